@@ -0,0 +1,7 @@
+"""
+title: Standalone performance benchmarks for IRx-generated programs.
+summary: >-
+  Each module builds one small program with the regular Builder, runs it
+  several times, and reports wall-clock timings. Run them from the repository
+  root, for example `python -m benchmarks.print_throughput`.
+"""
@@ -0,0 +1,136 @@
+"""
+title: Arrow compute kernels versus element-wise buffer view loops benchmark.
+summary: >-
+  Builds one nullable int64 array, then computes its null-aware sum and the sum
+  of the values above a threshold, once with the compute feature's kernels and
+  once with an element-wise loop over the borrowed buffer view that checks the
+  validity bitmap per row, which is how generated code had to scan Arrow
+  arrays before. The filtered query chains comparison, filter, and sum
+  kernels, so it pays for two intermediate arrays per pass.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from irx.builder.runtime.compute import build_compute_runtime_feature
+
+from benchmarks.common import time_runtime_harness
+
+DEFAULT_COUNT = 20_000_000
+DEFAULT_RUNS = 5
+THRESHOLD = 500
+PASSES = 10
+
+COMPUTE_HARNESS = """
+  #include <stdint.h>
+  #include <stdio.h>
+  #include <stdlib.h>
+
+  #include "irx_arrow_runtime.h"
+
+  int main(int argc, char** argv) {
+    int64_t* values = malloc(sizeof(int64_t) * %(count)d);
+    uint8_t* validity = malloc((%(count)d + 7) / 8);
+    irx_arrow_array_builder_handle* builder = NULL;
+    irx_arrow_array_handle* array = NULL;
+    int64_t total = 0;
+    if (argc != 3) return 1;
+    const int64_t threshold = atoll(argv[2]);
+    for (int64_t index = 0; index < %(count)d; ++index) {
+      values[index] = index %% 1000;
+    }
+    for (int64_t index = 0; index < (%(count)d + 7) / 8; ++index) {
+      validity[index] = 0xef;
+    }
+    irx_arrow_array_builder_new(IRX_ARROW_TYPE_INT64, &builder);
+    irx_arrow_array_builder_append_n(builder, values, %(count)d, validity);
+    irx_arrow_array_builder_finish(builder, &array);
+    free(values);
+    free(validity);
+
+    for (int pass = 0; pass < %(passes)d; ++pass) {
+      if (argv[1][0] == 'k') {
+        irx_arrow_array_handle* mask = NULL;
+        irx_arrow_array_handle* kept = NULL;
+        int64_t partial = 0;
+        if (threshold < 0) {
+          if (irx_arrow_compute_sum_int64(array, &partial)) return 2;
+          total += partial;
+          continue;
+        }
+        if (irx_arrow_compute_binary_int64_scalar(
+                IRX_ARROW_COMPUTE_GREATER, array, threshold, &mask) ||
+            irx_arrow_compute_filter(array, mask, &kept) ||
+            irx_arrow_compute_sum_int64(kept, &partial)) {
+          return 2;
+        }
+        total += partial;
+        irx_arrow_array_release(kept);
+        irx_arrow_array_release(mask);
+        continue;
+      }
+      irx_buffer_view view = {0};
+      const void* bitmap_data = NULL;
+      int64_t bit_offset = 0;
+      int64_t bit_length = 0;
+      if (irx_arrow_array_borrow_buffer_view(array, &view)) return 3;
+      if (irx_arrow_array_validity_bitmap(
+              array, &bitmap_data, &bit_offset, &bit_length)) {
+        return 4;
+      }
+      const uint8_t* bitmap = (const uint8_t*)bitmap_data;
+      const int64_t* data =
+          (const int64_t*)((const char*)view.data + view.offset_bytes);
+      for (int64_t index = 0; index < view.shape[0]; ++index) {
+        int64_t bit = bit_offset + index;
+        if (bitmap != NULL && !((bitmap[bit >> 3] >> (bit & 7)) & 1)) {
+          continue;
+        }
+        if (data[index] > threshold) total += data[index];
+      }
+    }
+    irx_arrow_array_release(array);
+    printf("%%lld\\n", (long long)total);
+    return 0;
+  }
+"""
+
+
+def main() -> None:
+    """
+    title: Run the Arrow compute benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    source = COMPUTE_HARNESS % {"count": args.count, "passes": PASSES}
+    feature = build_compute_runtime_feature()
+    results = [
+        time_runtime_harness(
+            f"irx compute {query}",
+            source,
+            feature,
+            runs=args.runs,
+            args=("kernels", str(threshold)),
+        )
+        if mode == "kernels"
+        else time_runtime_harness(
+            f"buffer view loop {query}",
+            source,
+            feature,
+            runs=args.runs,
+            args=("loop", str(threshold)),
+        )
+        for query, threshold in (("sum", -1), ("filtered sum", THRESHOLD))
+        for mode in ("kernels", "loop")
+    ]
+    for result in results:
+        if result is not None:
+            print(result.render(items=args.count * PASSES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+title: Memory-mapped Arrow IPC column scan benchmark.
+summary: >-
+  Writes one large uncompressed Arrow IPC file with pyarrow, then sums its
+  int64 column through the Arrow IPC runtime, which borrows the mapped pages,
+  and through a C program that first reads the whole file into heap memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+
+from pathlib import Path
+
+import pyarrow as pa
+
+from irx.builder.runtime.arrow_ipc import build_arrow_ipc_runtime_feature
+
+from benchmarks.common import time_c_program, time_runtime_harness
+
+DEFAULT_ROWS = 20_000_000
+DEFAULT_RUNS = 5
+
+MMAP_HARNESS = """
+  #include <stdint.h>
+  #include <stdio.h>
+
+  #include "irx_arrow_runtime.h"
+
+  int main(int argc, char** argv) {
+    irx_arrow_ipc_file_reader_handle* reader = NULL;
+    int64_t total = 0;
+    if (argc != 2 || irx_arrow_ipc_file_open(argv[1], &reader) != 0) return 1;
+    int32_t column = irx_arrow_ipc_file_column_index(reader, "value");
+    int64_t batches = irx_arrow_ipc_file_num_record_batches(reader);
+    for (int64_t batch = 0; batch < batches; ++batch) {
+      irx_arrow_array_handle* array = NULL;
+      irx_buffer_view view = {0};
+      if (irx_arrow_ipc_file_read_column(reader, batch, column, &array) != 0) {
+        return 2;
+      }
+      if (irx_arrow_array_borrow_buffer_view(array, &view) != 0) return 3;
+      const int64_t* values = (const int64_t*)view.data;
+      for (int64_t index = 0; index < view.shape[0]; ++index) {
+        total += values[index];
+      }
+      irx_arrow_array_release(array);
+    }
+    irx_arrow_ipc_file_close(reader);
+    printf("%lld\\n", (long long)total);
+    return 0;
+  }
+"""
+
+READ_INTO_HEAP_REFERENCE = """
+  #include <stdint.h>
+  #include <stdio.h>
+  #include <stdlib.h>
+
+  int main(int argc, char** argv) {
+    FILE* file = fopen(argv[1], "rb");
+    if (file == NULL) return 1;
+    fseek(file, 0, SEEK_END);
+    long size = ftell(file);
+    fseek(file, 0, SEEK_SET);
+    unsigned char* data = malloc((size_t)size);
+    if (fread(data, 1, (size_t)size, file) != (size_t)size) return 2;
+    fclose(file);
+    const int64_t* values = (const int64_t*)(data + %(offset)d);
+    int64_t total = 0;
+    for (int64_t index = 0; index < %(rows)d; ++index) {
+      total += values[index];
+    }
+    free(data);
+    printf("%%lld\\n", (long long)total);
+    return 0;
+  }
+"""
+
+
+def write_column_file(path: Path, rows: int) -> int:
+    """
+    title: Write one single-batch int64 IPC file and locate its value buffer.
+    parameters:
+      path:
+        type: Path
+      rows:
+        type: int
+    returns:
+      type: int
+    """
+    table = pa.table({"value": pa.array(range(rows), type=pa.int64())})
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=rows)
+    source = pa.memory_map(str(path))
+    base_address = source.read_buffer().address
+    source.seek(0)
+    batch = pa.ipc.open_file(source).get_batch(0)
+    return int(batch.column(0).buffers()[1].address - base_address)
+
+
+def main() -> None:
+    """
+    title: Run the Arrow IPC read benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "values.arrow"
+        offset = write_column_file(path, args.rows)
+        size_mib = path.stat().st_size / (1 << 20)
+        print(f"{args.rows} int64 rows, {size_mib:.0f} MiB on disk")
+
+        results = [
+            time_runtime_harness(
+                "irx arrow_ipc (mmap, borrowed)",
+                MMAP_HARNESS,
+                build_arrow_ipc_runtime_feature(),
+                runs=args.runs,
+                args=(str(path),),
+            ),
+            time_c_program(
+                "C fread into heap",
+                READ_INTO_HEAP_REFERENCE
+                % {"offset": offset, "rows": args.rows},
+                runs=args.runs,
+                args=(str(path),),
+            ),
+        ]
+        for result in results:
+            if result is not None:
+                print(result.render(items=args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+title: Arrow IPC stream output versus PrintExpr text output benchmark.
+summary: >-
+  Emits the same int64 and float64 value per row to stdout, once as Arrow IPC
+  record batches through the arrow_ipc stream writer and once as text through
+  PrintExpr, which is how generated programs reported results before.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from irx.builder.runtime.arrow_ipc import (
+    ARROW_IPC_COMPRESSION_NONE,
+    ARROW_IPC_COMPRESSION_ZSTD,
+    build_arrow_ipc_runtime_feature,
+)
+
+from benchmarks.common import time_module, time_runtime_harness
+from benchmarks.print_throughput import build_print_module
+
+DEFAULT_COUNT = 1_000_000
+DEFAULT_RUNS = 5
+CHUNK_ROWS = 65_536
+
+STREAM_HARNESS = """
+  #include <stdint.h>
+  #include <stdlib.h>
+
+  #include "irx_arrow_runtime.h"
+
+  static irx_arrow_array_handle* build_column(
+      int32_t type_id, const void* values, int64_t count) {
+    irx_arrow_array_builder_handle* builder = NULL;
+    irx_arrow_array_handle* array = NULL;
+    irx_arrow_array_builder_new(type_id, &builder);
+    irx_arrow_array_builder_append_n(builder, values, count, NULL);
+    irx_arrow_array_builder_finish(builder, &array);
+    return array;
+  }
+
+  int main(int argc, char** argv) {
+    const char* names[2] = {"value", "value_f64"};
+    irx_arrow_ipc_stream_writer_handle* writer = NULL;
+    int64_t* ints = malloc(sizeof(int64_t) * %(chunk)d);
+    double* floats = malloc(sizeof(double) * %(chunk)d);
+    if (argc != 2) return 1;
+    if (irx_arrow_ipc_stream_writer_open("-", 0, atoi(argv[1]), &writer)) {
+      return 2;
+    }
+    for (int64_t start = 0; start < %(count)d; start += %(chunk)d) {
+      int64_t rows = %(count)d - start < %(chunk)d ? %(count)d - start
+                                                   : %(chunk)d;
+      for (int64_t index = 0; index < rows; ++index) {
+        ints[index] = start + index;
+        floats[index] = (double)(start + index);
+      }
+      irx_arrow_array_handle* columns[2] = {
+          build_column(IRX_ARROW_TYPE_INT64, ints, rows),
+          build_column(IRX_ARROW_TYPE_FLOAT64, floats, rows),
+      };
+      if (irx_arrow_ipc_stream_writer_write_columns(
+              writer, 2, names, columns)) {
+        return 3;
+      }
+      irx_arrow_array_release(columns[0]);
+      irx_arrow_array_release(columns[1]);
+    }
+    free(ints);
+    free(floats);
+    return irx_arrow_ipc_stream_writer_close(writer);
+  }
+"""
+
+
+def main() -> None:
+    """
+    title: Run the Arrow IPC stream output benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    source = STREAM_HARNESS % {"count": args.count, "chunk": CHUNK_ROWS}
+    feature = build_arrow_ipc_runtime_feature()
+    results = [
+        time_runtime_harness(
+            "irx arrow_ipc stream",
+            source,
+            feature,
+            runs=args.runs,
+            args=(str(ARROW_IPC_COMPRESSION_NONE),),
+        ),
+        time_runtime_harness(
+            "irx arrow_ipc stream (zstd)",
+            source,
+            feature,
+            runs=args.runs,
+            args=(str(ARROW_IPC_COMPRESSION_ZSTD),),
+        ),
+        time_module(
+            "irx PrintExpr text",
+            build_print_module(args.count),
+            runs=args.runs,
+        ),
+    ]
+    for result in results:
+        if result is not None:
+            print(result.render(items=args.count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+title: Contiguous tensor traversal benchmark.
+summary: >-
+  Sums one constant int32 tensor many times, once as a flat 1-D view and once
+  through nested 2-D loops, and compares both with an equivalent C program.
+  Statically contiguous layouts lower each access to one inbounds element GEP
+  with constant element strides, so the IRx loops carry no descriptor stride
+  loads.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from irx import astx
+from irx.system import PrintExpr
+
+from benchmarks.common import main_module, time_c_program, time_module
+
+DEFAULT_SIDE = 256
+DEFAULT_PASSES = 200
+DEFAULT_RUNS = 5
+ELEMENT_BYTES = 4
+
+C_REFERENCE = """
+  #include <stdint.h>
+  #include <stdio.h>
+
+  static int32_t values[%(side)d][%(side)d];
+
+  int main(int argc, char** argv) {
+    int32_t total = 0;
+    for (int index = 0; index < %(side)d * %(side)d; ++index) {
+      values[index / %(side)d][index %% %(side)d] = index %% 97;
+    }
+    for (int pass = 0; pass < %(passes)d; ++pass) {
+      if (argv[1][0] == '1') {
+        const int32_t* flat = &values[0][0];
+        for (int index = 0; index < %(side)d * %(side)d; ++index) {
+          total += flat[index];
+        }
+        continue;
+      }
+      for (int row = 0; row < %(side)d; ++row) {
+        for (int col = 0; col < %(side)d; ++col) {
+          total += values[row][col];
+        }
+      }
+    }
+    printf("%%d\\n", total);
+    return 0;
+  }
+"""
+
+
+def _counter(name: str) -> astx.InlineVariableDeclaration:
+    """
+    title: Build one mutable Int32 loop counter declaration.
+    parameters:
+      name:
+        type: str
+    returns:
+      type: astx.InlineVariableDeclaration
+    """
+    return astx.InlineVariableDeclaration(
+        name,
+        type_=astx.Int32(),
+        mutability=astx.MutabilityKind.mutable,
+    )
+
+
+def _range_loop(
+    name: str,
+    end: int,
+    body: astx.Block,
+) -> astx.ForRangeLoopStmt:
+    """
+    title: Build one counted loop from zero to end.
+    parameters:
+      name:
+        type: str
+      end:
+        type: int
+      body:
+        type: astx.Block
+    returns:
+      type: astx.ForRangeLoopStmt
+    """
+    return astx.ForRangeLoopStmt(
+        variable=_counter(name),
+        start=astx.LiteralInt32(0),
+        end=astx.LiteralInt32(end),
+        step=astx.LiteralInt32(1),
+        body=body,
+    )
+
+
+def _accumulate(value: astx.AST) -> astx.Block:
+    """
+    title: Build a block adding one value to the running total.
+    parameters:
+      value:
+        type: astx.AST
+    returns:
+      type: astx.Block
+    """
+    body = astx.Block()
+    body.append(
+        astx.VariableAssignment(
+            "total",
+            astx.BinaryOp("+", astx.Identifier("total"), value),
+        )
+    )
+    return body
+
+
+def build_traversal_module(
+    side: int, passes: int, *, rank: int
+) -> astx.Module:
+    """
+    title: Build one program summing a contiguous tensor repeatedly.
+    parameters:
+      side:
+        type: int
+      passes:
+        type: int
+      rank:
+        type: int
+    returns:
+      type: astx.Module
+    """
+    tensor = astx.TensorLiteral(
+        [astx.LiteralInt32(index % 97) for index in range(side * side)],
+        element_type=astx.Int32(),
+        shape=(side, side),
+    )
+    if rank == 1:
+        base: astx.AST = astx.TensorView(
+            astx.Identifier("values"),
+            shape=(side * side,),
+            strides=(ELEMENT_BYTES,),
+        )
+        traversal = _range_loop(
+            "index",
+            side * side,
+            _accumulate(astx.TensorIndex(base, [astx.Identifier("index")])),
+        )
+    else:
+        inner = _range_loop(
+            "col",
+            side,
+            _accumulate(
+                astx.TensorIndex(
+                    astx.Identifier("values"),
+                    [astx.Identifier("row"), astx.Identifier("col")],
+                )
+            ),
+        )
+        rows = astx.Block()
+        rows.append(inner)
+        traversal = _range_loop("row", side, rows)
+
+    passes_body = astx.Block()
+    passes_body.append(traversal)
+    return main_module(
+        astx.VariableDeclaration(
+            name="values",
+            type_=astx.TensorType(astx.Int32()),
+            mutability=astx.MutabilityKind.constant,
+            value=tensor,
+        ),
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralInt32(0),
+        ),
+        _range_loop("pass_index", passes, passes_body),
+        PrintExpr(astx.Identifier("total")),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+
+def main() -> None:
+    """
+    title: Run the contiguous traversal benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--side", type=int, default=DEFAULT_SIDE)
+    parser.add_argument("--passes", type=int, default=DEFAULT_PASSES)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    items = args.side * args.side * args.passes
+    source = C_REFERENCE % {"side": args.side, "passes": args.passes}
+    for rank in (1, 2):
+        result = time_module(
+            f"irx {rank}-D contiguous traversal",
+            build_traversal_module(args.side, args.passes, rank=rank),
+            runs=args.runs,
+        )
+        print(result.render(items=items))
+        reference = time_c_program(
+            f"C -O2 {rank}-D traversal",
+            source,
+            runs=args.runs,
+            args=(str(rank),),
+        )
+        if reference is not None:
+            print(reference.render(items=items))
+
+
+if __name__ == "__main__":
+    main()
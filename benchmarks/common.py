@@ -0,0 +1,256 @@
+"""
+title: Shared helpers for IRx benchmarks.
+"""
+
+from __future__ import annotations
+
+import shutil
+import statistics
+import subprocess
+import tempfile
+import textwrap
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from irx import astx
+from irx.builder import Builder
+from irx.builder.runtime.features import RuntimeFeature
+from irx.builder.runtime.linking import link_executable
+from irx.typecheck import typechecked
+
+
+@typechecked
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    title: Timing summary for one benchmarked executable.
+    attributes:
+      name:
+        type: str
+      runs:
+        type: int
+      best_seconds:
+        type: float
+      median_seconds:
+        type: float
+    """
+
+    name: str
+    runs: int
+    best_seconds: float
+    median_seconds: float
+
+    def render(self, *, items: int | None = None) -> str:
+        """
+        title: Render one human-readable summary line.
+        parameters:
+          items:
+            type: int | None
+        returns:
+          type: str
+        """
+        line = (
+            f"{self.name:<32} best {self.best_seconds * 1e3:9.2f} ms  "
+            f"median {self.median_seconds * 1e3:9.2f} ms"
+        )
+        if items:
+            line += f"  {self.best_seconds * 1e9 / items:8.2f} ns/item"
+        return line
+
+
+@typechecked
+def main_module(*nodes: astx.AST) -> astx.Module:
+    """
+    title: Wrap statements in one Int32 main function.
+    parameters:
+      nodes:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.Module
+    """
+    module = astx.Module()
+    body = astx.Block()
+    for node in nodes:
+        body.append(node)
+    module.block.append(
+        astx.FunctionDef(
+            prototype=astx.FunctionPrototype(
+                "main",
+                args=astx.Arguments(),
+                return_type=astx.Int32(),
+            ),
+            body=body,
+        )
+    )
+    return module
+
+
+@typechecked
+def time_executable(
+    name: str,
+    executable: Path,
+    *,
+    runs: int,
+    args: tuple[str, ...] = (),
+) -> BenchmarkResult:
+    """
+    title: Run one executable repeatedly with stdout discarded.
+    parameters:
+      name:
+        type: str
+      executable:
+        type: Path
+      runs:
+        type: int
+      args:
+        type: tuple[str, Ellipsis]
+    returns:
+      type: BenchmarkResult
+    """
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [str(executable), *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        samples.append(time.perf_counter() - started)
+    return BenchmarkResult(
+        name=name,
+        runs=runs,
+        best_seconds=min(samples),
+        median_seconds=statistics.median(samples),
+    )
+
+
+@typechecked
+def time_module(
+    name: str,
+    module: astx.Module,
+    *,
+    runs: int,
+    builder: Builder | None = None,
+) -> BenchmarkResult:
+    """
+    title: Build one IRx module and time the resulting executable.
+    parameters:
+      name:
+        type: str
+      module:
+        type: astx.Module
+      runs:
+        type: int
+      builder:
+        type: Builder | None
+    returns:
+      type: BenchmarkResult
+    """
+    active_builder = builder or Builder()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executable = Path(tmp_dir) / "bench"
+        active_builder.build(module, output_file=str(executable))
+        return time_executable(name, executable, runs=runs)
+
+
+@typechecked
+def time_c_program(
+    name: str,
+    source: str,
+    *,
+    runs: int,
+    args: tuple[str, ...] = (),
+) -> BenchmarkResult | None:
+    """
+    title: Compile one C reference program and time it.
+    parameters:
+      name:
+        type: str
+      source:
+        type: str
+      runs:
+        type: int
+      args:
+        type: tuple[str, Ellipsis]
+    returns:
+      type: BenchmarkResult | None
+    """
+    compiler = shutil.which("clang") or shutil.which("cc")
+    if compiler is None:
+        return None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = Path(tmp_dir) / "reference.c"
+        executable = Path(tmp_dir) / "reference"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+        subprocess.run(
+            [compiler, "-O2", str(source_path), "-o", str(executable)],
+            check=True,
+        )
+        return time_executable(name, executable, runs=runs, args=args)
+
+
+@typechecked
+def time_runtime_harness(
+    name: str,
+    source: str,
+    feature: RuntimeFeature,
+    *,
+    runs: int,
+    args: tuple[str, ...] = (),
+) -> BenchmarkResult | None:
+    """
+    title: Compile one C harness against a runtime feature and time it.
+    parameters:
+      name:
+        type: str
+      source:
+        type: str
+      feature:
+        type: RuntimeFeature
+      runs:
+        type: int
+      args:
+        type: tuple[str, Ellipsis]
+    returns:
+      type: BenchmarkResult | None
+    """
+    compiler = shutil.which("clang")
+    if compiler is None:
+        return None
+    include_dirs = dict.fromkeys(
+        include_dir
+        for artifact in feature.artifacts
+        for include_dir in artifact.include_dirs
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = Path(tmp_dir) / "harness.c"
+        object_path = Path(tmp_dir) / "harness.o"
+        executable = Path(tmp_dir) / "harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+        subprocess.run(
+            [
+                compiler,
+                "-O2",
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+            ],
+            check=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=executable,
+            artifacts=feature.artifacts,
+            linker_flags=feature.linker_flags,
+            clang_binary=compiler,
+        )
+        return time_executable(name, executable, runs=runs, args=args)
@@ -0,0 +1,95 @@
+"""
+title: Bulk numeric PrintExpr throughput benchmark.
+summary: >-
+  Prints one integer and one float per loop iteration and compares the
+  buffered print runtime with an equivalent C program that formats every
+  value through snprintf into a fresh heap buffer and writes it with puts,
+  which is how PrintExpr used to lower.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from irx import astx
+from irx.system import PrintExpr
+
+from benchmarks.common import main_module, time_c_program, time_module
+
+DEFAULT_COUNT = 1_000_000
+DEFAULT_RUNS = 5
+
+SNPRINTF_PUTS_REFERENCE = """
+  #include <stdio.h>
+  #include <stdlib.h>
+
+  int main(void) {
+    for (int i = 0; i < %(count)d; ++i) {
+      int needed = snprintf(NULL, 0, "%%lld", (long long)i);
+      char* text = malloc((size_t)needed + 1);
+      snprintf(text, (size_t)needed + 1, "%%lld", (long long)i);
+      puts(text);
+      needed = snprintf(NULL, 0, "%%.6f", (double)i);
+      text = malloc((size_t)needed + 1);
+      snprintf(text, (size_t)needed + 1, "%%.6f", (double)i);
+      puts(text);
+    }
+    return 0;
+  }
+"""
+
+
+def build_print_module(count: int) -> astx.Module:
+    """
+    title: Build the IRx program printing two numbers per iteration.
+    parameters:
+      count:
+        type: int
+    returns:
+      type: astx.Module
+    """
+    body = astx.Block()
+    body.append(PrintExpr(astx.Identifier("i")))
+    body.append(PrintExpr(astx.Cast(astx.Identifier("i"), astx.Float64())))
+    loop = astx.ForRangeLoopStmt(
+        variable=astx.InlineVariableDeclaration(
+            "i",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+        ),
+        start=astx.LiteralInt32(0),
+        end=astx.LiteralInt32(count),
+        step=astx.LiteralInt32(1),
+        body=body,
+    )
+    return main_module(loop, astx.FunctionReturn(astx.LiteralInt32(0)))
+
+
+def main() -> None:
+    """
+    title: Run the print throughput benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    values = args.count * 2
+    result = time_module(
+        "irx PrintExpr (print runtime)",
+        build_print_module(args.count),
+        runs=args.runs,
+    )
+    print(result.render(items=values))
+
+    reference = time_c_program(
+        "C snprintf+malloc+puts",
+        SNPRINTF_PUTS_REFERENCE % {"count": args.count},
+        runs=args.runs,
+    )
+    if reference is not None:
+        print(reference.render(items=values))
+
+
+if __name__ == "__main__":
+    main()
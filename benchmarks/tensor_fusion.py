@@ -0,0 +1,223 @@
+"""
+title: Fused tensor expression bandwidth benchmark.
+summary: >-
+  Evaluates a * b + c over float64 tensors many times, once as one fused
+  expression and once with a * b bound to its own name so it materializes, and
+  compares both with an equivalent C loop. The fused form reads three operands
+  and writes one result per element; the materialized form also writes and
+  rereads the intermediate, so it moves half again as many bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from irx import astx
+from irx.system import PrintExpr
+
+from benchmarks.common import main_module, time_c_program, time_module
+
+DEFAULT_COUNT = 1 << 16
+DEFAULT_PASSES = 500
+DEFAULT_RUNS = 5
+ELEMENT_BYTES = 8
+FUSED_STREAMS = 4
+MATERIALIZED_STREAMS = 6
+
+C_REFERENCE = """
+  #include <stdio.h>
+  #include <stdlib.h>
+
+  int main(void) {
+    double* a = malloc(sizeof(double) * %(count)d);
+    double* b = malloc(sizeof(double) * %(count)d);
+    double* c = malloc(sizeof(double) * %(count)d);
+    double total = 0.0;
+    for (int index = 0; index < %(count)d; ++index) {
+      a[index] = index %% 97;
+      b[index] = index %% 89;
+      c[index] = index %% 83;
+    }
+    for (int pass = 0; pass < %(passes)d; ++pass) {
+      double* result = malloc(sizeof(double) * %(count)d);
+      for (int index = 0; index < %(count)d; ++index) {
+        result[index] = a[index] * b[index] + c[index];
+      }
+      total += result[pass %% %(count)d];
+      free(result);
+    }
+    printf("%%f\\n", total);
+    return 0;
+  }
+"""
+
+
+def _operand(name: str, count: int, modulus: int) -> astx.VariableDeclaration:
+    """
+    title: Declare one constant float64 operand tensor.
+    parameters:
+      name:
+        type: str
+      count:
+        type: int
+      modulus:
+        type: int
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.TensorType(astx.Float64()),
+        mutability=astx.MutabilityKind.constant,
+        value=astx.TensorLiteral(
+            [
+                astx.LiteralFloat64(float(index % modulus))
+                for index in range(count)
+            ],
+            element_type=astx.Float64(),
+            shape=(count,),
+        ),
+    )
+
+
+def _bind(name: str, value: astx.AST) -> astx.VariableDeclaration:
+    """
+    title: Bind one tensor expression to a constant name.
+    parameters:
+      name:
+        type: str
+      value:
+        type: astx.AST
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.TensorType(astx.Float64()),
+        mutability=astx.MutabilityKind.constant,
+        value=value,
+    )
+
+
+def build_fusion_module(
+    count: int, passes: int, *, fused: bool
+) -> astx.Module:
+    """
+    title: Build one program evaluating a * b + c repeatedly.
+    parameters:
+      count:
+        type: int
+      passes:
+        type: int
+      fused:
+        type: bool
+    returns:
+      type: astx.Module
+    """
+    product = astx.TensorElementwise(
+        "*", astx.Identifier("a"), astx.Identifier("b")
+    )
+    body = astx.Block()
+    if fused:
+        body.append(
+            _bind(
+                "result",
+                astx.TensorElementwise("+", product, astx.Identifier("c")),
+            )
+        )
+    else:
+        body.append(_bind("product", product))
+        body.append(
+            _bind(
+                "result",
+                astx.TensorElementwise(
+                    "+", astx.Identifier("product"), astx.Identifier("c")
+                ),
+            )
+        )
+    body.append(
+        astx.VariableAssignment(
+            "total",
+            astx.BinaryOp(
+                "+",
+                astx.Identifier("total"),
+                astx.TensorIndex(
+                    astx.Identifier("result"),
+                    [
+                        astx.BinaryOp(
+                            "%",
+                            astx.Identifier("pass_index"),
+                            astx.LiteralInt32(count),
+                        )
+                    ],
+                ),
+            ),
+        )
+    )
+    if not fused:
+        body.append(astx.TensorRelease(astx.Identifier("product")))
+    body.append(astx.TensorRelease(astx.Identifier("result")))
+
+    return main_module(
+        _operand("a", count, 97),
+        _operand("b", count, 89),
+        _operand("c", count, 83),
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Float64(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralFloat64(0.0),
+        ),
+        astx.ForRangeLoopStmt(
+            variable=astx.InlineVariableDeclaration(
+                "pass_index",
+                type_=astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+            ),
+            start=astx.LiteralInt32(0),
+            end=astx.LiteralInt32(passes),
+            step=astx.LiteralInt32(1),
+            body=body,
+        ),
+        PrintExpr(astx.Identifier("total")),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+
+def main() -> None:
+    """
+    title: Run the fused tensor expression benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--passes", type=int, default=DEFAULT_PASSES)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    items = args.count * args.passes
+    for fused, streams in (
+        (True, FUSED_STREAMS),
+        (False, MATERIALIZED_STREAMS),
+    ):
+        label = "fused" if fused else "materialized"
+        result = time_module(
+            f"irx {label} a * b + c",
+            build_fusion_module(args.count, args.passes, fused=fused),
+            runs=args.runs,
+        )
+        traffic = items * streams * ELEMENT_BYTES
+        print(
+            f"{result.render(items=items)}  "
+            f"{traffic / result.best_seconds / 1e9:6.2f} GB/s"
+        )
+    reference = time_c_program(
+        "C -O2 a * b + c",
+        C_REFERENCE % {"count": args.count, "passes": args.passes},
+        runs=args.runs,
+    )
+    if reference is not None:
+        print(reference.render(items=items))
+
+
+if __name__ == "__main__":
+    main()
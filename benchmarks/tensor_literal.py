@@ -0,0 +1,92 @@
+"""
+title: Constant tensor literal translate and startup benchmark.
+summary: >-
+  Compares a tensor literal made only of numeric literals, which lowers to
+  one constant global wrapped by the runtime, with the same literal seeded
+  by one runtime value, which still appends every element through the Arrow
+  tensor builder.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from irx import astx
+from irx.builder import Builder
+
+from benchmarks.common import main_module, time_module
+
+DEFAULT_SIDE = 128
+DEFAULT_RUNS = 5
+
+
+def build_tensor_module(side: int, *, constant: bool) -> astx.Module:
+    """
+    title: Build one program returning the zero first element of a tensor.
+    parameters:
+      side:
+        type: int
+      constant:
+        type: bool
+    returns:
+      type: astx.Module
+    """
+    values: list[astx.AST] = [
+        astx.LiteralInt32(index % 97) for index in range(side * side)
+    ]
+    nodes: list[astx.AST] = []
+    if not constant:
+        nodes.append(
+            astx.VariableDeclaration(
+                name="seed",
+                type_=astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+                value=astx.LiteralInt32(0),
+            )
+        )
+        values[0] = astx.Identifier("seed")
+    tensor = astx.TensorLiteral(
+        values,
+        element_type=astx.Int32(),
+        shape=(side, side),
+    )
+    origin = astx.LiteralInt32(0)
+    nodes.append(
+        astx.FunctionReturn(astx.TensorIndex(tensor, [origin, origin]))
+    )
+    return main_module(*nodes)
+
+
+def main() -> None:
+    """
+    title: Run the tensor literal benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--side", type=int, default=DEFAULT_SIDE)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    for label, constant in (
+        ("constant global + wrap", True),
+        ("per-element builder", False),
+    ):
+        start = time.perf_counter()
+        ir_text = Builder().translate(
+            build_tensor_module(args.side, constant=constant)
+        )
+        translate_seconds = time.perf_counter() - start
+        print(
+            f"{label}: translate {translate_seconds * 1e3:.1f} ms, "
+            f"{len(ir_text) / 1024:.0f} KiB IR"
+        )
+        result = time_module(
+            f"irx tensor literal ({label})",
+            build_tensor_module(args.side, constant=constant),
+            runs=args.runs,
+        )
+        print(result.render())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+title: Tensor matrix product throughput benchmark.
+summary: >-
+  Multiplies two square float64 matrices many times, once with TensorMatmul
+  and once with the naive triple loop a frontend would write over TensorIndex
+  and TensorStore, and compares both with the same naive loop in C. Results
+  are reported in GFLOP/s, counting one multiply and one add per inner step.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from irx import astx
+from irx.system import PrintExpr
+
+from benchmarks.common import main_module, time_c_program, time_module
+
+DEFAULT_SIDE = 128
+DEFAULT_PASSES = 200
+DEFAULT_RUNS = 5
+
+C_REFERENCE = """
+  #include <stdio.h>
+
+  static double a[%(side)d][%(side)d];
+  static double b[%(side)d][%(side)d];
+  static double c[%(side)d][%(side)d];
+
+  int main(void) {
+    double total = 0.0;
+    for (int row = 0; row < %(side)d; ++row) {
+      for (int col = 0; col < %(side)d; ++col) {
+        a[row][col] = (row * %(side)d + col) %% 97;
+        b[row][col] = (row * %(side)d + col) %% 89;
+      }
+    }
+    for (int pass = 0; pass < %(passes)d; ++pass) {
+      for (int row = 0; row < %(side)d; ++row) {
+        for (int col = 0; col < %(side)d; ++col) {
+          double sum = 0.0;
+          for (int k = 0; k < %(side)d; ++k) {
+            sum += a[row][k] * b[k][col];
+          }
+          c[row][col] = sum;
+        }
+      }
+      total += c[pass %% %(side)d][0];
+    }
+    printf("%%f\\n", total);
+    return 0;
+  }
+"""
+
+
+def _matrix(name: str, side: int, modulus: int) -> astx.VariableDeclaration:
+    """
+    title: Declare one constant square float64 matrix.
+    parameters:
+      name:
+        type: str
+      side:
+        type: int
+      modulus:
+        type: int
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.TensorType(astx.Float64()),
+        mutability=astx.MutabilityKind.constant,
+        value=astx.TensorLiteral(
+            [
+                astx.LiteralFloat64(float(index % modulus))
+                for index in range(side * side)
+            ],
+            element_type=astx.Float64(),
+            shape=(side, side),
+        ),
+    )
+
+
+def _range_loop(
+    name: str,
+    end: int,
+    *statements: astx.AST,
+) -> astx.ForRangeLoopStmt:
+    """
+    title: Build one counted loop from zero to end.
+    parameters:
+      name:
+        type: str
+      end:
+        type: int
+      statements:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.ForRangeLoopStmt
+    """
+    body = astx.Block()
+    for statement in statements:
+        body.append(statement)
+    return astx.ForRangeLoopStmt(
+        variable=astx.InlineVariableDeclaration(
+            name,
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+        ),
+        start=astx.LiteralInt32(0),
+        end=astx.LiteralInt32(end),
+        step=astx.LiteralInt32(1),
+        body=body,
+    )
+
+
+def _naive_product(side: int) -> list[astx.AST]:
+    """
+    title: Build the triple loop writing a @ b into the product tensor.
+    parameters:
+      side:
+        type: int
+    returns:
+      type: list[astx.AST]
+    """
+
+    def at(name: str, row: str, col: str) -> astx.TensorIndex:
+        return astx.TensorIndex(
+            astx.Identifier(name),
+            [astx.Identifier(row), astx.Identifier(col)],
+        )
+
+    accumulate = astx.VariableAssignment(
+        "sum",
+        astx.BinaryOp(
+            "+",
+            astx.Identifier("sum"),
+            astx.BinaryOp("*", at("a", "row", "k"), at("b", "k", "col")),
+        ),
+    )
+    columns = _range_loop(
+        "col",
+        side,
+        astx.VariableAssignment("sum", astx.LiteralFloat64(0.0)),
+        _range_loop("k", side, accumulate),
+        astx.TensorStore(
+            astx.Identifier("product"),
+            [astx.Identifier("row"), astx.Identifier("col")],
+            astx.Identifier("sum"),
+        ),
+    )
+    return [_range_loop("row", side, columns)]
+
+
+def build_matmul_module(side: int, passes: int, *, naive: bool) -> astx.Module:
+    """
+    title: Build one program multiplying two matrices repeatedly.
+    parameters:
+      side:
+        type: int
+      passes:
+        type: int
+      naive:
+        type: bool
+    returns:
+      type: astx.Module
+    """
+    first = astx.TensorIndex(
+        astx.Identifier("product"),
+        [
+            astx.BinaryOp(
+                "%", astx.Identifier("pass_index"), astx.LiteralInt32(side)
+            ),
+            astx.LiteralInt32(0),
+        ],
+    )
+    accumulate = astx.VariableAssignment(
+        "total",
+        astx.BinaryOp("+", astx.Identifier("total"), first),
+    )
+    if naive:
+        setup: list[astx.AST] = [
+            astx.VariableDeclaration(
+                name="product",
+                type_=astx.TensorType(astx.Float64()),
+                mutability=astx.MutabilityKind.constant,
+                # An owned, writable tensor of the right shape.
+                value=astx.TensorElementwise(
+                    "*", astx.Identifier("a"), astx.LiteralFloat64(0.0)
+                ),
+            ),
+            astx.VariableDeclaration(
+                name="sum",
+                type_=astx.Float64(),
+                mutability=astx.MutabilityKind.mutable,
+                value=astx.LiteralFloat64(0.0),
+            ),
+        ]
+        passes_loop = _range_loop(
+            "pass_index", passes, *_naive_product(side), accumulate
+        )
+    else:
+        setup = []
+        passes_loop = _range_loop(
+            "pass_index",
+            passes,
+            astx.VariableDeclaration(
+                name="product",
+                type_=astx.TensorType(astx.Float64()),
+                mutability=astx.MutabilityKind.constant,
+                value=astx.TensorMatmul(
+                    astx.Identifier("a"), astx.Identifier("b")
+                ),
+            ),
+            accumulate,
+            astx.TensorRelease(astx.Identifier("product")),
+        )
+
+    return main_module(
+        _matrix("a", side, 97),
+        _matrix("b", side, 89),
+        *setup,
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Float64(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralFloat64(0.0),
+        ),
+        passes_loop,
+        PrintExpr(astx.Identifier("total")),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+
+def main() -> None:
+    """
+    title: Run the matrix product benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--side", type=int, default=DEFAULT_SIDE)
+    parser.add_argument("--passes", type=int, default=DEFAULT_PASSES)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    flops = 2 * args.side**3 * args.passes
+    results = [
+        time_module(
+            f"irx {label}",
+            build_matmul_module(args.side, args.passes, naive=naive),
+            runs=args.runs,
+        )
+        for label, naive in (("TensorMatmul", False), ("naive loop", True))
+    ]
+    reference = time_c_program(
+        "C -O2 naive loop",
+        C_REFERENCE % {"side": args.side, "passes": args.passes},
+        runs=args.runs,
+    )
+    if reference is not None:
+        results.append(reference)
+    for result in results:
+        print(
+            f"{result.render()}  "
+            f"{flops / result.best_seconds / 1e9:6.2f} GFLOP/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
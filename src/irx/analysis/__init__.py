@@ -18,6 +18,11 @@ from irx.analysis.contract import (
     get_semantic_contract,
 )
 from irx.analysis.iterables import resolve_iteration_capability
+from irx.analysis.module_artifacts import (
+    ModuleInterface,
+    ModuleInterfaceCache,
+    module_fingerprint,
+)
 from irx.analysis.module_interfaces import (
     ImportResolver,
     ModuleKey,
@@ -92,6 +97,8 @@ __all__ = [
     "IterationKind",
     "IterationOrder",
     "MethodDispatchKind",
+    "ModuleInterface",
+    "ModuleInterfaceCache",
     "ModuleKey",
     "ParsedModule",
     "PhaseErrorBoundary",
@@ -134,5 +141,6 @@ __all__ = [
     "analyze_module",
     "analyze_modules",
     "get_semantic_contract",
+    "module_fingerprint",
     "resolve_iteration_capability",
 ]
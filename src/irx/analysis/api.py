@@ -14,6 +14,7 @@ from public import public
 
 from irx import astx
 from irx.analysis.analyzer import SemanticAnalyzer
+from irx.analysis.module_artifacts import ModuleInterfaceCache
 from irx.analysis.module_interfaces import (
     ImportResolver,
     ParsedModule,
@@ -69,6 +70,8 @@ def analyze_module(module: astx.Module) -> astx.Module:
 def analyze_modules(
     root: ParsedModule,
     resolver: ImportResolver,
+    *,
+    interface_cache: ModuleInterfaceCache | None = None,
 ) -> CompilationSession:
     """
     title: Analyze a reachable graph of host-provided parsed modules.
@@ -76,17 +79,25 @@ def analyze_modules(
       Run the stable multi-module semantic pipeline: expand the reachable
       module graph, predeclare top-level members, resolve top-level imports,
       attach semantic sidecars, and raise SemanticError before lowering when
-      diagnostics exist.
+      diagnostics exist. With an interface_cache, unchanged dependencies are
+      analyzed from their cached interfaces instead of their full ASTs.
     parameters:
       root:
         type: ParsedModule
       resolver:
         type: ImportResolver
+      interface_cache:
+        type: ModuleInterfaceCache | None
     returns:
       type: CompilationSession
     """
-    session = CompilationSession(root=root, resolver=resolver)
+    session = CompilationSession(
+        root=root,
+        resolver=resolver,
+        interface_cache=interface_cache,
+    )
     session.expand_graph()
+    session.load_module_interfaces()
 
     analyzer = SemanticAnalyzer(session=session)
 
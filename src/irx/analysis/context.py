@@ -24,6 +24,36 @@ from irx.diagnostics import DiagnosticBag
 from irx.typecheck import typechecked
 
 
+@public
+@typechecked
+@dataclass(frozen=True)
+class ParallelLoopRegion:
+    """
+    title: One parallel loop body under analysis.
+    summary: >-
+      Symbols declared in scopes at or above scope_depth are private to each
+      iteration; enclosing symbols may only be written when listed in
+      reduction_ids. loop_depth is the loop depth of the parallel loop itself,
+      so a break at that depth would leave it. kind names the loop form in
+      diagnostics: "parallel" for ParallelForRangeLoopStmt and "independent"
+      for a loop hinted as independent.
+    attributes:
+      scope_depth:
+        type: int
+      loop_depth:
+        type: int
+      reduction_ids:
+        type: frozenset[str]
+      kind:
+        type: str
+    """
+
+    scope_depth: int
+    loop_depth: int
+    reduction_ids: frozenset[str] = frozenset()
+    kind: str = "parallel"
+
+
 @public
 @typechecked
 @dataclass
@@ -52,6 +82,8 @@ class SemanticContext:
         type: ModuleKey | None
       loop_depth:
         type: int
+      parallel_loops:
+        type: list[ParallelLoopRegion]
       _symbol_counter:
         type: int
       _method_slot_counter:
@@ -73,6 +105,7 @@ class SemanticContext:
     current_class: SemanticClass | None = None
     current_module_key: ModuleKey | None = None
     loop_depth: int = 0
+    parallel_loops: list[ParallelLoopRegion] = field(default_factory=list)
     _symbol_counter: int = 0
     _method_slot_counter: int = 0
 
@@ -297,3 +330,35 @@ class SemanticContext:
             yield
         finally:
             self.loop_depth -= 1
+
+    @contextmanager
+    def in_parallel_loop(
+        self,
+        reduction_ids: frozenset[str],
+        *,
+        kind: str = "parallel",
+    ) -> Iterator[ParallelLoopRegion]:
+        """
+        title: Mark the body of one parallel loop.
+        summary: >-
+          Enter after the loop's own scope and loop depth are active, so the
+          loop variable counts as enclosing and cannot be assigned.
+        parameters:
+          reduction_ids:
+            type: frozenset[str]
+          kind:
+            type: str
+        returns:
+          type: Iterator[ParallelLoopRegion]
+        """
+        region = ParallelLoopRegion(
+            scope_depth=self.scopes.depth,
+            loop_depth=self.loop_depth,
+            reduction_ids=reduction_ids,
+            kind=kind,
+        )
+        self.parallel_loops.append(region)
+        try:
+            yield region
+        finally:
+            self.parallel_loops.pop()
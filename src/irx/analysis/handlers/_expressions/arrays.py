@@ -16,10 +16,33 @@ from irx.analysis.handlers.base import (
     SemanticAnalyzerCore,
     SemanticVisitorMixinBase,
 )
-from irx.analysis.types import is_integer_type
+from irx.analysis.types import (
+    is_boolean_type,
+    is_float_type,
+    is_integer_type,
+    is_numeric_type,
+)
+from irx.builtins.collections.tensor import tensor_primitive_type_name
+from irx.diagnostics import DiagnosticCodes
 from irx.typecheck import typechecked
 
 
+@typechecked
+def _is_array_handle_type(type_: astx.DataType | None) -> bool:
+    """
+    title: Return whether one semantic type is an Arrow array handle.
+    parameters:
+      type_:
+        type: astx.DataType | None
+    returns:
+      type: bool
+    """
+    return (
+        isinstance(type_, astx.OpaqueHandleType)
+        and type_.handle_name == "irx_arrow_array_handle"
+    )
+
+
 @typechecked
 class ExpressionArrayVisitorMixin(SemanticVisitorMixinBase):
     """
@@ -42,3 +65,176 @@ class ExpressionArrayVisitorMixin(SemanticVisitorMixinBase):
                     node=item,
                 )
         self._set_type(node, astx.Int32())
+
+    def _visit_array_operand(self, operand: astx.AST, role: str) -> None:
+        """
+        title: Visit one operand that must be an Arrow array handle.
+        parameters:
+          operand:
+            type: astx.AST
+          role:
+            type: str
+        """
+        self.visit(operand)
+        if not _is_array_handle_type(self._expr_type(operand)):
+            self.context.diagnostics.add(
+                f"array compute {role} must be an Arrow array handle",
+                node=operand,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayLiteral) -> None:
+        """
+        title: Visit ArrayLiteral nodes.
+        parameters:
+          node:
+            type: astx.ArrayLiteral
+        """
+        if tensor_primitive_type_name(node.element_type) is None:
+            self.context.diagnostics.add(
+                "array literals require a fixed-width numeric or bool "
+                "element type",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        element_is_bool = is_boolean_type(node.element_type)
+        element_is_float = is_float_type(node.element_type)
+        for item in node.values:
+            self.visit(item)
+            item_type = self._expr_type(item)
+            if element_is_bool:
+                valid = is_boolean_type(item_type)
+            elif element_is_float:
+                valid = is_numeric_type(item_type)
+            else:
+                valid = is_integer_type(item_type)
+            if not valid:
+                self.context.diagnostics.add(
+                    f"array literal value does not match element type "
+                    f"{node.element_type}",
+                    node=item,
+                    code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+                )
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayLength) -> None:
+        """
+        title: Visit ArrayLength nodes.
+        parameters:
+          node:
+            type: astx.ArrayLength
+        """
+        self._visit_array_operand(node.array, "length operand")
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayRelease) -> None:
+        """
+        title: Visit ArrayRelease nodes.
+        parameters:
+          node:
+            type: astx.ArrayRelease
+        """
+        self._visit_array_operand(node.array, "release operand")
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayReduce) -> None:
+        """
+        title: Visit ArrayReduce nodes.
+        parameters:
+          node:
+            type: astx.ArrayReduce
+        """
+        self._visit_array_operand(node.array, "reduction operand")
+        if node.op not in astx.ARRAY_REDUCE_OPS:
+            self.context.diagnostics.add(
+                f"unsupported array reduction '{node.op}'",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        if not isinstance(node.type_, astx.Int64 | astx.Float64):
+            self.context.diagnostics.add(
+                "array reductions return Int64 or Float64",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+        elif node.op == "mean" and not isinstance(node.type_, astx.Float64):
+            self.context.diagnostics.add(
+                "array mean returns Float64",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayElementwise) -> None:
+        """
+        title: Visit ArrayElementwise nodes.
+        parameters:
+          node:
+            type: astx.ArrayElementwise
+        """
+        if node.op_code not in astx.ARRAY_ELEMENTWISE_OPS:
+            self.context.diagnostics.add(
+                f"unsupported array elementwise operator '{node.op_code}'",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        self._visit_array_operand(node.lhs, "left operand")
+        self.visit(node.rhs)
+        rhs_type = self._expr_type(node.rhs)
+        if not _is_array_handle_type(rhs_type) and not is_numeric_type(
+            rhs_type
+        ):
+            self.context.diagnostics.add(
+                "array elementwise right operand must be an Arrow array "
+                "handle or a numeric scalar",
+                node=node.rhs,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayFilter) -> None:
+        """
+        title: Visit ArrayFilter nodes.
+        parameters:
+          node:
+            type: astx.ArrayFilter
+        """
+        self._visit_array_operand(node.array, "filter operand")
+        self._visit_array_operand(node.mask, "filter mask")
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayTake) -> None:
+        """
+        title: Visit ArrayTake nodes.
+        parameters:
+          node:
+            type: astx.ArrayTake
+        """
+        self._visit_array_operand(node.array, "take operand")
+        self._visit_array_operand(node.indices, "take indices")
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ArrayCast) -> None:
+        """
+        title: Visit ArrayCast nodes.
+        parameters:
+          node:
+            type: astx.ArrayCast
+        """
+        self._visit_array_operand(node.array, "cast operand")
+        if tensor_primitive_type_name(node.target_type) is None:
+            self.context.diagnostics.add(
+                "array casts require a fixed-width numeric or bool target "
+                "type",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        self._set_type(node, node.type_)
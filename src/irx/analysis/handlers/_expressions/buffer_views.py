@@ -10,6 +10,8 @@ summary: >-
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from irx import astx
 from irx.analysis.handlers._expressions.tensor_buffer_support import (
     ExpressionTensorBufferSupportVisitorMixin,
@@ -23,6 +25,12 @@ from irx.buffer import (
     buffer_view_is_readonly,
     validate_buffer_view_metadata,
 )
+from irx.builtins.collections.tensor import (
+    TensorLayout,
+    tensor_element_size_bytes,
+    tensor_element_size_bytes_from_dtype,
+    tensor_view_flags,
+)
 from irx.diagnostics import DiagnosticCodes
 from irx.typecheck import typechecked
 
@@ -150,6 +158,116 @@ class ExpressionBufferViewVisitorMixin(
             )
         self._set_type(node, astx.Int32())
 
+    def _visit_derived_buffer_view(
+        self,
+        node: (
+            astx.BufferViewSlice
+            | astx.BufferViewTranspose
+            | astx.BufferViewReshape
+        ),
+    ) -> None:
+        """
+        title: Analyze one slice, transpose, or reshape buffer view.
+        summary: >-
+          The derived descriptor keeps the base data, owner, and dtype handles
+          and only replaces shape, strides, offset_bytes, and contiguity
+          flags.
+        parameters:
+          node:
+            type: >-
+              astx.BufferViewSlice | astx.BufferViewTranspose |
+              astx.BufferViewReshape
+        """
+        self.visit(node.base)
+        if not isinstance(self._expr_type(node.base), astx.BufferViewType):
+            self.context.diagnostics.add(
+                "buffer view slicing requires a BufferViewType base",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+
+        element_type = self._static_buffer_view_element_type(node.base)
+        metadata = self._fixed_buffer_view_metadata(node.base)
+        if metadata is None:
+            self.context.diagnostics.add(
+                "buffer view slicing requires static descriptor metadata "
+                "from a descriptor or constant binding",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        else:
+            item_size_bytes = tensor_element_size_bytes(
+                element_type
+            ) or tensor_element_size_bytes_from_dtype(metadata.dtype)
+            layout = self._derived_view_layout(
+                node,
+                TensorLayout(
+                    shape=metadata.shape,
+                    strides=metadata.strides,
+                    offset_bytes=metadata.offset_bytes,
+                ),
+                item_size_bytes,
+            )
+            if layout is not None:
+                view_metadata = replace(
+                    metadata,
+                    ndim=layout.ndim,
+                    shape=layout.shape,
+                    strides=layout.strides,
+                    offset_bytes=layout.offset_bytes,
+                    flags=tensor_view_flags(
+                        metadata.flags,
+                        layout,
+                        item_size_bytes,
+                    ),
+                )
+                for error in validate_buffer_view_metadata(view_metadata):
+                    self.context.diagnostics.add(
+                        error,
+                        node=node,
+                        code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+                    )
+                self._semantic(node).extras[BUFFER_VIEW_METADATA_EXTRA] = (
+                    view_metadata
+                )
+
+        if element_type is not None:
+            self._semantic(node).extras[BUFFER_VIEW_ELEMENT_TYPE_EXTRA] = (
+                element_type
+            )
+        node.type_ = astx.BufferViewType(element_type)
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.BufferViewSlice) -> None:
+        """
+        title: Visit BufferViewSlice nodes.
+        parameters:
+          node:
+            type: astx.BufferViewSlice
+        """
+        self._visit_derived_buffer_view(node)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.BufferViewTranspose) -> None:
+        """
+        title: Visit BufferViewTranspose nodes.
+        parameters:
+          node:
+            type: astx.BufferViewTranspose
+        """
+        self._visit_derived_buffer_view(node)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.BufferViewReshape) -> None:
+        """
+        title: Visit BufferViewReshape nodes.
+        parameters:
+          node:
+            type: astx.BufferViewReshape
+        """
+        self._visit_derived_buffer_view(node)
+
     @SemanticAnalyzerCore.visit.dispatch
     def visit(self, node: astx.BufferViewRetain) -> None:
         """
@@ -29,6 +29,9 @@ from irx.builtins.collections.tensor import (
     TENSOR_LAYOUT_EXTRA,
     TensorLayout,
     tensor_element_size_bytes,
+    tensor_reshape_layout,
+    tensor_slice_layout,
+    tensor_transpose_layout,
 )
 from irx.diagnostics import DiagnosticCodes
 from irx.typecheck import typechecked
@@ -70,6 +73,37 @@ class ExpressionTensorBufferSupportVisitorMixin(SemanticVisitorMixinBase):
             return metadata
         return None
 
+    def _fixed_buffer_view_metadata(
+        self,
+        node: astx.AST,
+    ) -> BufferViewMetadata | None:
+        """
+        title: Return static buffer metadata that no reassignment can change.
+        summary: >-
+          Derived views bake the base layout into their own descriptor, so
+          only descriptors, derived views, and constant bindings qualify.
+        parameters:
+          node:
+            type: astx.AST
+        returns:
+          type: BufferViewMetadata | None
+        """
+        semantic = self._semantic(node)
+        if isinstance(
+            semantic.extras.get(BUFFER_VIEW_METADATA_EXTRA),
+            BufferViewMetadata,
+        ):
+            return self._static_buffer_view_metadata(node)
+
+        symbol = semantic.resolved_symbol
+        declaration = symbol.declaration if symbol is not None else None
+        if (
+            getattr(declaration, "mutability", None)
+            is not astx.MutabilityKind.constant
+        ):
+            return None
+        return self._static_buffer_view_metadata(node)
+
     def _static_buffer_view_element_type(
         self,
         node: astx.AST,
@@ -227,6 +261,50 @@ class ExpressionTensorBufferSupportVisitorMixin(SemanticVisitorMixinBase):
             return flags
         return None
 
+    def _derived_view_layout(
+        self,
+        node: astx.AST,
+        layout: TensorLayout,
+        item_size_bytes: int | None,
+    ) -> TensorLayout | None:
+        """
+        title: Return the layout of one slice, transpose, or reshape view.
+        parameters:
+          node:
+            type: astx.AST
+          layout:
+            type: TensorLayout
+          item_size_bytes:
+            type: int | None
+        returns:
+          type: TensorLayout | None
+        """
+        try:
+            if isinstance(node, (astx.TensorSlice, astx.BufferViewSlice)):
+                return tensor_slice_layout(layout, node.items)
+            if isinstance(
+                node,
+                (astx.TensorTranspose, astx.BufferViewTranspose),
+            ):
+                return tensor_transpose_layout(layout, node.axes)
+            if not isinstance(
+                node,
+                (astx.TensorReshape, astx.BufferViewReshape),
+            ):
+                raise ValueError("unsupported derived view node")
+            if item_size_bytes is None:
+                raise ValueError(
+                    "reshape views require a fixed-width element type"
+                )
+            return tensor_reshape_layout(layout, node.shape, item_size_bytes)
+        except ValueError as exc:
+            self.context.diagnostics.add(
+                str(exc),
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return None
+
     def _static_integer_literal_value(self, node: astx.AST) -> int | None:
         """
         title: Return a static integer literal value when present.
@@ -0,0 +1,364 @@
+# mypy: disable-error-code=no-redef
+# mypy: disable-error-code=untyped-decorator
+
+"""
+title: Expression Tensor operation visitors.
+summary: >-
+  Validate elementwise Tensor arithmetic, broadcasting, and reductions, and
+  record the static layout of every tensor they produce.
+"""
+
+from __future__ import annotations
+
+from irx import astx
+from irx.analysis.handlers._expressions.tensor_buffer_support import (
+    ExpressionTensorBufferSupportVisitorMixin,
+)
+from irx.analysis.handlers.base import SemanticAnalyzerCore
+from irx.analysis.normalization import normalize_flags
+from irx.analysis.types import (
+    display_type_name,
+    is_float_type,
+    is_integer_type,
+    is_numeric_type,
+    same_type,
+)
+from irx.buffer import BufferMutability, BufferOwnership, buffer_view_flags
+from irx.builtins.collections.tensor import (
+    TENSOR_ELEMENT_TYPE_EXTRA,
+    TENSOR_FLAGS_EXTRA,
+    TENSOR_LAYOUT_EXTRA,
+    TensorLayout,
+    tensor_broadcast_shape,
+    tensor_default_strides,
+    tensor_element_count,
+    tensor_element_size_bytes,
+    tensor_is_c_contiguous,
+    tensor_is_f_contiguous,
+    tensor_matmul_shape,
+)
+from irx.diagnostics import DiagnosticCodes
+from irx.typecheck import typechecked
+
+
+@typechecked
+class ExpressionTensorOpsVisitorMixin(
+    ExpressionTensorBufferSupportVisitorMixin
+):
+    """
+    title: Expression Tensor operation visitors.
+    """
+
+    def _tensor_operand_layout(
+        self,
+        node: astx.AST,
+        operation: str,
+    ) -> tuple[TensorLayout, astx.DataType] | None:
+        """
+        title: Return the static layout and element type of one operand.
+        summary: >-
+          Reports a diagnostic and returns None when the operand is a tensor
+          without static layout metadata or a fixed-width element type.
+        parameters:
+          node:
+            type: astx.AST
+          operation:
+            type: str
+        returns:
+          type: tuple[TensorLayout, astx.DataType] | None
+        """
+        layout = self._static_tensor_layout(node)
+        element_type = self._static_tensor_element_type(node)
+        if layout is None:
+            self.context.diagnostics.add(
+                f"{operation} require static tensor layout metadata",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return None
+        if tensor_element_size_bytes(element_type) is None:
+            self.context.diagnostics.add(
+                f"{operation} require a fixed-width numeric element type",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return None
+        assert element_type is not None
+        return layout, element_type
+
+    def _set_tensor_result(
+        self,
+        node: astx.AST,
+        shape: tuple[int, ...],
+        element_type: astx.DataType,
+    ) -> None:
+        """
+        title: Record the layout of one freshly allocated result tensor.
+        summary: >-
+          Results own new C-contiguous, writable storage independent of the
+          operands.
+        parameters:
+          node:
+            type: astx.AST
+          shape:
+            type: tuple[int, Ellipsis]
+          element_type:
+            type: astx.DataType
+        """
+        element_size_bytes = tensor_element_size_bytes(element_type)
+        assert element_size_bytes is not None
+        layout = TensorLayout(
+            shape=shape,
+            strides=tensor_default_strides(shape, element_size_bytes),
+        )
+        semantic = self._semantic(node)
+        semantic.extras[TENSOR_LAYOUT_EXTRA] = layout
+        semantic.extras[TENSOR_ELEMENT_TYPE_EXTRA] = element_type
+        semantic.extras[TENSOR_FLAGS_EXTRA] = buffer_view_flags(
+            BufferOwnership.OWNED,
+            BufferMutability.WRITABLE,
+            c_contiguous=tensor_is_c_contiguous(layout, element_size_bytes),
+            f_contiguous=tensor_is_f_contiguous(layout, element_size_bytes),
+        )
+        node.type_ = astx.TensorType(element_type)
+        self._set_type(node, node.type_)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorElementwise) -> None:
+        """
+        title: Visit TensorElementwise nodes.
+        parameters:
+          node:
+            type: astx.TensorElementwise
+        """
+        self.visit(node.lhs)
+        self.visit(node.rhs)
+        self._set_type(node, node.type_)
+        if node.op_code not in astx.TENSOR_ELEMENTWISE_OPS:
+            self.context.diagnostics.add(
+                f"unsupported tensor elementwise operator '{node.op_code}'",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+
+        shapes: list[tuple[int, ...]] = []
+        element_types: list[astx.DataType] = []
+        scalars: list[astx.AST] = []
+        for operand in (node.lhs, node.rhs):
+            if not isinstance(self._expr_type(operand), astx.TensorType):
+                scalars.append(operand)
+                continue
+            operand_layout = self._tensor_operand_layout(
+                operand, "tensor elementwise operands"
+            )
+            if operand_layout is None:
+                return
+            shapes.append(operand_layout[0].shape)
+            element_types.append(operand_layout[1])
+
+        if not element_types:
+            self.context.diagnostics.add(
+                "tensor elementwise operations require at least one tensor "
+                "operand",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+            return
+        element_type = element_types[0]
+        if not all(same_type(other, element_type) for other in element_types):
+            self.context.diagnostics.add(
+                "tensor elementwise operands must share one element type, got "
+                + " and ".join(display_type_name(t) for t in element_types),
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+            return
+        for scalar in scalars:
+            scalar_type = self._expr_type(scalar)
+            if not is_numeric_type(scalar_type) or (
+                is_float_type(scalar_type) and is_integer_type(element_type)
+            ):
+                self.context.diagnostics.add(
+                    "tensor elementwise scalar operand "
+                    f"{display_type_name(scalar_type)} cannot combine with "
+                    f"{display_type_name(element_type)} elements",
+                    node=scalar,
+                    code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+                )
+                return
+
+        self._set_flags(
+            node,
+            normalize_flags(
+                node, lhs_type=element_type, rhs_type=element_type
+            ),
+        )
+        try:
+            shape = tensor_broadcast_shape(*shapes)
+        except ValueError as error:
+            self.context.diagnostics.add(
+                str(error),
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return
+        self._set_tensor_result(node, shape, element_type)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorUnary) -> None:
+        """
+        title: Visit TensorUnary nodes.
+        parameters:
+          node:
+            type: astx.TensorUnary
+        """
+        self.visit(node.operand)
+        self._set_type(node, node.type_)
+        if node.op_code not in astx.TENSOR_UNARY_OPS:
+            self.context.diagnostics.add(
+                f"unsupported tensor unary operator '{node.op_code}'",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        if not isinstance(self._expr_type(node.operand), astx.TensorType):
+            self.context.diagnostics.add(
+                "tensor unary operations require a TensorType operand",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+            return
+        operand_layout = self._tensor_operand_layout(
+            node.operand, "tensor unary operations"
+        )
+        if operand_layout is None:
+            return
+        layout, element_type = operand_layout
+        if node.op_code == "sqrt" and not is_float_type(element_type):
+            self.context.diagnostics.add(
+                "tensor sqrt requires a floating-point element type",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+            return
+        self._set_tensor_result(node, layout.shape, element_type)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorReduce) -> None:
+        """
+        title: Visit TensorReduce nodes.
+        parameters:
+          node:
+            type: astx.TensorReduce
+        """
+        self.visit(node.base)
+        self._set_type(node, node.type_)
+        if node.op not in astx.TENSOR_REDUCE_OPS:
+            self.context.diagnostics.add(
+                f"unsupported tensor reduction '{node.op}'",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+        if not isinstance(self._expr_type(node.base), astx.TensorType):
+            self.context.diagnostics.add(
+                "tensor reductions require a TensorType operand",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+            return
+        operand_layout = self._tensor_operand_layout(
+            node.base, "tensor reductions"
+        )
+        if operand_layout is None:
+            return
+        layout, element_type = operand_layout
+        if node.axis is not None and not 0 <= node.axis < layout.ndim:
+            self.context.diagnostics.add(
+                f"tensor reduction axis {node.axis} is out of range for "
+                f"rank {layout.ndim}",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return
+        reduced_count = (
+            tensor_element_count(layout)
+            if node.axis is None
+            else layout.shape[node.axis]
+        )
+        if node.op in {"min", "max"} and reduced_count == 0:
+            self.context.diagnostics.add(
+                f"tensor {node.op} reductions require a non-empty extent",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return
+
+        result_type = (
+            astx.Float64()
+            if node.op == "mean" and not is_float_type(element_type)
+            else element_type
+        )
+        if node.axis is None or layout.ndim == 1:
+            node.type_ = result_type
+            self._set_type(node, result_type)
+            return
+        self._set_tensor_result(
+            node,
+            layout.shape[: node.axis] + layout.shape[node.axis + 1 :],
+            result_type,
+        )
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorMatmul) -> None:
+        """
+        title: Visit TensorMatmul nodes.
+        parameters:
+          node:
+            type: astx.TensorMatmul
+        """
+        self.visit(node.lhs)
+        self.visit(node.rhs)
+        self._set_type(node, node.type_)
+        operands: list[tuple[TensorLayout, astx.DataType]] = []
+        for operand in (node.lhs, node.rhs):
+            if not isinstance(self._expr_type(operand), astx.TensorType):
+                self.context.diagnostics.add(
+                    "tensor matmul requires TensorType operands",
+                    node=operand,
+                    code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+                )
+                return
+            operand_layout = self._tensor_operand_layout(
+                operand, "tensor matmul operands"
+            )
+            if operand_layout is None:
+                return
+            operands.append(operand_layout)
+
+        (lhs_layout, element_type), (rhs_layout, rhs_element_type) = operands
+        if not same_type(element_type, rhs_element_type):
+            self.context.diagnostics.add(
+                "tensor matmul operands must share one element type, got "
+                f"{display_type_name(element_type)} and "
+                f"{display_type_name(rhs_element_type)}",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+            return
+        try:
+            shape = tensor_matmul_shape(lhs_layout.shape, rhs_layout.shape)
+        except ValueError as error:
+            self.context.diagnostics.add(
+                str(error),
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+            return
+
+        if not shape:
+            node.type_ = element_type
+            self._set_type(node, element_type)
+            return
+        self._set_tensor_result(node, shape, element_type)
+
+
+__all__ = ["ExpressionTensorOpsVisitorMixin"]
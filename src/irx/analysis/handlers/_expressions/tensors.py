@@ -17,13 +17,9 @@ from irx.analysis.handlers._expressions.tensor_buffer_support import (
 from irx.analysis.handlers.base import SemanticAnalyzerCore
 from irx.analysis.validation import validate_assignment
 from irx.buffer import (
-    BUFFER_FLAG_VALIDITY_BITMAP,
     BufferMutability,
     BufferOwnership,
     buffer_view_flags,
-    buffer_view_has_validity_bitmap,
-    buffer_view_is_readonly,
-    buffer_view_ownership,
 )
 from irx.builtins.collections.tensor import (
     TENSOR_ELEMENT_TYPE_EXTRA,
@@ -36,6 +32,7 @@ from irx.builtins.collections.tensor import (
     tensor_element_size_bytes,
     tensor_is_c_contiguous,
     tensor_is_f_contiguous,
+    tensor_view_flags,
     validate_tensor_layout,
 )
 from irx.diagnostics import DiagnosticCodes
@@ -252,58 +249,110 @@ class ExpressionTensorVisitorMixin(ExpressionTensorBufferSupportVisitorMixin):
                     code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
                 )
 
-        base_flags = self._static_tensor_flags(node.base)
-        if base_flags is None:
-            flags = buffer_view_flags(
-                BufferOwnership.EXTERNAL_OWNER,
-                BufferMutability.READONLY,
-                c_contiguous=(
-                    False
-                    if element_size_bytes is None
-                    else tensor_is_c_contiguous(layout, element_size_bytes)
-                ),
-                f_contiguous=(
-                    False
-                    if element_size_bytes is None
-                    else tensor_is_f_contiguous(layout, element_size_bytes)
-                ),
+        flags = tensor_view_flags(
+            self._static_tensor_flags(node.base),
+            layout,
+            element_size_bytes,
+        )
+
+        if element_type is not None:
+            self._semantic(node).extras[TENSOR_ELEMENT_TYPE_EXTRA] = (
+                element_type
             )
-        else:
-            ownership = (
-                buffer_view_ownership(base_flags)
-                or BufferOwnership.EXTERNAL_OWNER
+            node.type_ = astx.TensorType(element_type)
+        self._semantic(node).extras[TENSOR_LAYOUT_EXTRA] = layout
+        self._semantic(node).extras[TENSOR_FLAGS_EXTRA] = flags
+        self._set_type(node, node.type_)
+
+    def _visit_derived_tensor_view(
+        self,
+        node: astx.TensorSlice | astx.TensorTranspose | astx.TensorReshape,
+    ) -> None:
+        """
+        title: Analyze one slice, transpose, or reshape Tensor view.
+        summary: >-
+          Derive the view layout from the static base layout and recompute the
+          contiguity flags, keeping the base ownership and mutability.
+        parameters:
+          node:
+            type: astx.TensorSlice | astx.TensorTranspose | astx.TensorReshape
+        """
+        self.visit(node.base)
+        if not isinstance(self._expr_type(node.base), astx.TensorType):
+            self.context.diagnostics.add(
+                "tensor views require a TensorType base",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
+            )
+
+        base_layout = self._static_tensor_layout(node.base)
+        element_type = self._static_tensor_element_type(node.base)
+        element_size_bytes = tensor_element_size_bytes(element_type)
+        if base_layout is None:
+            self.context.diagnostics.add(
+                "tensor views require static base layout metadata",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
             )
-            mutability = (
-                BufferMutability.READONLY
-                if buffer_view_is_readonly(base_flags)
-                else BufferMutability.WRITABLE
+        elif element_size_bytes is None:
+            self.context.diagnostics.add(
+                "tensor views require a fixed-width numeric element type",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_BUFFER_MISUSE,
             )
-            flags = buffer_view_flags(
-                ownership,
-                mutability,
-                c_contiguous=(
-                    False
-                    if element_size_bytes is None
-                    else tensor_is_c_contiguous(layout, element_size_bytes)
-                ),
-                f_contiguous=(
-                    False
-                    if element_size_bytes is None
-                    else tensor_is_f_contiguous(layout, element_size_bytes)
-                ),
+        else:
+            layout = self._derived_view_layout(
+                node,
+                base_layout,
+                element_size_bytes,
             )
-            if buffer_view_has_validity_bitmap(base_flags):
-                flags |= BUFFER_FLAG_VALIDITY_BITMAP
+            if layout is not None:
+                self._semantic(node).extras[TENSOR_LAYOUT_EXTRA] = layout
+                self._semantic(node).extras[TENSOR_FLAGS_EXTRA] = (
+                    tensor_view_flags(
+                        self._static_tensor_flags(node.base),
+                        layout,
+                        element_size_bytes,
+                    )
+                )
 
         if element_type is not None:
             self._semantic(node).extras[TENSOR_ELEMENT_TYPE_EXTRA] = (
                 element_type
             )
             node.type_ = astx.TensorType(element_type)
-        self._semantic(node).extras[TENSOR_LAYOUT_EXTRA] = layout
-        self._semantic(node).extras[TENSOR_FLAGS_EXTRA] = flags
         self._set_type(node, node.type_)
 
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorSlice) -> None:
+        """
+        title: Visit TensorSlice nodes.
+        parameters:
+          node:
+            type: astx.TensorSlice
+        """
+        self._visit_derived_tensor_view(node)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorTranspose) -> None:
+        """
+        title: Visit TensorTranspose nodes.
+        parameters:
+          node:
+            type: astx.TensorTranspose
+        """
+        self._visit_derived_tensor_view(node)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.TensorReshape) -> None:
+        """
+        title: Visit TensorReshape nodes.
+        parameters:
+          node:
+            type: astx.TensorReshape
+        """
+        self._visit_derived_tensor_view(node)
+
     @SemanticAnalyzerCore.visit.dispatch
     def visit(self, node: astx.TensorIndex) -> None:
         """
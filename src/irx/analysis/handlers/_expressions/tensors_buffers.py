@@ -10,6 +10,9 @@ from __future__ import annotations
 from irx.analysis.handlers._expressions.buffer_views import (
     ExpressionBufferViewVisitorMixin,
 )
+from irx.analysis.handlers._expressions.tensor_ops import (
+    ExpressionTensorOpsVisitorMixin,
+)
 from irx.analysis.handlers._expressions.tensors import (
     ExpressionTensorVisitorMixin,
 )
@@ -19,6 +22,7 @@ from irx.typecheck import typechecked
 @typechecked
 class ExpressionTensorBufferVisitorMixin(
     ExpressionTensorVisitorMixin,
+    ExpressionTensorOpsVisitorMixin,
     ExpressionBufferViewVisitorMixin,
 ):
     """
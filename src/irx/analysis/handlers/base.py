@@ -30,9 +30,11 @@ from irx.analysis.resolved_nodes import (
     ResolvedGeneratorFunction,
     ResolvedImportBinding,
     ResolvedIteration,
+    ResolvedLoopHints,
     ResolvedMethodCall,
     ResolvedModuleMemberAccess,
     ResolvedOperator,
+    ResolvedParallelLoop,
     ResolvedStaticClassFieldAccess,
     ResolvedYield,
     ReturnResolution,
@@ -590,6 +592,36 @@ class SemanticVisitorMixinTypingBase:
         """
         raise NotImplementedError
 
+    def _set_parallel_loop(
+        self,
+        node: astx.AST,
+        parallel_loop: ResolvedParallelLoop | None,
+    ) -> None:
+        """
+        title: Attach resolved parallel-loop metadata.
+        parameters:
+          node:
+            type: astx.AST
+          parallel_loop:
+            type: ResolvedParallelLoop | None
+        """
+        raise NotImplementedError
+
+    def _set_loop_hints(
+        self,
+        node: astx.AST,
+        loop_hints: ResolvedLoopHints | None,
+    ) -> None:
+        """
+        title: Attach resolved loop optimization hints.
+        parameters:
+          node:
+            type: astx.AST
+          loop_hints:
+            type: ResolvedLoopHints | None
+        """
+        raise NotImplementedError
+
     def _set_class_construction(
         self,
         node: astx.AST,
@@ -1274,6 +1306,24 @@ class SemanticAnalyzerCore(BaseVisitor):
         if symbol is None:
             info.resolved_assignment = None
             return
+        if self.context.parallel_loops:
+            region = self.context.parallel_loops[-1]
+            if symbol.symbol_id not in region.reduction_ids and (
+                self.context.scopes.resolve(symbol.name) is symbol
+                and not self.context.scopes.declared_since(
+                    region.scope_depth, symbol
+                )
+            ):
+                self.context.diagnostics.add(
+                    f"{region.kind} loop iterations cannot assign to "
+                    f"enclosing variable '{symbol.name}'",
+                    node=node,
+                    code=DiagnosticCodes.SEMANTIC_INVALID_ASSIGNMENT_TARGET,
+                    hint=(
+                        "assign a variable declared inside the loop body, or "
+                        "declare it as a reduction of a parallel loop"
+                    ),
+                )
         info.resolved_assignment = ResolvedAssignment(symbol)
 
     def _set_field_access(
@@ -1381,6 +1431,36 @@ class SemanticAnalyzerCore(BaseVisitor):
         """
         self._semantic(node).resolved_context_manager = context_manager
 
+    def _set_parallel_loop(
+        self,
+        node: astx.AST,
+        parallel_loop: ResolvedParallelLoop | None,
+    ) -> None:
+        """
+        title: Attach resolved parallel-loop metadata.
+        parameters:
+          node:
+            type: astx.AST
+          parallel_loop:
+            type: ResolvedParallelLoop | None
+        """
+        self._semantic(node).resolved_parallel_loop = parallel_loop
+
+    def _set_loop_hints(
+        self,
+        node: astx.AST,
+        loop_hints: ResolvedLoopHints | None,
+    ) -> None:
+        """
+        title: Attach resolved loop optimization hints.
+        parameters:
+          node:
+            type: astx.AST
+          loop_hints:
+            type: ResolvedLoopHints | None
+        """
+        self._semantic(node).resolved_loop_hints = loop_hints
+
     def _set_class_construction(
         self,
         node: astx.AST,
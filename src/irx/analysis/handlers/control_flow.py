@@ -25,7 +25,10 @@ from irx.analysis.resolved_nodes import (
     MethodDispatchKind,
     ResolvedContextManager,
     ResolvedGeneratorFunction,
+    ResolvedLoopHints,
     ResolvedMethodCall,
+    ResolvedParallelLoop,
+    ResolvedParallelReduction,
     ResolvedYield,
     SemanticClass,
     SemanticSymbol,
@@ -380,6 +383,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
                 code=DiagnosticCodes.SEMANTIC_INVALID_RETURN,
             )
             return
+        self._reject_parallel_loop_exit(node, "return")
         generator = self.context.current_function.signature.metadata.get(
             "generator"
         )
@@ -416,6 +420,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
           node:
             type: astx.YieldStmt
         """
+        self._reject_parallel_loop_exit(node, "yield")
         self._resolve_yield(node, node.value)
         self._set_type(node, None)
 
@@ -427,6 +432,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
           node:
             type: astx.YieldExpr
         """
+        self._reject_parallel_loop_exit(node, "yield")
         self._resolve_yield(node, node.value)
         self._set_type(node, astx.NoneType())
 
@@ -438,6 +444,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
           node:
             type: astx.YieldFromExpr
         """
+        self._reject_parallel_loop_exit(node, "yield from")
         self.context.diagnostics.add(
             "yield from is not supported yet",
             node=node,
@@ -469,10 +476,12 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
           node:
             type: astx.WhileStmt
         """
+        hints = self._resolve_loop_hints(node, allow_independent=False)
         self.visit(node.condition)
         self._validate_boolean_condition(node.condition, label="while")
         with self.context.in_loop():
             self.visit(node.body)
+        self._set_loop_hints(node, hints)
         self._set_type(node, None)
 
     @SemanticAnalyzerCore.visit.dispatch
@@ -483,6 +492,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
           node:
             type: astx.ForCountLoopStmt
         """
+        hints = self._resolve_loop_hints(node, allow_independent=False)
         with self.context.scope("for-count"):
             if node.initializer.value is not None:
                 self.visit(node.initializer.value)
@@ -503,6 +513,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
             self.visit(node.update)
             with self.context.in_loop():
                 self.visit(node.body)
+        self._set_loop_hints(node, hints)
         self._set_type(node, None)
 
     @SemanticAnalyzerCore.visit.dispatch
@@ -513,6 +524,7 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
           node:
             type: astx.ForRangeLoopStmt
         """
+        hints = self._resolve_loop_hints(node, allow_independent=True)
         with self.context.scope("for-range"):
             self.visit(node.start)
             self.visit(node.end)
@@ -528,7 +540,239 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
             )
             self._set_symbol(node.variable, symbol)
             with self.context.in_loop():
+                if hints is not None and hints.independent:
+                    with self.context.in_parallel_loop(
+                        frozenset(), kind="independent"
+                    ):
+                        self.visit(node.body)
+                else:
+                    self.visit(node.body)
+        self._set_loop_hints(node, hints)
+        self._set_type(node, None)
+
+    def _reject_parallel_loop_exit(self, node: astx.AST, label: str) -> None:
+        """
+        title: Reject control flow that would leave a parallel loop body.
+        parameters:
+          node:
+            type: astx.AST
+          label:
+            type: str
+        """
+        if self.context.parallel_loops:
+            kind = self.context.parallel_loops[-1].kind
+            article = "an" if kind[:1] in "aeiou" else "a"
+            self.context.diagnostics.add(
+                f"{label} cannot leave {article} {kind} loop body",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
+            )
+
+    def _resolve_loop_hints(
+        self,
+        node: astx.AST,
+        *,
+        allow_independent: bool,
+    ) -> ResolvedLoopHints | None:
+        """
+        title: Validate the optimization hints attached to one loop.
+        summary: >-
+          Only for-range loops may be hinted independent, because their loop
+          variable is the only state carried from one iteration to the next.
+        parameters:
+          node:
+            type: astx.AST
+          allow_independent:
+            type: bool
+        returns:
+          type: ResolvedLoopHints | None
+        """
+        hints = astx.get_loop_hints(node)
+        if hints is None:
+            return None
+        problems: list[str] = []
+        width = hints.vector_width
+        if width < 0 or width & (width - 1):
+            problems.append(
+                f"loop vector width must be a power of two, got {width}"
+            )
+        elif hints.vectorize is False and width > 1:
+            problems.append("loop vector width conflicts with vectorize=False")
+        for label, count in (
+            ("interleave count", hints.interleave_count),
+            ("unroll count", hints.unroll_count),
+        ):
+            if count < 0:
+                problems.append(
+                    f"loop {label} must be non-negative, got {count}"
+                )
+        if hints.unroll is False and hints.unroll_count > 1:
+            problems.append("loop unroll count conflicts with unroll=False")
+        if hints.independent and not allow_independent:
+            problems.append("independent loop hints require a for-range loop")
+        for message in problems:
+            self.context.diagnostics.add(
+                message,
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
+            )
+        if problems:
+            return None
+        return ResolvedLoopHints(
+            vectorize=hints.vectorize,
+            vector_width=hints.vector_width,
+            interleave_count=hints.interleave_count,
+            unroll=hints.unroll,
+            unroll_count=hints.unroll_count,
+            independent=hints.independent,
+        )
+
+    def _parallel_loop_step(
+        self, node: astx.ParallelForRangeLoopStmt
+    ) -> int | None:
+        """
+        title: Return the positive constant step of one parallel loop.
+        parameters:
+          node:
+            type: astx.ParallelForRangeLoopStmt
+        returns:
+          type: int | None
+        """
+        if isinstance(node.step, astx.LiteralNone):
+            return 1
+        value = getattr(node.step, "value", None)
+        if (
+            isinstance(node.step, astx.Literal)
+            and isinstance(value, int)
+            and not isinstance(value, bool)
+            and value > 0
+        ):
+            return value
+        self.context.diagnostics.add(
+            "parallel for-range loops require a positive integer literal step",
+            node=node.step,
+            code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
+        )
+        return None
+
+    def _resolve_parallel_reductions(
+        self, node: astx.ParallelForRangeLoopStmt
+    ) -> tuple[ResolvedParallelReduction, ...]:
+        """
+        title: Resolve the enclosing variables reduced by one parallel loop.
+        parameters:
+          node:
+            type: astx.ParallelForRangeLoopStmt
+        returns:
+          type: tuple[ResolvedParallelReduction, Ellipsis]
+        """
+        reductions: list[ResolvedParallelReduction] = []
+        for name, operator in node.reductions.items():
+            if operator not in astx.PARALLEL_REDUCTION_OPS:
+                self.context.diagnostics.add(
+                    f"unsupported parallel reduction operator '{operator}' "
+                    f"for '{name}'",
+                    node=node,
+                    code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
+                )
+                continue
+            symbol = self.context.scopes.resolve(name)
+            if symbol is None:
+                self.context.diagnostics.add(
+                    f"cannot reduce into unresolved name '{name}'",
+                    node=node,
+                    code=DiagnosticCodes.SEMANTIC_UNRESOLVED_NAME,
+                )
+                continue
+            if not symbol.is_mutable:
+                self.context.diagnostics.add(
+                    f"cannot reduce into '{name}': declared as constant",
+                    node=node,
+                    code=DiagnosticCodes.SEMANTIC_INVALID_ASSIGNMENT_TARGET,
+                )
+                continue
+            if not (
+                is_integer_type(symbol.type_) or is_float_type(symbol.type_)
+            ):
+                self.context.diagnostics.add(
+                    f"parallel reduction '{name}' requires a numeric "
+                    f"variable, got {display_type_name(symbol.type_)}",
+                    node=node,
+                    code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+                )
+                continue
+            reductions.append(ResolvedParallelReduction(symbol, operator))
+        return tuple(reductions)
+
+    @SemanticAnalyzerCore.visit.dispatch
+    def visit(self, node: astx.ParallelForRangeLoopStmt) -> None:
+        """
+        title: Visit ParallelForRangeLoopStmt nodes.
+        summary: >-
+          Validate the loop shape and schedule, then analyze the body as a
+          parallel region in which only iteration-local variables and the
+          declared reductions may be assigned.
+        parameters:
+          node:
+            type: astx.ParallelForRangeLoopStmt
+        """
+        if node.schedule not in astx.PARALLEL_SCHEDULES:
+            self.context.diagnostics.add(
+                f"unsupported parallel schedule '{node.schedule}'",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
+            )
+        if node.chunk_size < 0:
+            self.context.diagnostics.add(
+                "parallel chunk size must be non-negative, got "
+                f"{node.chunk_size}",
+                node=node,
+                code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
+            )
+        if not is_integer_type(node.variable.type_):
+            self.context.diagnostics.add(
+                "parallel for-range loop variable must be an integer, got "
+                f"{display_type_name(node.variable.type_)}",
+                node=node.variable,
+                code=DiagnosticCodes.SEMANTIC_TYPE_MISMATCH,
+            )
+        reductions = self._resolve_parallel_reductions(node)
+        step = self._parallel_loop_step(node)
+        hints = self._resolve_loop_hints(node, allow_independent=True)
+
+        with self.context.scope("for-range"):
+            self.visit(node.start)
+            self.visit(node.end)
+            if not isinstance(node.step, astx.LiteralNone):
+                self.visit(node.step)
+            symbol = self.registry.declare_local(
+                node.variable.name,
+                node.variable.type_,
+                is_mutable=(
+                    node.variable.mutability != astx.MutabilityKind.constant
+                ),
+                declaration=node.variable,
+            )
+            self._set_symbol(node.variable, symbol)
+            with (
+                self.context.in_loop(),
+                self.context.in_parallel_loop(
+                    frozenset(
+                        reduction.symbol.symbol_id for reduction in reductions
+                    )
+                ),
+            ):
                 self.visit(node.body)
+        self._set_parallel_loop(
+            node,
+            ResolvedParallelLoop(
+                schedule=node.schedule,
+                chunk_size=node.chunk_size,
+                step=step or 1,
+                reductions=reductions,
+            ),
+        )
+        self._set_loop_hints(node, hints)
         self._set_type(node, None)
 
     @SemanticAnalyzerCore.visit.dispatch
@@ -656,6 +900,12 @@ class ControlFlowVisitorMixin(SemanticVisitorMixinBase):
                 node=node,
                 code=DiagnosticCodes.SEMANTIC_INVALID_CONTROL_FLOW,
             )
+        elif (
+            self.context.parallel_loops
+            and self.context.parallel_loops[-1].loop_depth
+            == self.context.loop_depth
+        ):
+            self._reject_parallel_loop_exit(node, "break")
         self._set_type(node, None)
 
     @SemanticAnalyzerCore.visit.dispatch
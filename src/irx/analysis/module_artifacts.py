@@ -0,0 +1,520 @@
+"""
+title: On-disk module interface artifacts for multi-module compilation.
+summary: >-
+  Summarize one module as its declaration-level surface (function
+  signatures, struct and class definitions, template definitions, and
+  imports) together with the LLVM symbols its separately compiled object
+  defines. A CompilationSession loads that summary in place of an unchanged
+  dependency so analysis no longer walks the dependency's function bodies
+  and lowering only declares what the object already defines.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from public import public
+
+from irx import astx
+from irx.analysis.module_interfaces import ModuleKey, ParsedModule
+from irx.typecheck import typechecked
+
+MODULE_INTERFACE_FORMAT_VERSION = 1
+
+_INTERFACE_MODULE_ATTR = "irx_module_interface"
+_INTERFACE_SUFFIX = ".irxi"
+_OBJECT_SUFFIX = ".o"
+_BUILD_KEY_DIGEST_CHARS = 16
+_UNREADABLE_INTERFACE_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+_ANALYSIS_SIDECAR_ATTRS = (
+    "semantic",
+    "irx_owner_module",
+    "irx_generated_template_nodes",
+    "irx_template_specialization_analyzed",
+    "irx_template_specializations_prepared",
+)
+_TRANSIENT_FINGERPRINT_FIELDS = frozenset(
+    {"comment", "loc", "parent", "ref", *_ANALYSIS_SIDECAR_ATTRS}
+)
+_DECLARATION_NODES = (
+    astx.FunctionPrototype,
+    astx.StructDefStmt,
+    astx.ClassDefStmt,
+    astx.ImportStmt,
+    astx.ImportFromStmt,
+)
+
+
+@typechecked
+def _is_transient_name(node: object, value: object) -> bool:
+    """
+    title: Return whether one AST name is a generated placeholder.
+    summary: >-
+      ASTx names unnamed nodes temp_N from a process-wide counter, so those
+      names differ between two parses of the same source.
+    parameters:
+      node:
+        type: object
+      value:
+        type: object
+    returns:
+      type: bool
+    """
+    if isinstance(node, astx.Identifier):
+        return False
+    return (
+        isinstance(value, str)
+        and value.startswith("temp_")
+        and value[5:].isdigit()
+    )
+
+
+@typechecked
+def _structure(value: object) -> object:
+    """
+    title: Build one hashable structural rendering of an AST value.
+    parameters:
+      value:
+        type: object
+    returns:
+      type: object
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, Enum):
+        return (type(value).__qualname__, _structure(value.value))
+    if isinstance(value, Mapping):
+        return (
+            "mapping",
+            tuple(
+                sorted(
+                    (
+                        (_structure(key), _structure(item))
+                        for key, item in value.items()
+                    ),
+                    key=repr,
+                )
+            ),
+        )
+    if isinstance(value, Sequence):
+        return ("sequence", tuple(_structure(item) for item in value))
+    if isinstance(value, type):
+        return ("type", value.__module__, value.__qualname__)
+    if hasattr(value, "__dict__"):
+        fields = tuple(
+            (name, _structure(item))
+            for name, item in sorted(vars(value).items())
+            if name not in _TRANSIENT_FINGERPRINT_FIELDS
+            and not (name == "name" and _is_transient_name(value, item))
+        )
+        return (type(value).__module__, type(value).__qualname__, fields)
+    return ("value", type(value).__qualname__, repr(value))
+
+
+@public
+@typechecked
+def module_fingerprint(parsed_module: ParsedModule) -> str:
+    """
+    title: Return the content fingerprint of one parsed module.
+    summary: >-
+      Hash the module key and the structure of its AST, ignoring source
+      locations, generated placeholder names, and semantic sidecars, so two
+      parses of the same source agree. Fingerprint modules before analyzing
+      them: analysis stores resolved types on expression nodes.
+    parameters:
+      parsed_module:
+        type: ParsedModule
+    returns:
+      type: str
+    """
+    rendering = repr(
+        (
+            MODULE_INTERFACE_FORMAT_VERSION,
+            parsed_module.key,
+            _structure(parsed_module.ast),
+        )
+    )
+    return hashlib.sha256(rendering.encode("utf8")).hexdigest()
+
+
+@typechecked
+def _clear_analysis_sidecars(node: astx.AST) -> None:
+    """
+    title: Remove semantic and template-analysis state from one AST subtree.
+    parameters:
+      node:
+        type: astx.AST
+    """
+    seen: set[int] = set()
+    pending: list[object] = [node]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or not hasattr(current, "__dict__"):
+            continue
+        seen.add(id(current))
+        for attr_name in _ANALYSIS_SIDECAR_ATTRS:
+            if attr_name in vars(current):
+                delattr(current, attr_name)
+        for value in vars(current).values():
+            if isinstance(value, (list, tuple)):
+                pending.extend(value)
+            elif isinstance(value, astx.AST):
+                pending.append(value)
+
+
+@public
+@typechecked
+def module_interface_ast(module: astx.Module) -> astx.Module:
+    """
+    title: Return the declaration-level interface of one module.
+    summary: >-
+      Non-template function definitions become their prototypes. Template
+      functions keep their bodies because importers specialize them, and
+      classes keep their methods because class layout and dispatch are
+      resolved from them; lowering only declares those methods. Imports stay
+      so re-exported names still resolve. Other top-level nodes are dropped,
+      as multi-module lowering ignores them. module is not modified.
+    parameters:
+      module:
+        type: astx.Module
+    returns:
+      type: astx.Module
+    """
+    interface = astx.Module(name=module.name)
+    for node in copy.deepcopy(list(module.nodes)):
+        declaration: astx.AST = node
+        if isinstance(node, astx.FunctionDef) and not astx.is_template_node(
+            node.prototype
+        ):
+            declaration = node.prototype
+        elif not isinstance(node, (*_DECLARATION_NODES, astx.FunctionDef)):
+            continue
+        _clear_analysis_sidecars(declaration)
+        interface.block.append(declaration)
+    setattr(interface, _INTERFACE_MODULE_ATTR, True)
+    return interface
+
+
+@public
+@typechecked
+def is_module_interface(module: astx.Module) -> bool:
+    """
+    title: Return whether one module AST is a loaded module interface.
+    parameters:
+      module:
+        type: astx.Module
+    returns:
+      type: bool
+    """
+    return bool(getattr(module, _INTERFACE_MODULE_ATTR, False))
+
+
+@public
+@typechecked
+@dataclass(frozen=True)
+class ModuleInterface:
+    """
+    title: Serialized interface of one separately compiled module.
+    summary: >-
+      dependencies maps every module reachable from this one to the
+      fingerprint it had when the object was compiled; the interface is only
+      reusable while all of them still match, because the object calls their
+      functions by symbol. symbols are the LLVM functions the object defines
+      and runtime_features the runtime features it needs at link time.
+      build_key identifies the compiler version, target, and code generation
+      options the object was built with.
+    attributes:
+      module_key:
+        type: ModuleKey
+      fingerprint:
+        type: str
+      ast:
+        type: astx.Module
+      dependencies:
+        type: dict[ModuleKey, str]
+      symbols:
+        type: tuple[str, Ellipsis]
+      runtime_features:
+        type: tuple[str, Ellipsis]
+      display_name:
+        type: str | None
+      origin:
+        type: str | None
+      build_key:
+        type: str
+      format_version:
+        type: int
+    """
+
+    module_key: ModuleKey
+    fingerprint: str
+    ast: astx.Module
+    dependencies: dict[ModuleKey, str] = field(default_factory=dict)
+    symbols: tuple[str, ...] = ()
+    runtime_features: tuple[str, ...] = ()
+    display_name: str | None = None
+    origin: str | None = None
+    build_key: str = ""
+    format_version: int = MODULE_INTERFACE_FORMAT_VERSION
+
+    def parsed_module(self) -> ParsedModule:
+        """
+        title: Return the interface as a parsed module for analysis.
+        returns:
+          type: ParsedModule
+        """
+        return ParsedModule(
+            key=self.module_key,
+            ast=self.ast,
+            display_name=self.display_name,
+            origin=self.origin,
+        )
+
+
+@typechecked
+def _artifact_stem(fingerprint: str, build_key: str) -> str:
+    """
+    title: Return the file name stem shared by one interface and its object.
+    parameters:
+      fingerprint:
+        type: str
+      build_key:
+        type: str
+    returns:
+      type: str
+    """
+    if not build_key:
+        return fingerprint
+    digest = hashlib.sha256(build_key.encode("utf8")).hexdigest()
+    return f"{fingerprint}-{digest[:_BUILD_KEY_DIGEST_CHARS]}"
+
+
+@typechecked
+def _replace_file(path: Path, data: bytes) -> None:
+    """
+    title: Write one file through a temporary sibling and rename it in place.
+    summary: >-
+      Readers, including concurrent builds sharing the cache, see either the
+      previous file or the complete new one, never a partial write.
+    parameters:
+      path:
+        type: Path
+      data:
+        type: bytes
+    """
+    descriptor, temporary_name = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(data)
+        os.replace(temporary_name, path)
+    except BaseException:
+        Path(temporary_name).unlink(missing_ok=True)
+        raise
+
+
+@public
+@typechecked
+class ModuleInterfaceCache:
+    """
+    title: Directory of module interfaces and objects keyed by fingerprint.
+    summary: >-
+      Each compiled module is stored as an .irxi interface next to its .o
+      object. Both are named <fingerprint>-<digest>, where digest encodes the
+      interface's build_key, so builds with different configurations keep
+      their own files side by side. A cache with a build_key only loads
+      interfaces built with that key; without one it loads any, which suits
+      analysis. Interfaces are pickled, so only point
+      the cache at directories this compiler writes.
+    attributes:
+      directory:
+        type: Path
+      build_key:
+        type: str | None
+    """
+
+    directory: Path
+    build_key: str | None
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        build_key: str | None = None,
+    ) -> None:
+        """
+        title: Initialize ModuleInterfaceCache.
+        parameters:
+          directory:
+            type: str | Path
+          build_key:
+            type: str | None
+        """
+        self.directory = Path(directory)
+        self.build_key = build_key
+
+    def configured(self, build_key: str) -> ModuleInterfaceCache:
+        """
+        title: Return this cache restricted to one build configuration.
+        parameters:
+          build_key:
+            type: str
+        returns:
+          type: ModuleInterfaceCache
+        """
+        return ModuleInterfaceCache(self.directory, build_key=build_key)
+
+    def interface_path(self, fingerprint: str, build_key: str = "") -> Path:
+        """
+        title: Return the interface file path for one fingerprint.
+        parameters:
+          fingerprint:
+            type: str
+          build_key:
+            type: str
+        returns:
+          type: Path
+        """
+        stem = _artifact_stem(fingerprint, build_key)
+        return self.directory / f"{stem}{_INTERFACE_SUFFIX}"
+
+    def object_path(self, fingerprint: str, build_key: str = "") -> Path:
+        """
+        title: Return the native object path for one fingerprint.
+        parameters:
+          fingerprint:
+            type: str
+          build_key:
+            type: str
+        returns:
+          type: Path
+        """
+        stem = _artifact_stem(fingerprint, build_key)
+        return self.directory / f"{stem}{_OBJECT_SUFFIX}"
+
+    def load(self, fingerprint: str) -> ModuleInterface | None:
+        """
+        title: Load the interface stored for one fingerprint.
+        summary: >-
+          Return None when the interface or its object is missing, when the
+          interface file cannot be read back, when it was written by another
+          interface format version, or when it was built with a build_key
+          other than this cache's. A cache without a build_key returns the
+          first usable interface of any configuration.
+        parameters:
+          fingerprint:
+            type: str
+        returns:
+          type: ModuleInterface | None
+        """
+        if self.build_key is not None:
+            candidates = [self.interface_path(fingerprint, self.build_key)]
+        else:
+            candidates = [
+                self.interface_path(fingerprint),
+                *sorted(
+                    self.directory.glob(f"{fingerprint}-*{_INTERFACE_SUFFIX}")
+                ),
+            ]
+        for interface_path in candidates:
+            interface = self._load_interface(interface_path, fingerprint)
+            if interface is not None:
+                return interface
+        return None
+
+    def _load_interface(
+        self,
+        interface_path: Path,
+        fingerprint: str,
+    ) -> ModuleInterface | None:
+        """
+        title: Load one interface file if it is usable from this cache.
+        parameters:
+          interface_path:
+            type: Path
+          fingerprint:
+            type: str
+        returns:
+          type: ModuleInterface | None
+        """
+        if not interface_path.is_file():
+            return None
+        try:
+            with interface_path.open("rb") as handle:
+                format_version, interface = pickle.load(handle)
+        except _UNREADABLE_INTERFACE_ERRORS:
+            return None
+        if format_version != MODULE_INTERFACE_FORMAT_VERSION:
+            return None
+        if not isinstance(interface, ModuleInterface):
+            return None
+        if self.build_key is not None and interface.build_key != (
+            self.build_key
+        ):
+            return None
+        if not self.object_path(fingerprint, interface.build_key).is_file():
+            return None
+        return interface
+
+    def store(self, interface: ModuleInterface, object_code: bytes) -> Path:
+        """
+        title: Store one interface with the object compiled from its module.
+        summary: >-
+          Both files are replaced atomically, the object first, so a reader
+          never sees a partial file or an interface without the object it
+          describes.
+        parameters:
+          interface:
+            type: ModuleInterface
+          object_code:
+            type: bytes
+        returns:
+          type: Path
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _replace_file(
+            self.object_path(interface.fingerprint, interface.build_key),
+            object_code,
+        )
+        interface_path = self.interface_path(
+            interface.fingerprint, interface.build_key
+        )
+        _replace_file(
+            interface_path,
+            pickle.dumps(
+                (MODULE_INTERFACE_FORMAT_VERSION, interface),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+        )
+        return interface_path
+
+
+__all__ = [
+    "MODULE_INTERFACE_FORMAT_VERSION",
+    "ModuleInterface",
+    "ModuleInterfaceCache",
+    "is_module_interface",
+    "module_fingerprint",
+    "module_interface_ast",
+]
@@ -1461,6 +1461,86 @@ class ResolvedContextManager:
     target_symbol: SemanticSymbol | None = None
 
 
+@public
+@typechecked
+@dataclass(frozen=True)
+class ResolvedParallelReduction:
+    """
+    title: One reduction variable of a parallel loop.
+    summary: >-
+      Name the enclosing numeric variable that each thread accumulates
+      privately from the operator's identity, and the operator that combines
+      the partial results into it after the loop.
+    attributes:
+      symbol:
+        type: SemanticSymbol
+      operator:
+        type: str
+    """
+
+    symbol: SemanticSymbol
+    operator: str
+
+
+@public
+@typechecked
+@dataclass(frozen=True)
+class ResolvedParallelLoop:
+    """
+    title: Resolved parallel loop metadata.
+    summary: >-
+      Capture the validated schedule, chunk size, and reductions of one
+      ParallelForRangeLoopStmt, plus its positive constant step.
+    attributes:
+      schedule:
+        type: str
+      chunk_size:
+        type: int
+      step:
+        type: int
+      reductions:
+        type: tuple[ResolvedParallelReduction, Ellipsis]
+    """
+
+    schedule: str
+    chunk_size: int
+    step: int
+    reductions: tuple[ResolvedParallelReduction, ...] = ()
+
+
+@public
+@typechecked
+@dataclass(frozen=True)
+class ResolvedLoopHints:
+    """
+    title: Resolved loop optimization hints.
+    summary: >-
+      Capture the validated LoopHints of one loop statement. independent is
+      only set after the body was analyzed as a region whose iterations do
+      not assign enclosing variables.
+    attributes:
+      vectorize:
+        type: bool | None
+      vector_width:
+        type: int
+      interleave_count:
+        type: int
+      unroll:
+        type: bool | None
+      unroll_count:
+        type: int
+      independent:
+        type: bool
+    """
+
+    vectorize: bool | None = None
+    vector_width: int = 0
+    interleave_count: int = 0
+    unroll: bool | None = None
+    unroll_count: int = 0
+    independent: bool = False
+
+
 @public
 @typechecked
 class IterationKind(str, Enum):
@@ -1628,6 +1708,10 @@ class SemanticInfo:
         type: ResolvedMethodCall | None
       resolved_context_manager:
         type: ResolvedContextManager | None
+      resolved_parallel_loop:
+        type: ResolvedParallelLoop | None
+      resolved_loop_hints:
+        type: ResolvedLoopHints | None
       resolved_class_construction:
         type: ResolvedClassConstruction | None
       resolved_return:
@@ -1668,6 +1752,8 @@ class SemanticInfo:
     ) = None
     resolved_method_call: ResolvedMethodCall | None = None
     resolved_context_manager: ResolvedContextManager | None = None
+    resolved_parallel_loop: ResolvedParallelLoop | None = None
+    resolved_loop_hints: ResolvedLoopHints | None = None
     resolved_class_construction: ResolvedClassConstruction | None = None
     resolved_return: ReturnResolution | None = None
     resolved_generator_function: ResolvedGeneratorFunction | None = None
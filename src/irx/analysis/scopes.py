@@ -66,6 +66,34 @@ class ScopeStack:
             return None
         return self._stack[-1]
 
+    @property
+    def depth(self) -> int:
+        """
+        title: Return the number of active scopes.
+        returns:
+          type: int
+        """
+        return len(self._stack)
+
+    def declared_since(self, depth: int, symbol: SemanticSymbol) -> bool:
+        """
+        title: Report whether a symbol is declared at or above one depth.
+        summary: >-
+          Regions such as parallel loop bodies record the depth at entry, so
+          this separates symbols local to the region from enclosing ones.
+        parameters:
+          depth:
+            type: int
+          symbol:
+            type: SemanticSymbol
+        returns:
+          type: bool
+        """
+        return any(
+            scope.symbols.get(symbol.name) is symbol
+            for scope in self._stack[depth:]
+        )
+
     def push(self, kind: str) -> Scope:
         """
         title: Push a scope.
@@ -12,6 +12,11 @@ from dataclasses import dataclass, field
 from public import public
 
 from irx import astx
+from irx.analysis.module_artifacts import (
+    ModuleInterface,
+    ModuleInterfaceCache,
+    module_fingerprint,
+)
 from irx.analysis.module_interfaces import (
     ImportResolver,
     ModuleKey,
@@ -74,7 +79,9 @@ class CompilationSession:
     title: Shared state for multi-module analysis and lowering.
     summary: >-
       Own the loaded module graph and cross-module binding state that analysis
-      and lowering share for one compilation.
+      and lowering share for one compilation. With an interface_cache,
+      unchanged dependencies are swapped for their cached interfaces after
+      graph expansion, and interfaces records which ones were.
     attributes:
       root:
         type: ParsedModule
@@ -90,6 +97,12 @@ class CompilationSession:
         type: DiagnosticBag
       visible_bindings:
         type: dict[ModuleKey, dict[str, SemanticBinding]]
+      interface_cache:
+        type: ModuleInterfaceCache | None
+      fingerprints:
+        type: dict[ModuleKey, str]
+      interfaces:
+        type: dict[ModuleKey, ModuleInterface]
       _resolution_cache:
         type: dict[tuple[ModuleKey, str], ParsedModule | None]
       _probe_cache:
@@ -105,6 +118,9 @@ class CompilationSession:
     visible_bindings: dict[ModuleKey, dict[str, SemanticBinding]] = field(
         default_factory=dict
     )
+    interface_cache: ModuleInterfaceCache | None = None
+    fingerprints: dict[ModuleKey, str] = field(default_factory=dict)
+    interfaces: dict[ModuleKey, ModuleInterface] = field(default_factory=dict)
     _resolution_cache: dict[tuple[ModuleKey, str], ParsedModule | None] = (
         field(default_factory=dict)
     )
@@ -166,6 +182,53 @@ class CompilationSession:
         """
         return [self.modules[module_key] for module_key in self.load_order]
 
+    def load_module_interfaces(self) -> None:
+        """
+        title: Swap unchanged dependencies for their cached interfaces.
+        summary: >-
+          Fingerprint every reachable module as parsed, then replace each
+          non-root module whose cached interface was compiled from the same
+          fingerprint against the same reachable dependencies. The graph and
+          load order are kept, since interfaces keep their imports.
+        """
+        if self.interface_cache is None:
+            return
+        for module_key in self.load_order:
+            self.fingerprints[module_key] = module_fingerprint(
+                self.modules[module_key]
+            )
+
+        for module_key in self.load_order:
+            if module_key == self.root.key:
+                continue
+            interface = self.interface_cache.load(
+                self.fingerprints[module_key]
+            )
+            if interface is None or interface.module_key != module_key:
+                continue
+            if any(
+                self.fingerprints.get(dependency_key) != fingerprint
+                for dependency_key, fingerprint in (
+                    interface.dependencies.items()
+                )
+            ):
+                continue
+            self.interfaces[module_key] = interface
+            self._replace_module(interface.parsed_module())
+
+    def _replace_module(self, parsed_module: ParsedModule) -> None:
+        """
+        title: Replace one registered module and every cached reference.
+        parameters:
+          parsed_module:
+            type: ParsedModule
+        """
+        self.modules[parsed_module.key] = parsed_module
+        for cache in (self._resolution_cache, self._probe_cache):
+            for cache_key, resolved in cache.items():
+                if resolved is not None and resolved.key == parsed_module.key:
+                    cache[cache_key] = parsed_module
+
     def resolve_import_specifier(
         self,
         requesting_module_key: ModuleKey,
@@ -133,7 +133,7 @@ def clone_type(type_: astx.DataType) -> astx.DataType:
             clone_type(cast(astx.DataType, type_.key_type)),
             clone_type(cast(astx.DataType, type_.value_type)),
         )
-    if isinstance(type_, astx.BufferOwnerType):
+    if isinstance(type_, astx.BufferOwnerType | astx.ArrayHandleType):
         return type_.__class__()
     if isinstance(type_, astx.OpaqueHandleType):
         return astx.OpaqueHandleType(type_.handle_name)
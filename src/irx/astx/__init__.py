@@ -8,7 +8,18 @@ from typing import Any
 
 import astx as _upstream_astx
 
+from irx.astx.array import ARRAY_ELEMENTWISE_OPS as ARRAY_ELEMENTWISE_OPS
+from irx.astx.array import ARRAY_REDUCE_OPS as ARRAY_REDUCE_OPS
+from irx.astx.array import ArrayCast as ArrayCast
+from irx.astx.array import ArrayElementwise as ArrayElementwise
+from irx.astx.array import ArrayFilter as ArrayFilter
+from irx.astx.array import ArrayHandleType as ArrayHandleType
 from irx.astx.array import ArrayInt32ArrayLength as ArrayInt32ArrayLength
+from irx.astx.array import ArrayLength as ArrayLength
+from irx.astx.array import ArrayLiteral as ArrayLiteral
+from irx.astx.array import ArrayReduce as ArrayReduce
+from irx.astx.array import ArrayRelease as ArrayRelease
+from irx.astx.array import ArrayTake as ArrayTake
 from irx.astx.binary_op import (
     SPECIALIZED_BINARY_OP_EXTRA as SPECIALIZED_BINARY_OP_EXTRA,
 )
@@ -73,8 +84,11 @@ from irx.astx.buffer import BufferOwnerType as BufferOwnerType
 from irx.astx.buffer import BufferViewDescriptor as BufferViewDescriptor
 from irx.astx.buffer import BufferViewIndex as BufferViewIndex
 from irx.astx.buffer import BufferViewRelease as BufferViewRelease
+from irx.astx.buffer import BufferViewReshape as BufferViewReshape
 from irx.astx.buffer import BufferViewRetain as BufferViewRetain
+from irx.astx.buffer import BufferViewSlice as BufferViewSlice
 from irx.astx.buffer import BufferViewStore as BufferViewStore
+from irx.astx.buffer import BufferViewTranspose as BufferViewTranspose
 from irx.astx.buffer import BufferViewType as BufferViewType
 from irx.astx.buffer import BufferViewWrite as BufferViewWrite
 from irx.astx.classes import BaseFieldAccess as BaseFieldAccess
@@ -99,9 +113,17 @@ from irx.astx.ffi import OpaqueHandleType as OpaqueHandleType
 from irx.astx.ffi import PointerType as PointerType
 from irx.astx.iterables import DictComprehension as DictComprehension
 from irx.astx.iterables import ForInLoopStmt as ForInLoopStmt
+from irx.astx.loops import LoopHints as LoopHints
+from irx.astx.loops import get_loop_hints as get_loop_hints
+from irx.astx.loops import set_loop_hints as set_loop_hints
 from irx.astx.modules import ModuleNamespaceType as ModuleNamespaceType
 from irx.astx.modules import NamespaceKind as NamespaceKind
 from irx.astx.modules import NamespaceType as NamespaceType
+from irx.astx.parallel import PARALLEL_REDUCTION_OPS as PARALLEL_REDUCTION_OPS
+from irx.astx.parallel import PARALLEL_SCHEDULES as PARALLEL_SCHEDULES
+from irx.astx.parallel import (
+    ParallelForRangeLoopStmt as ParallelForRangeLoopStmt,
+)
 from irx.astx.structs import FieldAccess as FieldAccess
 from irx.astx.structs import StructType as StructType
 from irx.astx.system import AssertStmt as AssertStmt
@@ -131,17 +153,27 @@ from irx.astx.templates import set_template_params as set_template_params
 from irx.astx.templates import (
     template_specialization_name as template_specialization_name,
 )
+from irx.astx.tensor import TENSOR_ELEMENTWISE_OPS as TENSOR_ELEMENTWISE_OPS
+from irx.astx.tensor import TENSOR_REDUCE_OPS as TENSOR_REDUCE_OPS
+from irx.astx.tensor import TENSOR_UNARY_OPS as TENSOR_UNARY_OPS
 from irx.astx.tensor import TensorByteOffset as TensorByteOffset
 from irx.astx.tensor import TensorElementCount as TensorElementCount
+from irx.astx.tensor import TensorElementwise as TensorElementwise
 from irx.astx.tensor import TensorIndex as TensorIndex
 from irx.astx.tensor import TensorLiteral as TensorLiteral
+from irx.astx.tensor import TensorMatmul as TensorMatmul
 from irx.astx.tensor import TensorNDim as TensorNDim
+from irx.astx.tensor import TensorReduce as TensorReduce
 from irx.astx.tensor import TensorRelease as TensorRelease
+from irx.astx.tensor import TensorReshape as TensorReshape
 from irx.astx.tensor import TensorRetain as TensorRetain
 from irx.astx.tensor import TensorShape as TensorShape
+from irx.astx.tensor import TensorSlice as TensorSlice
 from irx.astx.tensor import TensorStore as TensorStore
 from irx.astx.tensor import TensorStride as TensorStride
+from irx.astx.tensor import TensorTranspose as TensorTranspose
 from irx.astx.tensor import TensorType as TensorType
+from irx.astx.tensor import TensorUnary as TensorUnary
 from irx.astx.tensor import TensorView as TensorView
 from irx.astx.types import GeneratorType as GeneratorType
 from irx.astx.types import TemplateTypeVar as TemplateTypeVar
@@ -149,9 +181,25 @@ from irx.astx.types import UnionType as UnionType
 from irx.typecheck import typechecked
 
 __all__ = (
+    "ARRAY_ELEMENTWISE_OPS",
+    "ARRAY_REDUCE_OPS",
+    "PARALLEL_REDUCTION_OPS",
+    "PARALLEL_SCHEDULES",
     "SPECIALIZED_BINARY_OP_EXTRA",
+    "TENSOR_ELEMENTWISE_OPS",
+    "TENSOR_REDUCE_OPS",
+    "TENSOR_UNARY_OPS",
     "AddBinOp",
+    "ArrayCast",
+    "ArrayElementwise",
+    "ArrayFilter",
+    "ArrayHandleType",
     "ArrayInt32ArrayLength",
+    "ArrayLength",
+    "ArrayLiteral",
+    "ArrayReduce",
+    "ArrayRelease",
+    "ArrayTake",
     "AssertStmt",
     "AssignmentBinOp",
     "BaseFieldAccess",
@@ -163,8 +211,11 @@ __all__ = (
     "BufferViewDescriptor",
     "BufferViewIndex",
     "BufferViewRelease",
+    "BufferViewReshape",
     "BufferViewRetain",
+    "BufferViewSlice",
     "BufferViewStore",
+    "BufferViewTranspose",
     "BufferViewType",
     "BufferViewWrite",
     "Cast",
@@ -191,6 +242,7 @@ __all__ = (
     "ListLength",
     "LogicalAndBinOp",
     "LogicalOrBinOp",
+    "LoopHints",
     "LtBinOp",
     "MethodCall",
     "ModBinOp",
@@ -200,6 +252,7 @@ __all__ = (
     "NamespaceType",
     "NeBinOp",
     "OpaqueHandleType",
+    "ParallelForRangeLoopStmt",
     "PointerType",
     "PrintExpr",
     "StaticFieldAccess",
@@ -210,15 +263,22 @@ __all__ = (
     "TemplateTypeVar",
     "TensorByteOffset",
     "TensorElementCount",
+    "TensorElementwise",
     "TensorIndex",
     "TensorLiteral",
+    "TensorMatmul",
     "TensorNDim",
+    "TensorReduce",
     "TensorRelease",
+    "TensorReshape",
     "TensorRetain",
     "TensorShape",
+    "TensorSlice",
     "TensorStore",
     "TensorStride",
+    "TensorTranspose",
     "TensorType",
+    "TensorUnary",
     "TensorView",
     "UnionType",
     "WithStmt",
@@ -226,11 +286,13 @@ __all__ = (
     "binary_op_type_for_opcode",
     "clear_generated_template_nodes",
     "generated_template_nodes",
+    "get_loop_hints",
     "get_template_args",
     "get_template_params",
     "is_template_node",
     "is_template_specialization",
     "mark_template_specialization",
+    "set_loop_hints",
     "set_template_args",
     "set_template_params",
     "specialize_binary_op",
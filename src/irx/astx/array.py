@@ -2,17 +2,35 @@
 title: IRx-owned array AST nodes.
 summary: >-
   Provide internal nodes for the Arrow C++ backed one-dimensional array
-  runtime.
+  runtime and the Arrow compute kernels that operate on its handles.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import cast
 
 import astx
 
+from irx.astx.ffi import OpaqueHandleType
 from irx.typecheck import typechecked
 
+ARRAY_REDUCE_OPS = ("sum", "min", "max", "mean")
+ARRAY_ELEMENTWISE_OPS = (
+    "+",
+    "-",
+    "*",
+    "/",
+    "==",
+    "!=",
+    "<",
+    "<=",
+    ">",
+    ">=",
+    "&&",
+    "||",
+)
+
 
 @typechecked
 class ArrayInt32ArrayLength(astx.base.DataType):
@@ -62,4 +80,458 @@ class ArrayInt32ArrayLength(astx.base.DataType):
         )
 
 
-__all__ = ["ArrayInt32ArrayLength"]
+@typechecked
+class ArrayHandleType(OpaqueHandleType):
+    """
+    title: Internal opaque Arrow array handle type.
+    summary: >-
+      The element type is a runtime property of the Arrow array, so the handle
+      type carries none.
+    """
+
+    def __init__(self) -> None:
+        """
+        title: Initialize the array handle type.
+        """
+        super().__init__("irx_arrow_array_handle")
+
+    def __str__(self) -> str:
+        """
+        title: Render the array handle type.
+        returns:
+          type: str
+        """
+        return "ArrayHandleType"
+
+
+@typechecked
+class ArrayLiteral(astx.base.DataType):
+    """
+    title: Internal Arrow array literal node.
+    summary: >-
+      Build one Arrow array from scalar values and return an owned handle.
+    attributes:
+      values:
+        type: list[astx.AST]
+      element_type:
+        type: astx.DataType
+      type_:
+        type: ArrayHandleType
+    """
+
+    values: list[astx.AST]
+    element_type: astx.DataType
+    type_: ArrayHandleType
+
+    def __init__(
+        self,
+        values: Sequence[astx.AST],
+        *,
+        element_type: astx.DataType,
+    ) -> None:
+        """
+        title: Initialize one array literal.
+        parameters:
+          values:
+            type: Sequence[astx.AST]
+          element_type:
+            type: astx.DataType
+        """
+        super().__init__()
+        self.values = list(values)
+        self.element_type = element_type
+        self.type_ = ArrayHandleType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the array literal.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "values": [item.get_struct(simplified) for item in self.values],
+            "element_type": self.element_type.get_struct(simplified),
+        }
+        return self._prepare_struct(
+            "ArrayLiteral",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayLength(astx.base.DataType):
+    """
+    title: Internal Arrow array length query.
+    attributes:
+      array:
+        type: astx.AST
+      type_:
+        type: astx.Int64
+    """
+
+    array: astx.AST
+    type_: astx.Int64
+
+    def __init__(self, array: astx.AST) -> None:
+        """
+        title: Initialize one array length query.
+        parameters:
+          array:
+            type: astx.AST
+        """
+        super().__init__()
+        self.array = array
+        self.type_ = astx.Int64()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the length query.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        return self._prepare_struct(
+            "ArrayLength",
+            self.array.get_struct(simplified),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayRelease(astx.base.DataType):
+    """
+    title: Internal explicit release for one owned Arrow array handle.
+    attributes:
+      array:
+        type: astx.AST
+      type_:
+        type: astx.NoneType
+    """
+
+    array: astx.AST
+    type_: astx.NoneType
+
+    def __init__(self, array: astx.AST) -> None:
+        """
+        title: Initialize one array release helper.
+        parameters:
+          array:
+            type: astx.AST
+        """
+        super().__init__()
+        self.array = array
+        self.type_ = astx.NoneType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the release helper.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        return self._prepare_struct(
+            "ArrayRelease",
+            self.array.get_struct(simplified),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayReduce(astx.base.DataType):
+    """
+    title: Internal Arrow compute reduction node.
+    summary: >-
+      Reduce one array with a vectorized Arrow kernel. Nulls are skipped; sum,
+      min, and max return either Int64 or Float64, and mean returns Float64.
+    attributes:
+      array:
+        type: astx.AST
+      op:
+        type: str
+      type_:
+        type: astx.DataType
+    """
+
+    array: astx.AST
+    op: str
+    type_: astx.DataType
+
+    def __init__(
+        self,
+        array: astx.AST,
+        op: str,
+        *,
+        result_type: astx.DataType | None = None,
+    ) -> None:
+        """
+        title: Initialize one array reduction.
+        parameters:
+          array:
+            type: astx.AST
+          op:
+            type: str
+          result_type:
+            type: astx.DataType | None
+        """
+        super().__init__()
+        self.array = array
+        self.op = op
+        if result_type is None:
+            result_type = astx.Float64() if op == "mean" else astx.Int64()
+        self.type_ = result_type
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the reduction.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        return self._prepare_struct(
+            f"ArrayReduce[{self.op}]",
+            self.array.get_struct(simplified),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayElementwise(astx.base.DataType):
+    """
+    title: Internal Arrow compute elementwise binary node.
+    summary: >-
+      Apply one arithmetic, comparison, or boolean kernel to an array and
+      either another array or a numeric scalar, returning a new owned handle.
+    attributes:
+      op_code:
+        type: str
+      lhs:
+        type: astx.AST
+      rhs:
+        type: astx.AST
+      type_:
+        type: ArrayHandleType
+    """
+
+    op_code: str
+    lhs: astx.AST
+    rhs: astx.AST
+    type_: ArrayHandleType
+
+    def __init__(self, op_code: str, lhs: astx.AST, rhs: astx.AST) -> None:
+        """
+        title: Initialize one elementwise array operation.
+        parameters:
+          op_code:
+            type: str
+          lhs:
+            type: astx.AST
+          rhs:
+            type: astx.AST
+        """
+        super().__init__()
+        self.op_code = op_code
+        self.lhs = lhs
+        self.rhs = rhs
+        self.type_ = ArrayHandleType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the operation.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "lhs": self.lhs.get_struct(simplified),
+            "rhs": self.rhs.get_struct(simplified),
+        }
+        return self._prepare_struct(
+            f"ArrayElementwise[{self.op_code}]",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayFilter(astx.base.DataType):
+    """
+    title: Internal Arrow compute filter node.
+    summary: >-
+      Keep the array values whose boolean mask entry is true; null mask
+      entries drop their value.
+    attributes:
+      array:
+        type: astx.AST
+      mask:
+        type: astx.AST
+      type_:
+        type: ArrayHandleType
+    """
+
+    array: astx.AST
+    mask: astx.AST
+    type_: ArrayHandleType
+
+    def __init__(self, array: astx.AST, mask: astx.AST) -> None:
+        """
+        title: Initialize one array filter.
+        parameters:
+          array:
+            type: astx.AST
+          mask:
+            type: astx.AST
+        """
+        super().__init__()
+        self.array = array
+        self.mask = mask
+        self.type_ = ArrayHandleType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the filter.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "array": self.array.get_struct(simplified),
+            "mask": self.mask.get_struct(simplified),
+        }
+        return self._prepare_struct(
+            "ArrayFilter",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayTake(astx.base.DataType):
+    """
+    title: Internal Arrow compute take node.
+    summary: >-
+      Gather array values at the positions held by an integer index array.
+    attributes:
+      array:
+        type: astx.AST
+      indices:
+        type: astx.AST
+      type_:
+        type: ArrayHandleType
+    """
+
+    array: astx.AST
+    indices: astx.AST
+    type_: ArrayHandleType
+
+    def __init__(self, array: astx.AST, indices: astx.AST) -> None:
+        """
+        title: Initialize one array take.
+        parameters:
+          array:
+            type: astx.AST
+          indices:
+            type: astx.AST
+        """
+        super().__init__()
+        self.array = array
+        self.indices = indices
+        self.type_ = ArrayHandleType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the take.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "array": self.array.get_struct(simplified),
+            "indices": self.indices.get_struct(simplified),
+        }
+        return self._prepare_struct(
+            "ArrayTake",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class ArrayCast(astx.base.DataType):
+    """
+    title: Internal Arrow compute cast node.
+    summary: >-
+      Convert array values to another primitive element type; lossy casts fail
+      at run time and produce a null handle.
+    attributes:
+      array:
+        type: astx.AST
+      target_type:
+        type: astx.DataType
+      type_:
+        type: ArrayHandleType
+    """
+
+    array: astx.AST
+    target_type: astx.DataType
+    type_: ArrayHandleType
+
+    def __init__(self, array: astx.AST, target_type: astx.DataType) -> None:
+        """
+        title: Initialize one array cast.
+        parameters:
+          array:
+            type: astx.AST
+          target_type:
+            type: astx.DataType
+        """
+        super().__init__()
+        self.array = array
+        self.target_type = target_type
+        self.type_ = ArrayHandleType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the cast.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        return self._prepare_struct(
+            f"ArrayCast[{self.target_type}]",
+            self.array.get_struct(simplified),
+            simplified,
+        )
+
+
+__all__ = [
+    "ARRAY_ELEMENTWISE_OPS",
+    "ARRAY_REDUCE_OPS",
+    "ArrayCast",
+    "ArrayElementwise",
+    "ArrayFilter",
+    "ArrayHandleType",
+    "ArrayInt32ArrayLength",
+    "ArrayLength",
+    "ArrayLiteral",
+    "ArrayReduce",
+    "ArrayRelease",
+    "ArrayTake",
+]
@@ -15,7 +15,7 @@ import astx
 from astx.types import AnyType
 
 from irx.astx.ffi import OpaqueHandleType
-from irx.buffer import BufferViewMetadata
+from irx.buffer import BufferIndexBoundsPolicy, BufferViewMetadata
 from irx.typecheck import typechecked
 
 
@@ -132,18 +132,25 @@ class BufferViewIndex(astx.base.DataType):
         type: astx.AST
       indices:
         type: list[astx.AST]
+      bounds_policy:
+        type: BufferIndexBoundsPolicy
       type_:
         type: astx.DataType
     """
 
     base: astx.AST
     indices: list[astx.AST]
+    bounds_policy: BufferIndexBoundsPolicy
     type_: astx.DataType
 
     def __init__(
         self,
         base: astx.AST,
         indices: Sequence[astx.AST],
+        *,
+        bounds_policy: BufferIndexBoundsPolicy = (
+            BufferIndexBoundsPolicy.DEFAULT
+        ),
     ) -> None:
         """
         title: Initialize one low-level indexed read.
@@ -152,6 +159,8 @@ class BufferViewIndex(astx.base.DataType):
             type: astx.AST
           indices:
             type: Sequence[astx.AST]
+          bounds_policy:
+            type: BufferIndexBoundsPolicy
         """
         super().__init__()
         if not indices:
@@ -160,6 +169,7 @@ class BufferViewIndex(astx.base.DataType):
             )
         self.base = base
         self.indices = list(indices)
+        self.bounds_policy = bounds_policy
         self.type_ = AnyType()
 
     def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
@@ -198,6 +208,8 @@ class BufferViewStore(astx.base.DataType):
         type: list[astx.AST]
       value:
         type: astx.AST
+      bounds_policy:
+        type: BufferIndexBoundsPolicy
       type_:
         type: astx.Int32
     """
@@ -205,6 +217,7 @@ class BufferViewStore(astx.base.DataType):
     base: astx.AST
     indices: list[astx.AST]
     value: astx.AST
+    bounds_policy: BufferIndexBoundsPolicy
     type_: astx.Int32
 
     def __init__(
@@ -212,6 +225,10 @@ class BufferViewStore(astx.base.DataType):
         base: astx.AST,
         indices: Sequence[astx.AST],
         value: astx.AST,
+        *,
+        bounds_policy: BufferIndexBoundsPolicy = (
+            BufferIndexBoundsPolicy.DEFAULT
+        ),
     ) -> None:
         """
         title: Initialize one low-level indexed store.
@@ -222,6 +239,8 @@ class BufferViewStore(astx.base.DataType):
             type: Sequence[astx.AST]
           value:
             type: astx.AST
+          bounds_policy:
+            type: BufferIndexBoundsPolicy
         """
         super().__init__()
         if not indices:
@@ -231,6 +250,7 @@ class BufferViewStore(astx.base.DataType):
         self.base = base
         self.indices = list(indices)
         self.value = value
+        self.bounds_policy = bounds_policy
         self.type_ = astx.Int32()
 
     def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
@@ -323,6 +343,185 @@ class BufferViewWrite(astx.base.DataType):
         )
 
 
+@typechecked
+class BufferViewSlice(astx.base.DataType):
+    """
+    title: Internal buffer view slice node.
+    summary: >-
+      Select a strided window of a statically described base view without
+      copying. Each item applies to one leading axis: a slice keeps the axis
+      and an integer drops it.
+    attributes:
+      base:
+        type: astx.AST
+      items:
+        type: tuple[slice | int, Ellipsis]
+      type_:
+        type: BufferViewType
+    """
+
+    base: astx.AST
+    items: tuple[slice | int, ...]
+    type_: BufferViewType
+
+    def __init__(
+        self,
+        base: astx.AST,
+        items: Sequence[slice | int],
+    ) -> None:
+        """
+        title: Initialize one buffer view slice.
+        parameters:
+          base:
+            type: astx.AST
+          items:
+            type: Sequence[slice | int]
+        """
+        super().__init__()
+        if not items:
+            raise ValueError("buffer view slicing requires at least one item")
+        self.base = base
+        self.items = tuple(items)
+        self.type_ = BufferViewType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the slice view.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "items": [
+                item
+                if isinstance(item, int)
+                else [item.start, item.stop, item.step]
+                for item in self.items
+            ],
+        }
+        return self._prepare_struct(
+            "BufferViewSlice",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class BufferViewTranspose(astx.base.DataType):
+    """
+    title: Internal buffer view transpose node.
+    summary: >-
+      Permute the axes of the base by permuting its shape and strides. No
+      axes means reversing them.
+    attributes:
+      base:
+        type: astx.AST
+      axes:
+        type: tuple[int, Ellipsis] | None
+      type_:
+        type: BufferViewType
+    """
+
+    base: astx.AST
+    axes: tuple[int, ...] | None
+    type_: BufferViewType
+
+    def __init__(
+        self,
+        base: astx.AST,
+        axes: Sequence[int] | None = None,
+    ) -> None:
+        """
+        title: Initialize one buffer view transpose.
+        parameters:
+          base:
+            type: astx.AST
+          axes:
+            type: Sequence[int] | None
+        """
+        super().__init__()
+        self.base = base
+        self.axes = None if axes is None else tuple(axes)
+        self.type_ = BufferViewType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the transpose view.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "axes": None if self.axes is None else list(self.axes),
+        }
+        return self._prepare_struct(
+            "BufferViewTranspose",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class BufferViewReshape(astx.base.DataType):
+    """
+    title: Internal buffer view reshape node.
+    summary: >-
+      Reinterpret the base with a new C-order shape. One dimension may be -1
+      and is inferred; semantic analysis rejects reshapes that would need a
+      copy.
+    attributes:
+      base:
+        type: astx.AST
+      shape:
+        type: tuple[int, Ellipsis]
+      type_:
+        type: BufferViewType
+    """
+
+    base: astx.AST
+    shape: tuple[int, ...]
+    type_: BufferViewType
+
+    def __init__(self, base: astx.AST, shape: Sequence[int]) -> None:
+        """
+        title: Initialize one buffer view reshape.
+        parameters:
+          base:
+            type: astx.AST
+          shape:
+            type: Sequence[int]
+        """
+        super().__init__()
+        self.base = base
+        self.shape = tuple(shape)
+        self.type_ = BufferViewType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the reshape view.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "shape": list(self.shape),
+        }
+        return self._prepare_struct(
+            "BufferViewReshape",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
 @typechecked
 class BufferViewRetain(astx.base.DataType):
     """
@@ -410,8 +609,11 @@ __all__ = [
     "BufferViewDescriptor",
     "BufferViewIndex",
     "BufferViewRelease",
+    "BufferViewReshape",
     "BufferViewRetain",
+    "BufferViewSlice",
     "BufferViewStore",
+    "BufferViewTranspose",
     "BufferViewType",
     "BufferViewWrite",
 ]
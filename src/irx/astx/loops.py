@@ -0,0 +1,83 @@
+"""
+title: IRx-owned loop hint helpers.
+summary: >-
+  Attach vectorization, interleaving, unrolling, and independence hints to
+  loop statements without requiring parser-level pragma syntax inside IRx.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import astx
+
+from irx.typecheck import typechecked
+
+_LOOP_HINTS_ATTR = "irx_loop_hints"
+
+
+@typechecked
+@dataclass(frozen=True)
+class LoopHints:
+    """
+    title: Optimization hints for one loop statement.
+    summary: >-
+      None and zero leave a choice to the optimizer. vector_width and
+      unroll_count request an exact factor; independent asserts that no
+      iteration reads memory another iteration writes, which semantic
+      analysis backs by rejecting writes to enclosing variables.
+    attributes:
+      vectorize:
+        type: bool | None
+      vector_width:
+        type: int
+      interleave_count:
+        type: int
+      unroll:
+        type: bool | None
+      unroll_count:
+        type: int
+      independent:
+        type: bool
+    """
+
+    vectorize: bool | None = None
+    vector_width: int = 0
+    interleave_count: int = 0
+    unroll: bool | None = None
+    unroll_count: int = 0
+    independent: bool = False
+
+
+@typechecked
+def set_loop_hints(node: astx.AST, hints: LoopHints | None) -> None:
+    """
+    title: Attach optimization hints to one loop statement.
+    parameters:
+      node:
+        type: astx.AST
+      hints:
+        type: LoopHints | None
+    """
+    setattr(node, _LOOP_HINTS_ATTR, hints)
+
+
+@typechecked
+def get_loop_hints(node: astx.AST) -> LoopHints | None:
+    """
+    title: Return the optimization hints attached to one loop statement.
+    parameters:
+      node:
+        type: astx.AST
+    returns:
+      type: LoopHints | None
+    """
+    hints = getattr(node, _LOOP_HINTS_ATTR, None)
+    return hints if isinstance(hints, LoopHints) else None
+
+
+__all__ = [
+    "LoopHints",
+    "get_loop_hints",
+    "set_loop_hints",
+]
@@ -0,0 +1,139 @@
+"""
+title: IRx-owned parallel loop AST nodes.
+summary: >-
+  Provide a counted loop whose iterations may run concurrently on the native
+  thread pool, with optional per-variable reductions.
+"""
+
+from __future__ import annotations
+
+from typing import cast
+
+import astx
+
+from astx.base import NO_SOURCE_LOCATION, ReprStruct, SourceLocation
+
+from irx.typecheck import typechecked
+
+PARALLEL_SCHEDULES = ("static", "dynamic")
+PARALLEL_REDUCTION_OPS = ("+", "*", "min", "max")
+
+
+@typechecked
+class ParallelForRangeLoopStmt(astx.ForRangeLoopStmt):
+    """
+    title: Internal parallel for-range statement node.
+    summary: >-
+      Model ``for variable in range(start, end, step)`` where iterations are
+      independent. A static schedule gives each thread one contiguous share
+      of the iterations, or chunk_size blocks round-robin; a dynamic schedule
+      hands out chunk_size blocks and lets idle threads steal from busy ones.
+      A chunk_size of zero lets the runtime choose. Each name in reductions
+      is an enclosing variable that iterations update privately and that is
+      combined with its operator after the loop.
+    attributes:
+      schedule:
+        type: str
+      chunk_size:
+        type: int
+      reductions:
+        type: dict[str, str]
+    """
+
+    schedule: str
+    chunk_size: int
+    reductions: dict[str, str]
+
+    def __init__(
+        self,
+        variable: astx.InlineVariableDeclaration,
+        start: astx.Expr,
+        end: astx.Expr,
+        step: astx.Expr,
+        body: astx.Block,
+        *,
+        schedule: str = "static",
+        chunk_size: int = 0,
+        reductions: dict[str, str] | None = None,
+        loc: SourceLocation = NO_SOURCE_LOCATION,
+        parent: astx.ASTNodes | None = None,
+    ) -> None:
+        """
+        title: Initialize one parallel for-range statement.
+        parameters:
+          variable:
+            type: astx.InlineVariableDeclaration
+          start:
+            type: astx.Expr
+          end:
+            type: astx.Expr
+          step:
+            type: astx.Expr
+          body:
+            type: astx.Block
+          schedule:
+            type: str
+          chunk_size:
+            type: int
+          reductions:
+            type: dict[str, str] | None
+          loc:
+            type: SourceLocation
+          parent:
+            type: astx.ASTNodes | None
+        """
+        super().__init__(
+            variable=variable,
+            start=start,
+            end=end,
+            step=step,
+            body=body,
+            loc=loc,
+            parent=parent,
+        )
+        self.schedule = schedule
+        self.chunk_size = chunk_size
+        self.reductions = dict(reductions or {})
+
+    def __str__(self) -> str:
+        """
+        title: Return a compact display string.
+        returns:
+          type: str
+        """
+        return "ParallelForRangeLoopStmt"
+
+    def get_struct(self, simplified: bool = False) -> ReprStruct:
+        """
+        title: Return the structured representation.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: ReprStruct
+        """
+        key = (
+            f"PARALLEL-FOR-RANGE-LOOP-STMT[{id(self)}]"
+            if simplified
+            else "PARALLEL-FOR-RANGE-LOOP-STMT"
+        )
+        value = cast(
+            ReprStruct,
+            {
+                "start": self.start.get_struct(simplified),
+                "end": self.end.get_struct(simplified),
+                "step": self.step.get_struct(simplified),
+                "schedule": self.schedule,
+                "chunk_size": self.chunk_size,
+                "reductions": dict(self.reductions),
+                "body": self.body.get_struct(simplified),
+            },
+        )
+        return self._prepare_struct(key, value, simplified)
+
+
+__all__ = [
+    "PARALLEL_REDUCTION_OPS",
+    "PARALLEL_SCHEDULES",
+    "ParallelForRangeLoopStmt",
+]
@@ -16,6 +16,10 @@ from astx.types import AnyType
 
 from irx.typecheck import typechecked
 
+TENSOR_ELEMENTWISE_OPS = ("+", "-", "*", "/", "min", "max")
+TENSOR_UNARY_OPS = ("-", "abs", "sqrt")
+TENSOR_REDUCE_OPS = ("sum", "min", "max", "mean")
+
 
 @typechecked
 class TensorType(AnyType):
@@ -210,6 +214,184 @@ class TensorView(astx.base.DataType):
         )
 
 
+@typechecked
+class TensorSlice(astx.base.DataType):
+    """
+    title: Internal Tensor slice view node.
+    summary: >-
+      Select a strided window of the base without copying. Each item applies
+      to one leading axis: a slice keeps the axis and an integer drops it.
+    attributes:
+      base:
+        type: astx.AST
+      items:
+        type: tuple[slice | int, Ellipsis]
+      type_:
+        type: TensorType
+    """
+
+    base: astx.AST
+    items: tuple[slice | int, ...]
+    type_: TensorType
+
+    def __init__(
+        self,
+        base: astx.AST,
+        items: Sequence[slice | int],
+    ) -> None:
+        """
+        title: Initialize one Tensor slice view.
+        parameters:
+          base:
+            type: astx.AST
+          items:
+            type: Sequence[slice | int]
+        """
+        super().__init__()
+        if not items:
+            raise ValueError("tensor slicing requires at least one item")
+        self.base = base
+        self.items = tuple(items)
+        self.type_ = TensorType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the slice view.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "items": [
+                item
+                if isinstance(item, int)
+                else [item.start, item.stop, item.step]
+                for item in self.items
+            ],
+        }
+        return self._prepare_struct(
+            "TensorSlice",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class TensorTranspose(astx.base.DataType):
+    """
+    title: Internal Tensor transpose view node.
+    summary: >-
+      Permute the axes of the base by permuting its shape and strides. No
+      axes means reversing them.
+    attributes:
+      base:
+        type: astx.AST
+      axes:
+        type: tuple[int, Ellipsis] | None
+      type_:
+        type: TensorType
+    """
+
+    base: astx.AST
+    axes: tuple[int, ...] | None
+    type_: TensorType
+
+    def __init__(
+        self,
+        base: astx.AST,
+        axes: Sequence[int] | None = None,
+    ) -> None:
+        """
+        title: Initialize one Tensor transpose view.
+        parameters:
+          base:
+            type: astx.AST
+          axes:
+            type: Sequence[int] | None
+        """
+        super().__init__()
+        self.base = base
+        self.axes = None if axes is None else tuple(axes)
+        self.type_ = TensorType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the transpose view.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "axes": None if self.axes is None else list(self.axes),
+        }
+        return self._prepare_struct(
+            "TensorTranspose",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class TensorReshape(astx.base.DataType):
+    """
+    title: Internal Tensor reshape view node.
+    summary: >-
+      Reinterpret the base with a new C-order shape. One dimension may be -1
+      and is inferred; semantic analysis rejects reshapes that would need a
+      copy.
+    attributes:
+      base:
+        type: astx.AST
+      shape:
+        type: tuple[int, Ellipsis]
+      type_:
+        type: TensorType
+    """
+
+    base: astx.AST
+    shape: tuple[int, ...]
+    type_: TensorType
+
+    def __init__(self, base: astx.AST, shape: Sequence[int]) -> None:
+        """
+        title: Initialize one Tensor reshape view.
+        parameters:
+          base:
+            type: astx.AST
+          shape:
+            type: Sequence[int]
+        """
+        super().__init__()
+        self.base = base
+        self.shape = tuple(shape)
+        self.type_ = TensorType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the reshape view.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "shape": list(self.shape),
+        }
+        return self._prepare_struct(
+            "TensorReshape",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
 @typechecked
 class TensorIndex(astx.base.DataType):
     """
@@ -665,17 +847,276 @@ class TensorRelease(astx.base.DataType):
         )
 
 
+@typechecked
+class TensorElementwise(astx.base.DataType):
+    """
+    title: Internal elementwise binary Tensor operation.
+    summary: >-
+      Combine two tensors, or one tensor and a numeric scalar, element by
+      element into a new owned tensor. Static shapes broadcast against each
+      other the way NumPy shapes do. With fast_math set, floating-point
+      lowering may reassociate and contract an addition of a product into one
+      fused multiply-add.
+    attributes:
+      op_code:
+        type: str
+      lhs:
+        type: astx.AST
+      rhs:
+        type: astx.AST
+      fast_math:
+        type: bool
+      type_:
+        type: TensorType
+    """
+
+    op_code: str
+    lhs: astx.AST
+    rhs: astx.AST
+    fast_math: bool
+    type_: TensorType
+
+    def __init__(
+        self,
+        op_code: str,
+        lhs: astx.AST,
+        rhs: astx.AST,
+        *,
+        fast_math: bool = False,
+    ) -> None:
+        """
+        title: Initialize one elementwise Tensor operation.
+        parameters:
+          op_code:
+            type: str
+          lhs:
+            type: astx.AST
+          rhs:
+            type: astx.AST
+          fast_math:
+            type: bool
+        """
+        super().__init__()
+        self.op_code = op_code
+        self.lhs = lhs
+        self.rhs = rhs
+        self.fast_math = fast_math
+        self.type_ = TensorType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the operation.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "lhs": self.lhs.get_struct(simplified),
+            "rhs": self.rhs.get_struct(simplified),
+        }
+        return self._prepare_struct(
+            f"TensorElementwise[{self.op_code}]",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class TensorUnary(astx.base.DataType):
+    """
+    title: Internal elementwise unary Tensor operation.
+    summary: >-
+      Apply negation, absolute value, or square root to every element into a
+      new owned tensor.
+    attributes:
+      op_code:
+        type: str
+      operand:
+        type: astx.AST
+      type_:
+        type: TensorType
+    """
+
+    op_code: str
+    operand: astx.AST
+    type_: TensorType
+
+    def __init__(self, op_code: str, operand: astx.AST) -> None:
+        """
+        title: Initialize one unary Tensor operation.
+        parameters:
+          op_code:
+            type: str
+          operand:
+            type: astx.AST
+        """
+        super().__init__()
+        self.op_code = op_code
+        self.operand = operand
+        self.type_ = TensorType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the operation.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        return self._prepare_struct(
+            f"TensorUnary[{self.op_code}]",
+            self.operand.get_struct(simplified),
+            simplified,
+        )
+
+
+@typechecked
+class TensorReduce(astx.base.DataType):
+    """
+    title: Internal Tensor reduction.
+    summary: >-
+      Reduce every element, or one axis, with sum, min, max, or mean. A full
+      reduction, or an axis reduction of a rank-1 tensor, yields a scalar;
+      other axis reductions yield a new owned tensor without that axis. Mean
+      of an integer tensor is Float64.
+    attributes:
+      base:
+        type: astx.AST
+      op:
+        type: str
+      axis:
+        type: int | None
+      type_:
+        type: astx.DataType
+    """
+
+    base: astx.AST
+    op: str
+    axis: int | None
+    type_: astx.DataType
+
+    def __init__(
+        self,
+        base: astx.AST,
+        op: str,
+        *,
+        axis: int | None = None,
+    ) -> None:
+        """
+        title: Initialize one Tensor reduction.
+        parameters:
+          base:
+            type: astx.AST
+          op:
+            type: str
+          axis:
+            type: int | None
+        """
+        super().__init__()
+        self.base = base
+        self.op = op
+        self.axis = axis
+        self.type_ = AnyType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the reduction.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "base": self.base.get_struct(simplified),
+            "axis": self.axis,
+        }
+        return self._prepare_struct(
+            f"TensorReduce[{self.op}]",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
+@typechecked
+class TensorMatmul(astx.base.DataType):
+    """
+    title: Internal Tensor matrix product.
+    summary: >-
+      Contract the last axis of lhs with the first axis of rhs, where each
+      operand is a vector or a matrix, following NumPy matmul. The product of
+      two vectors is a scalar; other products are a new owned tensor.
+    attributes:
+      lhs:
+        type: astx.AST
+      rhs:
+        type: astx.AST
+      type_:
+        type: astx.DataType
+    """
+
+    lhs: astx.AST
+    rhs: astx.AST
+    type_: astx.DataType
+
+    def __init__(self, lhs: astx.AST, rhs: astx.AST) -> None:
+        """
+        title: Initialize one Tensor matrix product.
+        parameters:
+          lhs:
+            type: astx.AST
+          rhs:
+            type: astx.AST
+        """
+        super().__init__()
+        self.lhs = lhs
+        self.rhs = rhs
+        self.type_ = AnyType()
+
+    def get_struct(self, simplified: bool = False) -> astx.base.ReprStruct:
+        """
+        title: Return the structured representation of the product.
+        parameters:
+          simplified:
+            type: bool
+        returns:
+          type: astx.base.ReprStruct
+        """
+        value = {
+            "lhs": self.lhs.get_struct(simplified),
+            "rhs": self.rhs.get_struct(simplified),
+        }
+        return self._prepare_struct(
+            "TensorMatmul",
+            cast(astx.base.ReprStruct, value),
+            simplified,
+        )
+
+
 __all__ = [
+    "TENSOR_ELEMENTWISE_OPS",
+    "TENSOR_REDUCE_OPS",
+    "TENSOR_UNARY_OPS",
     "TensorByteOffset",
     "TensorElementCount",
+    "TensorElementwise",
     "TensorIndex",
     "TensorLiteral",
+    "TensorMatmul",
     "TensorNDim",
+    "TensorReduce",
     "TensorRelease",
+    "TensorReshape",
     "TensorRetain",
     "TensorShape",
+    "TensorSlice",
     "TensorStore",
     "TensorStride",
+    "TensorTranspose",
     "TensorType",
+    "TensorUnary",
     "TensorView",
 ]
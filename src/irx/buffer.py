@@ -62,6 +62,15 @@ BUFFER_DTYPE_UINT64 = 9
 BUFFER_DTYPE_FLOAT32 = 10
 BUFFER_DTYPE_FLOAT64 = 11
 
+BUFFER_MAP_READONLY = 0
+BUFFER_MAP_COPY_ON_WRITE = 1
+BUFFER_MAP_WRITABLE = 2
+
+BUFFER_ADVICE_NORMAL = 0
+BUFFER_ADVICE_SEQUENTIAL = 1
+BUFFER_ADVICE_RANDOM = 2
+BUFFER_ADVICE_WILLNEED = 3
+
 BUFFER_DTYPE_TOKENS = {
     "bool": BUFFER_DTYPE_BOOL,
     "int8": BUFFER_DTYPE_INT8,
@@ -85,11 +94,13 @@ BUFFER_DTYPE_NAMES = {
 @typechecked
 class BufferIndexBoundsPolicy(str, Enum):
     """
-    title: Buffer view indexing bounds policy hook.
+    title: Buffer view indexing bounds policy.
     summary: >-
-      DEFAULT performs semantic static-bounds rejection when analysis can prove
-      the bounds and emits no runtime bounds helper yet. CHECKED and UNCHECKED
-      are reserved for future lowering modes.
+      Semantic analysis always rejects statically provable out-of-bounds
+      indices. CHECKED additionally compares every index against the
+      descriptor shape at run time and reports failures through the assertion
+      runtime, UNCHECKED emits no runtime checks, and DEFAULT defers to the
+      module-wide policy configured on the builder.
     """
 
     DEFAULT = "default"
@@ -423,6 +434,10 @@ def validate_buffer_view_metadata(
 
 
 __all__ = [
+    "BUFFER_ADVICE_NORMAL",
+    "BUFFER_ADVICE_RANDOM",
+    "BUFFER_ADVICE_SEQUENTIAL",
+    "BUFFER_ADVICE_WILLNEED",
     "BUFFER_DTYPE_BOOL",
     "BUFFER_DTYPE_FLOAT32",
     "BUFFER_DTYPE_FLOAT64",
@@ -444,6 +459,9 @@ __all__ = [
     "BUFFER_FLAG_READONLY",
     "BUFFER_FLAG_VALIDITY_BITMAP",
     "BUFFER_FLAG_WRITABLE",
+    "BUFFER_MAP_COPY_ON_WRITE",
+    "BUFFER_MAP_READONLY",
+    "BUFFER_MAP_WRITABLE",
     "BUFFER_MUTABILITY_FLAGS",
     "BUFFER_OWNERSHIP_FLAGS",
     "BUFFER_VIEW_ELEMENT_TYPE_EXTRA",
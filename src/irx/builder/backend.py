@@ -4,18 +4,33 @@ title: Concrete llvmliteir backend composition and public entry points.
 
 from __future__ import annotations
 
+import copy
 import os
 import tempfile
 
 from pathlib import Path
+from typing import Mapping, Sequence
+
+import llvmlite
 
 from llvmlite import binding as llvm
+from llvmlite import ir
 from public import public
 
+from irx import __version__ as irx_version
 from irx import astx
+from irx.analysis.module_artifacts import (
+    ModuleInterface,
+    ModuleInterfaceCache,
+    module_interface_ast,
+)
 from irx.analysis.module_interfaces import ImportResolver, ParsedModule
+from irx.analysis.session import CompilationSession
+from irx.analysis.types import is_string_type
+from irx.buffer import BufferIndexBoundsPolicy
 from irx.builder.base import Builder as BaseBuilder
-from irx.builder.core import VisitorCore
+from irx.builder.core import VisitorCore, semantic_function_key
+from irx.builder.exports import SharedExport, emit_shared_exports
 from irx.builder.lowering import (
     ArrayVisitorMixin,
     BinaryOpVisitorMixin,
@@ -27,15 +42,25 @@ from irx.builder.lowering import (
     ListVisitorMixin,
     LiteralVisitorMixin,
     ModuleVisitorMixin,
+    ParallelLoopVisitorMixin,
     SystemVisitorMixin,
     TemporalVisitorMixin,
+    TensorMatmulVisitorMixin,
+    TensorOpsVisitorMixin,
     TensorVisitorMixin,
     UnaryOpVisitorMixin,
     VariableVisitorMixin,
 )
-from irx.builder.runtime.linking import link_executable
+from irx.builder.runtime.features import NativeArtifact
+from irx.builder.runtime.linking import (
+    link_executable,
+    link_shared_library,
+)
+from irx.diagnostics import Diagnostic, DiagnosticCodes, LinkingError
 from irx.typecheck import typechecked
 
+MAX_OPT_LEVEL = 3
+
 
 @public
 @typechecked
@@ -48,9 +73,12 @@ class Visitor(
     BinaryOpVisitorMixin,
     ControlFlowVisitorMixin,
     GeneratorVisitorMixin,
+    ParallelLoopVisitorMixin,
     FunctionVisitorMixin,
     TemporalVisitorMixin,
     TensorVisitorMixin,
+    TensorOpsVisitorMixin,
+    TensorMatmulVisitorMixin,
     ArrayVisitorMixin,
     BufferVisitorMixin,
     SystemVisitorMixin,
@@ -63,13 +91,64 @@ class Visitor(
 @public
 @typechecked
 class Builder(BaseBuilder):
+    """
+    title: Concrete llvmliteir builder.
+    attributes:
+      translator:
+        type: Visitor
+      arena_temporaries:
+        type: bool
+      bounds_policy:
+        type: BufferIndexBoundsPolicy
+      opt_level:
+        type: int
+      shared_exports:
+        type: tuple[SharedExport, Ellipsis]
+    """
+
     translator: Visitor
+    arena_temporaries: bool
+    bounds_policy: BufferIndexBoundsPolicy
+    opt_level: int
+    shared_exports: tuple[SharedExport, ...]
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        arena_temporaries: bool = False,
+        bounds_policy: BufferIndexBoundsPolicy = (
+            BufferIndexBoundsPolicy.DEFAULT
+        ),
+        opt_level: int = 0,
+    ) -> None:
         """
         title: Initialize Builder.
+        summary: >-
+          bounds_policy is the module-wide default for buffer and tensor
+          indexing; individual buffer view accesses may override it.
+          opt_level 1 to 3 runs LLVM's matching module pipeline, including
+          the loop vectorizer and unroller that read loop hints, before
+          emitting objects; 0 emits the lowered IR as is.
+        parameters:
+          arena_temporaries:
+            type: bool
+            default: false
+          bounds_policy:
+            type: BufferIndexBoundsPolicy
+          opt_level:
+            type: int
+            default: 0
         """
         super().__init__()
+        if opt_level not in range(MAX_OPT_LEVEL + 1):
+            raise ValueError(
+                f"opt_level must be between 0 and {MAX_OPT_LEVEL}, "
+                f"got {opt_level}"
+            )
+        self.arena_temporaries = arena_temporaries
+        self.bounds_policy = bounds_policy
+        self.opt_level = opt_level
+        self.shared_exports = ()
         self.translator = self._new_translator()
 
     def _new_translator(self) -> Visitor:
@@ -78,7 +157,11 @@ class Builder(BaseBuilder):
         returns:
           type: Visitor
         """
-        return Visitor(active_runtime_features=set(self.runtime_feature_names))
+        return Visitor(
+            active_runtime_features=set(self.runtime_feature_names),
+            arena_temporaries=self.arena_temporaries,
+            bounds_policy=self.bounds_policy,
+        )
 
     def translate(self, expr: astx.AST) -> str:
         """
@@ -96,6 +179,8 @@ class Builder(BaseBuilder):
         self,
         root: ParsedModule,
         resolver: ImportResolver,
+        *,
+        interface_cache: ModuleInterfaceCache | None = None,
     ) -> str:
         """
         title: Translate a reachable graph of parsed modules.
@@ -104,11 +189,54 @@ class Builder(BaseBuilder):
             type: ParsedModule
           resolver:
             type: ImportResolver
+          interface_cache:
+            type: ModuleInterfaceCache | None
         returns:
           type: str
         """
         self.translator = self._new_translator()
-        return self.translator.translate_modules(root, resolver)
+        return self.translator.translate_modules(
+            root,
+            resolver,
+            interface_cache=self._configured_interface_cache(interface_cache),
+        )
+
+    def _interface_build_key(self) -> str:
+        """
+        title: Describe the configuration cached objects are compiled with.
+        summary: >-
+          Objects from another IRx or llvmlite release, another target, or
+          other lowering and optimization options must not be linked in, so
+          all of them are part of the key.
+        returns:
+          type: str
+        """
+        return repr(
+            (
+                irx_version,
+                llvmlite.__version__,
+                self.translator.target_machine.triple,
+                self.bounds_policy.value,
+                self.opt_level,
+                self.arena_temporaries,
+            )
+        )
+
+    def _configured_interface_cache(
+        self,
+        interface_cache: ModuleInterfaceCache | None,
+    ) -> ModuleInterfaceCache | None:
+        """
+        title: Restrict an interface cache to this builder's configuration.
+        parameters:
+          interface_cache:
+            type: ModuleInterfaceCache | None
+        returns:
+          type: ModuleInterfaceCache | None
+        """
+        if interface_cache is None:
+            return None
+        return interface_cache.configured(self._interface_build_key())
 
     def build(self, node: astx.AST, output_file: str) -> None:
         """
@@ -122,14 +250,168 @@ class Builder(BaseBuilder):
         result = self.translate(node)
         self._build_from_ir(result, output_file)
 
+    def build_shared(
+        self,
+        node: astx.Module,
+        output_file: str,
+        exports: Sequence[str] | None = None,
+        *,
+        export_runtime_symbols: bool = False,
+    ) -> tuple[SharedExport, ...]:
+        """
+        title: Build a shared library with C ABI entry points.
+        summary: >-
+          Exports name functions defined at the top level of node and default
+          to all of them. Each export is reachable under its bare name with
+          aggregate arguments such as buffer views passed by pointer. Active
+          runtime features are linked in and stay hidden unless
+          export_runtime_symbols is set, which lets hosts call runtime helpers
+          such as irx_buffer_owner_external_new through the same library.
+        parameters:
+          node:
+            type: astx.Module
+          output_file:
+            type: str
+          exports:
+            type: Sequence[str] | None
+          export_runtime_symbols:
+            type: bool
+        returns:
+          type: tuple[SharedExport, Ellipsis]
+        """
+        self.translate(node)
+        module = self.translator._llvm.module
+        targets = self._shared_export_targets(node, module, exports)
+        string_args = self._shared_export_string_args(node, targets)
+        import_string = (
+            self.translator.require_runtime_symbol(
+                "string", "irx_string_from_cstr"
+            )
+            if any(string_args.values())
+            else None
+        )
+        self.shared_exports = emit_shared_exports(
+            module,
+            targets,
+            string_args=string_args,
+            import_string=import_string,
+        )
+        symbols = [export.name for export in self.shared_exports]
+        if export_runtime_symbols:
+            runtime = self.translator.runtime_features
+            for feature_name in runtime.active_feature_names():
+                feature = runtime.feature(feature_name)
+                if feature.artifacts:
+                    symbols.extend(sorted(feature.symbols))
+
+        result_object = self._emit_object(str(module))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.tmp_path = temp_dir
+            file_path_o = Path(temp_dir) / "irx_module.o"
+            file_path_o.write_bytes(result_object)
+
+            self.output_file = output_file
+            link_shared_library(
+                primary_object=file_path_o,
+                output_file=Path(self.output_file),
+                artifacts=self.translator.runtime_features.native_artifacts(),
+                exports=symbols,
+                linker_flags=self.translator.runtime_features.linker_flags(),
+            )
+        return self.shared_exports
+
+    def _shared_export_targets(
+        self,
+        node: astx.Module,
+        module: ir.Module,
+        exports: Sequence[str] | None,
+    ) -> dict[str, ir.Function]:
+        """
+        title: Resolve export names to their lowered LLVM functions.
+        parameters:
+          node:
+            type: astx.Module
+          module:
+            type: ir.Module
+          exports:
+            type: Sequence[str] | None
+        returns:
+          type: dict[str, ir.Function]
+        """
+        defined: dict[str, ir.Function] = {}
+        for child in node.nodes:
+            if not isinstance(child, astx.FunctionDef):
+                continue
+            llvm_name = self.translator.llvm_function_name_for_node(
+                child.prototype,
+                child.name,
+            )
+            function = module.globals.get(llvm_name)
+            if isinstance(function, ir.Function):
+                defined[child.name] = function
+
+        if exports is None:
+            return defined
+
+        missing = [name for name in exports if name not in defined]
+        if missing:
+            raise LinkingError(
+                Diagnostic(
+                    message=(
+                        "cannot export undefined function(s): "
+                        f"{', '.join(missing)}"
+                    ),
+                    code=DiagnosticCodes.LINK_EXPORT_INVALID,
+                    phase="link",
+                    notes=(
+                        "exportable functions: "
+                        f"{', '.join(sorted(defined)) or '<none>'}",
+                    ),
+                )
+            )
+        return {name: defined[name] for name in exports}
+
+    def _shared_export_string_args(
+        self,
+        node: astx.Module,
+        targets: Mapping[str, ir.Function],
+    ) -> dict[str, tuple[int, ...]]:
+        """
+        title: Return the string parameter positions of each export.
+        parameters:
+          node:
+            type: astx.Module
+          targets:
+            type: Mapping[str, ir.Function]
+        returns:
+          type: dict[str, tuple[int, Ellipsis]]
+        """
+        string_args: dict[str, tuple[int, ...]] = {}
+        for child in node.nodes:
+            if not isinstance(child, astx.FunctionDef):
+                continue
+            if child.name not in targets:
+                continue
+            string_args[child.name] = tuple(
+                index
+                for index, arg in enumerate(child.prototype.args.nodes)
+                if is_string_type(arg.type_)
+            )
+        return string_args
+
     def build_modules(
         self,
         root: ParsedModule,
         resolver: ImportResolver,
         output_file: str,
+        *,
+        interface_cache: ModuleInterfaceCache | None = None,
     ) -> None:
         """
         title: Build a reachable graph of parsed modules.
+        summary: >-
+          Dependencies with a current interface in interface_cache are not
+          recompiled; their cached objects are linked in instead.
         parameters:
           root:
             type: ParsedModule
@@ -137,11 +419,202 @@ class Builder(BaseBuilder):
             type: ImportResolver
           output_file:
             type: str
+          interface_cache:
+            type: ModuleInterfaceCache | None
         """
-        result = self.translate_modules(root, resolver)
-        self._build_from_ir(result, output_file)
+        result = self.translate_modules(
+            root,
+            resolver,
+            interface_cache=interface_cache,
+        )
+        objects: list[NativeArtifact] = []
+        session = self.translator.compilation_session
+        if interface_cache is not None and session is not None:
+            objects = [
+                NativeArtifact(
+                    kind="object",
+                    path=interface_cache.object_path(
+                        interface.fingerprint, interface.build_key
+                    ),
+                )
+                for interface in session.interfaces.values()
+            ]
+        self._build_from_ir(result, output_file, objects)
 
-    def _build_from_ir(self, result: str, output_file: str) -> None:
+    def compile_module_interfaces(
+        self,
+        root: ParsedModule,
+        resolver: ImportResolver,
+        interface_cache: ModuleInterfaceCache,
+    ) -> tuple[ModuleInterface, ...]:
+        """
+        title: Compile every dependency of root into an interface cache.
+        summary: >-
+          Walk the modules reachable from root in dependency order and give
+          each one without a current cached interface its own analysis,
+          lowering, and native object, so its dependencies are already
+          cached when it is compiled. root itself is not compiled. Returns
+          the interfaces of all dependencies in load order. Interfaces
+          compiled with another build configuration are compiled again.
+        parameters:
+          root:
+            type: ParsedModule
+          resolver:
+            type: ImportResolver
+          interface_cache:
+            type: ModuleInterfaceCache
+        returns:
+          type: tuple[ModuleInterface, Ellipsis]
+        """
+        interface_cache = interface_cache.configured(
+            self._interface_build_key()
+        )
+        session = CompilationSession(
+            root=root,
+            resolver=resolver,
+            interface_cache=interface_cache,
+        )
+        session.expand_graph()
+        session.diagnostics.raise_if_errors()
+        session.load_module_interfaces()
+        interfaces: list[ModuleInterface] = []
+        for parsed_module in session.ordered_modules():
+            if parsed_module.key == root.key:
+                continue
+            interface = session.interfaces.get(parsed_module.key)
+            if interface is None:
+                interface = self._compile_module_interface(
+                    parsed_module,
+                    resolver,
+                    interface_cache,
+                )
+            interfaces.append(interface)
+        return tuple(interfaces)
+
+    def _compile_module_interface(
+        self,
+        parsed_module: ParsedModule,
+        resolver: ImportResolver,
+        interface_cache: ModuleInterfaceCache,
+    ) -> ModuleInterface:
+        """
+        title: Compile one module on its own and cache its interface.
+        summary: >-
+          The object exports the module's own functions and class static
+          storage. Everything else it defines, such as builtins and template
+          specializations that importers may emit too, becomes linkonce_odr.
+        parameters:
+          parsed_module:
+            type: ParsedModule
+          resolver:
+            type: ImportResolver
+          interface_cache:
+            type: ModuleInterfaceCache
+        returns:
+          type: ModuleInterface
+        """
+        # Analysis annotates the AST it walks; keep the host's copy pristine
+        # so later sessions still fingerprint it the same way.
+        unit = ParsedModule(
+            key=parsed_module.key,
+            ast=copy.deepcopy(parsed_module.ast),
+            display_name=parsed_module.display_name,
+            origin=parsed_module.origin,
+        )
+        self.translate_modules(unit, resolver, interface_cache=interface_cache)
+        session = self.translator.compilation_session
+        if session is None:
+            raise RuntimeError("module translation did not record a session")
+        module = self.translator._llvm.module
+
+        symbols: set[str] = set()
+        static_storage: set[str] = set()
+        for node in unit.ast.nodes:
+            if isinstance(node, astx.ClassDefStmt):
+                methods = list(node.methods)
+                semantic = getattr(node, "semantic", None)
+                resolved_class = getattr(semantic, "resolved_class", None)
+                initialization = getattr(
+                    resolved_class, "initialization", None
+                )
+                static_storage.update(
+                    static_initializer.storage.global_name
+                    for static_initializer in getattr(
+                        initialization, "static_initializers", ()
+                    )
+                )
+            elif isinstance(node, astx.FunctionDef):
+                methods = [node]
+            else:
+                continue
+            for method in methods:
+                function = self.translator.llvm_functions_by_symbol_id.get(
+                    semantic_function_key(method.prototype, method.name)
+                )
+                if function is not None and not astx.is_template_node(
+                    method.prototype
+                ):
+                    symbols.add(function.name)
+
+        # llvmlite caches rendered IR values, so linkage is rewritten on the
+        # parsed module rather than on the ir objects lowering produced.
+        object_module = llvm.parse_assembly(str(module))
+        for function in object_module.functions:
+            if (
+                not function.is_declaration
+                and function.name not in symbols
+                and function.linkage == llvm.Linkage.external
+            ):
+                function.linkage = llvm.Linkage.linkonce_odr
+        for variable in object_module.global_variables:
+            if variable.name in static_storage:
+                variable.linkage = llvm.Linkage.external
+
+        interface = ModuleInterface(
+            module_key=unit.key,
+            fingerprint=session.fingerprints[unit.key],
+            ast=module_interface_ast(parsed_module.ast),
+            dependencies={
+                module_key: fingerprint
+                for module_key, fingerprint in session.fingerprints.items()
+                if module_key != unit.key
+            },
+            symbols=tuple(sorted(symbols)),
+            runtime_features=(
+                self.translator.runtime_features.active_feature_names()
+            ),
+            display_name=unit.display_name,
+            origin=unit.origin,
+            build_key=self._interface_build_key(),
+        )
+        interface_cache.store(interface, self._emit_object(str(object_module)))
+        return interface
+
+    def _emit_object(self, module_text: str) -> bytes:
+        """
+        title: Compile LLVM IR text to one native object.
+        parameters:
+          module_text:
+            type: str
+        returns:
+          type: bytes
+        """
+        module = llvm.parse_assembly(module_text)
+        target_machine = self.translator.target_machine
+        if self.opt_level > 0:
+            tuning = llvm.create_pipeline_tuning_options(
+                speed_level=self.opt_level
+            )
+            pass_builder = llvm.create_pass_builder(target_machine, tuning)
+            pass_builder.getModulePassManager().run(module, pass_builder)
+        return bytes(target_machine.emit_object(module))
+
+    def _build_from_ir(
+        self,
+        result: str,
+        output_file: str,
+        objects: Sequence[NativeArtifact] = (),
+    ) -> None:
         """
         title: Build an executable from LLVM IR text.
         parameters:
@@ -149,9 +622,12 @@ class Builder(BaseBuilder):
             type: str
           output_file:
             type: str
+          objects:
+            type: Sequence[NativeArtifact]
         """
-        result_mod = llvm.parse_assembly(result)
-        result_object = self.translator.target_machine.emit_object(result_mod)
+        if self.translator.configure_executable_entry():
+            result = str(self.translator._llvm.module)
+        result_object = self._emit_object(result)
 
         with tempfile.TemporaryDirectory() as temp_dir:
             self.tmp_path = temp_dir
@@ -164,7 +640,10 @@ class Builder(BaseBuilder):
             link_executable(
                 primary_object=file_path_o,
                 output_file=Path(self.output_file),
-                artifacts=self.translator.runtime_features.native_artifacts(),
+                artifacts=(
+                    *objects,
+                    *self.translator.runtime_features.native_artifacts(),
+                ),
                 linker_flags=self.translator.runtime_features.linker_flags(),
             )
 
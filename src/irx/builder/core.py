@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import ctypes
 
-from typing import Any, cast
+from contextlib import contextmanager
+from typing import Any, Iterator, cast
 
 from llvmlite import binding as llvm
 from llvmlite import ir
@@ -15,7 +16,7 @@ from plum import dispatch
 from public import private
 
 from irx import astx
-from irx.buffer import BUFFER_VIEW_TYPE_NAME
+from irx.buffer import BUFFER_VIEW_TYPE_NAME, BufferIndexBoundsPolicy
 
 try:  # FP128 may not exist depending on llvmlite build.
     from llvmlite.ir import FP128Type
@@ -23,6 +24,10 @@ except ImportError:  # pragma: no cover - optional
     FP128Type = None
 
 from irx.analysis import analyze, analyze_modules
+from irx.analysis.module_artifacts import (
+    ModuleInterfaceCache,
+    is_module_interface,
+)
 from irx.analysis.module_interfaces import ImportResolver, ParsedModule
 from irx.analysis.module_symbols import (
     mangle_class_name,
@@ -33,6 +38,7 @@ from irx.analysis.module_symbols import (
     qualified_struct_name,
 )
 from irx.analysis.resolved_nodes import FunctionSignature
+from irx.analysis.session import CompilationSession
 from irx.analysis.types import (
     bit_width,
     common_numeric_type,
@@ -49,11 +55,19 @@ from irx.builder.runtime.registry import (
     RuntimeFeatureState,
     get_default_runtime_feature_registry,
 )
+from irx.builder.runtime.string.feature import (
+    STRING_FLAG_STATIC,
+    STRING_HEADER_BYTES,
+    STRING_HEADER_MAGIC,
+)
 from irx.builder.state import (
     CleanupEmitter,
+    FusedGeneratorTargets,
+    HoistedBufferDescriptor,
     LoopTargets,
     NamedValueMap,
     ResultStackValue,
+    TemporaryArenaScope,
 )
 from irx.builder.types import (
     VariablesLLVM,
@@ -356,6 +370,8 @@ class VisitorCore(BuilderVisitor):
     _emitted_function_bodies: set[str]
     _module_display_names: dict[int, str]
     _current_module_display_name: str | None
+    _lowering_module_interface: bool
+    compilation_session: CompilationSession | None
     _interned_c_strings: dict[tuple[str, str], ir.GlobalVariable]
     _c_string_global_counter: int
     _namespace_globals: dict[tuple[str, str], ir.GlobalVariable]
@@ -370,18 +386,32 @@ class VisitorCore(BuilderVisitor):
     _current_generator_frame_slots: dict[str, int]
     _current_generator_out_ptr: ir.Value | None
     _current_generator_next_state: int | None
+    _fused_generator_stack: list[FusedGeneratorTargets]
+    arena_temporaries: bool
+    _temporary_arena: TemporaryArenaScope | None
+    bounds_policy: BufferIndexBoundsPolicy
+    _buffer_bounds_guards: dict[int, ir.Value]
+    _hoisted_buffer_descriptors: dict[str, HoistedBufferDescriptor]
     target: llvm.TargetRef
     target_machine: llvm.TargetMachine
 
     def __init__(
         self,
         active_runtime_features: set[str] | None = None,
+        arena_temporaries: bool = False,
+        bounds_policy: BufferIndexBoundsPolicy = (
+            BufferIndexBoundsPolicy.DEFAULT
+        ),
     ) -> None:
         """
         title: Initialize VisitorCore.
         parameters:
           active_runtime_features:
             type: set[str] | None
+          arena_temporaries:
+            type: bool
+          bounds_policy:
+            type: BufferIndexBoundsPolicy
         """
         super().__init__()
         self.named_values = {}
@@ -398,6 +428,8 @@ class VisitorCore(BuilderVisitor):
         self._emitted_function_bodies = set()
         self._module_display_names = {}
         self._current_module_display_name = None
+        self._lowering_module_interface = False
+        self.compilation_session = None
         self._interned_c_strings = {}
         self._c_string_global_counter = 0
         self._namespace_globals = {}
@@ -412,6 +444,12 @@ class VisitorCore(BuilderVisitor):
         self._current_generator_frame_slots = {}
         self._current_generator_out_ptr = None
         self._current_generator_next_state = None
+        self._fused_generator_stack = []
+        self.arena_temporaries = arena_temporaries
+        self._temporary_arena = None
+        self.bounds_policy = bounds_policy
+        self._buffer_bounds_guards = {}
+        self._hoisted_buffer_descriptors = {}
 
         self.initialize()
         self.target = llvm.Target.from_default_triple()
@@ -458,6 +496,111 @@ class VisitorCore(BuilderVisitor):
         for cleanup in reversed(self.cleanup_stack[start_depth:]):
             cleanup()
 
+    def _active_temporary_arena(self) -> ir.Value | None:
+        """
+        title: Return the arena handle serving the current temporary scope.
+        summary: >-
+          Callers carve from the returned arena, so the first call inside a
+          scope emits that scope's arena mark; scopes that never carve cost
+          nothing. Generator resume functions never carve temporaries from the
+          arena because their scopes would span suspension points.
+        returns:
+          type: ir.Value | None
+        """
+        scope = self._temporary_arena
+        builder = self._llvm.ir_builder
+        if (
+            scope is None
+            or self._current_generator_frame_ptr is not None
+            or scope.function is not builder.function
+        ):
+            return None
+        if scope.mark is not None:
+            return scope.arena
+
+        root = scope
+        while (
+            root.parent is not None and root.parent.function is scope.function
+        ):
+            root = root.parent
+        current_block = builder.block
+        if root.arena is None:
+            builder.position_at_start(scope.function.entry_basic_block)
+            root.arena = builder.call(
+                self.require_runtime_symbol("arena", "irx_arena_default"),
+                [],
+                "temp_arena",
+            )
+        if scope.entry_instruction is not None:
+            builder.position_after(scope.entry_instruction)
+        elif scope.entry_block is scope.function.entry_basic_block:
+            builder.position_after(root.arena)
+        else:
+            builder.position_at_start(scope.entry_block)
+        scope.arena = root.arena
+        scope.mark = builder.call(
+            self.require_runtime_symbol("arena", "irx_arena_mark"),
+            [root.arena],
+            "temp_arena_mark",
+        )
+        builder.position_at_end(current_block)
+        return scope.arena
+
+    @contextmanager
+    def _arena_temporary_scope(self) -> Iterator[None]:
+        """
+        title: Recycle arena temporaries carved inside one lowered scope.
+        summary: >-
+          Rewinds the arena to the scope's entry mark when control leaves the
+          scope, either by falling through or through the active cleanup
+          stack used by return, break, and continue. The mark is only taken
+          once something in the scope carves a temporary; exits lowered
+          before that point cannot follow a carve, because every statement
+          loop opens its own scope.
+        returns:
+          type: Iterator[None]
+        """
+        if (
+            not self.arena_temporaries
+            or self._current_generator_frame_ptr is not None
+        ):
+            yield
+            return
+
+        previous_scope = self._temporary_arena
+        entry_block = self._llvm.ir_builder.block
+        scope = TemporaryArenaScope(
+            function=self._llvm.ir_builder.function,
+            entry_block=entry_block,
+            entry_instruction=(
+                entry_block.instructions[-1]
+                if entry_block.instructions
+                else None
+            ),
+            parent=previous_scope,
+        )
+
+        def cleanup() -> None:
+            """
+            title: Rewind the arena to this scope's entry mark.
+            """
+            if scope.mark is None:
+                return
+            self._llvm.ir_builder.call(
+                self.require_runtime_symbol("arena", "irx_arena_rewind"),
+                [scope.arena, scope.mark],
+            )
+
+        self._temporary_arena = scope
+        self.cleanup_stack.append(cleanup)
+        try:
+            yield
+            if not self._llvm.ir_builder.block.is_terminated:
+                cleanup()
+        finally:
+            self.cleanup_stack.pop()
+            self._temporary_arena = previous_scope
+
     def translate(self, node: astx.AST) -> str:
         """
         title: Translate.
@@ -486,18 +629,34 @@ class VisitorCore(BuilderVisitor):
         self,
         root: ParsedModule,
         resolver: ImportResolver,
+        *,
+        interface_cache: ModuleInterfaceCache | None = None,
     ) -> str:
         """
         title: Translate a reachable graph of parsed modules to LLVM IR.
+        summary: >-
+          Dependencies loaded from interface_cache are only declared; their
+          definitions live in the cached objects, and the runtime features
+          those objects need are activated here.
         parameters:
           root:
             type: ParsedModule
           resolver:
             type: ImportResolver
+          interface_cache:
+            type: ModuleInterfaceCache | None
         returns:
           type: str
         """
-        session = analyze_modules(root, resolver)
+        session = analyze_modules(
+            root,
+            resolver,
+            interface_cache=interface_cache,
+        )
+        self.compilation_session = session
+        for interface in session.interfaces.values():
+            for feature_name in interface.runtime_features:
+                self.activate_runtime_feature(feature_name)
         ordered_modules = session.ordered_modules()
         self._module_display_names = {
             id(parsed_module.ast): (
@@ -649,6 +808,11 @@ class VisitorCore(BuilderVisitor):
     def _translate_modules(self, modules: list[astx.Module]) -> None:
         """
         title: Translate a list of already-analyzed modules.
+        summary: >-
+          Module interfaces contribute types and declarations only, except
+          for template specializations, which every importer emits with
+          linkonce_odr linkage because the interface's object may already
+          define the same ones.
         parameters:
           modules:
             type: list[astx.Module]
@@ -658,9 +822,11 @@ class VisitorCore(BuilderVisitor):
                 id(module),
                 getattr(module, "name", "") or "<module>",
             )
+            self._lowering_module_interface = is_module_interface(module)
             for node in module.nodes:
                 if isinstance(node, (astx.StructDefStmt, astx.ClassDefStmt)):
                     self.visit(node)
+        self._lowering_module_interface = False
 
         for module in modules:
             self._current_module_display_name = self._module_display_names.get(
@@ -694,6 +860,7 @@ class VisitorCore(BuilderVisitor):
                 *module.nodes,
                 *astx.generated_template_nodes(module),
             ]
+            interface = is_module_interface(module)
             for node in function_nodes:
                 if isinstance(node, astx.FunctionDef):
                     if astx.is_template_node(
@@ -701,9 +868,36 @@ class VisitorCore(BuilderVisitor):
                     ) and not astx.is_template_specialization(node):
                         continue
                     self.visit(node)
+                    if interface:
+                        self.llvm_functions_by_symbol_id[
+                            semantic_function_key(node, node.name)
+                        ].linkage = "linkonce_odr"
 
         self._current_module_display_name = None
 
+    def configure_executable_entry(self) -> bool:
+        """
+        title: Prepare main for an executable build.
+        summary: >-
+          When the print runtime is active, main first hands stdout the
+          runtime's large buffer. Only executable builds call this, so shared
+          libraries and JIT hosts keep their own stdout configuration.
+        returns:
+          type: bool
+        """
+        if "print" not in self.runtime_features.active_feature_names():
+            return False
+        main = self._llvm.module.globals.get("main")
+        if not isinstance(main, ir.Function) or main.is_declaration:
+            return False
+        configure = self.require_runtime_symbol(
+            "print", "irx_print_configure_stdout"
+        )
+        builder = ir.IRBuilder(main.entry_basic_block)
+        builder.position_at_start(main.entry_basic_block)
+        builder.call(configure, [])
+        return True
+
     def activate_runtime_feature(self, feature_name: str) -> None:
         """
         title: Activate runtime feature.
@@ -829,6 +1023,16 @@ class VisitorCore(BuilderVisitor):
             self._llvm.TENSOR_BUILDER_HANDLE_TYPE
         )
         self._llvm.ARROW_TENSOR_HANDLE_TYPE = self._llvm.TENSOR_HANDLE_TYPE
+        self._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE = (
+            self._llvm.OPAQUE_POINTER_TYPE
+        )
+        self._llvm.ARROW_TABLE_HANDLE_TYPE = self._llvm.OPAQUE_POINTER_TYPE
+        self._llvm.ARROW_IPC_READER_HANDLE_TYPE = (
+            self._llvm.OPAQUE_POINTER_TYPE
+        )
+        self._llvm.ARROW_IPC_WRITER_HANDLE_TYPE = (
+            self._llvm.OPAQUE_POINTER_TYPE
+        )
         self._llvm.TIME_TYPE = ir.LiteralStructType(
             [
                 self._llvm.INT32_TYPE,
@@ -931,12 +1135,19 @@ class VisitorCore(BuilderVisitor):
             self._llvm.ir_builder.position_at_end(current_block)
         return alloca
 
-    def _get_fma_function(self, ty: ir.Type) -> ir.Function:
+    def _get_fma_function(
+        self, ty: ir.Type, intrinsic: str = "fma"
+    ) -> ir.Function:
         """
         title: Get fma function.
+        summary: >-
+          Pass intrinsic="fmuladd" for llvm.fmuladd, which fuses only when
+          the target has a fast fused multiply-add.
         parameters:
           ty:
             type: ir.Type
+          intrinsic:
+            type: str
         returns:
           type: ir.Function
         """
@@ -959,7 +1170,7 @@ class VisitorCore(BuilderVisitor):
         if count is not None:
             suffix = f"v{count}{suffix}"
 
-        name = f"llvm.fma.{suffix}"
+        name = f"llvm.{intrinsic}.{suffix}"
         if name in self._llvm.module.globals:
             return cast(ir.Function, self._llvm.module.get_global(name))
 
@@ -1089,6 +1300,8 @@ class VisitorCore(BuilderVisitor):
             )
         if isinstance(type_, astx.BufferOwnerType):
             return self._llvm.BUFFER_OWNER_HANDLE_TYPE
+        if isinstance(type_, astx.ArrayHandleType):
+            return self._llvm.ARRAY_HANDLE_TYPE
         if isinstance(type_, astx.OpaqueHandleType):
             return self._llvm.OPAQUE_POINTER_TYPE
         if isinstance(type_, astx.PointerType):
@@ -2221,23 +2434,111 @@ class VisitorCore(BuilderVisitor):
         builder.position_at_end(found_bb)
         self.result_stack.append(result)
 
+    def _string_literal_global(
+        self,
+        data: bytes,
+        *,
+        name: str,
+    ) -> ir.GlobalVariable:
+        """
+        title: Emit one constant length-prefixed string global.
+        summary: >-
+          The global mirrors the string runtime header, so literals take the
+          same O(1) length path as heap strings without any startup copy.
+          Its payload starts at field 3.
+        parameters:
+          data:
+            type: bytes
+          name:
+            type: str
+        returns:
+          type: ir.GlobalVariable
+        """
+        payload_type = ir.ArrayType(self._llvm.INT8_TYPE, len(data) + 1)
+        literal_type = ir.LiteralStructType(
+            [
+                self._llvm.INT64_TYPE,
+                self._llvm.INT32_TYPE,
+                self._llvm.INT32_TYPE,
+                payload_type,
+            ]
+        )
+        literal = ir.GlobalVariable(
+            self._llvm.module,
+            literal_type,
+            name=self._llvm.module.get_unique_name(name),
+        )
+        literal.linkage = "internal"
+        literal.global_constant = True
+        literal.align = STRING_HEADER_BYTES
+        literal.initializer = ir.Constant(
+            literal_type,
+            [
+                ir.Constant(self._llvm.INT64_TYPE, len(data)),
+                ir.Constant(self._llvm.INT32_TYPE, STRING_HEADER_MAGIC),
+                ir.Constant(self._llvm.INT32_TYPE, STRING_FLAG_STATIC),
+                ir.Constant(payload_type, bytearray(data + b"\0")),
+            ],
+        )
+        return literal
+
+    def _string_literal_data(
+        self,
+        literal: ir.GlobalVariable,
+        *,
+        name: str = "",
+    ) -> ir.Value:
+        """
+        title: Return the character data of one string literal global.
+        parameters:
+          literal:
+            type: ir.GlobalVariable
+          name:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        return self._llvm.ir_builder.gep(
+            literal,
+            [
+                ir.Constant(self._llvm.INT32_TYPE, 0),
+                ir.Constant(self._llvm.INT32_TYPE, 3),
+                ir.Constant(self._llvm.INT32_TYPE, 0),
+            ],
+            inbounds=True,
+            name=name,
+        )
+
+    def _string_literal_pointer(
+        self,
+        data: bytes,
+        *,
+        name: str,
+    ) -> ir.Value:
+        """
+        title: Emit one constant length-prefixed string and return its data.
+        summary: >-
+          Every string the compiler itself produces goes through here, so the
+          string runtime can always read the header in front of it.
+        parameters:
+          data:
+            type: bytes
+          name:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        return self._string_literal_data(
+            self._string_literal_global(data, name=name)
+        )
+
     def _create_string_concat_function(self) -> ir.Function:
         """
         title: Create string concat function.
         returns:
           type: ir.Function
         """
-        func_name = "string_concat"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.ASCII_STRING_TYPE,
-            [self._llvm.ASCII_STRING_TYPE, self._llvm.ASCII_STRING_TYPE],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-        func.linkage = "external"
-        return func
+        return self.require_runtime_symbol("string", "irx_string_concat")
 
     def _create_string_length_function(self) -> ir.Function:
         """
@@ -2245,21 +2546,7 @@ class VisitorCore(BuilderVisitor):
         returns:
           type: ir.Function
         """
-        func_name = "string_length"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.INT32_TYPE,
-            [self._llvm.ASCII_STRING_TYPE],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-        block = func.append_basic_block("entry")
-        builder = ir.IRBuilder(block)
-        strlen_func = self._create_strlen_inline()
-        result = builder.call(strlen_func, [func.args[0]], "len")
-        builder.ret(result)
-        return func
+        return self.require_runtime_symbol("string", "irx_string_length")
 
     def _create_string_equals_function(self) -> ir.Function:
         """
@@ -2267,21 +2554,7 @@ class VisitorCore(BuilderVisitor):
         returns:
           type: ir.Function
         """
-        func_name = "string_equals"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.BOOLEAN_TYPE,
-            [self._llvm.ASCII_STRING_TYPE, self._llvm.ASCII_STRING_TYPE],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-        block = func.append_basic_block("entry")
-        builder = ir.IRBuilder(block)
-        strcmp_func = self._create_strcmp_inline()
-        result = builder.call(strcmp_func, [func.args[0], func.args[1]], "cmp")
-        builder.ret(result)
-        return func
+        return self.require_runtime_symbol("string", "irx_string_equals")
 
     def _create_string_substring_function(self) -> ir.Function:
         """
@@ -2289,21 +2562,7 @@ class VisitorCore(BuilderVisitor):
         returns:
           type: ir.Function
         """
-        func_name = "string_substring"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.ASCII_STRING_TYPE,
-            [
-                self._llvm.ASCII_STRING_TYPE,
-                self._llvm.INT32_TYPE,
-                self._llvm.INT32_TYPE,
-            ],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-        func.linkage = "external"
-        return func
+        return self.require_runtime_symbol("string", "irx_string_substring")
 
     def _handle_string_concatenation(
         self, lhs: ir.Value, rhs: ir.Value
@@ -2318,199 +2577,100 @@ class VisitorCore(BuilderVisitor):
         returns:
           type: ir.Value
         """
-        strcat_func = self._create_strcat_inline()
-        return self._llvm.ir_builder.call(
-            strcat_func, [lhs, rhs], "str_concat"
-        )
+        concat_fn = self._create_string_concat_function()
+        return self._llvm.ir_builder.call(concat_fn, [lhs, rhs], "str_concat")
 
-    def _create_strcat_inline(self) -> ir.Function:
+    def _handle_string_concatenation_chain(
+        self, operands: list[ir.Value]
+    ) -> ir.Value:
         """
-        title: Create strcat inline.
+        title: Concatenate several strings through one string builder.
+        summary: >-
+          Sizes the builder from the operands' O(1) lengths so a chain like
+          a + b + c + d copies every byte once instead of materializing each
+          intermediate result.
+        parameters:
+          operands:
+            type: list[ir.Value]
         returns:
-          type: ir.Function
+          type: ir.Value
         """
-        func_name = "strcat_inline"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.INT8_TYPE.as_pointer(),
-            [
-                self._llvm.INT8_TYPE.as_pointer(),
-                self._llvm.INT8_TYPE.as_pointer(),
-            ],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-
-        entry = func.append_basic_block("entry")
-        builder = ir.IRBuilder(entry)
-        strlen_func = self._create_string_length_function()
-        len1 = builder.call(strlen_func, [func.args[0]], "len1")
-        len2 = builder.call(strlen_func, [func.args[1]], "len2")
-
-        total_len = builder.add(len1, len2, "total_len")
-        total_len = builder.add(
-            total_len,
-            ir.Constant(self._llvm.INT32_TYPE, 1),
-            "total_len_with_null",
-        )
-
-        malloc = self._create_malloc_decl()
-        total_len_szt = builder.zext(total_len, self._llvm.SIZE_T_TYPE)
-        result_ptr = builder.call(malloc, [total_len_szt], "result")
-
-        self._generate_strcpy(builder, result_ptr, func.args[0])
-        result_end = builder.gep(result_ptr, [len1], inbounds=True)
-        self._generate_strcpy(builder, result_end, func.args[1])
-
-        builder.ret(result_ptr)
-        return func
+        builder = self._llvm.ir_builder
+        length_fn = self._create_string_length_function()
+        total: ir.Value = ir.Constant(self._llvm.INT64_TYPE, 0)
+        for operand in operands:
+            length = builder.call(length_fn, [operand], "str_piece_len")
+            total = builder.add(total, length, "str_chain_len")
+        string_builder = builder.call(
+            self.require_runtime_symbol("string", "irx_string_builder_new"),
+            [total],
+            "str_builder",
+        )
+        append_fn = self.require_runtime_symbol(
+            "string", "irx_string_builder_append"
+        )
+        for operand in operands:
+            builder.call(append_fn, [string_builder, operand])
+        return builder.call(
+            self.require_runtime_symbol("string", "irx_string_builder_finish"),
+            [string_builder],
+            "str_concat",
+        )
+
+    def _handle_string_length(self, value: ir.Value) -> ir.Value:
+        """
+        title: Return the O(1) byte length of one lowered string.
+        parameters:
+          value:
+            type: ir.Value
+        returns:
+          type: ir.Value
+        """
+        length_fn = self._create_string_length_function()
+        return self._llvm.ir_builder.call(length_fn, [value], "str_len")
 
-    def _generate_strcpy(
+    def _handle_string_substring(
         self,
-        builder: ir.IRBuilder,
-        dest: ir.Value,
-        src: ir.Value,
-    ) -> None:
+        value: ir.Value,
+        start: ir.Value,
+        end: ir.Value,
+    ) -> ir.Value:
         """
-        title: Generate strcpy.
+        title: Slice one lowered string by byte offsets.
         parameters:
-          builder:
-            type: ir.IRBuilder
-          dest:
+          value:
             type: ir.Value
-          src:
+          start:
             type: ir.Value
+          end:
+            type: ir.Value
+        returns:
+          type: ir.Value
         """
-        loop_bb = builder.function.append_basic_block("strcpy_loop")
-        end_bb = builder.function.append_basic_block("strcpy_end")
-
-        index = builder.alloca(self._llvm.INT32_TYPE, name="strcpy_index")
-        builder.store(ir.Constant(self._llvm.INT32_TYPE, 0), index)
-        builder.branch(loop_bb)
-
-        builder.position_at_start(loop_bb)
-        idx_val = builder.load(index, "idx_val")
-        src_char_ptr = builder.gep(src, [idx_val], inbounds=True)
-        char_val = builder.load(src_char_ptr, "char_val")
-        dest_char_ptr = builder.gep(dest, [idx_val], inbounds=True)
-        builder.store(char_val, dest_char_ptr)
-
-        is_null = builder.icmp_signed(
-            "==", char_val, ir.Constant(self._llvm.INT8_TYPE, 0)
+        substring_fn = self._create_string_substring_function()
+        start = self._coerce_to(start, self._llvm.INT64_TYPE)
+        end = self._coerce_to(end, self._llvm.INT64_TYPE)
+        return self._llvm.ir_builder.call(
+            substring_fn, [value, start, end], "str_substring"
         )
-        next_idx = builder.add(idx_val, ir.Constant(self._llvm.INT32_TYPE, 1))
-        builder.store(next_idx, index)
-        builder.cbranch(is_null, end_bb, loop_bb)
-        builder.position_at_start(end_bb)
 
-    def _create_strcmp_inline(self) -> ir.Function:
-        """
-        title: Create strcmp inline.
-        returns:
-          type: ir.Function
+    def _import_foreign_string(self, value: ir.Value) -> ir.Value:
         """
-        func_name = "strcmp_inline"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.BOOLEAN_TYPE,
-            [
-                self._llvm.INT8_TYPE.as_pointer(),
-                self._llvm.INT8_TYPE.as_pointer(),
-            ],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-
-        entry = func.append_basic_block("entry")
-        loop = func.append_basic_block("loop")
-        not_equal = func.append_basic_block("not_equal")
-        equal = func.append_basic_block("equal")
-        builder = ir.IRBuilder(entry)
-
-        index = builder.alloca(self._llvm.INT32_TYPE, name="index")
-        builder.store(ir.Constant(self._llvm.INT32_TYPE, 0), index)
-        builder.branch(loop)
-
-        builder.position_at_start(loop)
-        idx_val = builder.load(index, "idx_val")
-        char1_ptr = builder.gep(func.args[0], [idx_val], inbounds=True)
-        char2_ptr = builder.gep(func.args[1], [idx_val], inbounds=True)
-        char1 = builder.load(char1_ptr, "char1")
-        char2 = builder.load(char2_ptr, "char2")
-        chars_equal = builder.icmp_signed("==", char1, char2)
-        char1_null = builder.icmp_signed(
-            "==", char1, ir.Constant(self._llvm.INT8_TYPE, 0)
-        )
-
-        builder.cbranch(
-            chars_equal,
-            builder.function.append_basic_block("check_null"),
-            not_equal,
-        )
-        check_null_bb = builder.function.basic_blocks[-1]
-        builder.position_at_start(check_null_bb)
-        builder.cbranch(
-            char1_null,
-            equal,
-            builder.function.append_basic_block("continue_loop"),
-        )
-        continue_bb = builder.function.basic_blocks[-1]
-        builder.position_at_start(continue_bb)
-        next_idx = builder.add(idx_val, ir.Constant(self._llvm.INT32_TYPE, 1))
-        builder.store(next_idx, index)
-        builder.branch(loop)
-
-        builder.position_at_start(not_equal)
-        builder.ret(ir.Constant(self._llvm.BOOLEAN_TYPE, 0))
-        builder.position_at_start(equal)
-        builder.ret(ir.Constant(self._llvm.BOOLEAN_TYPE, 1))
-        return func
-
-    def _create_strlen_inline(self) -> ir.Function:
-        """
-        title: Create strlen inline.
+        title: Convert one foreign C string into the IRx string layout.
+        summary: >-
+          Used where plain NUL-terminated pointers enter IRx code, such as
+          extern call results, so later length and equality checks can trust
+          the header.
+        parameters:
+          value:
+            type: ir.Value
         returns:
-          type: ir.Function
+          type: ir.Value
         """
-        func_name = "strlen_inline"
-        if func_name in self._llvm.module.globals:
-            return cast(ir.Function, self._llvm.module.get_global(func_name))
-
-        func_type = ir.FunctionType(
-            self._llvm.INT32_TYPE,
-            [self._llvm.INT8_TYPE.as_pointer()],
-        )
-        func = ir.Function(self._llvm.module, func_type, func_name)
-
-        entry = func.append_basic_block("entry")
-        loop = func.append_basic_block("loop")
-        end = func.append_basic_block("end")
-        builder = ir.IRBuilder(entry)
-
-        counter = builder.alloca(self._llvm.INT32_TYPE, name="counter")
-        builder.store(ir.Constant(self._llvm.INT32_TYPE, 0), counter)
-        builder.branch(loop)
-
-        builder.position_at_start(loop)
-        count_val = builder.load(counter, "count_val")
-        char_ptr = builder.gep(func.args[0], [count_val], inbounds=True)
-        char_val = builder.load(char_ptr, "char_val")
-        is_null = builder.icmp_signed(
-            "==", char_val, ir.Constant(self._llvm.INT8_TYPE, 0)
-        )
-
-        next_count = builder.add(
-            count_val,
-            ir.Constant(self._llvm.INT32_TYPE, 1),
+        from_cstr = self.require_runtime_symbol(
+            "string", "irx_string_from_cstr"
         )
-        builder.store(next_count, counter)
-        builder.cbranch(is_null, end, loop)
-
-        builder.position_at_start(end)
-        builder.ret(count_val)
-        return func
+        return self._llvm.ir_builder.call(from_cstr, [value], "str_import")
 
     def _handle_string_comparison(
         self,
@@ -2530,22 +2690,18 @@ class VisitorCore(BuilderVisitor):
         returns:
           type: ir.Value
         """
-        if op == "==":
-            equals_func = self._create_string_equals_function()
-            return self._llvm.ir_builder.call(
-                equals_func, [lhs, rhs], "str_equals"
-            )
-        if op == "!=":
-            equals_func = self._create_string_equals_function()
-            equals_result = self._llvm.ir_builder.call(
-                equals_func, [lhs, rhs], "str_equals"
-            )
-            return self._llvm.ir_builder.xor(
-                equals_result,
-                ir.Constant(self._llvm.BOOLEAN_TYPE, 1),
-                "str_not_equals",
-            )
-        raise Exception(f"String comparison operator {op} not implemented")
+        if op not in ("==", "!="):
+            raise Exception(f"String comparison operator {op} not implemented")
+        equals_func = self._create_string_equals_function()
+        equals_result = self._llvm.ir_builder.call(
+            equals_func, [lhs, rhs], "str_equals"
+        )
+        return self._llvm.ir_builder.icmp_signed(
+            "!=" if op == "==" else "==",
+            equals_result,
+            ir.Constant(self._llvm.INT32_TYPE, 0),
+            "str_equal" if op == "==" else "str_not_equals",
+        )
 
     def _normalize_int_for_printf(
         self,
@@ -2593,19 +2749,25 @@ class VisitorCore(BuilderVisitor):
         self,
         fmt_gv: ir.GlobalVariable,
         args: list[ir.Value],
+        temporary: bool = False,
     ) -> ir.Value:
         """
         title: Snprintf heap.
+        summary: >-
+          Temporary results are carved from the active scope arena when arena
+          temporaries are enabled; otherwise the buffer comes from malloc.
         parameters:
           fmt_gv:
             type: ir.GlobalVariable
           args:
             type: list[ir.Value]
+          temporary:
+            type: bool
         returns:
           type: ir.Value
         """
         snprintf = self._create_snprintf_decl()
-        malloc = self._create_malloc_decl()
+        arena = self._active_temporary_arena() if temporary else None
 
         zero_size = ir.Constant(self._llvm.SIZE_T_TYPE, 0)
         null_ptr = ir.Constant(self._llvm.INT8_TYPE.as_pointer(), None)
@@ -2635,10 +2797,153 @@ class VisitorCore(BuilderVisitor):
         need_szt = self._llvm.ir_builder.zext(
             need_plus_1, self._llvm.SIZE_T_TYPE
         )
-        mem = self._llvm.ir_builder.call(malloc, [need_szt])
+        if arena is not None:
+            mem = self._llvm.ir_builder.call(
+                self.require_runtime_symbol("arena", "irx_arena_alloc"),
+                [
+                    arena,
+                    self._llvm.ir_builder.zext(
+                        need_plus_1, self._llvm.INT64_TYPE
+                    ),
+                    ir.Constant(self._llvm.INT64_TYPE, 1),
+                ],
+            )
+        else:
+            malloc = self._create_malloc_decl()
+            mem = self._llvm.ir_builder.call(malloc, [need_szt])
         self._llvm.ir_builder.call(snprintf, [mem, need_szt, fmt_ptr, *args])
         return mem
 
+    def _format_string(
+        self,
+        fmt_gv: ir.GlobalVariable,
+        args: list[ir.Value],
+        *,
+        temporary: bool = False,
+    ) -> ir.Value:
+        """
+        title: Format values straight into a new IRx string.
+        summary: >-
+          One sizing snprintf call picks the length, then the text is written
+          directly into the payload reserved by irx_string_reserve, so no
+          intermediate C buffer is allocated or copied. Temporary strings are
+          carved, header included, from the active scope arena when arena
+          temporaries are enabled.
+        parameters:
+          fmt_gv:
+            type: ir.GlobalVariable
+          args:
+            type: list[ir.Value]
+          temporary:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        snprintf = self._create_snprintf_decl()
+        arena = self._active_temporary_arena() if temporary else None
+        fmt_ptr = builder.gep(
+            fmt_gv,
+            [
+                ir.Constant(self._llvm.INT32_TYPE, 0),
+                ir.Constant(self._llvm.INT32_TYPE, 0),
+            ],
+            inbounds=True,
+        )
+        needed = builder.call(
+            snprintf,
+            [
+                ir.Constant(self._llvm.INT8_TYPE.as_pointer(), None),
+                ir.Constant(self._llvm.SIZE_T_TYPE, 0),
+                fmt_ptr,
+                *args,
+            ],
+            "str_fmt_len",
+        )
+        zero_i32 = ir.Constant(self._llvm.INT32_TYPE, 0)
+        length = builder.select(
+            builder.icmp_signed("<", needed, zero_i32),
+            zero_i32,
+            needed,
+        )
+        length_i64 = builder.zext(length, self._llvm.INT64_TYPE)
+        if arena is None:
+            payload = builder.call(
+                self.require_runtime_symbol("string", "irx_string_reserve"),
+                [length_i64],
+                "str_fmt",
+            )
+        else:
+            payload = self._arena_string_payload(arena, length_i64)
+        capacity = builder.zext(
+            builder.add(length, ir.Constant(self._llvm.INT32_TYPE, 1)),
+            self._llvm.SIZE_T_TYPE,
+        )
+        builder.call(snprintf, [payload, capacity, fmt_ptr, *args])
+        return payload
+
+    def _arena_string_payload(
+        self,
+        arena: ir.Value,
+        length: ir.Value,
+    ) -> ir.Value:
+        """
+        title: Carve one string header and payload from an arena.
+        summary: >-
+          The header carries neither the static nor the heap flag, so
+          irx_string_free leaves the storage to the arena rewind.
+        parameters:
+          arena:
+            type: ir.Value
+          length:
+            type: ir.Value
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        storage = builder.call(
+            self.require_runtime_symbol("arena", "irx_arena_alloc"),
+            [
+                arena,
+                builder.add(
+                    length,
+                    ir.Constant(
+                        self._llvm.INT64_TYPE, STRING_HEADER_BYTES + 1
+                    ),
+                ),
+                ir.Constant(self._llvm.INT64_TYPE, STRING_HEADER_BYTES),
+            ],
+            "str_arena",
+        )
+        header_type = ir.LiteralStructType(
+            [
+                self._llvm.INT64_TYPE,
+                self._llvm.INT32_TYPE,
+                self._llvm.INT32_TYPE,
+            ]
+        )
+        header = builder.bitcast(storage, header_type.as_pointer())
+        zero = ir.Constant(self._llvm.INT32_TYPE, 0)
+        for index, value in enumerate(
+            (
+                length,
+                ir.Constant(self._llvm.INT32_TYPE, STRING_HEADER_MAGIC),
+                zero,
+            )
+        ):
+            field = builder.gep(
+                header,
+                [zero, ir.Constant(self._llvm.INT32_TYPE, index)],
+                inbounds=True,
+            )
+            builder.store(value, field)
+        return builder.gep(
+            storage,
+            [ir.Constant(self._llvm.INT64_TYPE, STRING_HEADER_BYTES)],
+            inbounds=True,
+            name="str_fmt",
+        )
+
     def _create_snprintf_decl(self) -> ir.Function:
         """
         title: Create snprintf decl.
@@ -0,0 +1,251 @@
+"""
+title: C ABI entry points for shared-library builds.
+summary: >-
+  IRx-internal functions pass aggregates such as buffer views by value, which
+  LLVM does not lower to the platform C ABI. Exported entry points therefore
+  wrap the internal function and take aggregate arguments by pointer, and
+  return aggregates through a leading out-pointer, so C, C++, and ctypes
+  callers see one predictable signature per export. String arguments arrive
+  as plain C strings and are converted to the IRx string layout once, in the
+  wrapper.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping
+
+from llvmlite import ir
+from public import public
+
+from irx.diagnostics import Diagnostic, DiagnosticCodes, LinkingError
+from irx.typecheck import typechecked
+
+
+@public
+@typechecked
+@dataclass(frozen=True)
+class SharedExport:
+    """
+    title: One C ABI entry point exported from a shared library.
+    attributes:
+      name:
+        type: str
+      target:
+        type: str
+      pointer_args:
+        type: tuple[int, Ellipsis]
+      returns_by_pointer:
+        type: bool
+      string_args:
+        type: tuple[int, Ellipsis]
+    """
+
+    name: str
+    target: str
+    pointer_args: tuple[int, ...] = ()
+    returns_by_pointer: bool = False
+    string_args: tuple[int, ...] = ()
+
+
+@typechecked
+def _is_aggregate(llvm_type: ir.Type) -> bool:
+    """
+    title: Return whether one LLVM type needs pointer passing at the C ABI.
+    parameters:
+      llvm_type:
+        type: ir.Type
+    returns:
+      type: bool
+    """
+    return isinstance(llvm_type, (ir.BaseStructType, ir.ArrayType))
+
+
+@typechecked
+def _export_error(message: str, *, hint: str | None = None) -> LinkingError:
+    """
+    title: Build one export diagnostic error.
+    parameters:
+      message:
+        type: str
+      hint:
+        type: str | None
+    returns:
+      type: LinkingError
+    """
+    return LinkingError(
+        Diagnostic(
+            message=message,
+            code=DiagnosticCodes.LINK_EXPORT_INVALID,
+            phase="link",
+            hint=hint,
+        )
+    )
+
+
+@public
+@typechecked
+def emit_shared_exports(
+    module: ir.Module,
+    targets: Mapping[str, ir.Function],
+    *,
+    string_args: Mapping[str, tuple[int, ...]] | None = None,
+    import_string: ir.Function | None = None,
+) -> tuple[SharedExport, ...]:
+    """
+    title: Emit C ABI entry points for selected IRx functions.
+    summary: >-
+      Functions whose signature already matches the C ABI under the requested
+      name are exported as-is. Every other target gets a thin wrapper named
+      after the export that loads aggregate arguments from pointers, passes
+      the string arguments listed in string_args through import_string, and
+      stores an aggregate result through a leading out-pointer.
+    parameters:
+      module:
+        type: ir.Module
+      targets:
+        type: Mapping[str, ir.Function]
+      string_args:
+        type: Mapping[str, tuple[int, Ellipsis]] | None
+      import_string:
+        type: ir.Function | None
+    returns:
+      type: tuple[SharedExport, Ellipsis]
+    """
+    exports: list[SharedExport] = []
+    for export_name, function in targets.items():
+        function_type = function.function_type
+        if function.is_declaration:
+            raise _export_error(
+                f"cannot export '{export_name}': function '{function.name}' "
+                "has no definition in this module"
+            )
+        if function_type.var_arg:
+            raise _export_error(
+                f"cannot export variadic function '{export_name}'"
+            )
+
+        pointer_args = tuple(
+            index
+            for index, arg_type in enumerate(function_type.args)
+            if _is_aggregate(arg_type)
+        )
+        returns_by_pointer = _is_aggregate(function_type.return_type)
+        export_string_args = (string_args or {}).get(export_name, ())
+        if export_string_args and import_string is None:
+            raise _export_error(
+                f"cannot export '{export_name}': string arguments need the "
+                "string runtime's import function"
+            )
+        if (
+            export_name == function.name
+            and not pointer_args
+            and not returns_by_pointer
+            and not export_string_args
+        ):
+            exports.append(SharedExport(export_name, function.name))
+            continue
+        if export_name in module.globals:
+            raise _export_error(
+                f"cannot export '{export_name}': the symbol already exists "
+                "in this module",
+                hint="choose a different export name",
+            )
+
+        exports.append(
+            _emit_export_wrapper(
+                module,
+                export_name,
+                function,
+                pointer_args=pointer_args,
+                returns_by_pointer=returns_by_pointer,
+                string_args=export_string_args,
+                import_string=import_string,
+            )
+        )
+    return tuple(exports)
+
+
+@typechecked
+def _emit_export_wrapper(
+    module: ir.Module,
+    export_name: str,
+    function: ir.Function,
+    *,
+    pointer_args: tuple[int, ...],
+    returns_by_pointer: bool,
+    string_args: tuple[int, ...] = (),
+    import_string: ir.Function | None = None,
+) -> SharedExport:
+    """
+    title: Emit one C ABI wrapper around an IRx function.
+    parameters:
+      module:
+        type: ir.Module
+      export_name:
+        type: str
+      function:
+        type: ir.Function
+      pointer_args:
+        type: tuple[int, Ellipsis]
+      returns_by_pointer:
+        type: bool
+      string_args:
+        type: tuple[int, Ellipsis]
+      import_string:
+        type: ir.Function | None
+    returns:
+      type: SharedExport
+    """
+    function_type = function.function_type
+    return_type = function_type.return_type
+    wrapper_args: list[ir.Type] = []
+    if returns_by_pointer:
+        wrapper_args.append(return_type.as_pointer())
+    wrapper_args.extend(
+        arg_type.as_pointer() if index in pointer_args else arg_type
+        for index, arg_type in enumerate(function_type.args)
+    )
+    wrapper = ir.Function(
+        module,
+        ir.FunctionType(
+            ir.VoidType() if returns_by_pointer else return_type,
+            wrapper_args,
+        ),
+        export_name,
+    )
+    wrapper_params = list(wrapper.args)
+    out_pointer = wrapper_params.pop(0) if returns_by_pointer else None
+    if out_pointer is not None:
+        out_pointer.name = "result"
+    for param, arg in zip(wrapper_params, function.args):
+        param.name = arg.name
+
+    builder = ir.IRBuilder(wrapper.append_basic_block("entry"))
+    call_args: list[ir.Value] = []
+    for index, param in enumerate(wrapper_params):
+        if index in pointer_args:
+            call_args.append(builder.load(param))
+        elif index in string_args and import_string is not None:
+            call_args.append(builder.call(import_string, [param]))
+        else:
+            call_args.append(param)
+    result = builder.call(function, call_args)
+    if out_pointer is not None:
+        builder.store(result, out_pointer)
+        builder.ret_void()
+    elif isinstance(return_type, ir.VoidType):
+        builder.ret_void()
+    else:
+        builder.ret(result)
+
+    return SharedExport(
+        export_name,
+        function.name,
+        pointer_args,
+        returns_by_pointer,
+        string_args,
+    )
+
+
+__all__ = ["SharedExport", "emit_shared_exports"]
@@ -0,0 +1,249 @@
+"""
+title: Loop metadata helpers for llvmliteir codegen.
+summary: >-
+  Build llvm.loop property lists from resolved loop hints and attach them to
+  the back edges of one lowered loop. Loops whose iterations are independent
+  also get a fresh access group: every non-stack load, store, and call in
+  the loop joins it, and llvm.loop.parallel_accesses names it, which lets
+  the vectorizer skip its own dependence checks.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from llvmlite import ir
+
+from irx.analysis.resolved_nodes import ResolvedLoopHints
+from irx.typecheck import typechecked
+
+_ACCESS_GROUP = "llvm.access.group"
+_LOOP = "llvm.loop"
+
+
+@typechecked
+class _DistinctMetadata(ir.values.MDValue):  # type: ignore[misc]
+    """
+    title: Metadata node that LLVM must never merge with an equal node.
+    summary: >-
+      Loop ids refer to themselves and access groups are empty, so both
+      compare and hash by identity here and print as distinct nodes.
+    """
+
+    def descr(self, buf: list[str]) -> None:
+        """
+        title: Render the node with the distinct keyword.
+        parameters:
+          buf:
+            type: list[str]
+        """
+        buf.append("distinct ")
+        super().descr(buf)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        title: Compare by identity.
+        parameters:
+          other:
+            type: object
+        returns:
+          type: bool
+        """
+        return self is other
+
+    def __ne__(self, other: object) -> bool:
+        """
+        title: Compare by identity.
+        parameters:
+          other:
+            type: object
+        returns:
+          type: bool
+        """
+        return self is not other
+
+    def __hash__(self) -> int:
+        """
+        title: Hash by identity.
+        returns:
+          type: int
+        """
+        return id(self)
+
+
+@typechecked
+def _distinct_metadata(module: ir.Module) -> _DistinctMetadata:
+    """
+    title: Append one empty distinct metadata node to a module.
+    parameters:
+      module:
+        type: ir.Module
+    returns:
+      type: _DistinctMetadata
+    """
+    return _DistinctMetadata(module, [], name=str(len(module.metadata)))
+
+
+@typechecked
+def loop_hint_properties(
+    module: ir.Module,
+    hints: ResolvedLoopHints,
+) -> list[ir.Value]:
+    """
+    title: Return the llvm.loop properties requested by one set of hints.
+    parameters:
+      module:
+        type: ir.Module
+      hints:
+        type: ResolvedLoopHints
+    returns:
+      type: list[ir.Value]
+    """
+    i1 = ir.IntType(1)
+    i32 = ir.IntType(32)
+    properties: list[list[Any]] = []
+    vectorize = hints.vectorize
+    if vectorize is None and hints.vector_width > 1:
+        vectorize = True
+    if vectorize is not None:
+        properties.append(
+            ["llvm.loop.vectorize.enable", ir.Constant(i1, int(vectorize))]
+        )
+    if hints.vector_width > 0:
+        properties.append(
+            ["llvm.loop.vectorize.width", ir.Constant(i32, hints.vector_width)]
+        )
+    if hints.interleave_count > 0:
+        properties.append(
+            [
+                "llvm.loop.interleave.count",
+                ir.Constant(i32, hints.interleave_count),
+            ]
+        )
+    if hints.unroll is False:
+        properties.append(["llvm.loop.unroll.disable"])
+    elif hints.unroll_count > 0:
+        properties.append(
+            ["llvm.loop.unroll.count", ir.Constant(i32, hints.unroll_count)]
+        )
+    elif hints.unroll:
+        properties.append(["llvm.loop.unroll.enable"])
+    return [module.add_metadata(operands) for operands in properties]
+
+
+@typechecked
+def _join_access_group(
+    module: ir.Module,
+    instruction: ir.Instruction,
+    group: ir.values.MDValue,
+) -> None:
+    """
+    title: Add one access group to an instruction's existing groups.
+    summary: >-
+      An instruction in nested independent loops belongs to the group of
+      each of them, which LLVM spells as a list of groups.
+    parameters:
+      module:
+        type: ir.Module
+      instruction:
+        type: ir.Instruction
+      group:
+        type: ir.values.MDValue
+    """
+    current = instruction.metadata.get(_ACCESS_GROUP)
+    if current is None:
+        instruction.set_metadata(_ACCESS_GROUP, group)
+        return
+    groups = (
+        [current]
+        if isinstance(current, _DistinctMetadata)
+        else current.operands
+    )
+    instruction.set_metadata(
+        _ACCESS_GROUP, module.add_metadata([*groups, group])
+    )
+
+
+@typechecked
+def _accesses_shared_memory(instruction: ir.Instruction) -> bool:
+    """
+    title: Return whether one instruction may touch memory beyond the stack.
+    summary: >-
+      Loads and stores of allocas are left out: they are the loop's own
+      scalar slots, which carry values from one iteration to the next until
+      mem2reg turns them into registers.
+    parameters:
+      instruction:
+        type: ir.Instruction
+    returns:
+      type: bool
+    """
+    if isinstance(instruction, ir.LoadInstr):
+        return not isinstance(instruction.operands[0], ir.AllocaInstr)
+    if isinstance(instruction, ir.StoreInstr):
+        return not isinstance(instruction.operands[1], ir.AllocaInstr)
+    if isinstance(instruction, ir.CallInstr):
+        callee = instruction.callee
+        return not (
+            isinstance(callee, ir.Function) and callee.name.startswith("llvm.")
+        )
+    return False
+
+
+@typechecked
+def attach_loop_metadata(
+    module: ir.Module,
+    header: ir.Block,
+    blocks: Sequence[ir.Block],
+    hints: ResolvedLoopHints | None,
+    *,
+    independent: bool = False,
+) -> None:
+    """
+    title: Attach llvm.loop metadata to one lowered loop.
+    summary: >-
+      blocks are the loop's blocks, including header; every branch among
+      them back to header is a latch and gets the same loop id. Nothing is
+      attached when there are no hints and the loop is not independent.
+    parameters:
+      module:
+        type: ir.Module
+      header:
+        type: ir.Block
+      blocks:
+        type: Sequence[ir.Block]
+      hints:
+        type: ResolvedLoopHints | None
+      independent:
+        type: bool
+    """
+    properties = [] if hints is None else loop_hint_properties(module, hints)
+    if independent or (hints is not None and hints.independent):
+        group = _distinct_metadata(module)
+        for block in blocks:
+            for instruction in block.instructions:
+                if _accesses_shared_memory(instruction):
+                    _join_access_group(module, instruction, group)
+        properties.append(
+            module.add_metadata(["llvm.loop.parallel_accesses", group])
+        )
+    if not properties:
+        return
+
+    loop_id = _distinct_metadata(module)
+    loop_id.operands = (loop_id, *properties)
+    for block in blocks:
+        if not block.is_terminated:
+            continue
+        terminator = block.instructions[-1]
+        if isinstance(terminator, (ir.Branch, ir.ConditionalBranch)) and any(
+            target is header for target in terminator.operands
+        ):
+            terminator.set_metadata(_LOOP, loop_id)
+
+
+__all__ = [
+    "attach_loop_metadata",
+    "loop_hint_properties",
+]
@@ -14,9 +14,12 @@ from irx.builder.lowering.generators import GeneratorVisitorMixin
 from irx.builder.lowering.list import ListVisitorMixin
 from irx.builder.lowering.literals import LiteralVisitorMixin
 from irx.builder.lowering.modules import ModuleVisitorMixin
+from irx.builder.lowering.parallel import ParallelLoopVisitorMixin
 from irx.builder.lowering.system import SystemVisitorMixin
 from irx.builder.lowering.temporal import TemporalVisitorMixin
 from irx.builder.lowering.tensor import TensorVisitorMixin
+from irx.builder.lowering.tensor_matmul import TensorMatmulVisitorMixin
+from irx.builder.lowering.tensor_ops import TensorOpsVisitorMixin
 from irx.builder.lowering.unary_ops import UnaryOpVisitorMixin
 from irx.builder.lowering.variables import VariableVisitorMixin
 
@@ -31,8 +34,11 @@ __all__ = [
     "ListVisitorMixin",
     "LiteralVisitorMixin",
     "ModuleVisitorMixin",
+    "ParallelLoopVisitorMixin",
     "SystemVisitorMixin",
     "TemporalVisitorMixin",
+    "TensorMatmulVisitorMixin",
+    "TensorOpsVisitorMixin",
     "TensorVisitorMixin",
     "UnaryOpVisitorMixin",
     "VariableVisitorMixin",
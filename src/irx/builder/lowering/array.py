@@ -8,11 +8,24 @@ title: Array visitor mixin for llvmliteir.
 
 from __future__ import annotations
 
+from typing import Any, cast
+
+from llvmlite import ir
+
 from irx import astx
 from irx.builder.core import VisitorCore
 from irx.builder.protocols import VisitorMixinBase
 from irx.builder.runtime import safe_pop
-from irx.builder.types import is_int_type
+from irx.builder.runtime.assertions import (
+    ASSERT_FAILURE_SYMBOL_NAME,
+    ASSERT_RUNTIME_FEATURE_NAME,
+)
+from irx.builder.runtime.compute import ARROW_COMPUTE_BINARY_OPS
+from irx.builder.types import is_fp_type, is_int_type
+from irx.builtins.collections.array_primitives import (
+    ARRAY_PRIMITIVE_TYPE_SPECS,
+)
+from irx.builtins.collections.tensor import tensor_primitive_type_name
 from irx.typecheck import typechecked
 
 
@@ -33,8 +46,8 @@ class ArrayVisitorMixin(VisitorMixinBase):
         builder_new = self.require_runtime_symbol(
             "array", "irx_arrow_array_builder_int32_new"
         )
-        append_int32 = self.require_runtime_symbol(
-            "array", "irx_arrow_array_builder_append_int32"
+        append_n = self.require_runtime_symbol(
+            "array", "irx_arrow_array_builder_append_n"
         )
         finish_builder = self.require_runtime_symbol(
             "array", "irx_arrow_array_builder_finish"
@@ -55,7 +68,12 @@ class ArrayVisitorMixin(VisitorMixinBase):
             builder_slot, "array_builder"
         )
 
-        for item in node.values:
+        values_storage = self.create_entry_block_alloca(
+            "array_values",
+            ir.ArrayType(self._llvm.INT32_TYPE, len(node.values)),
+        )
+        zero = ir.Constant(self._llvm.INT32_TYPE, 0)
+        for index, item in enumerate(node.values):
             self.visit_child(item)
             value = safe_pop(self.result_stack)
             if value is None:
@@ -74,7 +92,27 @@ class ArrayVisitorMixin(VisitorMixinBase):
                     value, self._llvm.INT32_TYPE, "array_i32_trunc"
                 )
 
-            self._llvm.ir_builder.call(append_int32, [builder_handle, value])
+            slot = self._llvm.ir_builder.gep(
+                values_storage,
+                [zero, ir.Constant(self._llvm.INT32_TYPE, index)],
+                inbounds=True,
+                name="array_value_slot",
+            )
+            self._llvm.ir_builder.store(value, slot)
+
+        self._llvm.ir_builder.call(
+            append_n,
+            [
+                builder_handle,
+                self._llvm.ir_builder.bitcast(
+                    values_storage,
+                    self._llvm.OPAQUE_POINTER_TYPE,
+                    "array_values_data",
+                ),
+                ir.Constant(self._llvm.INT64_TYPE, len(node.values)),
+                ir.Constant(self._llvm.INT8_TYPE.as_pointer(), None),
+            ],
+        )
 
         array_slot = self._llvm.ir_builder.alloca(
             self._llvm.ARRAY_HANDLE_TYPE,
@@ -94,5 +132,389 @@ class ArrayVisitorMixin(VisitorMixinBase):
         )
         self.result_stack.append(length_i32)
 
+    def _array_type_id(self, type_: astx.DataType) -> int:
+        """
+        title: Return the Arrow runtime type id for one array element type.
+        parameters:
+          type_:
+            type: astx.DataType
+        returns:
+          type: int
+        """
+        primitive_name = tensor_primitive_type_name(type_)
+        if primitive_name is None:
+            raise Exception(f"array lowering has unsupported type {type_}")
+        return ARRAY_PRIMITIVE_TYPE_SPECS[primitive_name].type_id
+
+    def _lower_array_operand(self, operand: astx.AST) -> ir.Value:
+        """
+        title: Lower one expression that yields an Arrow array handle.
+        parameters:
+          operand:
+            type: astx.AST
+        returns:
+          type: ir.Value
+        """
+        self.visit_child(operand)
+        value = safe_pop(self.result_stack)
+        if value is None:
+            raise Exception("array compute expected an array handle")
+        return value
+
+    def _call_array_producer(
+        self,
+        function: ir.Function,
+        args: list[ir.Value],
+        name: str,
+    ) -> None:
+        """
+        title: Call one runtime function that writes a new array handle.
+        summary: >-
+          The out slot starts as NULL, so a failed kernel yields a null handle
+          that later runtime calls reject instead of a stale pointer.
+        parameters:
+          function:
+            type: ir.Function
+          args:
+            type: list[ir.Value]
+          name:
+            type: str
+        """
+        out_slot = self.create_entry_block_alloca(
+            f"{name}_slot", self._llvm.ARRAY_HANDLE_TYPE
+        )
+        self._llvm.ir_builder.store(
+            ir.Constant(self._llvm.ARRAY_HANDLE_TYPE, None), out_slot
+        )
+        self._llvm.ir_builder.call(function, [*args, out_slot])
+        self.result_stack.append(self._llvm.ir_builder.load(out_slot, name))
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayLiteral) -> None:
+        """
+        title: Visit ArrayLiteral nodes.
+        parameters:
+          node:
+            type: astx.ArrayLiteral
+        """
+        builder_new = self.require_runtime_symbol(
+            "array", "irx_arrow_array_builder_new"
+        )
+        append_n = self.require_runtime_symbol(
+            "array", "irx_arrow_array_builder_append_n"
+        )
+        finish_builder = self.require_runtime_symbol(
+            "array", "irx_arrow_array_builder_finish"
+        )
+
+        llvm_type = self._llvm_type_for_ast_type(node.element_type)
+        if llvm_type is None:
+            raise Exception("array lowering has unsupported element type")
+        # Arrow bool builders take one byte per value, not packed bits.
+        is_bool = isinstance(node.element_type, astx.Boolean)
+        storage_type = self._llvm.INT8_TYPE if is_bool else llvm_type
+        values_storage = self.create_entry_block_alloca(
+            "array_literal_values",
+            ir.ArrayType(storage_type, max(len(node.values), 1)),
+        )
+        zero = ir.Constant(self._llvm.INT32_TYPE, 0)
+        for index, item in enumerate(node.values):
+            self.visit_child(item)
+            value = safe_pop(self.result_stack)
+            if value is None:
+                raise Exception("array literal expected a scalar value")
+            value = self._cast_ast_value(
+                value,
+                source_type=self._resolved_ast_type(item),
+                target_type=node.element_type,
+            )
+            if is_bool:
+                value = self._llvm.ir_builder.zext(
+                    value, storage_type, "array_bool_byte"
+                )
+            if value.type != storage_type:
+                raise Exception(
+                    "array literal requires integer, float, or bool values"
+                )
+            slot = self._llvm.ir_builder.gep(
+                values_storage,
+                [zero, ir.Constant(self._llvm.INT32_TYPE, index)],
+                inbounds=True,
+                name="array_literal_slot",
+            )
+            self._llvm.ir_builder.store(value, slot)
+
+        builder_slot = self.create_entry_block_alloca(
+            "array_literal_builder_slot",
+            self._llvm.ARRAY_BUILDER_HANDLE_TYPE,
+        )
+        self._llvm.ir_builder.call(
+            builder_new,
+            [
+                ir.Constant(
+                    self._llvm.INT32_TYPE,
+                    self._array_type_id(node.element_type),
+                ),
+                builder_slot,
+            ],
+        )
+        builder_handle = self._llvm.ir_builder.load(
+            builder_slot, "array_literal_builder"
+        )
+        self._llvm.ir_builder.call(
+            append_n,
+            [
+                builder_handle,
+                self._llvm.ir_builder.bitcast(
+                    values_storage,
+                    self._llvm.OPAQUE_POINTER_TYPE,
+                    "array_literal_data",
+                ),
+                ir.Constant(self._llvm.INT64_TYPE, len(node.values)),
+                ir.Constant(self._llvm.INT8_TYPE.as_pointer(), None),
+            ],
+        )
+        self._call_array_producer(
+            finish_builder, [builder_handle], "array_literal"
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayLength) -> None:
+        """
+        title: Visit ArrayLength nodes.
+        parameters:
+          node:
+            type: astx.ArrayLength
+        """
+        array_length = self.require_runtime_symbol(
+            "array", "irx_arrow_array_length"
+        )
+        array_handle = self._lower_array_operand(node.array)
+        self.result_stack.append(
+            self._llvm.ir_builder.call(
+                array_length, [array_handle], "array_length"
+            )
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayRelease) -> None:
+        """
+        title: Visit ArrayRelease nodes.
+        parameters:
+          node:
+            type: astx.ArrayRelease
+        """
+        release_array = self.require_runtime_symbol(
+            "array", "irx_arrow_array_release"
+        )
+        array_handle = self._lower_array_operand(node.array)
+        self._llvm.ir_builder.call(release_array, [array_handle])
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayReduce) -> None:
+        """
+        title: Visit ArrayReduce nodes.
+        parameters:
+          node:
+            type: astx.ArrayReduce
+        """
+        array_handle = self._lower_array_operand(node.array)
+        is_float = isinstance(node.type_, astx.Float64) or node.op == "mean"
+        result_type = (
+            self._llvm.DOUBLE_TYPE if is_float else self._llvm.INT64_TYPE
+        )
+        suffix = "double" if is_float else "int64"
+        result_slot = self.create_entry_block_alloca(
+            f"array_{node.op}_slot", result_type
+        )
+
+        if node.op == "sum":
+            function = self.require_runtime_symbol(
+                "compute", f"irx_arrow_compute_sum_{suffix}"
+            )
+            args = [array_handle, result_slot]
+        elif node.op == "mean":
+            function = self.require_runtime_symbol(
+                "compute", "irx_arrow_compute_mean"
+            )
+            args = [array_handle, result_slot]
+        elif node.op in {"min", "max"}:
+            function = self.require_runtime_symbol(
+                "compute", f"irx_arrow_compute_min_max_{suffix}"
+            )
+            other_slot = self.create_entry_block_alloca(
+                "array_min_max_other_slot", result_type
+            )
+            args = (
+                [array_handle, result_slot, other_slot]
+                if node.op == "min"
+                else [array_handle, other_slot, result_slot]
+            )
+        else:
+            raise Exception(f"unsupported array reduction '{node.op}'")
+
+        status = self._llvm.ir_builder.call(
+            function, args, f"array_{node.op}_status"
+        )
+        self._check_array_reduce_status(node, status)
+        self.result_stack.append(
+            self._llvm.ir_builder.load(result_slot, f"array_{node.op}")
+        )
+
+    def _check_array_reduce_status(
+        self,
+        node: astx.ArrayReduce,
+        status: ir.Value,
+    ) -> None:
+        """
+        title: Fail through the assertion runtime when a reduction fails.
+        summary: >-
+          Min, max, and mean fail on empty or all-null input, and a uint64
+          sum fails when it does not fit the int64 result. Arrow's sum
+          kernel wraps on overflow, so no other integer sum fails. The
+          kernel's last error becomes the failure message instead of a
+          silently unset result.
+        parameters:
+          node:
+            type: astx.ArrayReduce
+          status:
+            type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        control_flow = cast(Any, self)
+        ok_bb, fail_bb = control_flow._append_basic_blocks(
+            "array.reduce",
+            "ok",
+            "fail",
+        )
+        failed = builder.icmp_signed(
+            "!=",
+            status,
+            ir.Constant(status.type, 0),
+            name=f"array_{node.op}_failed",
+        )
+        builder.cbranch(failed, fail_bb, ok_bb)
+
+        builder.position_at_start(fail_bb)
+        source_ptr = control_flow._constant_c_string_pointer(
+            control_flow._assert_source_name(node),
+            name_hint="assert_source",
+        )
+        message_ptr = builder.call(
+            self.require_runtime_symbol("compute", "irx_arrow_last_error"),
+            [],
+            f"array_{node.op}_error",
+        )
+        fail_function = self.require_runtime_symbol(
+            ASSERT_RUNTIME_FEATURE_NAME,
+            ASSERT_FAILURE_SYMBOL_NAME,
+        )
+        builder.call(
+            fail_function,
+            [
+                source_ptr,
+                ir.Constant(self._llvm.INT32_TYPE, node.loc.line),
+                ir.Constant(self._llvm.INT32_TYPE, node.loc.col),
+                message_ptr,
+            ],
+        )
+        builder.unreachable()
+        builder.position_at_start(ok_bb)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayElementwise) -> None:
+        """
+        title: Visit ArrayElementwise nodes.
+        parameters:
+          node:
+            type: astx.ArrayElementwise
+        """
+        op_code = ARROW_COMPUTE_BINARY_OPS.get(node.op_code)
+        if op_code is None:
+            raise Exception(
+                f"unsupported array elementwise operator '{node.op_code}'"
+            )
+        lhs = self._lower_array_operand(node.lhs)
+        self.visit_child(node.rhs)
+        rhs = safe_pop(self.result_stack)
+        if rhs is None:
+            raise Exception("array elementwise expected a right operand")
+
+        op_value = ir.Constant(self._llvm.INT32_TYPE, op_code)
+        if is_fp_type(rhs.type):
+            function = self.require_runtime_symbol(
+                "compute", "irx_arrow_compute_binary_double_scalar"
+            )
+            rhs = self._coerce_to(rhs, self._llvm.DOUBLE_TYPE)
+        elif is_int_type(rhs.type):
+            function = self.require_runtime_symbol(
+                "compute", "irx_arrow_compute_binary_int64_scalar"
+            )
+            rhs = self._cast_ast_value(
+                rhs,
+                source_type=self._resolved_ast_type(node.rhs),
+                target_type=astx.Int64(),
+            )
+        else:
+            function = self.require_runtime_symbol(
+                "compute", "irx_arrow_compute_binary"
+            )
+        self._call_array_producer(
+            function, [op_value, lhs, rhs], "array_elementwise"
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayFilter) -> None:
+        """
+        title: Visit ArrayFilter nodes.
+        parameters:
+          node:
+            type: astx.ArrayFilter
+        """
+        function = self.require_runtime_symbol(
+            "compute", "irx_arrow_compute_filter"
+        )
+        array_handle = self._lower_array_operand(node.array)
+        mask_handle = self._lower_array_operand(node.mask)
+        self._call_array_producer(
+            function, [array_handle, mask_handle], "array_filter"
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayTake) -> None:
+        """
+        title: Visit ArrayTake nodes.
+        parameters:
+          node:
+            type: astx.ArrayTake
+        """
+        function = self.require_runtime_symbol(
+            "compute", "irx_arrow_compute_take"
+        )
+        array_handle = self._lower_array_operand(node.array)
+        indices_handle = self._lower_array_operand(node.indices)
+        self._call_array_producer(
+            function, [array_handle, indices_handle], "array_take"
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ArrayCast) -> None:
+        """
+        title: Visit ArrayCast nodes.
+        parameters:
+          node:
+            type: astx.ArrayCast
+        """
+        function = self.require_runtime_symbol(
+            "compute", "irx_arrow_compute_cast"
+        )
+        array_handle = self._lower_array_operand(node.array)
+        type_id = ir.Constant(
+            self._llvm.INT32_TYPE, self._array_type_id(node.target_type)
+        )
+        self._call_array_producer(
+            function, [array_handle, type_id], "array_cast"
+        )
+
 
 __all__ = ["ArrayVisitorMixin"]
@@ -9,7 +9,7 @@ from __future__ import annotations
 from llvmlite import ir
 
 from irx import astx
-from irx.analysis.types import common_numeric_type
+from irx.analysis.types import common_numeric_type, is_string_type
 from irx.astx.binary_op import (
     SPECIALIZED_BINARY_OP_EXTRA,
     AddBinOp,
@@ -44,6 +44,9 @@ from irx.builder.types import is_fp_type, is_int_type
 from irx.builder.vector import emit_add, emit_int_div, is_vector
 from irx.typecheck import typechecked
 
+# Chains with this many pieces go through one sized string builder.
+STRING_BUILDER_MIN_OPERANDS = 3
+
 
 @typechecked
 class BinaryOpVisitorMixin(VisitorMixinBase):
@@ -114,6 +117,41 @@ class BinaryOpVisitorMixin(VisitorMixinBase):
 
         return llvm_lhs, llvm_rhs, unsigned
 
+    def _string_concat_operands(self, node: astx.AST) -> list[astx.AST]:
+        """
+        title: Flatten one string concatenation chain into its operands.
+        parameters:
+          node:
+            type: astx.AST
+        returns:
+          type: list[astx.AST]
+        """
+        if (
+            isinstance(node, astx.BinaryOp)
+            and node.op_code == "+"
+            and is_string_type(self._resolved_ast_type(node))
+        ):
+            return [
+                *self._string_concat_operands(node.lhs),
+                *self._string_concat_operands(node.rhs),
+            ]
+        return [node]
+
+    def _lower_string_operand(self, node: astx.AST) -> ir.Value:
+        """
+        title: Lower one string concatenation operand.
+        parameters:
+          node:
+            type: astx.AST
+        returns:
+          type: ir.Value
+        """
+        self.visit_child(node)
+        value = safe_pop(self.result_stack)
+        if value is None:
+            raise Exception("codegen: Invalid string operand")
+        return value
+
     def _emit_vector_add(
         self,
         node: AddBinOp,
@@ -390,6 +428,18 @@ class BinaryOpVisitorMixin(VisitorMixinBase):
           node:
             type: AddBinOp
         """
+        string_operands = self._string_concat_operands(node)
+        if len(string_operands) >= STRING_BUILDER_MIN_OPERANDS:
+            self.result_stack.append(
+                self._handle_string_concatenation_chain(
+                    [
+                        self._lower_string_operand(operand)
+                        for operand in string_operands
+                    ]
+                )
+            )
+            return
+
         llvm_lhs, llvm_rhs, _unsigned = self._load_binary_operands(node)
 
         vector_result = self._emit_vector_add(node, llvm_lhs, llvm_rhs)
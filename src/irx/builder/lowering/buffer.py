@@ -9,24 +9,51 @@ summary: >-
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from typing import Any, Iterator, cast
+
 from llvmlite import ir
 
 from irx import astx
 from irx.analysis.types import is_unsigned_type
 from irx.buffer import (
+    BUFFER_FLAG_C_CONTIGUOUS,
+    BUFFER_FLAG_F_CONTIGUOUS,
     BUFFER_VIEW_ELEMENT_TYPE_EXTRA,
     BUFFER_VIEW_FIELD_INDICES,
     BUFFER_VIEW_METADATA_EXTRA,
     BufferHandle,
     BufferIndexBoundsPolicy,
     BufferViewMetadata,
+    buffer_flags_include,
+)
+from irx.builder.core import (
+    VisitorCore,
+    semantic_assignment_key,
+    semantic_symbol_key,
 )
-from irx.builder.core import VisitorCore
 from irx.builder.protocols import VisitorMixinBase
 from irx.builder.runtime import safe_pop
+from irx.builder.runtime.assertions import (
+    ASSERT_FAILURE_SYMBOL_NAME,
+    ASSERT_RUNTIME_FEATURE_NAME,
+)
+from irx.builder.state import HoistedBufferDescriptor
 from irx.builder.types import is_int_type
 from irx.typecheck import typechecked
 
+BUFFER_BOUNDS_FAILURE_MESSAGE = "buffer view index out of bounds"
+# Branch weights that keep the bounds failure path out of the hot layout.
+BUFFER_BOUNDS_BRANCH_WEIGHTS = (1 << 20, 1)
+_ASSIGNMENT_OPERATORS = {"=", "+=", "-=", "*=", "/=", "%="}
+_AST_NON_CHILD_FIELDS = {
+    "semantic",
+    "parent",
+    "type_",
+    "return_type",
+    "target_type",
+}
+
 
 @typechecked
 class BufferVisitorMixin(VisitorMixinBase):
@@ -145,6 +172,70 @@ class BufferVisitorMixin(VisitorMixinBase):
             )
         return value
 
+    def _derived_view_value(
+        self,
+        base: ir.Value,
+        *,
+        shape: tuple[int, ...],
+        strides: tuple[int, ...],
+        offset_delta: int,
+        flags: int,
+        symbol_namespace: str = "buffer",
+    ) -> ir.Value:
+        """
+        title: Rebuild one view descriptor over the storage of another.
+        summary: >-
+          The data, owner, and dtype fields stay those of the base, so the
+          derived view neither copies nor retains. The byte offset is the
+          runtime base offset plus the static delta of the derived layout.
+        parameters:
+          base:
+            type: ir.Value
+          shape:
+            type: tuple[int, Ellipsis]
+          strides:
+            type: tuple[int, Ellipsis]
+          offset_delta:
+            type: int
+          flags:
+            type: int
+          symbol_namespace:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        offset_bytes = self._extract_buffer_view_offset_bytes(base)
+        if offset_delta:
+            offset_bytes = self._llvm.ir_builder.add(
+                offset_bytes,
+                ir.Constant(self._llvm.INT64_TYPE, offset_delta),
+                name=f"irx_{symbol_namespace}_view_offset_sum",
+            )
+        fields = {
+            "ndim": ir.Constant(self._llvm.INT32_TYPE, len(shape)),
+            "shape": self._i64_array_pointer(
+                shape,
+                purpose="shape",
+                symbol_namespace=symbol_namespace,
+            ),
+            "strides": self._i64_array_pointer(
+                strides,
+                purpose="strides",
+                symbol_namespace=symbol_namespace,
+            ),
+            "offset_bytes": offset_bytes,
+            "flags": ir.Constant(self._llvm.INT32_TYPE, flags),
+        }
+        value = base
+        for field_name, field in fields.items():
+            value = self._llvm.ir_builder.insert_value(
+                value,
+                field,
+                BUFFER_VIEW_FIELD_INDICES[field_name],
+                name=f"irx_{symbol_namespace}_view_{field_name}",
+            )
+        return value
+
     def _buffer_view_pointer_for_call(
         self,
         view: astx.AST,
@@ -260,6 +351,36 @@ class BufferVisitorMixin(VisitorMixinBase):
             name="irx_buffer_view_offset_bytes",
         )
 
+    def _load_buffer_view_axes(
+        self,
+        axes: ir.Value,
+        rank: int,
+        *,
+        name: str,
+    ) -> tuple[ir.Value, ...]:
+        """
+        title: Load the first rank entries of a shape or strides array.
+        parameters:
+          axes:
+            type: ir.Value
+          rank:
+            type: int
+          name:
+            type: str
+        returns:
+          type: tuple[ir.Value, Ellipsis]
+        """
+        builder = self._llvm.ir_builder
+        values: list[ir.Value] = []
+        for axis in range(rank):
+            pointer = builder.gep(
+                axes,
+                [ir.Constant(self._llvm.INT64_TYPE, axis)],
+                name=f"{name}_ptr_{axis}",
+            )
+            values.append(builder.load(pointer, name=f"{name}_{axis}"))
+        return tuple(values)
+
     def _buffer_index_element_type(
         self,
         node: astx.AST,
@@ -284,6 +405,690 @@ class BufferVisitorMixin(VisitorMixinBase):
             "buffer view indexing requires a semantic element type"
         )
 
+    def _static_buffer_index_metadata(
+        self,
+        node: astx.AST,
+    ) -> BufferViewMetadata | None:
+        """
+        title: Return descriptor metadata that is fixed for one indexed base.
+        summary: >-
+          Mutable bindings may be reassigned to a view with another layout, so
+          only descriptors and immutable bindings qualify.
+        parameters:
+          node:
+            type: astx.AST
+        returns:
+          type: BufferViewMetadata | None
+        """
+        semantic = getattr(node, "semantic", None)
+        extras = getattr(semantic, "extras", {})
+        metadata = extras.get(BUFFER_VIEW_METADATA_EXTRA)
+        if isinstance(metadata, BufferViewMetadata):
+            return metadata
+
+        symbol = getattr(semantic, "resolved_symbol", None)
+        declaration = getattr(symbol, "declaration", None)
+        if (
+            getattr(declaration, "mutability", None)
+            is not astx.MutabilityKind.constant
+        ):
+            return None
+        initializer = getattr(declaration, "value", None)
+        initializer_semantic = getattr(initializer, "semantic", None)
+        initializer_extras = getattr(initializer_semantic, "extras", {})
+        metadata = initializer_extras.get(BUFFER_VIEW_METADATA_EXTRA)
+        if isinstance(metadata, BufferViewMetadata):
+            return metadata
+        return None
+
+    def _buffer_element_strides(
+        self,
+        element_llvm_type: ir.Type,
+        static_strides: tuple[int, ...] | None,
+        flags: int,
+    ) -> tuple[int, ...] | None:
+        """
+        title: Return static strides in elements for contiguous layouts.
+        summary: >-
+          Returns None unless the flags declare C or F contiguity and every
+          byte stride is a whole number of elements.
+        parameters:
+          element_llvm_type:
+            type: ir.Type
+          static_strides:
+            type: tuple[int, Ellipsis] | None
+          flags:
+            type: int
+        returns:
+          type: tuple[int, Ellipsis] | None
+        """
+        if static_strides is None:
+            return None
+        if not (
+            buffer_flags_include(flags, BUFFER_FLAG_C_CONTIGUOUS)
+            or buffer_flags_include(flags, BUFFER_FLAG_F_CONTIGUOUS)
+        ):
+            return None
+        element_size = element_llvm_type.get_abi_size(
+            self.target_machine.target_data
+        )
+        if element_size <= 0 or any(
+            stride % element_size for stride in static_strides
+        ):
+            return None
+        return tuple(stride // element_size for stride in static_strides)
+
+    def _effective_bounds_policy(
+        self,
+        bounds_policy: BufferIndexBoundsPolicy,
+    ) -> BufferIndexBoundsPolicy:
+        """
+        title: Resolve one access policy against the module-wide default.
+        parameters:
+          bounds_policy:
+            type: BufferIndexBoundsPolicy
+        returns:
+          type: BufferIndexBoundsPolicy
+        """
+        if bounds_policy is BufferIndexBoundsPolicy.DEFAULT:
+            return self.bounds_policy
+        return bounds_policy
+
+    def _lower_buffer_bounds_check(
+        self,
+        view: ir.Value,
+        indices: list[ir.Value],
+        *,
+        index_nodes: list[astx.AST],
+        static_shape: tuple[int, ...] | None,
+        node: astx.AST,
+        extents: tuple[ir.Value, ...] = (),
+    ) -> None:
+        """
+        title: Emit one runtime bounds check for normalized i64 indices.
+        summary: >-
+          Each index is compared unsigned against its extent, which also
+          rejects negative indices. Axes proven by an enclosing loop are
+          skipped; axes guarded by a runtime pre-loop check only compare when
+          that guard failed. Without a static shape, extents already loaded
+          in a loop preheader are used before loading them from the view.
+        parameters:
+          view:
+            type: ir.Value
+          indices:
+            type: list[ir.Value]
+          index_nodes:
+            type: list[astx.AST]
+          static_shape:
+            type: tuple[int, Ellipsis] | None
+          node:
+            type: astx.AST
+          extents:
+            type: tuple[ir.Value, Ellipsis]
+        """
+        builder = self._llvm.ir_builder
+        if static_shape is not None and len(static_shape) != len(indices):
+            static_shape = None
+        if len(extents) != len(indices):
+            extents = ()
+
+        checked_axes: list[tuple[int, ir.Value]] = []
+        guards: list[ir.Value] = []
+        unguarded = False
+        for axis, (index, index_node) in enumerate(
+            zip(indices, index_nodes, strict=True)
+        ):
+            guard = self._buffer_bounds_guards.get(id(index_node))
+            if isinstance(guard, ir.Constant) and guard.constant:
+                continue
+            checked_axes.append((axis, index))
+            if guard is None:
+                unguarded = True
+            else:
+                guards.append(guard)
+        if not checked_axes:
+            return
+
+        control_flow = cast(Any, self)
+        ok_bb, fail_bb = control_flow._append_basic_blocks(
+            "buffer.bounds",
+            "ok",
+            "fail",
+        )
+        if guards and not unguarded:
+            check_bb = control_flow._append_basic_blocks(
+                "buffer.bounds",
+                "check",
+            )[0]
+            guard = guards[0]
+            for other in guards[1:]:
+                guard = builder.and_(guard, other, name="irx_buffer_guard")
+            builder.cbranch(guard, ok_bb, check_bb)
+            builder.position_at_start(check_bb)
+
+        shape = (
+            None
+            if static_shape is not None or extents
+            else self._extract_buffer_view_shape(view)
+        )
+        in_bounds: ir.Value | None = None
+        for axis, index in checked_axes:
+            extent: ir.Value
+            if static_shape is not None:
+                extent = ir.Constant(self._llvm.INT64_TYPE, static_shape[axis])
+            elif extents:
+                extent = extents[axis]
+            else:
+                extent_ptr = builder.gep(
+                    shape,
+                    [ir.Constant(self._llvm.INT64_TYPE, axis)],
+                    name=f"irx_buffer_bounds_extent_ptr_{axis}",
+                )
+                extent = builder.load(
+                    extent_ptr,
+                    name=f"irx_buffer_bounds_extent_{axis}",
+                )
+            below = builder.icmp_unsigned(
+                "<",
+                index,
+                extent,
+                name=f"irx_buffer_bounds_ok_{axis}",
+            )
+            in_bounds = (
+                below
+                if in_bounds is None
+                else builder.and_(in_bounds, below, name="irx_buffer_bounds")
+            )
+        branch = builder.cbranch(in_bounds, ok_bb, fail_bb)
+        branch.set_weights(list(BUFFER_BOUNDS_BRANCH_WEIGHTS))
+
+        builder.position_at_start(fail_bb)
+        self._lower_buffer_bounds_failure(node)
+        builder.position_at_start(ok_bb)
+
+    def _lower_buffer_bounds_failure(self, node: astx.AST) -> None:
+        """
+        title: Report one out-of-bounds access through the assertion runtime.
+        parameters:
+          node:
+            type: astx.AST
+        """
+        control_flow = cast(Any, self)
+        source_ptr = control_flow._constant_c_string_pointer(
+            control_flow._assert_source_name(node),
+            name_hint="assert_source",
+        )
+        message_ptr = control_flow._constant_c_string_pointer(
+            BUFFER_BOUNDS_FAILURE_MESSAGE,
+            name_hint="irx_buffer_bounds_message",
+        )
+        fail_function = self.require_runtime_symbol(
+            ASSERT_RUNTIME_FEATURE_NAME,
+            ASSERT_FAILURE_SYMBOL_NAME,
+        )
+        self._llvm.ir_builder.call(
+            fail_function,
+            [
+                source_ptr,
+                ir.Constant(self._llvm.INT32_TYPE, node.loc.line),
+                ir.Constant(self._llvm.INT32_TYPE, node.loc.col),
+                message_ptr,
+            ],
+        )
+        self._llvm.ir_builder.unreachable()
+
+    def _checked_access_extents(
+        self,
+        node: astx.AST,
+    ) -> tuple[list[astx.AST], tuple[int, ...] | None] | None:
+        """
+        title: Return indices and static extents of one checked access.
+        summary: >-
+          Returns None for nodes that are not indexed accesses or that lower
+          without runtime bounds checks.
+        parameters:
+          node:
+            type: astx.AST
+        returns:
+          type: tuple[list[astx.AST], tuple[int, Ellipsis] | None] | None
+        """
+        if isinstance(node, (astx.BufferViewIndex, astx.BufferViewStore)):
+            if (
+                self._effective_bounds_policy(node.bounds_policy)
+                is not BufferIndexBoundsPolicy.CHECKED
+            ):
+                return None
+            metadata = self._static_buffer_index_metadata(node.base)
+            return (
+                node.indices,
+                metadata.shape if metadata is not None else None,
+            )
+        if isinstance(node, (astx.TensorIndex, astx.TensorStore)):
+            if self.bounds_policy is not BufferIndexBoundsPolicy.CHECKED:
+                return None
+            layout = cast(Any, self)._static_tensor_layout(node.base)
+            return (node.indices, layout.shape)
+        return None
+
+    def _collect_loop_index_extents(
+        self,
+        node: astx.AST,
+        variable_key: str,
+        found: list[tuple[astx.AST, int]],
+    ) -> bool:
+        """
+        title: Collect checked axes indexed directly by one loop variable.
+        summary: >-
+          Appends (index node, static extent) pairs to found. Returns False
+          when the subtree may change the loop variable, or defines nested
+          code that could, in which case nothing can be proven.
+        parameters:
+          node:
+            type: astx.AST
+          variable_key:
+            type: str
+          found:
+            type: list[tuple[astx.AST, int]]
+        returns:
+          type: bool
+        """
+        if isinstance(node, (astx.FunctionDef, astx.LambdaExpr)):
+            return False
+        if isinstance(node, astx.VariableAssignment):
+            if semantic_assignment_key(node, node.name) == variable_key:
+                return False
+        elif (
+            isinstance(node, astx.UnaryOp)
+            and node.op_code in {"++", "--"}
+            and isinstance(node.operand, astx.Identifier)
+        ):
+            operand = node.operand
+            if semantic_symbol_key(operand, operand.name) == variable_key:
+                return False
+        elif (
+            isinstance(node, astx.BinaryOp)
+            and node.op_code in _ASSIGNMENT_OPERATORS
+            and isinstance(node.lhs, astx.Identifier)
+        ):
+            if semantic_assignment_key(node, node.lhs.name) == variable_key:
+                return False
+
+        access = self._checked_access_extents(node)
+        if access is not None:
+            indices, shape = access
+            if shape is not None and len(shape) == len(indices):
+                for index, extent in zip(indices, shape, strict=True):
+                    if (
+                        isinstance(index, astx.Identifier)
+                        and semantic_symbol_key(index, index.name)
+                        == variable_key
+                    ):
+                        found.append((index, extent))
+
+        for name, value in vars(node).items():
+            if name in _AST_NON_CHILD_FIELDS:
+                continue
+            children = value if isinstance(value, (list, tuple)) else [value]
+            for child in children:
+                if isinstance(
+                    child, astx.AST
+                ) and not self._collect_loop_index_extents(
+                    child,
+                    variable_key,
+                    found,
+                ):
+                    return False
+        return True
+
+    def _hoist_loop_bounds_checks(
+        self,
+        body: astx.AST,
+        *,
+        variable_key: str,
+        start: ir.Value,
+        end: ir.Value,
+        unsigned: bool,
+    ) -> dict[int, ir.Value]:
+        """
+        title: Emit pre-loop bounds guards for one unit-step counted loop.
+        summary: >-
+          The caller guarantees the loop variable walks start, start + 1, ...
+          while it stays below end. Every checked access in body indexed
+          directly by that variable then stays in bounds exactly when the
+          loop is empty or start >= 0 and end <= extent. That condition is
+          folded at compile time when possible, otherwise emitted once at the
+          current insertion point, which must be the loop preheader. Returns
+          the guards keyed by index node id.
+        parameters:
+          body:
+            type: astx.AST
+          variable_key:
+            type: str
+          start:
+            type: ir.Value
+          end:
+            type: ir.Value
+          unsigned:
+            type: bool
+        returns:
+          type: dict[int, ir.Value]
+        """
+        found: list[tuple[astx.AST, int]] = []
+        if (
+            not is_int_type(start.type)
+            or not is_int_type(end.type)
+            or not self._collect_loop_index_extents(body, variable_key, found)
+        ):
+            return {}
+
+        guards_by_extent: dict[int, ir.Value | None] = {}
+        guards: dict[int, ir.Value] = {}
+        for index, extent in found:
+            if extent not in guards_by_extent:
+                guards_by_extent[extent] = self._loop_bounds_guard(
+                    start,
+                    end,
+                    extent,
+                    unsigned=unsigned,
+                )
+            guard = guards_by_extent[extent]
+            if guard is not None:
+                guards[id(index)] = guard
+        return guards
+
+    @contextmanager
+    def _buffer_bounds_guard_scope(
+        self,
+        guards: dict[int, ir.Value],
+    ) -> Iterator[None]:
+        """
+        title: Make hoisted loop bounds guards visible to one loop body.
+        parameters:
+          guards:
+            type: dict[int, ir.Value]
+        returns:
+          type: Iterator[None]
+        """
+        self._buffer_bounds_guards.update(guards)
+        try:
+            yield
+        finally:
+            for key in guards:
+                self._buffer_bounds_guards.pop(key, None)
+
+    def _loop_bounds_guard(
+        self,
+        start: ir.Value,
+        end: ir.Value,
+        extent: int,
+        *,
+        unsigned: bool,
+    ) -> ir.Value | None:
+        """
+        title: Return the pre-loop condition proving [start, end) in bounds.
+        summary: >-
+          Returns a true constant when the range is provably in bounds at
+          compile time, None when it provably is not, and otherwise an i1
+          computed once in the loop preheader.
+        parameters:
+          start:
+            type: ir.Value
+          end:
+            type: ir.Value
+          extent:
+            type: int
+          unsigned:
+            type: bool
+        returns:
+          type: ir.Value | None
+        """
+        if isinstance(start, ir.Constant) and isinstance(end, ir.Constant):
+            start_value = int(start.constant)
+            end_value = int(end.constant)
+            if unsigned:
+                start_value &= (1 << start.type.width) - 1
+                end_value &= (1 << end.type.width) - 1
+            if start_value >= end_value or (
+                start_value >= 0 and end_value <= extent
+            ):
+                return ir.Constant(self._llvm.BOOLEAN_TYPE, 1)
+            return None
+
+        builder = self._llvm.ir_builder
+        widen = builder.zext if unsigned else builder.sext
+        start64 = (
+            start
+            if start.type == self._llvm.INT64_TYPE
+            else widen(start, self._llvm.INT64_TYPE, name="irx_loop_start")
+        )
+        end64 = (
+            end
+            if end.type == self._llvm.INT64_TYPE
+            else widen(end, self._llvm.INT64_TYPE, name="irx_loop_end")
+        )
+        compare = builder.icmp_unsigned if unsigned else builder.icmp_signed
+        empty = compare(">=", start64, end64, name="irx_loop_empty")
+        fits = compare(
+            "<=",
+            end64,
+            ir.Constant(self._llvm.INT64_TYPE, extent),
+            name="irx_loop_fits",
+        )
+        if not unsigned:
+            fits = builder.and_(
+                builder.icmp_signed(
+                    ">=",
+                    start64,
+                    ir.Constant(self._llvm.INT64_TYPE, 0),
+                    name="irx_loop_nonnegative",
+                ),
+                fits,
+                name="irx_loop_in_range",
+            )
+        return builder.or_(empty, fits, name="irx_buffer_guard")
+
+    def _collect_loop_buffer_accesses(
+        self,
+        node: astx.AST,
+        accesses: list[astx.BufferViewIndex | astx.BufferViewStore],
+        declared: set[str],
+        *,
+        outlined: bool = False,
+    ) -> bool:
+        """
+        title: Collect indexed buffer view accesses in one loop body.
+        summary: >-
+          Appends every access to accesses and the keys of names the body
+          declares or assigns to declared. Returns False when the subtree
+          defines nested code or suspends a generator, since values loaded in
+          the preheader would not reach it. Parallel loop bodies are outlined
+          into their own function and hoist for themselves, so only their
+          declarations and assignments are collected.
+        parameters:
+          node:
+            type: astx.AST
+          accesses:
+            type: list[astx.BufferViewIndex | astx.BufferViewStore]
+          declared:
+            type: set[str]
+          outlined:
+            type: bool
+        returns:
+          type: bool
+        """
+        if isinstance(
+            node,
+            (
+                astx.FunctionDef,
+                astx.LambdaExpr,
+                astx.YieldExpr,
+                astx.YieldFromExpr,
+                astx.YieldStmt,
+            ),
+        ):
+            return False
+        if isinstance(node, astx.ParallelForRangeLoopStmt):
+            outlined = True
+        if isinstance(node, astx.VariableDeclaration):
+            declared.add(semantic_symbol_key(node, node.name))
+        elif isinstance(node, astx.VariableAssignment):
+            declared.add(semantic_assignment_key(node, node.name))
+        elif (
+            isinstance(node, astx.BinaryOp)
+            and node.op_code in _ASSIGNMENT_OPERATORS
+            and isinstance(node.lhs, astx.Identifier)
+        ):
+            declared.add(semantic_assignment_key(node, node.lhs.name))
+        elif not outlined and isinstance(
+            node, (astx.BufferViewIndex, astx.BufferViewStore)
+        ):
+            accesses.append(node)
+
+        for name, value in vars(node).items():
+            if name in _AST_NON_CHILD_FIELDS:
+                continue
+            children = value if isinstance(value, (list, tuple)) else [value]
+            for child in children:
+                if isinstance(
+                    child, astx.AST
+                ) and not self._collect_loop_buffer_accesses(
+                    child,
+                    accesses,
+                    declared,
+                    outlined=outlined,
+                ):
+                    return False
+        return True
+
+    def _hoist_loop_buffer_descriptors(
+        self,
+        body: astx.AST,
+    ) -> dict[str, HoistedBufferDescriptor]:
+        """
+        title: Load the descriptors of loop-invariant views indexed in a loop.
+        summary: >-
+          A binding declared before the loop that is immutable, or that the
+          body never assigns, holds the same view on every iteration. Its
+          data pointer, byte offset, and any strides or extents static
+          metadata does not fold are loaded once at the current insertion
+          point, which must be the loop preheader. Builders default to
+          opt_level 0, where no LLVM pass would hoist them out of the body.
+          Returns the descriptors keyed by view symbol; views an enclosing
+          loop already hoisted are left to it.
+        parameters:
+          body:
+            type: astx.AST
+        returns:
+          type: dict[str, HoistedBufferDescriptor]
+        """
+        accesses: list[astx.BufferViewIndex | astx.BufferViewStore] = []
+        declared: set[str] = set()
+        if not self._collect_loop_buffer_accesses(body, accesses, declared):
+            return {}
+
+        bases: dict[str, astx.Identifier] = {}
+        ranks: dict[str, int] = {}
+        dynamic_strides: set[str] = set()
+        dynamic_shape: set[str] = set()
+        for access in accesses:
+            base = access.base
+            if not isinstance(base, astx.Identifier):
+                continue
+            key = semantic_symbol_key(base, base.name)
+            if (
+                key in declared
+                or key in self._hoisted_buffer_descriptors
+                or key not in self.named_values
+            ):
+                continue
+            rank = len(access.indices)
+            metadata = self._static_buffer_index_metadata(base)
+            bases[key] = base
+            ranks[key] = max(rank, ranks.get(key, 0))
+            if metadata is None or len(metadata.strides) != rank:
+                dynamic_strides.add(key)
+            if self._effective_bounds_policy(
+                access.bounds_policy
+            ) is BufferIndexBoundsPolicy.CHECKED and (
+                metadata is None or len(metadata.shape) != rank
+            ):
+                dynamic_shape.add(key)
+
+        descriptors: dict[str, HoistedBufferDescriptor] = {}
+        for key, base in bases.items():
+            self.visit_child(base)
+            view = safe_pop(self.result_stack)
+            if view is None or view.type != self._llvm.BUFFER_VIEW_TYPE:
+                continue
+            descriptors[key] = HoistedBufferDescriptor(
+                function=self._llvm.ir_builder.function,
+                view=view,
+                data=self._extract_buffer_view_data(view),
+                offset_bytes=self._extract_buffer_view_offset_bytes(view),
+                strides=self._load_buffer_view_axes(
+                    self._extract_buffer_view_strides(view),
+                    ranks[key],
+                    name="irx_buffer_index_stride",
+                )
+                if key in dynamic_strides
+                else (),
+                shape=self._load_buffer_view_axes(
+                    self._extract_buffer_view_shape(view),
+                    ranks[key],
+                    name="irx_buffer_bounds_extent",
+                )
+                if key in dynamic_shape
+                else (),
+            )
+        return descriptors
+
+    @contextmanager
+    def _buffer_descriptor_scope(
+        self,
+        descriptors: dict[str, HoistedBufferDescriptor],
+    ) -> Iterator[None]:
+        """
+        title: Make hoisted buffer descriptors visible to one loop body.
+        parameters:
+          descriptors:
+            type: dict[str, HoistedBufferDescriptor]
+        returns:
+          type: Iterator[None]
+        """
+        self._hoisted_buffer_descriptors.update(descriptors)
+        try:
+            yield
+        finally:
+            for key in descriptors:
+                self._hoisted_buffer_descriptors.pop(key, None)
+
+    def _hoisted_buffer_descriptor(
+        self,
+        base: astx.AST,
+    ) -> HoistedBufferDescriptor | None:
+        """
+        title: Return the descriptor a loop preheader loaded for one base.
+        summary: >-
+          Descriptors loaded in another function, such as the one enclosing
+          an outlined parallel body, are not reachable and are ignored.
+        parameters:
+          base:
+            type: astx.AST
+        returns:
+          type: HoistedBufferDescriptor | None
+        """
+        if not isinstance(base, astx.Identifier):
+            return None
+        descriptor = self._hoisted_buffer_descriptors.get(
+            semantic_symbol_key(base, base.name)
+        )
+        if (
+            descriptor is None
+            or descriptor.function is not self._llvm.ir_builder.function
+        ):
+            return None
+        return descriptor
+
     def _normalize_buffer_index_value(
         self,
         value: ir.Value,
@@ -329,12 +1134,19 @@ class BufferVisitorMixin(VisitorMixinBase):
         indices: list[ir.Value],
         *,
         index_nodes: list[astx.AST],
-        bounds_policy: BufferIndexBoundsPolicy = (
-            BufferIndexBoundsPolicy.DEFAULT
-        ),
+        static_strides: tuple[int, ...] | None = None,
+        descriptor: HoistedBufferDescriptor | None = None,
     ) -> ir.Value:
         """
         title: Lower one buffer view indexed access to a byte offset.
+        summary: >-
+          Static strides become constant multipliers. Otherwise the strides
+          come from descriptor when an enclosing loop preheader already
+          loaded them, and are loaded from the view here if not. Those loads
+          stay plain: the shape and stride arrays live in owner-managed or
+          host memory, so nothing guarantees they are invariant beyond one
+          loop over an immutable binding. Bounds checks belong to element
+          accesses, see lower_buffer_element_pointer.
         parameters:
           view:
             type: ir.Value
@@ -342,33 +1154,44 @@ class BufferVisitorMixin(VisitorMixinBase):
             type: list[ir.Value]
           index_nodes:
             type: list[astx.AST]
-          bounds_policy:
-            type: BufferIndexBoundsPolicy
+          static_strides:
+            type: tuple[int, Ellipsis] | None
+          descriptor:
+            type: HoistedBufferDescriptor | None
         returns:
           type: ir.Value
         """
-        _ = bounds_policy
         if view.type != self._llvm.BUFFER_VIEW_TYPE:
             raise Exception("buffer view indexing requires a BufferViewType")
         if len(indices) != len(index_nodes):
             raise Exception("buffer view index lowering arity mismatch")
 
-        strides = self._extract_buffer_view_strides(view)
-        total_offset = self._extract_buffer_view_offset_bytes(view)
+        strides: tuple[ir.Value, ...]
+        if static_strides is not None and len(static_strides) == len(indices):
+            strides = tuple(
+                ir.Constant(self._llvm.INT64_TYPE, stride)
+                for stride in static_strides
+            )
+        elif descriptor is not None and len(descriptor.strides) == len(
+            indices
+        ):
+            strides = descriptor.strides
+        else:
+            strides = self._load_buffer_view_axes(
+                self._extract_buffer_view_strides(view),
+                len(indices),
+                name="irx_buffer_index_stride",
+            )
+        total_offset = (
+            descriptor.offset_bytes
+            if descriptor is not None
+            else self._extract_buffer_view_offset_bytes(view)
+        )
 
-        for axis, (index, index_node) in enumerate(
-            zip(indices, index_nodes, strict=True)
+        for axis, (index, index_node, stride) in enumerate(
+            zip(indices, index_nodes, strides, strict=True)
         ):
             index64 = self._normalize_buffer_index_value(index, index_node)
-            stride_ptr = self._llvm.ir_builder.gep(
-                strides,
-                [ir.Constant(self._llvm.INT64_TYPE, axis)],
-                name=f"irx_buffer_index_stride_ptr_{axis}",
-            )
-            stride = self._llvm.ir_builder.load(
-                stride_ptr,
-                name=f"irx_buffer_index_stride_{axis}",
-            )
             scaled_index = self._llvm.ir_builder.mul(
                 index64,
                 stride,
@@ -392,9 +1215,22 @@ class BufferVisitorMixin(VisitorMixinBase):
         bounds_policy: BufferIndexBoundsPolicy = (
             BufferIndexBoundsPolicy.DEFAULT
         ),
+        static_strides: tuple[int, ...] | None = None,
+        static_flags: int = 0,
+        static_shape: tuple[int, ...] | None = None,
+        bounds_node: astx.AST | None = None,
+        descriptor: HoistedBufferDescriptor | None = None,
     ) -> ir.Value:
         """
         title: Lower a buffer view indexed access to a typed element pointer.
+        summary: >-
+          When static metadata proves a contiguous layout, the address is one
+          inbounds element GEP from the view origin with constant element
+          strides, which keeps loop bodies free of descriptor loads and lets
+          LLVM vectorize them. Under the CHECKED policy every index is first
+          compared against its extent; bounds_node supplies the reported
+          source location. descriptor carries fields an enclosing loop
+          preheader already loaded for view.
         parameters:
           view:
             type: ir.Value
@@ -406,6 +1242,16 @@ class BufferVisitorMixin(VisitorMixinBase):
             type: list[astx.AST]
           bounds_policy:
             type: BufferIndexBoundsPolicy
+          static_strides:
+            type: tuple[int, Ellipsis] | None
+          static_flags:
+            type: int
+          static_shape:
+            type: tuple[int, Ellipsis] | None
+          bounds_node:
+            type: astx.AST | None
+          descriptor:
+            type: HoistedBufferDescriptor | None
         returns:
           type: ir.Value
         """
@@ -414,20 +1260,62 @@ class BufferVisitorMixin(VisitorMixinBase):
             raise Exception(
                 "buffer view indexing has unsupported element type"
             )
+        if (
+            self._effective_bounds_policy(bounds_policy)
+            is BufferIndexBoundsPolicy.CHECKED
+        ):
+            indices = [
+                self._normalize_buffer_index_value(index, index_node)
+                for index, index_node in zip(indices, index_nodes, strict=True)
+            ]
+            self._lower_buffer_bounds_check(
+                view,
+                indices,
+                index_nodes=index_nodes,
+                static_shape=static_shape,
+                node=bounds_node
+                if bounds_node is not None
+                else index_nodes[0],
+                extents=descriptor.shape if descriptor is not None else (),
+            )
+
+        data = (
+            descriptor.data
+            if descriptor is not None
+            else self._extract_buffer_view_data(view)
+        )
+        element_ptr_type = element_llvm_type.as_pointer()
+        element_strides = self._buffer_element_strides(
+            element_llvm_type,
+            static_strides,
+            static_flags,
+        )
+        if element_strides is not None and len(element_strides) == len(
+            indices
+        ):
+            return self._lower_contiguous_element_pointer(
+                data,
+                descriptor.offset_bytes
+                if descriptor is not None
+                else self._extract_buffer_view_offset_bytes(view),
+                indices,
+                element_ptr_type,
+                index_nodes=index_nodes,
+                element_strides=element_strides,
+            )
 
-        data = self._extract_buffer_view_data(view)
         total_offset = self.lower_buffer_byte_offset(
             view,
             indices,
             index_nodes=index_nodes,
-            bounds_policy=bounds_policy,
+            static_strides=static_strides,
+            descriptor=descriptor,
         )
         byte_ptr = self._llvm.ir_builder.gep(
             data,
             [total_offset],
             name="irx_buffer_index_byte_ptr",
         )
-        element_ptr_type = element_llvm_type.as_pointer()
         if byte_ptr.type == element_ptr_type:
             return byte_ptr
         return self._llvm.ir_builder.bitcast(
@@ -436,6 +1324,76 @@ class BufferVisitorMixin(VisitorMixinBase):
             name="irx_buffer_index_element_ptr",
         )
 
+    def _lower_contiguous_element_pointer(
+        self,
+        data: ir.Value,
+        offset_bytes: ir.Value,
+        indices: list[ir.Value],
+        element_ptr_type: ir.PointerType,
+        *,
+        index_nodes: list[astx.AST],
+        element_strides: tuple[int, ...],
+    ) -> ir.Value:
+        """
+        title: Lower an element pointer for a statically contiguous view.
+        parameters:
+          data:
+            type: ir.Value
+          offset_bytes:
+            type: ir.Value
+          indices:
+            type: list[ir.Value]
+          element_ptr_type:
+            type: ir.PointerType
+          index_nodes:
+            type: list[astx.AST]
+          element_strides:
+            type: tuple[int, Ellipsis]
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        origin = builder.gep(
+            data,
+            [offset_bytes],
+            name="irx_buffer_index_origin",
+        )
+        if origin.type != element_ptr_type:
+            origin = builder.bitcast(
+                origin,
+                element_ptr_type,
+                name="irx_buffer_index_origin_element",
+            )
+
+        linear: ir.Value | None = None
+        for axis, (index, index_node) in enumerate(
+            zip(indices, index_nodes, strict=True)
+        ):
+            term = self._normalize_buffer_index_value(index, index_node)
+            if element_strides[axis] != 1:
+                term = builder.mul(
+                    term,
+                    ir.Constant(self._llvm.INT64_TYPE, element_strides[axis]),
+                    name=f"irx_buffer_index_scaled_{axis}",
+                )
+            linear = (
+                term
+                if linear is None
+                else builder.add(
+                    linear,
+                    term,
+                    name=f"irx_buffer_index_linear_{axis}",
+                )
+            )
+        if linear is None:
+            return origin
+        return builder.gep(
+            origin,
+            [linear],
+            inbounds=True,
+            name="irx_buffer_index_element_ptr",
+        )
+
     def _lower_buffer_index_indices(
         self,
         indices: list[astx.AST],
@@ -459,6 +1417,43 @@ class BufferVisitorMixin(VisitorMixinBase):
             lowered_indices.append(value)
         return lowered_indices
 
+    def _lower_derived_buffer_view(
+        self,
+        node: (
+            astx.BufferViewSlice
+            | astx.BufferViewTranspose
+            | astx.BufferViewReshape
+        ),
+    ) -> None:
+        """
+        title: Lower one slice, transpose, or reshape buffer view.
+        parameters:
+          node:
+            type: >-
+              astx.BufferViewSlice | astx.BufferViewTranspose |
+              astx.BufferViewReshape
+        """
+        base_metadata = self._static_buffer_index_metadata(node.base)
+        metadata = self._static_buffer_index_metadata(node)
+        if base_metadata is None or metadata is None:
+            raise Exception(
+                "buffer view slicing requires static descriptor metadata"
+            )
+        self.visit_child(node.base)
+        base = safe_pop(self.result_stack)
+        if base is None or base.type != self._llvm.BUFFER_VIEW_TYPE:
+            raise Exception("buffer view slicing requires a buffer view base")
+        self.result_stack.append(
+            self._derived_view_value(
+                base,
+                shape=metadata.shape,
+                strides=metadata.strides,
+                offset_delta=metadata.offset_bytes
+                - base_metadata.offset_bytes,
+                flags=metadata.flags,
+            )
+        )
+
     @VisitorCore.visit.dispatch
     def visit(self, node: astx.BufferViewDescriptor) -> None:
         """
@@ -476,6 +1471,36 @@ class BufferVisitorMixin(VisitorMixinBase):
             self._buffer_view_value_from_metadata(metadata)
         )
 
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.BufferViewSlice) -> None:
+        """
+        title: Visit BufferViewSlice nodes.
+        parameters:
+          node:
+            type: astx.BufferViewSlice
+        """
+        self._lower_derived_buffer_view(node)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.BufferViewTranspose) -> None:
+        """
+        title: Visit BufferViewTranspose nodes.
+        parameters:
+          node:
+            type: astx.BufferViewTranspose
+        """
+        self._lower_derived_buffer_view(node)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.BufferViewReshape) -> None:
+        """
+        title: Visit BufferViewReshape nodes.
+        parameters:
+          node:
+            type: astx.BufferViewReshape
+        """
+        self._lower_derived_buffer_view(node)
+
     @VisitorCore.visit.dispatch
     def visit(self, node: astx.BufferViewIndex) -> None:
         """
@@ -484,18 +1509,29 @@ class BufferVisitorMixin(VisitorMixinBase):
           node:
             type: astx.BufferViewIndex
         """
-        self.visit_child(node.base)
-        view = safe_pop(self.result_stack)
+        descriptor = self._hoisted_buffer_descriptor(node.base)
+        if descriptor is not None:
+            view = descriptor.view
+        else:
+            self.visit_child(node.base)
+            view = safe_pop(self.result_stack)
         if view is None or view.type != self._llvm.BUFFER_VIEW_TYPE:
             raise Exception(
                 "buffer view indexed read requires a BufferViewType value"
             )
         indices = self._lower_buffer_index_indices(node.indices)
+        metadata = self._static_buffer_index_metadata(node.base)
         element_ptr = self.lower_buffer_element_pointer(
             view,
             indices,
             self._buffer_index_element_type(node),
             index_nodes=node.indices,
+            bounds_policy=node.bounds_policy,
+            static_strides=metadata.strides if metadata is not None else None,
+            static_flags=metadata.flags if metadata is not None else 0,
+            static_shape=metadata.shape if metadata is not None else None,
+            bounds_node=node,
+            descriptor=descriptor,
         )
         result = self._llvm.ir_builder.load(
             element_ptr,
@@ -511,19 +1547,30 @@ class BufferVisitorMixin(VisitorMixinBase):
           node:
             type: astx.BufferViewStore
         """
-        self.visit_child(node.base)
-        view = safe_pop(self.result_stack)
+        descriptor = self._hoisted_buffer_descriptor(node.base)
+        if descriptor is not None:
+            view = descriptor.view
+        else:
+            self.visit_child(node.base)
+            view = safe_pop(self.result_stack)
         if view is None or view.type != self._llvm.BUFFER_VIEW_TYPE:
             raise Exception(
                 "buffer view indexed store requires a BufferViewType value"
             )
         indices = self._lower_buffer_index_indices(node.indices)
         element_type = self._buffer_index_element_type(node)
+        metadata = self._static_buffer_index_metadata(node.base)
         element_ptr = self.lower_buffer_element_pointer(
             view,
             indices,
             element_type,
             index_nodes=node.indices,
+            bounds_policy=node.bounds_policy,
+            static_strides=metadata.strides if metadata is not None else None,
+            static_flags=metadata.flags if metadata is not None else 0,
+            static_shape=metadata.shape if metadata is not None else None,
+            bounds_node=node,
+            descriptor=descriptor,
         )
 
         self.visit_child(node.value)
@@ -37,6 +37,7 @@ from irx.builder.diagnostics import (
     require_semantic_metadata,
     resolved_ast_type_name,
 )
+from irx.builder.loop_metadata import attach_loop_metadata
 from irx.builder.protocols import VisitorMixinBase
 from irx.builder.runtime import safe_pop
 from irx.builder.runtime.assertions import (
@@ -129,6 +130,44 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
             function.append_basic_block(f"{prefix}.{role}") for role in roles
         )
 
+    def _attach_loop_hints(
+        self,
+        node: astx.AST,
+        *,
+        header: ir.Block,
+        exit_block: ir.Block,
+        independent: bool = False,
+    ) -> None:
+        """
+        title: Attach llvm.loop metadata to one loop that was just lowered.
+        summary: >-
+          Loop lowering appends the header first and nested blocks after its
+          exit block, so the loop is every block from header on except exit.
+        parameters:
+          node:
+            type: astx.AST
+          header:
+            type: ir.Block
+          exit_block:
+            type: ir.Block
+          independent:
+            type: bool
+        """
+        blocks = self._llvm.ir_builder.function.blocks
+        attach_loop_metadata(
+            self._llvm.module,
+            header,
+            [
+                block
+                for block in blocks[blocks.index(header) :]
+                if block is not exit_block
+            ],
+            getattr(
+                getattr(node, "semantic", None), "resolved_loop_hints", None
+            ),
+            independent=independent,
+        )
+
     def _assert_source_name(self, node: astx.AST) -> str:
         """
         title: Return one stable source label for assertion reporting.
@@ -168,7 +207,10 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
         name_hint: str,
     ) -> ir.Value:
         """
-        title: Return one pointer to one internal constant UTF-8 string.
+        title: Return one pointer to one interned constant UTF-8 string.
+        summary: >-
+          The string carries the IRx string header like every other string
+          the compiler emits.
         parameters:
           text:
             type: str
@@ -185,8 +227,6 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
         global_value = interned_globals.get(cache_key)
 
         if global_value is None:
-            encoded = text.encode("utf8") + b"\0"
-            array_type = ir.ArrayType(self._llvm.INT8_TYPE, len(encoded))
             normalized_hint = (
                 "".join(
                     character if character.isalnum() else "_"
@@ -204,27 +244,15 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 global_name = f"{normalized_hint}_{counter}"
             setattr(self, "_c_string_global_counter", counter + 1)
 
-            global_value = ir.GlobalVariable(
-                self._llvm.module,
-                array_type,
+            global_value = self._string_literal_global(
+                text.encode("utf8"),
                 name=global_name,
             )
-            global_value.linkage = "internal"
-            global_value.global_constant = True
-            global_value.initializer = ir.Constant(
-                array_type,
-                bytearray(encoded),
-            )
             interned_globals[cache_key] = global_value
             setattr(self, "_interned_c_strings", interned_globals)
 
-        return self._llvm.ir_builder.gep(
+        return self._string_literal_data(
             global_value,
-            [
-                ir.Constant(self._llvm.INT32_TYPE, 0),
-                ir.Constant(self._llvm.INT32_TYPE, 0),
-            ],
-            inbounds=True,
             name=f"{name_hint}_ptr",
         )
 
@@ -265,7 +293,11 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 or is_boolean_type(message_source_type),
             )
             int_fmt_gv = self._get_or_create_format_global(int_fmt)
-            return self._snprintf_heap(int_fmt_gv, [int_arg])
+            return self._snprintf_heap(
+                int_fmt_gv,
+                [int_arg],
+                temporary=True,
+            )
 
         if isinstance(
             message_type, (ir.HalfType, ir.FloatType, ir.DoubleType)
@@ -279,7 +311,11 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
             else:
                 float_arg = message_value
             float_fmt_gv = self._get_or_create_format_global("%.6f")
-            return self._snprintf_heap(float_fmt_gv, [float_arg])
+            return self._snprintf_heap(
+                float_fmt_gv,
+                [float_arg],
+                temporary=True,
+            )
 
         raise_lowering_error(
             "unsupported AssertStmt message lowering for type "
@@ -682,7 +718,8 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 target_addr,
                 is_constant=is_constant,
             ):
-                self._discard_child_results(node.body)
+                with self._arena_temporary_scope():
+                    self._discard_child_results(node.body)
             if not self._llvm.ir_builder.block.is_terminated:
                 self._llvm.ir_builder.branch(advance_bb)
 
@@ -833,6 +870,167 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
 
         return False
 
+    def _is_unit_literal(self, node: astx.AST) -> bool:
+        """
+        title: Return whether one expression is the integer literal one.
+        parameters:
+          node:
+            type: astx.AST
+        returns:
+          type: bool
+        """
+        return (
+            isinstance(node, astx.Literal)
+            and not isinstance(node, astx.LiteralBoolean)
+            and getattr(node, "value", None) == 1
+        )
+
+    def _for_count_update_is_increment(
+        self,
+        update: astx.AST,
+        *,
+        loop_symbol_key: str,
+    ) -> bool:
+        """
+        title: Return whether one for-count update adds one to the loop slot.
+        parameters:
+          update:
+            type: astx.AST
+          loop_symbol_key:
+            type: str
+        returns:
+          type: bool
+        """
+        if isinstance(update, astx.UnaryOp):
+            return update.op_code == "++" and self._is_loop_identifier(
+                update.operand,
+                loop_symbol_key,
+            )
+
+        value: astx.AST | None = None
+        if isinstance(update, astx.VariableAssignment):
+            if semantic_assignment_key(update, update.name) != loop_symbol_key:
+                return False
+            value = update.value
+        elif isinstance(update, astx.BinaryOp) and self._is_loop_identifier(
+            update.lhs,
+            loop_symbol_key,
+        ):
+            if update.op_code == "+=":
+                return self._is_unit_literal(update.rhs)
+            if update.op_code == "=":
+                value = update.rhs
+
+        if not isinstance(value, astx.BinaryOp) or value.op_code != "+":
+            return False
+        return (
+            self._is_loop_identifier(value.lhs, loop_symbol_key)
+            and self._is_unit_literal(value.rhs)
+        ) or (
+            self._is_unit_literal(value.lhs)
+            and self._is_loop_identifier(value.rhs, loop_symbol_key)
+        )
+
+    def _is_loop_identifier(
+        self, node: astx.AST, loop_symbol_key: str
+    ) -> bool:
+        """
+        title: Return whether one expression reads the loop variable.
+        parameters:
+          node:
+            type: astx.AST
+          loop_symbol_key:
+            type: str
+        returns:
+          type: bool
+        """
+        return (
+            isinstance(node, astx.Identifier)
+            and semantic_symbol_key(node, node.name) == loop_symbol_key
+        )
+
+    def _for_count_bounds_guards(
+        self,
+        node: astx.ForCountLoopStmt,
+        *,
+        loop_symbol_key: str,
+        var_addr: ir.Value,
+    ) -> dict[int, ir.Value]:
+        """
+        title: Hoist bounds checks for one canonical counting loop.
+        summary: >-
+          Only loops shaped like `i < end; ++i` qualify, where end has the
+          loop type and is a literal or an immutable binding, so it cannot
+          change between iterations.
+        parameters:
+          node:
+            type: astx.ForCountLoopStmt
+          loop_symbol_key:
+            type: str
+          var_addr:
+            type: ir.Value
+        returns:
+          type: dict[int, ir.Value]
+        """
+        condition = node.condition
+        if not (
+            isinstance(condition, astx.BinaryOp)
+            and condition.op_code == "<"
+            and self._is_loop_identifier(condition.lhs, loop_symbol_key)
+            and self._for_count_update_is_increment(
+                node.update,
+                loop_symbol_key=loop_symbol_key,
+            )
+        ):
+            return {}
+
+        end_node = condition.rhs
+        loop_type = node.initializer.type_
+        end_semantic = getattr(end_node, "semantic", None)
+        end_symbol = getattr(end_semantic, "resolved_symbol", None)
+        end_mutability = getattr(
+            getattr(end_symbol, "declaration", None),
+            "mutability",
+            None,
+        )
+        invariant_end = isinstance(end_node, astx.Literal) or (
+            isinstance(end_node, astx.Identifier)
+            and end_mutability is astx.MutabilityKind.constant
+        )
+        end_type = self._resolved_ast_type(end_node)
+        if not invariant_end or type(end_type) is not type(loop_type):
+            return {}
+        found: list[tuple[astx.AST, int]] = []
+        if (
+            not cast(Any, self)._collect_loop_index_extents(
+                node.body,
+                loop_symbol_key,
+                found,
+            )
+            or not found
+        ):
+            return {}
+
+        start_val = self._llvm.ir_builder.load(
+            var_addr,
+            name="for.count.start",
+        )
+        end_val = self._lower_typed_value(
+            end_node,
+            context="for-count loop bound",
+            target_type=loop_type,
+        )
+        return cast(
+            dict[int, ir.Value],
+            cast(Any, self)._hoist_loop_bounds_checks(
+                node.body,
+                variable_key=loop_symbol_key,
+                start=start_val,
+                end=end_val,
+                unsigned=is_unsigned_type(loop_type),
+            ),
+        )
+
     def _for_range_condition(
         self,
         current_value: ir.Value,
@@ -1070,6 +1268,7 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
           expr:
             type: astx.WhileStmt
         """
+        descriptors = cast(Any, self)._hoist_loop_buffer_descriptors(expr.body)
         cond_bb, body_bb, exit_bb = self._append_basic_blocks(
             "while",
             "cond",
@@ -1092,10 +1291,15 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
             continue_target=cond_bb,
         ):
             self._llvm.ir_builder.position_at_start(body_bb)
-            self._discard_child_results(expr.body)
+            with (
+                self._arena_temporary_scope(),
+                cast(Any, self)._buffer_descriptor_scope(descriptors),
+            ):
+                self._discard_child_results(expr.body)
             if not self._llvm.ir_builder.block.is_terminated:
                 self._llvm.ir_builder.branch(cond_bb)
 
+        self._attach_loop_hints(expr, header=cond_bb, exit_block=exit_bb)
         self._llvm.ir_builder.position_at_start(exit_bb)
 
     @VisitorCore.visit.dispatch
@@ -1124,6 +1328,12 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 "for-count loop initializer did not create storage",
                 node=node.initializer,
             )
+        bounds_guards = self._for_count_bounds_guards(
+            node,
+            loop_symbol_key=initializer_key,
+            var_addr=var_addr,
+        )
+        descriptors = cast(Any, self)._hoist_loop_buffer_descriptors(node.body)
 
         cond_bb, body_bb, update_bb, exit_bb = self._append_basic_blocks(
             "for.count",
@@ -1149,7 +1359,12 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 continue_target=update_bb,
             ):
                 self._llvm.ir_builder.position_at_start(body_bb)
-                self._discard_child_results(node.body)
+                with (
+                    self._arena_temporary_scope(),
+                    cast(Any, self)._buffer_bounds_guard_scope(bounds_guards),
+                    cast(Any, self)._buffer_descriptor_scope(descriptors),
+                ):
+                    self._discard_child_results(node.body)
                 if not self._llvm.ir_builder.block.is_terminated:
                     self._llvm.ir_builder.branch(update_bb)
 
@@ -1166,6 +1381,7 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 self._llvm.ir_builder.store(update_val, var_addr)
             self._llvm.ir_builder.branch(cond_bb)
 
+            self._attach_loop_hints(node, header=cond_bb, exit_block=exit_bb)
             self._llvm.ir_builder.position_at_start(exit_bb)
         finally:
             if had_previous:
@@ -1234,6 +1450,22 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                 unsigned=unsigned_loop,
             )
 
+        variable_key = semantic_symbol_key(node.variable, node.variable.name)
+        bounds_guards: dict[int, ir.Value] = {}
+        if (
+            isinstance(step_val, ir.Constant)
+            and is_int_type(step_val.type)
+            and step_val.constant == 1
+        ):
+            bounds_guards = cast(Any, self)._hoist_loop_bounds_checks(
+                node.body,
+                variable_key=variable_key,
+                start=start_val,
+                end=end_val,
+                unsigned=unsigned_loop,
+            )
+        descriptors = cast(Any, self)._hoist_loop_buffer_descriptors(node.body)
+
         cond_bb, body_bb, step_bb, exit_bb = self._append_basic_blocks(
             "for.range",
             "cond",
@@ -1243,7 +1475,6 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
         )
         self._llvm.ir_builder.branch(cond_bb)
 
-        variable_key = semantic_symbol_key(node.variable, node.variable.name)
         self._llvm.ir_builder.position_at_start(cond_bb)
         current_value = self._llvm.ir_builder.load(
             var_addr, node.variable.name
@@ -1270,7 +1501,12 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
                     node.variable.mutability == astx.MutabilityKind.constant
                 ),
             ):
-                self._discard_child_results(node.body)
+                with (
+                    self._arena_temporary_scope(),
+                    cast(Any, self)._buffer_bounds_guard_scope(bounds_guards),
+                    cast(Any, self)._buffer_descriptor_scope(descriptors),
+                ):
+                    self._discard_child_results(node.body)
             if not self._llvm.ir_builder.block.is_terminated:
                 self._llvm.ir_builder.branch(step_bb)
 
@@ -1287,6 +1523,7 @@ class ControlFlowVisitorMixin(VisitorMixinBase):
         self._llvm.ir_builder.store(next_value, var_addr)
         self._llvm.ir_builder.branch(cond_bb)
 
+        self._attach_loop_hints(node, header=cond_bb, exit_block=exit_bb)
         self._llvm.ir_builder.position_at_start(exit_bb)
 
     @VisitorCore.visit.dispatch
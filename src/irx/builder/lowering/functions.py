@@ -19,7 +19,7 @@ from irx.analysis.resolved_nodes import (
     ReturnResolution,
     SemanticFunction,
 )
-from irx.analysis.types import display_type_name
+from irx.analysis.types import display_type_name, is_string_type
 from irx.builder.core import (
     VisitorCore,
     semantic_symbol_key,
@@ -602,6 +602,10 @@ class FunctionVisitorMixin(VisitorMixinBase):
             self._llvm.ir_builder.call(callee_f, llvm_args)
             return
         result = self._llvm.ir_builder.call(callee_f, llvm_args, "calltmp")
+        if resolution.signature.is_extern and is_string_type(
+            resolution.signature.return_type
+        ):
+            result = self._import_foreign_string(result)
         self.result_stack.append(result)
 
     @VisitorCore.visit.dispatch
@@ -885,7 +889,8 @@ class FunctionVisitorMixin(VisitorMixinBase):
                     )
                 self.named_values[symbol_key] = alloca
 
-            self.visit_child(node.body)
+            with self._arena_temporary_scope():
+                self.visit_child(node.body)
             if not self._llvm.ir_builder.block.is_terminated:
                 return_type = fn.function_type.return_type
                 if isinstance(return_type, ir.VoidType):
@@ -930,6 +935,9 @@ class FunctionVisitorMixin(VisitorMixinBase):
           node:
             type: astx.FunctionReturn
         """
+        if self._fused_generator_stack:
+            cast(Any, self)._emit_fused_generator_stop(node)
+            return
         if self._current_generator_frame_ptr is not None:
             cast(Any, self)._emit_generator_stop(node)
             return
@@ -16,6 +16,7 @@ from llvmlite import ir
 
 from irx import astx
 from irx.analysis.resolved_nodes import (
+    CallResolution,
     ResolvedGeneratorFunction,
     ResolvedIteration,
     ResolvedYield,
@@ -31,10 +32,10 @@ from irx.builder.diagnostics import (
 )
 from irx.builder.protocols import VisitorMixinBase
 from irx.builder.runtime import safe_pop
+from irx.builder.state import FusedGeneratorTargets
 from irx.diagnostics import DiagnosticCodes
 from irx.typecheck import typechecked
 
-GENERATOR_FRAME_ALLOCATION_BYTES = 4096
 GENERATOR_STATE_FIELD_INDEX = 0
 GENERATOR_EXHAUSTED_FIELD_INDEX = 1
 
@@ -373,6 +374,9 @@ class GeneratorVisitorMixin(VisitorMixinBase):
           value:
             type: astx.AST | None
         """
+        if self._fused_generator_stack:
+            self._lower_fused_generator_suspend(node, value)
+            return
         resolution = self._semantic_yield_resolution(node)
         frame_ptr = self._current_generator_frame_ptr
         out_ptr = self._current_generator_out_ptr
@@ -408,6 +412,68 @@ class GeneratorVisitorMixin(VisitorMixinBase):
         )
         self._llvm.ir_builder.ret(ir.Constant(self._llvm.BOOLEAN_TYPE, 1))
 
+    def _lower_fused_generator_suspend(
+        self,
+        node: astx.AST,
+        value: astx.AST | None,
+    ) -> None:
+        """
+        title: Lower one yield site of a generator fused into its loop.
+        summary: >-
+          The yielded value goes straight into the loop element slot, the
+          resume state is recorded, and control jumps to the loop body. Code
+          after the yield continues in a fresh resume block that the loop
+          advance block dispatches to.
+        parameters:
+          node:
+            type: astx.AST
+          value:
+            type: astx.AST | None
+        """
+        resolution = self._semantic_yield_resolution(node)
+        targets = self._fused_generator_stack[-1]
+        if value is not None:
+            self.visit_child(value)
+            yielded = require_lowered_value(
+                safe_pop(self.result_stack),
+                node=value,
+                context="yield expression",
+            )
+            yielded = self._cast_ast_value(
+                yielded,
+                source_type=self._resolved_ast_type(value),
+                target_type=resolution.expected_type,
+            )
+            self._llvm.ir_builder.store(yielded, targets.yielded_addr)
+
+        next_state = len(targets.resume_blocks) + 1
+        self._llvm.ir_builder.store(
+            ir.Constant(self._llvm.INT32_TYPE, next_state),
+            targets.state_addr,
+        )
+        self._llvm.ir_builder.branch(targets.body_target)
+        resume_block = self._llvm.ir_builder.function.append_basic_block(
+            f"for.generator.resume.{next_state}"
+        )
+        targets.resume_blocks.append(resume_block)
+        self._llvm.ir_builder.position_at_start(resume_block)
+
+    def _emit_fused_generator_stop(self, node: astx.AST | None = None) -> None:
+        """
+        title: Leave the consuming loop when a fused generator finishes.
+        parameters:
+          node:
+            type: astx.AST | None
+        """
+        if not self._fused_generator_stack:
+            raise_lowering_internal_error(
+                "fused generator stop emitted outside a fused loop",
+                node=node,
+            )
+        targets = self._fused_generator_stack[-1]
+        self._emit_active_cleanups(targets.cleanup_depth)
+        self._llvm.ir_builder.branch(targets.exit_target)
+
     def _lower_generator_body_from_state(
         self,
         body: astx.Block,
@@ -532,6 +598,30 @@ class GeneratorVisitorMixin(VisitorMixinBase):
             self._current_generator_out_ptr = saved_out_ptr
             self._current_generator_next_state = saved_next_state
 
+    def _generator_frame_size(
+        self,
+        frame_type: ir.IdentifiedStructType,
+    ) -> ir.Value:
+        """
+        title: Return the allocation size of one generator frame layout.
+        parameters:
+          frame_type:
+            type: ir.IdentifiedStructType
+        returns:
+          type: ir.Value
+        """
+        size_type = self._llvm.SIZE_T_TYPE or self._llvm.INT64_TYPE
+        size_ptr = self._llvm.ir_builder.gep(
+            ir.Constant(frame_type.as_pointer(), None),
+            [ir.Constant(self._llvm.INT32_TYPE, 1)],
+            name="generator_frame_size_ptr",
+        )
+        return self._llvm.ir_builder.ptrtoint(
+            size_ptr,
+            size_type,
+            name="generator_frame_size",
+        )
+
     def _allocate_generator_frame(
         self,
         frame_type: ir.IdentifiedStructType,
@@ -545,15 +635,9 @@ class GeneratorVisitorMixin(VisitorMixinBase):
           type: ir.Value
         """
         malloc = self._malloc_function()
-        size_type = self._llvm.SIZE_T_TYPE or self._llvm.INT64_TYPE
         raw = self._llvm.ir_builder.call(
             malloc,
-            [
-                ir.Constant(
-                    size_type,
-                    GENERATOR_FRAME_ALLOCATION_BYTES,
-                )
-            ],
+            [self._generator_frame_size(frame_type)],
             name="generator_alloc",
         )
         return self._llvm.ir_builder.bitcast(
@@ -562,29 +646,25 @@ class GeneratorVisitorMixin(VisitorMixinBase):
             name="generator_frame",
         )
 
-    def _lower_generator_factory(
+    def _initialize_generator_frame(
         self,
-        generator: ResolvedGeneratorFunction,
-    ) -> ir.Function:
+        frame_ptr: ir.Value,
+        slots: dict[str, int],
+        function: SemanticFunction,
+        args: list[ir.Value],
+    ) -> None:
         """
-        title: Emit the public generator factory function.
+        title: Reset one generator frame and capture its call arguments.
         parameters:
-          generator:
-            type: ResolvedGeneratorFunction
-        returns:
-          type: ir.Function
+          frame_ptr:
+            type: ir.Value
+          slots:
+            type: dict[str, int]
+          function:
+            type: SemanticFunction
+          args:
+            type: list[ir.Value]
         """
-        function = generator.function
-        factory = cast(Any, self)._declare_semantic_function(function)
-        if function.symbol_id in self._emitted_function_bodies:
-            return factory
-
-        frame_type, slots = self._generator_frame_layout(generator)
-        resume = self._declare_generator_resume(generator)
-        entry = factory.append_basic_block("entry")
-        self._llvm.ir_builder = ir.IRBuilder(entry)
-        frame_ptr = self._allocate_generator_frame(frame_type)
-
         state_addr = self._generator_field_address(
             frame_ptr,
             GENERATOR_STATE_FIELD_INDEX,
@@ -604,7 +684,7 @@ class GeneratorVisitorMixin(VisitorMixinBase):
             exhausted_addr,
         )
 
-        for llvm_arg, symbol in zip(factory.args, function.args):
+        for llvm_arg, symbol in zip(args, function.args):
             field_index = slots.get(symbol.symbol_id)
             if field_index is None:
                 continue
@@ -615,6 +695,35 @@ class GeneratorVisitorMixin(VisitorMixinBase):
             )
             self._llvm.ir_builder.store(llvm_arg, field_addr)
 
+    def _lower_generator_factory(
+        self,
+        generator: ResolvedGeneratorFunction,
+    ) -> ir.Function:
+        """
+        title: Emit the public generator factory function.
+        parameters:
+          generator:
+            type: ResolvedGeneratorFunction
+        returns:
+          type: ir.Function
+        """
+        function = generator.function
+        factory = cast(Any, self)._declare_semantic_function(function)
+        if function.symbol_id in self._emitted_function_bodies:
+            return factory
+
+        frame_type, slots = self._generator_frame_layout(generator)
+        resume = self._declare_generator_resume(generator)
+        entry = factory.append_basic_block("entry")
+        self._llvm.ir_builder = ir.IRBuilder(entry)
+        frame_ptr = self._allocate_generator_frame(frame_type)
+        self._initialize_generator_frame(
+            frame_ptr,
+            slots,
+            function,
+            list(factory.args),
+        )
+
         raw_frame = self._llvm.ir_builder.bitcast(
             frame_ptr,
             self._llvm.OPAQUE_POINTER_TYPE,
@@ -663,18 +772,143 @@ class GeneratorVisitorMixin(VisitorMixinBase):
         self.result_stack.append(factory)
         return factory
 
-    def _lower_generator_for_in_loop(
+    def _local_generator_call(
+        self,
+        iterable: astx.AST,
+    ) -> tuple[ResolvedGeneratorFunction, CallResolution] | None:
+        """
+        title: Return the generator created directly by one loop iterable.
+        summary: >-
+          A generator created by a call in the for-in header is owned by that
+          loop alone, so its frame can live in the consuming function.
+        parameters:
+          iterable:
+            type: astx.AST
+        returns:
+          type: tuple[ResolvedGeneratorFunction, CallResolution] | None
+        """
+        if not isinstance(iterable, astx.FunctionCall):
+            return None
+        resolution = cast(Any, self)._semantic_call_resolution(iterable)
+        definition = resolution.callee.function.definition
+        if definition is None:
+            return None
+        generator = self._semantic_generator_function(definition)
+        if generator is None:
+            return None
+        return generator, resolution
+
+    def _can_fuse_generator(
+        self,
+        generator: ResolvedGeneratorFunction,
+    ) -> bool:
+        """
+        title: Return whether one generator can be fused into its loop.
+        parameters:
+          generator:
+            type: ResolvedGeneratorFunction
+        returns:
+          type: bool
+        """
+        definition = generator.function.definition
+        if definition is None:
+            return False
+        if any(
+            targets.symbol_id == generator.function.symbol_id
+            for targets in self._fused_generator_stack
+        ):
+            return False
+        top_level_ids = {id(child) for child in definition.body.nodes}
+        return all(
+            id(yield_node) in top_level_ids
+            for yield_node in generator.yield_nodes
+        )
+
+    def _lower_generator_call_arguments(
+        self,
+        call: astx.FunctionCall,
+        resolution: CallResolution,
+    ) -> list[ir.Value]:
+        """
+        title: Lower the explicit and default arguments of a generator call.
+        parameters:
+          call:
+            type: astx.FunctionCall
+          resolution:
+            type: CallResolution
+        returns:
+          type: list[ir.Value]
+        """
+        visitor = cast(Any, self)
+        llvm_args = visitor._lower_call_arguments(call, resolution)
+        llvm_args.extend(
+            visitor._lower_default_call_arguments(
+                function=resolution.callee.function,
+                explicit_arg_values=llvm_args,
+                label=f"call to '{call.fn}'",
+            )
+        )
+        return cast(list[ir.Value], llvm_args)
+
+    def _lower_stack_generator_frame(
+        self,
+        call: astx.FunctionCall,
+        generator: ResolvedGeneratorFunction,
+        resolution: CallResolution,
+    ) -> tuple[ir.Value, ir.Function]:
+        """
+        title: Create a loop-local generator frame in the current function.
+        parameters:
+          call:
+            type: astx.FunctionCall
+          generator:
+            type: ResolvedGeneratorFunction
+          resolution:
+            type: CallResolution
+        returns:
+          type: tuple[ir.Value, ir.Function]
+        """
+        function = generator.function
+        frame_type, slots = self._generator_frame_layout(generator)
+        resume = self._declare_generator_resume(generator)
+        llvm_args = self._lower_generator_call_arguments(call, resolution)
+        frame_ptr = self.create_entry_block_alloca(
+            f"{function.name}_frame",
+            frame_type,
+        )
+        self._initialize_generator_frame(frame_ptr, slots, function, llvm_args)
+        raw_frame = self._llvm.ir_builder.bitcast(
+            frame_ptr,
+            self._llvm.OPAQUE_POINTER_TYPE,
+            name="generator_frame",
+        )
+        return raw_frame, resume
+
+    def _lower_generator_loop_body(
         self,
         node: astx.ForInLoopStmt,
         iteration: ResolvedIteration,
+        *,
+        yielded_addr: ir.Value,
+        body_bb: ir.Block,
+        advance_bb: ir.Block,
+        exit_bb: ir.Block,
     ) -> None:
         """
-        title: Lower one for-in loop over a generator value.
+        title: Lower the user body of one generator-driven for-in loop.
         parameters:
           node:
             type: astx.ForInLoopStmt
           iteration:
             type: ResolvedIteration
+          yielded_addr:
+            type: ir.Value
+          body_bb:
+            type: ir.Block
+          advance_bb:
+            type: ir.Block
+          exit_bb:
+            type: ir.Block
         """
         target_name = getattr(node.target, "name", "item")
         target_type = (
@@ -682,19 +916,6 @@ class GeneratorVisitorMixin(VisitorMixinBase):
             if iteration.target_symbol is not None
             else iteration.element_type
         )
-        llvm_element_type = self._llvm_type_for_ast_type(
-            iteration.element_type
-        )
-        if llvm_element_type is None or isinstance(
-            llvm_element_type,
-            ir.VoidType,
-        ):
-            raise_lowering_error(
-                "generator element type is not lowerable",
-                node=node.iterable,
-                code=DiagnosticCodes.LOWERING_TYPE_MISMATCH,
-            )
-
         llvm_target_type = self._llvm_type_for_ast_type(target_type)
         if llvm_target_type is None or isinstance(
             llvm_target_type,
@@ -705,61 +926,10 @@ class GeneratorVisitorMixin(VisitorMixinBase):
                 node=node.target,
                 code=DiagnosticCodes.LOWERING_TYPE_MISMATCH,
             )
-
-        self.visit_child(node.iterable)
-        generator_value = require_lowered_value(
-            safe_pop(self.result_stack),
-            node=node.iterable,
-            context="generator iterable",
-        )
-        frame_value = self._llvm.ir_builder.extract_value(
-            generator_value,
-            0,
-            name="generator_frame",
-        )
-        resume_raw = self._llvm.ir_builder.extract_value(
-            generator_value,
-            1,
-            name="generator_resume_raw",
-        )
-        resume_type = ir.FunctionType(
-            self._llvm.BOOLEAN_TYPE,
-            [self._llvm.OPAQUE_POINTER_TYPE, llvm_element_type.as_pointer()],
-        )
-        resume = self._llvm.ir_builder.bitcast(
-            resume_raw,
-            resume_type.as_pointer(),
-            name="generator_resume",
-        )
-
         target_addr = self.create_entry_block_alloca(
             target_name,
             llvm_target_type,
         )
-        yielded_addr = self.create_entry_block_alloca(
-            f"{target_name}_yielded",
-            llvm_element_type,
-        )
-
-        cond_bb, body_bb, advance_bb, exit_bb = cast(
-            Any,
-            self,
-        )._append_basic_blocks(
-            "for.generator",
-            "cond",
-            "body",
-            "advance",
-            "exit",
-        )
-        self._llvm.ir_builder.branch(cond_bb)
-
-        self._llvm.ir_builder.position_at_start(cond_bb)
-        has_value = self._llvm.ir_builder.call(
-            resume,
-            [frame_value, yielded_addr],
-            name="generator_has_value",
-        )
-        self._llvm.ir_builder.cbranch(has_value, body_bb, exit_bb)
 
         target_key = semantic_symbol_key(node.target, target_name)
         is_constant = not isinstance(
@@ -791,10 +961,234 @@ class GeneratorVisitorMixin(VisitorMixinBase):
                 target_addr,
                 is_constant=is_constant,
             ):
-                cast(Any, self)._discard_child_results(node.body)
+                with self._arena_temporary_scope():
+                    cast(Any, self)._discard_child_results(node.body)
             if not self._llvm.ir_builder.block.is_terminated:
                 self._llvm.ir_builder.branch(advance_bb)
 
+    def _lower_fused_generator_for_in_loop(
+        self,
+        node: astx.ForInLoopStmt,
+        iteration: ResolvedIteration,
+        generator: ResolvedGeneratorFunction,
+        resolution: CallResolution,
+        yielded_addr: ir.Value,
+    ) -> None:
+        """
+        title: Lower a generator body directly into its consuming loop.
+        summary: >-
+          The generator statements are emitted inline in the loop header.
+          Each yield jumps to the loop body and the advance block switches on
+          the recorded state to the code after that yield, so no frame is
+          allocated and no resume function is called.
+        parameters:
+          node:
+            type: astx.ForInLoopStmt
+          iteration:
+            type: ResolvedIteration
+          generator:
+            type: ResolvedGeneratorFunction
+          resolution:
+            type: CallResolution
+          yielded_addr:
+            type: ir.Value
+        """
+        function = generator.function
+        definition = function.definition
+        if definition is None:
+            raise_lowering_internal_error(
+                "generator fusion requires a function definition",
+                node=function.prototype,
+            )
+        call = cast(astx.FunctionCall, node.iterable)
+        llvm_args = self._lower_generator_call_arguments(call, resolution)
+        target_name = getattr(node.target, "name", "item")
+        state_addr = self.create_entry_block_alloca(
+            f"{target_name}_generator_state",
+            self._llvm.INT32_TYPE,
+        )
+        body_bb, advance_bb, exit_bb = cast(
+            Any,
+            self,
+        )._append_basic_blocks(
+            "for.generator",
+            "body",
+            "advance",
+            "exit",
+        )
+
+        saved_named_values = self.named_values.copy()
+        saved_const_vars = set(self.const_vars)
+        targets = FusedGeneratorTargets(
+            symbol_id=function.symbol_id,
+            yielded_addr=yielded_addr,
+            state_addr=state_addr,
+            body_target=body_bb,
+            exit_target=exit_bb,
+            resume_blocks=[],
+            cleanup_depth=len(self.cleanup_stack),
+        )
+        self._fused_generator_stack.append(targets)
+        try:
+            # A generator fused into its own resume function must not reuse
+            # the enclosing frame slots for its locals.
+            for symbol in self._collect_generator_local_symbols(
+                definition.body
+            ):
+                self.named_values.pop(symbol.symbol_id, None)
+            for llvm_arg, symbol in zip(llvm_args, function.args):
+                arg_addr = self.create_entry_block_alloca(
+                    f"{function.name}_{symbol.name}",
+                    llvm_arg.type,
+                )
+                self._llvm.ir_builder.store(llvm_arg, arg_addr)
+                self.named_values[symbol.symbol_id] = arg_addr
+            for statement in definition.body.nodes:
+                if self._llvm.ir_builder.block.is_terminated:
+                    break
+                cast(Any, self)._discard_child_results(statement)
+            if not self._llvm.ir_builder.block.is_terminated:
+                self._emit_fused_generator_stop(definition)
+        finally:
+            self._fused_generator_stack.pop()
+            self.named_values = saved_named_values
+            self.const_vars = saved_const_vars
+
+        self._llvm.ir_builder.position_at_start(advance_bb)
+        state_value = self._llvm.ir_builder.load(
+            state_addr,
+            name=f"{target_name}_generator_state_value",
+        )
+        switch = self._llvm.ir_builder.switch(state_value, exit_bb)
+        for index, resume_block in enumerate(targets.resume_blocks, start=1):
+            switch.add_case(
+                ir.Constant(self._llvm.INT32_TYPE, index),
+                resume_block,
+            )
+
+        self._lower_generator_loop_body(
+            node,
+            iteration,
+            yielded_addr=yielded_addr,
+            body_bb=body_bb,
+            advance_bb=advance_bb,
+            exit_bb=exit_bb,
+        )
+        self._llvm.ir_builder.position_at_start(exit_bb)
+
+    def _lower_generator_for_in_loop(
+        self,
+        node: astx.ForInLoopStmt,
+        iteration: ResolvedIteration,
+    ) -> None:
+        """
+        title: Lower one for-in loop over a generator value.
+        summary: >-
+          Generators created in the loop header are fused into the loop when
+          their yields are top-level statements, or otherwise driven through a
+          stack frame sized from the generator layout. Generator values that
+          may escape keep the heap frame and indirect resume call.
+        parameters:
+          node:
+            type: astx.ForInLoopStmt
+          iteration:
+            type: ResolvedIteration
+        """
+        target_name = getattr(node.target, "name", "item")
+        llvm_element_type = self._llvm_type_for_ast_type(
+            iteration.element_type
+        )
+        if llvm_element_type is None or isinstance(
+            llvm_element_type,
+            ir.VoidType,
+        ):
+            raise_lowering_error(
+                "generator element type is not lowerable",
+                node=node.iterable,
+                code=DiagnosticCodes.LOWERING_TYPE_MISMATCH,
+            )
+
+        yielded_addr = self.create_entry_block_alloca(
+            f"{target_name}_yielded",
+            llvm_element_type,
+        )
+        local_call = self._local_generator_call(node.iterable)
+        if local_call is not None and self._can_fuse_generator(local_call[0]):
+            self._lower_fused_generator_for_in_loop(
+                node,
+                iteration,
+                local_call[0],
+                local_call[1],
+                yielded_addr,
+            )
+            return
+
+        resume: ir.Value
+        if local_call is not None:
+            frame_value, resume = self._lower_stack_generator_frame(
+                cast(astx.FunctionCall, node.iterable),
+                local_call[0],
+                local_call[1],
+            )
+        else:
+            self.visit_child(node.iterable)
+            generator_value = require_lowered_value(
+                safe_pop(self.result_stack),
+                node=node.iterable,
+                context="generator iterable",
+            )
+            frame_value = self._llvm.ir_builder.extract_value(
+                generator_value,
+                0,
+                name="generator_frame",
+            )
+            resume_raw = self._llvm.ir_builder.extract_value(
+                generator_value,
+                1,
+                name="generator_resume_raw",
+            )
+            resume_type = ir.FunctionType(
+                self._llvm.BOOLEAN_TYPE,
+                [
+                    self._llvm.OPAQUE_POINTER_TYPE,
+                    llvm_element_type.as_pointer(),
+                ],
+            )
+            resume = self._llvm.ir_builder.bitcast(
+                resume_raw,
+                resume_type.as_pointer(),
+                name="generator_resume",
+            )
+
+        cond_bb, body_bb, advance_bb, exit_bb = cast(
+            Any,
+            self,
+        )._append_basic_blocks(
+            "for.generator",
+            "cond",
+            "body",
+            "advance",
+            "exit",
+        )
+        self._llvm.ir_builder.branch(cond_bb)
+
+        self._llvm.ir_builder.position_at_start(cond_bb)
+        has_value = self._llvm.ir_builder.call(
+            resume,
+            [frame_value, yielded_addr],
+            name="generator_has_value",
+        )
+        self._llvm.ir_builder.cbranch(has_value, body_bb, exit_bb)
+
+        self._lower_generator_loop_body(
+            node,
+            iteration,
+            yielded_addr=yielded_addr,
+            body_bb=body_bb,
+            advance_bb=advance_bb,
+            exit_bb=exit_bb,
+        )
+
         self._llvm.ir_builder.position_at_start(advance_bb)
         self._llvm.ir_builder.branch(cond_bb)
         self._llvm.ir_builder.position_at_start(exit_bb)
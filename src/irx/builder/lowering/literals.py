@@ -57,28 +57,12 @@ class LiteralVisitorMixin(VisitorMixinBase):
         returns:
           type: ir.Value
         """
-        empty_str_type = ir.ArrayType(self._llvm.INT8_TYPE, 1)
         global_name = f"class_init_empty_str_{name_hint}"
         global_value = self._llvm.module.globals.get(global_name)
-        if global_value is None:
-            global_value = ir.GlobalVariable(
-                self._llvm.module,
-                empty_str_type,
-                name=global_name,
-            )
-            global_value.linkage = "internal"
-            global_value.global_constant = True
-            global_value.initializer = ir.Constant(
-                empty_str_type,
-                bytearray(b"\0"),
-            )
-        return self._llvm.ir_builder.gep(
+        if not isinstance(global_value, ir.GlobalVariable):
+            global_value = self._string_literal_global(b"", name=global_name)
+        return self._string_literal_data(
             global_value,
-            [
-                ir.Constant(self._llvm.INT32_TYPE, 0),
-                ir.Constant(self._llvm.INT32_TYPE, 0),
-            ],
-            inbounds=True,
             name=f"{name_hint}_empty",
         )
 
@@ -400,30 +384,12 @@ class LiteralVisitorMixin(VisitorMixinBase):
           expr:
             type: astx.LiteralUTF8Char
         """
-        string_value = expr.value
-        utf8_bytes = string_value.encode("utf-8")
-        string_length = len(utf8_bytes)
-
-        string_data_type = ir.ArrayType(
-            self._llvm.INT8_TYPE, string_length + 1
-        )
-        string_data = ir.GlobalVariable(
-            self._llvm.module,
-            string_data_type,
-            name=f"str_ascii_{id(expr)}",
-        )
-        string_data.linkage = "internal"
-        string_data.global_constant = True
-        string_data.initializer = ir.Constant(
-            string_data_type, bytearray(utf8_bytes + b"\0")
-        )
-
-        ptr = self._llvm.ir_builder.gep(
-            string_data,
-            [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), 0)],
-            inbounds=True,
+        self.result_stack.append(
+            self._string_literal_pointer(
+                expr.value.encode("utf-8"),
+                name=f"str_ascii_{id(expr)}",
+            )
         )
-        self.result_stack.append(ptr)
 
     @VisitorCore.visit.dispatch
     def visit(self, expr: astx.LiteralUTF8String) -> None:
@@ -434,28 +400,12 @@ class LiteralVisitorMixin(VisitorMixinBase):
             type: astx.LiteralUTF8String
         """
         string_value = expr.value
-        utf8_bytes = string_value.encode("utf-8")
-        string_length = len(utf8_bytes)
-
-        string_data_type = ir.ArrayType(
-            self._llvm.INT8_TYPE, string_length + 1
-        )
-        unique_name = f"str_utf8_{abs(hash(string_value))}_{id(expr)}"
-        string_data = ir.GlobalVariable(
-            self._llvm.module, string_data_type, name=unique_name
-        )
-        string_data.linkage = "internal"
-        string_data.global_constant = True
-        string_data.initializer = ir.Constant(
-            string_data_type, bytearray(utf8_bytes + b"\0")
-        )
-
-        data_ptr = self._llvm.ir_builder.gep(
-            string_data,
-            [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), 0)],
-            inbounds=True,
+        self.result_stack.append(
+            self._string_literal_pointer(
+                string_value.encode("utf-8"),
+                name=f"str_utf8_{abs(hash(string_value))}_{id(expr)}",
+            )
         )
-        self.result_stack.append(data_ptr)
 
     @VisitorCore.visit.dispatch
     def visit(self, expr: astx.LiteralString) -> None:
@@ -232,10 +232,6 @@ class ModuleVisitorMixin(VisitorMixinBase):
                     f"codegen: Unknown LLVM type for static class field "
                     f"'{storage.member.name}'."
                 )
-            initializer = self._literal_global_initializer(
-                static_initializer.value,
-                llvm_type,
-            )
             existing = self._llvm.module.globals.get(storage.global_name)
             if existing is None:
                 global_var = ir.GlobalVariable(
@@ -245,9 +241,16 @@ class ModuleVisitorMixin(VisitorMixinBase):
                 )
             else:
                 global_var = existing
-            global_var.linkage = "internal"
             global_var.global_constant = storage.member.is_constant
-            global_var.initializer = initializer
+            if self._lowering_module_interface:
+                # The interface's object owns the storage.
+                global_var.linkage = "external"
+                continue
+            global_var.linkage = "internal"
+            global_var.initializer = self._literal_global_initializer(
+                static_initializer.value,
+                llvm_type,
+            )
 
         dispatch_table = self._dispatch_table_initializer(node)
         if dispatch_table is not None:
@@ -265,6 +268,8 @@ class ModuleVisitorMixin(VisitorMixinBase):
             dispatch_global.global_constant = True
             dispatch_global.initializer = dispatch_initializer
 
+        if self._lowering_module_interface:
+            return
         for method in node.methods:
             if (
                 astx.is_template_node(method.prototype)
@@ -0,0 +1,686 @@
+# mypy: disable-error-code=no-redef
+# mypy: disable-error-code=untyped-decorator
+# mypy: disable-error-code=attr-defined
+
+"""
+title: Parallel loop visitor mixin for llvmliteir.
+summary: >-
+  Lower ParallelForRangeLoopStmt by outlining the loop body into an internal
+  function that runs one block of normalized iterations, then handing that
+  function to irx_parallel_for. Enclosing variables the body reads are passed
+  by address through one capture struct. Each reduction accumulates in a
+  private variable per block and is folded into one partial slot per worker;
+  the caller combines the partials in worker order after the loop.
+"""
+
+from __future__ import annotations
+
+import math
+
+from collections.abc import Callable
+from typing import Any, cast
+
+from llvmlite import ir
+
+from irx import astx
+from irx.analysis.resolved_nodes import (
+    ResolvedParallelLoop,
+    ResolvedParallelReduction,
+    SemanticSymbol,
+)
+from irx.analysis.types import is_unsigned_type
+from irx.builder.core import VisitorCore, semantic_symbol_key
+from irx.builder.diagnostics import (
+    raise_lowering_error,
+    require_semantic_metadata,
+)
+from irx.builder.lowering.buffer import _AST_NON_CHILD_FIELDS
+from irx.builder.protocols import VisitorMixinBase
+from irx.builder.runtime.parallel.feature import (
+    PARALLEL_MAX_THREADS,
+    PARALLEL_SCHEDULE_CODES,
+    parallel_body_type,
+)
+from irx.builder.types import is_fp_type
+from irx.builder.vector import emit_add
+from irx.diagnostics import DiagnosticCodes
+from irx.typecheck import typechecked
+
+# Capture struct fields that precede the captured variable addresses.
+_CAPTURE_START_FIELD = 0
+_CAPTURE_PARTIALS_FIELD = 1
+_CAPTURE_FIRST_VARIABLE_FIELD = 2
+
+
+@typechecked
+class ParallelLoopVisitorMixin(VisitorMixinBase):
+    def _collect_parallel_captures(
+        self,
+        node: astx.AST,
+        found: dict[str, ir.Value],
+    ) -> None:
+        """
+        title: Collect enclosing variable addresses referenced by a body.
+        summary: >-
+          Symbols bound to module globals need no capture; symbols declared
+          inside the body have no binding yet and are skipped.
+        parameters:
+          node:
+            type: astx.AST
+          found:
+            type: dict[str, ir.Value]
+        """
+        semantic = getattr(node, "semantic", None)
+        assignment = getattr(semantic, "resolved_assignment", None)
+        for symbol in (
+            getattr(semantic, "resolved_symbol", None),
+            getattr(assignment, "symbol", None),
+        ):
+            if not isinstance(symbol, SemanticSymbol):
+                continue
+            binding = self.named_values.get(symbol.symbol_id)
+            if binding is not None and not isinstance(binding, ir.GlobalValue):
+                found.setdefault(symbol.symbol_id, binding)
+
+        for name, value in vars(node).items():
+            if name in _AST_NON_CHILD_FIELDS:
+                continue
+            children = value if isinstance(value, (list, tuple)) else [value]
+            for child in children:
+                if isinstance(child, astx.AST):
+                    self._collect_parallel_captures(child, found)
+
+    def _parallel_reduction_identity(
+        self,
+        operator: str,
+        llvm_type: ir.Type,
+        *,
+        unsigned: bool,
+    ) -> ir.Constant:
+        """
+        title: Return the identity value of one reduction operator.
+        parameters:
+          operator:
+            type: str
+          llvm_type:
+            type: ir.Type
+          unsigned:
+            type: bool
+        returns:
+          type: ir.Constant
+        """
+        if operator == "+":
+            return ir.Constant(llvm_type, 0.0 if is_fp_type(llvm_type) else 0)
+        if operator == "*":
+            return ir.Constant(llvm_type, 1.0 if is_fp_type(llvm_type) else 1)
+        if is_fp_type(llvm_type):
+            return ir.Constant(
+                llvm_type,
+                math.inf if operator == "min" else -math.inf,
+            )
+        width = cast(ir.IntType, llvm_type).width
+        if unsigned:
+            return ir.Constant(llvm_type, -1 if operator == "min" else 0)
+        limit = 1 << (width - 1)
+        return ir.Constant(
+            llvm_type,
+            limit - 1 if operator == "min" else -limit,
+        )
+
+    def _emit_parallel_combine(
+        self,
+        operator: str,
+        lhs: ir.Value,
+        rhs: ir.Value,
+        *,
+        unsigned: bool,
+    ) -> ir.Value:
+        """
+        title: Combine two partial reduction values.
+        parameters:
+          operator:
+            type: str
+          lhs:
+            type: ir.Value
+          rhs:
+            type: ir.Value
+          unsigned:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        if operator == "+":
+            return emit_add(builder, lhs, rhs, "irx_parallel_sum")
+        if operator == "*":
+            if is_fp_type(lhs.type):
+                return builder.fmul(lhs, rhs, name="irx_parallel_product")
+            return builder.mul(lhs, rhs, name="irx_parallel_product")
+        keep_lhs = self._emit_numeric_compare(
+            "<" if operator == "min" else ">",
+            lhs,
+            rhs,
+            unsigned=unsigned,
+            name="irx_parallel_keep",
+        )
+        return builder.select(keep_lhs, lhs, rhs, name="irx_parallel_pick")
+
+    def _emit_parallel_worker_loop(
+        self,
+        threads: ir.Value,
+        name: str,
+        body: Callable[[ir.Value], None],
+    ) -> None:
+        """
+        title: Emit one loop over the worker indices below threads.
+        summary: >-
+          The runtime always reports at least one thread, so the loop is
+          bottom-tested.
+        parameters:
+          threads:
+            type: ir.Value
+          name:
+            type: str
+          body:
+            type: Callable[[ir.Value], None]
+        """
+        builder = self._llvm.ir_builder
+        preheader = builder.block
+        body_block = builder.function.append_basic_block(f"{name}.body")
+        exit_block = builder.function.append_basic_block(f"{name}.exit")
+        builder.branch(body_block)
+
+        builder.position_at_start(body_block)
+        worker = builder.phi(self._llvm.INT64_TYPE, name=f"{name}_worker")
+        worker.add_incoming(ir.Constant(self._llvm.INT64_TYPE, 0), preheader)
+        body(worker)
+        next_worker = builder.add(
+            worker,
+            ir.Constant(self._llvm.INT64_TYPE, 1),
+            name=f"{name}_next",
+        )
+        worker.add_incoming(next_worker, builder.block)
+        builder.cbranch(
+            builder.icmp_signed("<", next_worker, threads),
+            body_block,
+            exit_block,
+        )
+        builder.position_at_start(exit_block)
+
+    def _parallel_index_to_i64(
+        self, value: ir.Value, *, unsigned: bool
+    ) -> ir.Value:
+        """
+        title: Widen one loop-typed integer to i64.
+        parameters:
+          value:
+            type: ir.Value
+          unsigned:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        width = cast(ir.IntType, value.type).width
+        if width == self._llvm.INT64_TYPE.width:
+            return value
+        if unsigned:
+            return builder.zext(value, self._llvm.INT64_TYPE)
+        return builder.sext(value, self._llvm.INT64_TYPE)
+
+    def _parallel_trip_count(
+        self,
+        start: ir.Value,
+        end: ir.Value,
+        step: int,
+        *,
+        unsigned: bool,
+    ) -> ir.Value:
+        """
+        title: Return the number of iterations of start, start + step, ...
+        parameters:
+          start:
+            type: ir.Value
+          end:
+            type: ir.Value
+          step:
+            type: int
+          unsigned:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        span = builder.sub(
+            self._parallel_index_to_i64(end, unsigned=unsigned),
+            self._parallel_index_to_i64(start, unsigned=unsigned),
+            name="irx_parallel_span",
+        )
+        zero = ir.Constant(self._llvm.INT64_TYPE, 0)
+        if step != 1:
+            span = builder.sdiv(
+                builder.add(
+                    span,
+                    ir.Constant(self._llvm.INT64_TYPE, step - 1),
+                ),
+                ir.Constant(self._llvm.INT64_TYPE, step),
+            )
+        return builder.select(
+            builder.icmp_signed(">", span, zero),
+            span,
+            zero,
+            name="irx_parallel_count",
+        )
+
+    def _emit_parallel_body(
+        self,
+        node: astx.ParallelForRangeLoopStmt,
+        loop: ResolvedParallelLoop,
+        *,
+        context_type: ir.LiteralStructType,
+        captures: list[str],
+        partial_type: ir.LiteralStructType,
+    ) -> ir.Function:
+        """
+        title: Outline the body of one parallel loop.
+        summary: >-
+          The function runs normalized iterations [begin, end) with the loop
+          variable set to start + index * step, then folds its private
+          reductions into the worker's partial slot. Caller-function state
+          such as cleanups, loop targets, hoisted bounds guards, and the
+          temporary arena is set aside while the body is lowered, and arena
+          temporaries are disabled because the default arena is not shared
+          between threads.
+        parameters:
+          node:
+            type: astx.ParallelForRangeLoopStmt
+          loop:
+            type: ResolvedParallelLoop
+          context_type:
+            type: ir.LiteralStructType
+          captures:
+            type: list[str]
+          partial_type:
+            type: ir.LiteralStructType
+        returns:
+          type: ir.Function
+        """
+        function = ir.Function(
+            self._llvm.module,
+            parallel_body_type(cast(Any, self)),
+            self._llvm.module.get_unique_name("irx_parallel_body"),
+        )
+        function.linkage = "internal"
+        raw_context, begin, end, worker = function.args
+        raw_context.name = "context"
+        begin.name = "begin"
+        end.name = "end"
+        worker.name = "worker"
+
+        saved_builder = self._llvm.ir_builder
+        saved_named_values = self.named_values
+        saved_const_vars = self.const_vars
+        saved_loop_stack = self.loop_stack
+        saved_cleanup_stack = self.cleanup_stack
+        saved_guards = self._buffer_bounds_guards
+        saved_descriptors = self._hoisted_buffer_descriptors
+        saved_arena = self._temporary_arena
+        saved_arena_temporaries = self.arena_temporaries
+        self.named_values = dict(saved_named_values)
+        self.const_vars = set(saved_const_vars)
+        self.loop_stack = []
+        self.cleanup_stack = []
+        self._buffer_bounds_guards = {}
+        self._hoisted_buffer_descriptors = {}
+        self._temporary_arena = None
+        self.arena_temporaries = False
+        try:
+            builder = ir.IRBuilder(function.append_basic_block("entry"))
+            self._llvm.ir_builder = builder
+            context = builder.bitcast(
+                raw_context,
+                context_type.as_pointer(),
+                name="captures",
+            )
+
+            def field(index: int, name: str) -> ir.Value:
+                return builder.load(
+                    builder.gep(
+                        context,
+                        [
+                            ir.Constant(self._llvm.INT32_TYPE, 0),
+                            ir.Constant(self._llvm.INT32_TYPE, index),
+                        ],
+                        inbounds=True,
+                    ),
+                    name=name,
+                )
+
+            start = field(_CAPTURE_START_FIELD, "start")
+            partials = field(_CAPTURE_PARTIALS_FIELD, "partials")
+            for offset, symbol_id in enumerate(captures):
+                self.named_values[symbol_id] = field(
+                    _CAPTURE_FIRST_VARIABLE_FIELD + offset,
+                    symbol_id.replace(":", "_"),
+                )
+
+            privates: list[tuple[ResolvedParallelReduction, ir.Value]] = []
+            for reduction in loop.reductions:
+                llvm_type = partial_type.elements[len(privates)]
+                private = builder.alloca(
+                    llvm_type, name=f"{reduction.symbol.name}_private"
+                )
+                builder.store(
+                    self._parallel_reduction_identity(
+                        reduction.operator,
+                        llvm_type,
+                        unsigned=is_unsigned_type(reduction.symbol.type_),
+                    ),
+                    private,
+                )
+                self.named_values[reduction.symbol.symbol_id] = private
+                privates.append((reduction, private))
+
+            loop_type = start.type
+            unsigned = is_unsigned_type(node.variable.type_)
+            variable = builder.alloca(loop_type, name=node.variable.name)
+            index_addr = builder.alloca(
+                self._llvm.INT64_TYPE, name="irx_parallel_index"
+            )
+            builder.store(begin, index_addr)
+
+            bounds_guards: dict[int, ir.Value] = {}
+            variable_key = semantic_symbol_key(
+                node.variable, node.variable.name
+            )
+            if loop.step == 1:
+                bounds_guards = cast(Any, self)._hoist_loop_bounds_checks(
+                    node.body,
+                    variable_key=variable_key,
+                    start=builder.add(start, builder.trunc(begin, loop_type))
+                    if loop_type != self._llvm.INT64_TYPE
+                    else builder.add(start, begin),
+                    end=builder.add(start, builder.trunc(end, loop_type))
+                    if loop_type != self._llvm.INT64_TYPE
+                    else builder.add(start, end),
+                    unsigned=unsigned,
+                )
+            descriptors = cast(Any, self)._hoist_loop_buffer_descriptors(
+                node.body
+            )
+
+            cond_block = function.append_basic_block("irx.parallel.cond")
+            body_block = function.append_basic_block("irx.parallel.body")
+            step_block = function.append_basic_block("irx.parallel.step")
+            exit_block = function.append_basic_block("irx.parallel.exit")
+            builder.branch(cond_block)
+
+            builder.position_at_start(cond_block)
+            index = builder.load(index_addr, name="index")
+            builder.cbranch(
+                builder.icmp_signed("<", index, end),
+                body_block,
+                exit_block,
+            )
+
+            builder.position_at_start(body_block)
+            index = builder.load(index_addr, name="index")
+            if loop_type != self._llvm.INT64_TYPE:
+                index = builder.trunc(index, loop_type)
+            if loop.step != 1:
+                index = builder.mul(index, ir.Constant(loop_type, loop.step))
+            builder.store(
+                builder.add(start, index, name=node.variable.name), variable
+            )
+            control_flow = cast(Any, self)
+            with (
+                control_flow._loop_scope(
+                    break_target=exit_block,
+                    continue_target=step_block,
+                ),
+                control_flow._temporary_named_value(
+                    variable_key,
+                    variable,
+                    is_constant=(
+                        node.variable.mutability
+                        == astx.MutabilityKind.constant
+                    ),
+                ),
+                control_flow._buffer_bounds_guard_scope(bounds_guards),
+                control_flow._buffer_descriptor_scope(descriptors),
+            ):
+                control_flow._discard_child_results(node.body)
+            if not builder.block.is_terminated:
+                builder.branch(step_block)
+
+            builder.position_at_start(step_block)
+            builder.store(
+                builder.add(
+                    builder.load(index_addr, name="index"),
+                    ir.Constant(self._llvm.INT64_TYPE, 1),
+                ),
+                index_addr,
+            )
+            builder.branch(cond_block)
+            control_flow._attach_loop_hints(
+                node,
+                header=cond_block,
+                exit_block=exit_block,
+                independent=True,
+            )
+
+            builder.position_at_start(exit_block)
+            for position, (reduction, private) in enumerate(privates):
+                slot = builder.gep(
+                    partials,
+                    [worker, ir.Constant(self._llvm.INT32_TYPE, position)],
+                    inbounds=True,
+                )
+                builder.store(
+                    self._emit_parallel_combine(
+                        reduction.operator,
+                        builder.load(slot),
+                        builder.load(private),
+                        unsigned=is_unsigned_type(reduction.symbol.type_),
+                    ),
+                    slot,
+                )
+            builder.ret_void()
+        finally:
+            self._llvm.ir_builder = saved_builder
+            self.named_values = saved_named_values
+            self.const_vars = saved_const_vars
+            self.loop_stack = saved_loop_stack
+            self.cleanup_stack = saved_cleanup_stack
+            self._buffer_bounds_guards = saved_guards
+            self._hoisted_buffer_descriptors = saved_descriptors
+            self._temporary_arena = saved_arena
+            self.arena_temporaries = saved_arena_temporaries
+        return function
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.ParallelForRangeLoopStmt) -> None:
+        """
+        title: Visit ParallelForRangeLoopStmt nodes.
+        parameters:
+          node:
+            type: astx.ParallelForRangeLoopStmt
+        """
+        loop = require_semantic_metadata(
+            cast(
+                ResolvedParallelLoop | None,
+                getattr(
+                    getattr(node, "semantic", None),
+                    "resolved_parallel_loop",
+                    None,
+                ),
+            ),
+            node=node,
+            metadata="resolved_parallel_loop",
+            context="parallel loop lowering",
+        )
+        control_flow = cast(Any, self)
+        loop_type = control_flow._require_llvm_type(
+            node.variable.type_,
+            node=node.variable,
+            context="parallel for-range loop variable",
+        )
+        start = control_flow._lower_typed_value(
+            node.start,
+            context="parallel for-range start expression",
+            target_type=node.variable.type_,
+        )
+        end = control_flow._lower_typed_value(
+            node.end,
+            context="parallel for-range end expression",
+            target_type=node.variable.type_,
+        )
+        unsigned = is_unsigned_type(node.variable.type_)
+        count = self._parallel_trip_count(
+            start, end, loop.step, unsigned=unsigned
+        )
+
+        partial_types: list[ir.Type] = []
+        reduction_slots: list[ir.Value] = []
+        for reduction in loop.reductions:
+            slot = self.named_values.get(reduction.symbol.symbol_id)
+            if slot is None or isinstance(slot, ir.GlobalValue):
+                raise_lowering_error(
+                    "parallel reductions require a local variable, got "
+                    f"'{reduction.symbol.name}'",
+                    code=DiagnosticCodes.LOWERING_TYPE_MISMATCH,
+                    node=node,
+                )
+            partial_types.append(slot.type.pointee)
+            reduction_slots.append(slot)
+        partial_type = ir.LiteralStructType(partial_types)
+
+        captured: dict[str, ir.Value] = {}
+        self._collect_parallel_captures(node.body, captured)
+        for reduction in loop.reductions:
+            captured.pop(reduction.symbol.symbol_id, None)
+        captured.pop(semantic_symbol_key(node.variable, ""), None)
+        captures = list(captured)
+        context_type = ir.LiteralStructType(
+            [
+                loop_type,
+                partial_type.as_pointer(),
+                *(captured[symbol_id].type for symbol_id in captures),
+            ]
+        )
+
+        body = self._emit_parallel_body(
+            node,
+            loop,
+            context_type=context_type,
+            captures=captures,
+            partial_type=partial_type,
+        )
+
+        builder = self._llvm.ir_builder
+        partials = self.create_entry_block_alloca(
+            "irx_parallel_partials",
+            ir.ArrayType(partial_type, PARALLEL_MAX_THREADS),
+        )
+        first_partial = builder.gep(
+            partials,
+            [
+                ir.Constant(self._llvm.INT32_TYPE, 0),
+                ir.Constant(self._llvm.INT32_TYPE, 0),
+            ],
+            inbounds=True,
+            name="irx_parallel_partials_base",
+        )
+        context = self.create_entry_block_alloca(
+            "irx_parallel_captures", context_type
+        )
+        for index, value in enumerate(
+            [
+                start,
+                first_partial,
+                *(captured[symbol_id] for symbol_id in captures),
+            ]
+        ):
+            builder.store(
+                value,
+                builder.gep(
+                    context,
+                    [
+                        ir.Constant(self._llvm.INT32_TYPE, 0),
+                        ir.Constant(self._llvm.INT32_TYPE, index),
+                    ],
+                    inbounds=True,
+                ),
+            )
+
+        threads = (
+            builder.call(
+                self.require_runtime_symbol(
+                    "parallel", "irx_parallel_thread_count"
+                ),
+                [],
+                name="irx_parallel_threads",
+            )
+            if loop.reductions
+            else None
+        )
+
+        def partial_slot(worker: ir.Value, position: int) -> ir.Value:
+            return builder.gep(
+                first_partial,
+                [worker, ir.Constant(self._llvm.INT32_TYPE, position)],
+                inbounds=True,
+            )
+
+        if threads is not None:
+
+            def initialize(worker: ir.Value) -> None:
+                for position, reduction in enumerate(loop.reductions):
+                    builder.store(
+                        self._parallel_reduction_identity(
+                            reduction.operator,
+                            partial_types[position],
+                            unsigned=is_unsigned_type(reduction.symbol.type_),
+                        ),
+                        partial_slot(worker, position),
+                    )
+
+            self._emit_parallel_worker_loop(
+                threads, "irx.parallel.init", initialize
+            )
+
+        builder.call(
+            self.require_runtime_symbol("parallel", "irx_parallel_for"),
+            [
+                body,
+                builder.bitcast(context, self._llvm.OPAQUE_POINTER_TYPE),
+                count,
+                ir.Constant(
+                    self._llvm.INT32_TYPE,
+                    PARALLEL_SCHEDULE_CODES[loop.schedule],
+                ),
+                ir.Constant(self._llvm.INT64_TYPE, loop.chunk_size),
+            ],
+        )
+
+        if threads is not None:
+
+            def combine(worker: ir.Value) -> None:
+                for position, reduction in enumerate(loop.reductions):
+                    slot = reduction_slots[position]
+                    builder.store(
+                        self._emit_parallel_combine(
+                            reduction.operator,
+                            builder.load(slot),
+                            builder.load(partial_slot(worker, position)),
+                            unsigned=is_unsigned_type(reduction.symbol.type_),
+                        ),
+                        slot,
+                    )
+
+            self._emit_parallel_worker_loop(
+                threads, "irx.parallel.combine", combine
+            )
+
+
+__all__ = ["ParallelLoopVisitorMixin"]
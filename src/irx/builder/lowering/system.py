@@ -17,6 +17,66 @@ from irx.typecheck import typechecked
 
 @typechecked
 class SystemVisitorMixin(VisitorMixinBase):
+    def _is_string_cast(self, node: astx.Cast) -> bool:
+        """
+        title: Return whether one cast targets a string type.
+        parameters:
+          node:
+            type: astx.Cast
+        returns:
+          type: bool
+        """
+        return self._llvm_type_for_ast_type(node.target_type) in (
+            self._llvm.ASCII_STRING_TYPE,
+            self._llvm.UTF8_STRING_TYPE,
+        )
+
+    def _cast_to_string(
+        self,
+        value: ir.Value,
+        source_type: astx.DataType | None,
+        *,
+        temporary: bool = False,
+    ) -> ir.Value:
+        """
+        title: Lower one cast of a scalar value to a string.
+        parameters:
+          value:
+            type: ir.Value
+          source_type:
+            type: astx.DataType | None
+          temporary:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        if (
+            isinstance(value.type, ir.PointerType)
+            and value.type.pointee == self._llvm.INT8_TYPE
+        ):
+            return value
+        if is_int_type(value.type):
+            arg, fmt_str = self._normalize_int_for_printf(
+                value,
+                unsigned=is_unsigned_type(source_type)
+                or is_boolean_type(source_type),
+            )
+            fmt_gv = self._get_or_create_format_global(fmt_str)
+            return self._format_string(fmt_gv, [arg], temporary=temporary)
+
+        if isinstance(value.type, (ir.FloatType, ir.DoubleType, ir.HalfType)):
+            if isinstance(value.type, (ir.FloatType, ir.HalfType)):
+                value_prom = self._llvm.ir_builder.fpext(
+                    value, self._llvm.DOUBLE_TYPE, "to_double"
+                )
+            else:
+                value_prom = value
+            fmt_gv = self._get_or_create_format_global("%.6f")
+            return self._format_string(
+                fmt_gv, [value_prom], temporary=temporary
+            )
+        raise Exception(f"Unsupported cast from {value.type} to string")
+
     @VisitorCore.visit.dispatch
     def visit(self, node: astx.Cast) -> None:
         """
@@ -31,49 +91,13 @@ class SystemVisitorMixin(VisitorMixinBase):
             raise Exception("Invalid value in Cast")
 
         source_type = self._resolved_ast_type(node.value)
-        target_type = node.target_type
-        target_llvm_type = self._llvm_type_for_ast_type(target_type)
-        if target_llvm_type in (
-            self._llvm.ASCII_STRING_TYPE,
-            self._llvm.UTF8_STRING_TYPE,
-        ):
-            if (
-                isinstance(value.type, ir.PointerType)
-                and value.type.pointee == self._llvm.INT8_TYPE
-            ):
-                self.result_stack.append(value)
-                return
-            if is_int_type(value.type):
-                arg, fmt_str = self._normalize_int_for_printf(
-                    value,
-                    unsigned=is_unsigned_type(source_type)
-                    or is_boolean_type(source_type),
-                )
-                fmt_gv = self._get_or_create_format_global(fmt_str)
-                ptr = self._snprintf_heap(fmt_gv, [arg])
-                self.result_stack.append(ptr)
-                return
-
-            if isinstance(
-                value.type, (ir.FloatType, ir.DoubleType, ir.HalfType)
-            ):
-                if isinstance(value.type, (ir.FloatType, ir.HalfType)):
-                    value_prom = self._llvm.ir_builder.fpext(
-                        value, self._llvm.DOUBLE_TYPE, "to_double"
-                    )
-                else:
-                    value_prom = value
-                fmt_gv = self._get_or_create_format_global("%.6f")
-                ptr = self._snprintf_heap(fmt_gv, [value_prom])
-                self.result_stack.append(ptr)
-                return
-            raise Exception(
-                f"Unsupported cast from {value.type} to {target_llvm_type}"
-            )
+        if self._is_string_cast(node):
+            self.result_stack.append(self._cast_to_string(value, source_type))
+            return
         result = self._cast_ast_value(
             value,
             source_type=source_type,
-            target_type=target_type,
+            target_type=node.target_type,
         )
         self.result_stack.append(result)
 
@@ -81,47 +105,63 @@ class SystemVisitorMixin(VisitorMixinBase):
     def visit(self, node: astx.PrintExpr) -> None:
         """
         title: Visit PrintExpr nodes.
+        summary: >-
+          A message cast to string only lives until the print returns, so it
+          is formatted as a scope temporary.
         parameters:
           node:
             type: astx.PrintExpr
         """
-        self.visit_child(node.message)
-        message_value = safe_pop(self.result_stack)
+        message = node.message
+        if isinstance(message, astx.Cast) and self._is_string_cast(message):
+            self.visit_child(message.value)
+            cast_value = safe_pop(self.result_stack)
+            if cast_value is None:
+                raise Exception("Invalid value in Cast")
+            message_value = self._cast_to_string(
+                cast_value,
+                self._resolved_ast_type(message.value),
+                temporary=True,
+            )
+        else:
+            self.visit_child(message)
+            message_value = safe_pop(self.result_stack)
         if message_value is None:
             raise Exception("Invalid message in PrintExpr")
 
         message_source_type = self._resolved_ast_type(node.message)
         message_type = message_value.type
-        ptr: ir.Value
+        print_symbol: str
+        print_arg: ir.Value
         if (
             isinstance(message_type, ir.PointerType)
             and message_type.pointee == self._llvm.INT8_TYPE
         ):
-            ptr = message_value
+            print_symbol, print_arg = "irx_print_cstr", message_value
         elif is_int_type(message_type):
-            int_arg, int_fmt = self._normalize_int_for_printf(
+            print_arg, int_fmt = self._normalize_int_for_printf(
                 message_value,
                 unsigned=is_unsigned_type(message_source_type)
                 or is_boolean_type(message_source_type),
             )
-            int_fmt_gv = self._get_or_create_format_global(int_fmt)
-            ptr = self._snprintf_heap(int_fmt_gv, [int_arg])
+            print_symbol = (
+                "irx_print_u64" if int_fmt == "%llu" else "irx_print_i64"
+            )
         elif isinstance(
             message_type, (ir.HalfType, ir.FloatType, ir.DoubleType)
         ):
             if isinstance(message_type, (ir.HalfType, ir.FloatType)):
-                float_arg = self._llvm.ir_builder.fpext(
+                print_arg = self._llvm.ir_builder.fpext(
                     message_value, self._llvm.DOUBLE_TYPE, "print_to_double"
                 )
             else:
-                float_arg = message_value
-            float_fmt_gv = self._get_or_create_format_global("%.6f")
-            ptr = self._snprintf_heap(float_fmt_gv, [float_arg])
+                print_arg = message_value
+            print_symbol = "irx_print_f64"
         else:
             raise Exception(
                 f"Unsupported message type in PrintExpr: {message_type}"
             )
 
-        puts_fn = self.require_runtime_symbol("libc", "puts")
-        self._llvm.ir_builder.call(puts_fn, [ptr])
+        print_fn = self.require_runtime_symbol("print", print_symbol)
+        self._llvm.ir_builder.call(print_fn, [print_arg])
         self.result_stack.append(ir.Constant(self._llvm.INT32_TYPE, 0))
@@ -31,6 +31,9 @@ from irx.builtins.collections.tensor import (
 )
 from irx.typecheck import typechecked
 
+# Matches Arrow's preferred buffer alignment for constant literal storage.
+TENSOR_LITERAL_ALIGNMENT = 64
+
 
 @typechecked
 class TensorVisitorMixin(VisitorMixinBase):
@@ -249,88 +252,55 @@ class TensorVisitorMixin(VisitorMixinBase):
             )
         return spec
 
-    def _append_value_to_tensor_builder(
+    def _lower_tensor_values_to_storage(
         self,
-        *,
-        builder_handle: ir.Value,
-        value_node: astx.AST,
+        values: list[astx.AST],
         element_type: astx.DataType,
-    ) -> None:
+    ) -> ir.Value:
         """
-        title: Append one lowered scalar to the Arrow tensor builder.
+        title: Lower scalar AST values into one contiguous stack array.
+        summary: >-
+          The array lives in the function entry block so literals inside loops
+          reuse one slot instead of growing the stack per iteration.
         parameters:
-          builder_handle:
-            type: ir.Value
-          value_node:
-            type: astx.AST
+          values:
+            type: list[astx.AST]
           element_type:
             type: astx.DataType
+        returns:
+          type: ir.Value
         """
-        self.visit_child(value_node)
-        value = safe_pop(self.result_stack)
-        if value is None:
-            raise Exception("tensor literal expected a scalar value")
-
-        value = self._cast_ast_value(
-            value,
-            source_type=self._resolved_ast_type(value_node),
-            target_type=element_type,
-        )
-
-        if is_float_type(element_type):
-            append = self.require_runtime_symbol(
-                "tensor",
-                "irx_arrow_tensor_builder_append_double",
-            )
-            if value.type != self._llvm.DOUBLE_TYPE:
-                value = self._llvm.ir_builder.fpext(
-                    value,
-                    self._llvm.DOUBLE_TYPE,
-                    name="irx_tensor_double_promote",
-                )
-            self._llvm.ir_builder.call(append, [builder_handle, value])
-            return
-
-        if not is_int_type(value.type):
-            raise Exception("tensor builder requires integer or float values")
-
-        if is_unsigned_type(element_type):
-            append = self.require_runtime_symbol(
-                "tensor",
-                "irx_arrow_tensor_builder_append_uint",
-            )
-            if value.type.width < self._llvm.INT64_TYPE.width:
-                value = self._llvm.ir_builder.zext(
-                    value,
-                    self._llvm.INT64_TYPE,
-                    name="irx_tensor_uint_promote",
-                )
-            elif value.type.width > self._llvm.INT64_TYPE.width:
-                value = self._llvm.ir_builder.trunc(
-                    value,
-                    self._llvm.INT64_TYPE,
-                    name="irx_tensor_uint_trunc",
-                )
-            self._llvm.ir_builder.call(append, [builder_handle, value])
-            return
-
-        append = self.require_runtime_symbol(
-            "tensor",
-            "irx_arrow_tensor_builder_append_int",
-        )
-        if value.type.width < self._llvm.INT64_TYPE.width:
-            value = self._llvm.ir_builder.sext(
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        if llvm_type is None:
+            raise Exception("tensor lowering has unsupported element type")
+        storage = self.create_entry_block_alloca(
+            "irx_tensor_values",
+            ir.ArrayType(llvm_type, len(values)),
+        )
+        zero = ir.Constant(self._llvm.INT32_TYPE, 0)
+        for index, value_node in enumerate(values):
+            self.visit_child(value_node)
+            value = safe_pop(self.result_stack)
+            if value is None:
+                raise Exception("tensor literal expected a scalar value")
+
+            value = self._cast_ast_value(
                 value,
-                self._llvm.INT64_TYPE,
-                name="irx_tensor_int_promote",
+                source_type=self._resolved_ast_type(value_node),
+                target_type=element_type,
             )
-        elif value.type.width > self._llvm.INT64_TYPE.width:
-            value = self._llvm.ir_builder.trunc(
-                value,
-                self._llvm.INT64_TYPE,
-                name="irx_tensor_int_trunc",
+            if value.type != llvm_type:
+                raise Exception(
+                    "tensor builder requires integer or float values"
+                )
+            slot = self._llvm.ir_builder.gep(
+                storage,
+                [zero, ir.Constant(self._llvm.INT32_TYPE, index)],
+                inbounds=True,
+                name="irx_tensor_value_slot",
             )
-        self._llvm.ir_builder.call(append, [builder_handle, value])
+            self._llvm.ir_builder.store(value, slot)
+        return storage
 
     def _build_arrow_tensor_from_values(
         self,
@@ -387,12 +357,23 @@ class TensorVisitorMixin(VisitorMixinBase):
             name="irx_tensor_builder",
         )
 
-        for value in values:
-            self._append_value_to_tensor_builder(
-                builder_handle=builder_handle,
-                value_node=value,
-                element_type=element_type,
-            )
+        append_n = self.require_runtime_symbol(
+            "tensor",
+            "irx_arrow_tensor_builder_append_n",
+        )
+        storage = self._lower_tensor_values_to_storage(values, element_type)
+        self._llvm.ir_builder.call(
+            append_n,
+            [
+                builder_handle,
+                self._llvm.ir_builder.bitcast(
+                    storage,
+                    self._llvm.OPAQUE_POINTER_TYPE,
+                    name="irx_tensor_values_data",
+                ),
+                ir.Constant(self._llvm.INT64_TYPE, len(values)),
+            ],
+        )
 
         tensor_slot = self._llvm.ir_builder.alloca(
             self._llvm.TENSOR_HANDLE_TYPE,
@@ -407,6 +388,125 @@ class TensorVisitorMixin(VisitorMixinBase):
             name="irx_tensor_handle",
         )
 
+    def _constant_tensor_payload(
+        self,
+        values: list[astx.AST],
+        element_type: astx.DataType,
+    ) -> ir.Constant | None:
+        """
+        title: Fold tensor literal values into one constant storage array.
+        summary: >-
+          Returns None as soon as one value is not a numeric literal that fits
+          the element type, so those literals keep the builder path.
+        parameters:
+          values:
+            type: list[astx.AST]
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Constant | None
+        """
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        if llvm_type is None:
+            return None
+        float_element = is_float_type(element_type)
+        if not float_element and not is_int_type(llvm_type):
+            return None
+
+        constants: list[ir.Constant] = []
+        for value_node in values:
+            if not isinstance(value_node, astx.Literal):
+                return None
+            raw = getattr(value_node, "value", None)
+            if isinstance(raw, bool) or not isinstance(raw, int | float):
+                return None
+            if float_element:
+                constants.append(ir.Constant(llvm_type, float(raw)))
+                continue
+            if not isinstance(raw, int):
+                return None
+            width = llvm_type.width
+            if is_unsigned_type(element_type):
+                minimum, maximum = 0, (1 << width) - 1
+            else:
+                minimum, maximum = -(1 << (width - 1)), (1 << (width - 1)) - 1
+            if not minimum <= raw <= maximum:
+                return None
+            constants.append(ir.Constant(llvm_type, raw))
+        return ir.Constant(ir.ArrayType(llvm_type, len(constants)), constants)
+
+    def _wrap_constant_tensor_storage(
+        self,
+        payload: ir.Constant,
+        element_type: astx.DataType,
+        layout: TensorLayout,
+    ) -> ir.Value:
+        """
+        title: Emit constant tensor storage and wrap it as an Arrow tensor.
+        summary: >-
+          The literal becomes one internal constant global; the runtime wraps
+          it zero-copy, so startup cost no longer grows with the element count.
+        parameters:
+          payload:
+            type: ir.Constant
+          element_type:
+            type: astx.DataType
+          layout:
+            type: TensorLayout
+        returns:
+          type: ir.Value
+        """
+        spec = self._tensor_primitive_spec(element_type)
+        storage = ir.GlobalVariable(
+            self._llvm.module,
+            payload.type,
+            name=self._llvm.module.get_unique_name("irx_tensor_literal"),
+        )
+        storage.linkage = "internal"
+        storage.global_constant = True
+        storage.align = TENSOR_LITERAL_ALIGNMENT
+        storage.initializer = payload
+
+        wrap_buffer = self.require_runtime_symbol(
+            "tensor",
+            "irx_arrow_tensor_wrap_buffer",
+        )
+        tensor_slot = self._llvm.ir_builder.alloca(
+            self._llvm.TENSOR_HANDLE_TYPE,
+            name="irx_tensor_handle_slot",
+        )
+        self._llvm.ir_builder.call(
+            wrap_buffer,
+            [
+                ir.Constant(self._llvm.INT32_TYPE, spec.type_id),
+                ir.Constant(self._llvm.INT32_TYPE, layout.ndim),
+                self._i64_array_pointer(
+                    layout.shape,
+                    purpose="literal_shape",
+                    symbol_namespace="tensor",
+                ),
+                self._i64_array_pointer(
+                    layout.strides,
+                    purpose="literal_strides",
+                    symbol_namespace="tensor",
+                ),
+                self._llvm.ir_builder.bitcast(
+                    storage,
+                    self._llvm.OPAQUE_POINTER_TYPE,
+                    name="irx_tensor_literal_data",
+                ),
+                ir.Constant(
+                    self._llvm.INT64_TYPE,
+                    payload.type.count * spec.element_size_bytes,
+                ),
+                tensor_slot,
+            ],
+        )
+        return self._llvm.ir_builder.load(
+            tensor_slot,
+            name="irx_tensor_handle",
+        )
+
     def _wrap_arrow_tensor_handle_as_tensor(
         self,
         *,
@@ -512,11 +612,19 @@ class TensorVisitorMixin(VisitorMixinBase):
         layout = self._static_tensor_layout(node)
         flags = self._static_tensor_flags(node)
         element_type = self._static_tensor_element_type(node)
-        tensor_handle = self._build_arrow_tensor_from_values(
-            node.values,
-            element_type,
-            layout,
-        )
+        payload = self._constant_tensor_payload(node.values, element_type)
+        if payload is not None:
+            tensor_handle = self._wrap_constant_tensor_storage(
+                payload,
+                element_type,
+                layout,
+            )
+        else:
+            tensor_handle = self._build_arrow_tensor_from_values(
+                node.values,
+                element_type,
+                layout,
+            )
         self.result_stack.append(
             self._wrap_arrow_tensor_handle_as_tensor(
                 tensor_handle=tensor_handle,
@@ -559,6 +667,60 @@ class TensorVisitorMixin(VisitorMixinBase):
             )
         )
 
+    def _lower_derived_tensor_view(
+        self,
+        node: astx.TensorSlice | astx.TensorTranspose | astx.TensorReshape,
+    ) -> None:
+        """
+        title: Lower one slice, transpose, or reshape Tensor view.
+        parameters:
+          node:
+            type: astx.TensorSlice | astx.TensorTranspose | astx.TensorReshape
+        """
+        base_layout = self._static_tensor_layout(node.base)
+        layout = self._static_tensor_layout(node)
+        base_value = self._require_tensor_value(node.base)
+        self.result_stack.append(
+            cast(Any, self)._derived_view_value(
+                base_value,
+                shape=layout.shape,
+                strides=layout.strides,
+                offset_delta=layout.offset_bytes - base_layout.offset_bytes,
+                flags=self._static_tensor_flags(node),
+                symbol_namespace="tensor",
+            )
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorSlice) -> None:
+        """
+        title: Visit TensorSlice nodes.
+        parameters:
+          node:
+            type: astx.TensorSlice
+        """
+        self._lower_derived_tensor_view(node)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorTranspose) -> None:
+        """
+        title: Visit TensorTranspose nodes.
+        parameters:
+          node:
+            type: astx.TensorTranspose
+        """
+        self._lower_derived_tensor_view(node)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorReshape) -> None:
+        """
+        title: Visit TensorReshape nodes.
+        parameters:
+          node:
+            type: astx.TensorReshape
+        """
+        self._lower_derived_tensor_view(node)
+
     @VisitorCore.visit.dispatch
     def visit(self, node: astx.TensorIndex) -> None:
         """
@@ -569,11 +731,16 @@ class TensorVisitorMixin(VisitorMixinBase):
         """
         view = self._require_tensor_value(node.base)
         indices = cast(Any, self)._lower_buffer_index_indices(node.indices)
+        layout = self._static_tensor_layout(node.base)
         element_ptr = cast(Any, self).lower_buffer_element_pointer(
             view,
             indices,
             self._static_tensor_element_type(node.base),
             index_nodes=node.indices,
+            static_strides=layout.strides,
+            static_flags=self._static_tensor_flags(node.base),
+            static_shape=layout.shape,
+            bounds_node=node,
         )
         result = self._llvm.ir_builder.load(
             element_ptr,
@@ -592,11 +759,16 @@ class TensorVisitorMixin(VisitorMixinBase):
         view = self._require_tensor_value(node.base)
         indices = cast(Any, self)._lower_buffer_index_indices(node.indices)
         element_type = self._static_tensor_element_type(node.base)
+        layout = self._static_tensor_layout(node.base)
         element_ptr = cast(Any, self).lower_buffer_element_pointer(
             view,
             indices,
             element_type,
             index_nodes=node.indices,
+            static_strides=layout.strides,
+            static_flags=self._static_tensor_flags(node.base),
+            static_shape=layout.shape,
+            bounds_node=node,
         )
 
         self.visit_child(node.value)
@@ -710,6 +882,7 @@ class TensorVisitorMixin(VisitorMixinBase):
             view,
             indices,
             index_nodes=node.indices,
+            static_strides=self._static_tensor_layout(node.base).strides,
         )
         self.result_stack.append(offset)
 
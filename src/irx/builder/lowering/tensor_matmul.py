@@ -0,0 +1,790 @@
+# mypy: disable-error-code=no-redef
+# mypy: disable-error-code=untyped-decorator
+# mypy: disable-error-code=attr-defined
+
+"""
+title: Tensor matrix product visitor mixin for llvmliteir.
+summary: >-
+  Lower TensorMatmul to a cache-blocked, register-tiled kernel. When the
+  right operand is contiguous along its columns, each tile keeps a few rows
+  by a few column vectors of the result in registers and updates them with
+  one fused multiply-add per element of the left operand. When both operands
+  are contiguous along the contracted axis instead, as for a transposed right
+  operand or a matrix-vector product, each result element is a vectorized
+  dot product. Other layouts use the tiled kernel with scalar lanes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from llvmlite import ir
+
+from irx import astx
+from irx.analysis.types import is_float_type
+from irx.builder.core import VisitorCore
+from irx.builder.protocols import VisitorMixinBase
+from irx.builder.vector import splat_scalar
+from irx.builtins.collections.tensor import (
+    TensorLayout,
+    tensor_element_size_bytes,
+)
+from irx.typecheck import typechecked
+
+# Result rows kept in registers by one tile.
+TENSOR_MATMUL_TILE_ROWS = 4
+# Result column vectors kept in registers by one tile, per row.
+TENSOR_MATMUL_TILE_VECTORS = 2
+# Contracted-axis block, so one block of rhs rows stays in cache.
+TENSOR_MATMUL_BLOCK_K = 256
+# Column block in bytes; with the k block, a 128 KiB rhs panel.
+TENSOR_MATMUL_BLOCK_N_BYTES = 512
+
+
+@typechecked
+@dataclass(frozen=True)
+class _MatmulOperands:
+    """
+    title: Lowered operands of one matrix product seen as matrices.
+    summary: >-
+      A vector lhs is one row and a vector rhs is one column; the unit axis
+      gets a zero stride. Strides are in bytes.
+    attributes:
+      lhs:
+        type: ir.Value
+      rhs:
+        type: ir.Value
+      rows:
+        type: int
+      inner:
+        type: int
+      columns:
+        type: int
+      lhs_row_stride:
+        type: int
+      lhs_inner_stride:
+        type: int
+      rhs_inner_stride:
+        type: int
+      rhs_column_stride:
+        type: int
+    """
+
+    lhs: ir.Value
+    rhs: ir.Value
+    rows: int
+    inner: int
+    columns: int
+    lhs_row_stride: int
+    lhs_inner_stride: int
+    rhs_inner_stride: int
+    rhs_column_stride: int
+
+
+@typechecked
+def _matrix_layout(
+    layout: TensorLayout, *, column: bool
+) -> tuple[int, int, int, int]:
+    """
+    title: Return the extents and byte strides of one operand as a matrix.
+    parameters:
+      layout:
+        type: TensorLayout
+      column:
+        type: bool
+    returns:
+      type: tuple[int, int, int, int]
+    """
+    if layout.ndim == 2:  # noqa: PLR2004
+        return (
+            layout.shape[0],
+            layout.shape[1],
+            layout.strides[0],
+            layout.strides[1],
+        )
+    if column:
+        return layout.shape[0], 1, layout.strides[0], 0
+    return 1, layout.shape[0], 0, layout.strides[0]
+
+
+@typechecked
+class TensorMatmulVisitorMixin(VisitorMixinBase):
+    """
+    title: Tensor matrix product visitor mixin.
+    """
+
+    def _emit_tensor_blocks(
+        self,
+        base: ir.Value,
+        extent: int,
+        block: int,
+        name: str,
+        body: Callable[[ir.Value, int], None],
+    ) -> None:
+        """
+        title: Split one static extent into full blocks and a remainder.
+        summary: >-
+          Full blocks run in one loop; the remainder, if any, is emitted once
+          after it. body receives each block start and its static size.
+        parameters:
+          base:
+            type: ir.Value
+          extent:
+            type: int
+          block:
+            type: int
+          name:
+            type: str
+          body:
+            type: Callable[[ir.Value, int], None]
+        """
+        builder = self._llvm.ir_builder
+        full = extent - extent % block
+
+        def run_block(
+            index: ir.Value, carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            body(builder.add(base, index, name=f"{name}_start"), block)
+            return carried
+
+        cast(Any, self)._emit_tensor_loop(0, full, block, name, run_block)
+        if extent % block:
+            body(
+                builder.add(
+                    base,
+                    ir.Constant(self._llvm.INT64_TYPE, full),
+                    name=f"{name}_rest",
+                ),
+                extent % block,
+            )
+
+    def _emit_matmul_update(
+        self,
+        lhs: ir.Value,
+        rhs: ir.Value,
+        accumulator: ir.Value,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Emit accumulator + lhs * rhs on scalars or vectors.
+        summary: >-
+          Floating-point updates are one llvm.fmuladd call, so the backend
+          emits a fused multiply-add where the target has one and a multiply
+          and add elsewhere, instead of a libm fma call per lane.
+        parameters:
+          lhs:
+            type: ir.Value
+          rhs:
+            type: ir.Value
+          accumulator:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        if is_float_type(element_type):
+            fmuladd = self._get_fma_function(lhs.type, intrinsic="fmuladd")
+            return builder.call(
+                fmuladd,
+                [lhs, rhs, accumulator],
+                name="irx_tensor_matmul_fmuladd",
+            )
+        return builder.add(
+            builder.mul(lhs, rhs, name="irx_tensor_matmul_product"),
+            accumulator,
+            name="irx_tensor_matmul_sum",
+        )
+
+    def _scaled_index(self, index: ir.Value, scale: int) -> ir.Value:
+        """
+        title: Multiply one i64 index by a static scale.
+        parameters:
+          index:
+            type: ir.Value
+          scale:
+            type: int
+        returns:
+          type: ir.Value
+        """
+        return self._llvm.ir_builder.mul(
+            index,
+            ir.Constant(self._llvm.INT64_TYPE, scale),
+            name="irx_tensor_matmul_scaled",
+        )
+
+    def _emit_matmul_tile(
+        self,
+        operands: _MatmulOperands,
+        result: ir.Value,
+        element_type: astx.DataType,
+        *,
+        row: ir.Value,
+        rows: int,
+        column: ir.Value,
+        groups: list[tuple[int, int]],
+        inner: ir.Value,
+        inner_count: int,
+    ) -> None:
+        """
+        title: Update one register tile of the result over one k block.
+        summary: >-
+          The tile covers rows consecutive result rows and, per row, one
+          accumulator for each (column offset, lanes) group. Every step of
+          the k loop loads one lhs element per row, splats it, and multiplies
+          it into the rhs group of the same k.
+        parameters:
+          operands:
+            type: _MatmulOperands
+          result:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+          row:
+            type: ir.Value
+          rows:
+            type: int
+          column:
+            type: ir.Value
+          groups:
+            type: list[tuple[int, int]]
+          inner:
+            type: ir.Value
+          inner_count:
+            type: int
+        """
+        builder = self._llvm.ir_builder
+        visitor = cast(Any, self)
+        size = tensor_element_size_bytes(element_type)
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        assert size is not None and llvm_type is not None
+        i64 = self._llvm.INT64_TYPE
+
+        def group_type(lanes: int) -> ir.Type:
+            return llvm_type if lanes == 1 else ir.VectorType(llvm_type, lanes)
+
+        def typed(pointer: ir.Value, lanes: int) -> ir.Value:
+            return builder.bitcast(
+                pointer,
+                group_type(lanes).as_pointer(),
+                name="irx_tensor_matmul_lane_ptr",
+            )
+
+        result_base = builder.add(
+            self._scaled_index(row, operands.columns),
+            column,
+            name="irx_tensor_matmul_result_base",
+        )
+        result_pointers = [
+            typed(
+                builder.gep(
+                    result,
+                    [
+                        builder.add(
+                            result_base,
+                            ir.Constant(i64, r * operands.columns + offset),
+                        )
+                    ],
+                    inbounds=True,
+                    name="irx_tensor_matmul_result_ptr",
+                ),
+                lanes,
+            )
+            for r in range(rows)
+            for offset, lanes in groups
+        ]
+        initial = [
+            builder.load(pointer, name="irx_tensor_matmul_acc", align=size)
+            for pointer in result_pointers
+        ]
+        lhs_base = self._scaled_index(row, operands.lhs_row_stride)
+        rhs_base = self._scaled_index(column, operands.rhs_column_stride)
+        element_ptr_type = llvm_type.as_pointer()
+
+        def step(index: ir.Value, carried: list[ir.Value]) -> list[ir.Value]:
+            k = builder.add(inner, index, name="irx_tensor_matmul_k")
+            lhs_k = builder.add(
+                lhs_base, self._scaled_index(k, operands.lhs_inner_stride)
+            )
+            rhs_k = builder.add(
+                rhs_base, self._scaled_index(k, operands.rhs_inner_stride)
+            )
+            rhs_values = [
+                builder.load(
+                    typed(
+                        visitor._tensor_element_at(
+                            operands.rhs,
+                            builder.add(
+                                rhs_k,
+                                ir.Constant(
+                                    i64, offset * operands.rhs_column_stride
+                                ),
+                            ),
+                            element_ptr_type,
+                        ),
+                        lanes,
+                    ),
+                    name="irx_tensor_matmul_rhs",
+                    align=size,
+                )
+                for offset, lanes in groups
+            ]
+            updated = []
+            for r in range(rows):
+                lhs_value = builder.load(
+                    visitor._tensor_element_at(
+                        operands.lhs,
+                        builder.add(
+                            lhs_k,
+                            ir.Constant(i64, r * operands.lhs_row_stride),
+                        ),
+                        element_ptr_type,
+                    ),
+                    name="irx_tensor_matmul_lhs",
+                )
+                splats = {
+                    lanes: splat_scalar(
+                        builder, lhs_value, ir.VectorType(llvm_type, lanes)
+                    )
+                    for _, lanes in groups
+                    if lanes > 1
+                }
+                for position, (_, lanes) in enumerate(groups):
+                    updated.append(
+                        self._emit_matmul_update(
+                            splats.get(lanes, lhs_value),
+                            rhs_values[position],
+                            carried[r * len(groups) + position],
+                            element_type,
+                        )
+                    )
+            return updated
+
+        final = visitor._emit_tensor_loop(
+            0,
+            inner_count,
+            1,
+            "irx.tensor.matmul.k",
+            step,
+            carried=initial,
+        )
+        for value, pointer in zip(final, result_pointers, strict=True):
+            builder.store(value, pointer, align=size)
+
+    def _emit_matmul_tiled(
+        self,
+        operands: _MatmulOperands,
+        result: ir.Value,
+        element_type: astx.DataType,
+        lanes: int,
+    ) -> None:
+        """
+        title: Accumulate the product into a zeroed result, tile by tile.
+        summary: >-
+          Loops run over column blocks, then k blocks, then row tiles, then
+          column tiles, so one rhs panel is reused by every row of lhs before
+          the next panel is loaded.
+        parameters:
+          operands:
+            type: _MatmulOperands
+          result:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+          lanes:
+            type: int
+        """
+        size = tensor_element_size_bytes(element_type)
+        assert size is not None
+        tile_columns = lanes * TENSOR_MATMUL_TILE_VECTORS
+        block_columns = (
+            max(TENSOR_MATMUL_BLOCK_N_BYTES // size // tile_columns, 1)
+            * tile_columns
+        )
+        zero = ir.Constant(self._llvm.INT64_TYPE, 0)
+
+        def column_block(column: ir.Value, columns: int) -> None:
+            def inner_block(inner: ir.Value, count: int) -> None:
+                def row_tile(row: ir.Value, rows: int) -> None:
+                    def tile(start: ir.Value, width: int) -> None:
+                        vectors = width // lanes
+                        self._emit_matmul_tile(
+                            operands,
+                            result,
+                            element_type,
+                            row=row,
+                            rows=rows,
+                            column=start,
+                            groups=[
+                                (vector * lanes, lanes)
+                                for vector in range(vectors)
+                            ]
+                            + [
+                                (vectors * lanes + lane, 1)
+                                for lane in range(width % lanes)
+                            ],
+                            inner=inner,
+                            inner_count=count,
+                        )
+
+                    self._emit_tensor_blocks(
+                        column,
+                        columns,
+                        tile_columns,
+                        "irx.tensor.matmul.columns",
+                        tile,
+                    )
+
+                self._emit_tensor_blocks(
+                    zero,
+                    operands.rows,
+                    TENSOR_MATMUL_TILE_ROWS,
+                    "irx.tensor.matmul.rows",
+                    row_tile,
+                )
+
+            self._emit_tensor_blocks(
+                zero,
+                operands.inner,
+                TENSOR_MATMUL_BLOCK_K,
+                "irx.tensor.matmul.kblock",
+                inner_block,
+            )
+
+        self._emit_tensor_blocks(
+            zero,
+            operands.columns,
+            block_columns,
+            "irx.tensor.matmul.nblock",
+            column_block,
+        )
+
+    def _emit_tensor_dot(
+        self,
+        lhs: ir.Value,
+        rhs: ir.Value,
+        element_type: astx.DataType,
+        *,
+        lhs_stride: int,
+        rhs_stride: int,
+        count: int,
+    ) -> ir.Value:
+        """
+        title: Emit the dot product of two strided runs of elements.
+        summary: >-
+          Runs contiguous in both operands accumulate into several vector
+          registers with fused multiply-adds, then reduce across lanes and
+          finish the remainder element by element.
+        parameters:
+          lhs:
+            type: ir.Value
+          rhs:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+          lhs_stride:
+            type: int
+          rhs_stride:
+            type: int
+          count:
+            type: int
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        visitor = cast(Any, self)
+        size = tensor_element_size_bytes(element_type)
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        assert size is not None and llvm_type is not None
+        element_ptr_type = llvm_type.as_pointer()
+        lanes = visitor._tensor_vector_width(element_type)
+        step = lanes * TENSOR_MATMUL_TILE_VECTORS
+        contiguous = lhs_stride == size and rhs_stride == size
+        vector_stop = count - count % step if contiguous and lanes > 1 else 0
+        total: ir.Value = ir.Constant(llvm_type, 0)
+
+        if vector_stop:
+            vector_type = ir.VectorType(llvm_type, lanes)
+            lhs_elements = builder.bitcast(lhs, element_ptr_type)
+            rhs_elements = builder.bitcast(rhs, element_ptr_type)
+
+            def vector_step(
+                index: ir.Value, carried: list[ir.Value]
+            ) -> list[ir.Value]:
+                updated = []
+                for position, accumulator in enumerate(carried):
+                    lane = builder.add(
+                        index,
+                        ir.Constant(self._llvm.INT64_TYPE, position * lanes),
+                    )
+                    updated.append(
+                        self._emit_matmul_update(
+                            builder.load(
+                                visitor._tensor_vector_pointer(
+                                    lhs_elements, lane, vector_type
+                                ),
+                                name="irx_tensor_dot_lhs",
+                                align=size,
+                            ),
+                            builder.load(
+                                visitor._tensor_vector_pointer(
+                                    rhs_elements, lane, vector_type
+                                ),
+                                name="irx_tensor_dot_rhs",
+                                align=size,
+                            ),
+                            accumulator,
+                            element_type,
+                        )
+                    )
+                return updated
+
+            accumulators = visitor._emit_tensor_loop(
+                0,
+                vector_stop,
+                step,
+                "irx.tensor.dot.vector",
+                vector_step,
+                carried=[
+                    ir.Constant(vector_type, None)
+                    for _ in range(TENSOR_MATMUL_TILE_VECTORS)
+                ],
+            )
+            combined = accumulators[0]
+            for accumulator in accumulators[1:]:
+                combined = visitor._emit_tensor_binary(
+                    "+", combined, accumulator, element_type
+                )
+            total = visitor._emit_tensor_horizontal_reduce(
+                "sum", combined, element_type
+            )
+
+        def scalar_step(
+            index: ir.Value, carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            lhs_value = builder.load(
+                visitor._tensor_element_at(
+                    lhs,
+                    self._scaled_index(index, lhs_stride),
+                    element_ptr_type,
+                ),
+                name="irx_tensor_dot_lhs",
+            )
+            rhs_value = builder.load(
+                visitor._tensor_element_at(
+                    rhs,
+                    self._scaled_index(index, rhs_stride),
+                    element_ptr_type,
+                ),
+                name="irx_tensor_dot_rhs",
+            )
+            return [
+                self._emit_matmul_update(
+                    lhs_value, rhs_value, carried[0], element_type
+                )
+            ]
+
+        (total,) = visitor._emit_tensor_loop(
+            vector_stop,
+            count,
+            1,
+            "irx.tensor.dot.tail",
+            scalar_step,
+            carried=[total],
+        )
+        return total
+
+    def _emit_matmul_dots(
+        self,
+        operands: _MatmulOperands,
+        result: ir.Value,
+        element_type: astx.DataType,
+    ) -> None:
+        """
+        title: Store one dot product per result element.
+        parameters:
+          operands:
+            type: _MatmulOperands
+          result:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+        """
+        builder = self._llvm.ir_builder
+
+        def store_dot(
+            indices: list[ir.Value], carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            row, column = indices
+            builder.store(
+                self._emit_tensor_dot(
+                    builder.gep(
+                        operands.lhs,
+                        [self._scaled_index(row, operands.lhs_row_stride)],
+                    ),
+                    builder.gep(
+                        operands.rhs,
+                        [
+                            self._scaled_index(
+                                column, operands.rhs_column_stride
+                            )
+                        ],
+                    ),
+                    element_type,
+                    lhs_stride=operands.lhs_inner_stride,
+                    rhs_stride=operands.rhs_inner_stride,
+                    count=operands.inner,
+                ),
+                builder.gep(
+                    result,
+                    [
+                        builder.add(
+                            self._scaled_index(row, operands.columns), column
+                        )
+                    ],
+                    inbounds=True,
+                ),
+            )
+            return carried
+
+        cast(Any, self)._emit_tensor_loop_nest(
+            (operands.rows, operands.columns),
+            "irx.tensor.matmul.dot",
+            store_dot,
+        )
+
+    def _emit_tensor_zero_fill(
+        self,
+        elements: ir.Value,
+        count: int,
+        element_type: astx.DataType,
+    ) -> None:
+        """
+        title: Store zero into every element of one fresh result.
+        parameters:
+          elements:
+            type: ir.Value
+          count:
+            type: int
+          element_type:
+            type: astx.DataType
+        """
+        builder = self._llvm.ir_builder
+        visitor = cast(Any, self)
+        size = tensor_element_size_bytes(element_type)
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        assert size is not None and llvm_type is not None
+        lanes = visitor._tensor_vector_width(element_type)
+        vector_type = ir.VectorType(llvm_type, lanes)
+        vector_stop = count - count % lanes
+
+        def vector_step(
+            index: ir.Value, carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            builder.store(
+                ir.Constant(vector_type, None),
+                visitor._tensor_vector_pointer(elements, index, vector_type),
+                align=size,
+            )
+            return carried
+
+        def scalar_step(
+            index: ir.Value, carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            builder.store(
+                ir.Constant(llvm_type, 0),
+                builder.gep(elements, [index], inbounds=True),
+            )
+            return carried
+
+        visitor._emit_tensor_loop(
+            0, vector_stop, lanes, "irx.tensor.zero.vector", vector_step
+        )
+        visitor._emit_tensor_loop(
+            vector_stop, count, 1, "irx.tensor.zero.tail", scalar_step
+        )
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorMatmul) -> None:
+        """
+        title: Visit TensorMatmul nodes.
+        summary: >-
+          Picks the tiled kernel with vector lanes when rhs columns are
+          contiguous, the dot-product kernel when both operands are
+          contiguous along k, and the tiled kernel with scalar lanes
+          otherwise. Operands computed by other tensor operations are
+          released once the kernel has run.
+        parameters:
+          node:
+            type: astx.TensorMatmul
+        """
+        visitor = cast(Any, self)
+        element_type = visitor._static_tensor_element_type(node.lhs)
+        size = tensor_element_size_bytes(element_type)
+        assert size is not None
+        rows, inner, lhs_row_stride, lhs_inner_stride = _matrix_layout(
+            visitor._static_tensor_layout(node.lhs), column=False
+        )
+        _, columns, rhs_inner_stride, rhs_column_stride = _matrix_layout(
+            visitor._static_tensor_layout(node.rhs), column=True
+        )
+        temporaries: list[ir.Value] = []
+        operands = _MatmulOperands(
+            lhs=visitor._tensor_operand_origin(node.lhs, temporaries),
+            rhs=visitor._tensor_operand_origin(node.rhs, temporaries),
+            rows=rows,
+            inner=inner,
+            columns=columns,
+            lhs_row_stride=lhs_row_stride,
+            lhs_inner_stride=lhs_inner_stride,
+            rhs_inner_stride=rhs_inner_stride,
+            rhs_column_stride=rhs_column_stride,
+        )
+
+        if not isinstance(self._resolved_ast_type(node), astx.TensorType):
+            result = self._emit_tensor_dot(
+                operands.lhs,
+                operands.rhs,
+                element_type,
+                lhs_stride=lhs_inner_stride,
+                rhs_stride=rhs_inner_stride,
+                count=inner,
+            )
+            for view in temporaries:
+                visitor._release_tensor_temporary(view)
+            self.result_stack.append(result)
+            return
+
+        result_value, result_elements = visitor._allocate_tensor_result(
+            node, element_type
+        )
+        lanes = visitor._tensor_vector_width(element_type)
+        columns_contiguous = rhs_column_stride == size
+        if columns_contiguous and columns >= lanes:
+            self._emit_tensor_zero_fill(
+                result_elements, rows * columns, element_type
+            )
+            self._emit_matmul_tiled(
+                operands, result_elements, element_type, lanes
+            )
+        elif lhs_inner_stride == size and rhs_inner_stride == size:
+            self._emit_matmul_dots(operands, result_elements, element_type)
+        else:
+            self._emit_tensor_zero_fill(
+                result_elements, rows * columns, element_type
+            )
+            self._emit_matmul_tiled(
+                operands,
+                result_elements,
+                element_type,
+                lanes if columns_contiguous else 1,
+            )
+        for view in temporaries:
+            visitor._release_tensor_temporary(view)
+        self.result_stack.append(result_value)
+
+
+__all__ = ["TensorMatmulVisitorMixin"]
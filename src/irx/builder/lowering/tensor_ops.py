@@ -0,0 +1,1336 @@
+# mypy: disable-error-code=no-redef
+# mypy: disable-error-code=untyped-decorator
+
+"""
+title: Tensor operation visitor mixin for llvmliteir.
+summary: >-
+  Lower elementwise Tensor arithmetic and reductions to loop nests over the
+  operand buffer views. Operands whose static layouts are contiguous run as
+  one flat loop over LLVM vector types with a scalar remainder; other
+  layouts, including broadcast operands, walk the result shape with the
+  static byte strides. Chains of elementwise operations fuse into the loop of
+  their outermost node, so only that node allocates a result.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, TypeAlias, cast
+
+from llvmlite import ir
+
+from irx import astx
+from irx.analysis.types import is_float_type, is_unsigned_type
+from irx.builder.core import VisitorCore, semantic_flag
+from irx.builder.protocols import VisitorMixinBase
+from irx.builder.runtime import safe_pop
+from irx.builder.vector import emit_int_div, splat_scalar
+from irx.builtins.collections.tensor import (
+    TensorLayout,
+    tensor_buffer_dtype,
+    tensor_element_count,
+    tensor_element_size_bytes,
+    tensor_is_c_contiguous,
+    tensor_is_f_contiguous,
+)
+from irx.typecheck import typechecked
+
+# One 256-bit register: AVX2 on x86-64, a NEON register pair on AArch64.
+TENSOR_VECTOR_BYTES = 32
+
+_TensorOperand: TypeAlias = ir.Value | tuple[ir.Value, TensorLayout]
+_TensorMapNode: TypeAlias = astx.TensorElementwise | astx.TensorUnary
+# Tensor operations whose result is a freshly allocated owned tensor.
+_TENSOR_RESULT_NODES = (
+    astx.TensorElementwise,
+    astx.TensorUnary,
+    astx.TensorReduce,
+    astx.TensorMatmul,
+)
+
+
+@typechecked
+def _tensor_map_children(node: astx.AST) -> tuple[astx.AST, ...]:
+    """
+    title: Return the operands of one elementwise tensor node.
+    parameters:
+      node:
+        type: astx.AST
+    returns:
+      type: tuple[astx.AST, Ellipsis]
+    """
+    if isinstance(node, astx.TensorElementwise):
+        return (node.lhs, node.rhs)
+    if isinstance(node, astx.TensorUnary):
+        return (node.operand,)
+    return ()
+
+
+@typechecked
+def _plan_tensor_fusion(root: _TensorMapNode) -> list[astx.AST]:
+    """
+    title: Return the leaves of the elementwise tree fused under one root.
+    summary: >-
+      Elementwise descendants used exactly once are evaluated inside the root
+      loop. Everything else, including an elementwise subexpression that the
+      tree reuses, is a leaf lowered once before the loop. Leaves are listed
+      once each, in first-use order.
+    parameters:
+      root:
+        type: _TensorMapNode
+    returns:
+      type: list[astx.AST]
+    """
+    uses: Counter[int] = Counter()
+
+    def count(node: astx.AST) -> None:
+        uses[id(node)] += 1
+        if uses[id(node)] == 1:
+            for child in _tensor_map_children(node):
+                count(child)
+
+    count(root)
+    leaves: dict[int, astx.AST] = {}
+
+    def collect(node: astx.AST) -> None:
+        if node is root or (
+            _tensor_map_children(node) and uses[id(node)] == 1
+        ):
+            for child in _tensor_map_children(node):
+                collect(child)
+            return
+        leaves.setdefault(id(node), node)
+
+    collect(root)
+    return list(leaves.values())
+
+
+@typechecked
+class TensorOpsVisitorMixin(VisitorMixinBase):
+    """
+    title: Tensor operation visitor mixin.
+    """
+
+    def _tensor_vector_width(self, element_type: astx.DataType) -> int:
+        """
+        title: Return the vector lane count used for one element type.
+        parameters:
+          element_type:
+            type: astx.DataType
+        returns:
+          type: int
+        """
+        size = tensor_element_size_bytes(element_type)
+        if size is None:
+            raise Exception("tensor operations require fixed-width elements")
+        return max(TENSOR_VECTOR_BYTES // size, 1)
+
+    def _tensor_intrinsic(
+        self,
+        name: str,
+        overload_type: ir.Type,
+        return_type: ir.Type,
+        arg_types: list[ir.Type],
+    ) -> ir.Function:
+        """
+        title: Declare one overloaded LLVM intrinsic for a scalar or vector.
+        parameters:
+          name:
+            type: str
+          overload_type:
+            type: ir.Type
+          return_type:
+            type: ir.Type
+          arg_types:
+            type: list[ir.Type]
+        returns:
+          type: ir.Function
+        """
+        element = (
+            overload_type.element
+            if isinstance(overload_type, ir.VectorType)
+            else overload_type
+        )
+        if isinstance(element, ir.FloatType):
+            suffix = "f32"
+        elif isinstance(element, ir.DoubleType):
+            suffix = "f64"
+        elif isinstance(element, ir.IntType):
+            suffix = f"i{element.width}"
+        else:
+            raise Exception(f"tensor intrinsic has unsupported type {element}")
+        if isinstance(overload_type, ir.VectorType):
+            suffix = f"v{overload_type.count}{suffix}"
+
+        full_name = f"llvm.{name}.{suffix}"
+        if full_name in self._llvm.module.globals:
+            return cast(ir.Function, self._llvm.module.get_global(full_name))
+        return ir.Function(
+            self._llvm.module,
+            ir.FunctionType(return_type, arg_types),
+            full_name,
+        )
+
+    def _emit_tensor_loop(
+        self,
+        start: int,
+        stop: int,
+        step: int,
+        name: str,
+        body: Callable[[ir.Value, list[ir.Value]], list[ir.Value]],
+        *,
+        carried: list[ir.Value] | None = None,
+    ) -> list[ir.Value]:
+        """
+        title: Emit one counted loop with static bounds.
+        summary: >-
+          The trip count is known, so the loop is bottom-tested and skipped
+          entirely when it is empty. The index and every carried value are
+          phi nodes; body receives them and returns the next carried values,
+          and the final carried values are returned.
+        parameters:
+          start:
+            type: int
+          stop:
+            type: int
+          step:
+            type: int
+          name:
+            type: str
+          body:
+            type: Callable[[ir.Value, list[ir.Value]], list[ir.Value]]
+          carried:
+            type: list[ir.Value] | None
+        returns:
+          type: list[ir.Value]
+        """
+        initial = list(carried or [])
+        if start >= stop:
+            return initial
+
+        builder = self._llvm.ir_builder
+        preheader = builder.block
+        body_block = builder.function.append_basic_block(f"{name}.body")
+        exit_block = builder.function.append_basic_block(f"{name}.exit")
+        builder.branch(body_block)
+
+        builder.position_at_start(body_block)
+        index = builder.phi(self._llvm.INT64_TYPE, name=f"{name}_index")
+        index.add_incoming(
+            ir.Constant(self._llvm.INT64_TYPE, start), preheader
+        )
+        phis = []
+        for position, value in enumerate(initial):
+            phi = builder.phi(value.type, name=f"{name}_carried_{position}")
+            phi.add_incoming(value, preheader)
+            phis.append(phi)
+
+        updated = body(index, list(phis))
+        next_index = builder.add(
+            index,
+            ir.Constant(self._llvm.INT64_TYPE, step),
+            name=f"{name}_next",
+        )
+        latch = builder.block
+        index.add_incoming(next_index, latch)
+        for phi, value in zip(phis, updated, strict=True):
+            phi.add_incoming(value, latch)
+        has_next = builder.icmp_signed(
+            "<",
+            next_index,
+            ir.Constant(self._llvm.INT64_TYPE, stop),
+            name=f"{name}_has_next",
+        )
+        builder.cbranch(has_next, body_block, exit_block)
+        builder.position_at_start(exit_block)
+        return updated
+
+    def _emit_tensor_loop_nest(
+        self,
+        shape: tuple[int, ...],
+        name: str,
+        body: Callable[[list[ir.Value], list[ir.Value]], list[ir.Value]],
+        *,
+        carried: list[ir.Value] | None = None,
+    ) -> list[ir.Value]:
+        """
+        title: Emit one unit-step loop per axis of a static shape.
+        parameters:
+          shape:
+            type: tuple[int, Ellipsis]
+          name:
+            type: str
+          body:
+            type: Callable[[list[ir.Value], list[ir.Value]], list[ir.Value]]
+          carried:
+            type: list[ir.Value] | None
+        returns:
+          type: list[ir.Value]
+        """
+
+        def nest(
+            axis: int,
+            indices: list[ir.Value],
+            values: list[ir.Value],
+        ) -> list[ir.Value]:
+            if axis == len(shape):
+                return body(indices, values)
+            return self._emit_tensor_loop(
+                0,
+                shape[axis],
+                1,
+                f"{name}.{axis}",
+                lambda index, inner: nest(axis + 1, [*indices, index], inner),
+                carried=values,
+            )
+
+        return nest(0, [], list(carried or []))
+
+    def _tensor_linear_offset(
+        self,
+        indices: list[ir.Value],
+        strides: tuple[int, ...],
+    ) -> ir.Value:
+        """
+        title: Return the stride-weighted sum of one index tuple.
+        parameters:
+          indices:
+            type: list[ir.Value]
+          strides:
+            type: tuple[int, Ellipsis]
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        offset: ir.Value = ir.Constant(self._llvm.INT64_TYPE, 0)
+        for axis, (index, stride) in enumerate(
+            zip(indices, strides, strict=True)
+        ):
+            if stride == 0:
+                continue
+            term = builder.mul(
+                index,
+                ir.Constant(self._llvm.INT64_TYPE, stride),
+                name=f"irx_tensor_op_scaled_{axis}",
+            )
+            offset = builder.add(offset, term, name="irx_tensor_op_offset")
+        return offset
+
+    def _tensor_element_at(
+        self,
+        origin: ir.Value,
+        offset_bytes: ir.Value,
+        element_ptr_type: ir.PointerType,
+    ) -> ir.Value:
+        """
+        title: Return a typed element pointer at one byte offset.
+        parameters:
+          origin:
+            type: ir.Value
+          offset_bytes:
+            type: ir.Value
+          element_ptr_type:
+            type: ir.PointerType
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        return builder.bitcast(
+            builder.gep(origin, [offset_bytes], name="irx_tensor_op_byte_ptr"),
+            element_ptr_type,
+            name="irx_tensor_op_element_ptr",
+        )
+
+    def _tensor_operand_origin(
+        self,
+        node: astx.AST,
+        temporaries: list[ir.Value],
+    ) -> ir.Value:
+        """
+        title: Lower one tensor operand to a byte pointer at its first element.
+        summary: >-
+          When the operand is the fresh result of another tensor operation,
+          its view is appended to temporaries; the caller releases it with
+          _release_tensor_temporary once nothing reads it anymore.
+        parameters:
+          node:
+            type: astx.AST
+          temporaries:
+            type: list[ir.Value]
+        returns:
+          type: ir.Value
+        """
+        view = cast(Any, self)._require_tensor_value(node)
+        if isinstance(node, _TENSOR_RESULT_NODES):
+            temporaries.append(view)
+        return self._tensor_view_origin(view)
+
+    def _tensor_view_origin(self, view: ir.Value) -> ir.Value:
+        """
+        title: Return a byte pointer at the first element of one tensor value.
+        parameters:
+          view:
+            type: ir.Value
+        returns:
+          type: ir.Value
+        """
+        visitor = cast(Any, self)
+        return self._llvm.ir_builder.gep(
+            visitor._extract_view_field(
+                view, "data", name="irx_tensor_op_data"
+            ),
+            [
+                visitor._extract_view_field(
+                    view,
+                    "offset_bytes",
+                    name="irx_tensor_op_offset_bytes",
+                )
+            ],
+            name="irx_tensor_op_origin",
+        )
+
+    def _lower_tensor_scalar(
+        self,
+        node: astx.AST,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Lower one scalar elementwise operand to the element type.
+        summary: >-
+          The scalar is evaluated once, before the loop, and reused by every
+          iteration.
+        parameters:
+          node:
+            type: astx.AST
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        self.visit_child(node)
+        value = safe_pop(self.result_stack)
+        if value is None:
+            raise Exception("tensor elementwise expected a scalar operand")
+        return self._cast_ast_value(
+            value,
+            source_type=self._resolved_ast_type(node),
+            target_type=element_type,
+        )
+
+    def _allocate_tensor_result(
+        self,
+        node: astx.AST,
+        element_type: astx.DataType,
+    ) -> tuple[ir.Value, ir.Value]:
+        """
+        title: Allocate owned storage for one result tensor.
+        summary: >-
+          Returns the tensor value and a typed pointer to its first element.
+          The runtime owner frees the storage on the last release.
+        parameters:
+          node:
+            type: astx.AST
+          element_type:
+            type: astx.DataType
+        returns:
+          type: tuple[ir.Value, ir.Value]
+        """
+        visitor = cast(Any, self)
+        layout = visitor._static_tensor_layout(node)
+        size = tensor_element_size_bytes(element_type)
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        dtype = tensor_buffer_dtype(element_type)
+        if size is None or llvm_type is None or dtype is None:
+            raise Exception("tensor operations require fixed-width elements")
+
+        alloc = self.require_runtime_symbol("buffer", "irx_buffer_owner_alloc")
+        data_slot = self.create_entry_block_alloca(
+            "irx_tensor_result_data_slot",
+            self._llvm.OPAQUE_POINTER_TYPE,
+        )
+        owner_slot = self.create_entry_block_alloca(
+            "irx_tensor_result_owner_slot",
+            self._llvm.BUFFER_OWNER_HANDLE_TYPE,
+        )
+        builder = self._llvm.ir_builder
+        builder.call(
+            alloc,
+            [
+                ir.Constant(
+                    self._llvm.INT64_TYPE,
+                    tensor_element_count(layout) * size,
+                ),
+                data_slot,
+                owner_slot,
+            ],
+        )
+        data = builder.load(data_slot, name="irx_tensor_result_data")
+        value = visitor._tensor_value_from_parts(
+            data=data,
+            owner=builder.load(owner_slot, name="irx_tensor_result_owner"),
+            dtype=visitor._buffer_handle_value(
+                dtype,
+                self._llvm.OPAQUE_POINTER_TYPE,
+            ),
+            layout=layout,
+            flags=visitor._static_tensor_flags(node),
+        )
+        elements = builder.bitcast(
+            data,
+            llvm_type.as_pointer(),
+            name="irx_tensor_result_elements",
+        )
+        return value, elements
+
+    def _emit_tensor_binary(
+        self,
+        op_code: str,
+        lhs: ir.Value,
+        rhs: ir.Value,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Emit one elementwise binary operation on scalars or vectors.
+        parameters:
+          op_code:
+            type: str
+          lhs:
+            type: ir.Value
+          rhs:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        if op_code in {"min", "max"}:
+            if is_float_type(element_type):
+                name = "minnum" if op_code == "min" else "maxnum"
+            else:
+                sign = "u" if is_unsigned_type(element_type) else "s"
+                name = f"{sign}{op_code}"
+            intrinsic = self._tensor_intrinsic(
+                name, lhs.type, lhs.type, [lhs.type, lhs.type]
+            )
+            return builder.call(
+                intrinsic, [lhs, rhs], name=f"irx_tensor_{name}"
+            )
+
+        result: ir.Instruction
+        if is_float_type(element_type):
+            emit = {
+                "+": builder.fadd,
+                "-": builder.fsub,
+                "*": builder.fmul,
+                "/": builder.fdiv,
+            }
+            result = emit[op_code](lhs, rhs, name="irx_tensor_op")
+        elif op_code == "/":
+            result = emit_int_div(
+                builder, lhs, rhs, is_unsigned_type(element_type)
+            )
+        else:
+            emit = {"+": builder.add, "-": builder.sub, "*": builder.mul}
+            result = emit[op_code](lhs, rhs, name="irx_tensor_op")
+        self._apply_fast_math(result)
+        return result
+
+    def _emit_tensor_unary(
+        self,
+        op_code: str,
+        value: ir.Value,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Emit one elementwise unary operation on scalars or vectors.
+        parameters:
+          op_code:
+            type: str
+          value:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        is_float = is_float_type(element_type)
+        if op_code == "-":
+            if is_float:
+                result = builder.fneg(value, name="irx_tensor_neg")
+                self._apply_fast_math(result)
+                return result
+            return builder.neg(value, name="irx_tensor_neg")
+        if op_code == "sqrt" or (op_code == "abs" and is_float):
+            name = "sqrt" if op_code == "sqrt" else "fabs"
+            intrinsic = self._tensor_intrinsic(
+                name, value.type, value.type, [value.type]
+            )
+            return builder.call(intrinsic, [value], name=f"irx_tensor_{name}")
+        if is_unsigned_type(element_type):
+            return value
+        intrinsic = self._tensor_intrinsic(
+            "abs",
+            value.type,
+            value.type,
+            [value.type, ir.IntType(1)],
+        )
+        return builder.call(
+            intrinsic,
+            [value, ir.Constant(ir.IntType(1), 0)],
+            name="irx_tensor_abs",
+        )
+
+    def _lower_tensor_map(
+        self,
+        node: astx.AST,
+        operands: list[_TensorOperand],
+        element_type: astx.DataType,
+        combine: Callable[[list[ir.Value]], ir.Value],
+    ) -> None:
+        """
+        title: Lower one elementwise map into a new result tensor.
+        summary: >-
+          When every tensor operand is C-contiguous with the result shape, the
+          map is one flat loop of vector loads and stores plus a scalar
+          remainder; scalars are splatted once. Otherwise a loop nest walks
+          the result shape, reading broadcast axes with a zero stride.
+        parameters:
+          node:
+            type: astx.AST
+          operands:
+            type: list[_TensorOperand]
+          element_type:
+            type: astx.DataType
+          combine:
+            type: Callable[[list[ir.Value]], ir.Value]
+        """
+        builder = self._llvm.ir_builder
+        result_value, result_elements = self._allocate_tensor_result(
+            node,
+            element_type,
+        )
+        layout = cast(Any, self)._static_tensor_layout(node)
+        size = tensor_element_size_bytes(element_type)
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        assert size is not None and llvm_type is not None
+        element_ptr_type = llvm_type.as_pointer()
+
+        flat = all(
+            not isinstance(operand, tuple)
+            or (
+                operand[1].shape == layout.shape
+                and tensor_is_c_contiguous(operand[1], size)
+            )
+            for operand in operands
+        )
+        if flat:
+            count = tensor_element_count(layout)
+            width = self._tensor_vector_width(element_type)
+            vector_type = ir.VectorType(llvm_type, width)
+            origins = [
+                builder.bitcast(
+                    operand[0],
+                    element_ptr_type,
+                    name="irx_tensor_op_elements",
+                )
+                if isinstance(operand, tuple)
+                else None
+                for operand in operands
+            ]
+            vector_stop = count - count % width if width > 1 else 0
+            if vector_stop:
+                splats = [
+                    None
+                    if isinstance(operand, tuple)
+                    else splat_scalar(builder, operand, vector_type)
+                    for operand in operands
+                ]
+
+                def vector_body(
+                    index: ir.Value, carried: list[ir.Value]
+                ) -> list[ir.Value]:
+                    values = [
+                        splat
+                        if origin is None
+                        else builder.load(
+                            self._tensor_vector_pointer(
+                                origin, index, vector_type
+                            ),
+                            name="irx_tensor_op_vector",
+                            align=size,
+                        )
+                        for origin, splat in zip(origins, splats, strict=True)
+                    ]
+                    builder.store(
+                        combine(values),
+                        self._tensor_vector_pointer(
+                            result_elements, index, vector_type
+                        ),
+                        align=size,
+                    )
+                    return carried
+
+                self._emit_tensor_loop(
+                    0, vector_stop, width, "irx.tensor.map.vector", vector_body
+                )
+
+            def scalar_body(
+                index: ir.Value, carried: list[ir.Value]
+            ) -> list[ir.Value]:
+                values = [
+                    operand
+                    if origin is None
+                    else builder.load(
+                        builder.gep(origin, [index], inbounds=True),
+                        name="irx_tensor_op_scalar",
+                    )
+                    for origin, operand in zip(origins, operands, strict=True)
+                ]
+                builder.store(
+                    combine(values),
+                    builder.gep(result_elements, [index], inbounds=True),
+                )
+                return carried
+
+            self._emit_tensor_loop(
+                vector_stop, count, 1, "irx.tensor.map.tail", scalar_body
+            )
+            self.result_stack.append(result_value)
+            return
+
+        strides = [
+            self._tensor_broadcast_strides(operand[1], layout.shape)
+            if isinstance(operand, tuple)
+            else None
+            for operand in operands
+        ]
+        result_strides = tuple(stride // size for stride in layout.strides)
+
+        def nest_body(
+            indices: list[ir.Value], carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            values = [
+                operand
+                if operand_strides is None
+                else builder.load(
+                    self._tensor_element_at(
+                        operand[0],
+                        self._tensor_linear_offset(indices, operand_strides),
+                        element_ptr_type,
+                    ),
+                    name="irx_tensor_op_scalar",
+                )
+                for operand, operand_strides in zip(
+                    operands, strides, strict=True
+                )
+            ]
+            builder.store(
+                combine(values),
+                builder.gep(
+                    result_elements,
+                    [self._tensor_linear_offset(indices, result_strides)],
+                    inbounds=True,
+                ),
+            )
+            return carried
+
+        self._emit_tensor_loop_nest(layout.shape, "irx.tensor.map", nest_body)
+        self.result_stack.append(result_value)
+
+    def _tensor_vector_pointer(
+        self,
+        elements: ir.Value,
+        index: ir.Value,
+        vector_type: ir.VectorType,
+    ) -> ir.Value:
+        """
+        title: Return a vector pointer at one element index.
+        parameters:
+          elements:
+            type: ir.Value
+          index:
+            type: ir.Value
+          vector_type:
+            type: ir.VectorType
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        return builder.bitcast(
+            builder.gep(
+                elements,
+                [index],
+                inbounds=True,
+                name="irx_tensor_op_lane_ptr",
+            ),
+            vector_type.as_pointer(),
+            name="irx_tensor_op_vector_ptr",
+        )
+
+    def _tensor_broadcast_strides(
+        self,
+        layout: TensorLayout,
+        shape: tuple[int, ...],
+    ) -> tuple[int, ...]:
+        """
+        title: Return operand byte strides aligned to a broadcast shape.
+        summary: >-
+          Missing leading axes and stretched unit axes get a zero stride so
+          every result index reads the same operand element along them.
+        parameters:
+          layout:
+            type: TensorLayout
+          shape:
+            type: tuple[int, Ellipsis]
+        returns:
+          type: tuple[int, Ellipsis]
+        """
+        lead = len(shape) - layout.ndim
+        return tuple(
+            0
+            if axis < lead or layout.shape[axis - lead] != dim
+            else layout.strides[axis - lead]
+            for axis, dim in enumerate(shape)
+        )
+
+    def _tensor_reduce_identity(
+        self,
+        op: str,
+        llvm_type: ir.Type,
+        element_type: astx.DataType,
+    ) -> ir.Constant:
+        """
+        title: Return the identity value of one reduction accumulator.
+        parameters:
+          op:
+            type: str
+          llvm_type:
+            type: ir.Type
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Constant
+        """
+        if op in {"sum", "mean"}:
+            return ir.Constant(llvm_type, 0)
+        if isinstance(llvm_type, (ir.FloatType, ir.DoubleType)):
+            return ir.Constant(
+                llvm_type, float("inf") if op == "min" else float("-inf")
+            )
+        width = llvm_type.width
+        if is_unsigned_type(element_type):
+            return ir.Constant(
+                llvm_type, (1 << width) - 1 if op == "min" else 0
+            )
+        return ir.Constant(
+            llvm_type,
+            (1 << (width - 1)) - 1 if op == "min" else -(1 << (width - 1)),
+        )
+
+    def _emit_tensor_widen(
+        self,
+        value: ir.Value,
+        target_type: ir.Type,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Widen loaded integer elements to the accumulator type.
+        parameters:
+          value:
+            type: ir.Value
+          target_type:
+            type: ir.Type
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        if value.type == target_type:
+            return value
+        builder = self._llvm.ir_builder
+        if is_unsigned_type(element_type):
+            return builder.zext(value, target_type, name="irx_tensor_widen")
+        return builder.sext(value, target_type, name="irx_tensor_widen")
+
+    def _emit_tensor_horizontal_reduce(
+        self,
+        op: str,
+        vector: ir.Value,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Reduce the lanes of one vector accumulator to a scalar.
+        parameters:
+          op:
+            type: str
+          vector:
+            type: ir.Value
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        scalar_type = vector.type.element
+        args = [vector]
+        if isinstance(scalar_type, (ir.FloatType, ir.DoubleType)):
+            if op in {"sum", "mean"}:
+                name = "fadd"
+                args = [ir.Constant(scalar_type, 0.0), vector]
+            else:
+                name = "fmin" if op == "min" else "fmax"
+        elif op in {"sum", "mean"}:
+            name = "add"
+        else:
+            sign = "u" if is_unsigned_type(element_type) else "s"
+            name = f"{sign}{op}"
+        intrinsic = self._tensor_intrinsic(
+            f"vector.reduce.{name}",
+            vector.type,
+            scalar_type,
+            [arg.type for arg in args],
+        )
+        call = self._llvm.ir_builder.call(
+            intrinsic, args, name="irx_tensor_reduce_lanes"
+        )
+        self._apply_fast_math(call)
+        return call
+
+    def _reduce_contiguous_run(
+        self,
+        elements: ir.Value,
+        count: int,
+        op: str,
+        element_type: astx.DataType,
+        accumulator_type: ir.Type,
+    ) -> ir.Value:
+        """
+        title: Reduce one run of adjacent elements with vector accumulators.
+        summary: >-
+          A vector accumulator absorbs whole vectors, its lanes are reduced
+          once after the loop, and a scalar loop folds in the remainder.
+        parameters:
+          elements:
+            type: ir.Value
+          count:
+            type: int
+          op:
+            type: str
+          element_type:
+            type: astx.DataType
+          accumulator_type:
+            type: ir.Type
+        returns:
+          type: ir.Value
+        """
+        builder = self._llvm.ir_builder
+        combine_op = "+" if op in {"sum", "mean"} else op
+        width = self._tensor_vector_width(element_type)
+        size = tensor_element_size_bytes(element_type)
+        assert size is not None
+        identity = self._tensor_reduce_identity(
+            op, accumulator_type, element_type
+        )
+        accumulator: ir.Value = identity
+        vector_stop = count - count % width if width > 1 else 0
+        if vector_stop:
+            vector_type = ir.VectorType(elements.type.pointee, width)
+            accumulator_vector_type = ir.VectorType(accumulator_type, width)
+
+            def vector_body(
+                index: ir.Value, carried: list[ir.Value]
+            ) -> list[ir.Value]:
+                loaded = builder.load(
+                    self._tensor_vector_pointer(elements, index, vector_type),
+                    name="irx_tensor_reduce_vector",
+                    align=size,
+                )
+                return [
+                    self._emit_tensor_binary(
+                        combine_op,
+                        carried[0],
+                        self._emit_tensor_widen(
+                            loaded, accumulator_vector_type, element_type
+                        ),
+                        element_type,
+                    )
+                ]
+
+            (lanes,) = self._emit_tensor_loop(
+                0,
+                vector_stop,
+                width,
+                "irx.tensor.reduce.vector",
+                vector_body,
+                carried=[
+                    ir.Constant(accumulator_vector_type, [identity] * width)
+                ],
+            )
+            accumulator = self._emit_tensor_horizontal_reduce(
+                op, lanes, element_type
+            )
+
+        def scalar_body(
+            index: ir.Value, carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            loaded = builder.load(
+                builder.gep(elements, [index], inbounds=True),
+                name="irx_tensor_reduce_scalar",
+            )
+            return [
+                self._emit_tensor_binary(
+                    combine_op,
+                    carried[0],
+                    self._emit_tensor_widen(
+                        loaded, accumulator_type, element_type
+                    ),
+                    element_type,
+                )
+            ]
+
+        (accumulator,) = self._emit_tensor_loop(
+            vector_stop,
+            count,
+            1,
+            "irx.tensor.reduce.tail",
+            scalar_body,
+            carried=[accumulator],
+        )
+        return accumulator
+
+    def _finish_tensor_reduce(
+        self,
+        op: str,
+        accumulator: ir.Value,
+        count: int,
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Turn one reduction accumulator into the reduction result.
+        parameters:
+          op:
+            type: str
+          accumulator:
+            type: ir.Value
+          count:
+            type: int
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        if op != "mean":
+            return accumulator
+        builder = self._llvm.ir_builder
+        if not is_float_type(element_type):
+            convert = (
+                builder.uitofp
+                if is_unsigned_type(element_type)
+                else builder.sitofp
+            )
+            accumulator = convert(
+                accumulator,
+                self._llvm.DOUBLE_TYPE,
+                name="irx_tensor_mean_total",
+            )
+        result = builder.fdiv(
+            accumulator,
+            ir.Constant(accumulator.type, float(count)),
+            name="irx_tensor_mean",
+        )
+        self._apply_fast_math(result)
+        return result
+
+    def _release_tensor_temporary(self, view: ir.Value) -> None:
+        """
+        title: Release one intermediate result tensor.
+        parameters:
+          view:
+            type: ir.Value
+        """
+        release = self.require_runtime_symbol(
+            "buffer",
+            "irx_buffer_view_release",
+        )
+        slot = self.create_entry_block_alloca(
+            "irx_tensor_temporary_view",
+            self._llvm.BUFFER_VIEW_TYPE,
+        )
+        builder = self._llvm.ir_builder
+        builder.store(view, slot)
+        builder.call(release, [slot], name="irx_tensor_temporary_release")
+
+    def _emit_fused_tensor_node(
+        self,
+        node: astx.AST,
+        leaf_values: dict[int, ir.Value],
+        element_type: astx.DataType,
+    ) -> ir.Value:
+        """
+        title: Emit one fused elementwise node for the current loop lane.
+        summary: >-
+          With the node's fast_math flag set on floating-point elements, an
+          addition of an inline product contracts to one llvm.fma call.
+        parameters:
+          node:
+            type: astx.AST
+          leaf_values:
+            type: dict[int, ir.Value]
+          element_type:
+            type: astx.DataType
+        returns:
+          type: ir.Value
+        """
+        leaf = leaf_values.get(id(node))
+        if leaf is not None:
+            return leaf
+
+        def emit(child: astx.AST) -> ir.Value:
+            return self._emit_fused_tensor_node(
+                child, leaf_values, element_type
+            )
+
+        if isinstance(node, astx.TensorUnary):
+            return self._emit_tensor_unary(
+                node.op_code, emit(node.operand), element_type
+            )
+        if not isinstance(node, astx.TensorElementwise):
+            raise Exception("tensor fusion reached a non-elementwise node")
+
+        fast_math = is_float_type(element_type) and semantic_flag(
+            node, "fast_math"
+        )
+        previous_fast_math = self._fast_math_enabled
+        if fast_math:
+            self.set_fast_math(True)
+        try:
+            if fast_math and node.op_code == "+":
+                for product, addend in (
+                    (node.lhs, node.rhs),
+                    (node.rhs, node.lhs),
+                ):
+                    if (
+                        isinstance(product, astx.TensorElementwise)
+                        and product.op_code == "*"
+                        and id(product) not in leaf_values
+                    ):
+                        return self._emit_fma(
+                            emit(product.lhs),
+                            emit(product.rhs),
+                            emit(addend),
+                        )
+            return self._emit_tensor_binary(
+                node.op_code,
+                emit(node.lhs),
+                emit(node.rhs),
+                element_type,
+            )
+        finally:
+            self.set_fast_math(previous_fast_math)
+
+    def _lower_fused_tensor_map(self, root: _TensorMapNode) -> None:
+        """
+        title: Lower one elementwise expression tree as a single map.
+        summary: >-
+          Inline subexpressions never touch memory; only the root allocates a
+          result. Reused elementwise subexpressions are materialized once as
+          leaves and released after the loop.
+        parameters:
+          root:
+            type: _TensorMapNode
+        """
+        visitor = cast(Any, self)
+        element_type = visitor._static_tensor_element_type(root)
+        leaves = _plan_tensor_fusion(root)
+        operands: list[_TensorOperand] = []
+        temporaries: list[ir.Value] = []
+        for leaf in leaves:
+            if not isinstance(self._resolved_ast_type(leaf), astx.TensorType):
+                operands.append(self._lower_tensor_scalar(leaf, element_type))
+                continue
+            operands.append(
+                (
+                    self._tensor_operand_origin(leaf, temporaries),
+                    visitor._static_tensor_layout(leaf),
+                )
+            )
+
+        self._lower_tensor_map(
+            root,
+            operands,
+            element_type,
+            lambda values: self._emit_fused_tensor_node(
+                root,
+                {
+                    id(leaf): value
+                    for leaf, value in zip(leaves, values, strict=True)
+                },
+                element_type,
+            ),
+        )
+        for view in temporaries:
+            self._release_tensor_temporary(view)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorElementwise) -> None:
+        """
+        title: Visit TensorElementwise nodes.
+        parameters:
+          node:
+            type: astx.TensorElementwise
+        """
+        self._lower_fused_tensor_map(node)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorUnary) -> None:
+        """
+        title: Visit TensorUnary nodes.
+        parameters:
+          node:
+            type: astx.TensorUnary
+        """
+        self._lower_fused_tensor_map(node)
+
+    @VisitorCore.visit.dispatch
+    def visit(self, node: astx.TensorReduce) -> None:
+        """
+        title: Visit TensorReduce nodes.
+        summary: >-
+          Each reduced run whose elements are adjacent in memory goes through
+          the vector accumulator; other runs fold element by element. A base
+          computed by another tensor operation is released afterwards.
+        parameters:
+          node:
+            type: astx.TensorReduce
+        """
+        visitor = cast(Any, self)
+        layout = visitor._static_tensor_layout(node.base)
+        element_type = visitor._static_tensor_element_type(node.base)
+        size = tensor_element_size_bytes(element_type)
+        llvm_type = self._llvm_type_for_ast_type(element_type)
+        assert size is not None and llvm_type is not None
+        element_ptr_type = llvm_type.as_pointer()
+        accumulator_type = (
+            self._llvm.INT64_TYPE
+            if node.op == "mean" and not is_float_type(element_type)
+            else llvm_type
+        )
+        combine_op = "+" if node.op in {"sum", "mean"} else node.op
+
+        reduced_axes = (
+            tuple(range(layout.ndim)) if node.axis is None else (node.axis,)
+        )
+        kept_axes = tuple(
+            axis for axis in range(layout.ndim) if axis not in reduced_axes
+        )
+        reduced_shape = tuple(layout.shape[axis] for axis in reduced_axes)
+        reduced_strides = tuple(layout.strides[axis] for axis in reduced_axes)
+        count = 1
+        for dim in reduced_shape:
+            count *= dim
+        run = TensorLayout(shape=reduced_shape, strides=reduced_strides)
+        contiguous = tensor_is_c_contiguous(run, size) or (
+            tensor_is_f_contiguous(run, size)
+        )
+
+        temporaries: list[ir.Value] = []
+        origin = self._tensor_operand_origin(node.base, temporaries)
+        builder = self._llvm.ir_builder
+
+        def reduce_at(offset_bytes: ir.Value) -> ir.Value:
+            if contiguous:
+                accumulator = self._reduce_contiguous_run(
+                    self._tensor_element_at(
+                        origin, offset_bytes, element_ptr_type
+                    ),
+                    count,
+                    node.op,
+                    element_type,
+                    accumulator_type,
+                )
+            else:
+
+                def fold(
+                    indices: list[ir.Value], carried: list[ir.Value]
+                ) -> list[ir.Value]:
+                    element_offset = builder.add(
+                        offset_bytes,
+                        self._tensor_linear_offset(indices, reduced_strides),
+                        name="irx_tensor_reduce_offset",
+                    )
+                    loaded = builder.load(
+                        self._tensor_element_at(
+                            origin, element_offset, element_ptr_type
+                        ),
+                        name="irx_tensor_reduce_scalar",
+                    )
+                    return [
+                        self._emit_tensor_binary(
+                            combine_op,
+                            carried[0],
+                            self._emit_tensor_widen(
+                                loaded, accumulator_type, element_type
+                            ),
+                            element_type,
+                        )
+                    ]
+
+                (accumulator,) = self._emit_tensor_loop_nest(
+                    reduced_shape,
+                    "irx.tensor.reduce",
+                    fold,
+                    carried=[
+                        self._tensor_reduce_identity(
+                            node.op, accumulator_type, element_type
+                        )
+                    ],
+                )
+            return self._finish_tensor_reduce(
+                node.op, accumulator, count, element_type
+            )
+
+        if not isinstance(self._resolved_ast_type(node), astx.TensorType):
+            result = reduce_at(ir.Constant(self._llvm.INT64_TYPE, 0))
+            for view in temporaries:
+                self._release_tensor_temporary(view)
+            self.result_stack.append(result)
+            return
+
+        result_element_type = visitor._static_tensor_element_type(node)
+        result_value, result_elements = self._allocate_tensor_result(
+            node,
+            result_element_type,
+        )
+        kept_shape = tuple(layout.shape[axis] for axis in kept_axes)
+        kept_strides = tuple(layout.strides[axis] for axis in kept_axes)
+        result_layout = visitor._static_tensor_layout(node)
+        result_size = tensor_element_size_bytes(result_element_type)
+        assert result_size is not None
+        result_strides = tuple(
+            stride // result_size for stride in result_layout.strides
+        )
+
+        def store_reduction(
+            indices: list[ir.Value], carried: list[ir.Value]
+        ) -> list[ir.Value]:
+            builder.store(
+                reduce_at(self._tensor_linear_offset(indices, kept_strides)),
+                builder.gep(
+                    result_elements,
+                    [self._tensor_linear_offset(indices, result_strides)],
+                    inbounds=True,
+                ),
+            )
+            return carried
+
+        self._emit_tensor_loop_nest(
+            kept_shape, "irx.tensor.reduce.outer", store_reduction
+        )
+        for view in temporaries:
+            self._release_tensor_temporary(view)
+        self.result_stack.append(result_value)
+
+
+__all__ = ["TensorOpsVisitorMixin"]
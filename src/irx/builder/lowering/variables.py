@@ -205,24 +205,8 @@ class VariableVisitorMixin(VisitorMixinBase):
             self._llvm.ir_builder.store(init_val, alloca)
         else:
             if type_str == "string":
-                empty_str_type = ir.ArrayType(self._llvm.INT8_TYPE, 1)
-                empty_str_global = ir.GlobalVariable(
-                    self._llvm.module,
-                    empty_str_type,
-                    name=f"empty_str_{node.name}",
-                )
-                empty_str_global.linkage = "internal"
-                empty_str_global.global_constant = True
-                empty_str_global.initializer = ir.Constant(
-                    empty_str_type, bytearray(b"\0")
-                )
-                init_val = self._llvm.ir_builder.gep(
-                    empty_str_global,
-                    [
-                        ir.Constant(ir.IntType(32), 0),
-                        ir.Constant(ir.IntType(32), 0),
-                    ],
-                    inbounds=True,
+                init_val = self._string_literal_pointer(
+                    b"", name=f"empty_str_{node.name}"
                 )
                 alloca = (
                     existing_storage
@@ -4,7 +4,8 @@ title: Typing protocols for llvmliteir visitors.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Protocol, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Protocol, cast
 
 from llvmlite import binding as llvm
 from llvmlite import ir
@@ -12,11 +13,15 @@ from llvmlite import ir
 from irx import astx
 from irx.analysis.resolved_nodes import FunctionSignature
 from irx.base.visitors.protocols import BaseVisitorProtocol
+from irx.buffer import BufferIndexBoundsPolicy
 from irx.builder.state import (
     CleanupEmitter,
+    FusedGeneratorTargets,
+    HoistedBufferDescriptor,
     LoopTargets,
     NamedValueMap,
     ResultStackValue,
+    TemporaryArenaScope,
 )
 from irx.builder.types import VariablesLLVM
 from irx.typecheck import typechecked
@@ -69,6 +74,20 @@ class VisitorProtocol(BaseVisitorProtocol, Protocol):
         type: ir.Value | None
       _current_generator_next_state:
         type: int | None
+      _fused_generator_stack:
+        type: list[FusedGeneratorTargets]
+      arena_temporaries:
+        type: bool
+      _temporary_arena:
+        type: TemporaryArenaScope | None
+      bounds_policy:
+        type: BufferIndexBoundsPolicy
+      _buffer_bounds_guards:
+        type: dict[int, ir.Value]
+      _hoisted_buffer_descriptors:
+        type: dict[str, HoistedBufferDescriptor]
+      _lowering_module_interface:
+        type: bool
       target:
         type: llvm.TargetRef
       target_machine:
@@ -95,6 +114,13 @@ class VisitorProtocol(BaseVisitorProtocol, Protocol):
     _current_generator_frame_slots: dict[str, int]
     _current_generator_out_ptr: ir.Value | None
     _current_generator_next_state: int | None
+    _fused_generator_stack: list[FusedGeneratorTargets]
+    arena_temporaries: bool
+    _temporary_arena: TemporaryArenaScope | None
+    bounds_policy: BufferIndexBoundsPolicy
+    _buffer_bounds_guards: dict[int, ir.Value]
+    _hoisted_buffer_descriptors: dict[str, HoistedBufferDescriptor]
+    _lowering_module_interface: bool
     target: llvm.TargetRef
     target_machine: llvm.TargetMachine
 
@@ -252,6 +278,15 @@ class VisitorProtocol(BaseVisitorProtocol, Protocol):
         """
         ...
 
+    @contextmanager
+    def _arena_temporary_scope(self) -> Iterator[None]:
+        """
+        title: Recycle arena temporaries carved inside one lowered scope.
+        returns:
+          type: Iterator[None]
+        """
+        ...
+
     def require_runtime_symbol(
         self, _feature_name: str, _symbol_name: str
     ) -> ir.Function:
@@ -395,6 +430,73 @@ class VisitorProtocol(BaseVisitorProtocol, Protocol):
         """
         ...
 
+    def _handle_string_concatenation_chain(
+        self, _operands: list[ir.Value]
+    ) -> ir.Value:
+        """
+        title: Concatenate several strings through one string builder.
+        parameters:
+          _operands:
+            type: list[ir.Value]
+        returns:
+          type: ir.Value
+        """
+        ...
+
+    def _string_literal_global(
+        self, _data: bytes, *, name: str
+    ) -> ir.GlobalVariable:
+        """
+        title: Emit one constant length-prefixed string global.
+        parameters:
+          _data:
+            type: bytes
+          name:
+            type: str
+        returns:
+          type: ir.GlobalVariable
+        """
+        ...
+
+    def _string_literal_data(
+        self, _literal: ir.GlobalVariable, *, name: str = ""
+    ) -> ir.Value:
+        """
+        title: Return the character data of one string literal global.
+        parameters:
+          _literal:
+            type: ir.GlobalVariable
+          name:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        ...
+
+    def _string_literal_pointer(self, _data: bytes, *, name: str) -> ir.Value:
+        """
+        title: Emit one constant length-prefixed string and return its data.
+        parameters:
+          _data:
+            type: bytes
+          name:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        ...
+
+    def _import_foreign_string(self, _value: ir.Value) -> ir.Value:
+        """
+        title: Convert one foreign C string into the IRx string layout.
+        parameters:
+          _value:
+            type: ir.Value
+        returns:
+          type: ir.Value
+        """
+        ...
+
     def _common_list_element_type(
         self, _lhs_ty: ir.Type, _rhs_ty: ir.Type
     ) -> ir.Type:
@@ -502,7 +604,10 @@ class VisitorProtocol(BaseVisitorProtocol, Protocol):
         return cast(tuple[ir.Value, str], (None, ""))
 
     def _snprintf_heap(
-        self, _fmt_gv: ir.GlobalVariable, _args: list[ir.Value]
+        self,
+        _fmt_gv: ir.GlobalVariable,
+        _args: list[ir.Value],
+        temporary: bool = False,
     ) -> ir.Value:
         """
         title: Snprintf heap.
@@ -511,6 +616,29 @@ class VisitorProtocol(BaseVisitorProtocol, Protocol):
             type: ir.GlobalVariable
           _args:
             type: list[ir.Value]
+          temporary:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        ...
+
+    def _format_string(
+        self,
+        _fmt_gv: ir.GlobalVariable,
+        _args: list[ir.Value],
+        *,
+        temporary: bool = False,
+    ) -> ir.Value:
+        """
+        title: Format values straight into a new IRx string.
+        parameters:
+          _fmt_gv:
+            type: ir.GlobalVariable
+          _args:
+            type: list[ir.Value]
+          temporary:
+            type: bool
         returns:
           type: ir.Value
         """
@@ -573,6 +701,20 @@ class VisitorMixinTypingBase:
         type: ir.Value | None
       _current_generator_next_state:
         type: int | None
+      _fused_generator_stack:
+        type: list[FusedGeneratorTargets]
+      arena_temporaries:
+        type: bool
+      _temporary_arena:
+        type: TemporaryArenaScope | None
+      bounds_policy:
+        type: BufferIndexBoundsPolicy
+      _buffer_bounds_guards:
+        type: dict[int, ir.Value]
+      _hoisted_buffer_descriptors:
+        type: dict[str, HoistedBufferDescriptor]
+      _lowering_module_interface:
+        type: bool
       target:
         type: llvm.TargetRef
       target_machine:
@@ -599,6 +741,13 @@ class VisitorMixinTypingBase:
     _current_generator_frame_slots: dict[str, int]
     _current_generator_out_ptr: ir.Value | None
     _current_generator_next_state: int | None
+    _fused_generator_stack: list[FusedGeneratorTargets]
+    arena_temporaries: bool
+    _temporary_arena: TemporaryArenaScope | None
+    bounds_policy: BufferIndexBoundsPolicy
+    _buffer_bounds_guards: dict[int, ir.Value]
+    _hoisted_buffer_descriptors: dict[str, HoistedBufferDescriptor]
+    _lowering_module_interface: bool
     target: llvm.TargetRef
     target_machine: llvm.TargetMachine
 
@@ -761,6 +910,15 @@ class VisitorMixinTypingBase:
         """
         _ = _start_depth
 
+    @contextmanager
+    def _arena_temporary_scope(self) -> Iterator[None]:
+        """
+        title: Recycle arena temporaries carved inside one lowered scope.
+        returns:
+          type: Iterator[None]
+        """
+        yield
+
     def require_runtime_symbol(
         self, _feature_name: str, _symbol_name: str
     ) -> ir.Function:
@@ -1023,6 +1181,73 @@ class VisitorMixinTypingBase:
         """
         return cast(ir.Value, None)
 
+    def _handle_string_concatenation_chain(
+        self, _operands: list[ir.Value]
+    ) -> ir.Value:
+        """
+        title: Concatenate several strings through one string builder.
+        parameters:
+          _operands:
+            type: list[ir.Value]
+        returns:
+          type: ir.Value
+        """
+        return cast(ir.Value, None)
+
+    def _string_literal_global(
+        self, _data: bytes, *, name: str
+    ) -> ir.GlobalVariable:
+        """
+        title: Emit one constant length-prefixed string global.
+        parameters:
+          _data:
+            type: bytes
+          name:
+            type: str
+        returns:
+          type: ir.GlobalVariable
+        """
+        return cast(ir.GlobalVariable, None)
+
+    def _string_literal_data(
+        self, _literal: ir.GlobalVariable, *, name: str = ""
+    ) -> ir.Value:
+        """
+        title: Return the character data of one string literal global.
+        parameters:
+          _literal:
+            type: ir.GlobalVariable
+          name:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        return cast(ir.Value, None)
+
+    def _string_literal_pointer(self, _data: bytes, *, name: str) -> ir.Value:
+        """
+        title: Emit one constant length-prefixed string and return its data.
+        parameters:
+          _data:
+            type: bytes
+          name:
+            type: str
+        returns:
+          type: ir.Value
+        """
+        return cast(ir.Value, None)
+
+    def _import_foreign_string(self, _value: ir.Value) -> ir.Value:
+        """
+        title: Convert one foreign C string into the IRx string layout.
+        parameters:
+          _value:
+            type: ir.Value
+        returns:
+          type: ir.Value
+        """
+        return cast(ir.Value, None)
+
     def _common_list_element_type(
         self, _lhs_ty: ir.Type, _rhs_ty: ir.Type
     ) -> ir.Type:
@@ -1129,7 +1354,10 @@ class VisitorMixinTypingBase:
         return cast(tuple[ir.Value, str], (None, ""))
 
     def _snprintf_heap(
-        self, _fmt_gv: ir.GlobalVariable, _args: list[ir.Value]
+        self,
+        _fmt_gv: ir.GlobalVariable,
+        _args: list[ir.Value],
+        temporary: bool = False,
     ) -> ir.Value:
         """
         title: Snprintf heap.
@@ -1138,9 +1366,34 @@ class VisitorMixinTypingBase:
             type: ir.GlobalVariable
           _args:
             type: list[ir.Value]
+          temporary:
+            type: bool
+        returns:
+          type: ir.Value
+        """
+        _ = temporary
+        return cast(ir.Value, None)
+
+    def _format_string(
+        self,
+        _fmt_gv: ir.GlobalVariable,
+        _args: list[ir.Value],
+        *,
+        temporary: bool = False,
+    ) -> ir.Value:
+        """
+        title: Format values straight into a new IRx string.
+        parameters:
+          _fmt_gv:
+            type: ir.GlobalVariable
+          _args:
+            type: list[ir.Value]
+          temporary:
+            type: bool
         returns:
           type: ir.Value
         """
+        _ = temporary
         return cast(ir.Value, None)
 
     def _get_or_create_format_global(self, _fmt: str) -> ir.GlobalVariable:
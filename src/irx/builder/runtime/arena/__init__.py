@@ -0,0 +1,7 @@
+"""
+title: Arena runtime feature support for IRx.
+"""
+
+from irx.builder.runtime.arena.feature import build_arena_runtime_feature
+
+__all__ = ["build_arena_runtime_feature"]
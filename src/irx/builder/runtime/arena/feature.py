@@ -0,0 +1,278 @@
+"""
+title: Arena runtime feature declarations.
+summary: >-
+  Declares the bump-allocator runtime used for short-lived temporaries. Arenas
+  grow in chunks, hand out aligned slices, and release whole scopes at once
+  through mark/rewind, so lowered loops can recycle temporary storage without
+  one malloc/free pair per value.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+ARENA_DEFAULT_CHUNK_BYTES = 64 * 1024
+ARENA_DEFAULT_ALIGNMENT = 16
+
+
+@typechecked
+def build_arena_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the arena runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    native_root = Path(__file__).resolve().parent / "native"
+    symbols = {
+        "irx_arena_new": ExternalSymbolSpec(
+            "irx_arena_new",
+            _declare_arena_new,
+        ),
+        "irx_arena_alloc": ExternalSymbolSpec(
+            "irx_arena_alloc",
+            _declare_arena_alloc,
+        ),
+        "irx_arena_mark": ExternalSymbolSpec(
+            "irx_arena_mark",
+            _declare_arena_mark,
+        ),
+        "irx_arena_rewind": ExternalSymbolSpec(
+            "irx_arena_rewind",
+            _declare_arena_rewind,
+        ),
+        "irx_arena_reset": ExternalSymbolSpec(
+            "irx_arena_reset",
+            _declare_arena_reset,
+        ),
+        "irx_arena_destroy": ExternalSymbolSpec(
+            "irx_arena_destroy",
+            _declare_arena_destroy,
+        ),
+        "irx_arena_bytes_reserved": ExternalSymbolSpec(
+            "irx_arena_bytes_reserved",
+            _declare_arena_bytes_reserved,
+        ),
+        "irx_arena_default": ExternalSymbolSpec(
+            "irx_arena_default",
+            _declare_arena_default,
+        ),
+    }
+    return RuntimeFeature(
+        name="arena",
+        symbols=symbols,
+        artifacts=(
+            NativeArtifact(
+                kind="c_source",
+                path=native_root / "irx_arena_runtime.c",
+                include_dirs=(native_root,),
+                compile_flags=("-std=c99",),
+            ),
+        ),
+        metadata={
+            "canonical_name": "arena",
+            "symbols": tuple(symbols),
+            "opaque_handles": {"arena": "irx_arena"},
+            "default_chunk_bytes": ARENA_DEFAULT_CHUNK_BYTES,
+            "default_alignment": ARENA_DEFAULT_ALIGNMENT,
+            "limitations": (
+                "single-threaded default arena",
+                "allocations are released only by rewind, reset, or destroy",
+            ),
+        },
+    )
+
+
+@typechecked
+def _arena_handle_type(visitor: VisitorProtocol) -> ir.Type:
+    """
+    title: Return the opaque arena handle type.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Type
+    """
+    return visitor._llvm.OPAQUE_POINTER_TYPE
+
+
+@typechecked
+def _declare_arena_new(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena new.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _arena_handle_type(visitor),
+        [visitor._llvm.INT64_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_new",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_alloc(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena alloc.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT8_TYPE.as_pointer(),
+        [
+            _arena_handle_type(visitor),
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_alloc",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_mark(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena mark.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT64_TYPE,
+        [_arena_handle_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_mark",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_rewind(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena rewind.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [_arena_handle_type(visitor), visitor._llvm.INT64_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_rewind",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_reset(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena reset.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [_arena_handle_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_reset",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_destroy(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena destroy.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [_arena_handle_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_destroy",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_bytes_reserved(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena bytes reserved.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT64_TYPE,
+        [_arena_handle_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_bytes_reserved",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_arena_default(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare arena default.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(_arena_handle_type(visitor), [])
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_arena_default",
+        fn_type,
+    )
@@ -0,0 +1,196 @@
+#include "irx_arena_runtime.h"
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+typedef struct irx_arena_chunk {
+  struct irx_arena_chunk* prev;
+  int64_t base;
+  int64_t capacity;
+  int64_t used;
+} irx_arena_chunk;
+
+struct irx_arena {
+  irx_arena_chunk* current;
+  irx_arena_chunk* spare;
+  int64_t chunk_bytes;
+  int64_t reserved_bytes;
+};
+
+/* Keep chunk payloads aligned for the widest scalar the lowering emits. */
+#define IRX_ARENA_HEADER_BYTES                                        \
+  ((int64_t)((sizeof(irx_arena_chunk) + IRX_ARENA_DEFAULT_ALIGNMENT - 1) \
+             & ~(size_t)(IRX_ARENA_DEFAULT_ALIGNMENT - 1)))
+
+static irx_arena* irx_arena_default_instance = NULL;
+
+static void irx_arena_fail(const char* message) {
+  fprintf(stderr, "%s\n", message);
+  exit(1);
+}
+
+static uint8_t* irx_arena_chunk_payload(irx_arena_chunk* chunk) {
+  return (uint8_t*)chunk + IRX_ARENA_HEADER_BYTES;
+}
+
+static int64_t irx_arena_align_padding(
+    const irx_arena_chunk* chunk,
+    int64_t alignment) {
+  uintptr_t cursor = (uintptr_t)irx_arena_chunk_payload(
+                         (irx_arena_chunk*)chunk)
+                     + (uintptr_t)chunk->used;
+  uintptr_t mask = (uintptr_t)alignment - 1;
+  return (int64_t)(((cursor + mask) & ~mask) - cursor);
+}
+
+static irx_arena_chunk* irx_arena_take_chunk(
+    irx_arena* arena,
+    int64_t min_capacity) {
+  irx_arena_chunk** link = &arena->spare;
+  while (*link != NULL) {
+    irx_arena_chunk* candidate = *link;
+    if (candidate->capacity >= min_capacity) {
+      *link = candidate->prev;
+      return candidate;
+    }
+    link = &candidate->prev;
+  }
+
+  int64_t capacity = arena->chunk_bytes;
+  if (capacity < min_capacity) {
+    capacity = min_capacity;
+  }
+  irx_arena_chunk* chunk = (irx_arena_chunk*)malloc(
+      (size_t)(IRX_ARENA_HEADER_BYTES + capacity));
+  if (chunk == NULL) {
+    irx_arena_fail("arena chunk allocation failed");
+  }
+  chunk->capacity = capacity;
+  arena->reserved_bytes += capacity;
+  return chunk;
+}
+
+static void irx_arena_free_list(irx_arena_chunk* chunk) {
+  while (chunk != NULL) {
+    irx_arena_chunk* prev = chunk->prev;
+    free(chunk);
+    chunk = prev;
+  }
+}
+
+irx_arena* irx_arena_new(int64_t chunk_bytes) {
+  irx_arena* arena = (irx_arena*)malloc(sizeof(irx_arena));
+  if (arena == NULL) {
+    irx_arena_fail("arena allocation failed");
+  }
+  arena->current = NULL;
+  arena->spare = NULL;
+  arena->chunk_bytes =
+      chunk_bytes > 0 ? chunk_bytes : IRX_ARENA_DEFAULT_CHUNK_BYTES;
+  arena->reserved_bytes = 0;
+  return arena;
+}
+
+void* irx_arena_alloc(irx_arena* arena, int64_t size, int64_t alignment) {
+  if (arena == NULL) {
+    irx_arena_fail("arena allocation requires a non-null arena");
+  }
+  if (size < 0) {
+    irx_arena_fail("arena allocation requires a non-negative size");
+  }
+  if (alignment <= 0) {
+    alignment = IRX_ARENA_DEFAULT_ALIGNMENT;
+  }
+  if ((alignment & (alignment - 1)) != 0) {
+    irx_arena_fail("arena alignment must be a power of two");
+  }
+
+  irx_arena_chunk* chunk = arena->current;
+  if (chunk != NULL) {
+    int64_t padding = irx_arena_align_padding(chunk, alignment);
+    if (chunk->used + padding + size <= chunk->capacity) {
+      chunk->used += padding;
+      void* result = irx_arena_chunk_payload(chunk) + chunk->used;
+      chunk->used += size;
+      return result;
+    }
+  }
+
+  irx_arena_chunk* next = irx_arena_take_chunk(arena, size + alignment);
+  next->prev = chunk;
+  next->base = chunk == NULL ? 0 : chunk->base + chunk->capacity;
+  next->used = 0;
+  arena->current = next;
+
+  next->used = irx_arena_align_padding(next, alignment);
+  void* result = irx_arena_chunk_payload(next) + next->used;
+  next->used += size;
+  return result;
+}
+
+int64_t irx_arena_mark(const irx_arena* arena) {
+  if (arena == NULL || arena->current == NULL) {
+    return 0;
+  }
+  return arena->current->base + arena->current->used;
+}
+
+void irx_arena_rewind(irx_arena* arena, int64_t mark) {
+  if (arena == NULL) {
+    return;
+  }
+  if (mark < 0) {
+    mark = 0;
+  }
+  while (arena->current != NULL && arena->current->base > mark) {
+    irx_arena_chunk* chunk = arena->current;
+    arena->current = chunk->prev;
+    chunk->prev = arena->spare;
+    arena->spare = chunk;
+  }
+  if (arena->current == NULL) {
+    return;
+  }
+  int64_t offset = mark - arena->current->base;
+  /* Marks taken after this point refer to memory that is already gone. */
+  if (offset < arena->current->used) {
+    arena->current->used = offset;
+  }
+}
+
+void irx_arena_reset(irx_arena* arena) {
+  irx_arena_rewind(arena, 0);
+}
+
+void irx_arena_destroy(irx_arena* arena) {
+  if (arena == NULL) {
+    return;
+  }
+  irx_arena_free_list(arena->current);
+  irx_arena_free_list(arena->spare);
+  if (arena == irx_arena_default_instance) {
+    irx_arena_default_instance = NULL;
+  }
+  free(arena);
+}
+
+int64_t irx_arena_bytes_reserved(const irx_arena* arena) {
+  if (arena == NULL) {
+    return 0;
+  }
+  return arena->reserved_bytes;
+}
+
+static void irx_arena_destroy_default(void) {
+  irx_arena_destroy(irx_arena_default_instance);
+}
+
+irx_arena* irx_arena_default(void) {
+  if (irx_arena_default_instance == NULL) {
+    irx_arena_default_instance = irx_arena_new(IRX_ARENA_DEFAULT_CHUNK_BYTES);
+    atexit(irx_arena_destroy_default);
+  }
+  return irx_arena_default_instance;
+}
@@ -0,0 +1,33 @@
+#ifndef IRX_ARENA_RUNTIME_H
+#define IRX_ARENA_RUNTIME_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define IRX_ARENA_DEFAULT_CHUNK_BYTES (64 * 1024)
+#define IRX_ARENA_DEFAULT_ALIGNMENT 16
+
+typedef struct irx_arena irx_arena;
+
+/*
+ * Marks are logical byte positions inside one arena. Rewinding to a mark
+ * releases every allocation carved after it; chunks that become unused are
+ * kept on a spare list so steady-state loops stop touching malloc.
+ */
+irx_arena* irx_arena_new(int64_t chunk_bytes);
+void* irx_arena_alloc(irx_arena* arena, int64_t size, int64_t alignment);
+int64_t irx_arena_mark(const irx_arena* arena);
+void irx_arena_rewind(irx_arena* arena, int64_t mark);
+void irx_arena_reset(irx_arena* arena);
+void irx_arena_destroy(irx_arena* arena);
+int64_t irx_arena_bytes_reserved(const irx_arena* arena);
+irx_arena* irx_arena_default(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -23,6 +23,7 @@ from irx.builder.runtime.features import (
 )
 from irx.builtins.collections.array_primitives import (
     ARRAY_PRIMITIVE_TYPE_SPECS,
+    IRX_ARROW_TYPE_BINARY,
     IRX_ARROW_TYPE_BOOL,
     IRX_ARROW_TYPE_FLOAT32,
     IRX_ARROW_TYPE_FLOAT64,
@@ -30,11 +31,14 @@ from irx.builtins.collections.array_primitives import (
     IRX_ARROW_TYPE_INT16,
     IRX_ARROW_TYPE_INT32,
     IRX_ARROW_TYPE_INT64,
+    IRX_ARROW_TYPE_LARGE_BINARY,
+    IRX_ARROW_TYPE_LARGE_UTF8,
     IRX_ARROW_TYPE_UINT8,
     IRX_ARROW_TYPE_UINT16,
     IRX_ARROW_TYPE_UINT32,
     IRX_ARROW_TYPE_UINT64,
     IRX_ARROW_TYPE_UNKNOWN,
+    IRX_ARROW_TYPE_UTF8,
     ArrayPrimitiveTypeSpec,
 )
 from irx.typecheck import typechecked
@@ -42,6 +46,10 @@ from irx.typecheck import typechecked
 if TYPE_CHECKING:
     from irx.builder.protocols import VisitorProtocol
 
+IRX_ARROW_ENCODING_NONE = 0
+IRX_ARROW_ENCODING_DICTIONARY = 1
+IRX_ARROW_ENCODING_RUN_END = 2
+
 
 @typechecked
 def _build_runtime_feature(feature_name: str) -> RuntimeFeature:
@@ -116,6 +124,18 @@ def _build_runtime_feature(feature_name: str) -> RuntimeFeature:
             "irx_arrow_array_builder_append_double",
             _declare_builder_append_double,
         ),
+        "irx_arrow_array_builder_append_n": ExternalSymbolSpec(
+            "irx_arrow_array_builder_append_n",
+            _declare_builder_append_n,
+        ),
+        "irx_arrow_array_builder_append_binary": ExternalSymbolSpec(
+            "irx_arrow_array_builder_append_binary",
+            _declare_builder_append_binary,
+        ),
+        "irx_arrow_array_builder_append_binary_n": ExternalSymbolSpec(
+            "irx_arrow_array_builder_append_binary_n",
+            _declare_builder_append_binary_n,
+        ),
         "irx_arrow_array_builder_int32_new": ExternalSymbolSpec(
             "irx_arrow_array_builder_int32_new",
             _declare_builder_int32_new,
@@ -188,6 +208,46 @@ def _build_runtime_feature(feature_name: str) -> RuntimeFeature:
             "irx_arrow_array_borrow_buffer_view",
             _declare_array_borrow_buffer_view,
         ),
+        "irx_arrow_array_borrow_offsets_view": ExternalSymbolSpec(
+            "irx_arrow_array_borrow_offsets_view",
+            _declare_array_borrow_offsets_view,
+        ),
+        "irx_arrow_array_borrow_data_view": ExternalSymbolSpec(
+            "irx_arrow_array_borrow_data_view",
+            _declare_array_borrow_data_view,
+        ),
+        "irx_arrow_array_value_bytes": ExternalSymbolSpec(
+            "irx_arrow_array_value_bytes",
+            _declare_array_value_bytes,
+        ),
+        "irx_arrow_array_encoding": ExternalSymbolSpec(
+            "irx_arrow_array_encoding",
+            _declare_array_encoding,
+        ),
+        "irx_arrow_array_borrow_indices_view": ExternalSymbolSpec(
+            "irx_arrow_array_borrow_indices_view",
+            _declare_array_borrow_indices_view,
+        ),
+        "irx_arrow_array_borrow_run_ends_view": ExternalSymbolSpec(
+            "irx_arrow_array_borrow_run_ends_view",
+            _declare_array_borrow_run_ends_view,
+        ),
+        "irx_arrow_array_borrow_dictionary": ExternalSymbolSpec(
+            "irx_arrow_array_borrow_dictionary",
+            _declare_array_borrow_dictionary,
+        ),
+        "irx_arrow_array_borrow_run_values": ExternalSymbolSpec(
+            "irx_arrow_array_borrow_run_values",
+            _declare_array_borrow_run_values,
+        ),
+        "irx_arrow_array_physical_index": ExternalSymbolSpec(
+            "irx_arrow_array_physical_index",
+            _declare_array_physical_index,
+        ),
+        "irx_arrow_array_decode": ExternalSymbolSpec(
+            "irx_arrow_array_decode",
+            _declare_array_decode,
+        ),
         "irx_arrow_array_retain": ExternalSymbolSpec(
             "irx_arrow_array_retain",
             _declare_array_retain,
@@ -224,6 +284,16 @@ def _build_runtime_feature(feature_name: str) -> RuntimeFeature:
                 }
                 for name, spec in ARRAY_PRIMITIVE_TYPE_SPECS.items()
             },
+            "encodings": {
+                "none": IRX_ARROW_ENCODING_NONE,
+                "dictionary": IRX_ARROW_ENCODING_DICTIONARY,
+                "run_end": IRX_ARROW_ENCODING_RUN_END,
+            },
+            "variable_width_offset_sizes": {
+                name: spec.offset_size_bytes
+                for name, spec in ARRAY_PRIMITIVE_TYPE_SPECS.items()
+                if spec.offset_size_bytes is not None
+            },
             "opaque_handles": {
                 "schema": "irx_arrow_schema_handle",
                 "array_builder": "irx_arrow_array_builder_handle",
@@ -503,6 +573,75 @@ def _declare_builder_append_double(visitor: VisitorProtocol) -> ir.Function:
     )
 
 
+@typechecked
+def _declare_builder_append_n(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow builder bulk append.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_builder_append_n",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_BUILDER_HANDLE_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_builder_append_binary(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow builder append binary.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_builder_append_binary",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_BUILDER_HANDLE_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+
+
+@typechecked
+def _declare_builder_append_binary_n(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow builder bulk binary append.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_builder_append_binary_n",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_BUILDER_HANDLE_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE.as_pointer(),
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer(),
+        ],
+    )
+
+
 @typechecked
 def _declare_builder_int32_new(visitor: VisitorProtocol) -> ir.Function:
     """
@@ -844,6 +983,230 @@ def _declare_array_borrow_buffer_view(
     )
 
 
+@typechecked
+def _declare_array_borrow_offsets_view(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array borrow offsets view.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_borrow_offsets_view",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.BUFFER_VIEW_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_borrow_data_view(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array borrow data view.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_borrow_data_view",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.BUFFER_VIEW_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_value_bytes(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow array value bytes.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_value_bytes",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer().as_pointer(),
+            visitor._llvm.INT64_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_encoding(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow array encoding.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_encoding",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARRAY_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_array_borrow_indices_view(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array borrow indices view.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_borrow_indices_view",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.BUFFER_VIEW_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_borrow_run_ends_view(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array borrow run ends view.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_borrow_run_ends_view",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.BUFFER_VIEW_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_borrow_dictionary(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array borrow dictionary.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_borrow_dictionary",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_borrow_run_values(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array borrow run values.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_borrow_run_values",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_physical_index(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow array physical index.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_physical_index",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_array_decode(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow array decode.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_array_decode",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
 @typechecked
 def _declare_array_retain(visitor: VisitorProtocol) -> ir.Function:
     """
@@ -900,6 +1263,10 @@ def _declare_last_error(visitor: VisitorProtocol) -> ir.Function:
 
 __all__ = [
     "ARRAY_PRIMITIVE_TYPE_SPECS",
+    "IRX_ARROW_ENCODING_DICTIONARY",
+    "IRX_ARROW_ENCODING_NONE",
+    "IRX_ARROW_ENCODING_RUN_END",
+    "IRX_ARROW_TYPE_BINARY",
     "IRX_ARROW_TYPE_BOOL",
     "IRX_ARROW_TYPE_FLOAT32",
     "IRX_ARROW_TYPE_FLOAT64",
@@ -907,11 +1274,14 @@ __all__ = [
     "IRX_ARROW_TYPE_INT16",
     "IRX_ARROW_TYPE_INT32",
     "IRX_ARROW_TYPE_INT64",
+    "IRX_ARROW_TYPE_LARGE_BINARY",
+    "IRX_ARROW_TYPE_LARGE_UTF8",
     "IRX_ARROW_TYPE_UINT8",
     "IRX_ARROW_TYPE_UINT16",
     "IRX_ARROW_TYPE_UINT32",
     "IRX_ARROW_TYPE_UINT64",
     "IRX_ARROW_TYPE_UNKNOWN",
+    "IRX_ARROW_TYPE_UTF8",
     "ArrayPrimitiveTypeSpec",
     "build_array_runtime_feature",
 ]
@@ -0,0 +1,478 @@
+// Copyright IRx contributors.
+
+#include <arrow/api.h>
+#include <arrow/compute/api.h>
+#include <arrow/compute/initialize.h>
+
+#include <errno.h>
+#include <stdint.h>
+
+#include <cstdio>
+#include <limits>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "irx_arrow_runtime.h"
+#include "irx_arrow_runtime_internal.h"
+
+namespace {
+
+using irx_arrow_internal::array_from_handle;
+using irx_arrow_internal::array_handle_from_arrow;
+using irx_arrow_internal::clear_last_error;
+using irx_arrow_internal::set_last_arrow_error;
+using irx_arrow_internal::set_last_error;
+
+constexpr int kArrowOk = 0;
+
+// Arrow 21+ keeps most kernels in libarrow_compute, which registers them only
+// after an explicit initialization call.
+int ensure_compute_initialized() {
+  static std::once_flag once;
+  static arrow::Status status;
+  std::call_once(once, [] { status = arrow::compute::Initialize(); });
+  if (!status.ok()) {
+    return set_last_arrow_error(EINVAL, "Arrow compute initialization failed", status);
+  }
+  return kArrowOk;
+}
+
+const char* binary_function_name(int32_t op) {
+  switch (op) {
+    case IRX_ARROW_COMPUTE_ADD:
+      return "add";
+    case IRX_ARROW_COMPUTE_SUBTRACT:
+      return "subtract";
+    case IRX_ARROW_COMPUTE_MULTIPLY:
+      return "multiply";
+    case IRX_ARROW_COMPUTE_DIVIDE:
+      return "divide";
+    case IRX_ARROW_COMPUTE_EQUAL:
+      return "equal";
+    case IRX_ARROW_COMPUTE_NOT_EQUAL:
+      return "not_equal";
+    case IRX_ARROW_COMPUTE_LESS:
+      return "less";
+    case IRX_ARROW_COMPUTE_LESS_EQUAL:
+      return "less_equal";
+    case IRX_ARROW_COMPUTE_GREATER:
+      return "greater";
+    case IRX_ARROW_COMPUTE_GREATER_EQUAL:
+      return "greater_equal";
+    case IRX_ARROW_COMPUTE_AND:
+      return "and";
+    case IRX_ARROW_COMPUTE_OR:
+      return "or";
+    default:
+      return nullptr;
+  }
+}
+
+int require_array(
+    const irx_arrow_array_handle* handle,
+    const char* name,
+    const std::shared_ptr<arrow::Array>** out_array) {
+  *out_array = array_from_handle(handle);
+  if (*out_array == nullptr) {
+    const std::string message = std::string(name) + " must not be NULL";
+    return set_last_error(EINVAL, message.c_str());
+  }
+  return kArrowOk;
+}
+
+int call_function(
+    const char* function_name,
+    const std::vector<arrow::Datum>& args,
+    const arrow::compute::FunctionOptions* options,
+    arrow::Datum* out_datum) {
+  int code = ensure_compute_initialized();
+  if (code != kArrowOk) {
+    return code;
+  }
+  arrow::Result<arrow::Datum> result =
+      arrow::compute::CallFunction(function_name, args, options);
+  if (!result.ok()) {
+    const std::string context = std::string("Arrow compute '") + function_name + "' failed";
+    return set_last_arrow_error(EINVAL, context.c_str(), result.status());
+  }
+  *out_datum = std::move(result).ValueUnsafe();
+  return kArrowOk;
+}
+
+int scalar_to_int64(const std::shared_ptr<arrow::Scalar>& scalar, int64_t* out_value) {
+  if (!scalar->is_valid) {
+    return set_last_error(EINVAL, "Arrow compute reduction has no valid values");
+  }
+  if (scalar->type->id() == arrow::Type::UINT64) {
+    const uint64_t value = static_cast<const arrow::UInt64Scalar&>(*scalar).value;
+    if (value > static_cast<uint64_t>(std::numeric_limits<int64_t>::max())) {
+      return set_last_error(EOVERFLOW, "Arrow compute result does not fit in int64");
+    }
+    *out_value = static_cast<int64_t>(value);
+    return kArrowOk;
+  }
+  if (!arrow::is_integer(scalar->type->id()) && scalar->type->id() != arrow::Type::BOOL) {
+    return set_last_error(EINVAL, "Arrow compute int64 reductions require integer input");
+  }
+  arrow::Result<std::shared_ptr<arrow::Scalar>> cast_result = scalar->CastTo(arrow::int64());
+  if (!cast_result.ok()) {
+    return set_last_arrow_error(EINVAL, "Arrow compute result cast failed", cast_result.status());
+  }
+  *out_value = static_cast<const arrow::Int64Scalar&>(*cast_result.ValueUnsafe()).value;
+  return kArrowOk;
+}
+
+int scalar_to_double(const std::shared_ptr<arrow::Scalar>& scalar, double* out_value) {
+  if (!scalar->is_valid) {
+    return set_last_error(EINVAL, "Arrow compute reduction has no valid values");
+  }
+  arrow::Result<std::shared_ptr<arrow::Scalar>> cast_result = scalar->CastTo(arrow::float64());
+  if (!cast_result.ok()) {
+    return set_last_arrow_error(EINVAL, "Arrow compute result cast failed", cast_result.status());
+  }
+  *out_value = static_cast<const arrow::DoubleScalar&>(*cast_result.ValueUnsafe()).value;
+  return kArrowOk;
+}
+
+int reduce_sum(
+    const irx_arrow_array_handle* handle,
+    std::shared_ptr<arrow::Scalar>* out_scalar) {
+  const std::shared_ptr<arrow::Array>* array = nullptr;
+  int code = require_array(handle, "array", &array);
+  if (code != kArrowOk) {
+    return code;
+  }
+  arrow::compute::ScalarAggregateOptions options(/*skip_nulls=*/true, /*min_count=*/0);
+  arrow::Datum datum;
+  code = call_function("sum", {*array}, &options, &datum);
+  if (code != kArrowOk) {
+    return code;
+  }
+  *out_scalar = datum.scalar();
+  return kArrowOk;
+}
+
+int reduce_min_max(
+    const irx_arrow_array_handle* handle,
+    std::shared_ptr<arrow::Scalar>* out_min,
+    std::shared_ptr<arrow::Scalar>* out_max) {
+  const std::shared_ptr<arrow::Array>* array = nullptr;
+  int code = require_array(handle, "array", &array);
+  if (code != kArrowOk) {
+    return code;
+  }
+  arrow::compute::ScalarAggregateOptions options(/*skip_nulls=*/true, /*min_count=*/1);
+  arrow::Datum datum;
+  code = call_function("min_max", {*array}, &options, &datum);
+  if (code != kArrowOk) {
+    return code;
+  }
+  const auto& pair = static_cast<const arrow::StructScalar&>(*datum.scalar());
+  if (!pair.is_valid) {
+    return set_last_error(EINVAL, "Arrow compute reduction has no valid values");
+  }
+  *out_min = pair.value[0];
+  *out_max = pair.value[1];
+  return kArrowOk;
+}
+
+int wrap_result(
+    const arrow::Datum& datum,
+    bool nullable,
+    irx_arrow_array_handle** out_array) {
+  if (!datum.is_array()) {
+    return set_last_error(EINVAL, "Arrow compute kernel did not return an array");
+  }
+  return array_handle_from_arrow(datum.make_array(), nullable, out_array);
+}
+
+int binary_with_datum(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    const arrow::Datum& rhs,
+    bool rhs_nullable,
+    irx_arrow_array_handle** out_array) {
+  if (out_array == nullptr) {
+    return set_last_error(EINVAL, "out_array must not be NULL");
+  }
+  *out_array = nullptr;
+  const std::shared_ptr<arrow::Array>* lhs_array = nullptr;
+  int code = require_array(lhs, "lhs", &lhs_array);
+  if (code != kArrowOk) {
+    return code;
+  }
+  const char* function_name = binary_function_name(op);
+  if (function_name == nullptr) {
+    char message[64];
+    std::snprintf(message, sizeof(message), "unsupported Arrow compute op %d", op);
+    return set_last_error(EINVAL, message);
+  }
+  arrow::Datum datum;
+  code = call_function(function_name, {*lhs_array, rhs}, nullptr, &datum);
+  if (code != kArrowOk) {
+    return code;
+  }
+  return wrap_result(datum, irx_arrow_array_is_nullable(lhs) != 0 || rhs_nullable, out_array);
+}
+
+}  // namespace
+
+extern "C" {
+
+int irx_arrow_compute_sum_int64(
+    const irx_arrow_array_handle* array,
+    int64_t* out_value) {
+  clear_last_error();
+  try {
+    if (out_value == nullptr) {
+      return set_last_error(EINVAL, "out_value must not be NULL");
+    }
+    std::shared_ptr<arrow::Scalar> sum;
+    const int code = reduce_sum(array, &sum);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return scalar_to_int64(sum, out_value);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_sum_double(
+    const irx_arrow_array_handle* array,
+    double* out_value) {
+  clear_last_error();
+  try {
+    if (out_value == nullptr) {
+      return set_last_error(EINVAL, "out_value must not be NULL");
+    }
+    std::shared_ptr<arrow::Scalar> sum;
+    const int code = reduce_sum(array, &sum);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return scalar_to_double(sum, out_value);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_min_max_int64(
+    const irx_arrow_array_handle* array,
+    int64_t* out_min,
+    int64_t* out_max) {
+  clear_last_error();
+  try {
+    if (out_min == nullptr || out_max == nullptr) {
+      return set_last_error(EINVAL, "out_min and out_max must not be NULL");
+    }
+    std::shared_ptr<arrow::Scalar> min;
+    std::shared_ptr<arrow::Scalar> max;
+    int code = reduce_min_max(array, &min, &max);
+    if (code != kArrowOk) {
+      return code;
+    }
+    code = scalar_to_int64(min, out_min);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return scalar_to_int64(max, out_max);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_min_max_double(
+    const irx_arrow_array_handle* array,
+    double* out_min,
+    double* out_max) {
+  clear_last_error();
+  try {
+    if (out_min == nullptr || out_max == nullptr) {
+      return set_last_error(EINVAL, "out_min and out_max must not be NULL");
+    }
+    std::shared_ptr<arrow::Scalar> min;
+    std::shared_ptr<arrow::Scalar> max;
+    int code = reduce_min_max(array, &min, &max);
+    if (code != kArrowOk) {
+      return code;
+    }
+    code = scalar_to_double(min, out_min);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return scalar_to_double(max, out_max);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_mean(
+    const irx_arrow_array_handle* array,
+    double* out_value) {
+  clear_last_error();
+  try {
+    if (out_value == nullptr) {
+      return set_last_error(EINVAL, "out_value must not be NULL");
+    }
+    const std::shared_ptr<arrow::Array>* input = nullptr;
+    int code = require_array(array, "array", &input);
+    if (code != kArrowOk) {
+      return code;
+    }
+    arrow::compute::ScalarAggregateOptions options(/*skip_nulls=*/true, /*min_count=*/1);
+    arrow::Datum datum;
+    code = call_function("mean", {*input}, &options, &datum);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return scalar_to_double(datum.scalar(), out_value);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_binary(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    const irx_arrow_array_handle* rhs,
+    irx_arrow_array_handle** out_array) {
+  clear_last_error();
+  try {
+    const std::shared_ptr<arrow::Array>* rhs_array = nullptr;
+    const int code = require_array(rhs, "rhs", &rhs_array);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return binary_with_datum(
+        op, lhs, arrow::Datum(*rhs_array), irx_arrow_array_is_nullable(rhs) != 0, out_array);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_binary_int64_scalar(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    int64_t rhs,
+    irx_arrow_array_handle** out_array) {
+  clear_last_error();
+  try {
+    return binary_with_datum(op, lhs, arrow::Datum(rhs), false, out_array);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_binary_double_scalar(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    double rhs,
+    irx_arrow_array_handle** out_array) {
+  clear_last_error();
+  try {
+    return binary_with_datum(op, lhs, arrow::Datum(rhs), false, out_array);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_filter(
+    const irx_arrow_array_handle* array,
+    const irx_arrow_array_handle* mask,
+    irx_arrow_array_handle** out_array) {
+  clear_last_error();
+  try {
+    if (out_array == nullptr) {
+      return set_last_error(EINVAL, "out_array must not be NULL");
+    }
+    *out_array = nullptr;
+    const std::shared_ptr<arrow::Array>* input = nullptr;
+    const std::shared_ptr<arrow::Array>* selection = nullptr;
+    int code = require_array(array, "array", &input);
+    if (code == kArrowOk) {
+      code = require_array(mask, "mask", &selection);
+    }
+    if (code != kArrowOk) {
+      return code;
+    }
+    arrow::Datum datum;
+    code = call_function("filter", {*input, *selection}, nullptr, &datum);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return wrap_result(datum, irx_arrow_array_is_nullable(array) != 0, out_array);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_take(
+    const irx_arrow_array_handle* array,
+    const irx_arrow_array_handle* indices,
+    irx_arrow_array_handle** out_array) {
+  clear_last_error();
+  try {
+    if (out_array == nullptr) {
+      return set_last_error(EINVAL, "out_array must not be NULL");
+    }
+    *out_array = nullptr;
+    const std::shared_ptr<arrow::Array>* input = nullptr;
+    const std::shared_ptr<arrow::Array>* positions = nullptr;
+    int code = require_array(array, "array", &input);
+    if (code == kArrowOk) {
+      code = require_array(indices, "indices", &positions);
+    }
+    if (code != kArrowOk) {
+      return code;
+    }
+    arrow::Datum datum;
+    code = call_function("take", {*input, *positions}, nullptr, &datum);
+    if (code != kArrowOk) {
+      return code;
+    }
+    const bool nullable =
+        irx_arrow_array_is_nullable(array) != 0 || irx_arrow_array_is_nullable(indices) != 0;
+    return wrap_result(datum, nullable, out_array);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+int irx_arrow_compute_cast(
+    const irx_arrow_array_handle* array,
+    int32_t type_id,
+    irx_arrow_array_handle** out_array) {
+  clear_last_error();
+  try {
+    if (out_array == nullptr) {
+      return set_last_error(EINVAL, "out_array must not be NULL");
+    }
+    *out_array = nullptr;
+    const std::shared_ptr<arrow::Array>* input = nullptr;
+    int code = require_array(array, "array", &input);
+    if (code != kArrowOk) {
+      return code;
+    }
+    std::shared_ptr<arrow::DataType> target = irx_arrow_internal::data_type_from_type_id(type_id);
+    if (!target) {
+      char message[64];
+      std::snprintf(message, sizeof(message), "unsupported Arrow type id %d", type_id);
+      return set_last_error(EINVAL, message);
+    }
+    arrow::compute::CastOptions options = arrow::compute::CastOptions::Safe(std::move(target));
+    arrow::Datum datum;
+    code = call_function("cast", {*input}, &options, &datum);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return wrap_result(datum, irx_arrow_array_is_nullable(array) != 0, out_array);
+  } catch (const std::exception& exc) {
+    return set_last_error(EINVAL, exc.what());
+  }
+}
+
+}  // extern "C"
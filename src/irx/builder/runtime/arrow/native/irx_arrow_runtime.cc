@@ -1,14 +1,28 @@
 // Copyright IRx contributors.
 
 #include "irx_arrow_runtime.h"
+#include "irx_arrow_runtime_internal.h"
 
 #include <arrow/api.h>
 #include <arrow/c/bridge.h>
+#include <arrow/io/file.h>
+#include <arrow/ipc/reader.h>
+#include <arrow/ipc/writer.h>
 #include <arrow/tensor.h>
+#include <arrow/util/compression.h>
 
 #include <errno.h>
 #include <stddef.h>
 #include <stdint.h>
+#include <stdio.h>
+
+#ifdef _WIN32
+#include <io.h>
+#define irx_dup _dup
+#else
+#include <unistd.h>
+#define irx_dup dup
+#endif
 
 #include <algorithm>
 #include <cstdarg>
@@ -26,6 +40,7 @@ namespace {
 constexpr int kArrowOk = 0;
 constexpr int64_t kInitialRefcount = 1;
 constexpr int64_t kPrimitiveArrayBufferCount = 2;
+constexpr int64_t kBinaryArrayBufferCount = 3;
 
 thread_local char last_error[512] = {0};
 
@@ -34,6 +49,7 @@ enum class AppendKind {
   kUnsigned,
   kDouble,
   kBool,
+  kBinary,
 };
 
 struct TypeSpec {
@@ -46,6 +62,9 @@ struct TypeSpec {
   const char* name;
   const char* c_data_format;
   std::shared_ptr<arrow::DataType> (*make_type)();
+  // Variable-width layouts keep an offsets buffer of this width (4 or 8) in
+  // front of their data buffer; fixed-width layouts leave it at zero.
+  int64_t offset_size_bytes = 0;
 };
 
 std::shared_ptr<arrow::DataType> make_int8_type() { return arrow::int8(); }
@@ -59,6 +78,10 @@ std::shared_ptr<arrow::DataType> make_uint64_type() { return arrow::uint64(); }
 std::shared_ptr<arrow::DataType> make_float32_type() { return arrow::float32(); }
 std::shared_ptr<arrow::DataType> make_float64_type() { return arrow::float64(); }
 std::shared_ptr<arrow::DataType> make_bool_type() { return arrow::boolean(); }
+std::shared_ptr<arrow::DataType> make_utf8_type() { return arrow::utf8(); }
+std::shared_ptr<arrow::DataType> make_large_utf8_type() { return arrow::large_utf8(); }
+std::shared_ptr<arrow::DataType> make_binary_type() { return arrow::binary(); }
+std::shared_ptr<arrow::DataType> make_large_binary_type() { return arrow::large_binary(); }
 
 const TypeSpec kTypeSpecs[] = {
     {
@@ -182,11 +205,87 @@ const TypeSpec kTypeSpecs[] = {
         "b",
         make_bool_type,
     },
+    {
+        IRX_ARROW_TYPE_UTF8,
+        arrow::Type::STRING,
+        IRX_BUFFER_DTYPE_UINT8,
+        0,
+        false,
+        AppendKind::kBinary,
+        "utf8",
+        "u",
+        make_utf8_type,
+        4,
+    },
+    {
+        IRX_ARROW_TYPE_LARGE_UTF8,
+        arrow::Type::LARGE_STRING,
+        IRX_BUFFER_DTYPE_UINT8,
+        0,
+        false,
+        AppendKind::kBinary,
+        "large_utf8",
+        "U",
+        make_large_utf8_type,
+        8,
+    },
+    {
+        IRX_ARROW_TYPE_BINARY,
+        arrow::Type::BINARY,
+        IRX_BUFFER_DTYPE_UINT8,
+        0,
+        false,
+        AppendKind::kBinary,
+        "binary",
+        "z",
+        make_binary_type,
+        4,
+    },
+    {
+        IRX_ARROW_TYPE_LARGE_BINARY,
+        arrow::Type::LARGE_BINARY,
+        IRX_BUFFER_DTYPE_UINT8,
+        0,
+        false,
+        AppendKind::kBinary,
+        "large_binary",
+        "Z",
+        make_large_binary_type,
+        8,
+    },
 };
 
+// Encoded arrays resolve to their value type; index_spec then names the
+// dictionary index or run-end type.
 struct ResolvedSchema {
   const TypeSpec* spec = nullptr;
   bool nullable = false;
+  int32_t encoding = IRX_ARROW_ENCODING_NONE;
+  const TypeSpec* index_spec = nullptr;
+};
+
+// Arrow's IPC writer asks its sink for the current position, and file streams
+// answer with lseek, which fails on pipes such as a redirected stdout.
+class PositionTrackingOutputStream : public arrow::io::OutputStream {
+ public:
+  explicit PositionTrackingOutputStream(std::shared_ptr<arrow::io::OutputStream> raw)
+      : raw_(std::move(raw)) {}
+
+  arrow::Status Close() override { return raw_->Close(); }
+  bool closed() const override { return raw_->closed(); }
+  arrow::Result<int64_t> Tell() const override { return position_; }
+  arrow::Status Flush() override { return raw_->Flush(); }
+
+  using arrow::io::OutputStream::Write;
+  arrow::Status Write(const void* data, int64_t nbytes) override {
+    ARROW_RETURN_NOT_OK(raw_->Write(data, nbytes));
+    position_ += nbytes;
+    return arrow::Status::OK();
+  }
+
+ private:
+  std::shared_ptr<arrow::io::OutputStream> raw_;
+  int64_t position_ = 0;
 };
 
 }  // namespace
@@ -213,6 +312,18 @@ struct irx_arrow_array_handle {
   int32_t buffer_view_compatible = 0;
   int64_t shape[1] = {0};
   int64_t strides[1] = {0};
+  int64_t offset_size_bytes = 0;
+  int64_t offsets_shape[1] = {0};
+  int64_t offsets_strides[1] = {0};
+  int64_t data_shape[1] = {0};
+  int64_t data_strides[1] = {1};
+  int32_t encoding = IRX_ARROW_ENCODING_NONE;
+  uintptr_t index_dtype_token = 0;
+  int64_t index_shape[1] = {0};
+  int64_t index_strides[1] = {0};
+  irx_arrow_array_handle* encoded_values = nullptr;
+
+  ~irx_arrow_array_handle() { irx_arrow_array_release(encoded_values); }
 };
 
 struct irx_arrow_tensor_builder_handle {
@@ -238,6 +349,48 @@ struct irx_arrow_tensor_handle {
   int64_t element_size_bytes = 0;
 };
 
+struct irx_arrow_record_batch_handle {
+  int64_t refcount = 0;
+  std::shared_ptr<arrow::RecordBatch> batch;
+  std::vector<irx_arrow_array_handle*> columns;
+
+  ~irx_arrow_record_batch_handle() {
+    for (irx_arrow_array_handle* column : columns) {
+      irx_arrow_array_release(column);
+    }
+  }
+};
+
+struct irx_arrow_table_handle {
+  int64_t refcount = 0;
+  std::shared_ptr<arrow::Table> table;
+  std::vector<std::vector<irx_arrow_array_handle*>> chunks;
+
+  ~irx_arrow_table_handle() {
+    for (const std::vector<irx_arrow_array_handle*>& column : chunks) {
+      for (irx_arrow_array_handle* chunk : column) {
+        irx_arrow_array_release(chunk);
+      }
+    }
+  }
+};
+
+struct irx_arrow_ipc_file_reader_handle {
+  std::shared_ptr<arrow::io::MemoryMappedFile> file;
+  std::shared_ptr<arrow::ipc::RecordBatchFileReader> reader;
+  int64_t cached_batch_index = -1;
+  std::shared_ptr<arrow::RecordBatch> cached_batch;
+};
+
+struct irx_arrow_ipc_stream_writer_handle {
+  std::shared_ptr<arrow::io::OutputStream> sink;
+  std::shared_ptr<arrow::ipc::RecordBatchWriter> writer;
+  std::shared_ptr<arrow::Schema> schema;
+  arrow::ipc::IpcWriteOptions options = arrow::ipc::IpcWriteOptions::Defaults();
+  int64_t batch_rows = 0;
+  int64_t rows_written = 0;
+};
+
 namespace {
 
 void clear_error() { last_error[0] = '\0'; }
@@ -288,16 +441,26 @@ const TypeSpec* type_spec_from_c_data_format(const char* format) {
   return nullptr;
 }
 
-int validate_supported_c_schema(
-    const ArrowSchema* schema,
-    ResolvedSchema* out_resolved) {
+bool is_dictionary_index_spec(const TypeSpec* spec) {
+  return spec != nullptr && (spec->append_kind == AppendKind::kSigned ||
+                             spec->append_kind == AppendKind::kUnsigned);
+}
+
+bool is_run_end_spec(const TypeSpec* spec) {
+  return spec != nullptr && (spec->type_id == IRX_ARROW_TYPE_INT16 ||
+                             spec->type_id == IRX_ARROW_TYPE_INT32 ||
+                             spec->type_id == IRX_ARROW_TYPE_INT64);
+}
+
+int resolve_plain_c_schema(const ArrowSchema* schema, const TypeSpec** out_spec) {
   if (schema == nullptr) {
     return set_error(EINVAL, "schema must not be NULL");
   }
   if (schema->n_children != 0 || schema->dictionary != nullptr) {
     return set_error(
         EINVAL,
-        "Only plain primitive Arrow arrays are supported in this phase");
+        "Only plain, dictionary-encoded, and run-end encoded Arrow arrays "
+        "are supported in this phase");
   }
 
   const TypeSpec* spec = type_spec_from_c_data_format(schema->format);
@@ -306,12 +469,84 @@ int validate_supported_c_schema(
         EINVAL,
         "Unsupported Arrow storage type; supported types are bool, "
         "int8, int16, int32, int64, uint8, uint16, uint32, uint64, "
-        "float32, and float64");
+        "float32, float64, utf8, large_utf8, binary, and large_binary");
   }
+  *out_spec = spec;
+  return kArrowOk;
+}
 
-  out_resolved->spec = spec;
+int validate_supported_c_schema(
+    const ArrowSchema* schema,
+    ResolvedSchema* out_resolved) {
+  if (schema == nullptr) {
+    return set_error(EINVAL, "schema must not be NULL");
+  }
   out_resolved->nullable = (schema->flags & ARROW_FLAG_NULLABLE) != 0;
-  return kArrowOk;
+
+  if (schema->dictionary != nullptr) {
+    if (schema->n_children != 0) {
+      return set_error(EINVAL, "Arrow dictionary index schemas must not have children");
+    }
+    out_resolved->index_spec = type_spec_from_c_data_format(schema->format);
+    if (!is_dictionary_index_spec(out_resolved->index_spec)) {
+      return set_error(EINVAL, "Arrow dictionary indices must use an integer type");
+    }
+    out_resolved->encoding = IRX_ARROW_ENCODING_DICTIONARY;
+    return resolve_plain_c_schema(schema->dictionary, &out_resolved->spec);
+  }
+
+  if (schema->format != nullptr && std::strcmp(schema->format, "+r") == 0) {
+    if (schema->n_children != 2 || schema->children == nullptr) {
+      return set_error(
+          EINVAL,
+          "Arrow run-end encoded schemas must have run_ends and values children");
+    }
+    out_resolved->index_spec = type_spec_from_c_data_format(schema->children[0]->format);
+    if (!is_run_end_spec(out_resolved->index_spec)) {
+      return set_error(EINVAL, "Arrow run ends must use int16, int32, or int64");
+    }
+    out_resolved->encoding = IRX_ARROW_ENCODING_RUN_END;
+    return resolve_plain_c_schema(schema->children[1], &out_resolved->spec);
+  }
+
+  return resolve_plain_c_schema(schema, &out_resolved->spec);
+}
+
+std::shared_ptr<arrow::DataType> resolved_arrow_type(const ResolvedSchema& resolved) {
+  switch (resolved.encoding) {
+    case IRX_ARROW_ENCODING_DICTIONARY:
+      return arrow::dictionary(resolved.index_spec->make_type(), resolved.spec->make_type());
+    case IRX_ARROW_ENCODING_RUN_END:
+      return arrow::run_end_encoded(resolved.index_spec->make_type(), resolved.spec->make_type());
+    default:
+      return resolved.spec->make_type();
+  }
+}
+
+int make_array_handle(
+    std::shared_ptr<arrow::Array> array,
+    bool nullable,
+    irx_arrow_array_handle** out_array);
+
+// Encoded arrays keep their dictionary or run values as a child handle, and
+// expose their indices or run ends through the index view fields.
+int populate_encoded_metadata(
+    irx_arrow_array_handle* handle,
+    const ResolvedSchema& resolved) {
+  handle->index_dtype_token = resolved.index_spec->dtype_token;
+  handle->index_strides[0] = resolved.index_spec->element_size_bytes;
+
+  std::shared_ptr<arrow::Array> values;
+  if (resolved.encoding == IRX_ARROW_ENCODING_DICTIONARY) {
+    const auto& dictionary_array = static_cast<const arrow::DictionaryArray&>(*handle->array);
+    handle->index_shape[0] = handle->array->length();
+    values = dictionary_array.dictionary();
+  } else {
+    const auto& run_end_array = static_cast<const arrow::RunEndEncodedArray&>(*handle->array);
+    handle->index_shape[0] = run_end_array.run_ends()->length();
+    values = run_end_array.values();
+  }
+  return make_array_handle(std::move(values), true, &handle->encoded_values);
 }
 
 int populate_array_metadata(
@@ -323,11 +558,26 @@ int populate_array_metadata(
 
   handle->type_id = resolved.spec->type_id;
   handle->nullable = resolved.nullable ? 1 : 0;
+  handle->encoding = resolved.encoding;
+  if (resolved.encoding != IRX_ARROW_ENCODING_NONE) {
+    handle->dtype_token = resolved.spec->dtype_token;
+    handle->element_size_bytes = resolved.spec->element_size_bytes;
+    handle->shape[0] = handle->array->length();
+    return populate_encoded_metadata(handle, resolved);
+  }
   handle->dtype_token = resolved.spec->dtype_token;
   handle->element_size_bytes = resolved.spec->element_size_bytes;
   handle->buffer_view_compatible = resolved.spec->buffer_view_compatible ? 1 : 0;
   handle->shape[0] = handle->array->length();
   handle->strides[0] = resolved.spec->element_size_bytes;
+  handle->offset_size_bytes = resolved.spec->offset_size_bytes;
+  if (handle->offset_size_bytes > 0) {
+    const std::shared_ptr<arrow::ArrayData>& data = handle->array->data();
+    handle->offsets_shape[0] = handle->array->length() + 1;
+    handle->offsets_strides[0] = handle->offset_size_bytes;
+    handle->data_shape[0] =
+        data->buffers.size() > 2 && data->buffers[2] != nullptr ? data->buffers[2]->size() : 0;
+  }
   return kArrowOk;
 }
 
@@ -335,8 +585,23 @@ ResolvedSchema resolved_from_arrow_type(
     const std::shared_ptr<arrow::DataType>& type,
     bool nullable) {
   ResolvedSchema resolved;
-  resolved.spec = type_spec_from_arrow_type_id(type->id());
   resolved.nullable = nullable;
+  if (type->id() == arrow::Type::DICTIONARY) {
+    const auto& dictionary_type = static_cast<const arrow::DictionaryType&>(*type);
+    resolved.encoding = IRX_ARROW_ENCODING_DICTIONARY;
+    resolved.index_spec = type_spec_from_arrow_type_id(dictionary_type.index_type()->id());
+    resolved.spec = type_spec_from_arrow_type_id(dictionary_type.value_type()->id());
+  } else if (type->id() == arrow::Type::RUN_END_ENCODED) {
+    const auto& run_end_type = static_cast<const arrow::RunEndEncodedType&>(*type);
+    resolved.encoding = IRX_ARROW_ENCODING_RUN_END;
+    resolved.index_spec = type_spec_from_arrow_type_id(run_end_type.run_end_type()->id());
+    resolved.spec = type_spec_from_arrow_type_id(run_end_type.value_type()->id());
+  } else {
+    resolved.spec = type_spec_from_arrow_type_id(type->id());
+  }
+  if (resolved.encoding != IRX_ARROW_ENCODING_NONE && resolved.index_spec == nullptr) {
+    resolved.spec = nullptr;
+  }
   return resolved;
 }
 
@@ -393,15 +658,24 @@ int validate_c_data_array_layout(
         EINVAL,
         "non-nullable Arrow schema cannot import nullable array data");
   }
+  if (resolved.encoding != IRX_ARROW_ENCODING_NONE) {
+    // Children and dictionaries of encoded arrays are checked by Arrow C++'s
+    // full validation of the borrowed import.
+    return kArrowOk;
+  }
   if (array->n_children != 0 || array->dictionary != nullptr) {
     return set_error(
         EINVAL,
-        "Only plain primitive Arrow arrays are supported in this phase");
+        "Only plain, dictionary-encoded, and run-end encoded Arrow arrays "
+        "are supported in this phase");
   }
-  if (array->n_buffers < kPrimitiveArrayBufferCount) {
+  const int64_t required_buffers =
+      resolved.spec->offset_size_bytes > 0 ? kBinaryArrayBufferCount : kPrimitiveArrayBufferCount;
+  if (array->n_buffers < required_buffers) {
     return set_error(
         EINVAL,
-        "Arrow array n_buffers is smaller than the primitive layout requires");
+        "Arrow array n_buffers is smaller than the %s layout requires",
+        resolved.spec->name);
   }
   if (array->buffers == nullptr) {
     return set_error(EINVAL, "Arrow array buffers must not be NULL");
@@ -437,7 +711,8 @@ int validate_c_data_array_layout(
 
 int validate_c_data_array_with_arrow_cpp(
     const ArrowArray* array,
-    const ResolvedSchema& resolved) {
+    const ResolvedSchema& resolved,
+    std::shared_ptr<arrow::Array>* out_borrowed = nullptr) {
   int code = validate_c_data_array_layout(array, resolved);
   if (code != kArrowOk) {
     return code;
@@ -446,7 +721,7 @@ int validate_c_data_array_with_arrow_cpp(
   ArrowArray temporary = *array;
   temporary.release = noop_arrow_array_release;
   arrow::Result<std::shared_ptr<arrow::Array>> import_result =
-      arrow::ImportArray(&temporary, resolved.spec->make_type());
+      arrow::ImportArray(&temporary, resolved_arrow_type(resolved));
   if (!import_result.ok()) {
     return set_arrow_error(
         EINVAL,
@@ -463,6 +738,9 @@ int validate_c_data_array_with_arrow_cpp(
         "Arrow array validation failed",
         status);
   }
+  if (out_borrowed != nullptr) {
+    *out_borrowed = std::move(imported);
+  }
   return kArrowOk;
 }
 
@@ -528,6 +806,224 @@ int append_double_value(
   }
 }
 
+template <typename Builder>
+int append_typed_values(
+    arrow::ArrayBuilder* builder,
+    const void* values,
+    int64_t count,
+    const uint8_t* validity) {
+  using CType = typename Builder::value_type;
+  auto* typed_builder = dynamic_cast<Builder*>(builder);
+  if (typed_builder == nullptr) {
+    return set_error(EINVAL, "array builder element type mismatch");
+  }
+  const auto* typed_values = static_cast<const CType*>(values);
+  const arrow::Status status =
+      validity == nullptr
+          ? typed_builder->AppendValues(typed_values, count)
+          : typed_builder->AppendValues(typed_values, count, validity, 0);
+  if (!status.ok()) {
+    return set_arrow_error(EINVAL, "Arrow array bulk append failed", status);
+  }
+  return kArrowOk;
+}
+
+int append_bool_values(
+    arrow::ArrayBuilder* builder,
+    const void* values,
+    int64_t count,
+    const uint8_t* validity) {
+  auto* typed_builder = dynamic_cast<arrow::BooleanBuilder*>(builder);
+  if (typed_builder == nullptr) {
+    return set_error(EINVAL, "array builder element type mismatch");
+  }
+  const auto* bytes = static_cast<const uint8_t*>(values);
+  arrow::Status status = typed_builder->Reserve(count);
+  if (!status.ok()) {
+    return set_arrow_error(EINVAL, "Arrow array bulk append failed", status);
+  }
+  for (int64_t index = 0; index < count; ++index) {
+    if (validity != nullptr && !c_data_bit_is_set(validity, index)) {
+      typed_builder->UnsafeAppendNull();
+    } else {
+      typed_builder->UnsafeAppend(bytes[index] != 0);
+    }
+  }
+  return kArrowOk;
+}
+
+int append_values_n(
+    arrow::ArrayBuilder* builder,
+    int32_t type_id,
+    const void* values,
+    int64_t count,
+    const uint8_t* validity) {
+  switch (type_id) {
+    case IRX_ARROW_TYPE_INT8:
+      return append_typed_values<arrow::Int8Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_INT16:
+      return append_typed_values<arrow::Int16Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_INT32:
+      return append_typed_values<arrow::Int32Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_INT64:
+      return append_typed_values<arrow::Int64Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_UINT8:
+      return append_typed_values<arrow::UInt8Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_UINT16:
+      return append_typed_values<arrow::UInt16Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_UINT32:
+      return append_typed_values<arrow::UInt32Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_UINT64:
+      return append_typed_values<arrow::UInt64Builder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_FLOAT32:
+      return append_typed_values<arrow::FloatBuilder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_FLOAT64:
+      return append_typed_values<arrow::DoubleBuilder>(builder, values, count, validity);
+    case IRX_ARROW_TYPE_BOOL:
+      return append_bool_values(builder, values, count, validity);
+    default:
+      return set_error(EINVAL, "array builder has unsupported element type %d", type_id);
+  }
+}
+
+template <typename Builder>
+int append_binary_typed_value(
+    arrow::ArrayBuilder* builder,
+    const void* data,
+    int64_t length) {
+  using OffsetType = typename Builder::offset_type;
+  auto* typed_builder = dynamic_cast<Builder*>(builder);
+  if (typed_builder == nullptr) {
+    return set_error(EINVAL, "array builder element type mismatch");
+  }
+  if (length > std::numeric_limits<OffsetType>::max()) {
+    return set_error(EOVERFLOW, "binary value length overflows the array offsets");
+  }
+  const arrow::Status status = typed_builder->Append(
+      static_cast<const uint8_t*>(data),
+      static_cast<OffsetType>(length));
+  if (!status.ok()) {
+    return set_arrow_error(EINVAL, "Arrow array append failed", status);
+  }
+  return kArrowOk;
+}
+
+int append_binary_value(
+    arrow::ArrayBuilder* builder,
+    int32_t type_id,
+    const void* data,
+    int64_t length) {
+  switch (type_id) {
+    case IRX_ARROW_TYPE_UTF8:
+      return append_binary_typed_value<arrow::StringBuilder>(builder, data, length);
+    case IRX_ARROW_TYPE_LARGE_UTF8:
+      return append_binary_typed_value<arrow::LargeStringBuilder>(builder, data, length);
+    case IRX_ARROW_TYPE_BINARY:
+      return append_binary_typed_value<arrow::BinaryBuilder>(builder, data, length);
+    case IRX_ARROW_TYPE_LARGE_BINARY:
+      return append_binary_typed_value<arrow::LargeBinaryBuilder>(builder, data, length);
+    default:
+      return set_error(EINVAL, "array builder expected a utf8 or binary element type");
+  }
+}
+
+// Values are packed back to back with one length per entry. Null entries
+// still advance the data cursor by their length, so callers can mark rows
+// null without repacking the data.
+template <typename Builder>
+int append_binary_typed_values(
+    arrow::ArrayBuilder* builder,
+    const uint8_t* data,
+    const int64_t* lengths,
+    int64_t count,
+    const uint8_t* validity) {
+  using OffsetType = typename Builder::offset_type;
+  auto* typed_builder = dynamic_cast<Builder*>(builder);
+  if (typed_builder == nullptr) {
+    return set_error(EINVAL, "array builder element type mismatch");
+  }
+
+  int64_t data_bytes = 0;
+  for (int64_t index = 0; index < count; ++index) {
+    const int64_t length = lengths[index];
+    if (length < 0 || length > std::numeric_limits<OffsetType>::max()) {
+      return set_error(EINVAL, "binary value length %lld is out of range", static_cast<long long>(length));
+    }
+    if (validity != nullptr && !c_data_bit_is_set(validity, index)) {
+      continue;
+    }
+    if (data_bytes > std::numeric_limits<int64_t>::max() - length) {
+      return set_error(EOVERFLOW, "binary bulk append size overflowed int64");
+    }
+    data_bytes += length;
+  }
+  if (data == nullptr && data_bytes > 0) {
+    return set_error(EINVAL, "bulk append data must not be NULL");
+  }
+
+  arrow::Status status = typed_builder->Reserve(count);
+  if (status.ok()) {
+    status = typed_builder->ReserveData(data_bytes);
+  }
+  if (!status.ok()) {
+    return set_arrow_error(EINVAL, "Arrow array bulk append failed", status);
+  }
+
+  const uint8_t* cursor = data;
+  for (int64_t index = 0; index < count; ++index) {
+    const int64_t length = lengths[index];
+    if (validity != nullptr && !c_data_bit_is_set(validity, index)) {
+      typed_builder->UnsafeAppendNull();
+    } else {
+      typed_builder->UnsafeAppend(cursor, static_cast<OffsetType>(length));
+    }
+    cursor += length;
+  }
+  return kArrowOk;
+}
+
+int append_binary_values(
+    arrow::ArrayBuilder* builder,
+    int32_t type_id,
+    const void* data,
+    const int64_t* lengths,
+    int64_t count,
+    const uint8_t* validity) {
+  const auto* bytes = static_cast<const uint8_t*>(data);
+  switch (type_id) {
+    case IRX_ARROW_TYPE_UTF8:
+      return append_binary_typed_values<arrow::StringBuilder>(builder, bytes, lengths, count, validity);
+    case IRX_ARROW_TYPE_LARGE_UTF8:
+      return append_binary_typed_values<arrow::LargeStringBuilder>(builder, bytes, lengths, count, validity);
+    case IRX_ARROW_TYPE_BINARY:
+      return append_binary_typed_values<arrow::BinaryBuilder>(builder, bytes, lengths, count, validity);
+    case IRX_ARROW_TYPE_LARGE_BINARY:
+      return append_binary_typed_values<arrow::LargeBinaryBuilder>(builder, bytes, lengths, count, validity);
+    default:
+      return set_error(EINVAL, "array builder expected a utf8 or binary element type");
+  }
+}
+
+int append_c_data_binary_value(
+    arrow::ArrayBuilder* builder,
+    const TypeSpec* spec,
+    const ArrowArray* array,
+    int64_t logical_index) {
+  int64_t start = 0;
+  int64_t end = 0;
+  if (spec->offset_size_bytes == 4) {
+    const auto* offsets = static_cast<const int32_t*>(array->buffers[1]);
+    start = offsets[logical_index];
+    end = offsets[logical_index + 1];
+  } else {
+    const auto* offsets = static_cast<const int64_t*>(array->buffers[1]);
+    start = offsets[logical_index];
+    end = offsets[logical_index + 1];
+  }
+  const auto* data = static_cast<const uint8_t*>(array->buffers[2]);
+  return append_binary_value(builder, spec->type_id, data == nullptr ? data : data + start, end - start);
+}
+
 int append_c_data_value(
     arrow::ArrayBuilder* builder,
     const TypeSpec* spec,
@@ -544,6 +1040,9 @@ int append_c_data_value(
   if (array->buffers == nullptr || array->buffers[1] == nullptr) {
     return set_error(EINVAL, "Arrow array value buffer must not be NULL");
   }
+  if (spec->offset_size_bytes > 0) {
+    return append_c_data_binary_value(builder, spec, array, logical_index);
+  }
 
   const auto* data = static_cast<const uint8_t*>(array->buffers[1]);
   const uint8_t* slot = data + logical_index * spec->element_size_bytes;
@@ -582,11 +1081,23 @@ int build_array_copy_from_c_data(
     const ArrowArray* array,
     const ResolvedSchema& resolved,
     std::shared_ptr<arrow::Array>* out_array) {
-  int code = validate_c_data_array_with_arrow_cpp(array, resolved);
+  std::shared_ptr<arrow::Array> borrowed;
+  int code = validate_c_data_array_with_arrow_cpp(array, resolved, &borrowed);
   if (code != kArrowOk) {
     return code;
   }
 
+  if (resolved.encoding != IRX_ARROW_ENCODING_NONE) {
+    // Copy the encoded buffers as they are instead of decoding them.
+    arrow::Result<std::shared_ptr<arrow::Array>> copy_result =
+        borrowed->CopyTo(arrow::default_cpu_memory_manager());
+    if (!copy_result.ok()) {
+      return set_arrow_error(EINVAL, "Arrow encoded array copy failed", copy_result.status());
+    }
+    *out_array = std::move(copy_result).ValueUnsafe();
+    return kArrowOk;
+  }
+
   arrow::Result<std::unique_ptr<arrow::ArrayBuilder>> builder_result =
       arrow::MakeBuilder(resolved.spec->make_type());
   if (!builder_result.ok()) {
@@ -782,67 +1293,338 @@ bool tensor_is_f_contiguous(const irx_arrow_tensor_handle* tensor) {
   return true;
 }
 
-}  // namespace
+int make_array_handle(
+    std::shared_ptr<arrow::Array> array,
+    bool nullable,
+    irx_arrow_array_handle** out_array) {
+  ResolvedSchema resolved = resolved_from_arrow_type(array->type(), nullable);
+  if (resolved.spec == nullptr) {
+    return set_error(
+        EINVAL,
+        "Arrow column type %s is not supported",
+        array->type()->ToString().c_str());
+  }
 
-extern "C" {
+  auto handle = std::make_unique<irx_arrow_array_handle>();
+  handle->refcount = kInitialRefcount;
+  handle->array = std::move(array);
+  const int code = populate_array_metadata(handle.get(), resolved);
+  if (code != kArrowOk) {
+    return code;
+  }
+  *out_array = handle.release();
+  return kArrowOk;
+}
 
-int irx_arrow_schema_import_copy(
-    const ArrowSchema* schema,
-    irx_arrow_schema_handle** out_schema) {
-  clear_error();
-  try {
-    if (out_schema == nullptr) {
-      return set_error(EINVAL, "out_schema must not be NULL");
-    }
-    *out_schema = nullptr;
+template <typename RunEnd>
+int64_t find_run(const arrow::Array& run_ends, int64_t logical_index) {
+  const RunEnd* begin = run_ends.data()->GetValues<RunEnd>(1);
+  const RunEnd* end = begin + run_ends.length();
+  return std::upper_bound(begin, end, logical_index) - begin;
+}
 
-    ResolvedSchema resolved;
-    int code = validate_supported_c_schema(schema, &resolved);
-    if (code != kArrowOk) {
-      return code;
+// Map one logical index of an encoded array to its dictionary index or run;
+// null dictionary slots map to -1.
+int64_t encoded_physical_index(const irx_arrow_array_handle* array, int64_t index) {
+  if (array->encoding == IRX_ARROW_ENCODING_DICTIONARY) {
+    if (array->array->IsNull(index)) {
+      return -1;
     }
+    return static_cast<const arrow::DictionaryArray&>(*array->array).GetValueIndex(index);
+  }
 
-    auto handle = std::make_unique<irx_arrow_schema_handle>();
-    handle->refcount = kInitialRefcount;
-    handle->field = arrow::field("", resolved.spec->make_type(), resolved.nullable);
-    handle->type_id = resolved.spec->type_id;
-    handle->nullable = resolved.nullable ? 1 : 0;
-
-    *out_schema = handle.release();
-    return kArrowOk;
-  } catch (const std::bad_alloc&) {
-    return set_error(ENOMEM, "failed to allocate Arrow schema");
-  } catch (const std::exception& exc) {
-    return set_exception_error("irx_arrow_schema_import_copy", exc);
+  const auto& run_end_array = static_cast<const arrow::RunEndEncodedArray&>(*array->array);
+  const arrow::Array& run_ends = *run_end_array.run_ends();
+  const int64_t logical_index = run_end_array.offset() + index;
+  switch (run_ends.type_id()) {
+    case arrow::Type::INT16:
+      return find_run<int16_t>(run_ends, logical_index);
+    case arrow::Type::INT32:
+      return find_run<int32_t>(run_ends, logical_index);
+    default:
+      return find_run<int64_t>(run_ends, logical_index);
+  }
+}
+
+template <typename RunEnd>
+arrow::Status decode_run_end_encoded(
+    const arrow::RunEndEncodedArray& array,
+    const arrow::ArraySpan& values,
+    arrow::ArrayBuilder* builder) {
+  const arrow::Array& run_ends = *array.run_ends();
+  const RunEnd* ends = run_ends.data()->GetValues<RunEnd>(1);
+  const int64_t logical_end = array.offset() + array.length();
+  int64_t position = array.offset();
+  int64_t physical = find_run<RunEnd>(run_ends, position);
+  for (; position < logical_end; ++physical) {
+    const int64_t run_end = std::min<int64_t>(ends[physical], logical_end);
+    for (; position < run_end; ++position) {
+      ARROW_RETURN_NOT_OK(builder->AppendArraySlice(values, physical, 1));
+    }
   }
+  return arrow::Status::OK();
 }
 
-int irx_arrow_schema_export(
-    const irx_arrow_schema_handle* schema,
-    ArrowSchema* out_schema) {
-  clear_error();
-  try {
-    if (schema == nullptr) {
-      return set_error(EINVAL, "schema must not be NULL");
-    }
-    if (out_schema == nullptr) {
-      return set_error(EINVAL, "out_schema must not be NULL");
+arrow::Status decode_encoded_array(
+    const irx_arrow_array_handle* array,
+    arrow::ArrayBuilder* builder) {
+  ARROW_RETURN_NOT_OK(builder->Reserve(array->array->length()));
+  const arrow::ArraySpan values(*array->encoded_values->array->data());
+  if (array->encoding == IRX_ARROW_ENCODING_DICTIONARY) {
+    for (int64_t index = 0; index < array->array->length(); ++index) {
+      const int64_t physical = encoded_physical_index(array, index);
+      ARROW_RETURN_NOT_OK(
+          physical < 0 ? builder->AppendNull() : builder->AppendArraySlice(values, physical, 1));
     }
-    std::memset(out_schema, 0, sizeof(*out_schema));
+    return arrow::Status::OK();
+  }
 
-    const arrow::Status status = arrow::ExportField(*schema->field, out_schema);
-    if (!status.ok()) {
-      return set_arrow_error(EINVAL, "Arrow schema export failed", status);
-    }
-    return kArrowOk;
-  } catch (const std::exception& exc) {
-    return set_exception_error("irx_arrow_schema_export", exc);
+  const auto& run_end_array = static_cast<const arrow::RunEndEncodedArray&>(*array->array);
+  switch (run_end_array.run_ends()->type_id()) {
+    case arrow::Type::INT16:
+      return decode_run_end_encoded<int16_t>(run_end_array, values, builder);
+    case arrow::Type::INT32:
+      return decode_run_end_encoded<int32_t>(run_end_array, values, builder);
+    default:
+      return decode_run_end_encoded<int64_t>(run_end_array, values, builder);
   }
 }
 
-int32_t irx_arrow_schema_type_id(const irx_arrow_schema_handle* schema) {
-  clear_error();
-  if (schema == nullptr) {
+void fill_index_view(
+    const irx_arrow_array_handle* array,
+    const arrow::ArrayData& data,
+    int64_t offset_bytes,
+    irx_buffer_view* out_view) {
+  std::memset(out_view, 0, sizeof(*out_view));
+  if (data.buffers.size() > 1 && data.buffers[1] != nullptr) {
+    out_view->data = const_cast<uint8_t*>(data.buffers[1]->data());
+  }
+  out_view->owner = nullptr;
+  out_view->dtype = reinterpret_cast<void*>(array->index_dtype_token);
+  out_view->ndim = 1;
+  out_view->shape = const_cast<int64_t*>(array->index_shape);
+  out_view->strides = const_cast<int64_t*>(array->index_strides);
+  out_view->offset_bytes = offset_bytes;
+  out_view->flags = IRX_BUFFER_FLAG_BORROWED |
+                    IRX_BUFFER_FLAG_READONLY |
+                    IRX_BUFFER_FLAG_C_CONTIGUOUS;
+}
+
+int make_schema_handle(
+    const std::shared_ptr<arrow::Field>& field,
+    irx_arrow_schema_handle** out_schema) {
+  const TypeSpec* spec = resolved_from_arrow_type(field->type(), field->nullable()).spec;
+  if (spec == nullptr) {
+    return set_error(EINVAL, "unsupported Arrow field storage type");
+  }
+
+  auto handle = std::make_unique<irx_arrow_schema_handle>();
+  handle->refcount = kInitialRefcount;
+  handle->field = field;
+  handle->type_id = spec->type_id;
+  handle->nullable = field->nullable() ? 1 : 0;
+  *out_schema = handle.release();
+  return kArrowOk;
+}
+
+// Build a record batch whose field nullability follows each array handle, the
+// same way the array schema copy reports it.
+int record_batch_from_columns(
+    int32_t column_count,
+    const char* const* column_names,
+    irx_arrow_array_handle* const* columns,
+    std::shared_ptr<arrow::RecordBatch>* out_batch) {
+  if (column_count <= 0 || column_names == nullptr || columns == nullptr) {
+    return set_error(EINVAL, "record batches need at least one named column");
+  }
+
+  std::vector<std::shared_ptr<arrow::Field>> fields;
+  std::vector<std::shared_ptr<arrow::Array>> arrays;
+  fields.reserve(static_cast<size_t>(column_count));
+  arrays.reserve(static_cast<size_t>(column_count));
+  for (int32_t index = 0; index < column_count; ++index) {
+    const irx_arrow_array_handle* column = columns[index];
+    if (column == nullptr || !column->array || column_names[index] == nullptr) {
+      return set_error(EINVAL, "column %d must have a name and an array", index);
+    }
+    if (!arrays.empty() && column->array->length() != arrays.front()->length()) {
+      return set_error(EINVAL, "record batch columns must have equal lengths");
+    }
+    fields.push_back(
+        arrow::field(column_names[index], column->array->type(), column->nullable != 0));
+    arrays.push_back(column->array);
+  }
+
+  const int64_t length = arrays.front()->length();
+  *out_batch = arrow::RecordBatch::Make(arrow::schema(std::move(fields)), length, std::move(arrays));
+  return kArrowOk;
+}
+
+int wrap_record_batch(
+    std::shared_ptr<arrow::RecordBatch> batch,
+    irx_arrow_record_batch_handle** out_batch) {
+  auto handle = std::make_unique<irx_arrow_record_batch_handle>();
+  handle->refcount = kInitialRefcount;
+  handle->columns.reserve(static_cast<size_t>(batch->num_columns()));
+  for (int index = 0; index < batch->num_columns(); ++index) {
+    irx_arrow_array_handle* column = nullptr;
+    const int code =
+        make_array_handle(batch->column(index), batch->schema()->field(index)->nullable(), &column);
+    if (code != kArrowOk) {
+      return code;
+    }
+    handle->columns.push_back(column);
+  }
+  handle->batch = std::move(batch);
+  *out_batch = handle.release();
+  return kArrowOk;
+}
+
+int wrap_table(
+    std::shared_ptr<arrow::Table> table,
+    irx_arrow_table_handle** out_table) {
+  auto handle = std::make_unique<irx_arrow_table_handle>();
+  handle->refcount = kInitialRefcount;
+  handle->chunks.resize(static_cast<size_t>(table->num_columns()));
+  for (int index = 0; index < table->num_columns(); ++index) {
+    const bool nullable = table->schema()->field(index)->nullable();
+    std::vector<irx_arrow_array_handle*>& chunks = handle->chunks[static_cast<size_t>(index)];
+    for (const std::shared_ptr<arrow::Array>& chunk : table->column(index)->chunks()) {
+      irx_arrow_array_handle* column = nullptr;
+      const int code = make_array_handle(chunk, nullable, &column);
+      if (code != kArrowOk) {
+        return code;
+      }
+      chunks.push_back(column);
+    }
+  }
+  handle->table = std::move(table);
+  *out_table = handle.release();
+  return kArrowOk;
+}
+
+int check_slice_bounds(int64_t offset, int64_t length, int64_t num_rows) {
+  if (offset < 0 || length < 0 || offset > num_rows || length > num_rows - offset) {
+    return set_error(
+        EINVAL,
+        "slice [%lld, %lld) is outside %lld rows",
+        static_cast<long long>(offset),
+        static_cast<long long>(offset) + static_cast<long long>(length),
+        static_cast<long long>(num_rows));
+  }
+  return kArrowOk;
+}
+
+int load_ipc_record_batch(
+    irx_arrow_ipc_file_reader_handle* reader,
+    int64_t batch_index) {
+  if (batch_index < 0 || batch_index >= reader->reader->num_record_batches()) {
+    return set_error(EINVAL, "record batch index %lld is out of range", static_cast<long long>(batch_index));
+  }
+  // Columns are usually read one after another from the same batch, so keep
+  // the last decoded batch instead of re-reading its metadata per column.
+  if (reader->cached_batch_index != batch_index) {
+    arrow::Result<std::shared_ptr<arrow::RecordBatch>> batch_result =
+        reader->reader->ReadRecordBatch(static_cast<int>(batch_index));
+    if (!batch_result.ok()) {
+      return set_arrow_error(EINVAL, "Arrow IPC record batch read failed", batch_result.status());
+    }
+    reader->cached_batch = std::move(batch_result).ValueUnsafe();
+    reader->cached_batch_index = batch_index;
+  }
+  return kArrowOk;
+}
+
+int write_ipc_record_batch(
+    irx_arrow_ipc_stream_writer_handle* writer,
+    const std::shared_ptr<arrow::RecordBatch>& batch) {
+  if (!writer->writer) {
+    arrow::Result<std::shared_ptr<arrow::ipc::RecordBatchWriter>> writer_result =
+        arrow::ipc::MakeStreamWriter(writer->sink, batch->schema(), writer->options);
+    if (!writer_result.ok()) {
+      return set_arrow_error(EIO, "Arrow IPC stream writer creation failed", writer_result.status());
+    }
+    writer->writer = std::move(writer_result).ValueUnsafe();
+    writer->schema = batch->schema();
+  } else if (!writer->schema->Equals(*batch->schema())) {
+    return set_error(EINVAL, "columns do not match the Arrow IPC stream schema");
+  }
+
+  const int64_t length = batch->num_rows();
+  const int64_t step = writer->batch_rows > 0 ? writer->batch_rows : std::max<int64_t>(length, 1);
+  for (int64_t offset = 0; offset < length; offset += step) {
+    const int64_t rows = std::min(step, length - offset);
+    std::shared_ptr<arrow::RecordBatch> slice = rows == length ? batch : batch->Slice(offset, rows);
+    const arrow::Status status = writer->writer->WriteRecordBatch(*slice);
+    if (!status.ok()) {
+      return set_arrow_error(EIO, "Arrow IPC record batch write failed", status);
+    }
+    writer->rows_written += rows;
+  }
+  return kArrowOk;
+}
+
+}  // namespace
+
+extern "C" {
+
+int irx_arrow_schema_import_copy(
+    const ArrowSchema* schema,
+    irx_arrow_schema_handle** out_schema) {
+  clear_error();
+  try {
+    if (out_schema == nullptr) {
+      return set_error(EINVAL, "out_schema must not be NULL");
+    }
+    *out_schema = nullptr;
+
+    ResolvedSchema resolved;
+    int code = validate_supported_c_schema(schema, &resolved);
+    if (code != kArrowOk) {
+      return code;
+    }
+
+    auto handle = std::make_unique<irx_arrow_schema_handle>();
+    handle->refcount = kInitialRefcount;
+    handle->field = arrow::field("", resolved_arrow_type(resolved), resolved.nullable);
+    handle->type_id = resolved.spec->type_id;
+    handle->nullable = resolved.nullable ? 1 : 0;
+
+    *out_schema = handle.release();
+    return kArrowOk;
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow schema");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_schema_import_copy", exc);
+  }
+}
+
+int irx_arrow_schema_export(
+    const irx_arrow_schema_handle* schema,
+    ArrowSchema* out_schema) {
+  clear_error();
+  try {
+    if (schema == nullptr) {
+      return set_error(EINVAL, "schema must not be NULL");
+    }
+    if (out_schema == nullptr) {
+      return set_error(EINVAL, "out_schema must not be NULL");
+    }
+    std::memset(out_schema, 0, sizeof(*out_schema));
+
+    const arrow::Status status = arrow::ExportField(*schema->field, out_schema);
+    if (!status.ok()) {
+      return set_arrow_error(EINVAL, "Arrow schema export failed", status);
+    }
+    return kArrowOk;
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_schema_export", exc);
+  }
+}
+
+int32_t irx_arrow_schema_type_id(const irx_arrow_schema_handle* schema) {
+  clear_error();
+  if (schema == nullptr) {
     set_error(EINVAL, "schema must not be NULL");
     return IRX_ARROW_TYPE_UNKNOWN;
   }
@@ -960,6 +1742,84 @@ int irx_arrow_array_builder_append_double(
   return append_double_value(builder->builder.get(), builder->type_id, value);
 }
 
+int irx_arrow_array_builder_append_n(
+    irx_arrow_array_builder_handle* builder,
+    const void* values,
+    int64_t count,
+    const uint8_t* validity) {
+  clear_error();
+  if (builder == nullptr) {
+    return set_error(EINVAL, "builder must not be NULL");
+  }
+  if (count < 0) {
+    return set_error(EINVAL, "bulk append count must be non-negative");
+  }
+  if (count == 0) {
+    return kArrowOk;
+  }
+  if (values == nullptr) {
+    return set_error(EINVAL, "bulk append values must not be NULL");
+  }
+  try {
+    return append_values_n(builder->builder.get(), builder->type_id, values, count, validity);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to grow Arrow builder");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_array_builder_append_n", exc);
+  }
+}
+
+int irx_arrow_array_builder_append_binary(
+    irx_arrow_array_builder_handle* builder,
+    const void* data,
+    int64_t length) {
+  clear_error();
+  if (builder == nullptr) {
+    return set_error(EINVAL, "builder must not be NULL");
+  }
+  if (length < 0) {
+    return set_error(EINVAL, "binary value length must be non-negative");
+  }
+  if (data == nullptr && length > 0) {
+    return set_error(EINVAL, "binary value data must not be NULL");
+  }
+  try {
+    return append_binary_value(builder->builder.get(), builder->type_id, data, length);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to grow Arrow builder");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_array_builder_append_binary", exc);
+  }
+}
+
+int irx_arrow_array_builder_append_binary_n(
+    irx_arrow_array_builder_handle* builder,
+    const void* data,
+    const int64_t* lengths,
+    int64_t count,
+    const uint8_t* validity) {
+  clear_error();
+  if (builder == nullptr) {
+    return set_error(EINVAL, "builder must not be NULL");
+  }
+  if (count < 0) {
+    return set_error(EINVAL, "bulk append count must be non-negative");
+  }
+  if (count == 0) {
+    return kArrowOk;
+  }
+  if (lengths == nullptr) {
+    return set_error(EINVAL, "bulk append lengths must not be NULL");
+  }
+  try {
+    return append_binary_values(builder->builder.get(), builder->type_id, data, lengths, count, validity);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to grow Arrow builder");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_array_builder_append_binary_n", exc);
+  }
+}
+
 int irx_arrow_array_builder_int32_new(
     irx_arrow_array_builder_handle** out_builder) {
   return irx_arrow_array_builder_new(IRX_ARROW_TYPE_INT32, out_builder);
@@ -1273,6 +2133,18 @@ int irx_arrow_array_borrow_buffer_view(
   if (out_view == nullptr) {
     return set_error(EINVAL, "out_view must not be NULL");
   }
+  if (array->encoding != IRX_ARROW_ENCODING_NONE) {
+    return set_error(
+        EINVAL,
+        "Arrow encoded arrays cannot be exposed as plain buffer views; borrow "
+        "their indices or run ends and values, or decode them first");
+  }
+  if (array->offset_size_bytes > 0) {
+    return set_error(
+        EINVAL,
+        "Arrow variable-width arrays cannot be exposed as plain buffer views; "
+        "borrow their offsets and data buffers instead");
+  }
   if (!array->buffer_view_compatible) {
     return set_error(
         EINVAL,
@@ -1311,49 +2183,324 @@ int irx_arrow_array_borrow_buffer_view(
   return kArrowOk;
 }
 
-int irx_arrow_array_retain(irx_arrow_array_handle* array) {
+int irx_arrow_array_borrow_offsets_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view) {
   clear_error();
-  if (array == nullptr) {
-    return kArrowOk;
+  if (array == nullptr || !array->array) {
+    return set_error(EINVAL, "array must not be NULL");
   }
-  if (array->refcount <= 0) {
-    return set_error(EINVAL, "array handle is released");
+  if (out_view == nullptr) {
+    return set_error(EINVAL, "out_view must not be NULL");
   }
-  array->refcount += 1;
+  if (array->offset_size_bytes <= 0) {
+    return set_error(EINVAL, "only utf8 and binary arrays have an offsets buffer");
+  }
+
+  int64_t offset_bytes = 0;
+  int code = checked_offset_bytes(
+      array->array->offset(),
+      array->offset_size_bytes,
+      &offset_bytes);
+  if (code != kArrowOk) {
+    return code;
+  }
+
+  const std::shared_ptr<arrow::ArrayData>& data = array->array->data();
+  std::memset(out_view, 0, sizeof(*out_view));
+  out_view->data = const_cast<uint8_t*>(data->buffers[1]->data());
+  out_view->owner = nullptr;
+  out_view->dtype = reinterpret_cast<void*>(
+      array->offset_size_bytes == 4 ? IRX_BUFFER_DTYPE_INT32 : IRX_BUFFER_DTYPE_INT64);
+  out_view->ndim = 1;
+  out_view->shape = const_cast<int64_t*>(array->offsets_shape);
+  out_view->strides = const_cast<int64_t*>(array->offsets_strides);
+  out_view->offset_bytes = offset_bytes;
+  out_view->flags = IRX_BUFFER_FLAG_BORROWED |
+                    IRX_BUFFER_FLAG_READONLY |
+                    IRX_BUFFER_FLAG_C_CONTIGUOUS;
   return kArrowOk;
 }
 
-void irx_arrow_array_release(irx_arrow_array_handle* array) {
-  if (array == nullptr || array->refcount <= 0) {
-    return;
+int irx_arrow_array_borrow_data_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view) {
+  clear_error();
+  if (array == nullptr || !array->array) {
+    return set_error(EINVAL, "array must not be NULL");
   }
-  array->refcount -= 1;
-  if (array->refcount == 0) {
-    delete array;
+  if (out_view == nullptr) {
+    return set_error(EINVAL, "out_view must not be NULL");
+  }
+  if (array->offset_size_bytes <= 0) {
+    return set_error(EINVAL, "only utf8 and binary arrays have a data buffer");
+  }
+
+  const std::shared_ptr<arrow::ArrayData>& data = array->array->data();
+  std::memset(out_view, 0, sizeof(*out_view));
+  if (data->buffers.size() > 2 && data->buffers[2] != nullptr) {
+    out_view->data = const_cast<uint8_t*>(data->buffers[2]->data());
   }
+  out_view->owner = nullptr;
+  out_view->dtype = reinterpret_cast<void*>(IRX_BUFFER_DTYPE_UINT8);
+  out_view->ndim = 1;
+  out_view->shape = const_cast<int64_t*>(array->data_shape);
+  out_view->strides = const_cast<int64_t*>(array->data_strides);
+  out_view->offset_bytes = 0;
+  out_view->flags = IRX_BUFFER_FLAG_BORROWED |
+                    IRX_BUFFER_FLAG_READONLY |
+                    IRX_BUFFER_FLAG_C_CONTIGUOUS;
+  return kArrowOk;
 }
 
-int irx_arrow_tensor_builder_new(
-    int32_t type_id,
-    int32_t ndim,
-    const int64_t* shape,
-    const int64_t* strides,
-    irx_arrow_tensor_builder_handle** out_builder) {
+int irx_arrow_array_value_bytes(
+    const irx_arrow_array_handle* array,
+    int64_t index,
+    const uint8_t** out_data,
+    int64_t* out_length) {
   clear_error();
-  try {
-    if (out_builder == nullptr) {
-      return set_error(EINVAL, "out_builder must not be NULL");
-    }
-    *out_builder = nullptr;
-
-    const TypeSpec* spec = type_spec_from_type_id(type_id);
-    if (spec == nullptr) {
-      return set_error(EINVAL, "unsupported Arrow tensor type id %d", type_id);
-    }
-    if (!spec->buffer_view_compatible || spec->element_size_bytes <= 0) {
-      return set_error(
-          EINVAL,
-          "Arrow tensor builder requires a fixed-width primitive value type");
+  if (array == nullptr || !array->array) {
+    return set_error(EINVAL, "array must not be NULL");
+  }
+  if (out_data == nullptr || out_length == nullptr) {
+    return set_error(EINVAL, "out_data and out_length must not be NULL");
+  }
+  *out_data = nullptr;
+  *out_length = 0;
+  if (index < 0 || index >= array->array->length()) {
+    return set_error(EINVAL, "array index %lld is out of bounds", static_cast<long long>(index));
+  }
+  if (array->encoding != IRX_ARROW_ENCODING_NONE) {
+    const int64_t physical = encoded_physical_index(array, index);
+    if (physical < 0) {
+      return kArrowOk;
+    }
+    return irx_arrow_array_value_bytes(array->encoded_values, physical, out_data, out_length);
+  }
+  if (array->offset_size_bytes <= 0) {
+    return set_error(EINVAL, "only utf8 and binary arrays have byte values");
+  }
+  if (array->array->IsNull(index)) {
+    return kArrowOk;
+  }
+
+  const std::shared_ptr<arrow::ArrayData>& data = array->array->data();
+  const int64_t logical_index = array->array->offset() + index;
+  int64_t start = 0;
+  int64_t end = 0;
+  if (array->offset_size_bytes == 4) {
+    const auto* offsets = data->GetValues<int32_t>(1, 0);
+    start = offsets[logical_index];
+    end = offsets[logical_index + 1];
+  } else {
+    const auto* offsets = data->GetValues<int64_t>(1, 0);
+    start = offsets[logical_index];
+    end = offsets[logical_index + 1];
+  }
+  if (data->buffers.size() > 2 && data->buffers[2] != nullptr) {
+    *out_data = data->buffers[2]->data() + start;
+  }
+  *out_length = end - start;
+  return kArrowOk;
+}
+
+int32_t irx_arrow_array_encoding(const irx_arrow_array_handle* array) {
+  clear_error();
+  if (array == nullptr) {
+    set_error(EINVAL, "array must not be NULL");
+    return IRX_ARROW_ENCODING_NONE;
+  }
+  return array->encoding;
+}
+
+int irx_arrow_array_borrow_indices_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view) {
+  clear_error();
+  if (array == nullptr || !array->array) {
+    return set_error(EINVAL, "array must not be NULL");
+  }
+  if (out_view == nullptr) {
+    return set_error(EINVAL, "out_view must not be NULL");
+  }
+  if (array->encoding != IRX_ARROW_ENCODING_DICTIONARY) {
+    return set_error(EINVAL, "only dictionary-encoded arrays have an indices buffer");
+  }
+
+  int64_t offset_bytes = 0;
+  const int code = checked_offset_bytes(
+      array->array->offset(),
+      array->index_strides[0],
+      &offset_bytes);
+  if (code != kArrowOk) {
+    return code;
+  }
+  fill_index_view(array, *array->array->data(), offset_bytes, out_view);
+  if (array_has_validity_buffer(array)) {
+    out_view->flags |= IRX_BUFFER_FLAG_VALIDITY_BITMAP;
+  }
+  return kArrowOk;
+}
+
+int irx_arrow_array_borrow_run_ends_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view) {
+  clear_error();
+  if (array == nullptr || !array->array) {
+    return set_error(EINVAL, "array must not be NULL");
+  }
+  if (out_view == nullptr) {
+    return set_error(EINVAL, "out_view must not be NULL");
+  }
+  if (array->encoding != IRX_ARROW_ENCODING_RUN_END) {
+    return set_error(EINVAL, "only run-end encoded arrays have a run ends buffer");
+  }
+
+  const std::shared_ptr<arrow::Array>& run_ends =
+      static_cast<const arrow::RunEndEncodedArray&>(*array->array).run_ends();
+  int64_t offset_bytes = 0;
+  const int code = checked_offset_bytes(
+      run_ends->offset(),
+      array->index_strides[0],
+      &offset_bytes);
+  if (code != kArrowOk) {
+    return code;
+  }
+  fill_index_view(array, *run_ends->data(), offset_bytes, out_view);
+  return kArrowOk;
+}
+
+int irx_arrow_array_borrow_dictionary(
+    const irx_arrow_array_handle* array,
+    irx_arrow_array_handle** out_dictionary) {
+  clear_error();
+  if (array == nullptr || out_dictionary == nullptr) {
+    return set_error(EINVAL, "array and out_dictionary must not be NULL");
+  }
+  *out_dictionary = nullptr;
+  if (array->encoding != IRX_ARROW_ENCODING_DICTIONARY) {
+    return set_error(EINVAL, "only dictionary-encoded arrays have a dictionary");
+  }
+  *out_dictionary = array->encoded_values;
+  return kArrowOk;
+}
+
+int irx_arrow_array_borrow_run_values(
+    const irx_arrow_array_handle* array,
+    irx_arrow_array_handle** out_values) {
+  clear_error();
+  if (array == nullptr || out_values == nullptr) {
+    return set_error(EINVAL, "array and out_values must not be NULL");
+  }
+  *out_values = nullptr;
+  if (array->encoding != IRX_ARROW_ENCODING_RUN_END) {
+    return set_error(EINVAL, "only run-end encoded arrays have run values");
+  }
+  *out_values = array->encoded_values;
+  return kArrowOk;
+}
+
+int irx_arrow_array_physical_index(
+    const irx_arrow_array_handle* array,
+    int64_t index,
+    int64_t* out_physical_index) {
+  clear_error();
+  if (array == nullptr || !array->array) {
+    return set_error(EINVAL, "array must not be NULL");
+  }
+  if (out_physical_index == nullptr) {
+    return set_error(EINVAL, "out_physical_index must not be NULL");
+  }
+  if (index < 0 || index >= array->array->length()) {
+    return set_error(EINVAL, "array index %lld is out of bounds", static_cast<long long>(index));
+  }
+  *out_physical_index =
+      array->encoding == IRX_ARROW_ENCODING_NONE ? index : encoded_physical_index(array, index);
+  return kArrowOk;
+}
+
+int irx_arrow_array_decode(
+    const irx_arrow_array_handle* array,
+    irx_arrow_array_handle** out_array) {
+  clear_error();
+  try {
+    if (array == nullptr || !array->array) {
+      return set_error(EINVAL, "array must not be NULL");
+    }
+    if (out_array == nullptr) {
+      return set_error(EINVAL, "out_array must not be NULL");
+    }
+    *out_array = nullptr;
+    if (array->encoding == IRX_ARROW_ENCODING_NONE) {
+      return make_array_handle(array->array, array->nullable != 0, out_array);
+    }
+
+    arrow::Result<std::unique_ptr<arrow::ArrayBuilder>> builder_result =
+        arrow::MakeBuilder(array->encoded_values->array->type());
+    if (!builder_result.ok()) {
+      return set_arrow_error(EINVAL, "Arrow builder allocation failed", builder_result.status());
+    }
+    std::unique_ptr<arrow::ArrayBuilder> builder = std::move(builder_result).ValueUnsafe();
+    arrow::Status status = decode_encoded_array(array, builder.get());
+    std::shared_ptr<arrow::Array> decoded;
+    if (status.ok()) {
+      status = builder->Finish(&decoded);
+    }
+    if (!status.ok()) {
+      return set_arrow_error(EINVAL, "Arrow array decode failed", status);
+    }
+    const bool nullable = array->nullable != 0 || decoded->null_count() > 0;
+    return make_array_handle(std::move(decoded), nullable, out_array);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate decoded Arrow array");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_array_decode", exc);
+  }
+}
+
+int irx_arrow_array_retain(irx_arrow_array_handle* array) {
+  clear_error();
+  if (array == nullptr) {
+    return kArrowOk;
+  }
+  if (array->refcount <= 0) {
+    return set_error(EINVAL, "array handle is released");
+  }
+  array->refcount += 1;
+  return kArrowOk;
+}
+
+void irx_arrow_array_release(irx_arrow_array_handle* array) {
+  if (array == nullptr || array->refcount <= 0) {
+    return;
+  }
+  array->refcount -= 1;
+  if (array->refcount == 0) {
+    delete array;
+  }
+}
+
+int irx_arrow_tensor_builder_new(
+    int32_t type_id,
+    int32_t ndim,
+    const int64_t* shape,
+    const int64_t* strides,
+    irx_arrow_tensor_builder_handle** out_builder) {
+  clear_error();
+  try {
+    if (out_builder == nullptr) {
+      return set_error(EINVAL, "out_builder must not be NULL");
+    }
+    *out_builder = nullptr;
+
+    const TypeSpec* spec = type_spec_from_type_id(type_id);
+    if (spec == nullptr) {
+      return set_error(EINVAL, "unsupported Arrow tensor type id %d", type_id);
+    }
+    if (!spec->buffer_view_compatible || spec->element_size_bytes <= 0) {
+      return set_error(
+          EINVAL,
+          "Arrow tensor builder requires a fixed-width primitive value type");
     }
 
     int64_t element_count = 0;
@@ -1478,6 +2625,34 @@ int irx_arrow_tensor_builder_append_double(
   }
 }
 
+int irx_arrow_tensor_builder_append_n(
+    irx_arrow_tensor_builder_handle* builder,
+    const void* values,
+    int64_t count) {
+  clear_error();
+  if (builder == nullptr) {
+    return set_error(EINVAL, "tensor builder must not be NULL");
+  }
+  if (count < 0) {
+    return set_error(EINVAL, "bulk append count must be non-negative");
+  }
+  if (count > builder->element_count - builder->values_appended) {
+    return set_error(EINVAL, "too many values appended to tensor builder");
+  }
+  if (count == 0) {
+    return kArrowOk;
+  }
+  if (values == nullptr) {
+    return set_error(EINVAL, "bulk append values must not be NULL");
+  }
+  std::memcpy(
+      builder->data.data() + builder->values_appended * builder->element_size_bytes,
+      values,
+      static_cast<size_t>(count * builder->element_size_bytes));
+  builder->values_appended += count;
+  return kArrowOk;
+}
+
 int irx_arrow_tensor_builder_finish(
     irx_arrow_tensor_builder_handle* builder,
     irx_arrow_tensor_handle** out_tensor) {
@@ -1531,6 +2706,93 @@ void irx_arrow_tensor_builder_release(
   delete builder;
 }
 
+int irx_arrow_tensor_wrap_buffer(
+    int32_t type_id,
+    int32_t ndim,
+    const int64_t* shape,
+    const int64_t* strides,
+    const void* data,
+    int64_t data_nbytes,
+    irx_arrow_tensor_handle** out_tensor) {
+  clear_error();
+  try {
+    if (out_tensor == nullptr) {
+      return set_error(EINVAL, "out_tensor must not be NULL");
+    }
+    *out_tensor = nullptr;
+
+    const TypeSpec* spec = type_spec_from_type_id(type_id);
+    if (spec == nullptr) {
+      return set_error(EINVAL, "unsupported Arrow tensor type id %d", type_id);
+    }
+    if (!spec->buffer_view_compatible || spec->element_size_bytes <= 0) {
+      return set_error(
+          EINVAL,
+          "Arrow tensor wrapping requires a fixed-width primitive value type");
+    }
+
+    int64_t element_count = 0;
+    int code = static_cast<int>(tensor_shape_extent(ndim, shape, &element_count));
+    if (code != kArrowOk) {
+      return code;
+    }
+
+    int64_t expected_nbytes = 0;
+    code = tensor_data_nbytes(element_count, spec->element_size_bytes, &expected_nbytes);
+    if (code != kArrowOk) {
+      return code;
+    }
+    if (data_nbytes < expected_nbytes) {
+      return set_error(EINVAL, "tensor storage is smaller than its shape extent");
+    }
+    if (data == nullptr && data_nbytes > 0) {
+      return set_error(EINVAL, "tensor storage must not be NULL");
+    }
+
+    std::vector<int64_t> shape_values;
+    std::vector<int64_t> stride_values;
+    code = copy_tensor_layout(
+        ndim,
+        shape,
+        strides,
+        spec->element_size_bytes,
+        &shape_values,
+        &stride_values);
+    if (code != kArrowOk) {
+      return code;
+    }
+
+    // A non-owning arrow::Buffer keeps the wrap zero-copy.
+    auto buffer = std::make_shared<arrow::Buffer>(
+        static_cast<const uint8_t*>(data),
+        data_nbytes);
+    arrow::Result<std::shared_ptr<arrow::Tensor>> tensor_result = arrow::Tensor::Make(
+        spec->make_type(),
+        buffer,
+        shape_values,
+        stride_values);
+    if (!tensor_result.ok()) {
+      return set_arrow_error(EINVAL, "Arrow tensor construction failed", tensor_result.status());
+    }
+
+    auto tensor = std::make_unique<irx_arrow_tensor_handle>();
+    tensor->refcount = kInitialRefcount;
+    tensor->tensor = std::move(tensor_result).ValueUnsafe();
+    tensor->shape_cache = tensor->tensor->shape();
+    tensor->strides_cache = tensor->tensor->strides();
+    tensor->type_id = type_id;
+    tensor->dtype_token = spec->dtype_token;
+    tensor->element_size_bytes = spec->element_size_bytes;
+
+    *out_tensor = tensor.release();
+    return kArrowOk;
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow tensor handle");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_tensor_wrap_buffer", exc);
+  }
+}
+
 int32_t irx_arrow_tensor_type_id(const irx_arrow_tensor_handle* tensor) {
   clear_error();
   if (tensor == nullptr) {
@@ -1628,8 +2890,676 @@ void irx_arrow_tensor_release(irx_arrow_tensor_handle* tensor) {
   }
 }
 
-const char* irx_arrow_last_error(void) {
-  return last_error;
+int irx_arrow_record_batch_make(
+    int32_t column_count,
+    const char* const* column_names,
+    irx_arrow_array_handle* const* columns,
+    irx_arrow_record_batch_handle** out_batch) {
+  clear_error();
+  try {
+    if (out_batch == nullptr) {
+      return set_error(EINVAL, "out_batch must not be NULL");
+    }
+    *out_batch = nullptr;
+
+    std::shared_ptr<arrow::RecordBatch> batch;
+    const int code = record_batch_from_columns(column_count, column_names, columns, &batch);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return wrap_record_batch(std::move(batch), out_batch);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow record batch");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_record_batch_make", exc);
+  }
 }
 
-}  // extern "C"
+int64_t irx_arrow_record_batch_num_rows(
+    const irx_arrow_record_batch_handle* batch) {
+  clear_error();
+  if (batch == nullptr || !batch->batch) {
+    set_error(EINVAL, "batch must not be NULL");
+    return -1;
+  }
+  return batch->batch->num_rows();
+}
+
+int32_t irx_arrow_record_batch_num_columns(
+    const irx_arrow_record_batch_handle* batch) {
+  clear_error();
+  if (batch == nullptr || !batch->batch) {
+    set_error(EINVAL, "batch must not be NULL");
+    return -1;
+  }
+  return static_cast<int32_t>(batch->batch->num_columns());
+}
+
+int32_t irx_arrow_record_batch_column_index(
+    const irx_arrow_record_batch_handle* batch,
+    const char* name) {
+  clear_error();
+  if (batch == nullptr || !batch->batch) {
+    set_error(EINVAL, "batch must not be NULL");
+    return -1;
+  }
+  if (name == nullptr) {
+    set_error(EINVAL, "column name must not be NULL");
+    return -1;
+  }
+  const int index = batch->batch->schema()->GetFieldIndex(name);
+  if (index < 0) {
+    set_error(EINVAL, "record batch has no unique column named '%s'", name);
+    return -1;
+  }
+  return static_cast<int32_t>(index);
+}
+
+int irx_arrow_record_batch_column_schema(
+    const irx_arrow_record_batch_handle* batch,
+    int32_t column_index,
+    irx_arrow_schema_handle** out_schema) {
+  clear_error();
+  try {
+    if (batch == nullptr || !batch->batch) {
+      return set_error(EINVAL, "batch must not be NULL");
+    }
+    if (out_schema == nullptr) {
+      return set_error(EINVAL, "out_schema must not be NULL");
+    }
+    *out_schema = nullptr;
+    if (column_index < 0 || column_index >= batch->batch->num_columns()) {
+      return set_error(EINVAL, "column index %d is out of range", column_index);
+    }
+    return make_schema_handle(batch->batch->schema()->field(column_index), out_schema);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow schema");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_record_batch_column_schema", exc);
+  }
+}
+
+int irx_arrow_record_batch_borrow_column(
+    const irx_arrow_record_batch_handle* batch,
+    int32_t column_index,
+    irx_arrow_array_handle** out_array) {
+  clear_error();
+  if (batch == nullptr || !batch->batch) {
+    return set_error(EINVAL, "batch must not be NULL");
+  }
+  if (out_array == nullptr) {
+    return set_error(EINVAL, "out_array must not be NULL");
+  }
+  *out_array = nullptr;
+  if (column_index < 0 || static_cast<size_t>(column_index) >= batch->columns.size()) {
+    return set_error(EINVAL, "column index %d is out of range", column_index);
+  }
+  *out_array = batch->columns[static_cast<size_t>(column_index)];
+  return kArrowOk;
+}
+
+int irx_arrow_record_batch_slice(
+    const irx_arrow_record_batch_handle* batch,
+    int64_t offset,
+    int64_t length,
+    irx_arrow_record_batch_handle** out_batch) {
+  clear_error();
+  try {
+    if (batch == nullptr || !batch->batch) {
+      return set_error(EINVAL, "batch must not be NULL");
+    }
+    if (out_batch == nullptr) {
+      return set_error(EINVAL, "out_batch must not be NULL");
+    }
+    *out_batch = nullptr;
+    const int code = check_slice_bounds(offset, length, batch->batch->num_rows());
+    if (code != kArrowOk) {
+      return code;
+    }
+    return wrap_record_batch(batch->batch->Slice(offset, length), out_batch);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow record batch");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_record_batch_slice", exc);
+  }
+}
+
+int irx_arrow_record_batch_retain(irx_arrow_record_batch_handle* batch) {
+  clear_error();
+  if (batch == nullptr) {
+    return kArrowOk;
+  }
+  if (batch->refcount <= 0) {
+    return set_error(EINVAL, "record batch handle is released");
+  }
+  batch->refcount += 1;
+  return kArrowOk;
+}
+
+void irx_arrow_record_batch_release(irx_arrow_record_batch_handle* batch) {
+  if (batch == nullptr || batch->refcount <= 0) {
+    return;
+  }
+  batch->refcount -= 1;
+  if (batch->refcount == 0) {
+    delete batch;
+  }
+}
+
+int irx_arrow_table_from_record_batches(
+    int64_t batch_count,
+    irx_arrow_record_batch_handle* const* batches,
+    irx_arrow_table_handle** out_table) {
+  clear_error();
+  try {
+    if (out_table == nullptr) {
+      return set_error(EINVAL, "out_table must not be NULL");
+    }
+    *out_table = nullptr;
+    if (batch_count <= 0 || batches == nullptr) {
+      return set_error(EINVAL, "tables need at least one record batch");
+    }
+
+    std::vector<std::shared_ptr<arrow::RecordBatch>> record_batches;
+    record_batches.reserve(static_cast<size_t>(batch_count));
+    for (int64_t index = 0; index < batch_count; ++index) {
+      if (batches[index] == nullptr || !batches[index]->batch) {
+        return set_error(EINVAL, "record batch %lld must not be NULL", static_cast<long long>(index));
+      }
+      record_batches.push_back(batches[index]->batch);
+    }
+
+    arrow::Result<std::shared_ptr<arrow::Table>> table_result =
+        arrow::Table::FromRecordBatches(record_batches);
+    if (!table_result.ok()) {
+      return set_arrow_error(EINVAL, "Arrow table construction failed", table_result.status());
+    }
+    return wrap_table(std::move(table_result).ValueUnsafe(), out_table);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow table");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_table_from_record_batches", exc);
+  }
+}
+
+int64_t irx_arrow_table_num_rows(const irx_arrow_table_handle* table) {
+  clear_error();
+  if (table == nullptr || !table->table) {
+    set_error(EINVAL, "table must not be NULL");
+    return -1;
+  }
+  return table->table->num_rows();
+}
+
+int32_t irx_arrow_table_num_columns(const irx_arrow_table_handle* table) {
+  clear_error();
+  if (table == nullptr || !table->table) {
+    set_error(EINVAL, "table must not be NULL");
+    return -1;
+  }
+  return static_cast<int32_t>(table->table->num_columns());
+}
+
+int32_t irx_arrow_table_column_index(
+    const irx_arrow_table_handle* table,
+    const char* name) {
+  clear_error();
+  if (table == nullptr || !table->table) {
+    set_error(EINVAL, "table must not be NULL");
+    return -1;
+  }
+  if (name == nullptr) {
+    set_error(EINVAL, "column name must not be NULL");
+    return -1;
+  }
+  const int index = table->table->schema()->GetFieldIndex(name);
+  if (index < 0) {
+    set_error(EINVAL, "table has no unique column named '%s'", name);
+    return -1;
+  }
+  return static_cast<int32_t>(index);
+}
+
+int irx_arrow_table_column_schema(
+    const irx_arrow_table_handle* table,
+    int32_t column_index,
+    irx_arrow_schema_handle** out_schema) {
+  clear_error();
+  try {
+    if (table == nullptr || !table->table) {
+      return set_error(EINVAL, "table must not be NULL");
+    }
+    if (out_schema == nullptr) {
+      return set_error(EINVAL, "out_schema must not be NULL");
+    }
+    *out_schema = nullptr;
+    if (column_index < 0 || column_index >= table->table->num_columns()) {
+      return set_error(EINVAL, "column index %d is out of range", column_index);
+    }
+    return make_schema_handle(table->table->schema()->field(column_index), out_schema);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow schema");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_table_column_schema", exc);
+  }
+}
+
+int32_t irx_arrow_table_num_chunks(
+    const irx_arrow_table_handle* table,
+    int32_t column_index) {
+  clear_error();
+  if (table == nullptr || !table->table) {
+    set_error(EINVAL, "table must not be NULL");
+    return -1;
+  }
+  if (column_index < 0 || static_cast<size_t>(column_index) >= table->chunks.size()) {
+    set_error(EINVAL, "column index %d is out of range", column_index);
+    return -1;
+  }
+  return static_cast<int32_t>(table->chunks[static_cast<size_t>(column_index)].size());
+}
+
+int irx_arrow_table_borrow_chunk(
+    const irx_arrow_table_handle* table,
+    int32_t column_index,
+    int32_t chunk_index,
+    irx_arrow_array_handle** out_array) {
+  clear_error();
+  if (table == nullptr || !table->table) {
+    return set_error(EINVAL, "table must not be NULL");
+  }
+  if (out_array == nullptr) {
+    return set_error(EINVAL, "out_array must not be NULL");
+  }
+  *out_array = nullptr;
+  if (column_index < 0 || static_cast<size_t>(column_index) >= table->chunks.size()) {
+    return set_error(EINVAL, "column index %d is out of range", column_index);
+  }
+  const std::vector<irx_arrow_array_handle*>& chunks =
+      table->chunks[static_cast<size_t>(column_index)];
+  if (chunk_index < 0 || static_cast<size_t>(chunk_index) >= chunks.size()) {
+    return set_error(EINVAL, "chunk index %d is out of range", chunk_index);
+  }
+  *out_array = chunks[static_cast<size_t>(chunk_index)];
+  return kArrowOk;
+}
+
+int irx_arrow_table_slice(
+    const irx_arrow_table_handle* table,
+    int64_t offset,
+    int64_t length,
+    irx_arrow_table_handle** out_table) {
+  clear_error();
+  try {
+    if (table == nullptr || !table->table) {
+      return set_error(EINVAL, "table must not be NULL");
+    }
+    if (out_table == nullptr) {
+      return set_error(EINVAL, "out_table must not be NULL");
+    }
+    *out_table = nullptr;
+    const int code = check_slice_bounds(offset, length, table->table->num_rows());
+    if (code != kArrowOk) {
+      return code;
+    }
+    return wrap_table(table->table->Slice(offset, length), out_table);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow table");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_table_slice", exc);
+  }
+}
+
+int irx_arrow_table_retain(irx_arrow_table_handle* table) {
+  clear_error();
+  if (table == nullptr) {
+    return kArrowOk;
+  }
+  if (table->refcount <= 0) {
+    return set_error(EINVAL, "table handle is released");
+  }
+  table->refcount += 1;
+  return kArrowOk;
+}
+
+void irx_arrow_table_release(irx_arrow_table_handle* table) {
+  if (table == nullptr || table->refcount <= 0) {
+    return;
+  }
+  table->refcount -= 1;
+  if (table->refcount == 0) {
+    delete table;
+  }
+}
+
+int irx_arrow_ipc_file_open(
+    const char* path,
+    irx_arrow_ipc_file_reader_handle** out_reader) {
+  clear_error();
+  try {
+    if (path == nullptr) {
+      return set_error(EINVAL, "path must not be NULL");
+    }
+    if (out_reader == nullptr) {
+      return set_error(EINVAL, "out_reader must not be NULL");
+    }
+    *out_reader = nullptr;
+
+    arrow::Result<std::shared_ptr<arrow::io::MemoryMappedFile>> file_result =
+        arrow::io::MemoryMappedFile::Open(path, arrow::io::FileMode::READ);
+    if (!file_result.ok()) {
+      return set_arrow_error(ENOENT, "Arrow IPC file map failed", file_result.status());
+    }
+    std::shared_ptr<arrow::io::MemoryMappedFile> file = std::move(file_result).ValueUnsafe();
+
+    arrow::ipc::IpcReadOptions options = arrow::ipc::IpcReadOptions::Defaults();
+    options.use_threads = false;
+    arrow::Result<std::shared_ptr<arrow::ipc::RecordBatchFileReader>> reader_result =
+        arrow::ipc::RecordBatchFileReader::Open(file, options);
+    if (!reader_result.ok()) {
+      return set_arrow_error(EINVAL, "Arrow IPC file open failed", reader_result.status());
+    }
+
+    auto handle = std::make_unique<irx_arrow_ipc_file_reader_handle>();
+    handle->file = std::move(file);
+    handle->reader = std::move(reader_result).ValueUnsafe();
+    *out_reader = handle.release();
+    return kArrowOk;
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow IPC reader");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_file_open", exc);
+  }
+}
+
+int64_t irx_arrow_ipc_file_num_record_batches(
+    const irx_arrow_ipc_file_reader_handle* reader) {
+  clear_error();
+  if (reader == nullptr || !reader->reader) {
+    set_error(EINVAL, "reader must not be NULL");
+    return -1;
+  }
+  return reader->reader->num_record_batches();
+}
+
+int32_t irx_arrow_ipc_file_num_columns(
+    const irx_arrow_ipc_file_reader_handle* reader) {
+  clear_error();
+  if (reader == nullptr || !reader->reader) {
+    set_error(EINVAL, "reader must not be NULL");
+    return -1;
+  }
+  return static_cast<int32_t>(reader->reader->schema()->num_fields());
+}
+
+int32_t irx_arrow_ipc_file_column_index(
+    const irx_arrow_ipc_file_reader_handle* reader,
+    const char* name) {
+  clear_error();
+  if (reader == nullptr || !reader->reader) {
+    set_error(EINVAL, "reader must not be NULL");
+    return -1;
+  }
+  if (name == nullptr) {
+    set_error(EINVAL, "column name must not be NULL");
+    return -1;
+  }
+  const int index = reader->reader->schema()->GetFieldIndex(name);
+  if (index < 0) {
+    set_error(EINVAL, "Arrow IPC file has no unique column named '%s'", name);
+    return -1;
+  }
+  return static_cast<int32_t>(index);
+}
+
+int irx_arrow_ipc_file_read_column(
+    irx_arrow_ipc_file_reader_handle* reader,
+    int64_t batch_index,
+    int32_t column_index,
+    irx_arrow_array_handle** out_array) {
+  clear_error();
+  try {
+    if (reader == nullptr || !reader->reader) {
+      return set_error(EINVAL, "reader must not be NULL");
+    }
+    if (out_array == nullptr) {
+      return set_error(EINVAL, "out_array must not be NULL");
+    }
+    *out_array = nullptr;
+
+    const std::shared_ptr<arrow::Schema>& schema = reader->reader->schema();
+    if (column_index < 0 || column_index >= schema->num_fields()) {
+      return set_error(EINVAL, "column index %d is out of range", column_index);
+    }
+    const int code = load_ipc_record_batch(reader, batch_index);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return make_array_handle(
+        reader->cached_batch->column(column_index),
+        schema->field(column_index)->nullable(),
+        out_array);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow array");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_file_read_column", exc);
+  }
+}
+
+int irx_arrow_ipc_file_read_record_batch(
+    irx_arrow_ipc_file_reader_handle* reader,
+    int64_t batch_index,
+    irx_arrow_record_batch_handle** out_batch) {
+  clear_error();
+  try {
+    if (reader == nullptr || !reader->reader) {
+      return set_error(EINVAL, "reader must not be NULL");
+    }
+    if (out_batch == nullptr) {
+      return set_error(EINVAL, "out_batch must not be NULL");
+    }
+    *out_batch = nullptr;
+
+    const int code = load_ipc_record_batch(reader, batch_index);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return wrap_record_batch(reader->cached_batch, out_batch);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow record batch");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_file_read_record_batch", exc);
+  }
+}
+
+void irx_arrow_ipc_file_close(irx_arrow_ipc_file_reader_handle* reader) {
+  delete reader;
+}
+
+int irx_arrow_ipc_stream_writer_open(
+    const char* path,
+    int64_t batch_rows,
+    int32_t compression,
+    irx_arrow_ipc_stream_writer_handle** out_writer) {
+  clear_error();
+  try {
+    if (out_writer == nullptr) {
+      return set_error(EINVAL, "out_writer must not be NULL");
+    }
+    *out_writer = nullptr;
+    if (batch_rows < 0) {
+      return set_error(EINVAL, "batch_rows must be non-negative");
+    }
+
+    auto handle = std::make_unique<irx_arrow_ipc_stream_writer_handle>();
+    handle->batch_rows = batch_rows;
+    handle->options.use_threads = false;
+
+    arrow::Compression::type codec_type = arrow::Compression::UNCOMPRESSED;
+    switch (compression) {
+      case IRX_ARROW_IPC_COMPRESSION_NONE:
+        break;
+      case IRX_ARROW_IPC_COMPRESSION_LZ4_FRAME:
+        codec_type = arrow::Compression::LZ4_FRAME;
+        break;
+      case IRX_ARROW_IPC_COMPRESSION_ZSTD:
+        codec_type = arrow::Compression::ZSTD;
+        break;
+      default:
+        return set_error(EINVAL, "unsupported Arrow IPC compression %d", compression);
+    }
+    if (codec_type != arrow::Compression::UNCOMPRESSED) {
+      arrow::Result<std::unique_ptr<arrow::util::Codec>> codec_result =
+          arrow::util::Codec::Create(codec_type);
+      if (!codec_result.ok()) {
+        return set_arrow_error(EINVAL, "Arrow IPC codec is unavailable", codec_result.status());
+      }
+      handle->options.codec = std::move(codec_result).ValueUnsafe();
+    }
+
+    arrow::Result<std::shared_ptr<arrow::io::FileOutputStream>> sink_result;
+    if (path == nullptr || std::strcmp(path, "-") == 0) {
+      // Keep buffered stdio output ahead of the stream, and write through a
+      // duplicate descriptor so closing the stream leaves stdout open.
+      std::fflush(stdout);
+      const int stdout_fd = irx_dup(1);
+      if (stdout_fd < 0) {
+        return set_error(errno, "failed to duplicate stdout for Arrow IPC output");
+      }
+      sink_result = arrow::io::FileOutputStream::Open(stdout_fd);
+    } else {
+      sink_result = arrow::io::FileOutputStream::Open(path);
+    }
+    if (!sink_result.ok()) {
+      return set_arrow_error(EIO, "Arrow IPC output open failed", sink_result.status());
+    }
+    handle->sink =
+        std::make_shared<PositionTrackingOutputStream>(std::move(sink_result).ValueUnsafe());
+
+    *out_writer = handle.release();
+    return kArrowOk;
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow IPC writer");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_stream_writer_open", exc);
+  }
+}
+
+int irx_arrow_ipc_stream_writer_write_columns(
+    irx_arrow_ipc_stream_writer_handle* writer,
+    int32_t column_count,
+    const char* const* column_names,
+    irx_arrow_array_handle* const* columns) {
+  clear_error();
+  try {
+    if (writer == nullptr || !writer->sink) {
+      return set_error(EINVAL, "writer must not be NULL");
+    }
+    std::shared_ptr<arrow::RecordBatch> batch;
+    const int code = record_batch_from_columns(column_count, column_names, columns, &batch);
+    if (code != kArrowOk) {
+      return code;
+    }
+    return write_ipc_record_batch(writer, batch);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow IPC record batch");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_stream_writer_write_columns", exc);
+  }
+}
+
+int irx_arrow_ipc_stream_writer_write_record_batch(
+    irx_arrow_ipc_stream_writer_handle* writer,
+    const irx_arrow_record_batch_handle* batch) {
+  clear_error();
+  try {
+    if (writer == nullptr || !writer->sink) {
+      return set_error(EINVAL, "writer must not be NULL");
+    }
+    if (batch == nullptr || !batch->batch) {
+      return set_error(EINVAL, "batch must not be NULL");
+    }
+    return write_ipc_record_batch(writer, batch->batch);
+  } catch (const std::bad_alloc&) {
+    return set_error(ENOMEM, "failed to allocate Arrow IPC record batch");
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_stream_writer_write_record_batch", exc);
+  }
+}
+
+int64_t irx_arrow_ipc_stream_writer_rows_written(
+    const irx_arrow_ipc_stream_writer_handle* writer) {
+  clear_error();
+  if (writer == nullptr) {
+    set_error(EINVAL, "writer must not be NULL");
+    return -1;
+  }
+  return writer->rows_written;
+}
+
+int irx_arrow_ipc_stream_writer_close(
+    irx_arrow_ipc_stream_writer_handle* writer) {
+  clear_error();
+  if (writer == nullptr) {
+    return set_error(EINVAL, "writer must not be NULL");
+  }
+  std::unique_ptr<irx_arrow_ipc_stream_writer_handle> owned(writer);
+  try {
+    if (owned->writer) {
+      const arrow::Status status = owned->writer->Close();
+      if (!status.ok()) {
+        return set_arrow_error(EIO, "Arrow IPC stream close failed", status);
+      }
+    }
+    const arrow::Status status = owned->sink->Close();
+    if (!status.ok()) {
+      return set_arrow_error(EIO, "Arrow IPC output close failed", status);
+    }
+    return kArrowOk;
+  } catch (const std::exception& exc) {
+    return set_exception_error("irx_arrow_ipc_stream_writer_close", exc);
+  }
+}
+
+const char* irx_arrow_last_error(void) {
+  return last_error;
+}
+
+}  // extern "C"
+
+namespace irx_arrow_internal {
+
+const std::shared_ptr<arrow::Array>* array_from_handle(
+    const irx_arrow_array_handle* array) {
+  if (array == nullptr || !array->array) {
+    return nullptr;
+  }
+  return &array->array;
+}
+
+std::shared_ptr<arrow::DataType> data_type_from_type_id(int32_t type_id) {
+  const TypeSpec* spec = type_spec_from_type_id(type_id);
+  if (spec == nullptr) {
+    return nullptr;
+  }
+  return spec->make_type();
+}
+
+int array_handle_from_arrow(
+    std::shared_ptr<arrow::Array> array,
+    bool nullable,
+    irx_arrow_array_handle** out_array) {
+  return make_array_handle(std::move(array), nullable, out_array);
+}
+
+void clear_last_error() { clear_error(); }
+
+int set_last_error(int code, const char* message) {
+  return set_error(code, "%s", message);
+}
+
+int set_last_arrow_error(int code, const char* context, const arrow::Status& status) {
+  return set_arrow_error(code, context, status);
+}
+
+}  // namespace irx_arrow_internal
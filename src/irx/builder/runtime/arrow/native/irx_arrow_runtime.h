@@ -18,6 +18,12 @@ typedef struct irx_arrow_array_builder_handle irx_arrow_array_builder_handle;
 typedef struct irx_arrow_array_handle irx_arrow_array_handle;
 typedef struct irx_arrow_tensor_builder_handle irx_arrow_tensor_builder_handle;
 typedef struct irx_arrow_tensor_handle irx_arrow_tensor_handle;
+typedef struct irx_arrow_record_batch_handle irx_arrow_record_batch_handle;
+typedef struct irx_arrow_table_handle irx_arrow_table_handle;
+typedef struct irx_arrow_ipc_file_reader_handle
+    irx_arrow_ipc_file_reader_handle;
+typedef struct irx_arrow_ipc_stream_writer_handle
+    irx_arrow_ipc_stream_writer_handle;
 
 enum irx_arrow_type_id {
   IRX_ARROW_TYPE_UNKNOWN = 0,
@@ -32,6 +38,37 @@ enum irx_arrow_type_id {
   IRX_ARROW_TYPE_FLOAT32 = 9,
   IRX_ARROW_TYPE_FLOAT64 = 10,
   IRX_ARROW_TYPE_BOOL = 11,
+  IRX_ARROW_TYPE_UTF8 = 12,
+  IRX_ARROW_TYPE_LARGE_UTF8 = 13,
+  IRX_ARROW_TYPE_BINARY = 14,
+  IRX_ARROW_TYPE_LARGE_BINARY = 15,
+};
+
+enum irx_arrow_array_encoding {
+  IRX_ARROW_ENCODING_NONE = 0,
+  IRX_ARROW_ENCODING_DICTIONARY = 1,
+  IRX_ARROW_ENCODING_RUN_END = 2,
+};
+
+enum irx_arrow_compute_op {
+  IRX_ARROW_COMPUTE_ADD = 1,
+  IRX_ARROW_COMPUTE_SUBTRACT = 2,
+  IRX_ARROW_COMPUTE_MULTIPLY = 3,
+  IRX_ARROW_COMPUTE_DIVIDE = 4,
+  IRX_ARROW_COMPUTE_EQUAL = 5,
+  IRX_ARROW_COMPUTE_NOT_EQUAL = 6,
+  IRX_ARROW_COMPUTE_LESS = 7,
+  IRX_ARROW_COMPUTE_LESS_EQUAL = 8,
+  IRX_ARROW_COMPUTE_GREATER = 9,
+  IRX_ARROW_COMPUTE_GREATER_EQUAL = 10,
+  IRX_ARROW_COMPUTE_AND = 11,
+  IRX_ARROW_COMPUTE_OR = 12,
+};
+
+enum irx_arrow_ipc_compression {
+  IRX_ARROW_IPC_COMPRESSION_NONE = 0,
+  IRX_ARROW_IPC_COMPRESSION_LZ4_FRAME = 1,
+  IRX_ARROW_IPC_COMPRESSION_ZSTD = 2,
 };
 
 int irx_arrow_schema_import_copy(
@@ -60,6 +97,32 @@ int irx_arrow_array_builder_append_uint(
 int irx_arrow_array_builder_append_double(
     irx_arrow_array_builder_handle* builder,
     double value);
+/*
+ * Append `count` values stored contiguously in the builder's element layout
+ * (booleans use one byte per value). `validity` is an optional LSB-ordered
+ * Arrow validity bitmap; NULL marks every value as valid.
+ */
+int irx_arrow_array_builder_append_n(
+    irx_arrow_array_builder_handle* builder,
+    const void* values,
+    int64_t count,
+    const uint8_t* validity);
+
+/*
+ * Append utf8 or binary values. The bulk form takes the values packed back to
+ * back with one byte length per value; null entries still advance the data
+ * cursor by their length, which is normally zero.
+ */
+int irx_arrow_array_builder_append_binary(
+    irx_arrow_array_builder_handle* builder,
+    const void* data,
+    int64_t length);
+int irx_arrow_array_builder_append_binary_n(
+    irx_arrow_array_builder_handle* builder,
+    const void* data,
+    const int64_t* lengths,
+    int64_t count,
+    const uint8_t* validity);
 
 int irx_arrow_array_builder_int32_new(
     irx_arrow_array_builder_handle** out_builder);
@@ -109,6 +172,58 @@ int irx_arrow_array_validity_bitmap(
 int irx_arrow_array_borrow_buffer_view(
     const irx_arrow_array_handle* array,
     irx_buffer_view* out_view);
+/*
+ * utf8 and binary arrays expose their two value buffers as borrowed views: an
+ * int32 (int64 for the large types) offsets view with length + 1 entries that
+ * starts at the array offset, and a uint8 view of the whole data buffer.
+ * Value i spans data[offsets[i]:offsets[i + 1]]; the views stay valid while
+ * the array handle is alive. irx_arrow_array_value_bytes returns one value
+ * as a pointer into the data buffer, or NULL with length 0 for a null slot.
+ */
+int irx_arrow_array_borrow_offsets_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view);
+int irx_arrow_array_borrow_data_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view);
+int irx_arrow_array_value_bytes(
+    const irx_arrow_array_handle* array,
+    int64_t index,
+    const uint8_t** out_data,
+    int64_t* out_length);
+
+/*
+ * Dictionary and run-end encoded arrays are imported without decoding. Their
+ * type id is the value type, and irx_arrow_array_encoding tells them apart
+ * from plain arrays. The indices view starts at the array offset like a
+ * plain value view; the run-ends view covers the whole run-ends child, whose
+ * entries are logical end positions counted from the unsliced parent, so
+ * slices should be clipped with irx_arrow_array_offset. The dictionary and
+ * run values are borrowed array handles owned by the encoded array and must
+ * not be released. irx_arrow_array_physical_index maps one logical index to
+ * its dictionary index or run (-1 for a null dictionary slot), and
+ * irx_arrow_array_decode materializes a plain array on demand.
+ */
+int32_t irx_arrow_array_encoding(const irx_arrow_array_handle* array);
+int irx_arrow_array_borrow_indices_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view);
+int irx_arrow_array_borrow_run_ends_view(
+    const irx_arrow_array_handle* array,
+    irx_buffer_view* out_view);
+int irx_arrow_array_borrow_dictionary(
+    const irx_arrow_array_handle* array,
+    irx_arrow_array_handle** out_dictionary);
+int irx_arrow_array_borrow_run_values(
+    const irx_arrow_array_handle* array,
+    irx_arrow_array_handle** out_values);
+int irx_arrow_array_physical_index(
+    const irx_arrow_array_handle* array,
+    int64_t index,
+    int64_t* out_physical_index);
+int irx_arrow_array_decode(
+    const irx_arrow_array_handle* array,
+    irx_arrow_array_handle** out_array);
 
 int irx_arrow_array_retain(irx_arrow_array_handle* array);
 void irx_arrow_array_release(irx_arrow_array_handle* array);
@@ -128,11 +243,27 @@ int irx_arrow_tensor_builder_append_uint(
 int irx_arrow_tensor_builder_append_double(
     irx_arrow_tensor_builder_handle* builder,
     double value);
+int irx_arrow_tensor_builder_append_n(
+    irx_arrow_tensor_builder_handle* builder,
+    const void* values,
+    int64_t count);
 int irx_arrow_tensor_builder_finish(
     irx_arrow_tensor_builder_handle* builder,
     irx_arrow_tensor_handle** out_tensor);
 void irx_arrow_tensor_builder_release(
     irx_arrow_tensor_builder_handle* builder);
+/*
+ * Wrap caller-owned storage, such as a constant global emitted for a tensor
+ * literal, without copying. The storage must outlive the returned handle.
+ */
+int irx_arrow_tensor_wrap_buffer(
+    int32_t type_id,
+    int32_t ndim,
+    const int64_t* shape,
+    const int64_t* strides,
+    const void* data,
+    int64_t data_nbytes,
+    irx_arrow_tensor_handle** out_tensor);
 
 int32_t irx_arrow_tensor_type_id(const irx_arrow_tensor_handle* tensor);
 int32_t irx_arrow_tensor_ndim(const irx_arrow_tensor_handle* tensor);
@@ -144,6 +275,175 @@ int irx_arrow_tensor_borrow_buffer_view(
     irx_buffer_view* out_view);
 int irx_arrow_tensor_retain(irx_arrow_tensor_handle* tensor);
 void irx_arrow_tensor_release(irx_arrow_tensor_handle* tensor);
+
+/*
+ * Record batches group equal-length named columns under one reference count.
+ * Borrowed column handles stay valid while the batch is alive; retain one to
+ * keep it longer. Slices share the parent buffers.
+ */
+int irx_arrow_record_batch_make(
+    int32_t column_count,
+    const char* const* column_names,
+    irx_arrow_array_handle* const* columns,
+    irx_arrow_record_batch_handle** out_batch);
+int64_t irx_arrow_record_batch_num_rows(
+    const irx_arrow_record_batch_handle* batch);
+int32_t irx_arrow_record_batch_num_columns(
+    const irx_arrow_record_batch_handle* batch);
+int32_t irx_arrow_record_batch_column_index(
+    const irx_arrow_record_batch_handle* batch,
+    const char* name);
+int irx_arrow_record_batch_column_schema(
+    const irx_arrow_record_batch_handle* batch,
+    int32_t column_index,
+    irx_arrow_schema_handle** out_schema);
+int irx_arrow_record_batch_borrow_column(
+    const irx_arrow_record_batch_handle* batch,
+    int32_t column_index,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_record_batch_slice(
+    const irx_arrow_record_batch_handle* batch,
+    int64_t offset,
+    int64_t length,
+    irx_arrow_record_batch_handle** out_batch);
+int irx_arrow_record_batch_retain(irx_arrow_record_batch_handle* batch);
+void irx_arrow_record_batch_release(irx_arrow_record_batch_handle* batch);
+
+/*
+ * Tables are chunked columns built from record batches that share a schema.
+ * Column chunks are borrowed like record batch columns.
+ */
+int irx_arrow_table_from_record_batches(
+    int64_t batch_count,
+    irx_arrow_record_batch_handle* const* batches,
+    irx_arrow_table_handle** out_table);
+int64_t irx_arrow_table_num_rows(const irx_arrow_table_handle* table);
+int32_t irx_arrow_table_num_columns(const irx_arrow_table_handle* table);
+int32_t irx_arrow_table_column_index(
+    const irx_arrow_table_handle* table,
+    const char* name);
+int irx_arrow_table_column_schema(
+    const irx_arrow_table_handle* table,
+    int32_t column_index,
+    irx_arrow_schema_handle** out_schema);
+int32_t irx_arrow_table_num_chunks(
+    const irx_arrow_table_handle* table,
+    int32_t column_index);
+int irx_arrow_table_borrow_chunk(
+    const irx_arrow_table_handle* table,
+    int32_t column_index,
+    int32_t chunk_index,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_table_slice(
+    const irx_arrow_table_handle* table,
+    int64_t offset,
+    int64_t length,
+    irx_arrow_table_handle** out_table);
+int irx_arrow_table_retain(irx_arrow_table_handle* table);
+void irx_arrow_table_release(irx_arrow_table_handle* table);
+
+/*
+ * Arrow IPC file (Feather v2) reader over a memory-mapped file. Column arrays
+ * reference the mapped pages directly and keep the mapping alive on their own,
+ * so they stay valid after the reader is closed.
+ */
+int irx_arrow_ipc_file_open(
+    const char* path,
+    irx_arrow_ipc_file_reader_handle** out_reader);
+int64_t irx_arrow_ipc_file_num_record_batches(
+    const irx_arrow_ipc_file_reader_handle* reader);
+int32_t irx_arrow_ipc_file_num_columns(
+    const irx_arrow_ipc_file_reader_handle* reader);
+int32_t irx_arrow_ipc_file_column_index(
+    const irx_arrow_ipc_file_reader_handle* reader,
+    const char* name);
+int irx_arrow_ipc_file_read_column(
+    irx_arrow_ipc_file_reader_handle* reader,
+    int64_t batch_index,
+    int32_t column_index,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_ipc_file_read_record_batch(
+    irx_arrow_ipc_file_reader_handle* reader,
+    int64_t batch_index,
+    irx_arrow_record_batch_handle** out_batch);
+void irx_arrow_ipc_file_close(irx_arrow_ipc_file_reader_handle* reader);
+
+/*
+ * Arrow IPC stream writer. A NULL path or "-" writes to stdout. The first
+ * write fixes the stream schema from the column names and array types; every
+ * later write must match it. Writes longer than `batch_rows` are split into
+ * zero-copy slices of at most that many rows (0 keeps each write as one
+ * batch). Closing writes the end-of-stream marker and frees the writer.
+ */
+int irx_arrow_ipc_stream_writer_open(
+    const char* path,
+    int64_t batch_rows,
+    int32_t compression,
+    irx_arrow_ipc_stream_writer_handle** out_writer);
+int irx_arrow_ipc_stream_writer_write_columns(
+    irx_arrow_ipc_stream_writer_handle* writer,
+    int32_t column_count,
+    const char* const* column_names,
+    irx_arrow_array_handle* const* columns);
+int irx_arrow_ipc_stream_writer_write_record_batch(
+    irx_arrow_ipc_stream_writer_handle* writer,
+    const irx_arrow_record_batch_handle* batch);
+int64_t irx_arrow_ipc_stream_writer_rows_written(
+    const irx_arrow_ipc_stream_writer_handle* writer);
+int irx_arrow_ipc_stream_writer_close(
+    irx_arrow_ipc_stream_writer_handle* writer);
+
+/*
+ * Arrow C++ compute kernels over array handles. Kernels that produce arrays
+ * return new handles owned by the caller. Sums skip nulls and are 0 for empty
+ * input; min/max and mean fail when the input has no valid values. Integer
+ * results come back as int64, so uint64 sums above INT64_MAX fail.
+ */
+int irx_arrow_compute_sum_int64(
+    const irx_arrow_array_handle* array,
+    int64_t* out_value);
+int irx_arrow_compute_sum_double(
+    const irx_arrow_array_handle* array,
+    double* out_value);
+int irx_arrow_compute_min_max_int64(
+    const irx_arrow_array_handle* array,
+    int64_t* out_min,
+    int64_t* out_max);
+int irx_arrow_compute_min_max_double(
+    const irx_arrow_array_handle* array,
+    double* out_min,
+    double* out_max);
+int irx_arrow_compute_mean(
+    const irx_arrow_array_handle* array,
+    double* out_value);
+int irx_arrow_compute_binary(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    const irx_arrow_array_handle* rhs,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_compute_binary_int64_scalar(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    int64_t rhs,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_compute_binary_double_scalar(
+    int32_t op,
+    const irx_arrow_array_handle* lhs,
+    double rhs,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_compute_filter(
+    const irx_arrow_array_handle* array,
+    const irx_arrow_array_handle* mask,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_compute_take(
+    const irx_arrow_array_handle* array,
+    const irx_arrow_array_handle* indices,
+    irx_arrow_array_handle** out_array);
+int irx_arrow_compute_cast(
+    const irx_arrow_array_handle* array,
+    int32_t type_id,
+    irx_arrow_array_handle** out_array);
+
 const char* irx_arrow_last_error(void);
 
 #ifdef __cplusplus
@@ -0,0 +1,31 @@
+// Copyright IRx contributors.
+
+#ifndef IRX_ARROW_RUNTIME_INTERNAL_H_INCLUDED
+#define IRX_ARROW_RUNTIME_INTERNAL_H_INCLUDED
+
+// C++-only bridge for runtime translation units that extend the Arrow ABI
+// (for example the compute kernels) without duplicating handle internals.
+
+#include <arrow/api.h>
+
+#include <memory>
+
+#include "irx_arrow_runtime.h"
+
+namespace irx_arrow_internal {
+
+const std::shared_ptr<arrow::Array>* array_from_handle(
+    const irx_arrow_array_handle* array);
+std::shared_ptr<arrow::DataType> data_type_from_type_id(int32_t type_id);
+int array_handle_from_arrow(
+    std::shared_ptr<arrow::Array> array,
+    bool nullable,
+    irx_arrow_array_handle** out_array);
+
+void clear_last_error();
+int set_last_error(int code, const char* message);
+int set_last_arrow_error(int code, const char* context, const arrow::Status& status);
+
+}  // namespace irx_arrow_internal
+
+#endif
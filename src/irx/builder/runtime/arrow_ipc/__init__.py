@@ -0,0 +1,17 @@
+"""
+title: Arrow IPC runtime feature package.
+"""
+
+from irx.builder.runtime.arrow_ipc.feature import (
+    ARROW_IPC_COMPRESSION_LZ4_FRAME,
+    ARROW_IPC_COMPRESSION_NONE,
+    ARROW_IPC_COMPRESSION_ZSTD,
+    build_arrow_ipc_runtime_feature,
+)
+
+__all__ = [
+    "ARROW_IPC_COMPRESSION_LZ4_FRAME",
+    "ARROW_IPC_COMPRESSION_NONE",
+    "ARROW_IPC_COMPRESSION_ZSTD",
+    "build_arrow_ipc_runtime_feature",
+]
@@ -0,0 +1,418 @@
+"""
+title: Builtin Arrow IPC runtime feature declarations backed by Arrow C++.
+summary: >-
+  Reads Arrow IPC files (Feather v2) through a memory-mapped file so column
+  arrays, and the buffer views borrowed from them, point at the mapped pages,
+  and streams record batches out through the Arrow IPC stream format.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.arrowcpp import (
+    arrowcpp_compile_flags,
+    arrowcpp_include_dirs,
+    arrowcpp_linker_flags,
+    arrowcpp_runtime_metadata,
+)
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+ARROW_IPC_COMPRESSION_NONE = 0
+ARROW_IPC_COMPRESSION_LZ4_FRAME = 1
+ARROW_IPC_COMPRESSION_ZSTD = 2
+
+
+@typechecked
+def build_arrow_ipc_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the builtin Arrow IPC runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    runtime_root = Path(__file__).resolve().parent
+    native_root = (runtime_root.parent / "arrow" / "native").resolve()
+    buffer_native_root = (runtime_root.parent / "buffer" / "native").resolve()
+    include_dirs = (
+        native_root,
+        buffer_native_root,
+        *arrowcpp_include_dirs(),
+    )
+    artifacts = [
+        NativeArtifact(
+            kind="cxx_source",
+            path=native_root / "irx_arrow_runtime.cc",
+            include_dirs=include_dirs,
+            compile_flags=arrowcpp_compile_flags(),
+        )
+    ]
+
+    return RuntimeFeature(
+        name="arrow_ipc",
+        symbols={
+            "irx_arrow_ipc_file_open": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_open",
+                _declare_ipc_file_open,
+            ),
+            "irx_arrow_ipc_file_num_record_batches": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_num_record_batches",
+                _declare_ipc_file_num_record_batches,
+            ),
+            "irx_arrow_ipc_file_num_columns": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_num_columns",
+                _declare_ipc_file_num_columns,
+            ),
+            "irx_arrow_ipc_file_column_index": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_column_index",
+                _declare_ipc_file_column_index,
+            ),
+            "irx_arrow_ipc_file_read_column": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_read_column",
+                _declare_ipc_file_read_column,
+            ),
+            "irx_arrow_ipc_file_read_record_batch": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_read_record_batch",
+                _declare_ipc_file_read_record_batch,
+            ),
+            "irx_arrow_ipc_file_close": ExternalSymbolSpec(
+                "irx_arrow_ipc_file_close",
+                _declare_ipc_file_close,
+            ),
+            "irx_arrow_ipc_stream_writer_open": ExternalSymbolSpec(
+                "irx_arrow_ipc_stream_writer_open",
+                _declare_ipc_stream_writer_open,
+            ),
+            "irx_arrow_ipc_stream_writer_write_columns": ExternalSymbolSpec(
+                "irx_arrow_ipc_stream_writer_write_columns",
+                _declare_ipc_stream_writer_write_columns,
+            ),
+            "irx_arrow_ipc_stream_writer_write_record_batch": (
+                ExternalSymbolSpec(
+                    "irx_arrow_ipc_stream_writer_write_record_batch",
+                    _declare_ipc_stream_writer_write_record_batch,
+                )
+            ),
+            "irx_arrow_ipc_stream_writer_rows_written": ExternalSymbolSpec(
+                "irx_arrow_ipc_stream_writer_rows_written",
+                _declare_ipc_stream_writer_rows_written,
+            ),
+            "irx_arrow_ipc_stream_writer_close": ExternalSymbolSpec(
+                "irx_arrow_ipc_stream_writer_close",
+                _declare_ipc_stream_writer_close,
+            ),
+        },
+        artifacts=tuple(artifacts),
+        metadata={
+            "opaque_handles": {
+                "ipc_file_reader": "irx_arrow_ipc_file_reader_handle",
+                "ipc_stream_writer": "irx_arrow_ipc_stream_writer_handle",
+                "array": "irx_arrow_array_handle",
+                "record_batch": "irx_arrow_record_batch_handle",
+            },
+            "canonical_name": "arrow_ipc",
+            "formats": ("arrow_ipc_file", "feather_v2", "arrow_ipc_stream"),
+            "compression": {
+                "none": ARROW_IPC_COMPRESSION_NONE,
+                "lz4_frame": ARROW_IPC_COMPRESSION_LZ4_FRAME,
+                "zstd": ARROW_IPC_COMPRESSION_ZSTD,
+            },
+            "limitations": (
+                "columns must use a supported fixed-width primitive type",
+                "compressed files are decompressed into fresh buffers, so "
+                "only uncompressed files are read zero-copy",
+            ),
+            **arrowcpp_runtime_metadata(),
+        },
+        linker_flags=arrowcpp_linker_flags(),
+    )
+
+
+@typechecked
+def _declare_function(
+    visitor: VisitorProtocol,
+    name: str,
+    return_type: ir.Type,
+    arg_types: list[ir.Type],
+) -> ir.Function:
+    """
+    title: Declare one Arrow IPC runtime symbol.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+      name:
+        type: str
+      return_type:
+        type: ir.Type
+      arg_types:
+        type: list[ir.Type]
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(return_type, arg_types)
+    return declare_external_function(visitor._llvm.module, name, fn_type)
+
+
+@typechecked
+def _declare_ipc_file_open(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC file open.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_open",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT8_TYPE.as_pointer(),
+            visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_file_num_record_batches(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow IPC file record batch count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_num_record_batches",
+        visitor._llvm.INT64_TYPE,
+        [visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_ipc_file_num_columns(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC file column count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_num_columns",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_ipc_file_column_index(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC file column lookup by name.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_column_index",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_file_read_column(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC file column read.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_read_column",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_file_read_record_batch(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow IPC file record batch read.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_read_record_batch",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_file_close(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC file close.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_file_close",
+        ir.VoidType(),
+        [visitor._llvm.ARROW_IPC_READER_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_ipc_stream_writer_open(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC stream writer open.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_stream_writer_open",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT8_TYPE.as_pointer(),
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARROW_IPC_WRITER_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_stream_writer_write_columns(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow IPC stream writer column write.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_stream_writer_write_columns",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_IPC_WRITER_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer().as_pointer(),
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_stream_writer_write_record_batch(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow IPC stream writer record batch write.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_stream_writer_write_record_batch",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_IPC_WRITER_HANDLE_TYPE,
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE,
+        ],
+    )
+
+
+@typechecked
+def _declare_ipc_stream_writer_rows_written(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow IPC stream writer row count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_stream_writer_rows_written",
+        visitor._llvm.INT64_TYPE,
+        [visitor._llvm.ARROW_IPC_WRITER_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_ipc_stream_writer_close(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow IPC stream writer close.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_ipc_stream_writer_close",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARROW_IPC_WRITER_HANDLE_TYPE],
+    )
@@ -60,6 +60,20 @@ def arrowcpp_linker_flags() -> tuple[str, ...]:
     return tuple(flags)
 
 
+@typechecked
+def arrowcpp_compute_linker_flags() -> tuple[str, ...]:
+    """
+    title: Return linker flags for the Arrow C++ compute kernels.
+    summary: >-
+      Since Arrow 21 most compute kernels live in their own shared library next
+      to libarrow.
+    returns:
+      type: tuple[str, Ellipsis]
+    """
+    library = _find_pyarrow_library("arrow_compute")
+    return (*arrowcpp_linker_flags(), str(library))
+
+
 @typechecked
 def arrowcpp_runtime_metadata() -> dict[str, object]:
     """
@@ -154,6 +168,7 @@ def _versioned_library_glob() -> str:
 
 __all__ = [
     "arrowcpp_compile_flags",
+    "arrowcpp_compute_linker_flags",
     "arrowcpp_include_dirs",
     "arrowcpp_linker_flags",
     "arrowcpp_runtime_metadata",
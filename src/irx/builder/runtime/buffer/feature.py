@@ -37,6 +37,10 @@ def build_buffer_runtime_feature() -> RuntimeFeature:
                 "irx_buffer_owner_external_new",
                 _declare_owner_external_new,
             ),
+            "irx_buffer_owner_alloc": ExternalSymbolSpec(
+                "irx_buffer_owner_alloc",
+                _declare_owner_alloc,
+            ),
             "irx_buffer_owner_retain": ExternalSymbolSpec(
                 "irx_buffer_owner_retain",
                 _declare_owner_retain,
@@ -57,13 +61,21 @@ def build_buffer_runtime_feature() -> RuntimeFeature:
                 "irx_buffer_last_error",
                 _declare_last_error,
             ),
+            "irx_buffer_map_file": ExternalSymbolSpec(
+                "irx_buffer_map_file",
+                _declare_map_file,
+            ),
+            "irx_buffer_view_advise": ExternalSymbolSpec(
+                "irx_buffer_view_advise",
+                _declare_view_advise,
+            ),
         },
         artifacts=(
             NativeArtifact(
                 kind="c_source",
                 path=native_root / "irx_buffer_runtime.c",
                 include_dirs=(native_root,),
-                compile_flags=("-std=c99",),
+                compile_flags=("-std=c11",),
             ),
         ),
         metadata={
@@ -100,6 +112,31 @@ def _declare_owner_external_new(
     )
 
 
+@typechecked
+def _declare_owner_alloc(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare owner alloc.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE.as_pointer(),
+            visitor._llvm.BUFFER_OWNER_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_buffer_owner_alloc",
+        fn_type,
+    )
+
+
 @typechecked
 def _declare_owner_retain(visitor: VisitorProtocol) -> ir.Function:
     """
@@ -203,3 +240,57 @@ def _declare_last_error(visitor: VisitorProtocol) -> ir.Function:
         "irx_buffer_last_error",
         fn_type,
     )
+
+
+@typechecked
+def _declare_map_file(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare map file.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT64_TYPE.as_pointer(),
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.BUFFER_VIEW_TYPE.as_pointer(),
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_buffer_map_file",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_view_advise(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare view advise.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.BUFFER_VIEW_TYPE.as_pointer(),
+            visitor._llvm.INT32_TYPE,
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_buffer_view_advise",
+        fn_type,
+    )
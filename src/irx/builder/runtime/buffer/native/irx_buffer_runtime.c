@@ -1,15 +1,31 @@
+#ifndef _WIN32
+#define _POSIX_C_SOURCE 200809L
+#endif
+
 #include "irx_buffer_runtime.h"
 
 #include <errno.h>
+#include <stdatomic.h>
 #include <stdlib.h>
+#include <string.h>
+
+#ifdef _WIN32
+#include <malloc.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
 
+/* Owners may be shared by threads spawned from native or host code. */
 struct irx_buffer_owner_handle {
-  int64_t refcount;
+  _Atomic int64_t refcount;
   void* context;
   irx_buffer_owner_release_fn release;
 };
 
-static const char* irx_buffer_error = "";
+static _Thread_local const char* irx_buffer_error = "";
 
 static int32_t irx_buffer_set_error(const char* message) {
   irx_buffer_error = message;
@@ -33,7 +49,7 @@ int32_t irx_buffer_owner_external_new(
     return irx_buffer_set_error("failed to allocate buffer owner handle");
   }
 
-  owner->refcount = 1;
+  atomic_init(&owner->refcount, 1);
   owner->context = context;
   owner->release = release;
   *out_owner = owner;
@@ -41,15 +57,61 @@ int32_t irx_buffer_owner_external_new(
   return 0;
 }
 
+static void irx_buffer_storage_release(void* context) {
+#ifdef _WIN32
+  _aligned_free(context);
+#else
+  free(context);
+#endif
+}
+
+int32_t irx_buffer_owner_alloc(
+    int64_t size_bytes,
+    void** out_data,
+    irx_buffer_owner_handle** out_owner) {
+  if (out_data == NULL || out_owner == NULL) {
+    return irx_buffer_set_error("out_data and out_owner must not be NULL");
+  }
+  *out_data = NULL;
+  *out_owner = NULL;
+  if (size_bytes < 0) {
+    return irx_buffer_set_error("buffer allocation size must not be negative");
+  }
+
+  /* Empty tensors still get a distinct block so release stays uniform. */
+  size_t size = size_bytes == 0 ? IRX_BUFFER_ALLOC_ALIGNMENT
+                                : (size_t)size_bytes;
+  void* data = NULL;
+#ifdef _WIN32
+  data = _aligned_malloc(size, IRX_BUFFER_ALLOC_ALIGNMENT);
+#else
+  if (posix_memalign(&data, IRX_BUFFER_ALLOC_ALIGNMENT, size) != 0) {
+    data = NULL;
+  }
+#endif
+  if (data == NULL) {
+    return irx_buffer_set_error("failed to allocate buffer storage");
+  }
+  if (irx_buffer_owner_external_new(
+          data, irx_buffer_storage_release, out_owner) != 0) {
+    irx_buffer_storage_release(data);
+    return -1;
+  }
+  *out_data = data;
+  return 0;
+}
+
 int32_t irx_buffer_owner_retain(irx_buffer_owner_handle* owner) {
   if (owner == NULL) {
     irx_buffer_error = "";
     return 0;
   }
-  if (owner->refcount <= 0) {
+  if (atomic_load_explicit(&owner->refcount, memory_order_relaxed) <= 0) {
     return irx_buffer_set_error("cannot retain a released buffer owner");
   }
-  owner->refcount += 1;
+  /* A new reference is always derived from a live one, so no ordering is
+     needed; the matching release provides it. */
+  atomic_fetch_add_explicit(&owner->refcount, 1, memory_order_relaxed);
   irx_buffer_error = "";
   return 0;
 }
@@ -59,11 +121,13 @@ int32_t irx_buffer_owner_release(irx_buffer_owner_handle* owner) {
     irx_buffer_error = "";
     return 0;
   }
-  if (owner->refcount <= 0) {
+  if (atomic_load_explicit(&owner->refcount, memory_order_relaxed) <= 0) {
     return irx_buffer_set_error("cannot release a released buffer owner");
   }
-  owner->refcount -= 1;
-  if (owner->refcount == 0) {
+  /* Release publishes this thread's writes; acquire on the final drop makes
+     every other thread's writes visible before the owner is torn down. */
+  if (atomic_fetch_sub_explicit(&owner->refcount, 1, memory_order_acq_rel) ==
+      1) {
     irx_buffer_owner_release_fn release = owner->release;
     void* context = owner->context;
     free(owner);
@@ -92,3 +156,257 @@ int32_t irx_buffer_view_release(irx_buffer_view* view) {
   }
   return code;
 }
+
+static int64_t irx_buffer_dtype_size(int32_t dtype) {
+  switch (dtype) {
+    case IRX_BUFFER_DTYPE_BOOL:
+    case IRX_BUFFER_DTYPE_INT8:
+    case IRX_BUFFER_DTYPE_UINT8:
+      return 1;
+    case IRX_BUFFER_DTYPE_INT16:
+    case IRX_BUFFER_DTYPE_UINT16:
+      return 2;
+    case IRX_BUFFER_DTYPE_INT32:
+    case IRX_BUFFER_DTYPE_UINT32:
+    case IRX_BUFFER_DTYPE_FLOAT32:
+      return 4;
+    case IRX_BUFFER_DTYPE_INT64:
+    case IRX_BUFFER_DTYPE_UINT64:
+    case IRX_BUFFER_DTYPE_FLOAT64:
+      return 8;
+    default:
+      return 0;
+  }
+}
+
+#ifdef _WIN32
+
+int32_t irx_buffer_map_file(
+    const char* path,
+    int64_t offset_bytes,
+    int32_t dtype,
+    int32_t ndim,
+    const int64_t* shape,
+    int32_t mode,
+    int32_t advice,
+    irx_buffer_view* out_view) {
+  (void)path;
+  (void)offset_bytes;
+  (void)dtype;
+  (void)ndim;
+  (void)shape;
+  (void)mode;
+  (void)advice;
+  (void)out_view;
+  return irx_buffer_set_error("file mapping requires a POSIX platform");
+}
+
+int32_t irx_buffer_view_advise(const irx_buffer_view* view, int32_t advice) {
+  (void)view;
+  (void)advice;
+  return irx_buffer_set_error("file mapping requires a POSIX platform");
+}
+
+#else
+
+/* Owner context of one file mapping; shape and strides live in dims. */
+typedef struct irx_buffer_mapping {
+  void* base;
+  size_t length;
+  int64_t dims[];
+} irx_buffer_mapping;
+
+static void irx_buffer_mapping_release(void* context) {
+  irx_buffer_mapping* mapping = (irx_buffer_mapping*)context;
+  if (mapping->base != NULL) {
+    munmap(mapping->base, mapping->length);
+  }
+  free(mapping);
+}
+
+static int irx_buffer_posix_advice(int32_t advice, int* out_advice) {
+  switch (advice) {
+    case IRX_BUFFER_ADVICE_NORMAL:
+      *out_advice = POSIX_MADV_NORMAL;
+      return 1;
+    case IRX_BUFFER_ADVICE_SEQUENTIAL:
+      *out_advice = POSIX_MADV_SEQUENTIAL;
+      return 1;
+    case IRX_BUFFER_ADVICE_RANDOM:
+      *out_advice = POSIX_MADV_RANDOM;
+      return 1;
+    case IRX_BUFFER_ADVICE_WILLNEED:
+      *out_advice = POSIX_MADV_WILLNEED;
+      return 1;
+    default:
+      return 0;
+  }
+}
+
+static int64_t irx_buffer_mapping_elements(
+    int32_t ndim,
+    const int64_t* shape,
+    int64_t available,
+    int64_t element_size) {
+  if (ndim == 1 && (shape == NULL || shape[0] < 0)) {
+    return available / element_size;
+  }
+  int64_t count = 1;
+  for (int32_t axis = 0; axis < ndim; ++axis) {
+    if (shape[axis] < 0) {
+      return -1;
+    }
+    if (shape[axis] != 0 && count > INT64_MAX / shape[axis]) {
+      return -1;
+    }
+    count *= shape[axis];
+  }
+  return count;
+}
+
+int32_t irx_buffer_map_file(
+    const char* path,
+    int64_t offset_bytes,
+    int32_t dtype,
+    int32_t ndim,
+    const int64_t* shape,
+    int32_t mode,
+    int32_t advice,
+    irx_buffer_view* out_view) {
+  if (out_view == NULL) {
+    return irx_buffer_set_error("out_view must not be NULL");
+  }
+  memset(out_view, 0, sizeof(*out_view));
+  if (path == NULL) {
+    return irx_buffer_set_error("path must not be NULL");
+  }
+  if (ndim < 1 || (ndim > 1 && shape == NULL)) {
+    return irx_buffer_set_error("file mappings need a shape of rank >= 1");
+  }
+  if (offset_bytes < 0) {
+    return irx_buffer_set_error("file mapping offset must not be negative");
+  }
+  int64_t element_size = irx_buffer_dtype_size(dtype);
+  if (element_size == 0) {
+    return irx_buffer_set_error("file mappings need a primitive dtype");
+  }
+  int posix_advice = 0;
+  if (!irx_buffer_posix_advice(advice, &posix_advice)) {
+    return irx_buffer_set_error("unknown file mapping advice");
+  }
+  int open_flags = O_RDONLY;
+  int prot = PROT_READ;
+  int map_flags = MAP_SHARED;
+  if (mode == IRX_BUFFER_MAP_COPY_ON_WRITE) {
+    prot |= PROT_WRITE;
+    map_flags = MAP_PRIVATE;
+  } else if (mode == IRX_BUFFER_MAP_WRITABLE) {
+    open_flags = O_RDWR;
+    prot |= PROT_WRITE;
+  } else if (mode != IRX_BUFFER_MAP_READONLY) {
+    return irx_buffer_set_error("unknown file mapping mode");
+  }
+
+  int fd = open(path, open_flags);
+  if (fd < 0) {
+    return irx_buffer_set_error("failed to open file for mapping");
+  }
+  struct stat info;
+  if (fstat(fd, &info) != 0) {
+    close(fd);
+    return irx_buffer_set_error("failed to stat file for mapping");
+  }
+  int64_t file_size = (int64_t)info.st_size;
+  if (offset_bytes > file_size) {
+    close(fd);
+    return irx_buffer_set_error("file mapping offset is past the end");
+  }
+  int64_t count = irx_buffer_mapping_elements(
+      ndim, shape, file_size - offset_bytes, element_size);
+  if (count < 0 || count > (file_size - offset_bytes) / element_size) {
+    close(fd);
+    return irx_buffer_set_error("file mapping shape exceeds the file size");
+  }
+
+  int64_t page_size = (int64_t)sysconf(_SC_PAGESIZE);
+  int64_t delta = page_size > 0 ? offset_bytes % page_size : 0;
+  size_t length = (size_t)(delta + count * element_size);
+  void* base = NULL;
+  if (count > 0) {
+    base = mmap(
+        NULL, length, prot, map_flags, fd, (off_t)(offset_bytes - delta));
+    if (base == MAP_FAILED) {
+      close(fd);
+      return irx_buffer_set_error("failed to map file");
+    }
+    if (advice != IRX_BUFFER_ADVICE_NORMAL) {
+      /* Advice is only a hint, so a rejected hint keeps the mapping. */
+      (void)posix_madvise(base, length, posix_advice);
+    }
+  }
+  close(fd);
+
+  irx_buffer_mapping* mapping = (irx_buffer_mapping*)malloc(
+      sizeof(*mapping) + 2 * (size_t)ndim * sizeof(int64_t));
+  if (mapping == NULL) {
+    if (base != NULL) {
+      munmap(base, length);
+    }
+    return irx_buffer_set_error("failed to allocate file mapping");
+  }
+  mapping->base = base;
+  mapping->length = length;
+  int64_t* mapped_shape = mapping->dims;
+  int64_t* mapped_strides = mapping->dims + ndim;
+  int64_t stride = element_size;
+  for (int32_t axis = ndim - 1; axis >= 0; --axis) {
+    mapped_shape[axis] = ndim == 1 ? count : shape[axis];
+    mapped_strides[axis] = stride;
+    stride *= mapped_shape[axis];
+  }
+
+  irx_buffer_owner_handle* owner = NULL;
+  if (irx_buffer_owner_external_new(
+          mapping, irx_buffer_mapping_release, &owner) != 0) {
+    irx_buffer_mapping_release(mapping);
+    return -1;
+  }
+
+  out_view->data = base;
+  out_view->owner = owner;
+  out_view->dtype = (void*)(intptr_t)dtype;
+  out_view->ndim = ndim;
+  out_view->shape = mapped_shape;
+  out_view->strides = mapped_strides;
+  out_view->offset_bytes = base != NULL ? delta : 0;
+  out_view->flags =
+      IRX_BUFFER_FLAG_OWNED | IRX_BUFFER_FLAG_C_CONTIGUOUS |
+      (ndim == 1 ? IRX_BUFFER_FLAG_F_CONTIGUOUS : 0) |
+      (mode == IRX_BUFFER_MAP_READONLY ? IRX_BUFFER_FLAG_READONLY
+                                       : IRX_BUFFER_FLAG_WRITABLE);
+  irx_buffer_error = "";
+  return 0;
+}
+
+int32_t irx_buffer_view_advise(const irx_buffer_view* view, int32_t advice) {
+  if (view == NULL) {
+    return irx_buffer_set_error("view must not be NULL");
+  }
+  if (view->owner == NULL ||
+      view->owner->release != irx_buffer_mapping_release) {
+    return irx_buffer_set_error("view is not backed by a file mapping");
+  }
+  int posix_advice = 0;
+  if (!irx_buffer_posix_advice(advice, &posix_advice)) {
+    return irx_buffer_set_error("unknown file mapping advice");
+  }
+  irx_buffer_mapping* mapping = (irx_buffer_mapping*)view->owner->context;
+  if (mapping->base != NULL &&
+      posix_madvise(mapping->base, mapping->length, posix_advice) != 0) {
+    return irx_buffer_set_error("file mapping advice was rejected");
+  }
+  irx_buffer_error = "";
+  return 0;
+}
+
+#endif
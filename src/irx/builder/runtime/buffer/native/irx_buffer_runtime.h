@@ -28,6 +28,17 @@ extern "C" {
 #define IRX_BUFFER_DTYPE_FLOAT32 10
 #define IRX_BUFFER_DTYPE_FLOAT64 11
 
+#define IRX_BUFFER_MAP_READONLY 0
+#define IRX_BUFFER_MAP_COPY_ON_WRITE 1
+#define IRX_BUFFER_MAP_WRITABLE 2
+
+#define IRX_BUFFER_ADVICE_NORMAL 0
+#define IRX_BUFFER_ADVICE_SEQUENTIAL 1
+#define IRX_BUFFER_ADVICE_RANDOM 2
+#define IRX_BUFFER_ADVICE_WILLNEED 3
+
+#define IRX_BUFFER_ALLOC_ALIGNMENT 64
+
 typedef struct irx_buffer_owner_handle irx_buffer_owner_handle;
 typedef void (*irx_buffer_owner_release_fn)(void* context);
 
@@ -46,12 +57,32 @@ int32_t irx_buffer_owner_external_new(
     void* context,
     irx_buffer_owner_release_fn release,
     irx_buffer_owner_handle** out_owner);
+/* Allocate IRX_BUFFER_ALLOC_ALIGNMENT-aligned storage whose owner frees it
+   when the last reference is released. */
+int32_t irx_buffer_owner_alloc(
+    int64_t size_bytes,
+    void** out_data,
+    irx_buffer_owner_handle** out_owner);
 int32_t irx_buffer_owner_retain(irx_buffer_owner_handle* owner);
 int32_t irx_buffer_owner_release(irx_buffer_owner_handle* owner);
 int32_t irx_buffer_view_retain(const irx_buffer_view* view);
 int32_t irx_buffer_view_release(irx_buffer_view* view);
 const char* irx_buffer_last_error(void);
 
+/* Map a file region as a C-contiguous view whose owner release unmaps it.
+   A rank-1 view with a NULL or negative shape covers the rest of the file.
+   READONLY and WRITABLE share the file; COPY_ON_WRITE writes stay private. */
+int32_t irx_buffer_map_file(
+    const char* path,
+    int64_t offset_bytes,
+    int32_t dtype,
+    int32_t ndim,
+    const int64_t* shape,
+    int32_t mode,
+    int32_t advice,
+    irx_buffer_view* out_view);
+int32_t irx_buffer_view_advise(const irx_buffer_view* view, int32_t advice);
+
 #ifdef __cplusplus
 }
 #endif
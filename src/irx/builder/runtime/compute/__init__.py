@@ -0,0 +1,10 @@
+"""
+title: Arrow compute kernel runtime feature package.
+"""
+
+from irx.builder.runtime.compute.feature import (
+    ARROW_COMPUTE_BINARY_OPS,
+    build_compute_runtime_feature,
+)
+
+__all__ = ["ARROW_COMPUTE_BINARY_OPS", "build_compute_runtime_feature"]
@@ -0,0 +1,463 @@
+"""
+title: Builtin Arrow compute kernel runtime feature declarations.
+summary: >-
+  Exposes a curated set of Arrow C++ compute kernels over array handles, so
+  reductions, filters, and elementwise arithmetic run as vectorized native
+  kernels instead of scalar loops in generated code.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.arrowcpp import (
+    arrowcpp_compile_flags,
+    arrowcpp_compute_linker_flags,
+    arrowcpp_include_dirs,
+    arrowcpp_runtime_metadata,
+)
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+ARROW_COMPUTE_ADD = 1
+ARROW_COMPUTE_SUBTRACT = 2
+ARROW_COMPUTE_MULTIPLY = 3
+ARROW_COMPUTE_DIVIDE = 4
+ARROW_COMPUTE_EQUAL = 5
+ARROW_COMPUTE_NOT_EQUAL = 6
+ARROW_COMPUTE_LESS = 7
+ARROW_COMPUTE_LESS_EQUAL = 8
+ARROW_COMPUTE_GREATER = 9
+ARROW_COMPUTE_GREATER_EQUAL = 10
+ARROW_COMPUTE_AND = 11
+ARROW_COMPUTE_OR = 12
+
+ARROW_COMPUTE_BINARY_OPS = {
+    "+": ARROW_COMPUTE_ADD,
+    "-": ARROW_COMPUTE_SUBTRACT,
+    "*": ARROW_COMPUTE_MULTIPLY,
+    "/": ARROW_COMPUTE_DIVIDE,
+    "==": ARROW_COMPUTE_EQUAL,
+    "!=": ARROW_COMPUTE_NOT_EQUAL,
+    "<": ARROW_COMPUTE_LESS,
+    "<=": ARROW_COMPUTE_LESS_EQUAL,
+    ">": ARROW_COMPUTE_GREATER,
+    ">=": ARROW_COMPUTE_GREATER_EQUAL,
+    "&&": ARROW_COMPUTE_AND,
+    "||": ARROW_COMPUTE_OR,
+}
+
+
+@typechecked
+def build_compute_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the builtin Arrow compute runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    runtime_root = Path(__file__).resolve().parent
+    native_root = (runtime_root.parent / "arrow" / "native").resolve()
+    buffer_native_root = (runtime_root.parent / "buffer" / "native").resolve()
+    include_dirs = (
+        native_root,
+        buffer_native_root,
+        *arrowcpp_include_dirs(),
+    )
+    artifacts = [
+        NativeArtifact(
+            kind="cxx_source",
+            path=native_root / "irx_arrow_runtime.cc",
+            include_dirs=include_dirs,
+            compile_flags=arrowcpp_compile_flags(),
+        ),
+        NativeArtifact(
+            kind="cxx_source",
+            path=native_root / "irx_arrow_compute.cc",
+            include_dirs=include_dirs,
+            compile_flags=arrowcpp_compile_flags(),
+        ),
+    ]
+
+    return RuntimeFeature(
+        name="compute",
+        symbols={
+            "irx_arrow_compute_sum_int64": ExternalSymbolSpec(
+                "irx_arrow_compute_sum_int64",
+                _declare_compute_sum_int64,
+            ),
+            "irx_arrow_compute_sum_double": ExternalSymbolSpec(
+                "irx_arrow_compute_sum_double",
+                _declare_compute_sum_double,
+            ),
+            "irx_arrow_compute_min_max_int64": ExternalSymbolSpec(
+                "irx_arrow_compute_min_max_int64",
+                _declare_compute_min_max_int64,
+            ),
+            "irx_arrow_compute_min_max_double": ExternalSymbolSpec(
+                "irx_arrow_compute_min_max_double",
+                _declare_compute_min_max_double,
+            ),
+            "irx_arrow_compute_mean": ExternalSymbolSpec(
+                "irx_arrow_compute_mean",
+                _declare_compute_mean,
+            ),
+            "irx_arrow_compute_binary": ExternalSymbolSpec(
+                "irx_arrow_compute_binary",
+                _declare_compute_binary,
+            ),
+            "irx_arrow_compute_binary_int64_scalar": ExternalSymbolSpec(
+                "irx_arrow_compute_binary_int64_scalar",
+                _declare_compute_binary_int64_scalar,
+            ),
+            "irx_arrow_compute_binary_double_scalar": ExternalSymbolSpec(
+                "irx_arrow_compute_binary_double_scalar",
+                _declare_compute_binary_double_scalar,
+            ),
+            "irx_arrow_compute_filter": ExternalSymbolSpec(
+                "irx_arrow_compute_filter",
+                _declare_compute_filter,
+            ),
+            "irx_arrow_compute_take": ExternalSymbolSpec(
+                "irx_arrow_compute_take",
+                _declare_compute_take,
+            ),
+            "irx_arrow_compute_cast": ExternalSymbolSpec(
+                "irx_arrow_compute_cast",
+                _declare_compute_cast,
+            ),
+            "irx_arrow_last_error": ExternalSymbolSpec(
+                "irx_arrow_last_error",
+                _declare_last_error,
+            ),
+        },
+        artifacts=tuple(artifacts),
+        metadata={
+            "opaque_handles": {
+                "array": "irx_arrow_array_handle",
+            },
+            "canonical_name": "compute",
+            "binary_ops": dict(ARROW_COMPUTE_BINARY_OPS),
+            "reductions": ("sum", "min", "max", "mean"),
+            "vector_kernels": ("filter", "take", "cast"),
+            **arrowcpp_runtime_metadata(),
+        },
+        linker_flags=arrowcpp_compute_linker_flags(),
+    )
+
+
+@typechecked
+def _declare_function(
+    visitor: VisitorProtocol,
+    name: str,
+    return_type: ir.Type,
+    arg_types: list[ir.Type],
+) -> ir.Function:
+    """
+    title: Declare one Arrow compute runtime symbol.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+      name:
+        type: str
+      return_type:
+        type: ir.Type
+      arg_types:
+        type: list[ir.Type]
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(return_type, arg_types)
+    return declare_external_function(visitor._llvm.module, name, fn_type)
+
+
+@typechecked
+def _declare_compute_sum_int64(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute integer sum.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_sum_int64",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_sum_double(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute floating-point sum.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_sum_double",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.DOUBLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_min_max_int64(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute integer min/max.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_min_max_int64",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE.as_pointer(),
+            visitor._llvm.INT64_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_min_max_double(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute floating-point min/max.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_min_max_double",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.DOUBLE_TYPE.as_pointer(),
+            visitor._llvm.DOUBLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_mean(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute mean.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_mean",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.DOUBLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_binary(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute array-array binary kernel.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_binary",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_binary_int64_scalar(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow compute array-int64 binary kernel.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_binary_int64_scalar",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_binary_double_scalar(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare Arrow compute array-double binary kernel.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_binary_double_scalar",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.DOUBLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_filter(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute filter.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_filter",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_take(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute take.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_take",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_compute_cast(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow compute cast.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_compute_cast",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARRAY_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_last_error(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow last error.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_last_error",
+        visitor._llvm.OPAQUE_POINTER_TYPE,
+        [],
+    )
+
+
+__all__ = [
+    "ARROW_COMPUTE_ADD",
+    "ARROW_COMPUTE_AND",
+    "ARROW_COMPUTE_BINARY_OPS",
+    "ARROW_COMPUTE_DIVIDE",
+    "ARROW_COMPUTE_EQUAL",
+    "ARROW_COMPUTE_GREATER",
+    "ARROW_COMPUTE_GREATER_EQUAL",
+    "ARROW_COMPUTE_LESS",
+    "ARROW_COMPUTE_LESS_EQUAL",
+    "ARROW_COMPUTE_MULTIPLY",
+    "ARROW_COMPUTE_NOT_EQUAL",
+    "ARROW_COMPUTE_OR",
+    "ARROW_COMPUTE_SUBTRACT",
+    "build_compute_runtime_feature",
+]
@@ -7,6 +7,7 @@ from __future__ import annotations
 import hashlib
 import shutil
 import subprocess
+import sys
 
 from dataclasses import dataclass
 from pathlib import Path
@@ -135,6 +136,115 @@ def link_executable(
       cxx_binary:
         type: str
     """
+    _link(
+        primary_object=primary_object,
+        output_file=output_file,
+        artifacts=artifacts,
+        linker_flags=linker_flags,
+        clang_binary=clang_binary,
+        cxx_binary=cxx_binary,
+    )
+
+
+@typechecked
+def link_shared_library(
+    primary_object: Path,
+    output_file: Path,
+    artifacts: Sequence[NativeArtifact],
+    exports: Sequence[str],
+    *,
+    linker_flags: Sequence[str] = (),
+    clang_binary: str = "clang",
+    cxx_binary: str = "c++",
+) -> None:
+    """
+    title: Link a shared library that exports only the selected symbols.
+    summary: >-
+      Runtime artifacts are linked into the library, but every symbol outside
+      exports is made local, so loading two IRx libraries into one process
+      never interposes their internal functions or runtime copies.
+    parameters:
+      primary_object:
+        type: Path
+      output_file:
+        type: Path
+      artifacts:
+        type: Sequence[NativeArtifact]
+      exports:
+        type: Sequence[str]
+      linker_flags:
+        type: Sequence[str]
+      clang_binary:
+        type: str
+      cxx_binary:
+        type: str
+    """
+    export_list = primary_object.parent / f"{output_file.stem}.exports"
+    if sys.platform == "darwin":
+        export_list.write_text(
+            "".join(f"_{name}\n" for name in exports),
+            encoding="utf8",
+        )
+        export_flags = [
+            "-dynamiclib",
+            f"-Wl,-exported_symbols_list,{export_list}",
+        ]
+    elif sys.platform == "win32":
+        raise LinkingError(
+            Diagnostic(
+                message=(
+                    f"shared library '{output_file.name}' cannot be linked "
+                    "on Windows"
+                ),
+                code=DiagnosticCodes.LINK_FAILED,
+                phase="link",
+                notes=("shared-library builds use ELF or Mach-O exports",),
+            )
+        )
+    else:
+        symbols = "".join(f"    {name};\n" for name in exports)
+        export_list.write_text(
+            f"{{\n  global:\n{symbols}  local:\n    *;\n}};\n",
+            encoding="utf8",
+        )
+        export_flags = ["-shared", f"-Wl,--version-script={export_list}"]
+
+    _link(
+        primary_object=primary_object,
+        output_file=output_file,
+        artifacts=artifacts,
+        linker_flags=[*export_flags, *linker_flags],
+        clang_binary=clang_binary,
+        cxx_binary=cxx_binary,
+    )
+
+
+@typechecked
+def _link(
+    *,
+    primary_object: Path,
+    output_file: Path,
+    artifacts: Sequence[NativeArtifact],
+    linker_flags: Sequence[str],
+    clang_binary: str,
+    cxx_binary: str,
+) -> None:
+    """
+    title: Compile runtime artifacts and run the final link command.
+    parameters:
+      primary_object:
+        type: Path
+      output_file:
+        type: Path
+      artifacts:
+        type: Sequence[NativeArtifact]
+      linker_flags:
+        type: Sequence[str]
+      clang_binary:
+        type: str
+      cxx_binary:
+        type: str
+    """
     build_dir = primary_object.parent
     link_inputs = compile_native_artifacts(
         artifacts=artifacts,
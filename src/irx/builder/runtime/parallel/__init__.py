@@ -0,0 +1,9 @@
+"""
+title: Parallel loop runtime feature support for IRx.
+"""
+
+from irx.builder.runtime.parallel.feature import (
+    build_parallel_runtime_feature,
+)
+
+__all__ = ["build_parallel_runtime_feature"]
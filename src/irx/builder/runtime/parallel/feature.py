@@ -0,0 +1,143 @@
+"""
+title: Parallel loop runtime feature declarations.
+summary: >-
+  Declares the thread-pool runtime behind ParallelForRangeLoopStmt. Lowered
+  loops outline their body into a function over one block of iterations and
+  hand it to irx_parallel_for, which runs blocks on a lazily started pool of
+  POSIX threads with static or work-stealing dynamic scheduling.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+PARALLEL_MAX_THREADS = 64
+PARALLEL_SCHEDULE_CODES = {"static": 0, "dynamic": 1}
+
+
+@typechecked
+def build_parallel_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the parallel loop runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    native_root = Path(__file__).resolve().parent / "native"
+    symbols = {
+        "irx_parallel_for": ExternalSymbolSpec(
+            "irx_parallel_for",
+            _declare_parallel_for,
+        ),
+        "irx_parallel_thread_count": ExternalSymbolSpec(
+            "irx_parallel_thread_count",
+            _declare_parallel_thread_count,
+        ),
+    }
+    return RuntimeFeature(
+        name="parallel",
+        symbols=symbols,
+        artifacts=(
+            NativeArtifact(
+                kind="c_source",
+                path=native_root / "irx_parallel_runtime.c",
+                include_dirs=(native_root,),
+                compile_flags=("-std=c11", "-pthread"),
+            ),
+        ),
+        linker_flags=("-pthread",),
+        metadata={
+            "canonical_name": "parallel",
+            "symbols": tuple(symbols),
+            "max_threads": PARALLEL_MAX_THREADS,
+            "schedules": tuple(PARALLEL_SCHEDULE_CODES),
+            "thread_count_env": "IRX_NUM_THREADS",
+            "limitations": (
+                "one parallel loop runs on the pool at a time",
+                "nested parallel loops run serially inside the outer body",
+                "Windows builds run parallel loops serially",
+            ),
+        },
+    )
+
+
+@typechecked
+def parallel_body_type(visitor: VisitorProtocol) -> ir.FunctionType:
+    """
+    title: Return the outlined loop-body function type.
+    summary: >-
+      Bodies take the opaque capture context, the half-open block of
+      normalized iterations to run, and the calling worker index.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.FunctionType
+    """
+    return ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+
+
+@typechecked
+def _declare_parallel_for(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare parallel for.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [
+            parallel_body_type(visitor).as_pointer(),
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_parallel_for",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_parallel_thread_count(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare parallel thread count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(visitor._llvm.INT64_TYPE, [])
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_parallel_thread_count",
+        fn_type,
+    )
@@ -0,0 +1,270 @@
+#ifndef _WIN32
+#define _GNU_SOURCE
+#endif
+
+#include "irx_parallel_runtime.h"
+
+#include <stdlib.h>
+
+#ifndef _WIN32
+#include <pthread.h>
+#include <unistd.h>
+#endif
+
+/* Default dynamic chunks give each thread about this many blocks. */
+#define IRX_PARALLEL_CHUNKS_PER_THREAD 8
+
+static _Thread_local int irx_parallel_inside_body = 0;
+
+static int64_t irx_parallel_min(int64_t lhs, int64_t rhs) {
+  return lhs < rhs ? lhs : rhs;
+}
+
+static int64_t irx_parallel_requested_threads(void) {
+  const char* text = getenv("IRX_NUM_THREADS");
+  int64_t threads = 0;
+  if (text != NULL && *text != '\0') {
+    threads = strtoll(text, NULL, 10);
+  }
+#ifndef _WIN32
+  if (threads <= 0) {
+    threads = (int64_t)sysconf(_SC_NPROCESSORS_ONLN);
+  }
+#endif
+  if (threads < 1) {
+    threads = 1;
+  }
+  return irx_parallel_min(threads, IRX_PARALLEL_MAX_THREADS);
+}
+
+#ifdef _WIN32
+
+int64_t irx_parallel_thread_count(void) {
+  return 1;
+}
+
+void irx_parallel_for(
+    irx_parallel_body body,
+    void* context,
+    int64_t count,
+    int32_t schedule,
+    int64_t chunk) {
+  (void)schedule;
+  (void)chunk;
+  if (count > 0) {
+    body(context, 0, count, 0);
+  }
+}
+
+#else
+
+/* One thread's share of the iteration space; padded to its own line. */
+typedef struct irx_parallel_range {
+  _Alignas(64) pthread_mutex_t lock;
+  int64_t begin;
+  int64_t end;
+} irx_parallel_range;
+
+typedef struct irx_parallel_job {
+  irx_parallel_body body;
+  void* context;
+  int64_t count;
+  int64_t chunk;
+  int32_t schedule;
+} irx_parallel_job;
+
+typedef struct irx_parallel_pool {
+  /* Serializes jobs dispatched from different host threads. */
+  pthread_mutex_t dispatch;
+  /* Guards generation, remaining, and job. */
+  pthread_mutex_t lock;
+  pthread_cond_t start;
+  pthread_cond_t done;
+  int64_t threads;
+  uint64_t generation;
+  int64_t remaining;
+  irx_parallel_job job;
+  irx_parallel_range ranges[IRX_PARALLEL_MAX_THREADS];
+} irx_parallel_pool;
+
+static irx_parallel_pool irx_parallel_state;
+static pthread_once_t irx_parallel_once = PTHREAD_ONCE_INIT;
+
+static int irx_parallel_take(
+    irx_parallel_range* range, int64_t chunk, int64_t* begin, int64_t* end) {
+  int found = 0;
+  pthread_mutex_lock(&range->lock);
+  if (range->begin < range->end) {
+    *begin = range->begin;
+    *end = irx_parallel_min(range->begin + chunk, range->end);
+    range->begin = *end;
+    found = 1;
+  }
+  pthread_mutex_unlock(&range->lock);
+  return found;
+}
+
+static int irx_parallel_steal(int64_t worker) {
+  irx_parallel_pool* pool = &irx_parallel_state;
+  for (int64_t offset = 1; offset < pool->threads; ++offset) {
+    irx_parallel_range* victim =
+        &pool->ranges[(worker + offset) % pool->threads];
+    int64_t begin = 0;
+    int64_t end = 0;
+    pthread_mutex_lock(&victim->lock);
+    int64_t remaining = victim->end - victim->begin;
+    if (remaining > 0) {
+      begin = victim->begin + remaining / 2;
+      end = victim->end;
+      victim->end = begin;
+    }
+    pthread_mutex_unlock(&victim->lock);
+    if (begin < end) {
+      irx_parallel_range* own = &pool->ranges[worker];
+      pthread_mutex_lock(&own->lock);
+      own->begin = begin;
+      own->end = end;
+      pthread_mutex_unlock(&own->lock);
+      return 1;
+    }
+  }
+  return 0;
+}
+
+static void irx_parallel_run(const irx_parallel_job* job, int64_t worker) {
+  irx_parallel_pool* pool = &irx_parallel_state;
+  irx_parallel_range* own = &pool->ranges[worker];
+  int64_t begin = 0;
+  int64_t end = 0;
+
+  irx_parallel_inside_body = 1;
+  if (job->schedule == IRX_PARALLEL_SCHEDULE_DYNAMIC) {
+    for (;;) {
+      if (irx_parallel_take(own, job->chunk, &begin, &end)) {
+        job->body(job->context, begin, end, worker);
+      } else if (!irx_parallel_steal(worker)) {
+        break;
+      }
+    }
+  } else if (job->chunk > 0) {
+    int64_t stride = job->chunk * pool->threads;
+    for (begin = worker * job->chunk; begin < job->count; begin += stride) {
+      end = irx_parallel_min(begin + job->chunk, job->count);
+      job->body(job->context, begin, end, worker);
+    }
+  } else if (own->begin < own->end) {
+    job->body(job->context, own->begin, own->end, worker);
+  }
+  irx_parallel_inside_body = 0;
+}
+
+static void* irx_parallel_worker_main(void* argument) {
+  irx_parallel_pool* pool = &irx_parallel_state;
+  int64_t worker = (int64_t)(intptr_t)argument;
+  uint64_t seen = 0;
+
+  for (;;) {
+    pthread_mutex_lock(&pool->lock);
+    while (pool->generation == seen) {
+      pthread_cond_wait(&pool->start, &pool->lock);
+    }
+    seen = pool->generation;
+    irx_parallel_job job = pool->job;
+    pthread_mutex_unlock(&pool->lock);
+
+    irx_parallel_run(&job, worker);
+
+    pthread_mutex_lock(&pool->lock);
+    pool->remaining -= 1;
+    if (pool->remaining == 0) {
+      pthread_cond_signal(&pool->done);
+    }
+    pthread_mutex_unlock(&pool->lock);
+  }
+  return NULL;
+}
+
+static void irx_parallel_start_pool(void) {
+  irx_parallel_pool* pool = &irx_parallel_state;
+  int64_t requested = irx_parallel_requested_threads();
+
+  pthread_mutex_init(&pool->dispatch, NULL);
+  pthread_mutex_init(&pool->lock, NULL);
+  pthread_cond_init(&pool->start, NULL);
+  pthread_cond_init(&pool->done, NULL);
+  for (int64_t index = 0; index < IRX_PARALLEL_MAX_THREADS; ++index) {
+    pthread_mutex_init(&pool->ranges[index].lock, NULL);
+  }
+
+  /* Worker ids stay dense when the system refuses more threads. */
+  pool->threads = 1;
+  for (int64_t worker = 1; worker < requested; ++worker) {
+    pthread_t thread;
+    if (pthread_create(
+            &thread,
+            NULL,
+            irx_parallel_worker_main,
+            (void*)(intptr_t)worker) != 0) {
+      break;
+    }
+    pthread_detach(thread);
+    pool->threads = worker + 1;
+  }
+}
+
+int64_t irx_parallel_thread_count(void) {
+  pthread_once(&irx_parallel_once, irx_parallel_start_pool);
+  return irx_parallel_state.threads;
+}
+
+void irx_parallel_for(
+    irx_parallel_body body,
+    void* context,
+    int64_t count,
+    int32_t schedule,
+    int64_t chunk) {
+  irx_parallel_pool* pool = &irx_parallel_state;
+  if (count <= 0) {
+    return;
+  }
+  int64_t threads = irx_parallel_thread_count();
+  if (threads == 1 || count == 1 || irx_parallel_inside_body) {
+    body(context, 0, count, 0);
+    return;
+  }
+  if (schedule == IRX_PARALLEL_SCHEDULE_DYNAMIC && chunk <= 0) {
+    chunk = count / (threads * IRX_PARALLEL_CHUNKS_PER_THREAD);
+    if (chunk < 1) {
+      chunk = 1;
+    }
+  }
+
+  pthread_mutex_lock(&pool->dispatch);
+  for (int64_t worker = 0; worker < threads; ++worker) {
+    pool->ranges[worker].begin = count * worker / threads;
+    pool->ranges[worker].end = count * (worker + 1) / threads;
+  }
+  pthread_mutex_lock(&pool->lock);
+  pool->job.body = body;
+  pool->job.context = context;
+  pool->job.count = count;
+  pool->job.chunk = chunk;
+  pool->job.schedule = schedule;
+  pool->remaining = threads - 1;
+  pool->generation += 1;
+  pthread_cond_broadcast(&pool->start);
+  pthread_mutex_unlock(&pool->lock);
+
+  irx_parallel_run(&pool->job, 0);
+
+  /* Taking the lock after the last worker's decrement makes every body's
+     writes visible to the caller. */
+  pthread_mutex_lock(&pool->lock);
+  while (pool->remaining > 0) {
+    pthread_cond_wait(&pool->done, &pool->lock);
+  }
+  pthread_mutex_unlock(&pool->lock);
+  pthread_mutex_unlock(&pool->dispatch);
+}
+
+#endif
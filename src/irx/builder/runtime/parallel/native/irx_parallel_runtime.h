@@ -0,0 +1,47 @@
+#ifndef IRX_PARALLEL_RUNTIME_H
+#define IRX_PARALLEL_RUNTIME_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define IRX_PARALLEL_MAX_THREADS 64
+#define IRX_PARALLEL_SCHEDULE_STATIC 0
+#define IRX_PARALLEL_SCHEDULE_DYNAMIC 1
+
+/*
+ * One outlined loop body runs iterations [begin, end) of the normalized
+ * iteration space. worker is the calling thread's index, below
+ * irx_parallel_thread_count(); one worker never runs two chunks at once, so
+ * it may index per-thread storage such as reduction partials.
+ */
+typedef void (*irx_parallel_body)(
+    void* context, int64_t begin, int64_t end, int64_t worker);
+
+/*
+ * Run iterations [0, count) on the pool and return when all have finished.
+ * The calling thread works as worker 0. A static schedule splits the range
+ * into one contiguous share per thread, or deals chunk-sized blocks
+ * round-robin when chunk > 0. A dynamic schedule starts from the same
+ * shares, takes chunk-sized blocks from the front of the thread's own share,
+ * and steals half of another thread's remainder when its own runs out.
+ * Calls made from inside a running body execute serially on that thread.
+ *
+ * The pool starts on first use with IRX_NUM_THREADS threads, or one per
+ * online processor, capped at IRX_PARALLEL_MAX_THREADS.
+ */
+void irx_parallel_for(
+    irx_parallel_body body,
+    void* context,
+    int64_t count,
+    int32_t schedule,
+    int64_t chunk);
+int64_t irx_parallel_thread_count(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,7 @@
+"""
+title: Buffered stdout print runtime feature support for IRx.
+"""
+
+from irx.builder.runtime.print.feature import build_print_runtime_feature
+
+__all__ = ["build_print_runtime_feature"]
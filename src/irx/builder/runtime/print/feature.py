@@ -0,0 +1,213 @@
+"""
+title: Buffered stdout print runtime feature declarations.
+summary: >-
+  Declares the native print runtime used by PrintExpr. Numbers are formatted
+  on the stack straight into a large, fully buffered stdout stream, so bulk
+  output needs neither one heap allocation nor one write syscall per value.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+PRINT_BUFFER_BYTES = 64 * 1024
+PRINT_FLOAT_FORMAT = "%.6f"
+
+
+@typechecked
+def build_print_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the print runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    native_root = Path(__file__).resolve().parent / "native"
+    symbols = {
+        "irx_print_configure_stdout": ExternalSymbolSpec(
+            "irx_print_configure_stdout",
+            _declare_print_configure_stdout,
+        ),
+        "irx_print_cstr": ExternalSymbolSpec(
+            "irx_print_cstr",
+            _declare_print_cstr,
+        ),
+        "irx_print_i64": ExternalSymbolSpec(
+            "irx_print_i64",
+            _declare_print_i64,
+        ),
+        "irx_print_u64": ExternalSymbolSpec(
+            "irx_print_u64",
+            _declare_print_u64,
+        ),
+        "irx_print_f64": ExternalSymbolSpec(
+            "irx_print_f64",
+            _declare_print_f64,
+        ),
+        "irx_print_flush": ExternalSymbolSpec(
+            "irx_print_flush",
+            _declare_print_flush,
+        ),
+    }
+    return RuntimeFeature(
+        name="print",
+        symbols=symbols,
+        artifacts=(
+            NativeArtifact(
+                kind="c_source",
+                path=native_root / "irx_print_runtime.c",
+                include_dirs=(native_root,),
+                compile_flags=("-std=c99",),
+            ),
+        ),
+        metadata={
+            "canonical_name": "print",
+            "symbols": tuple(symbols),
+            "buffer_bytes": PRINT_BUFFER_BYTES,
+            "float_format": PRINT_FLOAT_FORMAT,
+            "limitations": (
+                "interactive terminals keep libc line buffering",
+                "only IRx-built executables enlarge the stdout buffer",
+                "output written after an abnormal termination may be lost",
+            ),
+        },
+    )
+
+
+@typechecked
+def _declare_print_configure_stdout(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare print configure stdout.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_print_configure_stdout",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_print_cstr(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare print cstr.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [visitor._llvm.ASCII_STRING_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_print_cstr",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_print_i64(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare print i64.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [visitor._llvm.INT64_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_print_i64",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_print_u64(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare print u64.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [visitor._llvm.INT64_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_print_u64",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_print_f64(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare print f64.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [visitor._llvm.DOUBLE_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_print_f64",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_print_flush(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare print flush.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_print_flush",
+        fn_type,
+    )
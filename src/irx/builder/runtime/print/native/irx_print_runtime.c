@@ -0,0 +1,88 @@
+#define _POSIX_C_SOURCE 200809L
+
+#include "irx_print_runtime.h"
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <unistd.h>
+
+/* Large enough for UINT64_MAX or INT64_MIN plus the trailing newline. */
+#define IRX_PRINT_INTEGER_SCRATCH 24
+/* %.6f of DBL_MAX needs 316 bytes; keep headroom for the newline. */
+#define IRX_PRINT_FLOAT_SCRATCH 352
+
+static char irx_print_buffer[IRX_PRINT_BUFFER_BYTES];
+
+/*
+ * Sharing libc's stdout buffer instead of keeping a private one keeps IRx
+ * output ordered with any extern C code that also writes to stdout. Only the
+ * generated executable's main calls this, before anything is written, so
+ * hosts that load IRx code as a shared library keep their own stdout setup.
+ */
+void irx_print_configure_stdout(void) {
+  if (!isatty(fileno(stdout))) {
+    setvbuf(stdout, irx_print_buffer, _IOFBF, sizeof(irx_print_buffer));
+  }
+}
+
+static char* irx_print_format_u64(char* end, uint64_t value) {
+  char* cursor = end;
+  do {
+    *--cursor = (char)('0' + (value % 10));
+    value /= 10;
+  } while (value != 0);
+  return cursor;
+}
+
+void irx_print_cstr(const char* text) {
+  if (text != NULL) {
+    fputs(text, stdout);
+  }
+  putc('\n', stdout);
+}
+
+void irx_print_u64(uint64_t value) {
+  char scratch[IRX_PRINT_INTEGER_SCRATCH];
+  char* end = scratch + sizeof(scratch) - 1;
+  char* start;
+
+  *end = '\n';
+  start = irx_print_format_u64(end, value);
+  fwrite(start, 1, (size_t)(end + 1 - start), stdout);
+}
+
+void irx_print_i64(int64_t value) {
+  char scratch[IRX_PRINT_INTEGER_SCRATCH];
+  char* end = scratch + sizeof(scratch) - 1;
+  char* start;
+  /* Negate in unsigned space so INT64_MIN does not overflow. */
+  uint64_t magnitude =
+      value < 0 ? (uint64_t)0 - (uint64_t)value : (uint64_t)value;
+
+  *end = '\n';
+  start = irx_print_format_u64(end, magnitude);
+  if (value < 0) {
+    *--start = '-';
+  }
+  fwrite(start, 1, (size_t)(end + 1 - start), stdout);
+}
+
+void irx_print_f64(double value) {
+  char scratch[IRX_PRINT_FLOAT_SCRATCH];
+  int length = snprintf(scratch, sizeof(scratch) - 1, "%.6f", value);
+
+  if (length < 0) {
+    return;
+  }
+  if ((size_t)length > sizeof(scratch) - 2) {
+    length = (int)(sizeof(scratch) - 2);
+  }
+  scratch[length] = '\n';
+  fwrite(scratch, 1, (size_t)length + 1, stdout);
+}
+
+void irx_print_flush(void) {
+  fflush(stdout);
+}
@@ -0,0 +1,31 @@
+#ifndef IRX_PRINT_RUNTIME_H
+#define IRX_PRINT_RUNTIME_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define IRX_PRINT_BUFFER_BYTES (64 * 1024)
+
+/*
+ * Every entry point writes one value followed by a newline into the process
+ * stdout stream. Numbers are formatted into a small stack scratch buffer, so
+ * printing never allocates. Executables built by IRx call
+ * irx_print_configure_stdout first thing in main, which switches
+ * non-interactive stdout to one large fully buffered block; the C runtime
+ * flushes it at exit.
+ */
+void irx_print_configure_stdout(void);
+void irx_print_cstr(const char* text);
+void irx_print_i64(int64_t value);
+void irx_print_u64(uint64_t value);
+void irx_print_f64(double value);
+void irx_print_flush(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
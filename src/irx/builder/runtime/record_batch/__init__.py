@@ -0,0 +1,9 @@
+"""
+title: Record batch and table runtime feature package.
+"""
+
+from irx.builder.runtime.record_batch.feature import (
+    build_record_batch_runtime_feature as build_record_batch_runtime_feature,
+)
+
+__all__ = ["build_record_batch_runtime_feature"]
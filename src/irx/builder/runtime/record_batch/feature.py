@@ -0,0 +1,597 @@
+"""
+title: Builtin record batch and table runtime feature declarations.
+summary: >-
+  Groups equal-length Arrow arrays into record batches and record batches into
+  chunked tables, so generated code can pass multi-column data around as one
+  reference-counted handle.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.arrowcpp import (
+    arrowcpp_compile_flags,
+    arrowcpp_include_dirs,
+    arrowcpp_linker_flags,
+    arrowcpp_runtime_metadata,
+)
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+
+@typechecked
+def build_record_batch_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the builtin record batch runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    runtime_root = Path(__file__).resolve().parent
+    native_root = (runtime_root.parent / "arrow" / "native").resolve()
+    buffer_native_root = (runtime_root.parent / "buffer" / "native").resolve()
+    include_dirs = (
+        native_root,
+        buffer_native_root,
+        *arrowcpp_include_dirs(),
+    )
+    artifacts = [
+        NativeArtifact(
+            kind="cxx_source",
+            path=native_root / "irx_arrow_runtime.cc",
+            include_dirs=include_dirs,
+            compile_flags=arrowcpp_compile_flags(),
+        )
+    ]
+
+    return RuntimeFeature(
+        name="record_batch",
+        symbols={
+            "irx_arrow_record_batch_make": ExternalSymbolSpec(
+                "irx_arrow_record_batch_make",
+                _declare_record_batch_make,
+            ),
+            "irx_arrow_record_batch_num_rows": ExternalSymbolSpec(
+                "irx_arrow_record_batch_num_rows",
+                _declare_record_batch_num_rows,
+            ),
+            "irx_arrow_record_batch_num_columns": ExternalSymbolSpec(
+                "irx_arrow_record_batch_num_columns",
+                _declare_record_batch_num_columns,
+            ),
+            "irx_arrow_record_batch_column_index": ExternalSymbolSpec(
+                "irx_arrow_record_batch_column_index",
+                _declare_record_batch_column_index,
+            ),
+            "irx_arrow_record_batch_column_schema": ExternalSymbolSpec(
+                "irx_arrow_record_batch_column_schema",
+                _declare_record_batch_column_schema,
+            ),
+            "irx_arrow_record_batch_borrow_column": ExternalSymbolSpec(
+                "irx_arrow_record_batch_borrow_column",
+                _declare_record_batch_borrow_column,
+            ),
+            "irx_arrow_record_batch_slice": ExternalSymbolSpec(
+                "irx_arrow_record_batch_slice",
+                _declare_record_batch_slice,
+            ),
+            "irx_arrow_record_batch_retain": ExternalSymbolSpec(
+                "irx_arrow_record_batch_retain",
+                _declare_record_batch_retain,
+            ),
+            "irx_arrow_record_batch_release": ExternalSymbolSpec(
+                "irx_arrow_record_batch_release",
+                _declare_record_batch_release,
+            ),
+            "irx_arrow_table_from_record_batches": ExternalSymbolSpec(
+                "irx_arrow_table_from_record_batches",
+                _declare_table_from_record_batches,
+            ),
+            "irx_arrow_table_num_rows": ExternalSymbolSpec(
+                "irx_arrow_table_num_rows",
+                _declare_table_num_rows,
+            ),
+            "irx_arrow_table_num_columns": ExternalSymbolSpec(
+                "irx_arrow_table_num_columns",
+                _declare_table_num_columns,
+            ),
+            "irx_arrow_table_column_index": ExternalSymbolSpec(
+                "irx_arrow_table_column_index",
+                _declare_table_column_index,
+            ),
+            "irx_arrow_table_column_schema": ExternalSymbolSpec(
+                "irx_arrow_table_column_schema",
+                _declare_table_column_schema,
+            ),
+            "irx_arrow_table_num_chunks": ExternalSymbolSpec(
+                "irx_arrow_table_num_chunks",
+                _declare_table_num_chunks,
+            ),
+            "irx_arrow_table_borrow_chunk": ExternalSymbolSpec(
+                "irx_arrow_table_borrow_chunk",
+                _declare_table_borrow_chunk,
+            ),
+            "irx_arrow_table_slice": ExternalSymbolSpec(
+                "irx_arrow_table_slice",
+                _declare_table_slice,
+            ),
+            "irx_arrow_table_retain": ExternalSymbolSpec(
+                "irx_arrow_table_retain",
+                _declare_table_retain,
+            ),
+            "irx_arrow_table_release": ExternalSymbolSpec(
+                "irx_arrow_table_release",
+                _declare_table_release,
+            ),
+            "irx_arrow_last_error": ExternalSymbolSpec(
+                "irx_arrow_last_error",
+                _declare_last_error,
+            ),
+        },
+        artifacts=tuple(artifacts),
+        metadata={
+            "opaque_handles": {
+                "record_batch": "irx_arrow_record_batch_handle",
+                "table": "irx_arrow_table_handle",
+                "array": "irx_arrow_array_handle",
+                "schema": "irx_arrow_schema_handle",
+            },
+            "canonical_name": "record_batch",
+            "borrowed_columns": True,
+            "zero_copy_slices": True,
+            **arrowcpp_runtime_metadata(),
+        },
+        linker_flags=arrowcpp_linker_flags(),
+    )
+
+
+@typechecked
+def _declare_function(
+    visitor: VisitorProtocol,
+    name: str,
+    return_type: ir.Type,
+    arg_types: list[ir.Type],
+) -> ir.Function:
+    """
+    title: Declare one record batch runtime symbol.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+      name:
+        type: str
+      return_type:
+        type: ir.Type
+      arg_types:
+        type: list[ir.Type]
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(return_type, arg_types)
+    return declare_external_function(visitor._llvm.module, name, fn_type)
+
+
+@typechecked
+def _declare_record_batch_make(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare record batch construction from named arrays.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_make",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer().as_pointer(),
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_record_batch_num_rows(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare record batch row count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_num_rows",
+        visitor._llvm.INT64_TYPE,
+        [visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_record_batch_num_columns(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare record batch column count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_num_columns",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_record_batch_column_index(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare record batch column lookup by name.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_column_index",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_record_batch_column_schema(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare record batch column schema copy.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_column_schema",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_record_batch_borrow_column(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare record batch column borrow.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_borrow_column",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_record_batch_slice(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare zero-copy record batch slicing.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_slice",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_record_batch_retain(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare record batch retain.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_retain",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_record_batch_release(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare record batch release.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_record_batch_release",
+        visitor._llvm.VOID_TYPE,
+        [visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_table_from_record_batches(
+    visitor: VisitorProtocol,
+) -> ir.Function:
+    """
+    title: Declare table construction from record batches.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_from_record_batches",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.ARROW_RECORD_BATCH_HANDLE_TYPE.as_pointer(),
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_table_num_rows(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table row count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_num_rows",
+        visitor._llvm.INT64_TYPE,
+        [visitor._llvm.ARROW_TABLE_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_table_num_columns(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table column count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_num_columns",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARROW_TABLE_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_table_column_index(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table column lookup by name.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_column_index",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE,
+            visitor._llvm.INT8_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_table_column_schema(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table column schema copy.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_column_schema",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_table_num_chunks(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table column chunk count.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_num_chunks",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+        ],
+    )
+
+
+@typechecked
+def _declare_table_borrow_chunk(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table column chunk borrow.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_borrow_chunk",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.ARRAY_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_table_slice(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare zero-copy table slicing.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_slice",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.ARROW_TABLE_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
+@typechecked
+def _declare_table_retain(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table retain.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_retain",
+        visitor._llvm.INT32_TYPE,
+        [visitor._llvm.ARROW_TABLE_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_table_release(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare table release.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_table_release",
+        visitor._llvm.VOID_TYPE,
+        [visitor._llvm.ARROW_TABLE_HANDLE_TYPE],
+    )
+
+
+@typechecked
+def _declare_last_error(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow last error.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_last_error",
+        visitor._llvm.OPAQUE_POINTER_TYPE,
+        [],
+    )
+
+
+__all__ = ["build_record_batch_runtime_feature"]
@@ -9,15 +9,30 @@ from typing import TYPE_CHECKING, Iterable
 
 from llvmlite import ir
 
+from irx.builder.runtime.arena.feature import build_arena_runtime_feature
 from irx.builder.runtime.array.feature import build_array_runtime_feature
+from irx.builder.runtime.arrow_ipc.feature import (
+    build_arrow_ipc_runtime_feature,
+)
 from irx.builder.runtime.assertions.feature import (
     build_assertions_runtime_feature,
 )
 from irx.builder.runtime.buffer.feature import build_buffer_runtime_feature
+from irx.builder.runtime.compute.feature import (
+    build_compute_runtime_feature,
+)
 from irx.builder.runtime.feature_libc import build_libc_runtime_feature
 from irx.builder.runtime.feature_libm import build_libm_runtime_feature
 from irx.builder.runtime.features import NativeArtifact, RuntimeFeature
 from irx.builder.runtime.list.feature import build_list_runtime_feature
+from irx.builder.runtime.parallel.feature import (
+    build_parallel_runtime_feature,
+)
+from irx.builder.runtime.print.feature import build_print_runtime_feature
+from irx.builder.runtime.record_batch.feature import (
+    build_record_batch_runtime_feature,
+)
+from irx.builder.runtime.string.feature import build_string_runtime_feature
 from irx.builder.runtime.tensor.feature import build_tensor_runtime_feature
 from irx.diagnostics import (
     Diagnostic,
@@ -300,5 +315,12 @@ def get_default_runtime_feature_registry() -> RuntimeFeatureRegistry:
     registry.register(build_buffer_runtime_feature())
     registry.register(build_array_runtime_feature())
     registry.register(build_tensor_runtime_feature())
+    registry.register(build_record_batch_runtime_feature())
+    registry.register(build_compute_runtime_feature())
+    registry.register(build_arrow_ipc_runtime_feature())
     registry.register(build_list_runtime_feature())
+    registry.register(build_arena_runtime_feature())
+    registry.register(build_parallel_runtime_feature())
+    registry.register(build_string_runtime_feature())
+    registry.register(build_print_runtime_feature())
     return registry
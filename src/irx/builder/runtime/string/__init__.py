@@ -0,0 +1,7 @@
+"""
+title: Length-prefixed string runtime feature support for IRx.
+"""
+
+from irx.builder.runtime.string.feature import build_string_runtime_feature
+
+__all__ = ["build_string_runtime_feature"]
@@ -0,0 +1,435 @@
+"""
+title: Length-prefixed string runtime feature declarations.
+summary: >-
+  Declares the native string runtime. IRx strings keep a small header with
+  their byte length immediately before the first character, so length and
+  equality are O(1)/memcmp operations and concatenation copies each operand
+  once, while the value itself remains a NUL-terminated i8* at FFI
+  boundaries.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llvmlite import ir
+
+from irx.builder.runtime.features import (
+    ExternalSymbolSpec,
+    NativeArtifact,
+    RuntimeFeature,
+    declare_external_function,
+)
+from irx.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from irx.builder.protocols import VisitorProtocol
+
+STRING_HEADER_MAGIC = 0x49525853
+STRING_HEADER_BYTES = 16
+STRING_FLAG_STATIC = 1
+STRING_FLAG_HEAP = 2
+
+
+@typechecked
+def build_string_runtime_feature() -> RuntimeFeature:
+    """
+    title: Build the string runtime feature specification.
+    returns:
+      type: RuntimeFeature
+    """
+    native_root = Path(__file__).resolve().parent / "native"
+    symbols = {
+        "irx_string_from_cstr": ExternalSymbolSpec(
+            "irx_string_from_cstr",
+            _declare_string_from_cstr,
+        ),
+        "irx_string_from_bytes": ExternalSymbolSpec(
+            "irx_string_from_bytes",
+            _declare_string_from_bytes,
+        ),
+        "irx_string_adopt_cstr": ExternalSymbolSpec(
+            "irx_string_adopt_cstr",
+            _declare_string_adopt_cstr,
+        ),
+        "irx_string_reserve": ExternalSymbolSpec(
+            "irx_string_reserve",
+            _declare_string_reserve,
+        ),
+        "irx_string_length": ExternalSymbolSpec(
+            "irx_string_length",
+            _declare_string_length,
+        ),
+        "irx_string_concat": ExternalSymbolSpec(
+            "irx_string_concat",
+            _declare_string_concat,
+        ),
+        "irx_string_equals": ExternalSymbolSpec(
+            "irx_string_equals",
+            _declare_string_equals,
+        ),
+        "irx_string_substring": ExternalSymbolSpec(
+            "irx_string_substring",
+            _declare_string_substring,
+        ),
+        "irx_string_free": ExternalSymbolSpec(
+            "irx_string_free",
+            _declare_string_free,
+        ),
+        "irx_string_builder_new": ExternalSymbolSpec(
+            "irx_string_builder_new",
+            _declare_string_builder_new,
+        ),
+        "irx_string_builder_append": ExternalSymbolSpec(
+            "irx_string_builder_append",
+            _declare_string_builder_append,
+        ),
+        "irx_string_builder_length": ExternalSymbolSpec(
+            "irx_string_builder_length",
+            _declare_string_builder_length,
+        ),
+        "irx_string_builder_finish": ExternalSymbolSpec(
+            "irx_string_builder_finish",
+            _declare_string_builder_finish,
+        ),
+    }
+    return RuntimeFeature(
+        name="string",
+        symbols=symbols,
+        artifacts=(
+            NativeArtifact(
+                kind="c_source",
+                path=native_root / "irx_string_runtime.c",
+                include_dirs=(native_root,),
+                compile_flags=("-std=c99",),
+            ),
+        ),
+        metadata={
+            "canonical_name": "string",
+            "symbols": tuple(symbols),
+            "opaque_handles": {"string_builder": "irx_string_builder"},
+            "header_bytes": STRING_HEADER_BYTES,
+            "header_magic": STRING_HEADER_MAGIC,
+            "encoding": "utf-8 bytes, NUL-terminated",
+            "limitations": (
+                "lengths and substring offsets count bytes, not code points",
+                "heap strings are not reclaimed automatically",
+            ),
+        },
+    )
+
+
+@typechecked
+def _string_type(visitor: VisitorProtocol) -> ir.Type:
+    """
+    title: Return the lowered string value type.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Type
+    """
+    return visitor._llvm.ASCII_STRING_TYPE
+
+
+@typechecked
+def _builder_handle_type(visitor: VisitorProtocol) -> ir.Type:
+    """
+    title: Return the opaque string-builder handle type.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Type
+    """
+    return visitor._llvm.OPAQUE_POINTER_TYPE
+
+
+@typechecked
+def _declare_string_from_cstr(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string from cstr.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [_string_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_from_cstr",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_from_bytes(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string from bytes.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [
+            _string_type(visitor),
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_from_bytes",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_adopt_cstr(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string adopt cstr.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [_string_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_adopt_cstr",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_reserve(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string reserve.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [visitor._llvm.INT64_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_reserve",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_length(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string length.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT64_TYPE,
+        [_string_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_length",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_concat(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string concat.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [
+            _string_type(visitor),
+            _string_type(visitor),
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_concat",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_equals(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string equals.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT32_TYPE,
+        [
+            _string_type(visitor),
+            _string_type(visitor),
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_equals",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_substring(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string substring.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [
+            _string_type(visitor),
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_substring",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_free(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string free.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [_string_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_free",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_builder_new(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string builder new.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _builder_handle_type(visitor),
+        [visitor._llvm.INT64_TYPE],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_builder_new",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_builder_append(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string builder append.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.VOID_TYPE,
+        [
+            _builder_handle_type(visitor),
+            _string_type(visitor),
+        ],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_builder_append",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_builder_length(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string builder length.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        visitor._llvm.INT64_TYPE,
+        [_builder_handle_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_builder_length",
+        fn_type,
+    )
+
+
+@typechecked
+def _declare_string_builder_finish(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare string builder finish.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    fn_type = ir.FunctionType(
+        _string_type(visitor),
+        [_builder_handle_type(visitor)],
+    )
+    return declare_external_function(
+        visitor._llvm.module,
+        "irx_string_builder_finish",
+        fn_type,
+    )
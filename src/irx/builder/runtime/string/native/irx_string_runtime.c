@@ -0,0 +1,221 @@
+#include "irx_string_runtime.h"
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define IRX_STRING_HEADER_BYTES ((int64_t)sizeof(irx_string_header))
+#define IRX_STRING_BUILDER_MIN_CAPACITY 32
+
+struct irx_string_builder {
+  irx_string_header* storage;
+  int64_t length;
+  int64_t capacity;
+};
+
+static const struct {
+  irx_string_header header;
+  char data[1];
+} irx_string_empty = {{0, IRX_STRING_MAGIC, IRX_STRING_FLAG_STATIC}, {0}};
+
+static void irx_string_fail(const char* message) {
+  fprintf(stderr, "%s\n", message);
+  exit(1);
+}
+
+static const irx_string_header* irx_string_header_of(const char* value) {
+  return (const irx_string_header*)(value - IRX_STRING_HEADER_BYTES);
+}
+
+static char* irx_string_payload(irx_string_header* header) {
+  return (char*)header + IRX_STRING_HEADER_BYTES;
+}
+
+static irx_string_header* irx_string_allocate(int64_t length) {
+  irx_string_header* header = (irx_string_header*)malloc(
+      (size_t)(IRX_STRING_HEADER_BYTES + length + 1));
+  if (header == NULL) {
+    irx_string_fail("irx_string: out of memory");
+  }
+  header->length = length;
+  header->magic = IRX_STRING_MAGIC;
+  header->flags = IRX_STRING_FLAG_HEAP;
+  irx_string_payload(header)[length] = '\0';
+  return header;
+}
+
+int64_t irx_string_length(const char* value) {
+  if (value == NULL) {
+    return 0;
+  }
+  return irx_string_header_of(value)->length;
+}
+
+char* irx_string_reserve(int64_t length) {
+  if (length < 0) {
+    length = 0;
+  }
+  return irx_string_payload(irx_string_allocate(length));
+}
+
+const char* irx_string_from_bytes(const char* data, int64_t length) {
+  irx_string_header* header;
+  if (length <= 0) {
+    return irx_string_empty.data;
+  }
+  header = irx_string_allocate(length);
+  memcpy(irx_string_payload(header), data, (size_t)length);
+  return irx_string_payload(header);
+}
+
+const char* irx_string_from_cstr(const char* text) {
+  if (text == NULL) {
+    return irx_string_empty.data;
+  }
+  return irx_string_from_bytes(text, (int64_t)strlen(text));
+}
+
+const char* irx_string_adopt_cstr(char* text) {
+  const char* result = irx_string_from_cstr(text);
+  free(text);
+  return result;
+}
+
+const char* irx_string_concat(const char* lhs, const char* rhs) {
+  int64_t lhs_length = irx_string_length(lhs);
+  int64_t rhs_length = irx_string_length(rhs);
+  irx_string_header* header;
+  char* payload;
+
+  if (lhs_length + rhs_length == 0) {
+    return irx_string_empty.data;
+  }
+  header = irx_string_allocate(lhs_length + rhs_length);
+  payload = irx_string_payload(header);
+  if (lhs_length > 0) {
+    memcpy(payload, lhs, (size_t)lhs_length);
+  }
+  if (rhs_length > 0) {
+    memcpy(payload + lhs_length, rhs, (size_t)rhs_length);
+  }
+  return payload;
+}
+
+int32_t irx_string_equals(const char* lhs, const char* rhs) {
+  int64_t length;
+  if (lhs == rhs) {
+    return 1;
+  }
+  length = irx_string_length(lhs);
+  if (length != irx_string_length(rhs)) {
+    return 0;
+  }
+  if (length == 0) {
+    return 1;
+  }
+  return memcmp(lhs, rhs, (size_t)length) == 0;
+}
+
+const char* irx_string_substring(
+    const char* value,
+    int64_t start,
+    int64_t end) {
+  int64_t length = irx_string_length(value);
+  if (start < 0) {
+    start += length;
+  }
+  if (end < 0) {
+    end += length;
+  }
+  if (start < 0) {
+    start = 0;
+  }
+  if (end > length) {
+    end = length;
+  }
+  if (start >= end) {
+    return irx_string_empty.data;
+  }
+  return irx_string_from_bytes(value + start, end - start);
+}
+
+void irx_string_free(const char* value) {
+  const irx_string_header* header;
+  if (value == NULL) {
+    return;
+  }
+  header = irx_string_header_of(value);
+  if ((header->flags & IRX_STRING_FLAG_HEAP) == 0) {
+    return;
+  }
+  free((void*)header);
+}
+
+static void irx_string_builder_reserve(
+    irx_string_builder* builder,
+    int64_t required) {
+  int64_t capacity = builder->capacity;
+  irx_string_header* storage;
+
+  if (required <= capacity) {
+    return;
+  }
+  if (capacity < IRX_STRING_BUILDER_MIN_CAPACITY) {
+    capacity = IRX_STRING_BUILDER_MIN_CAPACITY;
+  }
+  while (capacity < required) {
+    capacity *= 2;
+  }
+  storage = (irx_string_header*)realloc(
+      builder->storage,
+      (size_t)(IRX_STRING_HEADER_BYTES + capacity + 1));
+  if (storage == NULL) {
+    irx_string_fail("irx_string_builder: out of memory");
+  }
+  builder->storage = storage;
+  builder->capacity = capacity;
+}
+
+irx_string_builder* irx_string_builder_new(int64_t capacity_hint) {
+  irx_string_builder* builder =
+      (irx_string_builder*)malloc(sizeof(irx_string_builder));
+  if (builder == NULL) {
+    irx_string_fail("irx_string_builder: out of memory");
+  }
+  builder->storage = NULL;
+  builder->length = 0;
+  builder->capacity = 0;
+  irx_string_builder_reserve(builder, capacity_hint > 0 ? capacity_hint : 1);
+  return builder;
+}
+
+void irx_string_builder_append(
+    irx_string_builder* builder,
+    const char* value) {
+  int64_t length = irx_string_length(value);
+  if (length == 0) {
+    return;
+  }
+  irx_string_builder_reserve(builder, builder->length + length);
+  memcpy(
+      irx_string_payload(builder->storage) + builder->length,
+      value,
+      (size_t)length);
+  builder->length += length;
+}
+
+int64_t irx_string_builder_length(const irx_string_builder* builder) {
+  return builder->length;
+}
+
+const char* irx_string_builder_finish(irx_string_builder* builder) {
+  irx_string_header* header = builder->storage;
+  header->length = builder->length;
+  header->magic = IRX_STRING_MAGIC;
+  header->flags = IRX_STRING_FLAG_HEAP;
+  irx_string_payload(header)[builder->length] = '\0';
+  free(builder);
+  return irx_string_payload(header);
+}
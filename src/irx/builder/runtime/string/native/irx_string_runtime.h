@@ -0,0 +1,62 @@
+#ifndef IRX_STRING_RUNTIME_H
+#define IRX_STRING_RUNTIME_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define IRX_STRING_MAGIC 0x49525853u
+#define IRX_STRING_FLAG_STATIC 1u
+#define IRX_STRING_FLAG_HEAP 2u
+
+/*
+ * IRx strings are NUL-terminated byte pointers with a fixed header stored
+ * immediately before the first byte. The header carries the byte length so
+ * length, equality, and concatenation never rescan the payload, while the
+ * value itself stays an ordinary `const char*` for C callers. Apart from the
+ * from/adopt constructors, every function below requires its string
+ * arguments to carry the header; convert foreign C strings with
+ * irx_string_from_cstr first. The magic field only tags the layout for
+ * debuggers and is never probed.
+ */
+typedef struct irx_string_header {
+  int64_t length;
+  uint32_t magic;
+  uint32_t flags;
+} irx_string_header;
+
+typedef struct irx_string_builder irx_string_builder;
+
+const char* irx_string_from_cstr(const char* text);
+const char* irx_string_from_bytes(const char* data, int64_t length);
+const char* irx_string_adopt_cstr(char* text);
+/* Allocate a heap string of `length` bytes for the caller to fill in. */
+char* irx_string_reserve(int64_t length);
+int64_t irx_string_length(const char* value);
+const char* irx_string_concat(const char* lhs, const char* rhs);
+int32_t irx_string_equals(const char* lhs, const char* rhs);
+const char* irx_string_substring(
+    const char* value,
+    int64_t start,
+    int64_t end);
+void irx_string_free(const char* value);
+
+/*
+ * Builders grow geometrically, so appending N pieces costs O(total bytes)
+ * instead of one allocation and copy per intermediate result. Finishing a
+ * builder hands its buffer over as a regular IRx string.
+ */
+irx_string_builder* irx_string_builder_new(int64_t capacity_hint);
+void irx_string_builder_append(
+    irx_string_builder* builder,
+    const char* value);
+int64_t irx_string_builder_length(const irx_string_builder* builder);
+const char* irx_string_builder_finish(irx_string_builder* builder);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
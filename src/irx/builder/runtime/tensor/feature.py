@@ -74,6 +74,10 @@ def build_tensor_runtime_feature() -> RuntimeFeature:
                 "irx_arrow_tensor_builder_append_double",
                 _declare_tensor_builder_append_double,
             ),
+            "irx_arrow_tensor_builder_append_n": ExternalSymbolSpec(
+                "irx_arrow_tensor_builder_append_n",
+                _declare_tensor_builder_append_n,
+            ),
             "irx_arrow_tensor_builder_finish": ExternalSymbolSpec(
                 "irx_arrow_tensor_builder_finish",
                 _declare_tensor_builder_finish,
@@ -82,6 +86,10 @@ def build_tensor_runtime_feature() -> RuntimeFeature:
                 "irx_arrow_tensor_builder_release",
                 _declare_tensor_builder_release,
             ),
+            "irx_arrow_tensor_wrap_buffer": ExternalSymbolSpec(
+                "irx_arrow_tensor_wrap_buffer",
+                _declare_tensor_wrap_buffer,
+            ),
             "irx_arrow_tensor_type_id": ExternalSymbolSpec(
                 "irx_arrow_tensor_type_id",
                 _declare_tensor_type_id,
@@ -259,6 +267,28 @@ def _declare_tensor_builder_append_double(
     )
 
 
+@typechecked
+def _declare_tensor_builder_append_n(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow tensor builder bulk append.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_tensor_builder_append_n",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.TENSOR_BUILDER_HANDLE_TYPE,
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+        ],
+    )
+
+
 @typechecked
 def _declare_tensor_builder_finish(visitor: VisitorProtocol) -> ir.Function:
     """
@@ -280,6 +310,32 @@ def _declare_tensor_builder_finish(visitor: VisitorProtocol) -> ir.Function:
     )
 
 
+@typechecked
+def _declare_tensor_wrap_buffer(visitor: VisitorProtocol) -> ir.Function:
+    """
+    title: Declare Arrow tensor wrap buffer.
+    parameters:
+      visitor:
+        type: VisitorProtocol
+    returns:
+      type: ir.Function
+    """
+    return _declare_function(
+        visitor,
+        "irx_arrow_tensor_wrap_buffer",
+        visitor._llvm.INT32_TYPE,
+        [
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT32_TYPE,
+            visitor._llvm.INT64_TYPE.as_pointer(),
+            visitor._llvm.INT64_TYPE.as_pointer(),
+            visitor._llvm.OPAQUE_POINTER_TYPE,
+            visitor._llvm.INT64_TYPE,
+            visitor._llvm.TENSOR_HANDLE_TYPE.as_pointer(),
+        ],
+    )
+
+
 @typechecked
 def _declare_tensor_builder_release(visitor: VisitorProtocol) -> ir.Function:
     """
@@ -35,9 +35,113 @@ class LoopTargets:
     cleanup_depth: int = 0
 
 
+@typechecked
+@dataclass
+class FusedGeneratorTargets:
+    """
+    title: Lowering targets for one generator fused into its consuming loop.
+    summary: >-
+      Yield sites store into the loop's element slot and jump straight to the
+      loop body; the loop advance block dispatches back to the recorded resume
+      blocks instead of calling an out-of-line resume function.
+    attributes:
+      symbol_id:
+        type: str
+      yielded_addr:
+        type: ir.Value
+      state_addr:
+        type: ir.Value
+      body_target:
+        type: ir.Block
+      exit_target:
+        type: ir.Block
+      resume_blocks:
+        type: list[ir.Block]
+      cleanup_depth:
+        type: int
+    """
+
+    symbol_id: str
+    yielded_addr: ir.Value
+    state_addr: ir.Value
+    body_target: ir.Block
+    exit_target: ir.Block
+    resume_blocks: list[ir.Block]
+    cleanup_depth: int = 0
+
+
+@typechecked
+@dataclass(frozen=True)
+class HoistedBufferDescriptor:
+    """
+    title: Descriptor fields of one loop-invariant view loaded before a loop.
+    summary: >-
+      strides and shape hold one loaded value per axis, or are empty when
+      every access in the loop folds them from static metadata. The values
+      are only valid inside function, below the preheader that loaded them.
+    attributes:
+      function:
+        type: ir.Function
+      view:
+        type: ir.Value
+      data:
+        type: ir.Value
+      offset_bytes:
+        type: ir.Value
+      strides:
+        type: tuple[ir.Value, Ellipsis]
+      shape:
+        type: tuple[ir.Value, Ellipsis]
+    """
+
+    function: ir.Function
+    view: ir.Value
+    data: ir.Value
+    offset_bytes: ir.Value
+    strides: tuple[ir.Value, ...] = ()
+    shape: tuple[ir.Value, ...] = ()
+
+
+@typechecked
+@dataclass
+class TemporaryArenaScope:
+    """
+    title: One lowered scope whose arena temporaries are recycled together.
+    summary: >-
+      Nothing is emitted when the scope opens. The first temporary carved in
+      it inserts the scope's arena mark right after entry_instruction, or at
+      the start of entry_block when the scope opened on an empty block. The
+      arena handle lives on the function's outermost scope and is fetched
+      once at the start of the function's entry block.
+    attributes:
+      function:
+        type: ir.Function
+      entry_block:
+        type: ir.Block
+      entry_instruction:
+        type: ir.Instruction | None
+      parent:
+        type: TemporaryArenaScope | None
+      arena:
+        type: ir.Value | None
+      mark:
+        type: ir.Value | None
+    """
+
+    function: ir.Function
+    entry_block: ir.Block
+    entry_instruction: ir.Instruction | None
+    parent: TemporaryArenaScope | None = None
+    arena: ir.Value | None = None
+    mark: ir.Value | None = None
+
+
 __all__ = [
     "CleanupEmitter",
+    "FusedGeneratorTargets",
+    "HoistedBufferDescriptor",
     "LoopTargets",
     "NamedValueMap",
     "ResultStackValue",
+    "TemporaryArenaScope",
 ]
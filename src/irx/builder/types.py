@@ -78,6 +78,10 @@ class VariablesLLVM:
     TENSOR_HANDLE_TYPE: ir.types.Type
     ARROW_TENSOR_BUILDER_HANDLE_TYPE: ir.types.Type
     ARROW_TENSOR_HANDLE_TYPE: ir.types.Type
+    ARROW_RECORD_BATCH_HANDLE_TYPE: ir.types.Type
+    ARROW_TABLE_HANDLE_TYPE: ir.types.Type
+    ARROW_IPC_READER_HANDLE_TYPE: ir.types.Type
+    ARROW_IPC_WRITER_HANDLE_TYPE: ir.types.Type
 
     context: ir.context.Context
     module: ir.module.Module
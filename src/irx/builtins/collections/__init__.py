@@ -4,6 +4,7 @@ title: Builtin collection support for IRX.
 
 from irx.builtins.collections.array_primitives import (
     ARRAY_PRIMITIVE_TYPE_SPECS,
+    IRX_ARROW_TYPE_BINARY,
     IRX_ARROW_TYPE_BOOL,
     IRX_ARROW_TYPE_FLOAT32,
     IRX_ARROW_TYPE_FLOAT64,
@@ -11,11 +12,14 @@ from irx.builtins.collections.array_primitives import (
     IRX_ARROW_TYPE_INT16,
     IRX_ARROW_TYPE_INT32,
     IRX_ARROW_TYPE_INT64,
+    IRX_ARROW_TYPE_LARGE_BINARY,
+    IRX_ARROW_TYPE_LARGE_UTF8,
     IRX_ARROW_TYPE_UINT8,
     IRX_ARROW_TYPE_UINT16,
     IRX_ARROW_TYPE_UINT32,
     IRX_ARROW_TYPE_UINT64,
     IRX_ARROW_TYPE_UNKNOWN,
+    IRX_ARROW_TYPE_UTF8,
     ArrayPrimitiveTypeSpec,
 )
 from irx.builtins.collections.list import (
@@ -45,6 +49,7 @@ from irx.builtins.collections.tensor import (
 
 __all__ = [
     "ARRAY_PRIMITIVE_TYPE_SPECS",
+    "IRX_ARROW_TYPE_BINARY",
     "IRX_ARROW_TYPE_BOOL",
     "IRX_ARROW_TYPE_FLOAT32",
     "IRX_ARROW_TYPE_FLOAT64",
@@ -52,11 +57,14 @@ __all__ = [
     "IRX_ARROW_TYPE_INT16",
     "IRX_ARROW_TYPE_INT32",
     "IRX_ARROW_TYPE_INT64",
+    "IRX_ARROW_TYPE_LARGE_BINARY",
+    "IRX_ARROW_TYPE_LARGE_UTF8",
     "IRX_ARROW_TYPE_UINT8",
     "IRX_ARROW_TYPE_UINT16",
     "IRX_ARROW_TYPE_UINT32",
     "IRX_ARROW_TYPE_UINT64",
     "IRX_ARROW_TYPE_UNKNOWN",
+    "IRX_ARROW_TYPE_UTF8",
     "LIST_APPEND_SYMBOL",
     "LIST_AT_SYMBOL",
     "LIST_FIELD_INDICES",
@@ -2,7 +2,8 @@
 title: Shared primitive array storage metadata.
 summary: >-
   Define stable primitive type metadata shared by the builtin Arrow C++ backed
-  array runtime and higher-level Tensor helpers.
+  array runtime and higher-level Tensor helpers, including the variable-width
+  utf8 and binary layouts that only arrays support.
 """
 
 from __future__ import annotations
@@ -36,6 +37,10 @@ IRX_ARROW_TYPE_UINT64 = 8
 IRX_ARROW_TYPE_FLOAT32 = 9
 IRX_ARROW_TYPE_FLOAT64 = 10
 IRX_ARROW_TYPE_BOOL = 11
+IRX_ARROW_TYPE_UTF8 = 12
+IRX_ARROW_TYPE_LARGE_UTF8 = 13
+IRX_ARROW_TYPE_BINARY = 14
+IRX_ARROW_TYPE_LARGE_BINARY = 15
 
 
 @typechecked
@@ -54,6 +59,8 @@ class ArrayPrimitiveTypeSpec:
         type: int | None
       buffer_view_compatible:
         type: bool
+      offset_size_bytes:
+        type: int | None
     """
 
     name: str
@@ -61,6 +68,7 @@ class ArrayPrimitiveTypeSpec:
     dtype_token: int
     element_size_bytes: int | None
     buffer_view_compatible: bool
+    offset_size_bytes: int | None = None
 
 
 ARRAY_PRIMITIVE_TYPE_SPECS = {
@@ -143,12 +151,45 @@ ARRAY_PRIMITIVE_TYPE_SPECS = {
             None,
             False,
         ),
+        ArrayPrimitiveTypeSpec(
+            "utf8",
+            IRX_ARROW_TYPE_UTF8,
+            BUFFER_DTYPE_UINT8,
+            None,
+            False,
+            offset_size_bytes=4,
+        ),
+        ArrayPrimitiveTypeSpec(
+            "large_utf8",
+            IRX_ARROW_TYPE_LARGE_UTF8,
+            BUFFER_DTYPE_UINT8,
+            None,
+            False,
+            offset_size_bytes=8,
+        ),
+        ArrayPrimitiveTypeSpec(
+            "binary",
+            IRX_ARROW_TYPE_BINARY,
+            BUFFER_DTYPE_UINT8,
+            None,
+            False,
+            offset_size_bytes=4,
+        ),
+        ArrayPrimitiveTypeSpec(
+            "large_binary",
+            IRX_ARROW_TYPE_LARGE_BINARY,
+            BUFFER_DTYPE_UINT8,
+            None,
+            False,
+            offset_size_bytes=8,
+        ),
     )
 }
 
 
 __all__ = [
     "ARRAY_PRIMITIVE_TYPE_SPECS",
+    "IRX_ARROW_TYPE_BINARY",
     "IRX_ARROW_TYPE_BOOL",
     "IRX_ARROW_TYPE_FLOAT32",
     "IRX_ARROW_TYPE_FLOAT64",
@@ -156,10 +197,13 @@ __all__ = [
     "IRX_ARROW_TYPE_INT16",
     "IRX_ARROW_TYPE_INT32",
     "IRX_ARROW_TYPE_INT64",
+    "IRX_ARROW_TYPE_LARGE_BINARY",
+    "IRX_ARROW_TYPE_LARGE_UTF8",
     "IRX_ARROW_TYPE_UINT8",
     "IRX_ARROW_TYPE_UINT16",
     "IRX_ARROW_TYPE_UINT32",
     "IRX_ARROW_TYPE_UINT64",
     "IRX_ARROW_TYPE_UNKNOWN",
+    "IRX_ARROW_TYPE_UTF8",
     "ArrayPrimitiveTypeSpec",
 ]
@@ -7,6 +7,7 @@ summary: >-
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 
@@ -22,6 +23,9 @@ from irx.buffer import (
     BufferViewMetadata,
     buffer_dtype_handle,
     buffer_view_flags,
+    buffer_view_has_validity_bitmap,
+    buffer_view_is_readonly,
+    buffer_view_ownership,
 )
 from irx.builtins.collections.array_primitives import (
     ARRAY_PRIMITIVE_TYPE_SPECS,
@@ -258,6 +262,307 @@ def tensor_byte_bounds(
     return minimum, maximum
 
 
+@public
+@typechecked
+def tensor_slice_layout(
+    layout: TensorLayout,
+    items: Sequence[slice | int],
+) -> TensorLayout:
+    """
+    title: Return the layout of one strided sub-view of a static layout.
+    summary: >-
+      Each item selects along one leading axis. A slice keeps the axis with
+      start, stop, and a positive step; an integer selects one position and
+      drops the axis. Axes without an item are kept whole. Only shape,
+      strides, and offset_bytes change, so the view shares the base storage.
+    parameters:
+      layout:
+        type: TensorLayout
+      items:
+        type: Sequence[slice | int]
+    returns:
+      type: TensorLayout
+    """
+    if len(items) > layout.ndim:
+        raise ValueError("tensor slice has more items than the base rank")
+
+    shape: list[int] = []
+    strides: list[int] = []
+    offset_bytes = layout.offset_bytes
+    for axis, (dim, stride) in enumerate(
+        zip(layout.shape, layout.strides, strict=True)
+    ):
+        item = items[axis] if axis < len(items) else slice(None)
+        if isinstance(item, int):
+            if item < 0 or item >= dim:
+                raise ValueError(
+                    f"tensor slice index {item} is out of bounds for axis "
+                    f"{axis} with extent {dim}"
+                )
+            offset_bytes += item * stride
+            continue
+
+        start = 0 if item.start is None else item.start
+        stop = dim if item.stop is None else item.stop
+        step = 1 if item.step is None else item.step
+        if not all(isinstance(bound, int) for bound in (start, stop, step)):
+            raise ValueError("tensor slice bounds must be static integers")
+        if step <= 0:
+            raise ValueError("tensor slice steps must be positive")
+        if start < 0 or stop > dim or start > stop:
+            raise ValueError(
+                f"tensor slice {start}:{stop} is out of bounds for axis "
+                f"{axis} with extent {dim}"
+            )
+        shape.append((stop - start + step - 1) // step)
+        strides.append(stride * step)
+        offset_bytes += start * stride
+
+    return TensorLayout(
+        shape=tuple(shape),
+        strides=tuple(strides),
+        offset_bytes=offset_bytes,
+    )
+
+
+@public
+@typechecked
+def tensor_transpose_layout(
+    layout: TensorLayout,
+    axes: Sequence[int] | None = None,
+) -> TensorLayout:
+    """
+    title: Return the layout of one axis permutation of a static layout.
+    summary: >-
+      None reverses the axes, which turns a C-contiguous layout into an
+      F-contiguous one and vice versa.
+    parameters:
+      layout:
+        type: TensorLayout
+      axes:
+        type: Sequence[int] | None
+    returns:
+      type: TensorLayout
+    """
+    order = (
+        tuple(range(layout.ndim - 1, -1, -1)) if axes is None else tuple(axes)
+    )
+    if sorted(order) != list(range(layout.ndim)):
+        raise ValueError(
+            "tensor transpose axes must be a permutation of the base axes"
+        )
+    return TensorLayout(
+        shape=tuple(layout.shape[axis] for axis in order),
+        strides=tuple(layout.strides[axis] for axis in order),
+        offset_bytes=layout.offset_bytes,
+    )
+
+
+@public
+@typechecked
+def tensor_reshape_layout(
+    layout: TensorLayout,
+    shape: Sequence[int],
+    item_size_bytes: int,
+) -> TensorLayout:
+    """
+    title: Return the C-order reshape of a static layout without copying.
+    summary: >-
+      At most one dimension may be -1 and is inferred from the element count.
+      The base does not have to be contiguous: every run of base axes merged
+      into new axes only has to be contiguous with itself, the same rule
+      NumPy uses to reshape without a copy.
+    parameters:
+      layout:
+        type: TensorLayout
+      shape:
+        type: Sequence[int]
+      item_size_bytes:
+        type: int
+    returns:
+      type: TensorLayout
+    """
+    count = tensor_element_count(layout)
+    new_shape = list(shape)
+    inferred = [axis for axis, dim in enumerate(new_shape) if dim == -1]
+    if len(inferred) > 1 or any(dim < -1 for dim in new_shape):
+        raise ValueError(
+            "tensor reshape dimensions must be non-negative with at most one "
+            "inferred -1"
+        )
+    if inferred:
+        known = _shape_extent(tuple(dim for dim in new_shape if dim != -1))
+        if known == 0 or count % known != 0:
+            raise ValueError(
+                "tensor reshape cannot infer a dimension for this shape"
+            )
+        new_shape[inferred[0]] = count // known
+    if _shape_extent(tuple(new_shape)) != count:
+        raise ValueError(
+            "tensor reshape views require the same element count as the base"
+        )
+    if count == 0:
+        return TensorLayout(
+            shape=tuple(new_shape),
+            strides=tensor_default_strides(tuple(new_shape), item_size_bytes),
+            offset_bytes=layout.offset_bytes,
+        )
+
+    old = [
+        (dim, stride)
+        for dim, stride in zip(layout.shape, layout.strides, strict=True)
+        if dim != 1
+    ]
+    new_strides = [0] * len(new_shape)
+    old_axis, old_end = 0, 1
+    new_axis, new_end = 0, 1
+    while new_axis < len(new_shape) and old_axis < len(old):
+        new_extent = new_shape[new_axis]
+        old_extent = old[old_axis][0]
+        while new_extent != old_extent:
+            if new_extent < old_extent:
+                new_extent *= new_shape[new_end]
+                new_end += 1
+            else:
+                old_extent *= old[old_end][0]
+                old_end += 1
+        for axis in range(old_axis, old_end - 1):
+            if old[axis][1] != old[axis + 1][0] * old[axis + 1][1]:
+                raise ValueError(
+                    "tensor reshape would need a copy because merged axes "
+                    "are not contiguous"
+                )
+        new_strides[new_end - 1] = old[old_end - 1][1]
+        for axis in range(new_end - 1, new_axis, -1):
+            new_strides[axis - 1] = new_strides[axis] * new_shape[axis]
+        new_axis, new_end = new_end, new_end + 1
+        old_axis, old_end = old_end, old_end + 1
+
+    trailing = new_strides[new_axis - 1] if new_axis else item_size_bytes
+    for axis in range(new_axis, len(new_shape)):
+        new_strides[axis] = trailing
+    return TensorLayout(
+        shape=tuple(new_shape),
+        strides=tuple(new_strides),
+        offset_bytes=layout.offset_bytes,
+    )
+
+
+@public
+@typechecked
+def tensor_broadcast_shape(*shapes: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    title: Return the shape that static Tensor shapes broadcast to.
+    summary: >-
+      Shapes are aligned at their trailing axis. Each result extent is the
+      common extent of the aligned axes, where an extent of 1 stretches to
+      match the others, following the NumPy broadcasting rules.
+    parameters:
+      shapes:
+        type: tuple[int, Ellipsis]
+        variadic: positional
+    returns:
+      type: tuple[int, Ellipsis]
+    """
+    ndim = max((len(shape) for shape in shapes), default=0)
+    result: list[int] = []
+    for axis in range(ndim):
+        extents = {
+            shape[axis - ndim + len(shape)]
+            for shape in shapes
+            if axis - ndim + len(shape) >= 0
+        }
+        extents.discard(1)
+        if len(extents) > 1:
+            raise ValueError(
+                "tensor shapes "
+                + ", ".join(str(shape) for shape in shapes)
+                + " cannot be broadcast together"
+            )
+        result.append(extents.pop() if extents else 1)
+    return tuple(result)
+
+
+@public
+@typechecked
+def tensor_matmul_shape(
+    lhs: tuple[int, ...],
+    rhs: tuple[int, ...],
+) -> tuple[int, ...]:
+    """
+    title: Return the shape of a matrix product of two static shapes.
+    summary: >-
+      Operands are vectors or matrices. As in NumPy, a vector operand acts
+      as a row on the left or a column on the right and its unit axis is
+      dropped from the result, so the product of two vectors has shape ().
+    parameters:
+      lhs:
+        type: tuple[int, Ellipsis]
+      rhs:
+        type: tuple[int, Ellipsis]
+    returns:
+      type: tuple[int, Ellipsis]
+    """
+    if len(lhs) not in {1, 2} or len(rhs) not in {1, 2}:
+        raise ValueError(
+            f"tensor matmul operands must have rank 1 or 2, got {lhs} and "
+            f"{rhs}"
+        )
+    if lhs[-1] != rhs[0]:
+        raise ValueError(
+            f"tensor matmul inner extents {lhs[-1]} and {rhs[0]} of shapes "
+            f"{lhs} and {rhs} do not match"
+        )
+    return lhs[:-1] + rhs[1:]
+
+
+@public
+@typechecked
+def tensor_view_flags(
+    base_flags: int | None,
+    layout: TensorLayout,
+    item_size_bytes: int | None,
+) -> int:
+    """
+    title: Return the flags of one view derived from a base view.
+    summary: >-
+      Ownership, mutability, and the validity sidecar carry over from the
+      base; contiguity is recomputed from the view layout. A base without
+      static flags is treated as a readonly external owner.
+    parameters:
+      base_flags:
+        type: int | None
+      layout:
+        type: TensorLayout
+      item_size_bytes:
+        type: int | None
+    returns:
+      type: int
+    """
+    ownership = BufferOwnership.EXTERNAL_OWNER
+    mutability = BufferMutability.READONLY
+    if base_flags is not None:
+        ownership = buffer_view_ownership(base_flags) or ownership
+        if not buffer_view_is_readonly(base_flags):
+            mutability = BufferMutability.WRITABLE
+
+    flags = buffer_view_flags(
+        ownership,
+        mutability,
+        c_contiguous=(
+            item_size_bytes is not None
+            and tensor_is_c_contiguous(layout, item_size_bytes)
+        ),
+        f_contiguous=(
+            item_size_bytes is not None
+            and tensor_is_f_contiguous(layout, item_size_bytes)
+        ),
+    )
+    if base_flags is not None and buffer_view_has_validity_bitmap(base_flags):
+        flags |= BUFFER_FLAG_VALIDITY_BITMAP
+    return flags
+
+
 @public
 @typechecked
 def tensor_primitive_type_name(type_: astx.DataType | None) -> str | None:
@@ -412,6 +717,7 @@ __all__ = [
     "TENSOR_LAYOUT_EXTRA",
     "TensorLayout",
     "TensorOrder",
+    "tensor_broadcast_shape",
     "tensor_buffer_dtype",
     "tensor_buffer_view_metadata",
     "tensor_byte_bounds",
@@ -421,6 +727,11 @@ __all__ = [
     "tensor_element_size_bytes_from_dtype",
     "tensor_is_c_contiguous",
     "tensor_is_f_contiguous",
+    "tensor_matmul_shape",
     "tensor_primitive_type_name",
+    "tensor_reshape_layout",
+    "tensor_slice_layout",
+    "tensor_transpose_layout",
+    "tensor_view_flags",
     "validate_tensor_layout",
 ]
@@ -779,6 +779,7 @@ class DiagnosticCodes:
     LOWERING_INVALID_CONTROL_FLOW = "L011"
     NATIVE_COMPILE_FAILED = "C001"
     LINK_FAILED = "K001"
+    LINK_EXPORT_INVALID = "K002"
     RUNTIME_FEATURE_UNKNOWN = "R001"
     RUNTIME_FEATURE_SYMBOL_MISSING = "R002"
     RUNTIME_ARTIFACT_KIND_INVALID = "R003"
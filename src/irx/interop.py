@@ -0,0 +1,690 @@
+"""
+title: Zero-copy host interop for compiled IRx entry points.
+summary: >-
+  Pass host Python buffers (NumPy arrays, memoryviews, bytearrays, pyarrow
+  arrays) to native IRx code without copying. Buffer-protocol objects and
+  fixed-width pyarrow arrays become canonical irx_buffer_view structs, and
+  any object implementing the Arrow PyCapsule interface becomes an exported
+  ArrowArray/ArrowSchema pointer pair. When a buffer runtime library is given,
+  each view carries an external irx_buffer_owner_handle that pins the host
+  object until the last native reference is released.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import itertools
+
+from collections.abc import Callable
+from types import TracebackType
+
+import pyarrow as pa
+
+from public import public
+
+from irx.buffer import (
+    BUFFER_DTYPE_TOKENS,
+    BUFFER_FLAG_BORROWED,
+    BUFFER_FLAG_C_CONTIGUOUS,
+    BUFFER_FLAG_EXTERNAL_OWNER,
+    BUFFER_FLAG_F_CONTIGUOUS,
+    BUFFER_FLAG_READONLY,
+    BUFFER_FLAG_VALIDITY_BITMAP,
+    BUFFER_FLAG_WRITABLE,
+    BUFFER_VIEW_FIELD_NAMES,
+)
+from irx.typecheck import typechecked
+
+_BUFFER_VIEW_FIELD_TYPES: dict[str, type] = {
+    "data": ctypes.c_void_p,
+    "owner": ctypes.c_void_p,
+    "dtype": ctypes.c_void_p,
+    "ndim": ctypes.c_int32,
+    "shape": ctypes.POINTER(ctypes.c_int64),
+    "strides": ctypes.POINTER(ctypes.c_int64),
+    "offset_bytes": ctypes.c_int64,
+    "flags": ctypes.c_int32,
+}
+
+# Buffer-protocol request flags from CPython's object.h.
+_PYBUF_WRITABLE = 0x0001
+_PYBUF_FORMAT = 0x0004
+_PYBUF_ND = 0x0008
+_PYBUF_STRIDES = 0x0010 | _PYBUF_ND
+
+_SIGNED_FORMATS = frozenset("bhilqn")
+_UNSIGNED_FORMATS = frozenset("BHILQN")
+_FLOAT_FORMATS = {"f": "float32", "d": "float64"}
+_BYTE_ORDER_PREFIXES = "@=<>!"
+
+_ARROW_DTYPE_NAMES = {
+    pa.int8(): "int8",
+    pa.int16(): "int16",
+    pa.int32(): "int32",
+    pa.int64(): "int64",
+    pa.uint8(): "uint8",
+    pa.uint16(): "uint16",
+    pa.uint32(): "uint32",
+    pa.uint64(): "uint64",
+    pa.float32(): "float32",
+    pa.float64(): "float64",
+}
+
+
+@public
+@typechecked
+class BufferViewStruct(ctypes.Structure):
+    """
+    title: ctypes mirror of the canonical irx_buffer_view struct.
+    summary: >-
+      Field order follows BUFFER_VIEW_FIELD_NAMES, so the layout matches the
+      struct generated code and the native runtimes use.
+    """
+
+    _fields_ = [
+        (name, _BUFFER_VIEW_FIELD_TYPES[name])
+        for name in BUFFER_VIEW_FIELD_NAMES
+    ]
+
+
+@typechecked
+class _PyBuffer(ctypes.Structure):
+    """
+    title: ctypes mirror of CPython's Py_buffer.
+    """
+
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("strides", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("suboffsets", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_python_api = ctypes.pythonapi
+_python_api.PyObject_GetBuffer.argtypes = [
+    ctypes.py_object,
+    ctypes.POINTER(_PyBuffer),
+    ctypes.c_int,
+]
+_python_api.PyObject_GetBuffer.restype = ctypes.c_int
+_python_api.PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_python_api.PyBuffer_Release.restype = None
+_python_api.PyCapsule_GetPointer.argtypes = [
+    ctypes.py_object,
+    ctypes.c_char_p,
+]
+_python_api.PyCapsule_GetPointer.restype = ctypes.c_void_p
+
+_OWNER_RELEASE_FN = ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+
+
+@typechecked
+class _PinnedSource:
+    """
+    title: One host object pinned for the lifetime of a native view.
+    attributes:
+      source:
+        type: object
+      py_buffer:
+        type: _PyBuffer | None
+    """
+
+    source: object
+    py_buffer: _PyBuffer | None
+
+    def __init__(
+        self,
+        source: object,
+        py_buffer: _PyBuffer | None = None,
+    ) -> None:
+        """
+        title: Pin one host object.
+        parameters:
+          source:
+            type: object
+          py_buffer:
+            type: _PyBuffer | None
+        """
+        self.source = source
+        self.py_buffer = py_buffer
+
+    def release(self) -> None:
+        """
+        title: Drop the buffer export and the host object reference.
+        """
+        if self.py_buffer is not None:
+            _python_api.PyBuffer_Release(ctypes.byref(self.py_buffer))
+            self.py_buffer = None
+        self.source = None
+
+
+_PINNED_SOURCES: dict[int, _PinnedSource] = {}
+_PIN_TOKENS = itertools.count(1)
+
+
+@typechecked
+def _release_pinned_source(context: int | None) -> None:
+    """
+    title: Release the host object pinned under one owner context token.
+    parameters:
+      context:
+        type: int | None
+    """
+    pinned = _PINNED_SOURCES.pop(context or 0, None)
+    if pinned is not None:
+        pinned.release()
+
+
+_OWNER_RELEASE = _OWNER_RELEASE_FN(_release_pinned_source)
+
+
+@typechecked
+def _configure_buffer_runtime(runtime: ctypes.CDLL) -> None:
+    """
+    title: Set the ctypes signatures of the buffer owner entry points.
+    parameters:
+      runtime:
+        type: ctypes.CDLL
+    """
+    runtime.irx_buffer_owner_external_new.argtypes = [
+        ctypes.c_void_p,
+        _OWNER_RELEASE_FN,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    runtime.irx_buffer_owner_external_new.restype = ctypes.c_int32
+    runtime.irx_buffer_owner_release.argtypes = [ctypes.c_void_p]
+    runtime.irx_buffer_owner_release.restype = ctypes.c_int32
+
+
+@public
+@typechecked
+class HostBufferView:
+    """
+    title: One host object exported as an irx_buffer_view.
+    summary: >-
+      Keeps the view struct, its shape and stride arrays, and the pinned host
+      object together. Without a runtime the view is borrowed and stays valid
+      until release(); with a runtime it holds an external owner, and the host
+      object stays pinned until native code drops its last retain as well.
+    attributes:
+      view:
+        type: BufferViewStruct
+    """
+
+    view: BufferViewStruct
+
+    def __init__(
+        self,
+        pinned: _PinnedSource,
+        *,
+        data: int | None,
+        dtype_token: int,
+        shape: tuple[int, ...],
+        strides: tuple[int, ...],
+        offset_bytes: int,
+        flags: int,
+        runtime: ctypes.CDLL | None = None,
+    ) -> None:
+        """
+        title: Build one view over a pinned host object.
+        parameters:
+          pinned:
+            type: _PinnedSource
+          data:
+            type: int | None
+          dtype_token:
+            type: int
+          shape:
+            type: tuple[int, Ellipsis]
+          strides:
+            type: tuple[int, Ellipsis]
+          offset_bytes:
+            type: int
+          flags:
+            type: int
+          runtime:
+            type: ctypes.CDLL | None
+        """
+        self._runtime = runtime
+        self._shape = (ctypes.c_int64 * max(len(shape), 1))(*shape)
+        self._strides = (ctypes.c_int64 * max(len(strides), 1))(*strides)
+        self._owner = ctypes.c_void_p()
+        self._token = next(_PIN_TOKENS)
+        self._released = False
+        _PINNED_SOURCES[self._token] = pinned
+
+        if runtime is not None:
+            _configure_buffer_runtime(runtime)
+            code = runtime.irx_buffer_owner_external_new(
+                ctypes.c_void_p(self._token),
+                _OWNER_RELEASE,
+                ctypes.byref(self._owner),
+            )
+            if code != 0:
+                _release_pinned_source(self._token)
+                raise RuntimeError("failed to create an external buffer owner")
+            flags |= BUFFER_FLAG_EXTERNAL_OWNER
+        else:
+            flags |= BUFFER_FLAG_BORROWED
+
+        self.view = BufferViewStruct(
+            data=data,
+            owner=self._owner.value,
+            dtype=dtype_token,
+            ndim=len(shape),
+            shape=self._shape,
+            strides=self._strides,
+            offset_bytes=offset_bytes,
+            flags=flags,
+        )
+
+    @property
+    def pointer(self) -> object:
+        """
+        title: Return a pointer to the view struct for native calls.
+        returns:
+          type: object
+        """
+        if self._released:
+            raise ValueError("host buffer view was already released")
+        return ctypes.pointer(self.view)
+
+    @property
+    def released(self) -> bool:
+        """
+        title: Return whether the host side released this view.
+        returns:
+          type: bool
+        """
+        return self._released
+
+    def release(self) -> None:
+        """
+        title: Drop the host reference to the view.
+        summary: >-
+          Borrowed views unpin their source immediately. Owned views release
+          the host's owner reference, so the source stays pinned while native
+          code still retains it.
+        """
+        if self._released:
+            return
+        self._released = True
+        if self._runtime is not None:
+            self._runtime.irx_buffer_owner_release(self._owner)
+        else:
+            _release_pinned_source(self._token)
+
+    def __enter__(self) -> HostBufferView:
+        """
+        title: Enter a scope that releases the view on exit.
+        returns:
+          type: HostBufferView
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        title: Release the view when the scope ends.
+        parameters:
+          exc_type:
+            type: type[BaseException] | None
+          exc:
+            type: BaseException | None
+          traceback:
+            type: TracebackType | None
+        """
+        self.release()
+
+
+@public
+@typechecked
+class HostArrowArray:
+    """
+    title: One host object exported through the Arrow C Data interface.
+    summary: >-
+      Holds the PyCapsules returned by __arrow_c_array__, so the exported
+      ArrowArray and ArrowSchema stay valid until release(). Native code may
+      move them with irx_arrow_array_import_move; the capsules then skip their
+      own release.
+    """
+
+    def __init__(self, source: object) -> None:
+        """
+        title: Export one Arrow PyCapsule producer.
+        parameters:
+          source:
+            type: object
+        """
+        export = getattr(source, "__arrow_c_array__", None)
+        if export is None:
+            raise TypeError(
+                f"{type(source).__name__} does not implement __arrow_c_array__"
+            )
+        self._schema_capsule, self._array_capsule = export()
+        self._schema_address = _python_api.PyCapsule_GetPointer(
+            self._schema_capsule,
+            b"arrow_schema",
+        )
+        self._array_address = _python_api.PyCapsule_GetPointer(
+            self._array_capsule,
+            b"arrow_array",
+        )
+
+    @property
+    def array_address(self) -> int:
+        """
+        title: Return the address of the exported ArrowArray struct.
+        returns:
+          type: int
+        """
+        return int(self._array_address)
+
+    @property
+    def schema_address(self) -> int:
+        """
+        title: Return the address of the exported ArrowSchema struct.
+        returns:
+          type: int
+        """
+        return int(self._schema_address)
+
+    def release(self) -> None:
+        """
+        title: Drop the capsules, releasing any export native code left.
+        """
+        self._schema_capsule = None
+        self._array_capsule = None
+
+    def __enter__(self) -> HostArrowArray:
+        """
+        title: Enter a scope that releases the export on exit.
+        returns:
+          type: HostArrowArray
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        title: Release the export when the scope ends.
+        parameters:
+          exc_type:
+            type: type[BaseException] | None
+          exc:
+            type: BaseException | None
+          traceback:
+            type: TracebackType | None
+        """
+        self.release()
+
+
+@typechecked
+def _format_dtype_name(format_text: str, itemsize: int) -> str:
+    """
+    title: Map one buffer-protocol format string to a dtype name.
+    parameters:
+      format_text:
+        type: str
+      itemsize:
+        type: int
+    returns:
+      type: str
+    """
+    code = format_text.lstrip(_BYTE_ORDER_PREFIXES)
+    if format_text[:1] in {">", "!"}:
+        raise ValueError("big-endian host buffers are not supported")
+    if code == "?":
+        return "bool"
+    if code in _SIGNED_FORMATS and itemsize in {1, 2, 4, 8}:
+        return f"int{itemsize * 8}"
+    if code in _UNSIGNED_FORMATS and itemsize in {1, 2, 4, 8}:
+        return f"uint{itemsize * 8}"
+    if code in _FLOAT_FORMATS:
+        return _FLOAT_FORMATS[code]
+    raise ValueError(f"unsupported host buffer format {format_text!r}")
+
+
+@typechecked
+def _contiguity_flags(
+    shape: tuple[int, ...],
+    strides: tuple[int, ...],
+    itemsize: int,
+) -> int:
+    """
+    title: Return the contiguity flags one strided layout satisfies.
+    parameters:
+      shape:
+        type: tuple[int, Ellipsis]
+      strides:
+        type: tuple[int, Ellipsis]
+      itemsize:
+        type: int
+    returns:
+      type: int
+    """
+    flags = 0
+    for flag, dims in (
+        (BUFFER_FLAG_C_CONTIGUOUS, tuple(zip(shape, strides))[::-1]),
+        (BUFFER_FLAG_F_CONTIGUOUS, tuple(zip(shape, strides))),
+    ):
+        expected = itemsize
+        contiguous = True
+        for extent, stride in dims:
+            if extent != 1 and stride != expected:
+                contiguous = False
+            expected *= extent
+        if contiguous:
+            flags |= flag
+    return flags
+
+
+@typechecked
+def _arrow_buffer_view(
+    source: pa.Array,
+    runtime: ctypes.CDLL | None,
+) -> HostBufferView:
+    """
+    title: Export the value buffer of one fixed-width pyarrow array.
+    parameters:
+      source:
+        type: pa.Array
+      runtime:
+        type: ctypes.CDLL | None
+    returns:
+      type: HostBufferView
+    """
+    dtype_name = _ARROW_DTYPE_NAMES.get(source.type)
+    if dtype_name is None:
+        raise ValueError(
+            f"pyarrow {source.type} arrays cannot be exposed as buffer views; "
+            "pass them through the Arrow C Data interface instead"
+        )
+    validity, values = source.buffers()[:2]
+    itemsize = source.type.bit_width // 8
+    flags = BUFFER_FLAG_READONLY | BUFFER_FLAG_C_CONTIGUOUS
+    if validity is not None:
+        flags |= BUFFER_FLAG_VALIDITY_BITMAP
+    return HostBufferView(
+        _PinnedSource(source),
+        data=None if values is None else values.address,
+        dtype_token=BUFFER_DTYPE_TOKENS[dtype_name],
+        shape=(len(source),),
+        strides=(itemsize,),
+        offset_bytes=source.offset * itemsize,
+        flags=flags,
+        runtime=runtime,
+    )
+
+
+@public
+@typechecked
+def host_buffer_view(
+    source: object,
+    *,
+    writable: bool | None = None,
+    runtime: ctypes.CDLL | None = None,
+) -> HostBufferView:
+    """
+    title: Export one host object as an irx_buffer_view without copying.
+    summary: >-
+      Accepts any buffer-protocol object with a primitive format (NumPy
+      arrays, memoryviews, bytearrays, array.array) and fixed-width pyarrow
+      arrays. writable=None follows the source, True requires a writable
+      source, and False always exports a readonly view.
+    parameters:
+      source:
+        type: object
+      writable:
+        type: bool | None
+      runtime:
+        type: ctypes.CDLL | None
+    returns:
+      type: HostBufferView
+    """
+    if isinstance(source, pa.Array):
+        if writable:
+            raise ValueError("pyarrow arrays are immutable")
+        return _arrow_buffer_view(source, runtime)
+
+    py_buffer = _PyBuffer()
+    request = _PYBUF_STRIDES | _PYBUF_FORMAT
+    if writable:
+        request |= _PYBUF_WRITABLE
+    _python_api.PyObject_GetBuffer(
+        source,
+        ctypes.byref(py_buffer),
+        request,
+    )
+    pinned = _PinnedSource(source, py_buffer)
+    try:
+        format_text = (py_buffer.format or b"B").decode("ascii")
+        dtype_name = _format_dtype_name(format_text, py_buffer.itemsize)
+        shape = tuple(py_buffer.shape[i] for i in range(py_buffer.ndim))
+        strides = tuple(py_buffer.strides[i] for i in range(py_buffer.ndim))
+    except Exception:
+        pinned.release()
+        raise
+
+    is_writable = not py_buffer.readonly and writable is not False
+    flags = _contiguity_flags(shape, strides, py_buffer.itemsize)
+    flags |= BUFFER_FLAG_WRITABLE if is_writable else BUFFER_FLAG_READONLY
+    return HostBufferView(
+        pinned,
+        data=py_buffer.buf,
+        dtype_token=BUFFER_DTYPE_TOKENS[dtype_name],
+        shape=shape,
+        strides=strides,
+        offset_bytes=0,
+        flags=flags,
+        runtime=runtime,
+    )
+
+
+@public
+@typechecked
+def host_arrow_array(source: object) -> HostArrowArray:
+    """
+    title: Export one Arrow PyCapsule producer as C Data pointers.
+    parameters:
+      source:
+        type: object
+    returns:
+      type: HostArrowArray
+    """
+    return HostArrowArray(source)
+
+
+@public
+@typechecked
+def call_host_function(
+    function: Callable[..., object],
+    *args: object,
+    runtime: ctypes.CDLL | None = None,
+) -> object:
+    """
+    title: Call one native entry point with host arguments passed zero-copy.
+    summary: >-
+      HostBufferView arguments pass as irx_buffer_view pointers and
+      HostArrowArray arguments as an ArrowArray pointer followed by an
+      ArrowSchema pointer. Other Arrow PyCapsule producers and buffer-protocol
+      objects are exported the same way for the duration of the call; every
+      other argument is passed through unchanged.
+    parameters:
+      function:
+        type: Callable[Ellipsis, object]
+      args:
+        type: object
+        variadic: positional
+      runtime:
+        type: ctypes.CDLL | None
+    returns:
+      type: object
+    """
+    temporaries: list[HostBufferView | HostArrowArray] = []
+    native_args: list[object] = []
+    try:
+        for arg in args:
+            exported = arg
+            if not isinstance(arg, (HostBufferView, HostArrowArray)):
+                if hasattr(arg, "__arrow_c_array__"):
+                    exported = host_arrow_array(arg)
+                    temporaries.append(exported)
+                elif _supports_buffer_protocol(arg):
+                    exported = host_buffer_view(arg, runtime=runtime)
+                    temporaries.append(exported)
+
+            if isinstance(exported, HostBufferView):
+                native_args.append(exported.pointer)
+            elif isinstance(exported, HostArrowArray):
+                native_args.append(ctypes.c_void_p(exported.array_address))
+                native_args.append(ctypes.c_void_p(exported.schema_address))
+            else:
+                native_args.append(exported)
+        return function(*native_args)
+    finally:
+        for temporary in temporaries:
+            temporary.release()
+
+
+@typechecked
+def _supports_buffer_protocol(value: object) -> bool:
+    """
+    title: Return whether one value exports the Python buffer protocol.
+    parameters:
+      value:
+        type: object
+    returns:
+      type: bool
+    """
+    try:
+        memoryview(value)  # type: ignore[arg-type]
+    except TypeError:
+        return False
+    return True
+
+
+__all__ = [
+    "BufferViewStruct",
+    "HostArrowArray",
+    "HostBufferView",
+    "call_host_function",
+    "host_arrow_array",
+    "host_buffer_view",
+]
@@ -0,0 +1,310 @@
+"""
+title: Tests for the arena runtime feature and arena-backed temporaries.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from irx import astx
+from irx.builder import Builder
+from irx.builder.runtime.arena.feature import build_arena_runtime_feature
+from irx.builder.runtime.linking import link_executable
+from irx.builder.runtime.registry import get_default_runtime_feature_registry
+from irx.system import AssertStmt, PrintExpr
+
+from tests.conftest import (
+    assert_build_output,
+    assert_ir_parses,
+    make_main_module,
+)
+
+# Only the loop-iteration scope carves; main's function scope never marks.
+LOOP_PROGRAM_ARENA_SCOPES = 1
+# loop fallthrough, break, and the return inside the loop.
+BREAK_PROGRAM_ARENA_REWINDS = 3
+
+
+def _printing_range_loop(end: int, *body: astx.AST) -> astx.ForRangeLoopStmt:
+    """
+    title: Build one Int32 range loop that prints its index as a string.
+    summary: >-
+      Each iteration formats the index into a string that only lives until
+      the print returns, which is the scope-local temporary the arena serves.
+    parameters:
+      end:
+        type: int
+      body:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.ForRangeLoopStmt
+    """
+    block = astx.Block()
+    block.append(PrintExpr(astx.Cast(astx.Identifier("i"), astx.String())))
+    for node in body:
+        block.append(node)
+    return astx.ForRangeLoopStmt(
+        variable=astx.InlineVariableDeclaration(
+            "i",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+        ),
+        start=astx.LiteralInt32(0),
+        end=astx.LiteralInt32(end),
+        step=astx.LiteralInt32(1),
+        body=block,
+    )
+
+
+def test_arena_feature_is_registered_as_c_runtime() -> None:
+    """
+    title: The default registry should expose the arena runtime feature.
+    """
+    feature = get_default_runtime_feature_registry().get("arena")
+
+    assert feature.metadata["canonical_name"] == "arena"
+    assert [artifact.kind for artifact in feature.artifacts] == ["c_source"]
+    assert {
+        "irx_arena_new",
+        "irx_arena_alloc",
+        "irx_arena_mark",
+        "irx_arena_rewind",
+        "irx_arena_reset",
+        "irx_arena_destroy",
+    } <= set(feature.symbols)
+
+
+def test_print_temporaries_use_heap_without_arena_mode() -> None:
+    """
+    title: Arena lowering should stay opt-in.
+    """
+    builder = Builder()
+    ir_text = builder.translate(
+        make_main_module(
+            _printing_range_loop(3),
+            astx.FunctionReturn(astx.LiteralInt32(0)),
+        )
+    )
+
+    assert_ir_parses(ir_text)
+    assert 'call i8* @"irx_string_reserve"' in ir_text
+    assert "irx_arena" not in ir_text
+    active = builder.translator.runtime_features.active_feature_names()
+    assert "arena" not in active
+
+
+def test_print_temporaries_use_loop_scoped_arena() -> None:
+    """
+    title: Arena mode should carve printed strings and rewind per iteration.
+    """
+    builder = Builder(arena_temporaries=True)
+    module = make_main_module(
+        _printing_range_loop(3),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+    ir_text = builder.translate(module)
+
+    assert_ir_parses(ir_text)
+    assert 'call i8* @"irx_arena_alloc"' in ir_text
+    assert "irx_string_reserve" not in ir_text
+    assert 'call i8* @"malloc"' not in ir_text
+    marks = ir_text.count('call i64 @"irx_arena_mark"')
+    rewinds = ir_text.count('call void @"irx_arena_rewind"')
+    assert marks == LOOP_PROGRAM_ARENA_SCOPES
+    assert rewinds >= LOOP_PROGRAM_ARENA_SCOPES
+    assert (
+        'call i8* @"irx_arena_default"' in ir_text.split("for.range.body:")[0]
+    )
+    active = builder.translator.runtime_features.active_feature_names()
+    assert "arena" in active
+    assert_build_output(builder, module, "0\n1\n2")
+
+
+def test_assert_message_temporaries_use_loop_scoped_arena() -> None:
+    """
+    title: Failing assertion messages should be carved from the arena too.
+    """
+    builder = Builder(arena_temporaries=True)
+    ir_text = builder.translate(
+        make_main_module(
+            _printing_range_loop(
+                3,
+                AssertStmt(
+                    astx.BinaryOp(
+                        "<", astx.Identifier("i"), astx.LiteralInt32(3)
+                    ),
+                    message=astx.Identifier("i"),
+                ),
+            ),
+            astx.FunctionReturn(astx.LiteralInt32(0)),
+        )
+    )
+
+    assert_ir_parses(ir_text)
+    assert 'call i8* @"malloc"' not in ir_text
+    assert ir_text.count('call i64 @"irx_arena_mark"') == (
+        LOOP_PROGRAM_ARENA_SCOPES
+    )
+
+
+def test_arena_scopes_without_temporaries_emit_nothing() -> None:
+    """
+    title: Scopes that never carve a temporary should not touch the arena.
+    """
+    builder = Builder(arena_temporaries=True)
+    loop_body = astx.Block()
+    loop_body.append(PrintExpr(astx.Identifier("i")))
+    ir_text = builder.translate(
+        make_main_module(
+            astx.ForRangeLoopStmt(
+                variable=astx.InlineVariableDeclaration(
+                    "i",
+                    type_=astx.Int32(),
+                    mutability=astx.MutabilityKind.mutable,
+                ),
+                start=astx.LiteralInt32(0),
+                end=astx.LiteralInt32(3),
+                step=astx.LiteralInt32(1),
+                body=loop_body,
+            ),
+            astx.FunctionReturn(astx.LiteralInt32(0)),
+        )
+    )
+
+    assert_ir_parses(ir_text)
+    assert "irx_arena" not in ir_text
+    active = builder.translator.runtime_features.active_feature_names()
+    assert "arena" not in active
+
+
+def test_arena_scope_rewinds_on_break_and_return() -> None:
+    """
+    title: Early loop and function exits should still run the arena rewind.
+    """
+    builder = Builder(arena_temporaries=True)
+    break_block = astx.Block()
+    break_block.append(astx.BreakStmt())
+    return_block = astx.Block()
+    return_block.append(astx.FunctionReturn(astx.LiteralInt32(1)))
+    module = make_main_module(
+        _printing_range_loop(
+            10,
+            astx.IfStmt(
+                condition=astx.BinaryOp(
+                    ">=", astx.Identifier("i"), astx.LiteralInt32(2)
+                ),
+                then=break_block,
+            ),
+            astx.IfStmt(
+                condition=astx.BinaryOp(
+                    ">=", astx.Identifier("i"), astx.LiteralInt32(5)
+                ),
+                then=return_block,
+            ),
+        ),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+    ir_text = builder.translate(module)
+
+    assert_ir_parses(ir_text)
+    rewinds = ir_text.count('call void @"irx_arena_rewind"')
+    assert rewinds == BREAK_PROGRAM_ARENA_REWINDS
+    assert_build_output(builder, module, "0\n1\n2")
+
+
+def test_arena_runtime_rewind_reuses_chunks_harness() -> None:
+    """
+    title: Native arena runtime should recycle chunks across rewinds.
+    """
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for arena runtime harness tests")
+
+    feature = build_arena_runtime_feature()
+    include_dirs = [
+        include_dir
+        for artifact in feature.artifacts
+        for include_dir in artifact.include_dirs
+    ]
+    source = """
+      #include <stdint.h>
+      #include <string.h>
+
+      #include "irx_arena_runtime.h"
+
+      int main(void) {
+        irx_arena* arena = irx_arena_new(128);
+        int64_t reserved = 0;
+        for (int iteration = 0; iteration < 1000; ++iteration) {
+          int64_t mark = irx_arena_mark(arena);
+          for (int index = 0; index < 16; ++index) {
+            char* slot = (char*)irx_arena_alloc(arena, 40, 8);
+            if (((uintptr_t)slot & 7) != 0) return 1;
+            memset(slot, 'x', 40);
+          }
+          irx_arena_rewind(arena, mark);
+          if (iteration == 0) reserved = irx_arena_bytes_reserved(arena);
+        }
+        if (irx_arena_bytes_reserved(arena) != reserved) return 2;
+        if (irx_arena_mark(arena) != 0) return 3;
+
+        void* wide = irx_arena_alloc(arena, 4096, 64);
+        if (((uintptr_t)wide & 63) != 0) return 4;
+        irx_arena_reset(arena);
+        if (irx_arena_mark(arena) != 0) return 5;
+        irx_arena_destroy(arena);
+
+        if (irx_arena_alloc(irx_arena_default(), 8, 0) == 0) return 6;
+        return 0;
+      }
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "arena_harness.c"
+        object_path = tmp_path / "arena_harness.o"
+        output_path = tmp_path / "arena_harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+
+        subprocess.run(
+            [
+                clang_binary,
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+                "-std=c99",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=output_path,
+            artifacts=feature.artifacts,
+            linker_flags=feature.linker_flags,
+            clang_binary=clang_binary,
+        )
+        result = subprocess.run(
+            [str(output_path)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+    assert result.returncode == 0, result.stderr or result.stdout
@@ -0,0 +1,443 @@
+"""
+title: Tests for the Arrow compute kernel runtime feature and array nodes.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from irx import astx
+from irx.analysis import SemanticError, analyze
+from irx.builder import Builder, Visitor
+from irx.builder.runtime.compute import build_compute_runtime_feature
+from irx.builder.runtime.linking import link_executable
+from irx.builder.runtime.registry import (
+    RuntimeFeatureState,
+    get_default_runtime_feature_registry,
+)
+
+from tests.conftest import build_and_run
+
+COMPUTE_HARNESS = """
+  #include <math.h>
+  #include <stdint.h>
+  #include <stdio.h>
+
+  #include "irx_arrow_runtime.h"
+
+  static irx_arrow_array_handle* build_column(
+      int32_t type_id, const void* values, int64_t count,
+      const uint8_t* validity) {
+    irx_arrow_array_builder_handle* builder = NULL;
+    irx_arrow_array_handle* array = NULL;
+    if (irx_arrow_array_builder_new(type_id, &builder) != 0) return NULL;
+    if (irx_arrow_array_builder_append_n(builder, values, count,
+                                         validity) != 0 ||
+        irx_arrow_array_builder_finish(builder, &array) != 0) {
+      irx_arrow_array_builder_release(builder);
+      return NULL;
+    }
+    return array;
+  }
+
+  int main(void) {
+    int64_t values[6] = {4, -2, 7, 10, 3, 8};
+    uint8_t validity[1] = {0x3b};
+    double weights[3] = {0.5, 1.5, 4.0};
+    int32_t indices[3] = {5, 0, 3};
+    int64_t sum = 0;
+    int64_t low = 0;
+    int64_t high = 0;
+    double mean = 0.0;
+    double dsum = 0.0;
+    irx_arrow_array_handle* ints =
+        build_column(IRX_ARROW_TYPE_INT64, values, 6, validity);
+    irx_arrow_array_handle* doubles =
+        build_column(IRX_ARROW_TYPE_FLOAT64, weights, 3, NULL);
+    irx_arrow_array_handle* picks =
+        build_column(IRX_ARROW_TYPE_INT32, indices, 3, NULL);
+    irx_arrow_array_handle* mask = NULL;
+    irx_arrow_array_handle* kept = NULL;
+    irx_arrow_array_handle* scaled = NULL;
+    irx_arrow_array_handle* taken = NULL;
+    irx_arrow_array_handle* casted = NULL;
+    if (ints == NULL || doubles == NULL || picks == NULL) return 1;
+
+    if (irx_arrow_compute_sum_int64(ints, &sum) != 0 || sum != 23) return 2;
+    if (irx_arrow_compute_min_max_int64(ints, &low, &high) != 0) return 3;
+    if (low != -2 || high != 10) return 4;
+    if (irx_arrow_compute_mean(doubles, &mean) != 0) return 5;
+    if (fabs(mean - 2.0) > 1e-12) return 6;
+    if (irx_arrow_compute_sum_double(ints, &dsum) != 0 || dsum != 23.0) {
+      return 7;
+    }
+
+    if (irx_arrow_compute_binary_int64_scalar(
+            IRX_ARROW_COMPUTE_GREATER, ints, 3, &mask) != 0) {
+      return 8;
+    }
+    if (irx_arrow_compute_filter(ints, mask, &kept) != 0) return 9;
+    if (irx_arrow_array_length(kept) != 3) return 10;
+    if (irx_arrow_compute_binary(IRX_ARROW_COMPUTE_MULTIPLY, kept, kept,
+                                 &scaled) != 0) {
+      return 11;
+    }
+    if (irx_arrow_compute_sum_int64(scaled, &sum) != 0 || sum != 180) {
+      return 12;
+    }
+    if (irx_arrow_compute_binary(IRX_ARROW_COMPUTE_ADD, ints, doubles,
+                                 &casted) == 0) {
+      return 13;
+    }
+    if (irx_arrow_compute_take(ints, picks, &taken) != 0) return 14;
+    if (irx_arrow_compute_sum_int64(taken, &sum) != 0 || sum != 22) {
+      return 15;
+    }
+    if (irx_arrow_compute_cast(taken, IRX_ARROW_TYPE_FLOAT64, &casted) != 0) {
+      return 16;
+    }
+    if (irx_arrow_array_type_id(casted) != IRX_ARROW_TYPE_FLOAT64) return 17;
+    if (irx_arrow_compute_binary(99, ints, ints, &scaled) == 0) return 18;
+
+    irx_arrow_array_release(casted);
+    irx_arrow_array_release(taken);
+    irx_arrow_array_release(scaled);
+    irx_arrow_array_release(kept);
+    irx_arrow_array_release(mask);
+    irx_arrow_array_release(picks);
+    irx_arrow_array_release(doubles);
+    irx_arrow_array_release(ints);
+    printf("%lld\\n", (long long)low + high);
+    return 0;
+  }
+"""
+
+
+def _run_compute_harness(source: str) -> subprocess.CompletedProcess[str]:
+    """
+    title: Compile one C harness against the compute runtime and run it.
+    parameters:
+      source:
+        type: str
+    returns:
+      type: subprocess.CompletedProcess[str]
+    """
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for compute harness tests")
+
+    feature = build_compute_runtime_feature()
+    include_dirs = dict.fromkeys(
+        include_dir
+        for artifact in feature.artifacts
+        for include_dir in artifact.include_dirs
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "compute_harness.c"
+        object_path = tmp_path / "compute_harness.o"
+        output_path = tmp_path / "compute_harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+        subprocess.run(
+            [
+                clang_binary,
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+                "-std=c99",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=output_path,
+            artifacts=feature.artifacts,
+            linker_flags=(*feature.linker_flags, "-lm"),
+            clang_binary=clang_binary,
+        )
+        return subprocess.run(
+            [str(output_path)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+
+def _module_with_main(*nodes: astx.AST) -> astx.Module:
+    """
+    title: Build an int32 main module.
+    parameters:
+      nodes:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.Module
+    """
+    module = astx.Module()
+    prototype = astx.FunctionPrototype(
+        "main",
+        args=astx.Arguments(),
+        return_type=astx.Int32(),
+    )
+    body = astx.Block()
+    for node in nodes:
+        body.append(node)
+    module.block.append(astx.FunctionDef(prototype=prototype, body=body))
+    return module
+
+
+def _array_decl(name: str, value: astx.AST) -> astx.VariableDeclaration:
+    """
+    title: Declare one local Arrow array handle.
+    parameters:
+      name:
+        type: str
+      value:
+        type: astx.AST
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.ArrayHandleType(),
+        value=value,
+    )
+
+
+def _int64_array(values: list[int]) -> astx.ArrayLiteral:
+    """
+    title: Build one int64 Arrow array literal.
+    parameters:
+      values:
+        type: list[int]
+    returns:
+      type: astx.ArrayLiteral
+    """
+    return astx.ArrayLiteral(
+        [astx.LiteralInt64(value) for value in values],
+        element_type=astx.Int64(),
+    )
+
+
+def test_compute_feature_is_registered() -> None:
+    """
+    title: The default registry should expose the compute feature.
+    """
+    feature = get_default_runtime_feature_registry().get("compute")
+
+    assert feature.metadata["canonical_name"] == "compute"
+    assert any("arrow_compute" in flag for flag in feature.linker_flags)
+    assert {
+        "irx_arrow_compute_sum_int64",
+        "irx_arrow_compute_binary",
+        "irx_arrow_compute_filter",
+        "irx_arrow_compute_take",
+        "irx_arrow_compute_cast",
+    } <= set(feature.symbols)
+
+
+def test_compute_symbols_declare_llvm_functions() -> None:
+    """
+    title: Every compute symbol should lower to one LLVM declaration.
+    """
+    visitor = Visitor()
+    state = RuntimeFeatureState(
+        visitor,
+        get_default_runtime_feature_registry(),
+    )
+
+    for symbol_name in build_compute_runtime_feature().symbols:
+        state.require_symbol("compute", symbol_name)
+
+    ir_text = str(visitor._llvm.module)
+    assert 'declare external i32 @"irx_arrow_compute_mean"' in ir_text
+    assert state.active_feature_names() == ("compute",)
+
+
+def test_compute_kernels_reduce_filter_take_and_cast() -> None:
+    """
+    title: Compute kernels should honor validity and reject bad operands.
+    """
+    result = _run_compute_harness(COMPUTE_HARNESS)
+
+    assert result.returncode == 0, result.stderr or result.stdout
+    assert result.stdout.strip() == "8"
+
+
+def test_array_compute_nodes_reject_non_array_operands() -> None:
+    """
+    title: Compute nodes should require Arrow array handle operands.
+    """
+    module = _module_with_main(
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.ArrayReduce(astx.LiteralInt64(3), "sum"),
+                astx.Int32(),
+            )
+        )
+    )
+
+    with pytest.raises(SemanticError, match="must be an Arrow array handle"):
+        analyze(module)
+
+
+def test_array_mean_requires_float_result() -> None:
+    """
+    title: Mean reductions should always produce Float64 values.
+    """
+    module = _module_with_main(
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.ArrayReduce(
+                    _int64_array([1, 2]),
+                    "mean",
+                    result_type=astx.Int64(),
+                ),
+                astx.Int32(),
+            )
+        )
+    )
+
+    with pytest.raises(SemanticError, match="array mean returns Float64"):
+        analyze(module)
+
+
+def test_array_compute_nodes_run_filtered_sum() -> None:
+    """
+    title: Generated code should filter and reduce through compute kernels.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("clang is required for compute build tests")
+
+    values = astx.Identifier("values")
+    kept = astx.Identifier("kept")
+    module = _module_with_main(
+        _array_decl("values", _int64_array([5, 12, 1, 9, 20, 3])),
+        _array_decl(
+            "kept",
+            astx.ArrayFilter(
+                values,
+                astx.ArrayElementwise(">", values, astx.LiteralInt32(4)),
+            ),
+        ),
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Int64(),
+            value=astx.ArrayReduce(
+                astx.ArrayElementwise("-", kept, astx.LiteralInt64(1)),
+                "sum",
+            ),
+        ),
+        astx.ArrayRelease(kept),
+        astx.ArrayRelease(values),
+        astx.FunctionReturn(astx.Cast(astx.Identifier("total"), astx.Int32())),
+    )
+
+    result = build_and_run(Builder(), module)
+
+    assert result.returncode == sum([5, 12, 9, 20]) - 4
+
+
+def test_array_compute_nodes_run_take_cast_and_mean() -> None:
+    """
+    title: Take, cast, min/max, and mean nodes should compose end to end.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("clang is required for compute build tests")
+
+    values = astx.Identifier("values")
+    picked = astx.ArrayTake(
+        values,
+        astx.ArrayLiteral(
+            [astx.LiteralInt32(3), astx.LiteralInt32(0)],
+            element_type=astx.Int32(),
+        ),
+    )
+    mean = astx.ArrayReduce(astx.ArrayCast(picked, astx.Float64()), "mean")
+    module = _module_with_main(
+        _array_decl("values", _int64_array([6, 2, 40, 10])),
+        astx.VariableDeclaration(
+            name="mean",
+            type_=astx.Int64(),
+            value=astx.Cast(mean, astx.Int64()),
+        ),
+        astx.VariableDeclaration(
+            name="high",
+            type_=astx.Int64(),
+            value=astx.ArrayReduce(values, "max"),
+        ),
+        astx.VariableDeclaration(
+            name="count",
+            type_=astx.Int64(),
+            value=astx.ArrayLength(values),
+        ),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.BinaryOp(
+                    "+",
+                    astx.Identifier("mean"),
+                    astx.BinaryOp(
+                        "+",
+                        astx.Identifier("high"),
+                        astx.Identifier("count"),
+                    ),
+                ),
+                astx.Int32(),
+            )
+        ),
+    )
+
+    result = build_and_run(Builder(), module)
+
+    assert result.returncode == (6 + 10) // 2 + 40 + 4
+
+
+def test_array_reduce_failure_reports_through_assertion_runtime() -> None:
+    """
+    title: A failed reduction should abort with the kernel's error message.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("clang is required for compute build tests")
+
+    values = astx.Identifier("values")
+    module = _module_with_main(
+        _array_decl("values", _int64_array([1, 2, 3])),
+        astx.VariableDeclaration(
+            name="low",
+            type_=astx.Int64(),
+            value=astx.ArrayReduce(
+                astx.ArrayFilter(
+                    values,
+                    astx.ArrayElementwise(">", values, astx.LiteralInt32(9)),
+                ),
+                "min",
+            ),
+        ),
+        astx.FunctionReturn(astx.Cast(astx.Identifier("low"), astx.Int32())),
+    )
+
+    builder = Builder()
+    ir_text = builder.translate(module)
+    assert 'icmp ne i32 %"array_min_status", 0' in ir_text
+    assert 'call i8* @"irx_arrow_last_error"()' in ir_text
+
+    result = build_and_run(builder, module)
+
+    assert result.returncode == 1
+    assert "ARX_ASSERT_FAIL|" in result.stderr
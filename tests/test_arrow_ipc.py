@@ -0,0 +1,403 @@
+"""
+title: Tests for the Arrow IPC runtime feature.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from irx.builder.runtime.arrow_ipc import (
+    ARROW_IPC_COMPRESSION_NONE,
+    ARROW_IPC_COMPRESSION_ZSTD,
+    build_arrow_ipc_runtime_feature,
+)
+from irx.builder.runtime.linking import link_executable
+from irx.builder.runtime.registry import get_default_runtime_feature_registry
+
+ROWS_PER_BATCH = 1000
+BATCH_COUNT = 3
+WRITER_ROWS = 10
+WRITER_BATCH_ROWS = 4
+WRITER_WRITES = 2
+
+IPC_READER_HARNESS = """
+  #include <stdint.h>
+  #include <stdio.h>
+  #include <string.h>
+
+  #include "irx_arrow_runtime.h"
+
+  static int address_is_file_mapped(const void* address, const char* path) {
+    FILE* maps = fopen("/proc/self/maps", "r");
+    char line[4096];
+    int found = 0;
+    if (maps == NULL) return 0;
+    while (!found && fgets(line, sizeof(line), maps) != NULL) {
+      unsigned long start = 0;
+      unsigned long end = 0;
+      if (sscanf(line, "%lx-%lx", &start, &end) != 2) continue;
+      if ((unsigned long)address < start || (unsigned long)address >= end) {
+        continue;
+      }
+      found = strstr(line, path) != NULL;
+    }
+    fclose(maps);
+    return found;
+  }
+
+  int main(int argc, char** argv) {
+    irx_arrow_ipc_file_reader_handle* reader = NULL;
+    irx_arrow_array_handle* arrays[8] = {0};
+    int64_t batches = 0;
+    int64_t total = 0;
+    int32_t id_column = 0;
+    if (argc != 2) return 1;
+    if (irx_arrow_ipc_file_open("/nonexistent/irx.arrow", &reader) == 0) {
+      return 2;
+    }
+    if (irx_arrow_ipc_file_open(argv[1], &reader) != 0) return 3;
+    batches = irx_arrow_ipc_file_num_record_batches(reader);
+    if (batches <= 0 || batches > 8) return 4;
+    if (irx_arrow_ipc_file_num_columns(reader) != 2) return 5;
+    if (irx_arrow_ipc_file_column_index(reader, "missing") != -1) return 6;
+    id_column = irx_arrow_ipc_file_column_index(reader, "id");
+    if (id_column < 0) return 7;
+    if (irx_arrow_ipc_file_read_column(reader, batches, id_column, &arrays[0])
+        == 0) {
+      return 8;
+    }
+    for (int64_t batch = 0; batch < batches; ++batch) {
+      if (irx_arrow_ipc_file_read_column(
+              reader, batch, id_column, &arrays[batch]) != 0) {
+        return 9;
+      }
+    }
+    irx_arrow_ipc_file_close(reader);
+
+    for (int64_t batch = 0; batch < batches; ++batch) {
+      irx_buffer_view view = {0};
+      if (irx_arrow_array_borrow_buffer_view(arrays[batch], &view) != 0) {
+        return 10;
+      }
+      if (!address_is_file_mapped(view.data, argv[1])) return 11;
+      const int64_t* values = (const int64_t*)view.data;
+      for (int64_t index = 0; index < view.shape[0]; ++index) {
+        total += values[index];
+      }
+      irx_arrow_array_release(arrays[batch]);
+    }
+    printf("%lld\\n", (long long)total);
+    return 0;
+  }
+"""
+
+
+IPC_WRITER_HARNESS = """
+  #include <stdint.h>
+  #include <stdlib.h>
+
+  #include "irx_arrow_runtime.h"
+
+  static irx_arrow_array_handle* build_column(
+      int32_t type_id, const void* values, int64_t count) {
+    irx_arrow_array_builder_handle* builder = NULL;
+    irx_arrow_array_handle* array = NULL;
+    if (irx_arrow_array_builder_new(type_id, &builder) != 0) return NULL;
+    if (irx_arrow_array_builder_append_n(builder, values, count, NULL) != 0) {
+      irx_arrow_array_builder_release(builder);
+      return NULL;
+    }
+    if (irx_arrow_array_builder_finish(builder, &array) != 0) {
+      irx_arrow_array_builder_release(builder);
+      return NULL;
+    }
+    return array;
+  }
+
+  int main(int argc, char** argv) {
+    const char* names[2] = {"id", "score"};
+    const char* wrong_names[2] = {"id", "other"};
+    irx_arrow_ipc_stream_writer_handle* writer = NULL;
+    int64_t ids[%(rows)d];
+    double scores[%(rows)d];
+    if (argc != 3) return 1;
+    if (irx_arrow_ipc_stream_writer_open(
+            argv[1], %(batch_rows)d, atoi(argv[2]), &writer) != 0) {
+      return 2;
+    }
+    for (int write = 0; write < %(writes)d; ++write) {
+      for (int index = 0; index < %(rows)d; ++index) {
+        ids[index] = write * %(rows)d + index;
+        scores[index] = ids[index] * 0.5;
+      }
+      irx_arrow_array_handle* columns[2] = {
+          build_column(IRX_ARROW_TYPE_INT64, ids, %(rows)d),
+          build_column(IRX_ARROW_TYPE_FLOAT64, scores, %(rows)d),
+      };
+      if (columns[0] == NULL || columns[1] == NULL) return 3;
+      if (irx_arrow_ipc_stream_writer_write_columns(
+              writer, 2, names, columns) != 0) {
+        return 4;
+      }
+      if (irx_arrow_ipc_stream_writer_write_columns(
+              writer, 2, wrong_names, columns) == 0) {
+        return 5;
+      }
+      irx_arrow_array_release(columns[0]);
+      irx_arrow_array_release(columns[1]);
+    }
+    if (irx_arrow_ipc_stream_writer_rows_written(writer)
+        != %(rows)d * %(writes)d) {
+      return 6;
+    }
+    if (irx_arrow_ipc_stream_writer_close(writer) != 0) return 7;
+    return 0;
+  }
+""" % {
+    "rows": WRITER_ROWS,
+    "batch_rows": WRITER_BATCH_ROWS,
+    "writes": WRITER_WRITES,
+}
+
+
+IPC_BATCH_COPY_HARNESS = """
+  #include <stdint.h>
+
+  #include "irx_arrow_runtime.h"
+
+  int main(int argc, char** argv) {
+    irx_arrow_ipc_file_reader_handle* reader = NULL;
+    irx_arrow_ipc_stream_writer_handle* writer = NULL;
+    if (argc != 3) return 1;
+    if (irx_arrow_ipc_file_open(argv[1], &reader) != 0) return 2;
+    if (irx_arrow_ipc_stream_writer_open(argv[2], 0, 0, &writer) != 0) {
+      return 3;
+    }
+    int64_t batches = irx_arrow_ipc_file_num_record_batches(reader);
+    for (int64_t index = 0; index < batches; ++index) {
+      irx_arrow_record_batch_handle* batch = NULL;
+      if (irx_arrow_ipc_file_read_record_batch(reader, index, &batch) != 0) {
+        return 4;
+      }
+      if (irx_arrow_ipc_stream_writer_write_record_batch(writer, batch) != 0) {
+        return 5;
+      }
+      irx_arrow_record_batch_release(batch);
+    }
+    irx_arrow_ipc_file_close(reader);
+    return irx_arrow_ipc_stream_writer_close(writer) == 0 ? 0 : 6;
+  }
+"""
+
+
+def _write_ipc_file(path: Path) -> int:
+    """
+    title: Write one uncompressed multi-batch Arrow IPC file.
+    parameters:
+      path:
+        type: Path
+    returns:
+      type: int
+    """
+    batches = [
+        pa.record_batch(
+            {
+                "id": pa.array(
+                    range(
+                        batch * ROWS_PER_BATCH, (batch + 1) * ROWS_PER_BATCH
+                    ),
+                    type=pa.int64(),
+                ),
+                "score": pa.array(
+                    [float(index) for index in range(ROWS_PER_BATCH)],
+                    type=pa.float64(),
+                ),
+            }
+        )
+        for batch in range(BATCH_COUNT)
+    ]
+    with pa.ipc.new_file(str(path), batches[0].schema) as writer:
+        for record_batch in batches:
+            writer.write_batch(record_batch)
+    return sum(range(BATCH_COUNT * ROWS_PER_BATCH))
+
+
+def _run_ipc_harness(
+    source: str,
+    *args: str,
+) -> subprocess.CompletedProcess[bytes]:
+    """
+    title: Compile one C harness against the Arrow IPC runtime and run it.
+    parameters:
+      source:
+        type: str
+      args:
+        type: str
+        variadic: positional
+    returns:
+      type: subprocess.CompletedProcess[bytes]
+    """
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for Arrow IPC harness tests")
+
+    feature = build_arrow_ipc_runtime_feature()
+    include_dirs = dict.fromkeys(
+        include_dir
+        for artifact in feature.artifacts
+        for include_dir in artifact.include_dirs
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "ipc_harness.c"
+        object_path = tmp_path / "ipc_harness.o"
+        output_path = tmp_path / "ipc_harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+        subprocess.run(
+            [
+                clang_binary,
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+                "-std=c99",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=output_path,
+            artifacts=feature.artifacts,
+            linker_flags=feature.linker_flags,
+            clang_binary=clang_binary,
+        )
+        return subprocess.run(
+            [str(output_path), *args],
+            check=False,
+            capture_output=True,
+        )
+
+
+def test_arrow_ipc_feature_is_registered() -> None:
+    """
+    title: The default registry should expose the Arrow IPC runtime feature.
+    """
+    feature = get_default_runtime_feature_registry().get("arrow_ipc")
+
+    assert feature.metadata["canonical_name"] == "arrow_ipc"
+    assert [artifact.kind for artifact in feature.artifacts] == ["cxx_source"]
+    assert {
+        "irx_arrow_ipc_file_open",
+        "irx_arrow_ipc_file_num_record_batches",
+        "irx_arrow_ipc_file_num_columns",
+        "irx_arrow_ipc_file_column_index",
+        "irx_arrow_ipc_file_read_column",
+        "irx_arrow_ipc_file_read_record_batch",
+        "irx_arrow_ipc_file_close",
+        "irx_arrow_ipc_stream_writer_write_record_batch",
+    } <= set(feature.symbols)
+
+
+def test_arrow_ipc_reader_maps_columns_zero_copy() -> None:
+    """
+    title: Column buffer views should point into the memory-mapped file.
+    """
+    if not sys.platform.startswith("linux"):
+        pytest.skip("mapping checks read /proc/self/maps")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = Path(tmp_dir) / "columns.arrow"
+        expected = _write_ipc_file(data_path)
+        result = _run_ipc_harness(IPC_READER_HARNESS, str(data_path))
+
+    assert result.returncode == 0, result.stderr or result.stdout
+    assert result.stdout.decode().strip() == str(expected)
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [ARROW_IPC_COMPRESSION_NONE, ARROW_IPC_COMPRESSION_ZSTD],
+)
+def test_arrow_ipc_stream_writer_splits_batches(compression: int) -> None:
+    """
+    title: The stream writer should emit bounded batches pyarrow can read.
+    parameters:
+      compression:
+        type: int
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stream_path = Path(tmp_dir) / "out.arrows"
+        result = _run_ipc_harness(
+            IPC_WRITER_HARNESS,
+            str(stream_path),
+            str(compression),
+        )
+        assert result.returncode == 0, result.stderr or result.stdout
+        with pa.ipc.open_stream(stream_path.read_bytes()) as reader:
+            batches = list(reader)
+
+    total_rows = WRITER_ROWS * WRITER_WRITES
+    assert [batch.num_rows for batch in batches] == [4, 4, 2, 4, 4, 2]
+    table = pa.Table.from_batches(batches)
+    assert table.schema.names == ["id", "score"]
+    assert table.column("id").to_pylist() == list(range(total_rows))
+    assert table.column("score").to_pylist() == [
+        index * 0.5 for index in range(total_rows)
+    ]
+
+
+def test_arrow_ipc_stream_writer_streams_to_stdout() -> None:
+    """
+    title: A "-" path should stream the IPC payload to stdout.
+    """
+    result = _run_ipc_harness(
+        IPC_WRITER_HARNESS,
+        "-",
+        str(ARROW_IPC_COMPRESSION_NONE),
+    )
+
+    assert result.returncode == 0, result.stderr
+    table = pa.ipc.open_stream(result.stdout).read_all()
+    assert table.num_rows == WRITER_ROWS * WRITER_WRITES
+
+
+def test_arrow_ipc_record_batches_copy_file_to_stream() -> None:
+    """
+    title: Record batches read from a file should stream back out unchanged.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = Path(tmp_dir) / "columns.arrow"
+        stream_path = Path(tmp_dir) / "columns.arrows"
+        _write_ipc_file(data_path)
+        result = _run_ipc_harness(
+            IPC_BATCH_COPY_HARNESS,
+            str(data_path),
+            str(stream_path),
+        )
+        assert result.returncode == 0, result.stderr or result.stdout
+        with pa.ipc.open_file(str(data_path)) as file_reader:
+            expected = file_reader.read_all()
+        with pa.ipc.open_stream(stream_path.read_bytes()) as reader:
+            batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [
+        ROWS_PER_BATCH
+    ] * BATCH_COUNT
+    assert pa.Table.from_batches(batches).equals(expected)
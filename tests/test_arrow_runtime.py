@@ -29,6 +29,7 @@ from irx import astx
 from irx.buffer import (
     BUFFER_DTYPE_BOOL,
     BUFFER_DTYPE_INT32,
+    BUFFER_DTYPE_UINT8,
     BUFFER_DTYPE_UINT64,
     BUFFER_FLAG_BORROWED,
     BUFFER_FLAG_C_CONTIGUOUS,
@@ -39,6 +40,10 @@ from irx.buffer import (
 from irx.builder import Builder
 from irx.builder.runtime.array.feature import (
     ARRAY_PRIMITIVE_TYPE_SPECS,
+    IRX_ARROW_ENCODING_DICTIONARY,
+    IRX_ARROW_ENCODING_NONE,
+    IRX_ARROW_ENCODING_RUN_END,
+    IRX_ARROW_TYPE_BINARY,
     IRX_ARROW_TYPE_BOOL,
     IRX_ARROW_TYPE_FLOAT32,
     IRX_ARROW_TYPE_FLOAT64,
@@ -46,10 +51,12 @@ from irx.builder.runtime.array.feature import (
     IRX_ARROW_TYPE_INT16,
     IRX_ARROW_TYPE_INT32,
     IRX_ARROW_TYPE_INT64,
+    IRX_ARROW_TYPE_LARGE_UTF8,
     IRX_ARROW_TYPE_UINT8,
     IRX_ARROW_TYPE_UINT16,
     IRX_ARROW_TYPE_UINT32,
     IRX_ARROW_TYPE_UINT64,
+    IRX_ARROW_TYPE_UTF8,
     build_array_runtime_feature,
 )
 from irx.builder.runtime.linking import (
@@ -66,7 +73,7 @@ class SupportedPrimitiveMetadata(TypedDict):
     buffer_view_compatible: bool
 
 
-PrimitiveValue = int | float | bool | None
+PrimitiveValue = int | float | bool | str | bytes | None
 BuilderValue = int | float | None
 ArrowSchemaFactory = Callable[[], object]
 
@@ -153,6 +160,20 @@ PRIMITIVE_IMPORT_CASES: tuple[
         [True, False, None, True],
         [True, False, None, True],
     ),
+    ("utf8", pa.string, ["a", None, "", "ĩrx"], ["a", None, "", "ĩrx"]),
+    (
+        "large_utf8",
+        pa.large_string,
+        ["arrow", None, "c"],
+        ["arrow", None, "c"],
+    ),
+    ("binary", pa.binary, [b"\x00\x01", None, b""], [b"\x00\x01", None, b""]),
+    (
+        "large_binary",
+        pa.large_binary,
+        [b"xyz", b"", None],
+        [b"xyz", b"", None],
+    ),
 )
 
 
@@ -449,6 +470,27 @@ def _configure_arrow_runtime_library(library: ctypes.CDLL) -> None:
         ctypes.c_double,
     ]
     library.irx_arrow_array_builder_append_double.restype = ctypes.c_int
+    library.irx_arrow_array_builder_append_n.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_int64,
+        ctypes.c_void_p,
+    ]
+    library.irx_arrow_array_builder_append_n.restype = ctypes.c_int
+    library.irx_arrow_array_builder_append_binary.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_int64,
+    ]
+    library.irx_arrow_array_builder_append_binary.restype = ctypes.c_int
+    library.irx_arrow_array_builder_append_binary_n.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_int64),
+        ctypes.c_int64,
+        ctypes.c_void_p,
+    ]
+    library.irx_arrow_array_builder_append_binary_n.restype = ctypes.c_int
     library.irx_arrow_array_builder_int32_new.argtypes = [
         ctypes.POINTER(ctypes.c_void_p)
     ]
@@ -520,6 +562,56 @@ def _configure_arrow_runtime_library(library: ctypes.CDLL) -> None:
         ctypes.POINTER(BufferViewStruct),
     ]
     library.irx_arrow_array_borrow_buffer_view.restype = ctypes.c_int
+    library.irx_arrow_array_borrow_offsets_view.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(BufferViewStruct),
+    ]
+    library.irx_arrow_array_borrow_offsets_view.restype = ctypes.c_int
+    library.irx_arrow_array_borrow_data_view.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(BufferViewStruct),
+    ]
+    library.irx_arrow_array_borrow_data_view.restype = ctypes.c_int
+    library.irx_arrow_array_value_bytes.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int64,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_int64),
+    ]
+    library.irx_arrow_array_value_bytes.restype = ctypes.c_int
+    library.irx_arrow_array_encoding.argtypes = [ctypes.c_void_p]
+    library.irx_arrow_array_encoding.restype = ctypes.c_int32
+    library.irx_arrow_array_borrow_indices_view.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(BufferViewStruct),
+    ]
+    library.irx_arrow_array_borrow_indices_view.restype = ctypes.c_int
+    library.irx_arrow_array_borrow_run_ends_view.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(BufferViewStruct),
+    ]
+    library.irx_arrow_array_borrow_run_ends_view.restype = ctypes.c_int
+    library.irx_arrow_array_borrow_dictionary.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    library.irx_arrow_array_borrow_dictionary.restype = ctypes.c_int
+    library.irx_arrow_array_borrow_run_values.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    library.irx_arrow_array_borrow_run_values.restype = ctypes.c_int
+    library.irx_arrow_array_physical_index.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int64,
+        ctypes.POINTER(ctypes.c_int64),
+    ]
+    library.irx_arrow_array_physical_index.restype = ctypes.c_int
+    library.irx_arrow_array_decode.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    library.irx_arrow_array_decode.restype = ctypes.c_int
     library.irx_arrow_array_retain.argtypes = [ctypes.c_void_p]
     library.irx_arrow_array_retain.restype = ctypes.c_int
     library.irx_arrow_array_release.argtypes = [ctypes.c_void_p]
@@ -547,6 +639,12 @@ def _configure_arrow_runtime_library(library: ctypes.CDLL) -> None:
         ctypes.c_double,
     ]
     library.irx_arrow_tensor_builder_append_double.restype = ctypes.c_int
+    library.irx_arrow_tensor_builder_append_n.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_int64,
+    ]
+    library.irx_arrow_tensor_builder_append_n.restype = ctypes.c_int
     library.irx_arrow_tensor_builder_finish.argtypes = [
         ctypes.c_void_p,
         ctypes.POINTER(ctypes.c_void_p),
@@ -785,7 +883,20 @@ def _pyarrow_c_array(
     returns:
       type: tuple[pa.Array, object, object, int, int]
     """
-    array = pa.array(values, type=data_type)
+    return _pyarrow_c_export(pa.array(values, type=data_type))
+
+
+def _pyarrow_c_export(
+    array: pa.Array,
+) -> tuple[pa.Array, object, object, int, int]:
+    """
+    title: Export one existing PyArrow array through Arrow C Data capsules.
+    parameters:
+      array:
+        type: pa.Array
+    returns:
+      type: tuple[pa.Array, object, object, int, int]
+    """
     schema_capsule, array_capsule = array.__arrow_c_array__()
     return (
         array,
@@ -886,6 +997,8 @@ def test_arrow_length_codegen_declares_runtime_symbols() -> None:
 
     assert "array" in active_features
     assert '@"irx_arrow_array_builder_int32_new"' in ir_text
+    assert '@"irx_arrow_array_builder_append_n"' in ir_text
+    assert "irx_arrow_array_builder_append_int32" not in ir_text
     assert '@"irx_arrow_array_length"' in ir_text
     assert builder.translator.runtime_features.native_artifacts()
 
@@ -1376,6 +1489,120 @@ def test_arrow_runtime_builder_supports_supported_primitives(
             library.irx_arrow_array_release(array_handle)
 
 
+def test_arrow_runtime_bulk_append_applies_validity_bitmap() -> None:
+    """
+    title: Bulk appends should copy values and honor the validity bitmap.
+    """
+    with _load_arrow_runtime_library() as library:
+        int_values = (ctypes.c_int32 * 4)(1, 2, 3, 4)
+        bool_values = (ctypes.c_uint8 * 4)(1, 0, 1, 1)
+        validity = (ctypes.c_uint8 * 1)(0b1011)
+        cases: list[tuple[int, object, Sequence[int | None]]] = [
+            (IRX_ARROW_TYPE_INT32, int_values, [1, 2, None, 4]),
+            (IRX_ARROW_TYPE_BOOL, bool_values, [True, False, None, True]),
+        ]
+        for type_id, values, expected in cases:
+            builder = ctypes.c_void_p()
+            array_handle = ctypes.c_void_p()
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_new(
+                    type_id,
+                    ctypes.byref(builder),
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_append_n(
+                    builder,
+                    values,
+                    len(expected),
+                    validity,
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_finish(
+                    builder,
+                    ctypes.byref(array_handle),
+                ),
+            )
+            try:
+                exported_schema = ArrowSchemaStruct()
+                exported_array = ArrowArrayStruct()
+                _assert_arrow_ok(
+                    library,
+                    library.irx_arrow_array_export(
+                        array_handle,
+                        ctypes.byref(exported_array),
+                        ctypes.byref(exported_schema),
+                    ),
+                )
+                exported = _import_exported_array(
+                    exported_array,
+                    exported_schema,
+                )
+                assert exported.to_pylist() == expected
+            finally:
+                library.irx_arrow_array_release(array_handle)
+
+
+def test_arrow_runtime_tensor_bulk_append_checks_capacity() -> None:
+    """
+    title: Tensor bulk appends should fill slots and reject overflow.
+    """
+    with _load_arrow_runtime_library() as library:
+        shape = (ctypes.c_int64 * 1)(3)
+        strides = (ctypes.c_int64 * 1)(4)
+        values = (ctypes.c_int32 * 4)(7, 8, 9, 10)
+        builder = ctypes.c_void_p()
+        tensor_handle = ctypes.c_void_p()
+        _assert_arrow_ok(
+            library,
+            library.irx_arrow_tensor_builder_new(
+                IRX_ARROW_TYPE_INT32,
+                1,
+                shape,
+                strides,
+                ctypes.byref(builder),
+            ),
+        )
+        try:
+            assert (
+                library.irx_arrow_tensor_builder_append_n(builder, values, 4)
+                != 0
+            )
+            assert b"too many values" in library.irx_arrow_last_error()
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_tensor_builder_append_n(builder, values, 3),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_tensor_builder_finish(
+                    builder,
+                    ctypes.byref(tensor_handle),
+                ),
+            )
+        finally:
+            if tensor_handle.value is None:
+                library.irx_arrow_tensor_builder_release(builder)
+
+        view = BufferViewStruct()
+        try:
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_tensor_borrow_buffer_view(
+                    tensor_handle,
+                    ctypes.byref(view),
+                ),
+            )
+            data = ctypes.cast(view.data, ctypes.POINTER(ctypes.c_int32))
+            assert [data[index] for index in range(3)] == [7, 8, 9]
+        finally:
+            library.irx_arrow_tensor_release(tensor_handle)
+
+
 def test_arrow_cpp_tensor_runtime_borrows_buffer_views() -> None:
     """
     title: Arrow C++ tensors should project stable metadata into buffer views.
@@ -1581,6 +1808,461 @@ def test_arrow_runtime_bool_arrays_reject_plain_buffer_view_bridge() -> None:
                 library.irx_arrow_array_release(array_handle)
 
 
+def test_arrow_runtime_string_arrays_borrow_offsets_and_data() -> None:
+    """
+    title: >-
+      Variable-width arrays should expose their offsets and data buffers
+      without copying.
+    """
+    with _load_arrow_runtime_library() as library:
+        _, schema_capsule, array_capsule, schema_addr, array_addr = (
+            _pyarrow_c_array(["ab", "cde", None, "f"], pa.string())
+        )
+        raw_array = _arrow_array_struct(array_addr)
+        raw_buffers = ctypes.cast(
+            raw_array.buffers,
+            ctypes.POINTER(ctypes.c_void_p),
+        )
+        raw_offsets = raw_buffers[1]
+        raw_data = raw_buffers[2]
+        raw_array.length = 3
+        raw_array.offset = 1
+        raw_array.null_count = 1
+
+        array_handle = ctypes.c_void_p()
+        offsets_view = BufferViewStruct()
+        data_view = BufferViewStruct()
+        plain_view = BufferViewStruct()
+
+        _assert_arrow_ok(
+            library,
+            library.irx_arrow_array_import_move(
+                array_addr,
+                schema_addr,
+                ctypes.byref(array_handle),
+            ),
+        )
+
+        try:
+            assert (
+                library.irx_arrow_array_type_id(array_handle)
+                == IRX_ARROW_TYPE_UTF8
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_offsets_view(
+                    array_handle,
+                    ctypes.byref(offsets_view),
+                ),
+            )
+            assert offsets_view.data == raw_offsets
+            assert offsets_view.dtype == BUFFER_DTYPE_INT32
+            assert offsets_view.shape[0] == 4  # noqa: PLR2004
+            assert offsets_view.strides[0] == 4  # noqa: PLR2004
+            assert offsets_view.offset_bytes == 4  # noqa: PLR2004
+            assert offsets_view.flags & BUFFER_FLAG_BORROWED
+
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_data_view(
+                    array_handle,
+                    ctypes.byref(data_view),
+                ),
+            )
+            assert data_view.data == raw_data
+            assert data_view.dtype == BUFFER_DTYPE_UINT8
+            assert data_view.strides[0] == 1
+            assert data_view.offset_bytes == 0
+
+            rows: list[bytes | None] = []
+            for index in range(3):
+                data = ctypes.c_void_p()
+                length = ctypes.c_int64()
+                _assert_arrow_ok(
+                    library,
+                    library.irx_arrow_array_value_bytes(
+                        array_handle,
+                        index,
+                        ctypes.byref(data),
+                        ctypes.byref(length),
+                    ),
+                )
+                rows.append(
+                    None
+                    if data.value is None
+                    else ctypes.string_at(data.value, length.value)
+                )
+            assert rows == [b"cde", None, b"f"]
+
+            code = library.irx_arrow_array_borrow_buffer_view(
+                array_handle,
+                ctypes.byref(plain_view),
+            )
+            assert code != 0
+            assert "variable-width" in library.irx_arrow_last_error().decode()
+        finally:
+            _ = (schema_capsule, array_capsule)
+            if array_handle.value is not None:
+                library.irx_arrow_array_release(array_handle)
+
+
+def test_arrow_runtime_binary_bulk_append_uses_value_lengths() -> None:
+    """
+    title: Binary bulk appends should split packed bytes by per-value lengths.
+    """
+    with _load_arrow_runtime_library() as library:
+        packed = b"helloIRxskip!"
+        lengths = (ctypes.c_int64 * 4)(5, 3, 4, 1)
+        validity = (ctypes.c_uint8 * 1)(0b1011)
+        cases: list[tuple[int, list[str | None] | list[bytes | None]]] = [
+            (
+                IRX_ARROW_TYPE_LARGE_UTF8,
+                ["hello", "IRx", None, "!"],
+            ),
+            (
+                IRX_ARROW_TYPE_BINARY,
+                [b"hello", b"IRx", None, b"!"],
+            ),
+        ]
+        for type_id, expected in cases:
+            builder = ctypes.c_void_p()
+            array_handle = ctypes.c_void_p()
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_new(
+                    type_id,
+                    ctypes.byref(builder),
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_append_binary_n(
+                    builder,
+                    packed,
+                    lengths,
+                    len(lengths),
+                    validity,
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_append_binary(
+                    builder,
+                    b"tail",
+                    4,
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_builder_finish(
+                    builder,
+                    ctypes.byref(array_handle),
+                ),
+            )
+            try:
+                exported_schema = ArrowSchemaStruct()
+                exported_array = ArrowArrayStruct()
+                _assert_arrow_ok(
+                    library,
+                    library.irx_arrow_array_export(
+                        array_handle,
+                        ctypes.byref(exported_array),
+                        ctypes.byref(exported_schema),
+                    ),
+                )
+                exported = _import_exported_array(
+                    exported_array,
+                    exported_schema,
+                )
+                tail = "tail" if isinstance(expected[0], str) else b"tail"
+                assert exported.to_pylist() == [*expected, tail]
+            finally:
+                library.irx_arrow_array_release(array_handle)
+
+
+def _export_runtime_array(
+    library: ctypes.CDLL, array_handle: object
+) -> pa.Array:
+    """
+    title: Export one runtime array handle back into PyArrow.
+    parameters:
+      library:
+        type: ctypes.CDLL
+      array_handle:
+        type: object
+    returns:
+      type: pa.Array
+    """
+    exported_schema = ArrowSchemaStruct()
+    exported_array = ArrowArrayStruct()
+    _assert_arrow_ok(
+        library,
+        library.irx_arrow_array_export(
+            array_handle,
+            ctypes.byref(exported_array),
+            ctypes.byref(exported_schema),
+        ),
+    )
+    return _import_exported_array(exported_array, exported_schema)
+
+
+def test_arrow_runtime_dictionary_arrays_import_without_decoding() -> None:
+    """
+    title: >-
+      Dictionary arrays should keep their indices and dictionary zero-copy and
+      decode only on request.
+    """
+    source = pa.array(["red", "blue", "red", None, "green", "red"])
+    encoded = source.dictionary_encode().slice(1, 4)
+    with _load_arrow_runtime_library() as library:
+        _, schema_capsule, array_capsule, schema_addr, array_addr = (
+            _pyarrow_c_export(encoded)
+        )
+        raw_buffers = ctypes.cast(
+            _arrow_array_struct(array_addr).buffers,
+            ctypes.POINTER(ctypes.c_void_p),
+        )
+        raw_indices = raw_buffers[1]
+        array_handle = ctypes.c_void_p()
+        dictionary = ctypes.c_void_p()
+        decoded = ctypes.c_void_p()
+        view = BufferViewStruct()
+
+        _assert_arrow_ok(
+            library,
+            library.irx_arrow_array_import_move(
+                array_addr,
+                schema_addr,
+                ctypes.byref(array_handle),
+            ),
+        )
+        try:
+            assert (
+                library.irx_arrow_array_encoding(array_handle)
+                == IRX_ARROW_ENCODING_DICTIONARY
+            )
+            assert (
+                library.irx_arrow_array_type_id(array_handle)
+                == IRX_ARROW_TYPE_UTF8
+            )
+            assert library.irx_arrow_array_length(array_handle) == 4  # noqa: PLR2004
+
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_indices_view(
+                    array_handle,
+                    ctypes.byref(view),
+                ),
+            )
+            assert view.data == raw_indices
+            assert view.dtype == BUFFER_DTYPE_INT32
+            assert view.shape[0] == 4  # noqa: PLR2004
+            assert view.offset_bytes == 4  # noqa: PLR2004
+            assert view.flags & BUFFER_FLAG_VALIDITY_BITMAP
+            assert library.irx_arrow_array_borrow_run_ends_view(
+                array_handle,
+                ctypes.byref(view),
+            )
+
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_dictionary(
+                    array_handle,
+                    ctypes.byref(dictionary),
+                ),
+            )
+            assert _export_runtime_array(library, dictionary).to_pylist() == [
+                "red",
+                "blue",
+                "green",
+            ]
+
+            physical: list[int] = []
+            for index in range(4):
+                position = ctypes.c_int64()
+                _assert_arrow_ok(
+                    library,
+                    library.irx_arrow_array_physical_index(
+                        array_handle,
+                        index,
+                        ctypes.byref(position),
+                    ),
+                )
+                physical.append(position.value)
+            assert physical == [1, 0, -1, 2]
+
+            data = ctypes.c_void_p()
+            length = ctypes.c_int64()
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_value_bytes(
+                    array_handle,
+                    3,
+                    ctypes.byref(data),
+                    ctypes.byref(length),
+                ),
+            )
+            assert data.value is not None
+            assert ctypes.string_at(data.value, length.value) == b"green"
+
+            code = library.irx_arrow_array_borrow_buffer_view(
+                array_handle,
+                ctypes.byref(view),
+            )
+            assert code != 0
+            assert "encoded" in library.irx_arrow_last_error().decode()
+
+            exported = _export_runtime_array(library, array_handle)
+            assert pa.types.is_dictionary(exported.type)
+            assert exported.to_pylist() == ["blue", "red", None, "green"]
+
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_decode(
+                    array_handle,
+                    ctypes.byref(decoded),
+                ),
+            )
+            assert (
+                library.irx_arrow_array_encoding(decoded)
+                == IRX_ARROW_ENCODING_NONE
+            )
+            decoded_array = _export_runtime_array(library, decoded)
+            assert decoded_array.type == pa.string()
+            assert decoded_array.to_pylist() == ["blue", "red", None, "green"]
+        finally:
+            _ = (schema_capsule, array_capsule)
+            if decoded.value is not None:
+                library.irx_arrow_array_release(decoded)
+            if array_handle.value is not None:
+                library.irx_arrow_array_release(array_handle)
+
+
+def test_arrow_runtime_run_end_arrays_aggregate_over_runs() -> None:
+    """
+    title: >-
+      Run-end encoded arrays should expose run ends and values so a sum can
+      walk runs instead of rows.
+    """
+    encoded = pa.RunEndEncodedArray.from_arrays(
+        pa.array([3, 5, 9, 10], type=pa.int32()),
+        pa.array([7, None, 2, 4], type=pa.int64()),
+    ).slice(2, 6)
+    with _load_arrow_runtime_library() as library:
+        _, schema_capsule, array_capsule, schema_addr, array_addr = (
+            _pyarrow_c_export(encoded)
+        )
+        array_handle = ctypes.c_void_p()
+        run_values = ctypes.c_void_p()
+        decoded = ctypes.c_void_p()
+        run_ends_view = BufferViewStruct()
+        values_view = BufferViewStruct()
+
+        try:
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_import_copy(
+                    array_addr,
+                    schema_addr,
+                    ctypes.byref(array_handle),
+                ),
+            )
+            assert (
+                library.irx_arrow_array_encoding(array_handle)
+                == IRX_ARROW_ENCODING_RUN_END
+            )
+            assert (
+                library.irx_arrow_array_type_id(array_handle)
+                == IRX_ARROW_TYPE_INT64
+            )
+            offset = library.irx_arrow_array_offset(array_handle)
+            length = library.irx_arrow_array_length(array_handle)
+            assert (offset, length) == (2, 6)
+
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_run_ends_view(
+                    array_handle,
+                    ctypes.byref(run_ends_view),
+                ),
+            )
+            assert run_ends_view.dtype == BUFFER_DTYPE_INT32
+            assert run_ends_view.shape[0] == 4  # noqa: PLR2004
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_run_values(
+                    array_handle,
+                    ctypes.byref(run_values),
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_borrow_buffer_view(
+                    run_values,
+                    ctypes.byref(values_view),
+                ),
+            )
+            assert library.irx_arrow_array_is_nullable(run_values) == 1
+
+            first = ctypes.c_int64()
+            last = ctypes.c_int64()
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_physical_index(
+                    array_handle,
+                    0,
+                    ctypes.byref(first),
+                ),
+            )
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_physical_index(
+                    array_handle,
+                    length - 1,
+                    ctypes.byref(last),
+                ),
+            )
+            assert (first.value, last.value) == (0, 2)
+
+            run_ends = ctypes.cast(
+                run_ends_view.data + run_ends_view.offset_bytes,
+                ctypes.POINTER(ctypes.c_int32),
+            )
+            values = ctypes.cast(
+                values_view.data + values_view.offset_bytes,
+                ctypes.POINTER(ctypes.c_int64),
+            )
+            valid = [True, False, True, True]
+            total = 0
+            run_start = offset
+            for run in range(first.value, last.value + 1):
+                run_end = min(run_ends[run], offset + length)
+                if valid[run]:
+                    total += values[run] * (run_end - run_start)
+                run_start = run_end
+
+            _assert_arrow_ok(
+                library,
+                library.irx_arrow_array_decode(
+                    array_handle,
+                    ctypes.byref(decoded),
+                ),
+            )
+            rows = _export_runtime_array(library, decoded).to_pylist()
+            assert rows == [7, None, None, 2, 2, 2]
+            assert total == sum(row for row in rows if row is not None)
+            assert (
+                _export_runtime_array(library, array_handle).to_pylist()
+                == encoded.to_pylist()
+            )
+        finally:
+            _ = (schema_capsule, array_capsule)
+            if decoded.value is not None:
+                library.irx_arrow_array_release(decoded)
+            if array_handle.value is not None:
+                library.irx_arrow_array_release(array_handle)
+
+
 def test_arrow_runtime_import_move_adopts_offset_arrays() -> None:
     """
     title: Move import should adopt external C Data and preserve offsets.
@@ -1746,13 +2428,13 @@ def test_arrow_runtime_schema_handles_roundtrip_supported_schemas() -> None:
                 library.irx_arrow_schema_release(schema_handle)
 
 
-def test_arrow_runtime_rejects_unsupported_string_arrays() -> None:
+def test_arrow_runtime_rejects_unsupported_float16_arrays() -> None:
     """
-    title: Unsupported variable-width layouts should fail clearly.
+    title: Unsupported storage types should fail clearly.
     """
     with _load_arrow_runtime_library() as library:
         _, schema_capsule, array_capsule, schema_addr, array_addr = (
-            _pyarrow_c_array(["a", "b"], pa.string())
+            _pyarrow_c_array([1.0, 2.0], pa.float16())
         )
         array_handle = ctypes.c_void_p()
 
@@ -163,7 +163,7 @@ def test_binary_op_basic(
 @pytest.mark.parametrize("builder_class", [LLVMBuilder])
 def test_binary_op_string_not_equals(builder_class: type[Builder]) -> None:
     """
-    title: Verify string '!=' uses strcmp_inline + xor 1 path.
+    title: Verify string '!=' lowers through the runtime equality check.
     parameters:
       builder_class:
         type: type[Builder]
@@ -0,0 +1,192 @@
+"""
+title: Tests for file-backed buffer views in the native buffer runtime.
+"""
+
+from __future__ import annotations
+
+import array
+import shutil
+import subprocess
+import sys
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from irx.buffer import (
+    BUFFER_ADVICE_WILLNEED,
+    BUFFER_MAP_COPY_ON_WRITE,
+    BUFFER_MAP_READONLY,
+    BUFFER_MAP_WRITABLE,
+)
+from irx.builder.runtime.buffer.feature import build_buffer_runtime_feature
+from irx.builder.runtime.linking import link_executable
+
+ELEMENT_COUNT = 2048
+
+HARNESS = """
+  #include <stdint.h>
+  #include <string.h>
+
+  #include "irx_buffer_runtime.h"
+
+  static int32_t* element(const irx_buffer_view* view, int64_t row,
+                          int64_t col) {
+    char* origin = (char*)view->data + view->offset_bytes;
+    int64_t offset = row * view->strides[0];
+    if (view->ndim > 1) offset += col * view->strides[1];
+    return (int32_t*)(origin + offset);
+  }
+
+  int main(int argc, char** argv) {
+    irx_buffer_view view;
+    int64_t total = 0;
+    if (argc < 2) return 100;
+
+    if (irx_buffer_map_file(argv[1], 0, IRX_BUFFER_DTYPE_INT32, 1, NULL,
+                            IRX_BUFFER_MAP_READONLY,
+                            IRX_BUFFER_ADVICE_SEQUENTIAL, &view) != 0) {
+      return 1;
+    }
+    if (view.shape[0] != 2048 || view.strides[0] != 4) return 2;
+    if (view.flags != (IRX_BUFFER_FLAG_OWNED | IRX_BUFFER_FLAG_READONLY |
+                       IRX_BUFFER_FLAG_C_CONTIGUOUS |
+                       IRX_BUFFER_FLAG_F_CONTIGUOUS)) {
+      return 3;
+    }
+    for (int64_t index = 0; index < view.shape[0]; ++index) {
+      total += *element(&view, index, 0);
+    }
+    if (total != 2047 * 2048 / 2) return 4;
+    if (irx_buffer_view_advise(&view, IRX_BUFFER_ADVICE_RANDOM) != 0) {
+      return 5;
+    }
+    if (irx_buffer_view_retain(&view) != 0) return 6;
+    if (irx_buffer_owner_release(view.owner) != 0) return 7;
+    if (irx_buffer_view_release(&view) != 0 || view.owner != NULL) return 8;
+
+    int64_t shape[2] = {3, 5};
+    if (irx_buffer_map_file(argv[1], 4100, IRX_BUFFER_DTYPE_INT32, 2, shape,
+                            IRX_BUFFER_MAP_COPY_ON_WRITE,
+                            IRX_BUFFER_ADVICE_WILLNEED, &view) != 0) {
+      return 10;
+    }
+    if (view.strides[0] != 20 || view.strides[1] != 4) return 11;
+    if (!(view.flags & IRX_BUFFER_FLAG_WRITABLE)) return 12;
+    if (*element(&view, 1, 2) != 1032) return 13;
+    *element(&view, 1, 2) = -1;
+    if (irx_buffer_view_release(&view) != 0) return 14;
+
+    int64_t head[1] = {4};
+    if (irx_buffer_map_file(argv[1], 0, IRX_BUFFER_DTYPE_INT32, 1, head,
+                            IRX_BUFFER_MAP_WRITABLE,
+                            IRX_BUFFER_ADVICE_NORMAL, &view) != 0) {
+      return 20;
+    }
+    if (view.shape[0] != 4) return 21;
+    *element(&view, 0, 0) = 777;
+    if (irx_buffer_view_release(&view) != 0) return 22;
+
+    int64_t too_large[1] = {4096};
+    if (irx_buffer_map_file(argv[1], 0, IRX_BUFFER_DTYPE_INT32, 1,
+                            too_large, IRX_BUFFER_MAP_READONLY,
+                            IRX_BUFFER_ADVICE_NORMAL, &view) == 0) {
+      return 30;
+    }
+    if (strcmp(irx_buffer_last_error(),
+               "file mapping shape exceeds the file size") != 0) {
+      return 31;
+    }
+    if (view.owner != NULL) return 32;
+    if (irx_buffer_map_file(argv[1], 0, 0, 1, NULL, IRX_BUFFER_MAP_READONLY,
+                            IRX_BUFFER_ADVICE_NORMAL, &view) == 0) {
+      return 33;
+    }
+    if (irx_buffer_view_advise(&view, IRX_BUFFER_ADVICE_RANDOM) == 0) {
+      return 34;
+    }
+    return 0;
+  }
+"""
+
+
+def test_buffer_map_constants_match_native_header() -> None:
+    """
+    title: Python map mode and advice constants should mirror the C header.
+    """
+    feature = build_buffer_runtime_feature()
+    header = (
+        feature.artifacts[0].path.with_suffix(".h").read_text(encoding="utf8")
+    )
+
+    assert f"#define IRX_BUFFER_MAP_READONLY {BUFFER_MAP_READONLY}" in header
+    assert (
+        f"#define IRX_BUFFER_MAP_COPY_ON_WRITE {BUFFER_MAP_COPY_ON_WRITE}"
+    ) in header
+    assert f"#define IRX_BUFFER_MAP_WRITABLE {BUFFER_MAP_WRITABLE}" in header
+    assert (
+        f"#define IRX_BUFFER_ADVICE_WILLNEED {BUFFER_ADVICE_WILLNEED}"
+    ) in header
+    assert "irx_buffer_map_file" in feature.symbols
+    assert "irx_buffer_view_advise" in feature.symbols
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="file mappings require a POSIX platform",
+)
+def test_buffer_runtime_maps_files_without_copying(tmp_path: Path) -> None:
+    """
+    title: Mapped views should read, copy-on-write, and write through files.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for buffer runtime harness tests")
+
+    data_path = tmp_path / "values.i32"
+    data_path.write_bytes(array.array("i", range(ELEMENT_COUNT)).tobytes())
+
+    feature = build_buffer_runtime_feature()
+    source_path = tmp_path / "mapping_harness.c"
+    object_path = tmp_path / "mapping_harness.o"
+    output_path = tmp_path / "mapping_harness"
+    source_path.write_text(textwrap.dedent(HARNESS), encoding="utf8")
+    subprocess.run(
+        [
+            clang_binary,
+            "-c",
+            str(source_path),
+            "-o",
+            str(object_path),
+            "-I",
+            str(feature.artifacts[0].path.parent),
+            "-std=c99",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    link_executable(
+        primary_object=object_path,
+        output_file=output_path,
+        artifacts=feature.artifacts,
+        linker_flags=feature.linker_flags,
+        clang_binary=clang_binary,
+    )
+    result = subprocess.run(
+        [str(output_path), str(data_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr or result.stdout
+
+    values = array.array("i")
+    values.frombytes(data_path.read_bytes())
+    assert values[0] == 777  # noqa: PLR2004
+    assert values[1032] == 1032  # noqa: PLR2004
+    assert len(values) == ELEMENT_COUNT
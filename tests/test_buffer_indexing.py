@@ -10,12 +10,14 @@ from irx import astx
 from irx.analysis import SemanticError, analyze
 from irx.buffer import (
     BufferHandle,
+    BufferIndexBoundsPolicy,
     BufferMutability,
     BufferOwnership,
     BufferViewMetadata,
     buffer_view_flags,
 )
 from irx.builder import Builder
+from llvmlite import binding as llvm
 
 from tests.conftest import assert_ir_parses
 
@@ -26,6 +28,7 @@ def _metadata(
     strides: tuple[int, ...] = (4,),
     offset_bytes: int = 0,
     mutability: BufferMutability = BufferMutability.READONLY,
+    c_contiguous: bool = False,
 ) -> BufferViewMetadata:
     """
     title: Build static descriptor metadata for indexed access tests.
@@ -38,6 +41,8 @@ def _metadata(
         type: int
       mutability:
         type: BufferMutability
+      c_contiguous:
+        type: bool
     returns:
       type: BufferViewMetadata
     """
@@ -49,7 +54,11 @@ def _metadata(
         shape=shape,
         strides=strides,
         offset_bytes=offset_bytes,
-        flags=buffer_view_flags(BufferOwnership.BORROWED, mutability),
+        flags=buffer_view_flags(
+            BufferOwnership.BORROWED,
+            mutability,
+            c_contiguous=c_contiguous,
+        ),
     )
 
 
@@ -297,8 +306,8 @@ def test_rank1_read_lowers_through_descriptor_fields() -> None:
 
     assert "irx_buffer_view_data" in ir_text
     assert "irx_buffer_view_offset_bytes" in ir_text
-    assert "irx_buffer_view_strides" in ir_text
-    assert "irx_buffer_index_stride_0" in ir_text
+    assert "irx_buffer_index_stride_0" not in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext", 4' in ir_text
     assert "load i32" in ir_text
     assert_ir_parses(ir_text)
 
@@ -327,6 +336,7 @@ def test_identifier_read_lowers_with_static_initializer_metadata() -> None:
     assert 'load %"irx_buffer_view"' in ir_text
     assert "irx_buffer_view_data" in ir_text
     assert "irx_buffer_index_stride_0" in ir_text
+    assert "!invariant.load" not in ir_text
     assert "load i32" in ir_text
     assert_ir_parses(ir_text)
 
@@ -410,10 +420,11 @@ def test_rank2_read_uses_both_strides() -> None:
         )
     )
 
-    assert "irx_buffer_index_stride_0" in ir_text
-    assert "irx_buffer_index_stride_1" in ir_text
+    assert "irx_buffer_index_stride_0" not in ir_text
     assert "irx_buffer_index_scaled_0" in ir_text
     assert "irx_buffer_index_scaled_1" in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext", 16' in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext.1", 4' in ir_text
     assert "load i32" in ir_text
     assert_ir_parses(ir_text)
 
@@ -440,7 +451,354 @@ def test_rank2_store_uses_offset_bytes_and_strides() -> None:
     )
 
     assert "irx_buffer_view_offset_bytes" in ir_text
-    assert "irx_buffer_index_stride_0" in ir_text
-    assert "irx_buffer_index_stride_1" in ir_text
+    assert "irx_buffer_index_offset_1" in ir_text
+    assert "irx_buffer_index_stride_1" not in ir_text
     assert "store i32 5" in ir_text
     assert_ir_parses(ir_text)
+
+
+def test_contiguous_read_uses_one_element_gep() -> None:
+    """
+    title: Static contiguous views should index in elements, not bytes.
+    """
+    ir_text = Builder().translate(
+        _module_with_main(
+            astx.FunctionReturn(
+                astx.BufferViewIndex(
+                    _descriptor(
+                        _metadata(
+                            shape=(3, 4),
+                            strides=(16, 4),
+                            offset_bytes=8,
+                            c_contiguous=True,
+                        )
+                    ),
+                    [astx.LiteralInt32(1), astx.LiteralInt32(2)],
+                )
+            )
+        )
+    )
+
+    assert "irx_buffer_index_byte_ptr" not in ir_text
+    assert "irx_buffer_index_stride_0" not in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext", 4' in ir_text
+    assert "irx_buffer_index_scaled_1" not in ir_text
+    assert (
+        '%"irx_buffer_index_element_ptr" = getelementptr inbounds i32, '
+        'i32* %"irx_buffer_index_origin_element"'
+    ) in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_contiguous_flag_needs_whole_element_strides() -> None:
+    """
+    title: Byte strides that split elements should keep byte addressing.
+    """
+    ir_text = Builder().translate(
+        _module_with_main(
+            astx.FunctionReturn(
+                astx.BufferViewIndex(
+                    _descriptor(
+                        _metadata(shape=(4,), strides=(6,), c_contiguous=True)
+                    ),
+                    [astx.LiteralInt32(1)],
+                )
+            )
+        )
+    )
+
+    assert "irx_buffer_index_byte_ptr" in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext", 6' in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_checked_index_branches_to_cold_failure() -> None:
+    """
+    title: CHECKED accesses should compare indices against the shape.
+    """
+    ir_text = Builder().translate(
+        _module_with_main(
+            astx.FunctionReturn(
+                astx.BufferViewIndex(
+                    _descriptor(_metadata(shape=(4, 3), strides=(12, 4))),
+                    [astx.LiteralInt32(1), astx.LiteralInt32(2)],
+                    bounds_policy=BufferIndexBoundsPolicy.CHECKED,
+                )
+            )
+        )
+    )
+
+    assert 'icmp ult i64 %"irx_buffer_index_sext", 4' in ir_text
+    assert 'icmp ult i64 %"irx_buffer_index_sext.1", 3' in ir_text
+    assert 'label %"buffer.bounds.fail", !prof' in ir_text
+    assert 'call void @"__arx_assert_fail"' in ir_text
+    assert 'c"buffer view index out of bounds\\00"' in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_unchecked_access_overrides_checked_module_default() -> None:
+    """
+    title: Per-access policies should win over the module-wide default.
+    """
+    module = _module_with_main(
+        astx.FunctionReturn(
+            astx.BufferViewIndex(
+                _descriptor(_metadata()),
+                [astx.LiteralInt32(1)],
+                bounds_policy=BufferIndexBoundsPolicy.UNCHECKED,
+            )
+        )
+    )
+
+    ir_text = Builder(bounds_policy=BufferIndexBoundsPolicy.CHECKED).translate(
+        module
+    )
+
+    assert "buffer.bounds" not in ir_text
+    assert "__arx_assert_fail" not in ir_text
+    assert "buffer.bounds" not in Builder().translate(
+        _module_with_main(
+            astx.FunctionReturn(
+                astx.BufferViewIndex(
+                    _descriptor(_metadata()),
+                    [astx.LiteralInt32(1)],
+                )
+            )
+        )
+    )
+
+
+def _view_loop_module(
+    mutability: astx.MutabilityKind,
+    *,
+    reassign: bool = False,
+) -> astx.Module:
+    """
+    title: Sum a rank-2 view bound to a name in nested checked loops.
+    parameters:
+      mutability:
+        type: astx.MutabilityKind
+      reassign:
+        type: bool
+    returns:
+      type: astx.Module
+    """
+    metadata = _metadata(shape=(3, 4), strides=(16, 4))
+
+    def loop(name: str, end: int, *body: astx.AST) -> astx.ForRangeLoopStmt:
+        block = astx.Block()
+        for node in body:
+            block.append(node)
+        return astx.ForRangeLoopStmt(
+            variable=astx.InlineVariableDeclaration(
+                name,
+                type_=astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+            ),
+            start=astx.LiteralInt32(0),
+            end=astx.LiteralInt32(end),
+            step=astx.LiteralInt32(1),
+            body=block,
+        )
+
+    body: list[astx.AST] = [
+        astx.VariableAssignment(
+            "total",
+            astx.BinaryOp(
+                "+",
+                astx.Identifier("total"),
+                astx.BufferViewIndex(
+                    astx.Identifier("view"),
+                    [astx.Identifier("row"), astx.Identifier("column")],
+                    bounds_policy=BufferIndexBoundsPolicy.CHECKED,
+                ),
+            ),
+        )
+    ]
+    if reassign:
+        body.append(astx.VariableAssignment("view", _descriptor(metadata)))
+    return _module_with_main(
+        astx.VariableDeclaration(
+            name="view",
+            type_=astx.BufferViewType(astx.Int32()),
+            mutability=mutability,
+            value=_descriptor(metadata),
+        ),
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralInt32(0),
+        ),
+        loop("row", 3, loop("column", 4, *body)),
+        astx.FunctionReturn(astx.Identifier("total")),
+    )
+
+
+def _main_preheader(ir_text: str) -> tuple[str, str]:
+    """
+    title: Split main's IR into everything and the part before any loop.
+    parameters:
+      ir_text:
+        type: str
+    returns:
+      type: tuple[str, str]
+    """
+    main = ir_text[ir_text.index('define i32 @"main"') :]
+    return main, main[: main.index("for.range.cond:")]
+
+
+def test_unassigned_view_descriptor_loads_in_loop_preheader() -> None:
+    """
+    title: Loops load a view they never reassign once, before the loop.
+    """
+    ir_text = Builder().translate(
+        _view_loop_module(astx.MutabilityKind.mutable)
+    )
+    main, preheader = _main_preheader(ir_text)
+
+    for field in (
+        "irx_buffer_index_stride_0",
+        "irx_buffer_index_stride_1",
+        "irx_buffer_bounds_extent_0",
+        "irx_buffer_bounds_extent_1",
+        "irx_buffer_view_offset_bytes",
+        "irx_buffer_view_data",
+    ):
+        assert main.count(f'%"{field}" = ') == 1
+        assert f'%"{field}" = ' in preheader
+    assert main.count('load %"irx_buffer_view"') == 1
+    llvm.parse_assembly(ir_text).verify()
+
+
+def test_immutable_view_loads_once_with_static_strides() -> None:
+    """
+    title: Immutable views fold strides and only load the view up front.
+    """
+    ir_text = Builder().translate(
+        _view_loop_module(astx.MutabilityKind.constant)
+    )
+    main, preheader = _main_preheader(ir_text)
+
+    assert "irx_buffer_index_stride_0" not in main
+    assert "irx_buffer_bounds_extent_0" not in main
+    assert main.count('load %"irx_buffer_view"') == 1
+    assert 'load %"irx_buffer_view"' in preheader
+    llvm.parse_assembly(ir_text).verify()
+
+
+def test_reassigned_view_descriptor_loads_per_access() -> None:
+    """
+    title: Views the loop body reassigns keep loading their descriptor.
+    """
+    ir_text = Builder().translate(
+        _view_loop_module(astx.MutabilityKind.mutable, reassign=True)
+    )
+    main, preheader = _main_preheader(ir_text)
+
+    assert "irx_buffer_index_stride_0" not in preheader
+    assert 'load %"irx_buffer_view"' not in preheader
+    assert "irx_buffer_index_stride_0" in main
+    llvm.parse_assembly(ir_text).verify()
+
+
+def test_slice_view_lowers_by_rewriting_descriptor_metadata() -> None:
+    """
+    title: Slices should share storage and only rewrite layout fields.
+    """
+    window = astx.BufferViewSlice(
+        _descriptor(
+            _metadata(shape=(3, 4), strides=(16, 4), c_contiguous=True)
+        ),
+        [slice(1, 3), slice(0, 4, 2)],
+    )
+    transposed = astx.BufferViewTranspose(window)
+    module = _module_with_main(
+        astx.FunctionReturn(
+            astx.BufferViewIndex(
+                transposed,
+                [astx.LiteralInt32(1), astx.LiteralInt32(0)],
+            )
+        )
+    )
+
+    ir_text = Builder().translate(module)
+    metadata = getattr(transposed, "semantic").extras["buffer_view_metadata"]
+
+    assert metadata.shape == (2, 2)
+    assert metadata.strides == (8, 16)
+    assert metadata.offset_bytes == 16  # noqa: PLR2004
+    assert metadata.data == BufferHandle(4096)
+    assert metadata.flags == buffer_view_flags(
+        BufferOwnership.BORROWED,
+        BufferMutability.READONLY,
+    )
+    assert 'add i64 %"irx_buffer_view_offset_bytes", 16' in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext", 8' in ir_text
+    assert "irx_buffer_view_retain" not in ir_text
+    assert_ir_parses(ir_text)
+
+
+@pytest.mark.parametrize(
+    ("view", "match"),
+    [
+        (
+            astx.BufferViewSlice(
+                _descriptor(_metadata()),
+                [slice(2, 5)],
+            ),
+            "out of bounds for axis 0",
+        ),
+        (
+            astx.BufferViewSlice(_descriptor(_metadata()), [slice(0, 4, 0)]),
+            "steps must be positive",
+        ),
+        (
+            astx.BufferViewTranspose(
+                _descriptor(_metadata(shape=(2, 2), strides=(8, 4))),
+                [0, 0],
+            ),
+            "permutation",
+        ),
+        (
+            astx.BufferViewReshape(
+                astx.BufferViewSlice(
+                    _descriptor(_metadata(shape=(3, 4), strides=(16, 4))),
+                    [slice(None), slice(1, 3)],
+                ),
+                [6],
+            ),
+            "would need a copy",
+        ),
+        (
+            astx.BufferViewReshape(astx.Identifier("view"), [2, 2]),
+            "descriptor or constant binding",
+        ),
+    ],
+)
+def test_derived_views_reject_invalid_static_layouts(
+    view: astx.AST,
+    match: str,
+) -> None:
+    """
+    title: Slice, transpose, and reshape views should validate statically.
+    parameters:
+      view:
+        type: astx.AST
+      match:
+        type: str
+    """
+    module = _module_with_main(
+        astx.VariableDeclaration(
+            name="view",
+            type_=astx.BufferViewType(astx.Int32()),
+            mutability=astx.MutabilityKind.mutable,
+            value=_descriptor(_metadata()),
+        ),
+        astx.FunctionReturn(
+            astx.BufferViewIndex(view, [astx.LiteralInt32(0)])
+        ),
+    )
+
+    with pytest.raises(SemanticError, match=match):
+        analyze(module)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+import sys
 import tempfile
 import textwrap
 
@@ -653,9 +654,23 @@ def test_plain_buffer_descriptor_does_not_activate_runtime_feature() -> None:
     assert builder.translator.runtime_features.native_artifacts() == ()
 
 
-def test_buffer_runtime_owner_retain_release_harness() -> None:
+def _run_buffer_runtime_harness(
+    source: str,
+    *args: str,
+    linker_flags: tuple[str, ...] = (),
+) -> subprocess.CompletedProcess[str]:
     """
-    title: Native buffer runtime should retain/release owner handles.
+    title: Build one C harness against the buffer runtime and run it.
+    parameters:
+      source:
+        type: str
+      args:
+        type: str
+        variadic: positional
+      linker_flags:
+        type: tuple[str, Ellipsis]
+    returns:
+      type: subprocess.CompletedProcess[str]
     """
     clang_binary = shutil.which("clang")
     if clang_binary is None:
@@ -671,6 +686,50 @@ def test_buffer_runtime_owner_retain_release_harness() -> None:
             seen_include_dirs.add(include_dir)
             include_dirs.append(include_dir)
 
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "buffer_harness.c"
+        object_path = tmp_path / "buffer_harness.o"
+        output_path = tmp_path / "buffer_harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+
+        subprocess.run(
+            [
+                clang_binary,
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+                "-std=c11",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=output_path,
+            artifacts=feature.artifacts,
+            linker_flags=(*feature.linker_flags, *linker_flags),
+            clang_binary=clang_binary,
+        )
+        return subprocess.run(
+            [str(output_path), *args],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+
+def test_buffer_runtime_owner_retain_release_harness() -> None:
+    """
+    title: Native buffer runtime should retain/release owner handles.
+    """
     source = """
       #include "irx_buffer_runtime.h"
 
@@ -707,43 +766,81 @@ def test_buffer_runtime_owner_retain_release_harness() -> None:
       }
     """
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        source_path = tmp_path / "buffer_harness.c"
-        object_path = tmp_path / "buffer_harness.o"
-        output_path = tmp_path / "buffer_harness"
-        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+    result = _run_buffer_runtime_harness(source)
 
-        subprocess.run(
-            [
-                clang_binary,
-                "-c",
-                str(source_path),
-                "-o",
-                str(object_path),
-                *[
-                    option
-                    for include_dir in include_dirs
-                    for option in ("-I", str(include_dir))
-                ],
-                "-std=c99",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        link_executable(
-            primary_object=object_path,
-            output_file=output_path,
-            artifacts=feature.artifacts,
-            linker_flags=feature.linker_flags,
-            clang_binary=clang_binary,
-        )
-        result = subprocess.run(
-            [str(output_path)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
+    assert result.returncode == 0, result.stderr or result.stdout
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="the stress harness uses POSIX threads",
+)
+def test_buffer_runtime_owner_refcount_is_thread_safe() -> None:
+    """
+    title: Concurrent retain/release should keep one exact owner lifetime.
+    """
+    source = """
+      #include <pthread.h>
+      #include <stdatomic.h>
+      #include <string.h>
+
+      #include "irx_buffer_runtime.h"
+
+      #define THREADS 8
+      #define ROUNDS 100000
+
+      static atomic_int released = 0;
+      static irx_buffer_view shared;
+
+      static void mark_released(void* context) {
+        (void)context;
+        atomic_fetch_add(&released, 1);
+      }
+
+      static void* hammer(void* arg) {
+        irx_buffer_view local = shared;
+        for (int round = 0; round < ROUNDS; ++round) {
+          if (irx_buffer_view_retain(&local) != 0) return (void*)1;
+          if (irx_buffer_owner_release(local.owner) != 0) return (void*)2;
+        }
+        if ((long)arg % 2 == 0) {
+          irx_buffer_view_retain(NULL);
+          if (strcmp(irx_buffer_last_error(), "view must not be NULL")) {
+            return (void*)3;
+          }
+        } else if (irx_buffer_last_error()[0] != '\\0') {
+          return (void*)4;
+        }
+        /* Each thread drops the reference main() took on its behalf. */
+        if (irx_buffer_view_release(&local) != 0) return (void*)5;
+        return NULL;
+      }
+
+      int main(void) {
+        pthread_t threads[THREADS];
+        irx_buffer_owner_handle* owner = 0;
+        if (irx_buffer_owner_external_new(0, mark_released, &owner) != 0) {
+          return 1;
+        }
+        shared.owner = owner;
+        shared.flags = IRX_BUFFER_FLAG_EXTERNAL_OWNER;
+        for (long index = 0; index < THREADS; ++index) {
+          if (irx_buffer_view_retain(&shared) != 0) return 2;
+          if (pthread_create(&threads[index], 0, hammer, (void*)index)) {
+            return 3;
+          }
+        }
+        for (int index = 0; index < THREADS; ++index) {
+          void* status = 0;
+          if (pthread_join(threads[index], &status) || status) return 4;
+        }
+        if (atomic_load(&released) != 0) return 5;
+        if (irx_buffer_last_error()[0] != '\\0') return 6;
+        if (irx_buffer_view_release(&shared) != 0) return 7;
+        return atomic_load(&released) == 1 ? 0 : 8;
+      }
+    """
+
+    result = _run_buffer_runtime_harness(source, linker_flags=("-pthread",))
 
     assert result.returncode == 0, result.stderr or result.stdout
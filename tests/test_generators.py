@@ -249,6 +249,103 @@ def _guarded_exhaustion_module() -> astx.Module:
     return module
 
 
+def _recursive_generator_module() -> astx.Module:
+    """
+    title: Build a generator that consumes a smaller call of itself.
+    returns:
+      type: astx.Module
+    """
+    inner_loop = astx.ForInLoopStmt(
+        astx.Identifier("inner"),
+        astx.FunctionCall(
+            "triangle",
+            [
+                astx.BinaryOp(
+                    "-",
+                    astx.Identifier("n"),
+                    astx.LiteralInt32(1),
+                )
+            ],
+        ),
+        _block_of(
+            astx.VariableAssignment(
+                "acc",
+                astx.BinaryOp(
+                    "+",
+                    astx.Identifier("acc"),
+                    astx.Identifier("inner"),
+                ),
+            )
+        ),
+    )
+    triangle = astx.FunctionDef(
+        prototype=astx.FunctionPrototype(
+            "triangle",
+            args=astx.Arguments(astx.Argument("n", astx.Int32())),
+            return_type=astx.GeneratorType(astx.Int32()),
+        ),
+        body=_block_of(
+            astx.VariableDeclaration(
+                "acc",
+                astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+                value=astx.LiteralInt32(0),
+            ),
+            astx.IfStmt(
+                condition=astx.BinaryOp(
+                    ">",
+                    astx.Identifier("n"),
+                    astx.LiteralInt32(0),
+                ),
+                then=_block_of(inner_loop),
+            ),
+            astx.YieldStmt(
+                astx.BinaryOp(
+                    "+",
+                    astx.Identifier("acc"),
+                    astx.Identifier("n"),
+                )
+            ),
+        ),
+    )
+    loop = astx.ForInLoopStmt(
+        astx.Identifier("item"),
+        astx.FunctionCall("triangle", [astx.LiteralInt32(4)]),
+        _block_of(
+            astx.VariableAssignment(
+                "total",
+                astx.BinaryOp(
+                    "+",
+                    astx.Identifier("total"),
+                    astx.Identifier("item"),
+                ),
+            )
+        ),
+    )
+    module = astx.Module()
+    module.block.append(triangle)
+    module.block.append(
+        astx.FunctionDef(
+            prototype=astx.FunctionPrototype(
+                "main",
+                args=astx.Arguments(),
+                return_type=astx.Int32(),
+            ),
+            body=_block_of(
+                astx.VariableDeclaration(
+                    "total",
+                    astx.Int32(),
+                    mutability=astx.MutabilityKind.mutable,
+                    value=astx.LiteralInt32(0),
+                ),
+                loop,
+                astx.FunctionReturn(astx.Identifier("total")),
+            ),
+        )
+    )
+    return module
+
+
 def test_generator_iteration_semantics() -> None:
     """
     title: Generator values should resolve as generator iterables.
@@ -373,13 +470,37 @@ def test_generator_resume_uses_element_slot() -> None:
     """
     title: Resume calls should write into yielded element storage.
     """
-    ir_text = Builder().translate(_sum_generator_float_target_module())
+    ir_text = Builder().translate(_guarded_exhaustion_module())
     assert '%"item_yielded" = alloca i32' in ir_text
     resume_call = 'call i1 %"generator_resume"(i8* %"generator_frame", i32*'
     assert resume_call in ir_text
     assert_ir_parses(ir_text)
 
 
+def test_local_generator_loop_is_fused() -> None:
+    """
+    title: A generator created in the loop header should lower inline.
+    """
+    ir_text = Builder().translate(_sum_generator_float_target_module())
+    main_ir = ir_text[ir_text.index('define i32 @"main"') :]
+    main_ir = main_ir[: main_ir.index("\n}")]
+    assert '%"item_yielded" = alloca i32' in main_ir
+    assert "for.generator.resume.1" in main_ir
+    assert "numbers.__resume" not in main_ir
+    assert "malloc" not in main_ir
+    assert_ir_parses(ir_text)
+
+
+def test_heap_generator_frame_is_sized_from_layout() -> None:
+    """
+    title: Escaping generator frames should allocate their layout size.
+    """
+    ir_text = Builder().translate(_guarded_exhaustion_module())
+    assert "generator_frame_size" in ir_text
+    assert "4096" not in ir_text
+    assert_ir_parses(ir_text)
+
+
 @pytest.mark.skipif(not HAS_CLANG, reason="clang is required for build tests")
 def test_generator_executes() -> None:
     """
@@ -413,3 +534,29 @@ def test_exhausted_generator_stays_done() -> None:
         _guarded_exhaustion_module(),
         str(expected_sum),
     )
+
+
+def test_recursive_local_generator_uses_stack_frame() -> None:
+    """
+    title: Re-entrant local generators should fall back to a stack frame.
+    """
+    ir_text = Builder().translate(_recursive_generator_module())
+    main_ir = ir_text[ir_text.index('define i32 @"main"') :]
+    main_ir = main_ir[: main_ir.index("\n}")]
+    assert '%"triangle_frame" = alloca %"main__triangle.__frame"' in main_ir
+    assert 'call i1 @"main__triangle.__resume"' in main_ir
+    assert "malloc" not in main_ir
+    assert_ir_parses(ir_text)
+
+
+@pytest.mark.skipif(not HAS_CLANG, reason="clang is required for build tests")
+def test_recursive_local_generator_executes() -> None:
+    """
+    title: Fused and stack-frame generator loops should compose.
+    """
+    expected_sum = 10
+    assert_build_output(
+        Builder(),
+        _recursive_generator_module(),
+        str(expected_sum),
+    )
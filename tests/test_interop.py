@@ -0,0 +1,296 @@
+"""
+title: Tests for zero-copy host interop with native IRx entry points.
+"""
+
+from __future__ import annotations
+
+import array
+import ctypes
+import gc
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import weakref
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from irx.buffer import (
+    BUFFER_DTYPE_FLOAT64,
+    BUFFER_DTYPE_INT32,
+    BUFFER_DTYPE_INT64,
+    BUFFER_DTYPE_UINT8,
+    BUFFER_FLAG_BORROWED,
+    BUFFER_FLAG_C_CONTIGUOUS,
+    BUFFER_FLAG_EXTERNAL_OWNER,
+    BUFFER_FLAG_F_CONTIGUOUS,
+    BUFFER_FLAG_READONLY,
+    BUFFER_FLAG_VALIDITY_BITMAP,
+    BUFFER_FLAG_WRITABLE,
+)
+from irx.builder.runtime.buffer.feature import build_buffer_runtime_feature
+from irx.interop import (
+    BufferViewStruct,
+    call_host_function,
+    host_arrow_array,
+    host_buffer_view,
+)
+
+KERNELS = """
+  #include <stddef.h>
+  #include <stdint.h>
+
+  #include "irx_arrow_c_abi.h"
+  #include "irx_buffer_runtime.h"
+
+  static irx_buffer_view kept;
+
+  static const char* element(const irx_buffer_view* view, int64_t index) {
+    return (const char*)view->data + view->offset_bytes +
+           index * view->strides[0];
+  }
+
+  double sum_f64(const irx_buffer_view* view) {
+    double total = 0.0;
+    for (int64_t index = 0; index < view->shape[0]; ++index) {
+      total += *(const double*)element(view, index);
+    }
+    return total;
+  }
+
+  int64_t sum_i64(const irx_buffer_view* view) {
+    int64_t total = 0;
+    for (int64_t index = 0; index < view->shape[0]; ++index) {
+      total += *(const int64_t*)element(view, index);
+    }
+    return total;
+  }
+
+  void scale_i32(irx_buffer_view* view, int32_t factor) {
+    for (int64_t index = 0; index < view->shape[0]; ++index) {
+      *(int32_t*)element(view, index) *= factor;
+    }
+  }
+
+  int32_t keep_view(const irx_buffer_view* view) {
+    kept = *view;
+    return irx_buffer_view_retain(view);
+  }
+
+  int64_t kept_sum_i32(void) {
+    int64_t total = 0;
+    for (int64_t index = 0; index < kept.shape[0]; ++index) {
+      total += *(const int32_t*)element(&kept, index);
+    }
+    return total;
+  }
+
+  int32_t drop_view(void) { return irx_buffer_view_release(&kept); }
+
+  int64_t arrow_sum_i64(const struct ArrowArray* array,
+                        const struct ArrowSchema* schema) {
+    const uint8_t* validity = (const uint8_t*)array->buffers[0];
+    const int64_t* values = (const int64_t*)array->buffers[1];
+    int64_t total = 0;
+    if (schema->format[0] != 'l') return -1;
+    for (int64_t index = 0; index < array->length; ++index) {
+      int64_t bit = array->offset + index;
+      if (validity != NULL && !((validity[bit >> 3] >> (bit & 7)) & 1)) {
+        continue;
+      }
+      total += values[bit];
+    }
+    return total;
+  }
+"""
+
+
+@contextmanager
+def _load_kernel_library() -> Iterator[ctypes.CDLL]:
+    """
+    title: Build the buffer runtime and test kernels into one shared library.
+    returns:
+      type: Iterator[ctypes.CDLL]
+    """
+    if sys.platform == "win32":
+        pytest.skip("host interop shared-library tests require Unix")
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for host interop tests")
+
+    artifact = build_buffer_runtime_feature().artifacts[0]
+    arrow_native = artifact.path.parents[2] / "arrow" / "native"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "kernels.c"
+        library_path = tmp_path / "libirx_interop_kernels.so"
+        source_path.write_text(textwrap.dedent(KERNELS), encoding="utf8")
+        subprocess.run(
+            [
+                clang_binary,
+                "-shared",
+                "-fPIC",
+                "-std=c99",
+                "-I",
+                str(artifact.path.parent),
+                "-I",
+                str(arrow_native),
+                str(source_path),
+                str(artifact.path),
+                "-o",
+                str(library_path),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        library = ctypes.CDLL(str(library_path))
+        view_pointer = ctypes.POINTER(BufferViewStruct)
+        library.sum_f64.argtypes = [view_pointer]
+        library.sum_f64.restype = ctypes.c_double
+        library.sum_i64.argtypes = [view_pointer]
+        library.sum_i64.restype = ctypes.c_int64
+        library.scale_i32.argtypes = [view_pointer, ctypes.c_int32]
+        library.scale_i32.restype = None
+        library.keep_view.argtypes = [view_pointer]
+        library.keep_view.restype = ctypes.c_int32
+        library.kept_sum_i32.argtypes = []
+        library.kept_sum_i32.restype = ctypes.c_int64
+        library.drop_view.argtypes = []
+        library.drop_view.restype = ctypes.c_int32
+        library.arrow_sum_i64.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        library.arrow_sum_i64.restype = ctypes.c_int64
+        yield library
+
+
+class _Payload(bytearray):
+    """
+    title: Weak-referenceable bytearray used to observe host pinning.
+    """
+
+
+def test_host_buffer_view_describes_memoryview_layouts() -> None:
+    """
+    title: Buffer-protocol exports should mirror dtype, strides, and flags.
+    """
+    values = array.array("d", [1.0, 2.0, 3.0, 4.0, 5.0])
+    with host_buffer_view(memoryview(values)[::2]) as exported:
+        view = exported.view
+        assert view.dtype == BUFFER_DTYPE_FLOAT64
+        assert view.ndim == 1
+        assert view.shape[0] == 3  # noqa: PLR2004
+        assert view.strides[0] == 16  # noqa: PLR2004
+        assert view.flags == BUFFER_FLAG_BORROWED | BUFFER_FLAG_WRITABLE
+        assert view.owner is None
+
+    with host_buffer_view(b"irx") as exported:
+        assert exported.view.dtype == BUFFER_DTYPE_UINT8
+        assert exported.view.flags == (
+            BUFFER_FLAG_BORROWED
+            | BUFFER_FLAG_READONLY
+            | BUFFER_FLAG_C_CONTIGUOUS
+            | BUFFER_FLAG_F_CONTIGUOUS
+        )
+
+    with pytest.raises(BufferError):
+        host_buffer_view(b"irx", writable=True)
+    with pytest.raises(ValueError, match="unsupported host buffer format"):
+        host_buffer_view(memoryview(bytearray(4)).cast("c"))
+
+
+def test_host_buffer_view_exports_numpy_arrays() -> None:
+    """
+    title: NumPy arrays should export their layout without copying.
+    """
+    np = pytest.importorskip("numpy")
+    matrix = np.asfortranarray(np.arange(6, dtype=np.int32).reshape(2, 3))
+
+    with host_buffer_view(matrix) as exported:
+        view = exported.view
+        assert view.data == matrix.ctypes.data
+        assert view.dtype == BUFFER_DTYPE_INT32
+        assert (view.shape[0], view.shape[1]) == (2, 3)
+        assert (view.strides[0], view.strides[1]) == (4, 8)
+        assert view.flags & BUFFER_FLAG_F_CONTIGUOUS
+        assert not view.flags & BUFFER_FLAG_C_CONTIGUOUS
+
+
+def test_host_buffers_pass_to_native_kernels_without_copying() -> None:
+    """
+    title: Native writes through a host view should land in the host object.
+    """
+    with _load_kernel_library() as library:
+        values = array.array("i", [1, 2, 3, 4])
+        call_host_function(library.scale_i32, values, 10)
+        assert values.tolist() == [10, 20, 30, 40]
+
+        floats = array.array("d", [0.5, 1.0, 1.5, 2.0, 2.5])
+        strided = memoryview(floats)[1::2]
+        assert call_host_function(library.sum_f64, strided) == 3.0  # noqa: PLR2004
+
+
+def test_pyarrow_arrays_pass_as_views_or_c_data() -> None:
+    """
+    title: pyarrow arrays should reach native code as views or C Data.
+    """
+    source = pa.array([1, 2, None, 4, 5], type=pa.int64()).slice(1, 3)
+    with _load_kernel_library() as library:
+        assert call_host_function(library.arrow_sum_i64, source) == 6  # noqa: PLR2004
+
+        with host_arrow_array(source) as exported:
+            assert exported.array_address != 0
+            assert (
+                library.arrow_sum_i64(
+                    exported.array_address,
+                    exported.schema_address,
+                )
+                == 6  # noqa: PLR2004
+            )
+
+        with host_buffer_view(source) as exported:
+            view = exported.view
+            assert view.dtype == BUFFER_DTYPE_INT64
+            assert view.offset_bytes == 8  # noqa: PLR2004
+            assert view.flags & BUFFER_FLAG_VALIDITY_BITMAP
+            assert view.flags & BUFFER_FLAG_READONLY
+            assert view.data == source.buffers()[1].address
+
+        dense = pa.array([1, 2, 3, 4], type=pa.int64()).slice(1)
+        with host_buffer_view(dense) as exported:
+            assert call_host_function(library.sum_i64, exported) == 9  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="C Data interface"):
+        host_buffer_view(pa.array(["a"]))
+
+
+def test_external_owner_pins_host_object_until_native_release() -> None:
+    """
+    title: A native retain should keep the host object alive past release.
+    """
+    with _load_kernel_library() as library:
+        payload = _Payload(array.array("i", [3, 4, 5]).tobytes())
+        payload_ref = weakref.ref(payload)
+        exported = host_buffer_view(
+            memoryview(payload).cast("i"),
+            runtime=library,
+        )
+        assert exported.view.owner is not None
+        assert exported.view.flags & BUFFER_FLAG_EXTERNAL_OWNER
+
+        assert library.keep_view(exported.pointer) == 0
+        exported.release()
+        del payload
+        gc.collect()
+
+        assert payload_ref() is not None
+        assert library.kept_sum_i32() == 12  # noqa: PLR2004
+
+        assert library.drop_view() == 0
+        gc.collect()
+        assert payload_ref() is None
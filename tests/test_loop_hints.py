@@ -0,0 +1,410 @@
+"""
+title: Tests for loop optimization hints and llvm.loop metadata.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from irx import astx
+from irx.analysis import SemanticError, analyze
+from irx.builder import Builder
+from llvmlite import binding as llvm
+
+from tests.conftest import assert_ir_parses, build_and_run, make_main_module
+
+TENSOR_LENGTH = 1000
+# out[5] * 3 where out = a + a and a[5] = 5.
+EXPECTED_SCALED_ELEMENT = 30
+OPTIMIZED_LEVEL = 2
+
+
+def _loop_variable() -> astx.InlineVariableDeclaration:
+    """
+    title: Build the Int32 loop variable i.
+    returns:
+      type: astx.InlineVariableDeclaration
+    """
+    return astx.InlineVariableDeclaration(
+        "i",
+        type_=astx.Int32(),
+        mutability=astx.MutabilityKind.mutable,
+    )
+
+
+def _block(*nodes: astx.AST) -> astx.Block:
+    """
+    title: Build one block from statements.
+    parameters:
+      nodes:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.Block
+    """
+    block = astx.Block()
+    for node in nodes:
+        block.append(node)
+    return block
+
+
+def _hinted(loop: astx.AST, hints: astx.LoopHints) -> astx.AST:
+    """
+    title: Attach hints to one loop and return it.
+    parameters:
+      loop:
+        type: astx.AST
+      hints:
+        type: astx.LoopHints
+    returns:
+      type: astx.AST
+    """
+    astx.set_loop_hints(loop, hints)
+    return loop
+
+
+def _tensor(name: str, value: astx.AST) -> astx.VariableDeclaration:
+    """
+    title: Declare one Int32 tensor binding.
+    parameters:
+      name:
+        type: str
+      value:
+        type: astx.AST
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.TensorType(astx.Int32()),
+        mutability=astx.MutabilityKind.constant,
+        value=value,
+    )
+
+
+def _doubled_a() -> astx.TensorElementwise:
+    """
+    title: Build the fresh owned tensor a + a.
+    returns:
+      type: astx.TensorElementwise
+    """
+    return astx.TensorElementwise(
+        "+", astx.Identifier("a"), astx.Identifier("a")
+    )
+
+
+def _scaling_program(hints: astx.LoopHints | None) -> astx.Module:
+    """
+    title: Build a program that scales one heap tensor into another.
+    summary: >-
+      Both tensors are fresh operation results, so LLVM cannot prove on its
+      own that the store never overwrites a later load.
+    parameters:
+      hints:
+        type: astx.LoopHints | None
+    returns:
+      type: astx.Module
+    """
+    loop = astx.ForRangeLoopStmt(
+        variable=_loop_variable(),
+        start=astx.LiteralInt32(0),
+        end=astx.LiteralInt32(TENSOR_LENGTH),
+        step=astx.LiteralInt32(1),
+        body=_block(
+            astx.TensorStore(
+                astx.Identifier("scaled"),
+                [astx.Identifier("i")],
+                astx.BinaryOp(
+                    "*",
+                    astx.TensorIndex(
+                        astx.Identifier("doubled"), [astx.Identifier("i")]
+                    ),
+                    astx.LiteralInt32(3),
+                ),
+            )
+        ),
+    )
+    if hints is not None:
+        astx.set_loop_hints(loop, hints)
+    return make_main_module(
+        _tensor(
+            "a",
+            astx.TensorLiteral(
+                [astx.LiteralInt32(index) for index in range(TENSOR_LENGTH)],
+                element_type=astx.Int32(),
+                shape=(TENSOR_LENGTH,),
+            ),
+        ),
+        _tensor("doubled", _doubled_a()),
+        _tensor("scaled", _doubled_a()),
+        loop,
+        astx.FunctionReturn(
+            astx.TensorIndex(astx.Identifier("scaled"), [astx.LiteralInt32(5)])
+        ),
+    )
+
+
+def _optimize(ir_text: str) -> str:
+    """
+    title: Run LLVM's O2 module pipeline over IR text.
+    parameters:
+      ir_text:
+        type: str
+    returns:
+      type: str
+    """
+    module = llvm.parse_assembly(ir_text)
+    target_machine = llvm.Target.from_default_triple().create_target_machine()
+    pass_builder = llvm.create_pass_builder(
+        target_machine,
+        llvm.create_pipeline_tuning_options(speed_level=OPTIMIZED_LEVEL),
+    )
+    pass_builder.getModulePassManager().run(module, pass_builder)
+    return str(module)
+
+
+def test_loop_hints_lower_to_llvm_loop_properties() -> None:
+    """
+    title: Hints should become properties of one self-referential loop id.
+    """
+    ir_text = Builder().translate(
+        _scaling_program(
+            astx.LoopHints(vector_width=8, interleave_count=2, unroll_count=4)
+        )
+    )
+
+    assert '!{ !"llvm.loop.vectorize.enable", i1 1 }' in ir_text
+    assert '!{ !"llvm.loop.vectorize.width", i32 8 }' in ir_text
+    assert '!{ !"llvm.loop.interleave.count", i32 2 }' in ir_text
+    assert '!{ !"llvm.loop.unroll.count", i32 4 }' in ir_text
+    assert 'br label %"for.range.cond", !llvm.loop' in ir_text
+    assert "llvm.access.group" not in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_while_and_for_count_loops_accept_hints() -> None:
+    """
+    title: Every loop form should carry its hints on the back edge.
+    """
+    counter = astx.VariableDeclaration(
+        name="n",
+        type_=astx.Int32(),
+        mutability=astx.MutabilityKind.mutable,
+        value=astx.LiteralInt32(0),
+    )
+    step = astx.VariableAssignment(
+        "n", astx.BinaryOp("+", astx.Identifier("n"), astx.LiteralInt32(1))
+    )
+    while_loop = _hinted(
+        astx.WhileStmt(
+            condition=astx.BinaryOp(
+                "<", astx.Identifier("n"), astx.LiteralInt32(4)
+            ),
+            body=_block(step),
+        ),
+        astx.LoopHints(unroll=False),
+    )
+    count_loop = _hinted(
+        astx.ForCountLoopStmt(
+            initializer=astx.InlineVariableDeclaration(
+                "k",
+                type_=astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+                value=astx.LiteralInt32(0),
+            ),
+            condition=astx.BinaryOp(
+                "<", astx.Identifier("k"), astx.LiteralInt32(4)
+            ),
+            update=astx.UnaryOp("++", astx.Identifier("k")),
+            body=_block(
+                astx.VariableAssignment(
+                    "n",
+                    astx.BinaryOp(
+                        "+", astx.Identifier("n"), astx.LiteralInt32(1)
+                    ),
+                )
+            ),
+        ),
+        astx.LoopHints(vectorize=False),
+    )
+
+    ir_text = Builder().translate(
+        make_main_module(
+            counter,
+            while_loop,
+            count_loop,
+            astx.FunctionReturn(astx.Identifier("n")),
+        )
+    )
+
+    assert 'br label %"while.cond", !llvm.loop' in ir_text
+    assert '!{ !"llvm.loop.unroll.disable" }' in ir_text
+    assert 'br label %"for.count.cond", !llvm.loop' in ir_text
+    assert '!{ !"llvm.loop.vectorize.enable", i1 0 }' in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_independent_loop_skips_runtime_alias_checks() -> None:
+    """
+    title: Independent loops should vectorize without runtime alias checks.
+    """
+    plain = _optimize(Builder().translate(_scaling_program(None)))
+    independent_ir = Builder().translate(
+        _scaling_program(astx.LoopHints(independent=True))
+    )
+    independent = _optimize(independent_ir)
+
+    assert "!llvm.access.group" in independent_ir
+    assert '!"llvm.loop.parallel_accesses"' in independent_ir
+    assert "vector.memcheck" in plain
+    assert "vector.body" in independent
+    assert "vector.memcheck" not in independent
+
+
+def test_parallel_loop_body_is_marked_independent() -> None:
+    """
+    title: The outlined chunk loop of a parallel loop should be parallel.
+    """
+    body = _block(
+        astx.TensorStore(
+            astx.Identifier("scaled"),
+            [astx.Identifier("i")],
+            astx.TensorIndex(
+                astx.Identifier("doubled"), [astx.Identifier("i")]
+            ),
+        )
+    )
+    ir_text = Builder().translate(
+        make_main_module(
+            _tensor(
+                "a",
+                astx.TensorLiteral(
+                    [astx.LiteralInt32(1)] * 4,
+                    element_type=astx.Int32(),
+                    shape=(4,),
+                ),
+            ),
+            _tensor("doubled", _doubled_a()),
+            _tensor("scaled", _doubled_a()),
+            astx.ParallelForRangeLoopStmt(
+                _loop_variable(),
+                astx.LiteralInt32(0),
+                astx.LiteralInt32(4),
+                astx.LiteralInt32(1),
+                body,
+            ),
+            astx.FunctionReturn(astx.LiteralInt32(0)),
+        )
+    )
+
+    assert 'br label %"irx.parallel.cond", !llvm.loop' in ir_text
+    assert '!"llvm.loop.parallel_accesses"' in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_optimized_build_matches_unoptimized_result() -> None:
+    """
+    title: Builder(opt_level=2) should run the pipeline and keep results.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    result = build_and_run(
+        Builder(opt_level=OPTIMIZED_LEVEL),
+        _scaling_program(
+            astx.LoopHints(independent=True, vector_width=4, unroll_count=2)
+        ),
+    )
+
+    assert result.returncode == EXPECTED_SCALED_ELEMENT, result.stderr
+
+
+def test_builder_rejects_unknown_opt_level() -> None:
+    """
+    title: Builder should reject optimization levels LLVM does not define.
+    """
+    with pytest.raises(ValueError, match="opt_level must be between 0 and 3"):
+        Builder(opt_level=4)
+
+
+@pytest.mark.parametrize(
+    ("hints", "body", "message"),
+    [
+        (
+            astx.LoopHints(independent=True),
+            astx.VariableAssignment("total", astx.Identifier("i")),
+            "independent loop iterations cannot assign to enclosing "
+            "variable 'total'",
+        ),
+        (
+            astx.LoopHints(independent=True),
+            astx.BreakStmt(),
+            "break cannot leave an independent loop body",
+        ),
+        (
+            astx.LoopHints(vector_width=3),
+            astx.ContinueStmt(),
+            "power of two",
+        ),
+        (
+            astx.LoopHints(unroll=False, unroll_count=4),
+            astx.ContinueStmt(),
+            "conflicts with unroll=False",
+        ),
+    ],
+)
+def test_loop_hints_reject_invalid_requests(
+    hints: astx.LoopHints,
+    body: astx.AST,
+    message: str,
+) -> None:
+    """
+    title: Invalid hints and dependent independent loops should fail analysis.
+    parameters:
+      hints:
+        type: astx.LoopHints
+      body:
+        type: astx.AST
+      message:
+        type: str
+    """
+    loop = _hinted(
+        astx.ForRangeLoopStmt(
+            variable=_loop_variable(),
+            start=astx.LiteralInt32(0),
+            end=astx.LiteralInt32(4),
+            step=astx.LiteralInt32(1),
+            body=_block(body),
+        ),
+        hints,
+    )
+    module = make_main_module(
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralInt32(0),
+        ),
+        loop,
+        astx.FunctionReturn(astx.Identifier("total")),
+    )
+
+    with pytest.raises(SemanticError, match=message):
+        analyze(module)
+
+
+def test_independent_hint_requires_for_range_loop() -> None:
+    """
+    title: While loops cannot be hinted independent.
+    """
+    loop = _hinted(
+        astx.WhileStmt(condition=astx.LiteralBoolean(False), body=_block()),
+        astx.LoopHints(independent=True),
+    )
+
+    with pytest.raises(SemanticError, match="require a for-range loop"):
+        analyze(
+            make_main_module(loop, astx.FunctionReturn(astx.LiteralInt32(0)))
+        )
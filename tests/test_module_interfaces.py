@@ -0,0 +1,560 @@
+"""
+title: Tests for cached module interfaces and separately compiled objects.
+"""
+
+from __future__ import annotations
+
+import pickle
+import shutil
+import subprocess
+
+from pathlib import Path
+
+import pytest
+
+from irx import astx
+from irx.analysis import (
+    ModuleInterface,
+    ModuleInterfaceCache,
+    ParsedModule,
+    analyze_modules,
+    module_fingerprint,
+)
+from irx.analysis.module_artifacts import (
+    is_module_interface,
+    module_interface_ast,
+)
+from irx.analysis.module_symbols import mangle_function_name
+from irx.buffer import BufferIndexBoundsPolicy
+from irx.builder import Builder
+
+from tests.conftest import (
+    StaticImportResolver,
+    assert_ir_parses,
+    make_parsed_module,
+)
+
+HAS_CLANG = shutil.which("clang") is not None
+STATIC_START = 3
+STATIC_STEP = 10
+AREA = 7
+# bump() leaves instances at 13; add(1, 2) + area + use_add() adds 3 + 7 + 9.
+EXPECTED_EXIT = STATIC_START + STATIC_STEP + 3 + AREA + 9
+
+
+def _int_function(name: str, *body_nodes: astx.AST) -> astx.FunctionDef:
+    """
+    title: Build a small int32-returning function.
+    parameters:
+      name:
+        type: str
+      body_nodes:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.FunctionDef
+    """
+    body = astx.Block()
+    for node in body_nodes:
+        body.append(node)
+    return astx.FunctionDef(
+        prototype=astx.FunctionPrototype(
+            name,
+            args=astx.Arguments(),
+            return_type=astx.Int32(),
+        ),
+        body=body,
+    )
+
+
+def _add_template() -> astx.FunctionDef:
+    """
+    title: Build add(lhs, rhs) templated over a small Number domain.
+    returns:
+      type: astx.FunctionDef
+    """
+
+    def _number() -> astx.TemplateTypeVar:
+        """
+        title: Build one Number-bounded template type variable.
+        returns:
+          type: astx.TemplateTypeVar
+        """
+        return astx.TemplateTypeVar(
+            "T",
+            bound=astx.UnionType(
+                (astx.Int32(), astx.Float64()),
+                alias_name="Number",
+            ),
+        )
+
+    prototype = astx.FunctionPrototype(
+        "add",
+        args=astx.Arguments(
+            astx.Argument("lhs", _number()),
+            astx.Argument("rhs", _number()),
+        ),
+        return_type=_number(),
+    )
+    astx.set_template_params(
+        prototype,
+        (astx.TemplateParam("T", _number().bound),),
+    )
+    body = astx.Block()
+    body.append(
+        astx.FunctionReturn(
+            astx.BinaryOp("+", astx.Identifier("lhs"), astx.Identifier("rhs"))
+        )
+    )
+    return astx.FunctionDef(prototype=prototype, body=body)
+
+
+def _counter_class() -> astx.ClassDefStmt:
+    """
+    title: Build a class with static storage and two methods.
+    returns:
+      type: astx.ClassDefStmt
+    """
+    instances = astx.VariableDeclaration(
+        name="instances",
+        type_=astx.Int32(),
+        mutability=astx.MutabilityKind.mutable,
+        scope=astx.ScopeKind.global_,
+        value=astx.LiteralInt32(STATIC_START),
+    )
+    instances.is_static = True
+    bump = _int_function(
+        "bump",
+        astx.BinaryOp(
+            "=",
+            astx.StaticFieldAccess("Counter", "instances"),
+            astx.BinaryOp(
+                "+",
+                astx.StaticFieldAccess("Counter", "instances"),
+                astx.LiteralInt32(STATIC_STEP),
+            ),
+        ),
+        astx.FunctionReturn(astx.StaticFieldAccess("Counter", "instances")),
+    )
+    bump.prototype.is_static = True
+    area = _int_function(
+        "area",
+        astx.FunctionReturn(astx.LiteralInt32(AREA)),
+    )
+    return astx.ClassDefStmt(
+        name="Counter",
+        attributes=[instances],
+        methods=[bump, area],
+    )
+
+
+def _lib_module(addend: int = 5) -> ParsedModule:
+    """
+    title: Build the dependency module as a parser would.
+    parameters:
+      addend:
+        type: int
+    returns:
+      type: ParsedModule
+    """
+    return make_parsed_module(
+        "lib",
+        _add_template(),
+        _counter_class(),
+        _int_function(
+            "use_add",
+            astx.FunctionReturn(
+                astx.FunctionCall(
+                    "add",
+                    [astx.LiteralInt32(4), astx.LiteralInt32(addend)],
+                )
+            ),
+        ),
+    )
+
+
+def _app_module() -> ParsedModule:
+    """
+    title: Build the root module that imports lib.
+    returns:
+      type: ParsedModule
+    """
+    return make_parsed_module(
+        "app",
+        astx.ImportFromStmt(
+            module="lib",
+            names=[
+                astx.AliasExpr("add"),
+                astx.AliasExpr("Counter"),
+                astx.AliasExpr("use_add"),
+            ],
+        ),
+        _int_function(
+            "main",
+            astx.VariableDeclaration(
+                name="bumped",
+                type_=astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+                value=astx.StaticMethodCall("Counter", "bump", []),
+            ),
+            astx.FunctionReturn(
+                astx.BinaryOp(
+                    "+",
+                    astx.BinaryOp(
+                        "+",
+                        astx.StaticFieldAccess("Counter", "instances"),
+                        astx.FunctionCall(
+                            "add",
+                            [astx.LiteralInt32(1), astx.LiteralInt32(2)],
+                        ),
+                    ),
+                    astx.BinaryOp(
+                        "+",
+                        astx.MethodCall(
+                            astx.ClassConstruct("Counter"), "area", []
+                        ),
+                        astx.FunctionCall("use_add", []),
+                    ),
+                ),
+            ),
+        ),
+    )
+
+
+def test_module_fingerprint_is_stable_across_parses() -> None:
+    """
+    title: Rebuilt ASTs agree on a fingerprint until a body changes.
+    """
+    assert module_fingerprint(_lib_module()) == module_fingerprint(
+        _lib_module()
+    )
+    assert module_fingerprint(_lib_module()) != module_fingerprint(
+        _lib_module(addend=6)
+    )
+
+
+def test_module_interface_ast_keeps_only_declarations() -> None:
+    """
+    title: Interfaces keep prototypes, classes, and template definitions.
+    """
+    module = _lib_module().ast
+    interface = module_interface_ast(module)
+
+    kinds = [type(node) for node in interface.nodes]
+    assert kinds == [
+        astx.FunctionDef,
+        astx.ClassDefStmt,
+        astx.FunctionPrototype,
+    ]
+    assert is_module_interface(interface)
+    assert not is_module_interface(module)
+    assert isinstance(module.nodes[2], astx.FunctionDef)
+
+
+def test_module_interface_cache_round_trips(tmp_path: Path) -> None:
+    """
+    title: The cache needs both files and the current format version.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    parsed = _lib_module()
+    interface = ModuleInterface(
+        module_key=parsed.key,
+        fingerprint=module_fingerprint(parsed),
+        ast=module_interface_ast(parsed.ast),
+        symbols=("lib__use_add",),
+    )
+    assert cache.load(interface.fingerprint) is None
+
+    cache.store(interface, b"object")
+    loaded = cache.load(interface.fingerprint)
+    assert loaded is not None
+    assert loaded.symbols == ("lib__use_add",)
+    assert is_module_interface(loaded.ast)
+
+    cache.interface_path(interface.fingerprint).write_bytes(
+        pickle.dumps((0, interface))
+    )
+    assert cache.load(interface.fingerprint) is None
+
+    cache.store(interface, b"object")
+    cache.object_path(interface.fingerprint).unlink()
+    assert cache.load(interface.fingerprint) is None
+
+
+def test_module_interface_cache_treats_unreadable_files_as_missing(
+    tmp_path: Path,
+) -> None:
+    """
+    title: Truncated or corrupt interface files are cache misses.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    parsed = _lib_module()
+    interface = ModuleInterface(
+        module_key=parsed.key,
+        fingerprint=module_fingerprint(parsed),
+        ast=module_interface_ast(parsed.ast),
+    )
+    interface_path = cache.store(interface, b"object")
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [
+            interface_path.name,
+            cache.object_path(interface.fingerprint).name,
+        ]
+    )
+
+    complete = interface_path.read_bytes()
+    interface_path.write_bytes(complete[: len(complete) // 2])
+    assert cache.load(interface.fingerprint) is None
+
+    interface_path.write_bytes(b"not a pickle")
+    assert cache.load(interface.fingerprint) is None
+
+    interface_path.write_bytes(pickle.dumps("not a tuple"))
+    assert cache.load(interface.fingerprint) is None
+
+
+def test_module_interface_cache_checks_build_key(tmp_path: Path) -> None:
+    """
+    title: Each build key keeps its own interface and object files.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    parsed = _lib_module()
+    fingerprint = module_fingerprint(parsed)
+    for build_key in ("release", "debug"):
+        cache.store(
+            ModuleInterface(
+                module_key=parsed.key,
+                fingerprint=fingerprint,
+                ast=module_interface_ast(parsed.ast),
+                build_key=build_key,
+            ),
+            build_key.encode("utf8"),
+        )
+
+    assert cache.interface_path(fingerprint, "release") != (
+        cache.interface_path(fingerprint, "debug")
+    )
+    assert not cache.interface_path(fingerprint).exists()
+    assert not cache.object_path(fingerprint).exists()
+    assert cache.object_path(fingerprint, "release").read_bytes() == (
+        b"release"
+    )
+    assert cache.load(fingerprint) is not None
+    for build_key in ("release", "debug"):
+        loaded = cache.configured(build_key).load(fingerprint)
+        assert loaded is not None
+        assert loaded.build_key == build_key
+    assert cache.configured("profile").load(fingerprint) is None
+
+
+def test_compile_module_interfaces_caches_each_dependency(
+    tmp_path: Path,
+) -> None:
+    """
+    title: Dependencies are compiled once and then reused.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    resolver = StaticImportResolver({"lib": _lib_module()})
+
+    (interface,) = Builder().compile_module_interfaces(
+        _app_module(), resolver, cache
+    )
+
+    assert interface.module_key == "lib"
+    assert mangle_function_name("lib", "use_add") in interface.symbols
+    assert not any("add__" in symbol for symbol in interface.symbols)
+    object_path = cache.object_path(interface.fingerprint, interface.build_key)
+    compiled_at = object_path.stat().st_mtime_ns
+
+    (reused,) = Builder().compile_module_interfaces(
+        _app_module(), resolver, cache
+    )
+    assert reused.fingerprint == interface.fingerprint
+    assert object_path.stat().st_mtime_ns == compiled_at
+
+
+def test_compile_module_interfaces_recompiles_for_other_options(
+    tmp_path: Path,
+) -> None:
+    """
+    title: Builder options keep separate cache entries that are each reused.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    resolver = StaticImportResolver({"lib": _lib_module()})
+    use_add = mangle_function_name("lib", "use_add")
+
+    (default,) = Builder().compile_module_interfaces(
+        _app_module(), resolver, cache
+    )
+    (optimized,) = Builder(opt_level=2).compile_module_interfaces(
+        _app_module(), resolver, cache
+    )
+
+    assert optimized.fingerprint == default.fingerprint
+    assert optimized.build_key != default.build_key
+    assert cache.object_path(default.fingerprint, default.build_key).is_file()
+    assert cache.object_path(
+        optimized.fingerprint, optimized.build_key
+    ).is_file()
+
+    default_interface = cache.interface_path(
+        default.fingerprint, default.build_key
+    )
+    default_object = cache.object_path(default.fingerprint, default.build_key)
+    stored_at = (
+        default_interface.stat().st_mtime_ns,
+        default_object.stat().st_mtime_ns,
+    )
+    (again,) = Builder().compile_module_interfaces(
+        _app_module(), resolver, cache
+    )
+    assert again.build_key == default.build_key
+    assert (
+        default_interface.stat().st_mtime_ns,
+        default_object.stat().st_mtime_ns,
+    ) == stored_at
+
+    reused = Builder(opt_level=2).translate_modules(
+        _app_module(), resolver, interface_cache=cache
+    )
+    assert f'declare external i32 @"{use_add}"()' in reused
+
+    checked = Builder(
+        bounds_policy=BufferIndexBoundsPolicy.CHECKED
+    ).translate_modules(_app_module(), resolver, interface_cache=cache)
+    assert f'define i32 @"{use_add}"' in checked
+
+
+def test_analyze_modules_loads_current_interfaces(tmp_path: Path) -> None:
+    """
+    title: Sessions analyze unchanged dependencies from their interfaces.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    resolver = StaticImportResolver({"lib": _lib_module()})
+    Builder().compile_module_interfaces(_app_module(), resolver, cache)
+
+    session = analyze_modules(_app_module(), resolver, interface_cache=cache)
+
+    assert set(session.interfaces) == {"lib"}
+    assert is_module_interface(session.modules["lib"].ast)
+    assert not is_module_interface(session.modules["app"].ast)
+
+
+def test_analyze_modules_rejects_interfaces_of_changed_dependencies(
+    tmp_path: Path,
+) -> None:
+    """
+    title: An interface compiled against an older dependency is not reused.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    mid = make_parsed_module(
+        "mid",
+        astx.ImportFromStmt(module="lib", names=[astx.AliasExpr("use_add")]),
+        _int_function(
+            "twice",
+            astx.FunctionReturn(
+                astx.BinaryOp(
+                    "+",
+                    astx.FunctionCall("use_add", []),
+                    astx.FunctionCall("use_add", []),
+                )
+            ),
+        ),
+    )
+    root = make_parsed_module(
+        "app",
+        astx.ImportFromStmt(module="mid", names=[astx.AliasExpr("twice")]),
+        _int_function(
+            "main", astx.FunctionReturn(astx.FunctionCall("twice", []))
+        ),
+    )
+    Builder().compile_module_interfaces(
+        root,
+        StaticImportResolver({"lib": _lib_module(), "mid": mid}),
+        cache,
+    )
+
+    session = analyze_modules(
+        root,
+        StaticImportResolver({"lib": _lib_module(addend=6), "mid": mid}),
+        interface_cache=cache,
+    )
+
+    assert session.interfaces == {}
+    assert not is_module_interface(session.modules["mid"].ast)
+
+
+def test_translate_modules_declares_interface_functions(
+    tmp_path: Path,
+) -> None:
+    """
+    title: Lowering declares what the cached object defines.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path)
+    resolver = StaticImportResolver({"lib": _lib_module()})
+    Builder().compile_module_interfaces(_app_module(), resolver, cache)
+
+    ir_text = Builder().translate_modules(
+        _app_module(), resolver, interface_cache=cache
+    )
+
+    use_add = mangle_function_name("lib", "use_add")
+    assert f'declare external i32 @"{use_add}"()' in ir_text
+    assert f'define i32 @"{use_add}"' not in ir_text
+    assert '@"lib__Counter__static__instances" = external global' in ir_text
+    assert 'define linkonce_odr i32 @"lib__add' in ir_text
+    assert_ir_parses(ir_text)
+
+
+@pytest.mark.skipif(not HAS_CLANG, reason="clang is not available")
+def test_build_modules_links_cached_dependency_objects(
+    tmp_path: Path,
+) -> None:
+    """
+    title: A build against cached objects runs like a whole-graph build.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    cache = ModuleInterfaceCache(tmp_path / "cache")
+    resolver = StaticImportResolver({"lib": _lib_module()})
+    Builder().compile_module_interfaces(_app_module(), resolver, cache)
+
+    cached_output = tmp_path / "cached"
+    Builder().build_modules(
+        _app_module(),
+        resolver,
+        str(cached_output),
+        interface_cache=cache,
+    )
+    whole_output = tmp_path / "whole"
+    Builder().build_modules(_app_module(), resolver, str(whole_output))
+
+    cached = subprocess.run([str(cached_output)], check=False)
+    whole = subprocess.run([str(whole_output)], check=False)
+    assert cached.returncode == EXPECTED_EXIT
+    assert whole.returncode == EXPECTED_EXIT
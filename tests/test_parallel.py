@@ -0,0 +1,283 @@
+"""
+title: Tests for parallel for-range loops and the parallel runtime feature.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from irx import astx
+from irx.analysis import SemanticError, analyze
+from irx.builder import Builder
+from irx.builder.runtime.registry import get_default_runtime_feature_registry
+
+from tests.conftest import assert_ir_parses, build_and_run, make_main_module
+
+PARALLEL_ITERATIONS = 1000
+# max(i) + (3 * sum(i) + scale * PARALLEL_ITERATIONS) // 1000, wrapped to a
+# process exit status.
+EXPECTED_REDUCTION_RESULT = (999 + 1498 + 2) % 256
+POOL_THREADS = "4"
+
+
+def _mutable(
+    name: str,
+    type_: astx.DataType,
+    value: astx.AST,
+) -> astx.VariableDeclaration:
+    """
+    title: Declare one mutable local variable.
+    parameters:
+      name:
+        type: str
+      type_:
+        type: astx.DataType
+      value:
+        type: astx.AST
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=type_,
+        mutability=astx.MutabilityKind.mutable,
+        value=value,
+    )
+
+
+def _block(*nodes: astx.AST) -> astx.Block:
+    """
+    title: Build one block from statements.
+    parameters:
+      nodes:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.Block
+    """
+    block = astx.Block()
+    for node in nodes:
+        block.append(node)
+    return block
+
+
+def _parallel_loop(
+    *body: astx.AST,
+    schedule: str = "static",
+    chunk_size: int = 0,
+    reductions: dict[str, str] | None = None,
+    loop_type: astx.DataType | None = None,
+    step: astx.AST | None = None,
+) -> astx.ParallelForRangeLoopStmt:
+    """
+    title: Build one parallel loop over 0 <= i < PARALLEL_ITERATIONS.
+    parameters:
+      body:
+        type: astx.AST
+        variadic: positional
+      schedule:
+        type: str
+      chunk_size:
+        type: int
+      reductions:
+        type: dict[str, str] | None
+      loop_type:
+        type: astx.DataType | None
+      step:
+        type: astx.AST | None
+    returns:
+      type: astx.ParallelForRangeLoopStmt
+    """
+    return astx.ParallelForRangeLoopStmt(
+        astx.InlineVariableDeclaration(
+            "i",
+            type_=loop_type or astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+        ),
+        astx.LiteralInt32(0),
+        astx.LiteralInt32(PARALLEL_ITERATIONS),
+        step or astx.LiteralInt32(1),
+        _block(*body),
+        schedule=schedule,
+        chunk_size=chunk_size,
+        reductions=reductions,
+    )
+
+
+def _reduction_program(schedule: str, chunk_size: int) -> astx.Module:
+    """
+    title: Build a program that sums and maximizes over a parallel loop.
+    summary: >-
+      The body reads the enclosing scale variable, declares its own local,
+      and updates one "+" and one "max" reduction.
+    parameters:
+      schedule:
+        type: str
+      chunk_size:
+        type: int
+    returns:
+      type: astx.Module
+    """
+    return make_main_module(
+        _mutable("scale", astx.Int64(), astx.LiteralInt64(2)),
+        _mutable("total", astx.Int64(), astx.LiteralInt64(0)),
+        _mutable("top", astx.Int32(), astx.LiteralInt32(0)),
+        _parallel_loop(
+            _mutable("wide", astx.Int64(), astx.Identifier("i")),
+            astx.VariableAssignment(
+                "total",
+                astx.BinaryOp(
+                    "+",
+                    astx.Identifier("total"),
+                    astx.BinaryOp(
+                        "+",
+                        astx.BinaryOp(
+                            "*", astx.Identifier("wide"), astx.LiteralInt64(3)
+                        ),
+                        astx.Identifier("scale"),
+                    ),
+                ),
+            ),
+            astx.IfStmt(
+                astx.BinaryOp(
+                    ">", astx.Identifier("i"), astx.Identifier("top")
+                ),
+                _block(astx.VariableAssignment("top", astx.Identifier("i"))),
+            ),
+            schedule=schedule,
+            chunk_size=chunk_size,
+            reductions={"total": "+", "top": "max"},
+        ),
+        _mutable(
+            "scaled",
+            astx.Int32(),
+            astx.Cast(
+                astx.BinaryOp(
+                    "/",
+                    astx.Identifier("total"),
+                    astx.LiteralInt64(PARALLEL_ITERATIONS),
+                ),
+                astx.Int32(),
+            ),
+        ),
+        astx.FunctionReturn(
+            astx.BinaryOp(
+                "+", astx.Identifier("top"), astx.Identifier("scaled")
+            )
+        ),
+    )
+
+
+def test_parallel_feature_is_registered_as_c_runtime() -> None:
+    """
+    title: The default registry should expose the parallel runtime feature.
+    """
+    feature = get_default_runtime_feature_registry().get("parallel")
+
+    assert [artifact.kind for artifact in feature.artifacts] == ["c_source"]
+    assert {"irx_parallel_for", "irx_parallel_thread_count"} <= set(
+        feature.symbols
+    )
+    assert "-pthread" in feature.linker_flags
+
+
+def test_parallel_loop_outlines_body_into_runtime_call() -> None:
+    """
+    title: The loop body should become an internal worker function.
+    """
+    ir_text = Builder().translate(_reduction_program("dynamic", 16))
+
+    assert 'define internal void @"irx_parallel_body"' in ir_text
+    assert '@"irx_parallel_for"' in ir_text
+    assert '@"irx_parallel_thread_count"' in ir_text
+    assert "i32 1, i64 16)" in ir_text
+    assert "total_private" in ir_text
+    assert "irx.parallel.combine" in ir_text
+    assert_ir_parses(ir_text)
+
+
+@pytest.mark.parametrize(
+    ("schedule", "chunk_size"),
+    [("static", 0), ("static", 7), ("dynamic", 0), ("dynamic", 5)],
+)
+def test_parallel_loop_reductions_match_serial_result(
+    schedule: str,
+    chunk_size: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    title: Every schedule should produce the serial reduction results.
+    parameters:
+      schedule:
+        type: str
+      chunk_size:
+        type: int
+      monkeypatch:
+        type: pytest.MonkeyPatch
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+    monkeypatch.setenv("IRX_NUM_THREADS", POOL_THREADS)
+
+    result = build_and_run(Builder(), _reduction_program(schedule, chunk_size))
+
+    assert result.returncode == EXPECTED_REDUCTION_RESULT, result.stderr
+
+
+@pytest.mark.parametrize(
+    ("loop", "message"),
+    [
+        (
+            _parallel_loop(
+                astx.VariableAssignment("total", astx.Identifier("total"))
+            ),
+            "cannot assign to enclosing variable 'total'",
+        ),
+        (
+            _parallel_loop(astx.BreakStmt()),
+            "break cannot leave a parallel loop body",
+        ),
+        (
+            _parallel_loop(astx.FunctionReturn(astx.LiteralInt32(0))),
+            "return cannot leave a parallel loop body",
+        ),
+        (
+            _parallel_loop(schedule="guided"),
+            "unsupported parallel schedule",
+        ),
+        (
+            _parallel_loop(step=astx.Identifier("total")),
+            "positive integer literal step",
+        ),
+        (
+            _parallel_loop(loop_type=astx.Float64()),
+            "loop variable must be an integer",
+        ),
+        (
+            _parallel_loop(reductions={"total": "-"}),
+            "unsupported parallel reduction",
+        ),
+    ],
+)
+def test_parallel_loop_rejects_dependent_iterations(
+    loop: astx.ParallelForRangeLoopStmt,
+    message: str,
+) -> None:
+    """
+    title: Iterations that are not independent should fail analysis.
+    parameters:
+      loop:
+        type: astx.ParallelForRangeLoopStmt
+      message:
+        type: str
+    """
+    module = make_main_module(
+        _mutable("total", astx.Int32(), astx.LiteralInt32(0)),
+        loop,
+        astx.FunctionReturn(astx.Identifier("total")),
+    )
+
+    with pytest.raises(SemanticError, match=message):
+        analyze(module)
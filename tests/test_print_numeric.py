@@ -2,12 +2,18 @@
 title: Tests for numeric and expression-based PrintExpr lowering.
 """
 
+from pathlib import Path
+
 from irx import astx
 from irx.analysis.module_symbols import mangle_function_name
 from irx.builder import Builder
 from irx.system import PrintExpr
 from llvmlite import binding as llvm
 
+from tests.conftest import assert_build_output, make_main_module
+
+UINT64_MAX = 2**64 - 1
+
 
 def _translate_and_validate(module: astx.Module) -> str:
     """
@@ -24,22 +30,24 @@ def _translate_and_validate(module: astx.Module) -> str:
     return ir_text
 
 
-def _assert_puts_uses_char_ptr(ir_text: str) -> None:
+def _assert_prints_without_heap(ir_text: str, symbol: str) -> None:
     """
-    title: Assert puts uses char ptr.
+    title: Assert PrintExpr wrote through one buffered print entry point.
     parameters:
       ir_text:
         type: str
+      symbol:
+        type: str
     """
-    assert 'call i32 @"puts"(i8*' in ir_text
-    assert 'call i32 @"puts"(i32' not in ir_text
-    assert 'call i32 @"puts"(float' not in ir_text
-    assert 'call i32 @"puts"(double' not in ir_text
+    assert f'call void @"{symbol}"(' in ir_text
+    assert '@"snprintf"' not in ir_text
+    assert '@"malloc"' not in ir_text
+    assert '@"puts"' not in ir_text
 
 
 def test_print_integer_literal_codegen() -> None:
     """
-    title: PrintExpr should format integer literals through snprintf + puts.
+    title: PrintExpr should write integer literals through the print runtime.
     """
     module = astx.Module()
 
@@ -52,14 +60,13 @@ def test_print_integer_literal_codegen() -> None:
     module.block.append(astx.FunctionDef(prototype=main_proto, body=main_body))
 
     ir_text = _translate_and_validate(module)
-    assert "%lld" in ir_text
-    assert '@"snprintf"' in ir_text
-    _assert_puts_uses_char_ptr(ir_text)
+    assert 'call void @"irx_print_i64"(i64' in ir_text
+    _assert_prints_without_heap(ir_text, "irx_print_i64")
 
 
 def test_print_float_literal_codegen() -> None:
     """
-    title: PrintExpr should format float literals through snprintf + puts.
+    title: PrintExpr should write float literals through the print runtime.
     """
     module = astx.Module()
 
@@ -72,9 +79,8 @@ def test_print_float_literal_codegen() -> None:
     module.block.append(astx.FunctionDef(prototype=main_proto, body=main_body))
 
     ir_text = _translate_and_validate(module)
-    assert "%.6f" in ir_text
-    assert '@"snprintf"' in ir_text
-    _assert_puts_uses_char_ptr(ir_text)
+    assert 'call void @"irx_print_f64"(double' in ir_text
+    _assert_prints_without_heap(ir_text, "irx_print_f64")
 
 
 def test_print_recursive_function_call_result_codegen() -> None:
@@ -140,8 +146,7 @@ def test_print_recursive_function_call_result_codegen() -> None:
     fib_name = mangle_function_name("main", "fib")
     assert f'define i32 @"{fib_name}"' in ir_text
     assert f'call i32 @"{fib_name}"(i32 10)' in ir_text
-    assert "%lld" in ir_text
-    _assert_puts_uses_char_ptr(ir_text)
+    _assert_prints_without_heap(ir_text, "irx_print_i64")
 
 
 def test_print_float_function_call_result_codegen() -> None:
@@ -191,5 +196,49 @@ def test_print_float_function_call_result_codegen() -> None:
     average_name = mangle_function_name("main", "average")
     assert f'define float @"{average_name}"' in ir_text
     assert f'call float @"{average_name}"' in ir_text
-    assert "%.6f" in ir_text
-    _assert_puts_uses_char_ptr(ir_text)
+    _assert_prints_without_heap(ir_text, "irx_print_f64")
+
+
+def test_print_runtime_formats_numbers_without_heap() -> None:
+    """
+    title: Buffered print output should match the previous printf formats.
+    """
+    builder = Builder()
+    module = make_main_module(
+        PrintExpr(astx.LiteralInt32(-42)),
+        PrintExpr(astx.LiteralUInt64(UINT64_MAX)),
+        PrintExpr(astx.LiteralFloat64(-2.5)),
+        PrintExpr(astx.LiteralBoolean(True)),
+        PrintExpr(astx.LiteralUTF8String("done")),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+    assert_build_output(
+        builder,
+        module,
+        f"-42\n{UINT64_MAX}\n-2.500000\n1\ndone",
+    )
+
+
+def test_only_executables_configure_stdout(tmp_path: Path) -> None:
+    """
+    title: Executable main should set up stdout; translated IR should not.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    builder = Builder()
+    module = make_main_module(
+        PrintExpr(astx.LiteralInt32(7)),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+    assert "irx_print_configure_stdout" not in builder.translate(module)
+
+    builder.build(module, str(tmp_path / "printer"))
+    ir_text = str(builder.translator._llvm.module)
+    main_entry = ir_text.split('define i32 @"main"()', 1)[1]
+    first_instruction = main_entry.split("entry:\n", 1)[1].split("\n")[0]
+    assert first_instruction.strip() == (
+        'call void @"irx_print_configure_stdout"()'
+    )
@@ -0,0 +1,250 @@
+"""
+title: Tests for the record batch and table runtime feature.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from irx.builder import Visitor
+from irx.builder.runtime.linking import link_executable
+from irx.builder.runtime.record_batch import (
+    build_record_batch_runtime_feature,
+)
+from irx.builder.runtime.registry import (
+    RuntimeFeatureState,
+    get_default_runtime_feature_registry,
+)
+
+RECORD_BATCH_HARNESS = """
+  #include <stdint.h>
+  #include <stdio.h>
+
+  #include "irx_arrow_runtime.h"
+
+  static irx_arrow_array_handle* build_column(
+      int32_t type_id, const void* values, int64_t count) {
+    irx_arrow_array_builder_handle* builder = NULL;
+    irx_arrow_array_handle* array = NULL;
+    if (irx_arrow_array_builder_new(type_id, &builder) != 0) return NULL;
+    if (irx_arrow_array_builder_append_n(builder, values, count, NULL) != 0 ||
+        irx_arrow_array_builder_finish(builder, &array) != 0) {
+      irx_arrow_array_builder_release(builder);
+      return NULL;
+    }
+    return array;
+  }
+
+  static const void* column_data(irx_arrow_array_handle* array,
+                                 int64_t* offset_bytes) {
+    irx_buffer_view view = {0};
+    if (irx_arrow_array_borrow_buffer_view(array, &view) != 0) return NULL;
+    *offset_bytes = view.offset_bytes;
+    return view.data;
+  }
+
+  int main(void) {
+    const char* names[2] = {"id", "score"};
+    int64_t ids[10];
+    double scores[10];
+    irx_arrow_record_batch_handle* batch = NULL;
+    irx_arrow_record_batch_handle* slice = NULL;
+    irx_arrow_table_handle* table = NULL;
+    irx_arrow_table_handle* table_slice = NULL;
+    irx_arrow_schema_handle* schema = NULL;
+    irx_arrow_array_handle* borrowed = NULL;
+    int64_t offset_bytes = 0;
+    for (int index = 0; index < 10; ++index) {
+      ids[index] = index;
+      scores[index] = index * 0.5;
+    }
+    irx_arrow_array_handle* columns[2] = {
+        build_column(IRX_ARROW_TYPE_INT64, ids, 10),
+        build_column(IRX_ARROW_TYPE_FLOAT64, scores, 9),
+    };
+    if (columns[0] == NULL || columns[1] == NULL) return 1;
+    if (irx_arrow_record_batch_make(2, names, columns, &batch) == 0) return 2;
+    irx_arrow_array_release(columns[1]);
+    columns[1] = build_column(IRX_ARROW_TYPE_FLOAT64, scores, 10);
+    if (irx_arrow_record_batch_make(2, names, columns, &batch) != 0) return 3;
+
+    const void* id_data = column_data(columns[0], &offset_bytes);
+    irx_arrow_array_release(columns[0]);
+    irx_arrow_array_release(columns[1]);
+
+    if (irx_arrow_record_batch_num_rows(batch) != 10) return 4;
+    if (irx_arrow_record_batch_num_columns(batch) != 2) return 5;
+    if (irx_arrow_record_batch_column_index(batch, "score") != 1) return 6;
+    if (irx_arrow_record_batch_column_index(batch, "missing") != -1) return 7;
+    if (irx_arrow_record_batch_column_schema(batch, 1, &schema) != 0) return 8;
+    if (irx_arrow_schema_type_id(schema) != IRX_ARROW_TYPE_FLOAT64) return 9;
+    irx_arrow_schema_release(schema);
+    if (irx_arrow_record_batch_borrow_column(batch, 2, &borrowed) == 0) {
+      return 10;
+    }
+    if (irx_arrow_record_batch_borrow_column(batch, 0, &borrowed) != 0) {
+      return 11;
+    }
+    if (column_data(borrowed, &offset_bytes) != id_data) return 12;
+
+    if (irx_arrow_record_batch_slice(batch, 8, 3, &slice) == 0) return 13;
+    if (irx_arrow_record_batch_slice(batch, 2, 5, &slice) != 0) return 14;
+    if (irx_arrow_record_batch_num_rows(slice) != 5) return 15;
+    irx_arrow_record_batch_borrow_column(slice, 0, &borrowed);
+    if (column_data(borrowed, &offset_bytes) != id_data) return 16;
+    if (offset_bytes != 2 * (int64_t)sizeof(int64_t)) return 17;
+
+    irx_arrow_record_batch_handle* parts[2] = {batch, slice};
+    if (irx_arrow_table_from_record_batches(2, parts, &table) != 0) return 18;
+    irx_arrow_record_batch_release(slice);
+    if (irx_arrow_record_batch_retain(batch) != 0) return 19;
+    irx_arrow_record_batch_release(batch);
+    irx_arrow_record_batch_release(batch);
+
+    if (irx_arrow_table_num_rows(table) != 15) return 20;
+    if (irx_arrow_table_num_columns(table) != 2) return 21;
+    if (irx_arrow_table_column_index(table, "id") != 0) return 22;
+    if (irx_arrow_table_num_chunks(table, 0) != 2) return 23;
+    if (irx_arrow_table_column_schema(table, 0, &schema) != 0) return 24;
+    if (irx_arrow_schema_type_id(schema) != IRX_ARROW_TYPE_INT64) return 25;
+    irx_arrow_schema_release(schema);
+    if (irx_arrow_table_borrow_chunk(table, 0, 1, &borrowed) != 0) return 26;
+    if (irx_arrow_array_length(borrowed) != 5) return 27;
+    if (column_data(borrowed, &offset_bytes) != id_data) return 28;
+
+    if (irx_arrow_table_slice(table, 8, 5, &table_slice) != 0) return 29;
+    irx_arrow_table_release(table);
+    if (irx_arrow_table_num_rows(table_slice) != 5) return 30;
+    int64_t total = 0;
+    for (int32_t chunk = 0; chunk < irx_arrow_table_num_chunks(table_slice, 0);
+         ++chunk) {
+      irx_arrow_table_borrow_chunk(table_slice, 0, chunk, &borrowed);
+      const int64_t* values =
+          (const int64_t*)((const char*)column_data(borrowed, &offset_bytes) +
+                           offset_bytes);
+      for (int64_t index = 0; index < irx_arrow_array_length(borrowed);
+           ++index) {
+        total += values[index];
+      }
+    }
+    irx_arrow_table_release(table_slice);
+    printf("%lld\\n", (long long)total);
+    return 0;
+  }
+"""
+
+
+def _run_record_batch_harness(
+    source: str,
+) -> subprocess.CompletedProcess[str]:
+    """
+    title: Compile one C harness against the record batch runtime and run it.
+    parameters:
+      source:
+        type: str
+    returns:
+      type: subprocess.CompletedProcess[str]
+    """
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for record batch harness tests")
+
+    feature = build_record_batch_runtime_feature()
+    include_dirs = dict.fromkeys(
+        include_dir
+        for artifact in feature.artifacts
+        for include_dir in artifact.include_dirs
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "record_batch_harness.c"
+        object_path = tmp_path / "record_batch_harness.o"
+        output_path = tmp_path / "record_batch_harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+        subprocess.run(
+            [
+                clang_binary,
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+                "-std=c99",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=output_path,
+            artifacts=feature.artifacts,
+            linker_flags=feature.linker_flags,
+            clang_binary=clang_binary,
+        )
+        return subprocess.run(
+            [str(output_path)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+
+def test_record_batch_feature_is_registered() -> None:
+    """
+    title: The default registry should expose the record batch feature.
+    """
+    feature = get_default_runtime_feature_registry().get("record_batch")
+
+    assert feature.metadata["canonical_name"] == "record_batch"
+    assert [artifact.kind for artifact in feature.artifacts] == ["cxx_source"]
+    assert {
+        "irx_arrow_record_batch_make",
+        "irx_arrow_record_batch_borrow_column",
+        "irx_arrow_record_batch_slice",
+        "irx_arrow_table_from_record_batches",
+        "irx_arrow_table_borrow_chunk",
+        "irx_arrow_table_slice",
+    } <= set(feature.symbols)
+
+
+def test_record_batch_symbols_declare_llvm_functions() -> None:
+    """
+    title: Every record batch symbol should lower to one LLVM declaration.
+    """
+    visitor = Visitor()
+    state = RuntimeFeatureState(
+        visitor,
+        get_default_runtime_feature_registry(),
+    )
+    feature = build_record_batch_runtime_feature()
+
+    for symbol_name in feature.symbols:
+        state.require_symbol("record_batch", symbol_name)
+
+    ir_text = str(visitor._llvm.module)
+    assert 'declare external i32 @"irx_arrow_record_batch_make"' in ir_text
+    assert 'declare external void @"irx_arrow_table_release"' in ir_text
+    assert state.active_feature_names() == ("record_batch",)
+
+
+def test_record_batches_and_tables_share_column_buffers() -> None:
+    """
+    title: Batches, tables, and their slices should reuse the column buffers.
+    """
+    result = _run_record_batch_harness(RECORD_BATCH_HARNESS)
+
+    assert result.returncode == 0, result.stderr or result.stdout
+    assert result.stdout.strip() == str(sum([8, 9, 2, 3, 4]))
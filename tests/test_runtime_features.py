@@ -175,9 +175,9 @@ def test_runtime_feature_state_collects_only_active_artifacts() -> None:
     assert [artifact.path for artifact in artifacts] == [Path("/tmp/b.c")]
 
 
-def test_print_expr_uses_libc_feature_without_array_runtime() -> None:
+def test_print_expr_uses_print_feature_without_array_runtime() -> None:
     """
-    title: PrintExpr should activate libc without pulling in the array runtime.
+    title: PrintExpr should activate print without the array runtime.
     """
     builder = Builder()
     module = astx.Module()
@@ -196,10 +196,10 @@ def test_print_expr_uses_libc_feature_without_array_runtime() -> None:
         builder.translator.runtime_features.active_feature_names()
     )
 
-    assert "libc" in active_features
+    assert "print" in active_features
     assert "array" not in active_features
-    assert '@"puts"' in ir_text
-    assert '@"snprintf"' in ir_text
+    assert '@"irx_print_i64"' in ir_text
+    assert '@"snprintf"' not in ir_text
 
 
 def test_simple_module_has_no_native_runtime_artifacts() -> None:
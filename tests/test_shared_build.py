@@ -0,0 +1,208 @@
+"""
+title: Tests for shared-library builds with C ABI entry points.
+"""
+
+from __future__ import annotations
+
+import array
+import ctypes
+import shutil
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from irx import astx
+from irx.builder import Builder
+from irx.builder.exports import SharedExport, emit_shared_exports
+from irx.diagnostics import LinkingError
+from irx.interop import BufferViewStruct, call_host_function
+
+from tests.conftest import assert_ir_parses
+
+HAS_CLANG = shutil.which("clang") is not None
+EXPECTED_SUM = 5
+EXPECTED_COUNT = 7
+
+
+def _function(
+    name: str,
+    *args: astx.Argument,
+    return_type: astx.DataType,
+    value: astx.Expr,
+) -> astx.FunctionDef:
+    """
+    title: Build one function that returns a single expression.
+    parameters:
+      name:
+        type: str
+      return_type:
+        type: astx.DataType
+      value:
+        type: astx.Expr
+      args:
+        type: astx.Argument
+        variadic: positional
+    returns:
+      type: astx.FunctionDef
+    """
+    body = astx.Block()
+    body.append(astx.FunctionReturn(value))
+    return astx.FunctionDef(
+        prototype=astx.FunctionPrototype(
+            name,
+            args=astx.Arguments(*args),
+            return_type=return_type,
+        ),
+        body=body,
+    )
+
+
+def _kernel_module() -> astx.Module:
+    """
+    title: Build a module with scalar and buffer-view kernels.
+    returns:
+      type: astx.Module
+    """
+    module = astx.Module()
+    module.block.append(
+        _function(
+            "add",
+            astx.Argument("lhs", astx.Int32()),
+            astx.Argument("rhs", astx.Int32()),
+            return_type=astx.Int32(),
+            value=astx.BinaryOp(
+                "+",
+                astx.Identifier("lhs"),
+                astx.Identifier("rhs"),
+            ),
+        )
+    )
+    module.block.append(
+        _function(
+            "count",
+            astx.Argument("view", astx.BufferViewType(astx.Int64())),
+            astx.Argument("fallback", astx.Int32()),
+            return_type=astx.Int32(),
+            value=astx.Identifier("fallback"),
+        )
+    )
+    module.block.append(
+        _function(
+            "helper",
+            return_type=astx.Int32(),
+            value=astx.LiteralInt32(1),
+        )
+    )
+    return module
+
+
+def test_shared_exports_pass_aggregates_by_pointer() -> None:
+    """
+    title: Exports should wrap IRx functions that take views by value.
+    """
+    builder = Builder()
+    module = _kernel_module()
+    builder.translate(module)
+    llvm_module = builder.translator._llvm.module
+    exports = builder._shared_export_targets(module, llvm_module, None)
+    emitted = emit_shared_exports(llvm_module, exports)
+    ir_text = str(llvm_module)
+
+    assert SharedExport("count", "main__count", (0,), False) in emitted
+    assert (
+        'define i32 @"count"(%"irx_buffer_view"* %"view", i32 %"fallback")'
+    ) in ir_text
+    assert 'define i32 @"add"(i32 %"lhs", i32 %"rhs")' in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_shared_exports_import_string_arguments() -> None:
+    """
+    title: Exported string parameters should be converted in the wrapper.
+    """
+    builder = Builder()
+    module = astx.Module()
+    module.block.append(
+        _function(
+            "echo",
+            astx.Argument("text", astx.String()),
+            return_type=astx.String(),
+            value=astx.Identifier("text"),
+        )
+    )
+    builder.translate(module)
+    llvm_module = builder.translator._llvm.module
+    targets = builder._shared_export_targets(module, llvm_module, None)
+    import_string = builder.translator.require_runtime_symbol(
+        "string", "irx_string_from_cstr"
+    )
+    emitted = emit_shared_exports(
+        llvm_module,
+        targets,
+        string_args=builder._shared_export_string_args(module, targets),
+        import_string=import_string,
+    )
+    ir_text = str(llvm_module)
+
+    assert emitted == (SharedExport("echo", "main__echo", string_args=(0,)),)
+    wrapper = ir_text.split('define i8* @"echo"', 1)[1].split("}", 1)[0]
+    assert 'call i8* @"irx_string_from_cstr"(i8* %"text")' in wrapper
+    assert_ir_parses(ir_text)
+
+
+def test_build_shared_rejects_unknown_exports(tmp_path: Path) -> None:
+    """
+    title: Unknown export names should fail before linking.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    with pytest.raises(LinkingError, match=r"IRX-K002.*missing"):
+        Builder().build_shared(
+            _kernel_module(),
+            str(tmp_path / "libmissing.so"),
+            exports=["add", "missing"],
+        )
+
+
+@pytest.mark.skipif(not HAS_CLANG, reason="clang is not available")
+@pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="shared-library builds need ELF or Mach-O exports",
+)
+def test_build_shared_library_loads_through_ctypes(tmp_path: Path) -> None:
+    """
+    title: A shared build should expose only selected C ABI entry points.
+    parameters:
+      tmp_path:
+        type: Path
+    """
+    builder = Builder()
+    builder.activate_runtime_feature("buffer")
+    output_file = tmp_path / "libkernels.so"
+    exports = builder.build_shared(
+        _kernel_module(),
+        str(output_file),
+        exports=["add", "count"],
+        export_runtime_symbols=True,
+    )
+    assert [export.name for export in exports] == ["add", "count"]
+
+    library = ctypes.CDLL(str(output_file))
+    library.add.argtypes = [ctypes.c_int32, ctypes.c_int32]
+    library.add.restype = ctypes.c_int32
+    library.count.argtypes = [
+        ctypes.POINTER(BufferViewStruct),
+        ctypes.c_int32,
+    ]
+    library.count.restype = ctypes.c_int32
+
+    assert library.add(2, 3) == EXPECTED_SUM
+    values = array.array("q", [1, 2, 3])
+    assert call_host_function(library.count, values, 7) == EXPECTED_COUNT
+    assert hasattr(library, "irx_buffer_owner_external_new")
+    for hidden in ("helper", "main__helper", "main__add"):
+        with pytest.raises(AttributeError):
+            getattr(library, hidden)
@@ -0,0 +1,351 @@
+"""
+title: Tests for the length-prefixed string runtime and its lowering.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from irx import astx
+from irx.builder import Builder
+from irx.builder.runtime.linking import link_executable
+from irx.builder.runtime.registry import get_default_runtime_feature_registry
+from irx.builder.runtime.string.feature import (
+    STRING_HEADER_MAGIC,
+    build_string_runtime_feature,
+)
+from irx.system import PrintExpr
+
+from tests.conftest import (
+    assert_build_output,
+    assert_ir_parses,
+    make_main_module,
+)
+
+# lowercase "l" for strchr.
+ASCII_LOWER_L = 108
+
+
+def _string_decl(name: str, value: str) -> astx.VariableDeclaration:
+    """
+    title: Declare one mutable string variable.
+    parameters:
+      name:
+        type: str
+      value:
+        type: str
+    returns:
+      type: astx.VariableDeclaration
+    """
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.String(),
+        value=astx.LiteralString(value),
+        mutability=astx.MutabilityKind.mutable,
+    )
+
+
+def test_string_feature_is_registered_as_c_runtime() -> None:
+    """
+    title: The default registry should expose the string runtime feature.
+    """
+    feature = get_default_runtime_feature_registry().get("string")
+
+    assert feature.metadata["canonical_name"] == "string"
+    assert [artifact.kind for artifact in feature.artifacts] == ["c_source"]
+    assert {
+        "irx_string_length",
+        "irx_string_concat",
+        "irx_string_equals",
+        "irx_string_substring",
+        "irx_string_builder_new",
+        "irx_string_builder_append",
+        "irx_string_builder_finish",
+    } <= set(feature.symbols)
+
+
+def test_string_literals_carry_length_header() -> None:
+    """
+    title: Literals should be emitted with the runtime header in place.
+    """
+    builder = Builder()
+    ir_text = builder.translate(
+        make_main_module(
+            _string_decl("greeting", "héllo"),
+            astx.FunctionReturn(astx.LiteralInt32(0)),
+        )
+    )
+
+    assert_ir_parses(ir_text)
+    assert f"{{i64 6, i32 {STRING_HEADER_MAGIC}, i32 1, [7 x i8]" in ir_text
+    active = builder.translator.runtime_features.active_feature_names()
+    assert "string" not in active
+
+
+def test_compiler_owned_strings_always_carry_header() -> None:
+    """
+    title: Default and formatted strings should use the header layout too.
+    """
+    builder = Builder()
+    module = make_main_module(
+        astx.VariableDeclaration(
+            name="blank",
+            type_=astx.String(),
+            mutability=astx.MutabilityKind.mutable,
+        ),
+        astx.VariableDeclaration(
+            name="number",
+            type_=astx.String(),
+            value=astx.Cast(astx.LiteralInt32(42), astx.String()),
+            mutability=astx.MutabilityKind.mutable,
+        ),
+        PrintExpr(
+            astx.BinaryOp(
+                "+",
+                astx.Identifier("blank"),
+                astx.Identifier("number"),
+            )
+        ),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+    ir_text = builder.translate(module)
+
+    assert_ir_parses(ir_text)
+    assert f"{{i64 0, i32 {STRING_HEADER_MAGIC}, i32 1, [1 x i8]" in ir_text
+    assert 'call i8* @"irx_string_reserve"' in ir_text
+    assert "irx_string_adopt_cstr" not in ir_text
+    assert '@"malloc"' not in ir_text
+    assert_build_output(builder, module, "42")
+
+
+def test_string_concat_chain_uses_one_builder() -> None:
+    """
+    title: Long concatenation chains should share one sized builder.
+    """
+    builder = Builder()
+    module = make_main_module(
+        _string_decl("a", "ab"),
+        _string_decl("b", "cd"),
+        PrintExpr(
+            astx.BinaryOp(
+                "+",
+                astx.BinaryOp(
+                    "+",
+                    astx.BinaryOp(
+                        "+", astx.Identifier("a"), astx.Identifier("b")
+                    ),
+                    astx.LiteralString("-"),
+                ),
+                astx.Identifier("a"),
+            )
+        ),
+        PrintExpr(
+            astx.BinaryOp("+", astx.Identifier("b"), astx.Identifier("a"))
+        ),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+    ir_text = builder.translate(module)
+
+    assert_ir_parses(ir_text)
+    assert ir_text.count('call i8* @"irx_string_builder_new"') == 1
+    assert ir_text.count('call i8* @"irx_string_concat"') == 1
+    assert "strcat_inline" not in ir_text
+    assert_build_output(builder, module, "abcd-ab\ncdab")
+
+
+def test_string_equality_compares_lengths_first() -> None:
+    """
+    title: String equality should lower onto the runtime comparison.
+    """
+    builder = Builder()
+    then_block = astx.Block()
+    then_block.append(PrintExpr(astx.LiteralUTF8String("same")))
+    else_block = astx.Block()
+    else_block.append(PrintExpr(astx.LiteralUTF8String("different")))
+    module = make_main_module(
+        _string_decl("a", "foo"),
+        astx.IfStmt(
+            condition=astx.BinaryOp(
+                "==",
+                astx.Identifier("a"),
+                astx.BinaryOp(
+                    "+", astx.LiteralString("fo"), astx.LiteralString("o")
+                ),
+            ),
+            then=then_block,
+            else_=else_block,
+        ),
+        astx.IfStmt(
+            condition=astx.BinaryOp(
+                "==", astx.Identifier("a"), astx.LiteralString("food")
+            ),
+            then=then_block,
+            else_=else_block,
+        ),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+
+    ir_text = builder.translate(module)
+
+    assert_ir_parses(ir_text)
+    assert 'call i32 @"irx_string_equals"' in ir_text
+    assert_build_output(builder, module, "same\ndifferent")
+
+
+def test_extern_string_results_are_imported() -> None:
+    """
+    title: Strings returned by C code should be converted at the boundary.
+    """
+    prototype = astx.FunctionPrototype(
+        "strchr",
+        args=astx.Arguments(
+            astx.Argument("text", astx.String()),
+            astx.Argument("needle", astx.Int32()),
+        ),
+        return_type=astx.String(),
+    )
+    prototype.is_extern = True
+    prototype.calling_convention = "c"
+    prototype.symbol_name = "strchr"
+    builder = Builder()
+    module = make_main_module(
+        PrintExpr(
+            astx.BinaryOp(
+                "+",
+                astx.FunctionCall(
+                    "strchr",
+                    [
+                        astx.LiteralString("hello"),
+                        astx.LiteralInt32(ASCII_LOWER_L),
+                    ],
+                ),
+                astx.LiteralString("!"),
+            )
+        ),
+        astx.FunctionReturn(astx.LiteralInt32(0)),
+    )
+    module.block.insert(0, prototype)
+
+    ir_text = builder.translate(module)
+
+    assert_ir_parses(ir_text)
+    assert 'call i8* @"irx_string_from_cstr"' in ir_text
+    assert_build_output(builder, module, "llo!")
+
+
+def test_string_runtime_header_and_builder_harness() -> None:
+    """
+    title: Native string runtime should keep lengths and grow builders.
+    """
+    clang_binary = shutil.which("clang")
+    if clang_binary is None:
+        pytest.skip("clang is required for string runtime harness tests")
+
+    feature = build_string_runtime_feature()
+    include_dirs = [
+        include_dir
+        for artifact in feature.artifacts
+        for include_dir in artifact.include_dirs
+    ]
+    source = """
+      #include <stdlib.h>
+      #include <string.h>
+
+      #include "irx_string_runtime.h"
+
+      int main(void) {
+        const char* hello = irx_string_from_cstr("hello");
+        const char* world = irx_string_from_bytes(" world", 6);
+        const char* joined = irx_string_concat(hello, world);
+        if (irx_string_length(joined) != 11) return 1;
+        if (strcmp(joined, "hello world") != 0) return 2;
+        const char* expected = irx_string_from_cstr("hello world");
+        if (!irx_string_equals(joined, expected)) return 3;
+        if (irx_string_equals(joined, hello)) return 4;
+
+        const char* tail = irx_string_substring(joined, -5, 100);
+        if (strcmp(tail, "world") != 0) return 5;
+        if (irx_string_length(irx_string_substring(joined, 4, 2)) != 0) {
+          return 6;
+        }
+
+        irx_string_builder* builder = irx_string_builder_new(0);
+        for (int index = 0; index < 1000; ++index) {
+          irx_string_builder_append(builder, hello);
+        }
+        if (irx_string_builder_length(builder) != 5000) return 7;
+        const char* repeated = irx_string_builder_finish(builder);
+        if (irx_string_length(repeated) != 5000) return 8;
+        if ((int64_t)strlen(repeated) != 5000) return 9;
+
+        char* owned = (char*)malloc(4);
+        memcpy(owned, "abc", 4);
+        const char* adopted = irx_string_adopt_cstr(owned);
+        if (irx_string_length(adopted) != 3) return 10;
+
+        char* reserved = irx_string_reserve(2);
+        memcpy(reserved, "ok", 3);
+        if (irx_string_length(reserved) != 2) return 11;
+        if (!irx_string_equals(reserved, irx_string_from_cstr("ok"))) {
+          return 12;
+        }
+
+        irx_string_free(reserved);
+        irx_string_free(expected);
+        irx_string_free(repeated);
+        irx_string_free(tail);
+        irx_string_free(joined);
+        irx_string_free(adopted);
+        return 0;
+      }
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        source_path = tmp_path / "string_harness.c"
+        object_path = tmp_path / "string_harness.o"
+        output_path = tmp_path / "string_harness"
+        source_path.write_text(textwrap.dedent(source), encoding="utf8")
+
+        subprocess.run(
+            [
+                clang_binary,
+                "-c",
+                str(source_path),
+                "-o",
+                str(object_path),
+                *[
+                    option
+                    for include_dir in include_dirs
+                    for option in ("-I", str(include_dir))
+                ],
+                "-std=c99",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        link_executable(
+            primary_object=object_path,
+            output_file=output_path,
+            artifacts=feature.artifacts,
+            linker_flags=feature.linker_flags,
+            clang_binary=clang_binary,
+        )
+        result = subprocess.run(
+            [str(output_path)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+    assert result.returncode == 0, result.stderr or result.stdout
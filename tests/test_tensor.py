@@ -12,8 +12,14 @@ import pytest
 
 from irx import astx
 from irx.analysis import SemanticError, analyze
-from irx.buffer import buffer_dtype_handle
+from irx.buffer import (
+    BUFFER_FLAG_C_CONTIGUOUS,
+    BUFFER_FLAG_F_CONTIGUOUS,
+    BufferIndexBoundsPolicy,
+    buffer_dtype_handle,
+)
 from irx.builder import Builder
+from irx.builder.runtime.assertions import parse_assert_failure_output
 from irx.builtins.collections.tensor import (
     tensor_element_size_bytes_from_dtype,
 )
@@ -189,7 +195,11 @@ def test_tensor_literal_lowers_through_tensor_runtime_and_owner_bridge() -> (
 
     ir_text = builder.translate(module)
 
-    assert '@"irx_arrow_tensor_builder_new"' in ir_text
+    assert '@"irx_arrow_tensor_wrap_buffer"' in ir_text
+    assert "irx_arrow_tensor_builder_append" not in ir_text
+    assert "internal constant [4 x i32] [i32 1, i32 2, i32 3, i32 4]" in (
+        ir_text
+    )
     assert '@"irx_arrow_tensor_borrow_buffer_view"' in ir_text
     assert '@"irx_buffer_owner_external_new"' in ir_text
     assert "irx_tensor_shape" in ir_text
@@ -198,6 +208,38 @@ def test_tensor_literal_lowers_through_tensor_runtime_and_owner_bridge() -> (
     assert_ir_parses(ir_text)
 
 
+def test_tensor_literal_with_runtime_values_uses_bulk_builder_append() -> None:
+    """
+    title: Non-constant tensor literal values should bulk append once.
+    """
+    builder = Builder()
+    module = _module_with_main(
+        astx.VariableDeclaration(
+            name="seed",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralInt32(7),
+        ),
+        astx.FunctionReturn(
+            astx.TensorIndex(
+                astx.TensorLiteral(
+                    [astx.LiteralInt32(1), astx.Identifier("seed")],
+                    element_type=astx.Int32(),
+                    shape=(2,),
+                ),
+                [astx.LiteralInt32(1)],
+            )
+        ),
+    )
+
+    ir_text = builder.translate(module)
+
+    assert '@"irx_arrow_tensor_builder_append_n"' in ir_text
+    assert "irx_arrow_tensor_builder_append_int" not in ir_text
+    assert "irx_arrow_tensor_wrap_buffer" not in ir_text
+    assert_ir_parses(ir_text)
+
+
 def test_tensor_view_lowers_custom_shape_stride_and_offset() -> None:
     """
     title: Tensor views should lower with explicit shape, stride, and offset.
@@ -224,8 +266,8 @@ def test_tensor_view_lowers_custom_shape_stride_and_offset() -> None:
     assert (
         "irx_tensor_stride_ptr" in ir_text or "irx_tensor_strides_" in ir_text
     )
-    assert "irx_buffer_index_stride_0" in ir_text
-    assert "irx_buffer_index_stride_1" in ir_text
+    assert "irx_buffer_index_stride_0" not in ir_text
+    assert 'mul i64 %"irx_buffer_index_sext", 12' in ir_text
     assert (
         "irx_tensor_offset_bytes" in ir_text
         or "irx_buffer_index_offset_1" in ir_text
@@ -302,3 +344,265 @@ def test_tensor_view_build_returns_view_element() -> None:
 
     expected = 50
     assert result.returncode == expected, result.stderr or result.stdout
+
+
+def test_constant_float_tensor_literal_build_returns_element() -> None:
+    """
+    title: Constant float tensor storage should be readable after the wrap.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    module = _module_with_main(
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.TensorIndex(
+                    astx.TensorLiteral(
+                        [astx.LiteralFloat64(value) for value in (1.5, 9.25)],
+                        element_type=astx.Float64(),
+                        shape=(2,),
+                    ),
+                    [astx.LiteralInt32(1)],
+                ),
+                astx.Int32(),
+            )
+        )
+    )
+
+    result = build_and_run(Builder(), module)
+
+    expected = 9
+    assert result.returncode == expected, result.stderr or result.stdout
+
+
+def _checked_sum_module(end: astx.AST) -> astx.Module:
+    """
+    title: Build a main that sums one four-element tensor over [0, end).
+    parameters:
+      end:
+        type: astx.AST
+    returns:
+      type: astx.Module
+    """
+    body = astx.Block()
+    body.append(
+        astx.VariableAssignment(
+            "total",
+            astx.BinaryOp(
+                "+",
+                astx.Identifier("total"),
+                astx.TensorIndex(
+                    astx.Identifier("values"),
+                    [astx.Identifier("index")],
+                ),
+            ),
+        )
+    )
+    return _module_with_main(
+        astx.VariableDeclaration(
+            name="values",
+            type_=astx.TensorType(astx.Int32()),
+            mutability=astx.MutabilityKind.constant,
+            value=_int32_tensor([1, 2, 3, 4], shape=(4,)),
+        ),
+        astx.VariableDeclaration(
+            name="total",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralInt32(0),
+        ),
+        astx.VariableDeclaration(
+            name="count",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.mutable,
+            value=astx.LiteralInt32(4),
+        ),
+        astx.ForRangeLoopStmt(
+            variable=astx.InlineVariableDeclaration(
+                "index",
+                type_=astx.Int32(),
+                mutability=astx.MutabilityKind.mutable,
+            ),
+            start=astx.LiteralInt32(0),
+            end=end,
+            step=astx.LiteralInt32(1),
+            body=body,
+        ),
+        astx.FunctionReturn(astx.Identifier("total")),
+    )
+
+
+def test_checked_tensor_loop_hoists_bounds_check() -> None:
+    """
+    title: Loops over a tensor axis should check their range once up front.
+    """
+    builder = Builder(bounds_policy=BufferIndexBoundsPolicy.CHECKED)
+    ir_text = builder.translate(_checked_sum_module(astx.Identifier("count")))
+
+    preheader, loop = ir_text.split("for.range.cond:", 1)
+    assert '%"irx_buffer_guard" = or i1' in preheader
+    assert (
+        'br i1 %"irx_buffer_guard", label %"buffer.bounds.ok", '
+        'label %"buffer.bounds.check"'
+    ) in loop
+    assert_ir_parses(ir_text)
+
+    proven = Builder(bounds_policy=BufferIndexBoundsPolicy.CHECKED).translate(
+        _checked_sum_module(astx.LiteralInt32(4))
+    )
+    assert "buffer.bounds" not in proven
+
+
+def test_checked_tensor_loop_reports_out_of_bounds_access() -> None:
+    """
+    title: CHECKED builds should fail through the assertion runtime.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    in_bounds = build_and_run(
+        Builder(bounds_policy=BufferIndexBoundsPolicy.CHECKED),
+        _checked_sum_module(astx.Identifier("count")),
+    )
+    expected_total = 10
+    assert in_bounds.returncode == expected_total, in_bounds.stderr
+
+    result = build_and_run(
+        Builder(bounds_policy=BufferIndexBoundsPolicy.CHECKED),
+        _checked_sum_module(astx.LiteralInt32(5)),
+    )
+    report = parse_assert_failure_output(result.stderr)
+
+    assert result.returncode == 1
+    assert report is not None
+    assert report.message == "buffer view index out of bounds"
+
+
+def test_tensor_transpose_recomputes_contiguity_flags() -> None:
+    """
+    title: Derived Tensor views should recompute contiguity statically.
+    """
+    base = _int32_tensor(list(range(6)), shape=(2, 3))
+    transposed = astx.TensorTranspose(base)
+    sliced = astx.TensorSlice(base, [slice(None), slice(0, 3, 2)])
+    reshaped = astx.TensorReshape(transposed, [3, 2, 1])
+    module = _module_with_main(
+        astx.FunctionReturn(
+            astx.BinaryOp(
+                "+",
+                astx.TensorIndex(
+                    sliced,
+                    [astx.LiteralInt32(0), astx.LiteralInt32(1)],
+                ),
+                astx.TensorIndex(
+                    reshaped,
+                    [
+                        astx.LiteralInt32(2),
+                        astx.LiteralInt32(1),
+                        astx.LiteralInt32(0),
+                    ],
+                ),
+            )
+        )
+    )
+
+    analyze(module)
+    transposed_extras = getattr(transposed, "semantic").extras
+    sliced_extras = getattr(sliced, "semantic").extras
+    reshaped_extras = getattr(reshaped, "semantic").extras
+
+    assert transposed_extras["tensor_layout"].strides == (4, 12)
+    assert transposed_extras["tensor_flags"] & BUFFER_FLAG_F_CONTIGUOUS
+    assert not transposed_extras["tensor_flags"] & BUFFER_FLAG_C_CONTIGUOUS
+    assert sliced_extras["tensor_layout"].strides == (12, 8)
+    assert not sliced_extras["tensor_flags"] & (
+        BUFFER_FLAG_C_CONTIGUOUS | BUFFER_FLAG_F_CONTIGUOUS
+    )
+    assert reshaped_extras["tensor_layout"].strides == (4, 12, 12)
+
+
+@pytest.mark.parametrize(
+    ("view", "match"),
+    [
+        (astx.TensorSlice(astx.Identifier("values"), [4]), "out of bounds"),
+        (
+            astx.TensorSlice(astx.Identifier("values"), [slice(0, 2), 0]),
+            "more items than the base rank",
+        ),
+        (
+            astx.TensorReshape(astx.Identifier("values"), [3, -1]),
+            "cannot infer a dimension",
+        ),
+    ],
+)
+def test_tensor_derived_views_reject_invalid_static_layouts(
+    view: astx.AST,
+    match: str,
+) -> None:
+    """
+    title: Tensor slice and reshape views should validate static shapes.
+    parameters:
+      view:
+        type: astx.AST
+      match:
+        type: str
+    """
+    module = _module_with_main(
+        astx.VariableDeclaration(
+            name="values",
+            type_=astx.TensorType(astx.Int32()),
+            mutability=astx.MutabilityKind.constant,
+            value=_int32_tensor([1, 2, 3, 4], shape=(4,)),
+        ),
+        astx.FunctionReturn(astx.TensorElementCount(view)),
+    )
+
+    with pytest.raises(SemanticError, match=match):
+        analyze(module)
+
+
+def test_tensor_derived_views_build_without_copying() -> None:
+    """
+    title: Slices, transposes, and reshapes should read the base storage.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    matrix = astx.Identifier("matrix")
+    window = astx.TensorTranspose(
+        astx.TensorSlice(matrix, [slice(1, 3), slice(0, 4, 2)])
+    )
+    rows = astx.TensorReshape(astx.TensorSlice(matrix, [slice(1, 3)]), [-1])
+    module = _module_with_main(
+        astx.VariableDeclaration(
+            name="matrix",
+            type_=astx.TensorType(astx.Int32()),
+            mutability=astx.MutabilityKind.constant,
+            value=_int32_tensor(list(range(12)), shape=(3, 4)),
+        ),
+        astx.FunctionReturn(
+            astx.BinaryOp(
+                "+",
+                astx.BinaryOp(
+                    "+",
+                    astx.TensorIndex(
+                        window,
+                        [astx.LiteralInt32(1), astx.LiteralInt32(0)],
+                    ),
+                    astx.TensorIndex(rows, [astx.LiteralInt32(7)]),
+                ),
+                astx.TensorIndex(
+                    astx.TensorSlice(matrix, [2]),
+                    [astx.LiteralInt32(3)],
+                ),
+            )
+        ),
+    )
+
+    ir_text = Builder().translate(module)
+    result = build_and_run(Builder(), module)
+
+    assert "irx_tensor_view_strides" in ir_text
+    assert "irx_buffer_view_retain" not in ir_text
+    expected = 6 + 11 + 11
+    assert result.returncode == expected, result.stderr or result.stdout
@@ -0,0 +1,696 @@
+"""
+title: Tests for elementwise Tensor arithmetic and reductions.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from irx import astx
+from irx.analysis import SemanticError, analyze
+from irx.buffer import BUFFER_FLAG_C_CONTIGUOUS, BUFFER_FLAG_OWNED
+from irx.builder import Builder
+from irx.builtins.collections.tensor import (
+    tensor_broadcast_shape,
+    tensor_matmul_shape,
+)
+
+from tests.conftest import assert_ir_parses, build_and_run
+
+# fused, reused, and the materialized shifted operand of reused.
+EXPECTED_FUSION_ALLOCATIONS = 3
+# fused[1, 2] = 6 * 6 + 3 = 39, reused[0, 3] = 2 * -2 = -4.
+EXPECTED_FUSION_RESULT = 35
+# sum(a * b) + max(sum(a * b, axis=0)) for a = 1..6 and b = 6..1.
+EXPECTED_REDUCE_RESULT = 56 + 20
+# a * b twice, plus the axis reduction feeding the outer max.
+EXPECTED_REDUCE_ALLOCATIONS = 3
+# (a @ b)[1, 3] + (b.T @ a.T)[2, 1] + (v @ b)[1] + v @ v + (fa @ fb)[0, 1].
+EXPECTED_MATMUL_RESULT = 20 + 14 + 8 + 14 + 8
+# max((lhs + lhs) @ (rhs * 2)) + (v + v) @ v for v = [1, 2, 3].
+EXPECTED_COMPUTED_MATMUL_RESULT = 80 + 28
+# Both matrix operands, the matrix product, and the doubled vector.
+EXPECTED_COMPUTED_MATMUL_ALLOCATIONS = 4
+MATMUL_LHS = [-2, -1, 0, 1, 2, 3]
+MATMUL_RHS = list(range(-5, 7))
+
+
+def _module_with_main(*nodes: astx.AST) -> astx.Module:
+    """
+    title: Build an int32 main module.
+    parameters:
+      nodes:
+        type: astx.AST
+        variadic: positional
+    returns:
+      type: astx.Module
+    """
+    module = astx.Module()
+    body = astx.Block()
+    for node in nodes:
+        body.append(node)
+    module.block.append(
+        astx.FunctionDef(
+            prototype=astx.FunctionPrototype(
+                "main",
+                args=astx.Arguments(),
+                return_type=astx.Int32(),
+            ),
+            body=body,
+        )
+    )
+    return module
+
+
+def _tensor(
+    name: str,
+    values: list[int] | list[float],
+    *,
+    shape: tuple[int, ...],
+    element_type: astx.DataType,
+) -> astx.VariableDeclaration:
+    """
+    title: Declare one constant Tensor literal binding.
+    parameters:
+      name:
+        type: str
+      values:
+        type: list[int] | list[float]
+      shape:
+        type: tuple[int, Ellipsis]
+      element_type:
+        type: astx.DataType
+    returns:
+      type: astx.VariableDeclaration
+    """
+    literal = (
+        astx.LiteralFloat64
+        if isinstance(element_type, astx.Float64)
+        else astx.LiteralInt32
+    )
+    return astx.VariableDeclaration(
+        name=name,
+        type_=astx.TensorType(element_type),
+        mutability=astx.MutabilityKind.constant,
+        value=astx.TensorLiteral(
+            [literal(value) for value in values],
+            element_type=element_type,
+            shape=shape,
+        ),
+    )
+
+
+def _at(base: astx.AST, *indices: int) -> astx.TensorIndex:
+    """
+    title: Build one Tensor read at static indices.
+    parameters:
+      base:
+        type: astx.AST
+      indices:
+        type: int
+        variadic: positional
+    returns:
+      type: astx.TensorIndex
+    """
+    return astx.TensorIndex(
+        base,
+        [astx.LiteralInt32(index) for index in indices],
+    )
+
+
+def test_tensor_broadcast_shape_follows_numpy_rules() -> None:
+    """
+    title: Static shapes should broadcast from the trailing axis.
+    """
+    assert tensor_broadcast_shape((2, 3), (3,)) == (2, 3)
+    assert tensor_broadcast_shape((2, 1), (1, 4)) == (2, 4)
+    assert tensor_broadcast_shape((0,), (1,)) == (0,)
+    with pytest.raises(ValueError, match="cannot be broadcast"):
+        tensor_broadcast_shape((2, 3), (2,))
+
+
+def test_tensor_ops_record_owned_result_layouts() -> None:
+    """
+    title: Results should own fresh C-contiguous storage of the right shape.
+    """
+    matrix = astx.Identifier("matrix")
+    added = astx.TensorElementwise("+", matrix, astx.Identifier("row"))
+    column_max = astx.TensorReduce(matrix, "max", axis=0)
+    mean = astx.TensorReduce(matrix, "mean")
+    module = _module_with_main(
+        _tensor(
+            "matrix",
+            list(range(6)),
+            shape=(2, 3),
+            element_type=astx.Int32(),
+        ),
+        _tensor("row", [1, 2, 3], shape=(3,), element_type=astx.Int32()),
+        astx.VariableDeclaration(
+            name="average",
+            type_=astx.Float64(),
+            mutability=astx.MutabilityKind.constant,
+            value=mean,
+        ),
+        astx.FunctionReturn(
+            astx.BinaryOp("+", _at(added, 1, 2), _at(column_max, 0))
+        ),
+    )
+    analyze(module)
+
+    extras = getattr(added, "semantic").extras
+    assert extras["tensor_layout"].shape == (2, 3)
+    assert extras["tensor_layout"].strides == (12, 4)
+    assert extras["tensor_flags"] & BUFFER_FLAG_OWNED
+    assert extras["tensor_flags"] & BUFFER_FLAG_C_CONTIGUOUS
+    assert getattr(column_max, "semantic").extras["tensor_layout"].shape == (
+        3,
+    )
+    assert isinstance(mean.type_, astx.Float64)
+
+
+def test_contiguous_tensor_ops_lower_to_vector_loops() -> None:
+    """
+    title: Contiguous operands should map and reduce with LLVM vector types.
+    """
+    values = astx.Identifier("values")
+    module = _module_with_main(
+        _tensor(
+            "values",
+            [float(index) for index in range(10)],
+            shape=(10,),
+            element_type=astx.Float64(),
+        ),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.TensorReduce(
+                    astx.TensorElementwise(
+                        "*",
+                        values,
+                        astx.LiteralFloat64(2.0),
+                    ),
+                    "sum",
+                ),
+                astx.Int32(),
+            )
+        ),
+    )
+
+    ir_text = Builder().translate(module)
+
+    assert "load <4 x double>" in ir_text
+    assert "fmul <4 x double>" in ir_text
+    assert '@"llvm.vector.reduce.fadd.v4f64"' in ir_text
+    assert '@"irx_buffer_owner_alloc"' in ir_text
+    assert "irx.tensor.map.tail" in ir_text
+    assert_ir_parses(ir_text)
+
+
+def test_tensor_ops_broadcast_and_reduce_at_run_time() -> None:
+    """
+    title: Broadcast, strided, and reduced results should match NumPy.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    matrix = astx.Identifier("matrix")
+    module = _module_with_main(
+        _tensor(
+            "matrix",
+            list(range(-6, 6)),
+            shape=(3, 4),
+            element_type=astx.Int32(),
+        ),
+        _tensor("row", [1, 2, 3, 4], shape=(4,), element_type=astx.Int32()),
+        astx.VariableDeclaration(
+            name="shifted",
+            type_=astx.TensorType(astx.Int32()),
+            mutability=astx.MutabilityKind.constant,
+            value=astx.TensorElementwise(
+                "max",
+                astx.TensorTranspose(
+                    astx.TensorElementwise("-", matrix, astx.Identifier("row"))
+                ),
+                astx.LiteralInt32(-3),
+            ),
+        ),
+        astx.FunctionReturn(
+            astx.BinaryOp(
+                "+",
+                astx.BinaryOp(
+                    "+",
+                    _at(astx.Identifier("shifted"), 3, 2),
+                    _at(astx.TensorReduce(matrix, "sum", axis=1), 2),
+                ),
+                astx.BinaryOp(
+                    "+",
+                    astx.TensorReduce(astx.TensorUnary("abs", matrix), "max"),
+                    astx.TensorReduce(astx.TensorTranspose(matrix), "min"),
+                ),
+            )
+        ),
+    )
+
+    result = build_and_run(Builder(), module)
+
+    # shifted[3, 2] = max(matrix[2, 3] - row[3], -3) = 1,
+    # sum(matrix[2]) = 2 + 3 + 4 + 5 = 14, max(|matrix|) = 6, min = -6.
+    assert result.returncode == 1 + 14 + 6 - 6, result.stderr or result.stdout
+
+
+def _fusion_module(*, fast_math: bool) -> astx.Module:
+    """
+    title: Build a module with a fused chain and a reused subexpression.
+    summary: >-
+      Returns fused[1, 2] + reused[0, 3], where fused is values * values + 3
+      and reused is shifted * -shifted for the one node shifted = values - 1.
+    parameters:
+      fast_math:
+        type: bool
+    returns:
+      type: astx.Module
+    """
+    values = astx.Identifier("values")
+    shifted = astx.TensorElementwise("-", values, astx.LiteralFloat64(1.0))
+    return _module_with_main(
+        _tensor(
+            "values",
+            [float(index) for index in range(8)],
+            shape=(2, 4),
+            element_type=astx.Float64(),
+        ),
+        astx.VariableDeclaration(
+            name="fused",
+            type_=astx.TensorType(astx.Float64()),
+            mutability=astx.MutabilityKind.constant,
+            value=astx.TensorElementwise(
+                "+",
+                astx.TensorElementwise("*", values, values),
+                astx.LiteralFloat64(3.0),
+                fast_math=fast_math,
+            ),
+        ),
+        astx.VariableDeclaration(
+            name="reused",
+            type_=astx.TensorType(astx.Float64()),
+            mutability=astx.MutabilityKind.constant,
+            value=astx.TensorElementwise(
+                "*",
+                shifted,
+                astx.TensorUnary("-", shifted),
+            ),
+        ),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.BinaryOp(
+                    "+",
+                    _at(astx.Identifier("fused"), 1, 2),
+                    _at(astx.Identifier("reused"), 0, 3),
+                ),
+                astx.Int32(),
+            )
+        ),
+    )
+
+
+def test_tensor_expression_chains_fuse_into_one_loop() -> None:
+    """
+    title: Only the chain root and reused subexpressions should allocate.
+    """
+    ir_text = Builder().translate(_fusion_module(fast_math=False))
+
+    assert (
+        ir_text.count('call i32 @"irx_buffer_owner_alloc"')
+        == EXPECTED_FUSION_ALLOCATIONS
+    )
+    assert ir_text.count("irx_tensor_temporary_release") == 1
+    assert "llvm.fma" not in ir_text
+    assert_ir_parses(ir_text)
+
+    contracted = Builder().translate(_fusion_module(fast_math=True))
+
+    assert '@"llvm.fma.v4f64"' in contracted
+    assert contracted.count("fmul <4 x double>") == (
+        ir_text.count("fmul <4 x double>") - 1
+    )
+    assert_ir_parses(contracted)
+
+
+def _reduce_module() -> astx.Module:
+    """
+    title: Build one module that reduces computed tensors.
+    returns:
+      type: astx.Module
+    """
+
+    def product() -> astx.TensorElementwise:
+        return astx.TensorElementwise(
+            "*", astx.Identifier("a"), astx.Identifier("b")
+        )
+
+    return _module_with_main(
+        _tensor(
+            "a", [1, 2, 3, 4, 5, 6], shape=(2, 3), element_type=astx.Int32()
+        ),
+        _tensor(
+            "b", [6, 5, 4, 3, 2, 1], shape=(2, 3), element_type=astx.Int32()
+        ),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.BinaryOp(
+                    "+",
+                    astx.TensorReduce(product(), "sum"),
+                    astx.TensorReduce(
+                        astx.TensorReduce(product(), "sum", axis=0),
+                        "max",
+                    ),
+                ),
+                astx.Int32(),
+            )
+        ),
+    )
+
+
+def test_tensor_reduce_releases_computed_bases() -> None:
+    """
+    title: Reductions should release the temporaries they consume.
+    """
+    ir_text = Builder().translate(_reduce_module())
+
+    allocations = ir_text.count('call i32 @"irx_buffer_owner_alloc"')
+    assert allocations == EXPECTED_REDUCE_ALLOCATIONS
+    assert ir_text.count('call i32 @"irx_buffer_view_release"') == allocations
+    assert_ir_parses(ir_text)
+
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    result = build_and_run(Builder(), _reduce_module())
+
+    assert result.returncode == EXPECTED_REDUCE_RESULT, (
+        result.stderr or result.stdout
+    )
+
+
+@pytest.mark.parametrize("fast_math", [False, True])
+def test_fused_tensor_chains_match_unfused_results(fast_math: bool) -> None:
+    """
+    title: Fused and reused subexpressions should compute the same values.
+    parameters:
+      fast_math:
+        type: bool
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    result = build_and_run(Builder(), _fusion_module(fast_math=fast_math))
+
+    assert result.returncode == EXPECTED_FUSION_RESULT, (
+        result.stderr or result.stdout
+    )
+
+
+def test_tensor_matmul_shape_follows_numpy_rules() -> None:
+    """
+    title: Matrix and vector operands should drop their contracted axes.
+    """
+    assert tensor_matmul_shape((2, 3), (3, 4)) == (2, 4)
+    assert tensor_matmul_shape((3,), (3, 4)) == (4,)
+    assert tensor_matmul_shape((2, 3), (3,)) == (2,)
+    assert tensor_matmul_shape((3,), (3,)) == ()
+    with pytest.raises(ValueError, match="inner extents 3 and 2"):
+        tensor_matmul_shape((2, 3), (2, 3))
+    with pytest.raises(ValueError, match="rank 1 or 2"):
+        tensor_matmul_shape((2, 2, 2), (2,))
+
+
+def test_tensor_matmul_lowers_to_tiled_and_dot_kernels() -> None:
+    """
+    title: Matmul should pick a register-tiled or dot kernel by layout.
+    """
+    module = _module_with_main(
+        _tensor(
+            "lhs",
+            [float(index) for index in range(40)],
+            shape=(4, 10),
+            element_type=astx.Float64(),
+        ),
+        _tensor(
+            "rhs",
+            [float(index) for index in range(40)],
+            shape=(10, 4),
+            element_type=astx.Float64(),
+        ),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.BinaryOp(
+                    "+",
+                    _at(
+                        astx.TensorMatmul(
+                            astx.Identifier("lhs"),
+                            astx.Identifier("rhs"),
+                        ),
+                        3,
+                        3,
+                    ),
+                    _at(
+                        astx.TensorMatmul(
+                            astx.Identifier("lhs"),
+                            astx.TensorTranspose(astx.Identifier("lhs")),
+                        ),
+                        1,
+                        2,
+                    ),
+                ),
+                astx.Int32(),
+            )
+        ),
+    )
+
+    ir_text = Builder().translate(module)
+
+    assert "irx.tensor.matmul.kblock" in ir_text
+    assert '@"llvm.fmuladd.v4f64"' in ir_text
+    assert "irx.tensor.matmul.dot" in ir_text
+    assert "irx.tensor.dot.vector" in ir_text
+    assert_ir_parses(ir_text)
+
+
+def _computed_matmul_module() -> astx.Module:
+    """
+    title: Build one module that multiplies computed tensors.
+    returns:
+      type: astx.Module
+    """
+    lhs = astx.Identifier("lhs")
+    vector = astx.Identifier("v")
+    return _module_with_main(
+        _tensor("lhs", MATMUL_LHS, shape=(2, 3), element_type=astx.Int32()),
+        _tensor("rhs", MATMUL_RHS, shape=(3, 4), element_type=astx.Int32()),
+        _tensor("v", [1, 2, 3], shape=(3,), element_type=astx.Int32()),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.BinaryOp(
+                    "+",
+                    astx.TensorReduce(
+                        astx.TensorMatmul(
+                            astx.TensorElementwise("+", lhs, lhs),
+                            astx.TensorElementwise(
+                                "*",
+                                astx.Identifier("rhs"),
+                                astx.LiteralInt32(2),
+                            ),
+                        ),
+                        "max",
+                    ),
+                    astx.TensorMatmul(
+                        astx.TensorElementwise("+", vector, vector),
+                        vector,
+                    ),
+                ),
+                astx.Int32(),
+            )
+        ),
+    )
+
+
+def test_tensor_matmul_releases_computed_operands() -> None:
+    """
+    title: Matmul should release operands computed by other tensor ops.
+    """
+    ir_text = Builder().translate(_computed_matmul_module())
+
+    allocations = ir_text.count('call i32 @"irx_buffer_owner_alloc"')
+    assert allocations == EXPECTED_COMPUTED_MATMUL_ALLOCATIONS
+    assert ir_text.count('call i32 @"irx_buffer_view_release"') == allocations
+    assert_ir_parses(ir_text)
+
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    result = build_and_run(Builder(), _computed_matmul_module())
+
+    assert result.returncode == EXPECTED_COMPUTED_MATMUL_RESULT, (
+        result.stderr or result.stdout
+    )
+
+
+def test_tensor_matmul_matches_numpy_at_run_time() -> None:
+    """
+    title: Matrix, transposed, vector, and dot products should match NumPy.
+    """
+    if shutil.which("clang") is None:
+        pytest.skip("builder.build() currently requires clang")
+
+    lhs = astx.Identifier("a")
+    rhs = astx.Identifier("b")
+    vector = astx.Identifier("v")
+    module = _module_with_main(
+        _tensor("a", MATMUL_LHS, shape=(2, 3), element_type=astx.Int32()),
+        _tensor("b", MATMUL_RHS, shape=(3, 4), element_type=astx.Int32()),
+        _tensor("v", [1, 2, 3], shape=(3,), element_type=astx.Int32()),
+        _tensor(
+            "fa",
+            [float(value) for value in MATMUL_LHS],
+            shape=(2, 3),
+            element_type=astx.Float64(),
+        ),
+        _tensor(
+            "fb",
+            [float(value) for value in MATMUL_RHS],
+            shape=(3, 4),
+            element_type=astx.Float64(),
+        ),
+        astx.VariableDeclaration(
+            name="rounded",
+            type_=astx.Int32(),
+            mutability=astx.MutabilityKind.constant,
+            value=astx.Cast(
+                _at(
+                    astx.TensorMatmul(
+                        astx.Identifier("fa"),
+                        astx.Identifier("fb"),
+                    ),
+                    0,
+                    1,
+                ),
+                astx.Int32(),
+            ),
+        ),
+        astx.FunctionReturn(
+            astx.BinaryOp(
+                "+",
+                astx.BinaryOp(
+                    "+",
+                    _at(astx.TensorMatmul(lhs, rhs), 1, 3),
+                    _at(
+                        astx.TensorMatmul(
+                            astx.TensorTranspose(rhs),
+                            astx.TensorTranspose(lhs),
+                        ),
+                        2,
+                        1,
+                    ),
+                ),
+                astx.BinaryOp(
+                    "+",
+                    astx.BinaryOp(
+                        "+",
+                        _at(astx.TensorMatmul(vector, rhs), 1),
+                        astx.TensorMatmul(vector, vector),
+                    ),
+                    astx.Identifier("rounded"),
+                ),
+            )
+        ),
+    )
+
+    result = build_and_run(Builder(), module)
+
+    assert result.returncode == EXPECTED_MATMUL_RESULT, (
+        result.stderr or result.stdout
+    )
+
+
+@pytest.mark.parametrize(
+    ("expression", "match"),
+    [
+        (
+            astx.TensorElementwise(
+                "+",
+                astx.Identifier("matrix"),
+                astx.Identifier("odd"),
+            ),
+            "cannot be broadcast",
+        ),
+        (
+            astx.TensorElementwise(
+                "*",
+                astx.Identifier("matrix"),
+                astx.LiteralFloat64(0.5),
+            ),
+            "cannot combine with",
+        ),
+        (
+            astx.TensorUnary("sqrt", astx.Identifier("matrix")),
+            "floating-point element type",
+        ),
+        (
+            astx.TensorReduce(astx.Identifier("matrix"), "sum", axis=2),
+            "axis 2 is out of range",
+        ),
+        (
+            astx.TensorElementwise(
+                "%",
+                astx.Identifier("matrix"),
+                astx.Identifier("matrix"),
+            ),
+            "unsupported tensor elementwise operator",
+        ),
+        (
+            astx.TensorMatmul(
+                astx.Identifier("matrix"),
+                astx.Identifier("matrix"),
+            ),
+            "inner extents 3 and 2",
+        ),
+        (
+            astx.TensorMatmul(
+                astx.Identifier("matrix"),
+                astx.LiteralInt32(2),
+            ),
+            "requires TensorType operands",
+        ),
+    ],
+)
+def test_tensor_ops_reject_invalid_operands(
+    expression: astx.AST,
+    match: str,
+) -> None:
+    """
+    title: Tensor operations should validate shapes, types, and axes.
+    parameters:
+      expression:
+        type: astx.AST
+      match:
+        type: str
+    """
+    module = _module_with_main(
+        _tensor(
+            "matrix",
+            [1, 2, 3, 4, 5, 6],
+            shape=(2, 3),
+            element_type=astx.Int32(),
+        ),
+        _tensor("odd", [1, 2], shape=(2,), element_type=astx.Int32()),
+        astx.FunctionReturn(
+            astx.Cast(
+                astx.TensorElementCount(expression),
+                astx.Int32(),
+            )
+        ),
+    )
+
+    with pytest.raises(SemanticError, match=match):
+        analyze(module)